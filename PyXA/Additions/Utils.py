@@ -10,6 +10,7 @@ import xml.etree.ElementTree as ET
 from typing import Union, Callable, Any, Literal
 from PyObjCTools import AppHelper
 from PyXA import XABase
+from PyXA import XABackends
 from datetime import datetime, timedelta
 from enum import Enum
 from time import sleep
@@ -148,7 +149,7 @@ class AppBuilder:
                     list_class_dict[
                         property["name"]
                     ] = lambda self, property=property: list(
-                        self.xa_elem.arrayByApplyingSelector_(property["name"])
+                        XABackends.element_values(self.xa_elem, property["name"])
                     )
 
                 cls = create_class(
@@ -503,7 +504,7 @@ class SDEFParser:
                         + '\n\t\t"""'
                     )
                     lines.append(
-                        '\t\treturn list(self.xa_elem.arrayByApplyingSelector_("'
+                        '\t\treturn list(XABackends.element_values(self.xa_elem, "'
                         + property["name"]
                         + '"))'
                     )
@@ -0,0 +1,1098 @@
+""".. versionadded:: 0.3.1
+
+Backends supplying the scripting objects that PyXA's wrappers operate on.
+
+By default, PyXA communicates with applications through ScriptingBridge. When a backend is installed for an application, :class:`PyXA.Application` instead wraps the objects provided by the backend. Backend element arrays implement the interface defined by :class:`XABackendArray`, i.e. counting, indexing, selector fan-out, predicate filtering, and setting properties, and backend scripting objects implement the SBObject methods for getting and setting properties, as done by :class:`XAElementArray` and :class:`XAFakeObject`.
+
+This module does not depend on PyObjC, and importing it does not import :mod:`PyXA.XABase`, so the backends, their element arrays, and the functions that access element arrays can be used and tested on any platform, with plain Python callables as predicates. PyXA's wrapper classes, including :class:`PyXA.XABase.XAList` and :class:`PyXA.XABase.XAPredicate`, still import AppKit and ScriptingBridge, so running PyXA's list machinery against a backend requires macOS.
+
+:class:`XAFakeBackend` provides in-process fake applications that can be populated with synthetic datasets, allowing PyXA's list machinery to be benchmarked and tested without launching the real applications. :class:`XARecordingBackend` captures the scripting traffic of a real session to a trace file, which :class:`XAReplayBackend` then serves offline, optionally with the recorded latencies.
+
+:Example: Benchmark fetching track names from a library of 100,000 tracks
+
+>>> import time
+>>> import PyXA
+>>> from PyXA import XABackends
+>>>
+>>> backend = XABackends.XAFakeBackend()
+>>> backend.add_music_library(track_count=100000)
+>>> with XABackends.installed("Music", backend):
+...     music = PyXA.Application("Music")
+...     start = time.perf_counter()
+...     names = music.tracks().name()
+...     print(len(names), time.perf_counter() - start)
+100000 0.0213
+"""
+
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, Union
+
+from PyXA.XAErrors import ApplicationNotFoundError
+
+_backends: dict[str, "XABackend"] = {}
+_lock = threading.Lock()
+
+# Called with a description of each element array request and a function sending it, while PyXA calls are traced
+_request_hook: Union[Callable[[str, Callable[[], Any]], Any], None] = None
+
+
+class XABackend:
+    """A source of scripting objects for one or more applications.
+
+    Subclasses must implement :func:`running_application` and :func:`scripting_application`.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def running_application(self, app_name: str) -> Any:
+        """Gets an object standing in for the NSRunningApplication of an application.
+
+        :param app_name: The name of the application
+        :type app_name: str
+        :return: An object implementing the NSRunningApplication methods used by PyXA
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+    def scripting_application(self, app_name: str) -> Any:
+        """Gets an object standing in for the SBApplication of an application.
+
+        :param app_name: The name of the application
+        :type app_name: str
+        :return: The root scripting object of the application
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+
+def _xa_index_list(indexes: Any) -> list[int]:
+    # Accepts NSIndexSets as well as lists of positions
+    if not hasattr(indexes, "indexGreaterThanIndex_"):
+        return list(indexes)
+
+    positions = []
+    index = indexes.firstIndex()
+    while len(positions) < indexes.count():
+        positions.append(index)
+        index = indexes.indexGreaterThanIndex_(index)
+    return positions
+
+
+class _XAEnumerator:
+    def __init__(self, elements: "XABackendArray"):
+        self.__elements = elements
+        self.__position = 0
+
+    def __iter__(self):
+        return iter(self.__remaining())
+
+    def nextObject(self) -> Any:
+        if self.__position >= len(self.__elements):
+            return None
+        self.__position += 1
+        return self.__elements[self.__position - 1]
+
+    def allObjects(self) -> "XABackendArray":
+        remaining = self.__remaining()
+        self.__position = len(self.__elements)
+        return remaining
+
+    def __remaining(self) -> "XABackendArray":
+        return self.__elements.subarrayWithRange_(
+            (self.__position, len(self.__elements) - self.__position)
+        )
+
+
+class XABackendArray:
+    """The interface of arrays of scripting elements provided by backends, which :class:`PyXA.XABase.XAList` treats like SBElementArrays.
+
+    The interface consists of the NSArray and SBElementArray methods that PyXA's list machinery uses: counting and indexing elements, selecting sub-arrays, selector fan-out, predicate filtering, and setting a property of every element. SBElementArrays implement it natively. :class:`PyXA.XABase.XAList` accesses element arrays through :func:`element_count`, :func:`element_at`, :func:`element_values`, :func:`filtered_elements`, and :func:`set_element_values`, which dispatch to these methods.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def count(self) -> int:
+        """Gets the number of elements in the array.
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+    def objectAtIndex_(self, index: int) -> Any:
+        """Gets the element at an index of the array.
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+    def subarrayWithRange_(self, range: tuple[int, int]) -> "XABackendArray":
+        """Gets the elements in a range, given as a tuple of the start index and the length.
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+    def objectsAtIndexes_(self, indexes: Any) -> "XABackendArray":
+        """Gets the elements at a set of indexes, given as an NSIndexSet or a list of positions in any order.
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+    def arrayByApplyingSelector_(self, selector: str) -> list[Any]:
+        """Gets the value of a property of every element, in order.
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+    def filteredArrayUsingPredicate_(self, predicate: Any) -> "XABackendArray":
+        """Gets the elements that match a predicate.
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+    def setValue_forKey_(self, value: Any, key: str):
+        """Sets the value of a property of every element.
+
+        .. versionadded:: 0.3.1
+        """
+        raise NotImplementedError()
+
+
+def element_count(array: Any) -> int:
+    """Gets the number of elements in an element array.
+
+    :param array: An SBElementArray or :class:`XABackendArray`
+    :type array: Any
+    :return: The number of elements
+    :rtype: int
+
+    .. versionadded:: 0.3.1
+    """
+    if _request_hook is not None:
+        return _request_hook("bridge count", array.count)
+    return array.count()
+
+
+def element_at(array: Any, index: int) -> Any:
+    """Gets the element at an index of an element array.
+
+    :param array: An SBElementArray or :class:`XABackendArray`
+    :type array: Any
+    :param index: The index of the element
+    :type index: int
+    :return: The element
+    :rtype: Any
+
+    .. versionadded:: 0.3.1
+    """
+    if _request_hook is not None:
+        return _request_hook("bridge element", lambda: array.objectAtIndex_(index))
+    return array.objectAtIndex_(index)
+
+
+def element_values(array: Any, selector: str) -> list[Any]:
+    """Gets the value of a property of every element of an element array with a single request.
+
+    :param array: An SBElementArray or :class:`XABackendArray`
+    :type array: Any
+    :param selector: The selector name of the property, e.g. `playedCount`
+    :type selector: str
+    :return: The values of the property, in order
+    :rtype: list[Any]
+
+    .. versionadded:: 0.3.1
+    """
+    if _request_hook is not None:
+        return _request_hook(
+            "bridge get " + selector, lambda: array.arrayByApplyingSelector_(selector)
+        )
+    return array.arrayByApplyingSelector_(selector)
+
+
+def filtered_elements(array: Any, predicate: Any) -> Any:
+    """Gets the elements of an element array that match a predicate.
+
+    :param array: An SBElementArray or :class:`XABackendArray`
+    :type array: Any
+    :param predicate: The predicate to match
+    :type predicate: Any
+    :return: The matching elements
+    :rtype: Any
+
+    .. versionadded:: 0.3.1
+    """
+    if _request_hook is not None:
+        return _request_hook(
+            "bridge filter", lambda: array.filteredArrayUsingPredicate_(predicate)
+        )
+    return array.filteredArrayUsingPredicate_(predicate)
+
+
+def set_element_values(array: Any, value: Any, key: str):
+    """Sets the value of a property of every element of an element array with a single request.
+
+    :param array: An SBElementArray or :class:`XABackendArray`
+    :type array: Any
+    :param value: The new value of the property
+    :type value: Any
+    :param key: The selector name of the property
+    :type key: str
+
+    .. versionadded:: 0.3.1
+    """
+    if _request_hook is not None:
+        _request_hook("bridge set " + key, lambda: array.setValue_forKey_(value, key))
+        return
+    array.setValue_forKey_(value, key)
+
+
+class XAElementArray(XABackendArray, list):
+    """A pure-Python array of scripting objects implementing the subset of the NSArray and SBElementArray interfaces used by :class:`PyXA.XABase.XAList`.
+
+    Elements must implement `valueForKey_`, `setValue_forKey_`, and `properties`, as :class:`XAFakeObject` does.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def count(self) -> int:
+        return len(self)
+
+    def get(self) -> "XAElementArray":
+        return self
+
+    def objectAtIndex_(self, index: int) -> Any:
+        return self[index]
+
+    def firstObject(self) -> Any:
+        return self[0] if len(self) > 0 else None
+
+    def lastObject(self) -> Any:
+        return self[-1] if len(self) > 0 else None
+
+    def objectEnumerator(self) -> _XAEnumerator:
+        return _XAEnumerator(self.__class__(self))
+
+    def reverseObjectEnumerator(self) -> _XAEnumerator:
+        return _XAEnumerator(self.__class__(self[::-1]))
+
+    def subarrayWithRange_(self, range: tuple[int, int]) -> "XAElementArray":
+        start, length = range
+        return self.__class__(self[start : start + length])
+
+    def objectsAtIndexes_(self, indexes: Any) -> "XAElementArray":
+        return self.__class__(self[index] for index in _xa_index_list(indexes))
+
+    def shuffledArray(self) -> "XAElementArray":
+        elements = self.__class__(self)
+        random.shuffle(elements)
+        return elements
+
+    def sortedArrayUsingDescriptors_(
+        self, descriptors: list[Any]
+    ) -> "XAElementArray":
+        """Sorts the array by the keys and directions of NSSortDescriptors, or of any objects with `key` and `ascending` methods. Elements missing a value are sorted last, as by :func:`PyXA.XABase.XAList.sort_by`.
+
+        .. versionadded:: 0.3.1
+        """
+        elements = list(self)
+        # Stable sorts applied from the least to the most significant key
+        for descriptor in reversed(list(descriptors)):
+            key = descriptor.key()
+            present = [e for e in elements if e.valueForKey_(key) is not None]
+            missing = [e for e in elements if e.valueForKey_(key) is None]
+            present.sort(
+                key=lambda element: element.valueForKey_(key),
+                reverse=not descriptor.ascending(),
+            )
+            elements = present + missing
+        return self.__class__(elements)
+
+    def arrayByApplyingSelector_(self, selector: str) -> list[Any]:
+        return [element.valueForKey_(selector) for element in self]
+
+    def valueForKey_(self, key: str) -> list[Any]:
+        return self.arrayByApplyingSelector_(key)
+
+    def setValue_forKey_(self, value: Any, key: str):
+        for element in self:
+            element.setValue_forKey_(value, key)
+
+    def filteredArrayUsingPredicate_(
+        self, predicate: Union[Callable[[dict], bool], Any]
+    ) -> "XAElementArray":
+        """Filters the array by evaluating an NSPredicate, or any callable, against the property dictionary of each element.
+
+        .. versionadded:: 0.3.1
+        """
+        evaluate = predicate if callable(predicate) else predicate.evaluateWithObject_
+        return self.__class__(
+            element for element in self if evaluate(element.properties())
+        )
+
+    def addObject_(self, element: Any):
+        self.append(element)
+
+    def insertObject_atIndex_(self, element: Any, index: int):
+        self.insert(index, element)
+
+    def removeLastObject(self):
+        self.pop()
+
+
+class XAFakeObject:
+    """An in-process stand-in for an SBObject, holding its properties and element arrays in dictionaries.
+
+    Properties and elements are accessed the same way as through ScriptingBridge, e.g. `track.name()`, `track.setName_("Example")`, and `app.tracks()`.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(
+        self,
+        properties: Union[dict[str, Any], None] = None,
+        elements: Union[dict[str, list["XAFakeObject"]], None] = None,
+    ):
+        """Creates a fake scripting object.
+
+        :param properties: A dictionary mapping selector names, e.g. `playedCount`, to property values, defaults to None
+        :type properties: Union[dict[str, Any], None], optional
+        :param elements: A dictionary mapping element selector names, e.g. `tracks`, to lists of fake objects, defaults to None
+        :type elements: Union[dict[str, list[XAFakeObject]], None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.xa_properties: dict[str, Any] = dict(properties or {})  #: The object's properties, keyed by selector name
+        self.xa_elements: dict[str, XAElementArray] = {
+            name: XAElementArray(values) for name, values in (elements or {}).items()
+        }  #: The object's element arrays, keyed by selector name
+
+    def valueForKey_(self, key: str) -> Any:
+        if key == "properties":
+            return self.properties()
+        if key in self.xa_elements:
+            return self.xa_elements[key]
+        return self.xa_properties.get(key)
+
+    def setValue_forKey_(self, value: Any, key: str):
+        self.xa_properties[key] = value
+
+    def properties(self) -> dict[str, Any]:
+        return dict(self.xa_properties)
+
+    def get(self) -> "XAFakeObject":
+        return self
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("__") or name.startswith("xa_"):
+            raise AttributeError(name)
+
+        if name.startswith("set") and name.endswith("_") and len(name) > 4:
+            key = name[3].lower() + name[4:-1]
+            return lambda value: self.setValue_forKey_(value, key)
+
+        if name in self.xa_elements:
+            return lambda: self.xa_elements[name]
+
+        if name in self.xa_properties:
+            return lambda: self.xa_properties[name]
+
+        raise AttributeError(
+            f"{type(self).__name__} has no property or element named {name}"
+        )
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.xa_properties.get("name")) + ">"
+
+
+class XAFakeRunningApplication:
+    """An in-process stand-in for the NSRunningApplication of a fake application.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, name: str, bundle_identifier: str):
+        self.__name = name
+        self.__bundle_identifier = bundle_identifier
+        self.__launch_date = datetime.now()
+
+    def localizedName(self) -> str:
+        return self.__name
+
+    def bundleIdentifier(self) -> str:
+        return self.__bundle_identifier
+
+    def processIdentifier(self) -> int:
+        return -1
+
+    def bundleURL(self) -> None:
+        return None
+
+    def executableURL(self) -> None:
+        return None
+
+    def launchDate(self) -> datetime:
+        return self.__launch_date
+
+    def icon(self) -> None:
+        return None
+
+    def isActive(self) -> bool:
+        return False
+
+    def isHidden(self) -> bool:
+        return False
+
+    def ownsMenuBar(self) -> bool:
+        return False
+
+    def activateWithOptions_(self, options: int) -> bool:
+        return True
+
+    def hide(self) -> bool:
+        return True
+
+    def unhide(self) -> bool:
+        return True
+
+    def terminate(self) -> bool:
+        return True
+
+    def __repr__(self):
+        return "<" + str(type(self)) + self.__name + ">"
+
+
+class XAFakeBackend(XABackend):
+    """A backend serving in-process fake applications.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self):
+        self.xa_apps: dict[str, tuple[XAFakeRunningApplication, XAFakeObject]] = {}  #: The fake applications, keyed by lowercase name
+
+    def add_application(
+        self,
+        app_name: str,
+        bundle_identifier: Union[str, None] = None,
+        properties: Union[dict[str, Any], None] = None,
+        elements: Union[dict[str, list[XAFakeObject]], None] = None,
+    ) -> XAFakeObject:
+        """Adds a fake application to the backend.
+
+        :param app_name: The name of the application
+        :type app_name: str
+        :param bundle_identifier: The bundle identifier of the application, defaults to None
+        :type bundle_identifier: Union[str, None], optional
+        :param properties: The properties of the application's root scripting object, defaults to None
+        :type properties: Union[dict[str, Any], None], optional
+        :param elements: The element arrays of the application's root scripting object, defaults to None
+        :type elements: Union[dict[str, list[XAFakeObject]], None], optional
+        :return: The root scripting object of the application
+        :rtype: XAFakeObject
+
+        .. versionadded:: 0.3.1
+        """
+        root = XAFakeObject(
+            {
+                "name": app_name,
+                "frontmost": False,
+                "version": "1.0",
+                **(properties or {}),
+            },
+            elements,
+        )
+        running_app = XAFakeRunningApplication(
+            app_name, bundle_identifier or "com.example." + app_name.replace(" ", "")
+        )
+        self.xa_apps[app_name.lower()] = (running_app, root)
+        return root
+
+    def add_music_library(
+        self, track_count: int = 100000, seed: int = 0
+    ) -> XAFakeObject:
+        """Adds a fake Music application containing a library of synthetic tracks.
+
+        :param track_count: The number of tracks to generate, defaults to 100000
+        :type track_count: int, optional
+        :param seed: The seed of the random number generator, defaults to 0
+        :type seed: int, optional
+        :return: The root scripting object of the application
+        :rtype: XAFakeObject
+
+        .. versionadded:: 0.3.1
+        """
+        rng = random.Random(seed)
+        genres = ["Pop", "Rock", "Jazz", "Classical", "Hip-Hop", "Electronic", "Folk"]
+        artists = [f"Artist {index}" for index in range(max(track_count // 50, 1))]
+        start_date = datetime(2010, 1, 1)
+
+        tracks = []
+        for index in range(track_count):
+            artist = rng.choice(artists)
+            tracks.append(
+                XAFakeObject(
+                    {
+                        "id": index + 1,
+                        "index": index + 1,
+                        "persistentID": f"{rng.getrandbits(64):016X}",
+                        "name": f"Track {index + 1}",
+                        "artist": artist,
+                        "albumArtist": artist,
+                        "album": f"{artist} Album {rng.randint(1, 5)}",
+                        "genre": rng.choice(genres),
+                        "duration": rng.uniform(60, 600),
+                        "trackNumber": rng.randint(1, 20),
+                        "year": rng.randint(1960, 2023),
+                        "playedCount": rng.randint(0, 500),
+                        "rating": rng.choice([0, 20, 40, 60, 80, 100]),
+                        "loved": rng.random() < 0.1,
+                        "enabled": True,
+                        "dateAdded": start_date + timedelta(minutes=index),
+                        "kind": "MPEG audio file",
+                    }
+                )
+            )
+
+        return self.add_application(
+            "Music",
+            "com.apple.Music",
+            elements={"tracks": tracks, "playlists": [], "sources": []},
+        )
+
+    def add_messages_history(
+        self, transfer_count: int = 50000, chat_count: int = 500, seed: int = 0
+    ) -> XAFakeObject:
+        """Adds a fake Messages application containing synthetic chats and file transfers.
+
+        Messages' scripting dictionary does not expose individual messages, so file transfers stand in for message history.
+
+        :param transfer_count: The number of file transfers to generate, defaults to 50000
+        :type transfer_count: int, optional
+        :param chat_count: The number of chats to generate, defaults to 500
+        :type chat_count: int, optional
+        :param seed: The seed of the random number generator, defaults to 0
+        :type seed: int, optional
+        :return: The root scripting object of the application
+        :rtype: XAFakeObject
+
+        .. versionadded:: 0.3.1
+        """
+        rng = random.Random(seed)
+        account = XAFakeObject(
+            {
+                "id": "E:example@icloud.com",
+                "objectDescription": "example@icloud.com",
+                "enabled": True,
+            }
+        )
+        participants = [
+            XAFakeObject(
+                {
+                    "id": f"participant-{index}",
+                    "handle": f"+1555{index:07d}",
+                    "name": f"Participant {index}",
+                    "firstName": "Participant",
+                    "lastName": str(index),
+                    "fullName": f"Participant {index}",
+                }
+            )
+            for index in range(max(chat_count, 1))
+        ]
+        chats = [
+            XAFakeObject(
+                {
+                    "id": f"iMessage;-;chat{index}",
+                    "name": f"Chat {index}",
+                    "account": account,
+                },
+                {"participants": rng.sample(participants, min(3, len(participants)))},
+            )
+            for index in range(chat_count)
+        ]
+        start_date = datetime(2015, 1, 1)
+        transfers = [
+            XAFakeObject(
+                {
+                    "id": f"transfer-{index}",
+                    "name": f"Attachment {index}.jpeg",
+                    "filePath": f"/Users/example/Library/Messages/Attachments/{index}.jpeg",
+                    "direction": rng.choice([0, 1]),
+                    "account": account,
+                    "participant": rng.choice(participants),
+                    "fileSize": rng.randint(1000, 10000000),
+                    "fileProgress": 100,
+                    "transferStatus": 0,
+                    "started": start_date + timedelta(minutes=index),
+                }
+            )
+            for index in range(transfer_count)
+        ]
+
+        return self.add_application(
+            "Messages",
+            "com.apple.MobileSMS",
+            elements={
+                "chats": chats,
+                "fileTransfers": transfers,
+                "participants": participants,
+                "accounts": [account],
+                "documents": [],
+            },
+        )
+
+    def running_application(self, app_name: str) -> XAFakeRunningApplication:
+        return self.__app(app_name)[0]
+
+    def scripting_application(self, app_name: str) -> XAFakeObject:
+        return self.__app(app_name)[1]
+
+    def __app(self, app_name: str) -> tuple[XAFakeRunningApplication, XAFakeObject]:
+        app = self.xa_apps.get(app_name.lower())
+        if app is None:
+            raise KeyError(f"{app_name} has not been added to this backend")
+        return app
+
+
+# Array methods whose results are themselves arrays of scripting elements
+_ARRAY_SELECTORS = {
+    "get",
+    "filteredArrayUsingPredicate_",
+    "subarrayWithRange_",
+    "objectsAtIndexes_",
+    "sortedArrayUsingDescriptors_",
+    "shuffledArray",
+}
+
+# Enumerators are recorded as the list of objects they enumerate
+_ENUMERATOR_SELECTORS = {"objectEnumerator", "reverseObjectEnumerator"}
+
+
+class _XAProxyObject:
+    # Stands in for a scripting object, forwarding every method call to its backend
+    def __init__(self, backend: XABackend, path: str, target: Any = None):
+        self.xa_backend = backend
+        self.xa_path = path
+        self.xa_target = target
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("__") or name.startswith("xa_"):
+            raise AttributeError(name)
+        if not self.xa_backend.xa_responds(self, name):
+            raise AttributeError(f"{self.xa_path} has no method named {name}")
+        return lambda *args: self.xa_backend.xa_call(self, name, args)
+
+    def __repr__(self):
+        return "<" + str(type(self)) + self.xa_path + ">"
+
+
+class _XAProxyArray(_XAProxyObject, XABackendArray):
+    # The interface methods are forwarded explicitly, since they would otherwise resolve to XABackendArray
+    def count(self) -> int:
+        return self.xa_backend.xa_call(self, "count", ())
+
+    def objectAtIndex_(self, index: int) -> Any:
+        return self.xa_backend.xa_call(self, "objectAtIndex_", (index,))
+
+    def subarrayWithRange_(self, range: tuple[int, int]) -> Any:
+        return self.xa_backend.xa_call(self, "subarrayWithRange_", (range,))
+
+    def objectsAtIndexes_(self, indexes: Any) -> Any:
+        return self.xa_backend.xa_call(self, "objectsAtIndexes_", (indexes,))
+
+    def arrayByApplyingSelector_(self, selector: str) -> list[Any]:
+        return self.xa_backend.xa_call(self, "arrayByApplyingSelector_", (selector,))
+
+    def filteredArrayUsingPredicate_(self, predicate: Any) -> Any:
+        return self.xa_backend.xa_call(self, "filteredArrayUsingPredicate_", (predicate,))
+
+    def setValue_forKey_(self, value: Any, key: str):
+        return self.xa_backend.xa_call(self, "setValue_forKey_", (value, key))
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        return iter(self.objectEnumerator())
+
+    def __getitem__(self, index: int) -> Any:
+        return self.objectAtIndex_(index)
+
+
+def _xa_encode_argument(value: Any) -> Any:
+    if isinstance(value, _XAProxyObject):
+        return {"$ref": value.xa_path}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_xa_encode_argument(item) for item in value]
+    if isinstance(value, dict):
+        return {"$dict": {str(k): _xa_encode_argument(v) for k, v in value.items()}}
+    if isinstance(value, datetime):
+        return {"$date": value.timestamp()}
+    if hasattr(value, "predicateFormat"):
+        return {"$predicate": str(value.predicateFormat())}
+    if hasattr(value, "indexGreaterThanIndex_"):
+        return {"$indexes": _xa_index_list(value)}
+    if hasattr(value, "ascending") and hasattr(value, "key"):
+        return {"$sort": [str(value.key()), bool(value.ascending())]}
+    if hasattr(value, "timeIntervalSince1970"):
+        return {"$date": float(value.timeIntervalSince1970())}
+    return {"$repr": str(value)}
+
+
+def _xa_call_path(path: str, selector: str, args: list[Any]) -> str:
+    if len(args) == 0:
+        return path + "." + selector
+
+    encoded_args = json.dumps(args, separators=(",", ":"), sort_keys=True)
+    if len(encoded_args) > 64:
+        # Keeps paths short for calls with long arguments, e.g. thousands of positions
+        encoded_args = "#" + hashlib.sha1(encoded_args.encode()).hexdigest()[:16]
+    return path + "." + selector + "(" + encoded_args + ")"
+
+
+class XARecordingBackend(XABackend):
+    """A backend that forwards calls to running applications through ScriptingBridge while recording the traffic, i.e. each call along with its returned value and latency.
+
+    Recorded traffic can be saved with :func:`save` and replayed with :class:`XAReplayBackend`. Recorded applications must already be running.
+
+    :Example: Record a session of Music
+
+    >>> import PyXA
+    >>> from PyXA import XABackends
+    >>>
+    >>> backend = XABackends.XARecordingBackend()
+    >>> with XABackends.installed("Music", backend):
+    ...     tracks = PyXA.Application("Music").tracks()
+    ...     columns = tracks.fetch(["name", "artist", "played_count"])
+    >>>
+    >>> backend.save("/Users/exampleUser/music_session.json.gz")
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self):
+        self.xa_apps: dict[str, list[str]] = {}  #: The name and bundle identifier of each recorded application, keyed by lowercase name
+        self.xa_calls: list[list[Any]] = []  #: The recorded calls, each as a list of the call path, the encoded result, and the latency in seconds
+        self.__lock = threading.Lock()
+
+    @property
+    def total_latency(self) -> float:
+        """The total time, in seconds, spent waiting for recorded calls to return.
+
+        .. versionadded:: 0.3.1
+        """
+        return sum(call[2] for call in self.xa_calls)
+
+    def running_application(self, app_name: str) -> "AppKit.NSRunningApplication":
+        import AppKit
+
+        for app in AppKit.NSWorkspace.sharedWorkspace().runningApplications():
+            name = str(app.localizedName())
+            if name.lower() == app_name.lower():
+                self.xa_apps[app_name.lower()] = [name, str(app.bundleIdentifier())]
+                return app
+        raise ApplicationNotFoundError(app_name)
+
+    def scripting_application(self, app_name: str) -> _XAProxyObject:
+        import ScriptingBridge
+
+        running_app = self.running_application(app_name)
+        app = ScriptingBridge.SBApplication.applicationWithProcessIdentifier_(
+            running_app.processIdentifier()
+        )
+        return _XAProxyObject(self, app_name.lower(), app)
+
+    def xa_responds(self, proxy: _XAProxyObject, selector: str) -> bool:
+        """Whether the scripting object that a proxy stands in for has a method with the given selector.
+
+        .. versionadded:: 0.3.1
+        """
+        return hasattr(proxy.xa_target, selector)
+
+    def xa_call(self, proxy: _XAProxyObject, selector: str, args: tuple) -> Any:
+        """Forwards a call to the scripting object that a proxy stands in for, recording the call.
+
+        .. versionadded:: 0.3.1
+        """
+        call_path = _xa_call_path(proxy.xa_path, selector, _xa_encode_argument(args))
+        target_args = [
+            arg.xa_target if isinstance(arg, _XAProxyObject) else arg for arg in args
+        ]
+
+        start = time.perf_counter()
+        if selector == "objectsAtIndexes_" and isinstance(target_args[0], list):
+            # Positions may be out of order, which index sets cannot express
+            import AppKit
+
+            result = AppKit.NSMutableArray.alloc().initWithCapacity_(
+                len(target_args[0])
+            )
+            for position in target_args[0]:
+                result.addObject_(proxy.xa_target.objectAtIndex_(position))
+        elif selector in _ENUMERATOR_SELECTORS:
+            result = getattr(proxy.xa_target, selector)().allObjects()
+        else:
+            result = getattr(proxy.xa_target, selector)(*target_args)
+        latency = time.perf_counter() - start
+
+        as_array = isinstance(proxy, _XAProxyArray) and selector in _ARRAY_SELECTORS
+        encoded, value = self.__encode(result, call_path, as_array)
+        with self.__lock:
+            self.xa_calls.append([call_path, encoded, round(latency, 6)])
+
+        if selector in _ENUMERATOR_SELECTORS:
+            return _XAEnumerator(value)
+        return value
+
+    def __encode(
+        self, value: Any, path: str, as_array: bool = False
+    ) -> tuple[Any, Any]:
+        # Gets the JSON-serializable form of a value and the value to return in its place
+        import AppKit
+        import ScriptingBridge
+
+        if value is None or isinstance(value, AppKit.NSNull):
+            return None, None
+        if isinstance(value, ScriptingBridge.SBElementArray) or (
+            as_array and isinstance(value, AppKit.NSArray)
+        ):
+            return {"$array": path}, _XAProxyArray(self, path, value)
+        if isinstance(value, ScriptingBridge.SBObject):
+            return {"$ref": path}, _XAProxyObject(self, path, value)
+        if isinstance(value, (bool, int, float, str)):
+            return value, value
+        if isinstance(value, (AppKit.NSArray, list, tuple)):
+            items = [
+                self.__encode(item, path + f"[{index}]")
+                for index, item in enumerate(value)
+            ]
+            return [item[0] for item in items], [item[1] for item in items]
+        if isinstance(value, (AppKit.NSDictionary, dict)):
+            items = {
+                str(key): self.__encode(item, path + f"[{key}]")
+                for key, item in value.items()
+            }
+            return (
+                {"$dict": {key: item[0] for key, item in items.items()}},
+                {key: item[1] for key, item in items.items()},
+            )
+        if isinstance(value, datetime):
+            return {"$date": value.timestamp()}, value
+        if isinstance(value, AppKit.NSDate):
+            return {"$date": float(value.timeIntervalSince1970())}, value
+        return {"$repr": str(value)}, value
+
+    def save(self, path: str):
+        """Saves the recorded traffic to a trace file, compressed with gzip if the path ends in `.gz`.
+
+        :param path: The path of the trace file
+        :type path: str
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            trace = {"version": 1, "apps": self.xa_apps, "calls": self.xa_calls}
+            opener = gzip.open if path.endswith(".gz") else open
+            with opener(path, "wt") as file:
+                json.dump(trace, file, separators=(",", ":"))
+
+
+class XAReplayBackend(XABackend):
+    """A backend that serves the traffic recorded by :class:`XARecordingBackend` without contacting any applications.
+
+    Each call receives the responses recorded for the same call path in the order they were recorded, with the last response repeated once all have been served. Dates are replayed as :class:`datetime.datetime` objects, and values without a JSON representation as their string descriptions.
+
+    :Example: Measure PyXA's overhead in a recorded session
+
+    >>> import time
+    >>> import PyXA
+    >>> from PyXA import XABackends
+    >>>
+    >>> backend = XABackends.XAReplayBackend("/Users/exampleUser/music_session.json.gz")
+    >>> with XABackends.installed("Music", backend):
+    ...     start = time.perf_counter()
+    ...     tracks = PyXA.Application("Music").tracks()
+    ...     columns = tracks.fetch(["name", "artist", "played_count"])
+    ...     print(time.perf_counter() - start, backend.total_latency)
+    0.0124 1.8392
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, path: str, latency_scale: float = 0):
+        """Loads a trace file.
+
+        :param path: The path of a trace file saved by :func:`XARecordingBackend.save`
+        :type path: str
+        :param latency_scale: The factor to multiply recorded latencies by when replaying calls, e.g. 1 to reproduce them, defaults to 0
+        :type latency_scale: float, optional
+
+        .. versionadded:: 0.3.1
+        """
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt") as file:
+            trace = json.load(file)
+
+        self.latency_scale = latency_scale  #: The factor that recorded latencies are multiplied by when replaying calls
+        self.xa_apps: dict[str, list[str]] = trace["apps"]  #: The name and bundle identifier of each recorded application, keyed by lowercase name
+        self.total_latency: float = 0  #: The total time, in seconds, that the recorded calls spent waiting for applications to respond
+
+        self.__responses: dict[str, list[tuple[Any, float]]] = {}
+        self.__positions: dict[str, int] = {}
+        self.__selectors: dict[str, bool] = {}
+        self.__lock = threading.Lock()
+        for call_path, result, latency in trace["calls"]:
+            self.__responses.setdefault(call_path, []).append((result, latency))
+            self.total_latency += latency
+
+    def running_application(self, app_name: str) -> XAFakeRunningApplication:
+        app = self.xa_apps.get(app_name.lower())
+        if app is None:
+            raise ApplicationNotFoundError(app_name)
+        return XAFakeRunningApplication(app[0], app[1])
+
+    def scripting_application(self, app_name: str) -> _XAProxyObject:
+        self.running_application(app_name)
+        return _XAProxyObject(self, app_name.lower())
+
+    def xa_responds(self, proxy: _XAProxyObject, selector: str) -> bool:
+        """Whether the trace contains a call of the given selector on the object that a proxy stands in for.
+
+        .. versionadded:: 0.3.1
+        """
+        prefix = proxy.xa_path + "." + selector
+        with self.__lock:
+            responds = self.__selectors.get(prefix)
+            if responds is None:
+                responds = any(
+                    call_path == prefix or call_path.startswith(prefix + "(")
+                    for call_path in self.__responses
+                )
+                self.__selectors[prefix] = responds
+        return responds
+
+    def xa_call(self, proxy: _XAProxyObject, selector: str, args: tuple) -> Any:
+        """Serves the next recorded response to a call.
+
+        .. versionadded:: 0.3.1
+        """
+        call_path = _xa_call_path(proxy.xa_path, selector, _xa_encode_argument(args))
+        responses = self.__responses.get(call_path)
+        if responses is None:
+            raise KeyError(f"{call_path} was not recorded")
+
+        with self.__lock:
+            position = self.__positions.get(call_path, 0)
+            self.__positions[call_path] = min(position + 1, len(responses) - 1)
+
+        result, latency = responses[position]
+        if self.latency_scale > 0:
+            time.sleep(latency * self.latency_scale)
+
+        value = self.__decode(result)
+        if selector in _ENUMERATOR_SELECTORS:
+            return _XAEnumerator(value)
+        return value
+
+    def rewind(self):
+        """Resets the position of every call path, so that recorded responses are served again from the beginning.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            self.__positions.clear()
+
+    def __decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.__decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+
+        kind, data = next(iter(value.items()))
+        if kind == "$array":
+            return _XAProxyArray(self, data)
+        if kind == "$ref":
+            return _XAProxyObject(self, data)
+        if kind == "$dict":
+            return {key: self.__decode(item) for key, item in data.items()}
+        if kind == "$date":
+            return datetime.fromtimestamp(data)
+        return data
+
+
+def install(app_name: str, backend: XABackend):
+    """Installs a backend for an application, so that subsequently created application objects use it.
+
+    :param app_name: The name of the application
+    :type app_name: str
+    :param backend: The backend to install
+    :type backend: XABackend
+
+    .. versionadded:: 0.3.1
+    """
+    with _lock:
+        _backends[app_name.lower()] = backend
+
+
+def uninstall(app_name: str):
+    """Removes the backend installed for an application, restoring the default ScriptingBridge backend.
+
+    :param app_name: The name of the application
+    :type app_name: str
+
+    .. versionadded:: 0.3.1
+    """
+    with _lock:
+        _backends.pop(app_name.lower(), None)
+
+
+def backend_for(app_name: str) -> Union[XABackend, None]:
+    """Gets the backend installed for an application.
+
+    :param app_name: The name of the application
+    :type app_name: str
+    :return: The installed backend, or None if the application uses the default backend
+    :rtype: Union[XABackend, None]
+
+    .. versionadded:: 0.3.1
+    """
+    return _backends.get(app_name.lower())
+
+
+@contextmanager
+def installed(app_name: str, backend: XABackend) -> Iterator[XABackend]:
+    """Installs a backend for an application within a `with` block.
+
+    :param app_name: The name of the application
+    :type app_name: str
+    :param backend: The backend to install
+    :type backend: XABackend
+    :yield: The installed backend
+    :rtype: Iterator[XABackend]
+
+    .. versionadded:: 0.3.1
+    """
+    previous = backend_for(app_name)
+    install(app_name, backend)
+    try:
+        yield backend
+    finally:
+        if previous is None:
+            uninstall(app_name)
+        else:
+            install(app_name, previous)
@@ -3,37 +3,44 @@
 General classes and methods applicable to any PyXA object.
 """
 
+import functools
+import hashlib
+import heapq
 import importlib
+import json
 import math
 import os
+import plistlib
 import random
 import re
 import sys
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from enum import Enum
 from pprint import pprint
-from typing import Any, Callable, Literal, Union
-
-import macimg, macimg.filters, macimg.distortions, macimg.transforms, macimg.compositions
+from typing import Any, Callable, Iterator, Literal, Union
 
 import AppKit
-import Quartz
-import requests
 import ScriptingBridge
-import DataDetection
-import libdispatch
-from bs4 import BeautifulSoup, element
 from PyObjCTools import AppHelper
 
+from PyXA import XABackends
 from PyXA.XAErrors import (
     ApplicationNotFoundError,
     InvalidPredicateError,
     AppleScriptError,
 )
 from PyXA.XAProtocols import XACanOpenPath, XAClipboardCodable, XAPathLike
-from PyXA.XATypes import XADatetimeBlock
+from PyXA.XATypes import (
+    XADatetimeBlock,
+    XAScriptCacheInfo,
+    XASnapshotDiff,
+    XAUpdateReport,
+)
 
 from .apps import application_classes
 
@@ -73,6 +80,389 @@ def camelize(text: str) -> str:
     return parts[0] + "".join([part.title() for part in parts[1:]])
 
 
+def _xa_is_element_array(obj: Any) -> bool:
+    """Checks whether an object is an array of scripting elements, either from ScriptingBridge or from an installed backend.
+
+    .. versionadded:: 0.3.1
+    """
+    return isinstance(
+        obj, (ScriptingBridge.SBElementArray, XABackends.XABackendArray)
+    )
+
+
+# The maximum number of identifiers targeted by a single whose clause
+_XA_WHOSE_LIMIT = 200
+
+
+def _xa_identifier_predicate(key: str, identifiers: list[Any]) -> "AppKit.NSPredicate":
+    """Creates a predicate matching the elements whose identifier property has one of the given values.
+
+    .. versionadded:: 0.3.1
+    """
+    return AppKit.NSCompoundPredicate.orPredicateWithSubpredicates_(
+        [
+            AppKit.NSPredicate.predicateWithFormat_("%K == %@", key, identifier)
+            for identifier in identifiers
+        ]
+    )
+
+
+class _XAElementIdentifiers:
+    """The identifiers of the elements of an SBElementArray, retrieved with a single request when first needed.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, array: "ScriptingBridge.SBElementArray", key: str = "id"):
+        self.xa_array = array
+        self.xa_key = key
+        self.__identifiers = None
+        self.__lock = threading.Lock()
+
+    def get(self) -> list[Any]:
+        """Gets the identifier of each element, in order, with None for elements whose identifier is missing or shared with another element.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            if self.__identifiers is None:
+                try:
+                    identifiers = [
+                        None if isinstance(identifier, AppKit.NSNull) else identifier
+                        for identifier in XABackends.element_values(
+                            self.xa_array, self.xa_key
+                        )
+                    ]
+                except Exception:
+                    # The elements have no identifier property
+                    identifiers = [None] * XABackends.element_count(self.xa_array)
+
+                occurrences: dict[Any, int] = {}
+                for identifier in identifiers:
+                    identifier = _xa_hashable(identifier)
+                    occurrences[identifier] = occurrences.get(identifier, 0) + 1
+                self.__identifiers = [
+                    identifier
+                    if identifier is not None
+                    and occurrences[_xa_hashable(identifier)] == 1
+                    else None
+                    for identifier in identifiers
+                ]
+            return self.__identifiers
+
+
+class _XAElementSlice(XABackends.XABackendArray):
+    """The elements at a selection of positions of an SBElementArray, in any order, e.g. a slice of the array.
+
+    ScriptingBridge has no range specifiers, so a slice cannot be another SBElementArray. Instead, requests for the slice's elements are sent to the parent array with whose clauses targeting the elements by their identifiers, up to 200 identifiers at a time. The identifiers of the parent's elements are retrieved with one request when first needed and are shared with the slices of the slice. Elements without a unique identifier are accessed one at a time.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(
+        self,
+        parent: "ScriptingBridge.SBElementArray",
+        positions: list[int],
+        identifiers: Union[_XAElementIdentifiers, None] = None,
+    ):
+        self.xa_parent = parent
+        self.xa_positions = list(positions)
+        self.xa_identifiers = identifiers or _XAElementIdentifiers(parent)
+        # ScriptingBridge creates a new reference each time an element is accessed, so references are reused to keep cached property values of the slice's elements reachable
+        self.__elements: dict[int, Any] = {}
+
+    def __slice(self, positions: list[int]) -> "_XAElementSlice":
+        return _XAElementSlice(self.xa_parent, positions, self.xa_identifiers)
+
+    def __targets(self) -> tuple[list[tuple[list[int], Any]], list[int]]:
+        # Groups the distinct parent positions into whose clauses, ordered by position as the clauses' results are; positions without a unique identifier are returned separately
+        if not self.xa_positions:
+            return [], []
+
+        identifiers = self.xa_identifiers.get()
+        positions = sorted(set(self.xa_positions))
+        identified = [
+            position for position in positions if identifiers[position] is not None
+        ]
+        groups = []
+        for start in range(0, len(identified), _XA_WHOSE_LIMIT):
+            group = identified[start : start + _XA_WHOSE_LIMIT]
+            predicate = _xa_identifier_predicate(
+                self.xa_identifiers.xa_key,
+                [identifiers[position] for position in group],
+            )
+            groups.append((group, predicate))
+        return groups, [
+            position for position in positions if identifiers[position] is None
+        ]
+
+    def count(self) -> int:
+        return len(self.xa_positions)
+
+    def get(self) -> "AppKit.NSArray":
+        elements = self.xa_parent.get()
+        return AppKit.NSArray.arrayWithArray_(
+            [elements.objectAtIndex_(position) for position in self.xa_positions]
+        )
+
+    def objectAtIndex_(self, index: int) -> Any:
+        position = self.xa_positions[index]
+        element = self.__elements.get(position)
+        if element is None:
+            element = self.xa_parent.objectAtIndex_(position)
+            self.__elements[position] = element
+        return element
+
+    def firstObject(self) -> Any:
+        return self.objectAtIndex_(0) if self.xa_positions else None
+
+    def lastObject(self) -> Any:
+        return self.objectAtIndex_(-1) if self.xa_positions else None
+
+    def objectEnumerator(self) -> Iterator[Any]:
+        return iter(self)
+
+    def reverseObjectEnumerator(self) -> "XABackends._XAEnumerator":
+        return XABackends._XAEnumerator(self.__slice(self.xa_positions[::-1]))
+
+    def subarrayWithRange_(self, range: tuple[int, int]) -> "_XAElementSlice":
+        start, length = range
+        return self.__slice(self.xa_positions[start : start + length])
+
+    def objectsAtIndexes_(self, indexes: Any) -> "_XAElementSlice":
+        return self.__slice(
+            [self.xa_positions[index] for index in XABackends._xa_index_list(indexes)]
+        )
+
+    def shuffledArray(self) -> "_XAElementSlice":
+        return self.__slice(random.sample(self.xa_positions, len(self.xa_positions)))
+
+    def arrayByApplyingSelector_(self, selector: str) -> list[Any]:
+        groups, others = self.__targets()
+        values = {}
+        for group, predicate in groups:
+            group_values = XABackends.element_values(
+                XABackends.filtered_elements(self.xa_parent, predicate), selector
+            )
+            if len(group_values) != len(group):
+                # Elements were added or removed since the identifiers were retrieved
+                others.extend(group)
+                continue
+            values.update(zip(group, group_values))
+
+        for position in others:
+            values[position] = self.xa_parent.objectAtIndex_(position).valueForKey_(
+                selector
+            )
+        return [values[position] for position in self.xa_positions]
+
+    def filteredArrayUsingPredicate_(self, predicate: Any) -> "_XAElementSlice":
+        groups, others = self.__targets()
+        key = self.xa_identifiers.xa_key
+        identifiers = self.xa_identifiers.get() if groups else []
+        matches = set()
+        for group, group_predicate in groups:
+            matching = XABackends.filtered_elements(
+                self.xa_parent,
+                AppKit.NSCompoundPredicate.andPredicateWithSubpredicates_(
+                    [group_predicate, predicate]
+                ),
+            )
+            matching_identifiers = {
+                _xa_hashable(identifier)
+                for identifier in XABackends.element_values(matching, key)
+            }
+            matches.update(
+                position
+                for position in group
+                if _xa_hashable(identifiers[position]) in matching_identifiers
+            )
+
+        for position in others:
+            if predicate.evaluateWithObject_(self.xa_parent.objectAtIndex_(position)):
+                matches.add(position)
+        return self.__slice(
+            [position for position in self.xa_positions if position in matches]
+        )
+
+    def setValue_forKey_(self, value: Any, key: str):
+        groups, others = self.__targets()
+        for _, predicate in groups:
+            XABackends.set_element_values(
+                XABackends.filtered_elements(self.xa_parent, predicate), value, key
+            )
+        for position in others:
+            self.xa_parent.objectAtIndex_(position).setValue_forKey_(value, key)
+
+    def __len__(self):
+        return len(self.xa_positions)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.objectAtIndex_(index)
+
+    def __iter__(self):
+        return (self.objectAtIndex_(index) for index in range(len(self.xa_positions)))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.xa_positions} of {self.xa_parent}>"
+
+
+class _XALazyModule:
+    """A module that is imported on first attribute access, for frameworks that are slow to import and only used by some methods.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, name: str):
+        self.__name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(importlib.import_module(self.__name), attr)
+
+
+Quartz = _XALazyModule("Quartz")
+
+
+def _xa_graphics() -> Any:
+    """Gets the module defining :class:`XAColor` and :class:`XAImage`, importing it on first use since it imports macimg.
+
+    .. versionadded:: 0.3.1
+    """
+    return importlib.import_module("PyXA.XAGraphics")
+
+
+def __getattr__(name: str) -> Any:
+    # XAColor and XAImage subclass macimg's classes, so they are defined in XAGraphics
+    if name in ("XAColor", "XAImage"):
+        return getattr(_xa_graphics(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _macimg(submodule: str) -> Any:
+    """Gets a submodule of macimg, e.g. "filters", importing it on first use since the submodules are slow to import.
+
+    .. versionadded:: 0.3.1
+    """
+    return importlib.import_module("macimg." + submodule)
+
+
+def _xa_record_values(records: list[dict], key: str) -> list[Any]:
+    """Gets the values of a property from a list of property records, with missing values as None.
+
+    .. versionadded:: 0.3.1
+    """
+    values = (record.get(key) for record in records)
+    return [None if isinstance(value, AppKit.NSNull) else value for value in values]
+
+
+def _xa_hashable(value: Any) -> Any:
+    """Converts a property value into a hashable form for use as an index key.
+
+    .. versionadded:: 0.3.1
+    """
+    if isinstance(value, (list, tuple)) or (
+        hasattr(value, "objectEnumerator") and not hasattr(value, "keys")
+    ):
+        return tuple(_xa_hashable(x) for x in value)
+    if hasattr(value, "keys"):
+        return tuple(sorted((str(k), _xa_hashable(value[k])) for k in value.keys()))
+    return value
+
+
+def _xa_sort_key(value: Any) -> tuple[int, Any]:
+    """Converts a property value into a key that sorts missing values last and dates by their timestamp.
+
+    .. versionadded:: 0.3.1
+    """
+    if value is None:
+        return (1, 0)
+    if hasattr(value, "timeIntervalSince1970"):
+        return (0, value.timeIntervalSince1970())
+    if isinstance(value, datetime):
+        return (0, value.timestamp())
+    return (0, value)
+
+
+def _xa_to_ndarray(
+    values: list[Any], dtype: Any = None, name: str = "values"
+) -> "numpy.ndarray":
+    """Converts a list of bridged property values to a typed NumPy array.
+
+    :param values: The values to convert
+    :type values: list[Any]
+    :param dtype: The NumPy dtype to use, or None to infer it from the values, defaults to None
+    :type dtype: Any, optional
+    :param name: The name of the converted property, used in error messages, defaults to "values"
+    :type name: str, optional
+    :raises ValueError: The values include missing values, but the given dtype is an integer or boolean type
+    :return: The NumPy array of values
+    :rtype: numpy.ndarray
+
+    .. versionadded:: 0.3.1
+    """
+    import numpy
+
+    def _timestamp(value):
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return value.timeIntervalSince1970()
+
+    if dtype is None:
+        sample = next((value for value in values if value is not None), None)
+        has_missing = any(value is None for value in values)
+        if isinstance(sample, bool) and not has_missing:
+            dtype = numpy.bool_
+        elif isinstance(sample, int) and not isinstance(sample, bool):
+            dtype = numpy.float64 if has_missing else numpy.int64
+        elif isinstance(sample, float):
+            dtype = numpy.float64
+        elif isinstance(sample, datetime) or hasattr(sample, "timeIntervalSince1970"):
+            dtype = "datetime64[us]"
+        else:
+            dtype = object
+
+    dtype = numpy.dtype(dtype)
+    if dtype.kind == "M":
+        micros = numpy.fromiter(
+            (
+                numpy.nan if value is None else _timestamp(value) * 1e6
+                for value in values
+            ),
+            dtype=numpy.float64,
+            count=len(values),
+        )
+        missing = numpy.isnan(micros)
+        micros[missing] = 0
+        array = micros.astype(numpy.int64).astype("datetime64[us]").astype(dtype)
+        array[missing] = numpy.datetime64("NaT")
+        return array
+
+    if dtype.kind == "f":
+        return numpy.fromiter(
+            (numpy.nan if value is None else value for value in values),
+            dtype=dtype,
+            count=len(values),
+        )
+
+    if dtype.kind in ("i", "u", "b"):
+        if any(value is None for value in values):
+            raise ValueError(
+                f"Cannot convert {name} to {dtype} because some values are missing. Use a float or object dtype instead."
+            )
+        return numpy.fromiter(values, dtype=dtype, count=len(values))
+
+    if dtype.kind == "U":
+        return numpy.array(
+            ["" if value is None else str(value) for value in values], dtype=dtype
+        )
+
+    array = numpy.empty(len(values), dtype=dtype)
+    array[:] = values
+    return array
+
+
 VERSION = "0.3.0"  #: The installed version of PyXA
 supported_applications: list[str] = list(
     application_classes.keys()
@@ -81,9 +471,316 @@ supported_applications: list[str] = list(
 workspace = None
 
 
+_xa_class_attribute_cache: dict[type, tuple[tuple[int, ...], frozenset[str]]] = {}
+_xa_fallback_attribute_cache: dict[type, set[str]] = {}
+
+
+def _xa_class_attributes(cls: type) -> frozenset[str]:
+    """Gets the names of all attributes defined by a class and its bases, excluding :class:`object`.
+
+    The names are cached per class and recomputed when attributes are added to or removed from any class in its MRO.
+
+    .. versionadded:: 0.3.1
+    """
+    mro = cls.__mro__[:-1]
+    signature = tuple(len(base.__dict__) for base in mro)
+    cached = _xa_class_attribute_cache.get(cls)
+    if cached is None or cached[0] != signature:
+        cached = (signature, frozenset(name for base in mro for name in base.__dict__))
+        _xa_class_attribute_cache[cls] = cached
+    return cached[1]
+
+
+def _xa_fallback_attributes(cls: type) -> set[str]:
+    """Gets the set of attribute names known to be resolved by a class's scripting fallback rather than by the class itself.
+
+    Entries never need to be invalidated, since attributes later added to the class are found before ``__getattr__`` is called.
+
+    .. versionadded:: 0.3.1
+    """
+    names = _xa_fallback_attribute_cache.get(cls)
+    if names is None:
+        names = _xa_fallback_attribute_cache.setdefault(cls, set())
+    return names
+
+
+_xa_batches = threading.local()  # The batch being recorded on each thread, see XASBApplication.batch()
+
+
+def _xa_recording_batch(xa_object: "XAObject") -> Any:
+    """Gets the batch that changes to the given object should be recorded in instead of being sent immediately, if any.
+
+    .. versionadded:: 0.3.1
+    """
+    batch = getattr(_xa_batches, "current", None)
+    if batch is not None and batch.records(xa_object):
+        return batch
+    return None
+
+
+def _xa_batched(operation: Union[Literal["delete", "move"], None] = None) -> Callable:
+    """Decorates a method that changes scripting objects so that calling it while a batch is recorded for the object's application does not send the change ahead of the changes already recorded in the batch.
+
+    Deletions of objects and moves of objects to other PyXA objects are recorded in the batch, in which case the method returns None. Other operations, including all operations on lists, cannot be recorded automatically, so they raise a RuntimeError while the batch is recorded; such operations can be recorded using the methods of :class:`XABaseScriptable.XASBBatch` instead.
+
+    :param operation: The batch operation that calls to the method are recorded as, or None if calls cannot be recorded, defaults to None
+    :type operation: Union[Literal["delete", "move"], None], optional
+
+    .. seealso:: :func:`XABaseScriptable.XASBApplication.batch`
+
+    .. versionadded:: 0.3.1
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            batch = getattr(_xa_batches, "current", None)
+            target = getattr(self, "xa_prnt", None) if isinstance(self, XAList) else self
+            if (
+                batch is None
+                or not isinstance(target, XAObject)
+                or not batch.records(target)
+            ):
+                return method(self, *args, **kwargs)
+
+            if target is self and operation == "delete":
+                batch.delete(self)
+                return None
+
+            destination = args[0] if len(args) > 0 else next(iter(kwargs.values()), None)
+            if (
+                target is self
+                and operation == "move"
+                and isinstance(destination, XAObject)
+                and not isinstance(destination, XAList)
+            ):
+                batch.move(self, destination)
+                return None
+
+            raise RuntimeError(
+                f"{type(self).__name__}.{method.__name__}() cannot be called while a batch is recorded for its application, since it would run before the changes already in the batch. Use the methods of the batch object instead."
+            )
+
+        return wrapper
+
+    return decorator
+
+
 ###############
 ### General ###
 ###############
+class XAPropertyCache:
+    """A cache of property values of PyXA objects, with an optional time-to-live.
+
+    Values are stored per scripting element and property name, grouped by element so that invalidating the values of an element takes constant time. A single cache can be shared by many objects, including objects used from several threads, e.g. all objects derived from an application within :func:`XAApplication.cached`. Expired values are removed when they are looked up, and the values of the least recently used elements are removed once the cache holds more than :attr:`max_size` values.
+
+    .. seealso:: :func:`XAObject.enable_cache`
+
+    .. versionadded:: 0.3.1
+    """
+
+    max_size: int = 100000  #: The default maximum number of values to cache
+
+    def __init__(
+        self, ttl: Union[float, None] = None, max_size: Union[int, None] = None
+    ):
+        """Creates a new property cache.
+
+        :param ttl: The number of seconds that cached values remain valid, or None to keep values until they are invalidated, defaults to None
+        :type ttl: Union[float, None], optional
+        :param max_size: The maximum number of values to cache, or None to use :attr:`XAPropertyCache.max_size`, defaults to None
+        :type max_size: Union[int, None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.ttl = ttl  #: The number of seconds that cached values remain valid
+        if max_size is not None:
+            self.max_size = max_size
+        self.enabled = True  #: Whether the cache is currently used for property lookups
+        self.hits = 0  #: The number of lookups answered from the cache
+        self.misses = 0  #: The number of lookups that required a request to the target application
+        # Values and the times they were stored, keyed by element and then by property name, from the least to the most recently used element
+        self.__values: OrderedDict[Any, dict[str, tuple[Any, float]]] = OrderedDict()
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def get(self, element: Any, name: str, loader: Callable[[], Any]) -> Any:
+        """Gets the cached value of a property of a scripting element, calling the loader function to retrieve and store the value if it is not cached or has expired.
+
+        :param element: The scripting element whose property to get
+        :type element: Any
+        :param name: The name of the property
+        :type name: str
+        :param loader: A function that retrieves the current value of the property
+        :type loader: Callable[[], Any]
+        :return: The value of the property
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            entries = self.__values.get(element)
+            entry = entries.get(name) if entries is not None else None
+            if entry is not None:
+                if self.ttl is None or time.monotonic() - entry[1] < self.ttl:
+                    self.__values.move_to_end(element)
+                    self.hits += 1
+                    return entry[0]
+                self.__remove(element, name)
+            self.misses += 1
+
+        # Loaded outside of the lock, since loading sends a request to the target application
+        value = loader()
+        self.set(element, name, value)
+        return value
+
+    def set(self, element: Any, name: str, value: Any):
+        """Stores the value of a property of a scripting element.
+
+        :param element: The scripting element whose property value to store
+        :type element: Any
+        :param name: The name of the property
+        :type name: str
+        :param value: The value to store
+        :type value: Any
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            entries = self.__values.get(element)
+            if entries is None:
+                entries = self.__values[element] = {}
+            else:
+                self.__values.move_to_end(element)
+            if name not in entries:
+                self.__size += 1
+            entries[name] = (value, time.monotonic())
+
+            while self.__size > max(self.max_size, 0):
+                oldest = next(iter(self.__values))
+                if len(self.__values) > 1:
+                    self.__size -= len(self.__values.pop(oldest))
+                else:
+                    # Only the current element remains, so its oldest values are removed
+                    self.__remove(oldest, next(iter(self.__values[oldest])))
+
+    def __remove(self, element: Any, name: str):
+        entries = self.__values[element]
+        del entries[name]
+        self.__size -= 1
+        if len(entries) == 0:
+            del self.__values[element]
+
+    def invalidate(self, element: Any = None, name: Union[str, None] = None):
+        """Removes cached values. If no element is specified, values are removed for all elements.
+
+        Removing the values of a single element takes constant time, while removing the values of a property for all elements takes time proportional to the number of cached elements.
+
+        :param element: The scripting element whose cached values to remove, defaults to None
+        :type element: Any, optional
+        :param name: The name of the property whose cached values to remove, or None to remove all properties, defaults to None
+        :type name: Union[str, None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            if element is None and name is None:
+                self.__values.clear()
+                self.__size = 0
+                return
+
+            if element is not None:
+                entries = self.__values.get(element)
+                if entries is None:
+                    return
+                if name is None:
+                    self.__size -= len(self.__values.pop(element))
+                elif name in entries:
+                    self.__remove(element, name)
+                return
+
+            for element, entries in list(self.__values.items()):
+                if name in entries:
+                    self.__remove(element, name)
+
+    def stats(self) -> dict[str, Union[int, float, None]]:
+        """Gets the hit and miss counts of the cache.
+
+        :return: A dictionary containing the number of hits, misses, cached values, the hit rate, and the TTL of the cache
+        :rtype: dict[str, Union[int, float, None]]
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            hits, misses, size = self.hits, self.misses, self.__size
+
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": size,
+            "hit_rate": hits / lookups if lookups > 0 else 0.0,
+            "ttl": self.ttl,
+        }
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.stats()) + ">"
+
+
+_xa_cached_classes: dict[type, type] = {}
+
+
+def _xa_cached_class(cls: type) -> type:
+    """Gets a subclass of the given class whose property lookups go through the object's property cache, creating it once per class.
+
+    .. versionadded:: 0.3.1
+    """
+    cached_cls = _xa_cached_classes.get(cls)
+    if cached_cls is not None:
+        return cached_cls
+
+    property_names = frozenset(
+        name
+        for klass in cls.__mro__
+        for name, attribute in klass.__dict__.items()
+        if isinstance(attribute, property)
+        and not name.startswith("_")
+        and not name.startswith("xa_")
+    )
+
+    def __getattribute__(self, name):
+        if name in property_names:
+            cache = object.__getattribute__(self, "xa_cache")
+            if cache is not None and cache.enabled:
+                return cache.get(
+                    object.__getattribute__(self, "xa_elem"),
+                    name,
+                    lambda: super(cached_cls, self).__getattribute__(name),
+                )
+        return super(cached_cls, self).__getattribute__(name)
+
+    def __setattr__(self, name, value):
+        super(cached_cls, self).__setattr__(name, value)
+        if name in property_names and self.xa_cache is not None:
+            self.xa_cache.invalidate(self.xa_elem)
+
+    cached_cls = type(
+        cls.__name__,
+        (cls,),
+        {
+            "__getattribute__": __getattribute__,
+            "__setattr__": __setattr__,
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+        },
+    )
+    cached_cls._xa_uncached_class = cls
+    _xa_cached_classes[cls] = cached_cls
+    _xa_cached_classes[cached_cls] = cached_cls
+    return cached_cls
+
+
 class XAObject:
     """A general class for PyXA scripting objects.
 
@@ -96,6 +793,8 @@ class XAObject:
     _xa_estr = None
     _xa_wksp = None
 
+    xa_cache: Union[XAPropertyCache, None] = None  #: The cache used for property lookups on this object, if caching is enabled
+
     def __init__(self, properties: dict = None):
         """Instantiates a PyXA scripting object.
 
@@ -189,7 +888,11 @@ class XAObject:
             "element": obj,
             "appref": getattr(self, "xa_aref", None),
         }
-        return obj_class(properties, *args)
+        new_obj = obj_class(properties, *args)
+
+        if self.xa_cache is not None and isinstance(new_obj, XAObject):
+            new_obj.enable_cache(cache=self.xa_cache)
+        return new_obj
 
     def _spawn_thread(
         self,
@@ -219,6 +922,52 @@ class XAObject:
         new_thread.start()
         return new_thread
 
+    def enable_cache(
+        self, ttl: Union[float, None] = None, cache: Union[XAPropertyCache, None] = None
+    ) -> "XAObject":
+        """Enables caching of this object's property values, such that repeated accesses of the same property do not send a new request to the target application until the cached value expires.
+
+        Cached values are invalidated when properties are set via :func:`set_property`, :func:`set_properties`, or property setters on this object. Objects derived from this object, e.g. its elements, share its cache.
+
+        :param ttl: The number of seconds that cached values remain valid, or None to keep values until they are invalidated, defaults to None
+        :type ttl: Union[float, None], optional
+        :param cache: An existing cache to use instead of creating a new one, defaults to None
+        :type cache: Union[XAPropertyCache, None], optional
+        :return: A reference to this PyXA object.
+        :rtype: XAObject
+
+        :Example:
+
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> track = app.current_track.enable_cache(ttl=5)
+        >>> for _ in range(100):
+        ...     name = track.name
+        >>> print(track.xa_cache.stats())
+        {'hits': 99, 'misses': 1, 'size': 1, 'hit_rate': 0.99, 'ttl': 5}
+
+        .. seealso:: :func:`XAApplication.cached`
+
+        .. versionadded:: 0.3.1
+        """
+        self.xa_cache = cache if cache is not None else XAPropertyCache(ttl)
+        self.__class__ = _xa_cached_class(self.__class__)
+        return self
+
+    def disable_cache(self) -> "XAObject":
+        """Disables caching of this object's property values, restoring its original class.
+
+        :return: A reference to this PyXA object.
+        :rtype: XAObject
+
+        .. versionadded:: 0.3.1
+        """
+        self.xa_cache = None
+        self.__class__ = self.__class__.__dict__.get(
+            "_xa_uncached_class", self.__class__
+        )
+        return self
+
     def set_properties(self, properties: dict) -> "XAObject":
         """Updates the value of multiple properties of the scripting element associated with this object.
 
@@ -233,6 +982,11 @@ class XAObject:
 
         .. versionadded:: 0.0.1
         """
+        batch = _xa_recording_batch(self)
+        if batch is not None:
+            batch.set_properties(self, properties)
+            return self
+
         property_dict = {}
         for key in properties:
             parts = key.split("_")
@@ -240,6 +994,9 @@ class XAObject:
             property_name = parts[0] + "".join(titled_parts)
             property_dict[property_name] = properties[key]
         self.xa_elem.setValuesForKeysWithDictionary_(property_dict)
+
+        if self.xa_cache is not None:
+            self.xa_cache.invalidate(self.xa_elem)
         return self
 
     def set_property(self, property_name: str, value: Any) -> "XAObject":
@@ -254,11 +1011,19 @@ class XAObject:
 
         .. versionadded:: 0.0.1
         """
+        batch = _xa_recording_batch(self)
+        if batch is not None:
+            batch.set_property(self, property_name, value)
+            return self
+
         if "_" in property_name:
             parts = property_name.split("_")
             titled_parts = [part.title() for part in parts[1:]]
             property_name = parts[0] + "".join(titled_parts)
         self.xa_elem.setValue_forKey_(value, property_name)
+
+        if self.xa_cache is not None:
+            self.xa_cache.invalidate(self.xa_elem)
         return self
 
     def exists(self) -> bool:
@@ -289,9 +1054,15 @@ class XAObject:
 class XAList(XAObject):
     """A wrapper around NSArray and NSMutableArray objects enabling fast enumeration and lazy evaluation of Objective-C objects.
 
+    .. note::
+
+       Bulk operations, such as :func:`fetch` and :func:`set_property_all`, send a single request for lists of scripting elements obtained from an application or filtered with methods such as :func:`filter`. Slices and reorderings of such a list, e.g. by :func:`sort_by`, remain lists of scripting elements, but their bulk operations target the elements by ID with one request per 200 elements, so filter lists before slicing them where possible.
+
     .. versionadded:: 0.0.3
     """
 
+    _xa_selector_cache: dict[tuple[type, str], str] = {}
+
     def __init__(
         self,
         properties: dict,
@@ -314,9 +1085,10 @@ class XAList(XAObject):
         """
         super().__init__(properties)
         self.xa_ocls = object_class
+        self._xa_indexes: dict[tuple[str, ...], dict[Any, int]] = {}
 
-        if not isinstance(self.xa_elem, AppKit.NSArray) and not isinstance(
-            self.xa_elem, ScriptingBridge.SBElementArray
+        if not isinstance(self.xa_elem, AppKit.NSArray) and not _xa_is_element_array(
+            self.xa_elem
         ):
             self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(self.xa_elem)
 
@@ -341,8 +1113,23 @@ class XAList(XAObject):
         >>> print(photo)
         <<class 'PyXA.apps.PhotosApp.XAPhotosMediaItem'>id=CB24FE9F-E9DC-4A5C-A0B0-CC779B1CEDCE/L0/001>
 
+        .. versionchanged:: 0.3.1
+
+           Uses an index built with :func:`build_index`, if one exists for the property.
+
         .. versionadded:: 0.0.6
         """
+        index = self._xa_indexes.get(self._xa_index_key(property))
+        if index is not None:
+            position = index.get(_xa_hashable(value))
+            if position is not None:
+                return self._new_element(
+                    self.xa_elem.objectAtIndex_(position), self.xa_ocls
+                )
+
+            if isinstance(value, (str, int, float, bool)):
+                return None
+
         predicate = XAPredicate()
         predicate.add_eq_condition(property, value)
         ls = predicate.evaluate(self.xa_elem)
@@ -358,5340 +1145,6726 @@ class XAList(XAObject):
 
         return self._new_element(obj, self.xa_ocls)
 
-    def _format_for_filter(self, filter, value1, value2=None):
-        if "_" in filter and " " not in filter:
-            parts = filter.split("_")
-            filter = parts[0]
-            if len(parts) > 1:
-                for part in parts[1:]:
-                    filter += part.title()
-
-        return (filter, value1, value2)
+    def _xa_index_key(self, *keys: str) -> tuple[str, ...]:
+        return tuple(self._xa_selector(key).lower() for key in keys)
 
-    def map(self, function: Callable[[object], object]) -> "XAList":
-        """Applies the given function to each element in the list and returns a new :class:`XAList` containing the results.
+    def build_index(self, *keys: str) -> "XAList":
+        """Builds a hash index mapping values of the given properties to the positions of the elements that have them.
 
-        This is most effective when the function does not access the element's properties, as this will cause the element to be fully dereferenced. In such cases, it is better (faster) to use subclass-specific fast-enumeration methods. Use this method to associate element references with other data, e.g. by wrapping each element in a dictionary.
+        The values of the properties are bulk-fetched once using :func:`fetch`. Afterwards, :func:`by_property` (and therefore all `by_<property>` methods) for a single indexed property, and :func:`lookup` for an indexed combination of properties, find elements in constant time instead of filtering the whole list. Indexes are discarded when the list is modified, or by calling :func:`drop_indexes`.
 
-        :param function: The function to apply to each element
-        :type function: Callable[[object], object]
-        :return: The new list containing the results of the function
+        :param keys: The names of one or more properties to index
+        :type keys: str
+        :return: A reference to this list
         :rtype: XAList
 
-        :Example:
+        :Example 1: Index tracks by ID
 
         >>> import PyXA
-        >>> app = PyXA.Application("Notes")
-        >>> notes = app.notes()
-        >>> indexed_notes = notes.map(lambda element, index: {"element": element, "id": index})
-        >>> print(indexed_notes[0])
-        {'element': <<class 'PyXA.apps.Notes.XANote'>Example Note, x-coredata://314D805E-C349-42A0-96EC-380EE21392E2/ICNote/p9527>, 'id': 0}
+        >>> app = PyXA.Music()
+        >>> tracks = app.tracks().build_index("id")
+        >>> for track_id in [3185, 3186, 3187]:
+        ...     print(tracks.by_id(track_id))
+        <<class 'PyXA.apps.Music.XAMusicTrack'>Chandelier>
+        <<class 'PyXA.apps.Music.XAMusicTrack'>Shake It Off>
+        <<class 'PyXA.apps.Music.XAMusicTrack'>Die Another Day>
 
-        .. versionadded:: 0.3.0
-        """
-        new_arr = AppKit.NSMutableArray.alloc().initWithArray_(self.xa_elem)
+        :Example 2: Index tracks by name and artist
 
-        def apply_to_index(index):
-            new_arr.replaceObjectAtIndex_withObject_(
-                index, function(self._new_element(new_arr[index], self.xa_ocls), index)
-            )
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> tracks = app.tracks().build_index("name", "artist")
+        >>> print(tracks.lookup(name="Chandelier", artist="Sia"))
+        <<class 'PyXA.apps.Music.XAMusicTrack'>Chandelier>
 
-        queue = libdispatch.dispatch_get_global_queue(
-            libdispatch.DISPATCH_QUEUE_PRIORITY_HIGH, 0
-        )
-        libdispatch.dispatch_apply(
-            self.xa_elem.count(), queue, lambda i: apply_to_index(i)
-        )
+        .. versionadded:: 0.3.1
+        """
+        if len(keys) == 0:
+            raise ValueError("At least one property must be specified.")
 
-        return self._new_element(new_arr, XAList)
+        columns = self.fetch(list(keys))
+        if len(keys) == 1:
+            values = columns[keys[0]]
+        else:
+            values = zip(*[columns[key] for key in keys])
 
-    def equalling(self, property: str, value: str) -> "XAList":
-        """Retrieves all elements whose property value equals the given value.
+        index = {}
+        for position, value in enumerate(values):
+            index.setdefault(_xa_hashable(value), position)
 
-        :param property: The property to match
-        :type property: str
-        :param value: The value to search for
-        :type value: str
-        :return: The list of matching elements
+        self._xa_indexes[self._xa_index_key(*keys)] = index
+        return self
+
+    def drop_indexes(self) -> "XAList":
+        """Discards all indexes built with :func:`build_index`.
+
+        :return: A reference to this list
         :rtype: XAList
 
-        :Example:
+        .. versionadded:: 0.3.1
+        """
+        self._xa_indexes.clear()
+        return self
 
-        >>> import PyXA
-        >>> app = PyXA.Application("TV")
-        >>> print(app.tracks().equalling("playedCount", 0))
-        <<class 'PyXA.apps.TV.XATVTrackList'>['Frozen', 'Sunshine', 'The Hunger Games: Mockingjay - Part 2', ...]>
+    def lookup(self, **values: Any) -> Union[XAObject, None]:
+        """Retrieves the first element whose property values match all of the given values, if one exists.
 
-        .. versionadded:: 0.1.0
+        If an index has been built for exactly the given properties using :func:`build_index`, the element is found in constant time. Otherwise, the list is filtered using a predicate.
+
+        :param values: Property names and the values to match
+        :type values: Any
+        :return: The matching element, if one is found
+        :rtype: Union[XAObject, None]
+
+        .. versionadded:: 0.3.1
         """
-        property, value, _ = self._format_for_filter(property, value)
+        keys = list(values.keys())
+        index = self._xa_indexes.get(self._xa_index_key(*keys))
+        if index is not None:
+            if len(keys) == 1:
+                value = _xa_hashable(values[keys[0]])
+            else:
+                value = _xa_hashable([values[key] for key in keys])
+
+            position = index.get(value)
+            if position is not None:
+                return self._new_element(
+                    self.xa_elem.objectAtIndex_(position), self.xa_ocls
+                )
+
+            if all(isinstance(x, (str, int, float, bool)) for x in values.values()):
+                return None
+
         predicate = XAPredicate()
-        predicate.add_eq_condition(property, value)
+        for key in keys:
+            predicate.add_eq_condition(self._xa_selector(key), values[key])
         ls = predicate.evaluate(self.xa_elem)
-        return self._new_element(ls, self.__class__)
 
-    def not_equalling(self, property: str, value: str) -> "XAList":
-        """Retrieves all elements whose property value does not equal the given value.
+        if len(ls) == 0:
+            return None
+        return self._new_element(ls.firstObject(), self.xa_ocls)
 
-        :param property: The property to match
-        :type property: str
-        :param value: The value to search for
-        :type value: str
-        :return: The list of matching elements
+    def _xa_is_scriptable(self) -> bool:
+        # Sorting scripting bridge objects by key-value coding would send one request per element
+        if _xa_is_element_array(self.xa_elem):
+            return True
+        return self.xa_elem.count() > 0 and isinstance(
+            self.xa_elem.objectAtIndex_(0), ScriptingBridge.SBObject
+        )
+
+    def _xa_reordered(self, positions: list[int]) -> "XAList":
+        if isinstance(self.xa_elem, ScriptingBridge.SBElementArray):
+            # Keeps the bulk operations of the element array available on the result
+            return self._new_element(
+                _XAElementSlice(self.xa_elem, positions), self.__class__
+            )
+
+        if isinstance(self.xa_elem, XABackends.XABackendArray):
+            # Backend arrays accept positions in any order
+            return self._new_element(
+                self.xa_elem.objectsAtIndexes_(positions), self.__class__
+            )
+
+        arr = AppKit.NSMutableArray.alloc().initWithCapacity_(len(positions))
+        for position in positions:
+            arr.addObject_(self.xa_elem.objectAtIndex_(position))
+        return self._new_element(arr, self.__class__)
+
+    def _xa_sorted_with_descriptors(
+        self, keys: tuple[str, ...], descending: bool
+    ) -> Any:
+        # Sorts arrays that can sort themselves without sending a request per element, i.e. in-process backend arrays and arrays of non-scripting objects
+        if not isinstance(
+            self.xa_elem, XABackends.XAElementArray
+        ) and self._xa_is_scriptable():
+            return None
+
+        descriptors = [
+            AppKit.NSSortDescriptor.sortDescriptorWithKey_ascending_(
+                self._xa_selector(key), not descending
+            )
+            for key in keys
+        ]
+        try:
+            return self.xa_elem.sortedArrayUsingDescriptors_(descriptors)
+        except Exception:
+            # Elements are not key-value coding compliant for the keys
+            return None
+
+    def _xa_sorted_positions(
+        self, keys: tuple[str, ...], descending: bool
+    ) -> list[int]:
+        columns = self.fetch(list(keys))
+        sort_keys = [[_xa_sort_key(x) for x in columns[key]] for key in keys]
+        if descending:
+            # Keep missing values last when the order is reversed
+            sort_keys = [[(1 - x[0], x[1]) for x in column] for column in sort_keys]
+        sort_keys = list(zip(*sort_keys))
+        return sorted(
+            range(len(sort_keys)), key=sort_keys.__getitem__, reverse=descending
+        )
+
+    def sort_by(self, *keys: str, descending: bool = False) -> "XAList":
+        """Sorts the list by the values of one or more properties, without dereferencing the list's elements.
+
+        Lists of scriptable elements are sorted by fetching the sort keys of all elements in one pass using :func:`fetch`, then reordering the element references. Lists that can be sorted without a request per element, i.e. lists of non-scripting objects and in-process backend arrays, are sorted using sort descriptors, falling back to the same approach if the elements do not support them. Missing values are sorted after all other values.
+
+        :param keys: The names of the properties to sort by, in order of precedence
+        :type keys: str
+        :param descending: Whether to sort in descending order, defaults to False
+        :type descending: bool, optional
+        :return: A new list of the same type containing the sorted elements
         :rtype: XAList
 
         :Example:
 
         >>> import PyXA
-        >>> app = PyXA.Application("TV")
-        >>> print(app.tracks().not_equalling("playedCount", 0))
-        <<class 'PyXA.apps.TV.XATVTrackList'>['The Avatar State', 'The Cave of Two Lovers', 'Return to Omashu', ...]>
+        >>> app = PyXA.Music()
+        >>> print(app.tracks().sort_by("artist", "name")[:3])
+        <<class 'PyXA.apps.Music.XAMusicTrackList'>['Chandelier', 'Alive', 'Shake It Off']>
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.3.1
         """
-        property, value, _ = self._format_for_filter(property, value)
-        predicate = XAPredicate()
-        predicate.add_neq_condition(property, value)
-        ls = predicate.evaluate(self.xa_elem)
-        return self._new_element(ls, self.__class__)
+        if len(keys) == 0:
+            raise ValueError("At least one property must be specified.")
 
-    def containing(self, property: str, value: str) -> "XAList":
-        """Retrieves all elements whose property value contains the given value.
+        arr = self._xa_sorted_with_descriptors(keys, descending)
+        if arr is not None:
+            return self._new_element(arr, self.__class__)
+        return self._xa_reordered(self._xa_sorted_positions(keys, descending))
 
-        :param property: The property to match
-        :type property: str
-        :param value: The value to search for
-        :type value: str
-        :return: The list of matching elements
+    def top_k(self, key: str, k: int, descending: bool = True) -> "XAList":
+        """Retrieves the k elements with the largest (or smallest) values of the given property.
+
+        Lists that can be sorted without a request per element, such as lists of non-scripting objects, are sorted using sort descriptors. Otherwise, only the values of the given property are fetched, in one request, and the top k element references are selected from them.
+
+        :param key: The name of the property to rank elements by
+        :type key: str
+        :param k: The number of elements to retrieve
+        :type k: int
+        :param descending: Whether to retrieve the elements with the largest values, rather than the smallest, defaults to True
+        :type descending: bool, optional
+        :return: A new list of the same type containing at most k elements, ordered by the property value
         :rtype: XAList
 
-        :Example:
+        :Example: Get the 50 most recently received messages
 
         >>> import PyXA
-        >>> app = PyXA.Application("Reminders")
-        >>> print(app.reminders().containing("name", "PyXA"))
-        <<class 'PyXA.apps.Reminders.XARemindersReminderList'>['PyXA v0.1.0 release']>
+        >>> app = PyXA.Mail()
+        >>> inbox = app.accounts()[0].mailboxes().by_name("INBOX")
+        >>> latest = inbox.messages().top_k("date_received", 50)
 
-        .. versionadded:: 0.0.6
+        .. versionadded:: 0.3.1
         """
-        property, value, _ = self._format_for_filter(property, value)
-        predicate = XAPredicate()
-        predicate.add_contains_condition(property, value)
-        ls = predicate.evaluate(self.xa_elem)
-        return self._new_element(ls, self.__class__)
+        arr = self._xa_sorted_with_descriptors((key,), descending)
+        if arr is not None:
+            return self._new_element(
+                arr.subarrayWithRange_((0, min(k, arr.count()))), self.__class__
+            )
 
-    def not_containing(self, property: str, value: str) -> "XAList":
-        """Retrieves all elements whose property value does not contain the given value.
+        values = [_xa_sort_key(x) for x in self.fetch([key])[key]]
+        present = [index for index, value in enumerate(values) if value[0] == 0]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        positions = select(k, present, key=values.__getitem__)
 
-        :param property: The property to match
-        :type property: str
-        :param value: The value to search for
-        :type value: str
-        :return: The list of matching elements
+        if len(positions) < k:
+            # Fill with elements lacking a value
+            missing = [index for index, value in enumerate(values) if value[0] == 1]
+            positions.extend(missing[: k - len(positions)])
+        return self._xa_reordered(positions)
+
+    def distinct(self, key: str) -> "XAList":
+        """Retrieves the first element for each distinct value of the given property, in list order.
+
+        :param key: The name of the property whose values to deduplicate by
+        :type key: str
+        :return: A new list of the same type containing one element per distinct value
         :rtype: XAList
 
         :Example:
 
         >>> import PyXA
-        >>> app = PyXA.Application("Reminders")
-        >>> print(app.reminders().not_containing("name", " "))
-        <<class 'PyXA.apps.Reminders.XARemindersReminderList'>['Trash', 'Thing', 'Reminder', ...]>
+        >>> app = PyXA.Music()
+        >>> one_per_album = app.tracks().distinct("album")
+        >>> print(len(one_per_album))
+        42
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.3.1
         """
-        property, value, _ = self._format_for_filter(property, value)
-        ls = XAPredicate.evaluate_with_format(
-            self.xa_elem, f'NOT {property} CONTAINS "{value}"'
-        )
-        return self._new_element(ls, self.__class__)
+        positions = {}
+        for position, value in enumerate(self.fetch([key])[key]):
+            positions.setdefault(_xa_hashable(value), position)
+        return self._xa_reordered(list(positions.values()))
 
-    def beginning_with(self, property: str, value: str) -> "XAList":
-        """Retrieves all elements whose property value begins with the given value.
+    def group_by(self, *keys: str) -> "XAListGroupBy":
+        """Groups the elements of the list by the values of one or more properties, for aggregation using :func:`XAListGroupBy.agg`.
 
-        :param property: The property to match
-        :type property: str
-        :param value: The value to search for
-        :type value: str
-        :return: The list of matching elements
-        :rtype: XAList
+        :param keys: The names of the properties to group by
+        :type keys: str
+        :return: The grouping of the list
+        :rtype: XAListGroupBy
 
         :Example:
 
         >>> import PyXA
-        >>> app = PyXA.Application("System Events")
-        >>> print(app.downloads_folder.files().beginning_with("name", "Example"))
-        <<class 'PyXA.apps.SystemEvents.XASystemEventsFileList'>['Example.png', 'ExampleImage.png', ...]>
+        >>> app = PyXA.Music()
+        >>> totals = app.tracks().group_by("artist").agg(duration="sum", name="count")
+        >>> print(totals["artist"][:2], totals["duration"][:2], totals["name"][:2])
+        ['Sia' 'Taylor Swift'] [1264.5 3312.0] [5 14]
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.3.1
         """
-        property, value, _ = self._format_for_filter(property, value)
-        predicate = XAPredicate()
-        predicate.add_begins_with_condition(property, value)
-        ls = predicate.evaluate(self.xa_elem)
-        return self._new_element(ls, self.__class__)
+        return XAListGroupBy(self, keys)
 
-    def ending_with(self, property: str, value: str) -> "XAList":
-        """Retrieves all elements whose property value ends with the given value.
+    def set_property_all(self, property_name: str, value: Any) -> XAUpdateReport:
+        """Assigns the same value to a property of every element in the list.
 
-        :param property: The property to match
-        :type property: str
-        :param value: The value to search for
-        :type value: str
-        :return: The list of matching elements
-        :rtype: XAList
+        For lists of scripting elements, this sends a single request that updates all elements at once, rather than one request per element.
 
-        :Example:
+        :param property_name: The name of the property to assign a new value to
+        :type property_name: str
+        :param value: The value to assign to the property
+        :type value: Any
+        :return: The number of elements updated and the number of requests sent
+        :rtype: XAUpdateReport
+
+        :Example: Mark all incomplete reminders as completed
 
         >>> import PyXA
-        >>> app = PyXA.Application("System Events")
-        >>> print(app.downloads_folder.files().ending_with("name", ".png"))
-        <<class 'PyXA.apps.SystemEvents.XASystemEventsFileList'>['Example.png', 'Image.png', ...]>
+        >>> app = PyXA.Reminders()
+        >>> print(app.reminders().equalling("completed", False).set_property_all("completed", True))
+        XAUpdateReport(updated=3000, events=1)
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.3.1
         """
-        property, value, _ = self._format_for_filter(property, value)
-        predicate = XAPredicate()
-        predicate.add_ends_with_condition(property, value)
-        ls = predicate.evaluate(self.xa_elem)
-        return self._new_element(ls, self.__class__)
+        count = XABackends.element_count(self.xa_elem)
+        if count == 0:
+            return XAUpdateReport(0, 0)
 
-    def greater_than(self, property: str, value: Union[int, float]) -> "XAList":
-        """Retrieves all elements whose property value is greater than the given value.
+        XABackends.set_element_values(
+            self.xa_elem, value, self._xa_selector(property_name)
+        )
+        self._xa_values_changed([property_name])
 
-        :param property: The property to match
-        :type property: str
-        :param value: The value to compare against
-        :type value: Union[int, float]
-        :return: The list of matching elements
-        :rtype: XAList
+        events = 1 if _xa_is_element_array(self.xa_elem) else count
+        return XAUpdateReport(count, events)
 
-        :Example:
+    def set_properties_each(
+        self, properties: list[dict[str, Any]], key: str = "id"
+    ) -> XAUpdateReport:
+        """Assigns new property values to each element in the list, where each element can receive different values.
+
+        Elements receiving the same value for a property are updated together. For lists of scripting elements, each group is updated by a single request that targets the group's elements by the given identifier property, i.e. a `set ... of every ... whose ...` request. For slices of such lists, the requests target the elements within the sliced list, so identifiers must be unique within it. Elements whose identifier is missing or shared with another element, as well as the elements of other lists, are updated one element at a time.
+
+        :param properties: A list of dictionaries of property names and values, one for each element in the list
+        :type properties: list[dict[str, Any]]
+        :param key: The name of the property that uniquely identifies each element, defaults to "id"
+        :type key: str, optional
+        :raises ValueError: The number of dictionaries does not match the length of the list
+        :return: The number of elements updated and the number of requests sent
+        :rtype: XAUpdateReport
+
+        :Example: Number the first three tracks of a playlist
 
         >>> import PyXA
-        >>> app = PyXA.Application("Photos")
-        >>> print(app.media_items().greater_than("altitude", 10000)[0].spotlight())
-        <<class 'PyXA.apps.PhotosApp.XAPhotosMediaItem'>id=53B0F28E-0B39-446B-896C-484CD0DC2D3C/L0/001>
+        >>> app = PyXA.Music()
+        >>> tracks = app.playlists()[0].tracks()[:3]
+        >>> print(tracks.set_properties_each([{"track_number": 1}, {"track_number": 2}, {"track_number": 3}], "persistent_id"))
+        XAUpdateReport(updated=3, events=4)
 
-        .. versionadded:: 0.1.0
+        The first request retrieves the persistent IDs of the playlist's tracks, and each of the other three sets the track number of one track.
+
+        .. versionadded:: 0.3.1
         """
-        property, value, _ = self._format_for_filter(property, value)
-        predicate = XAPredicate()
-        predicate.add_gt_condition(property, value)
-        ls = predicate.evaluate(self.xa_elem)
-        return self._new_element(ls, self.__class__)
+        count = XABackends.element_count(self.xa_elem)
+        if len(properties) != count:
+            raise ValueError(
+                f"Expected {count} dictionaries of properties, got {len(properties)}."
+            )
 
-    def less_than(self, property: str, value: Union[int, float]) -> "XAList":
-        """Retrieves all elements whose property value is less than the given value.
+        # Group the positions of elements receiving the same value for each property
+        groups: dict[tuple[str, Any], tuple[Any, list[int]]] = {}
+        for position, element_properties in enumerate(properties):
+            for property_name, value in element_properties.items():
+                group = groups.setdefault(
+                    (property_name, _xa_hashable(value)), (value, [])
+                )
+                group[1].append(position)
+
+        updated = sum(1 for element_properties in properties if element_properties)
+        if updated == 0:
+            return XAUpdateReport(0, 0)
+
+        events = 0
+        if not _xa_is_element_array(self.xa_elem):
+            for (property_name, _), (value, positions) in groups.items():
+                selector = self._xa_selector(property_name)
+                for position in positions:
+                    XABackends.element_at(self.xa_elem, position).setValue_forKey_(
+                        value, selector
+                    )
+                    events += 1
+        else:
+            array = self.xa_elem
+            if isinstance(array, _XAElementSlice):
+                # Sends the whose clauses to the parent array directly, so identifiers must be unique within the parent
+                array = self.xa_elem.xa_parent
+                groups = {
+                    group: (
+                        value,
+                        [self.xa_elem.xa_positions[position] for position in positions],
+                    )
+                    for group, (value, positions) in groups.items()
+                }
 
-        :param property: The property to match
-        :type property: str
-        :param value: The value to compare against
-        :type value: Union[int, float]
-        :return: The list of matching elements
-        :rtype: XAList
+            ids = None
+            key_selector = self._xa_selector(key)
+            for (property_name, _), (value, positions) in groups.items():
+                selector = self._xa_selector(property_name)
+                if array is self.xa_elem and len(positions) == count:
+                    XABackends.set_element_values(array, value, selector)
+                    events += 1
+                    continue
 
-        :Example:
+                if ids is None:
+                    ids = [
+                        None if isinstance(identifier, AppKit.NSNull) else identifier
+                        for identifier in XABackends.element_values(
+                            array, key_selector
+                        )
+                    ]
+                    events += 1
+
+                    # A whose clause matching a missing or shared identifier would also change elements other than the intended ones
+                    occurrences: dict[Any, int] = {}
+                    for identifier in ids:
+                        identifier = _xa_hashable(identifier)
+                        occurrences[identifier] = occurrences.get(identifier, 0) + 1
+                    unidentifiable = {
+                        position
+                        for position, identifier in enumerate(ids)
+                        if identifier is None
+                        or occurrences[_xa_hashable(identifier)] > 1
+                    }
+
+                for position in positions:
+                    if position in unidentifiable:
+                        XABackends.element_at(array, position).setValue_forKey_(
+                            value, selector
+                        )
+                        events += 1
+                positions = [
+                    position for position in positions if position not in unidentifiable
+                ]
 
-        >>> app = PyXA.Application("Music")
-        >>> tracks = app.tracks()
-        >>> print(tracks.less_than("playedCount", 5).name())
-        ['Outrunning Karma', 'Death of a Hero', '1994', 'Mind Is a Prison']
+                # Limit the size of each whose clause
+                for start in range(0, len(positions), _XA_WHOSE_LIMIT):
+                    chunk = [
+                        ids[position]
+                        for position in positions[start : start + _XA_WHOSE_LIMIT]
+                    ]
+                    predicate = _xa_identifier_predicate(key_selector, chunk)
+                    XABackends.set_element_values(
+                        XABackends.filtered_elements(array, predicate),
+                        value,
+                        selector,
+                    )
+                    events += 1
 
-        .. versionadded:: 0.1.0
-        """
-        property, value, _ = self._format_for_filter(property, value)
-        predicate = XAPredicate()
-        predicate.add_lt_condition(property, value)
-        ls = predicate.evaluate(self.xa_elem)
-        return self._new_element(ls, self.__class__)
+        self._xa_values_changed({property_name for property_name, _ in groups})
+        return XAUpdateReport(updated, events)
 
-    def between(
-        self, property: str, value1: Union[int, float], value2: Union[int, float]
-    ) -> "XAList":
-        """Retrieves all elements whose property value is between the given values.
+    def _xa_values_changed(self, property_names: list[str]):
+        # Cached values and indexes of the updated properties are now stale
+        if self.xa_cache is not None:
+            for property_name in property_names:
+                self.xa_cache.invalidate(name=snakify(property_name))
+        self.drop_indexes()
 
-        :param property: The property to match
-        :type property: str
-        :param value1: The lower-end of the range to match
-        :type value1: Union[int, float]
-        :param value2: The upper-end of the range to match
-        :type value2: Union[int, float]
-        :return: The list of matching elements
-        :rtype: XAList
+    def snapshot(
+        self, key: str = "id", fields: Union[list[str], None] = None
+    ) -> "XAListSnapshot":
+        """Captures the values of the given properties of every element in the list, for change detection using :func:`XAListSnapshot.diff`.
 
-        :Example:
+        All values are retrieved in a single call to :func:`fetch`.
 
-        >>> import PyXA
-        >>> from datetime import datetime, timedelta
-        >>>
-        >>> app = PyXA.Application("Calendar")
-        >>> events = app.calendars()[3].events()
-        >>> now = datetime.now()
-        >>> print(events.between("startDate", now, now + timedelta(days=1)))
-        <<class 'PyXA.apps.Calendar.XACalendarEventList'>['Capstone Meeting', 'Lunch with Dan']>
+        :param key: The name of the property that uniquely identifies each element, defaults to "id"
+        :type key: str, optional
+        :param fields: The names of the properties to capture, defaults to None
+        :type fields: Union[list[str], None], optional
+        :raises ValueError: Two or more elements share the same key
+        :return: The snapshot of the list
+        :rtype: XAListSnapshot
 
-        .. versionadded:: 0.1.0
+        :Example: Poll for changes to reminders
+
+        >>> import PyXA, time
+        >>> app = PyXA.Reminders()
+        >>> previous = app.reminders().snapshot("id", ["name", "completed"])
+        >>> while True:
+        ...     time.sleep(60)
+        ...     current = app.reminders().snapshot("id", ["name", "completed"])
+        ...     changes = current.diff(previous)
+        ...     print(len(changes.added), len(changes.removed), len(changes.changed))
+        ...     previous = current
+
+        .. versionadded:: 0.3.1
         """
-        property, value1, value2 = self._format_for_filter(property, value1, value2)
-        predicate = XAPredicate()
-        predicate.add_gt_condition(property, value1)
-        predicate.add_lt_condition(property, value2)
-        ls = predicate.evaluate(self.xa_elem)
-        return self._new_element(ls, self.__class__)
+        return XAListSnapshot(self, key, fields or [])
 
-    def exists(self, property: str) -> "XAList":
-        """Retrieves all elements whose specified property value exists.
+    def query(self) -> "XAListQuery":
+        """Begins a lazy query on the list.
 
-        :param property: The property to check the existence of
-        :type property: str
-        :return: The list of matching elements
-        :rtype: XAList
+        Filters chained onto the query are combined into a single compound predicate that is evaluated once, when the query's results are first needed. For lists of scriptable elements, the predicate is evaluated by the target application.
 
-        .. versionadded:: 0.2.2
-        """
-        ls = [x for x in self.xa_elem if getattr(x, property)().exists()]
-        return self._new_element(ls, self.__class__)
+        :return: A new query on this list
+        :rtype: XAListQuery
 
-    def not_exists(self, property: str) -> "XAList":
-        """Retrieves all elements whose specified property value does not exist.
+        :Example:
 
-        :param property: The property to check the non-existence of
-        :type property: str
-        :return: The list of matching elements
-        :rtype: XAList
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> query = app.tracks().query().equalling("artist", "Sia").greater_than("played_count", 10).containing("name", "a")
+        >>> print(query.explain())
+        artist == "Sia" AND playedCount > 10 AND name CONTAINS "a"
+        >>> print(query.evaluate())
+        <<class 'PyXA.apps.Music.XAMusicTrackList'>['Chandelier', 'Alive']>
 
-        .. versionadded:: 0.2.2
+        .. versionadded:: 0.3.1
         """
-        ls = [x for x in self.xa_elem if not getattr(x, property)().exists()]
-        return self._new_element(ls, self.__class__)
+        return XAListQuery(self)
 
-    def filter(
-        self,
-        filter: str,
-        comparison_operation: Union[str, None] = None,
-        value1: Union[Any, None] = None,
-        value2: Union[Any, None] = None,
-    ) -> "XAList":
-        """Filters the list by the given parameters.
+    def _format_for_filter(self, filter, value1, value2=None):
+        if "_" in filter and " " not in filter:
+            parts = filter.split("_")
+            filter = parts[0]
+            if len(parts) > 1:
+                for part in parts[1:]:
+                    filter += part.title()
 
-        The filter may be either a format string, used to create an NSPredicate, or up to 4 arguments specifying the filtered property name, the comparison operation, and up to two values to compare against.
+        return (filter, value1, value2)
 
-        :param filter: A format string or a property name
-        :type filter: str
-        :param comparison_operation: The symbol or name of a comparison operation, such as > or <, defaults to None
-        :type comparison_operation: Union[str, None], optional
-        :param value1: The first value to compare each list item's property value against, defaults to None
-        :type value1: Union[Any, None], optional
-        :param value2: The second value to compare each list item's property value against, defaults to None
-        :type value2: Union[Any, None], optional
-        :return: The filtered XAList object
-        :rtype: XAList
+    def map(self, function: Callable[[object], object]) -> "XAList":
+        """Applies the given function to each element in the list and returns a new :class:`XAList` containing the results.
 
-        :Example 1: Get the last file sent by you (via this machine) in Messages.app
+        This is most effective when the function does not access the element's properties, as this will cause the element to be fully dereferenced. In such cases, it is better (faster) to use subclass-specific fast-enumeration methods. Use this method to associate element references with other data, e.g. by wrapping each element in a dictionary.
 
-        >>> import PyXA
-        >>> app = PyXA.Application("Messages")
-        >>> last_file_transfer = app.file_transfers().filter("direction", "==", app.MessageDirection.OUTGOING)[-1]
-        >>> print(last_file_transfer)
-        <<class 'PyXA.apps.Messages.XAMessagesFileTransfer'>Test.jpg>
+        :param function: The function to apply to each element
+        :type function: Callable[[object], object]
+        :return: The new list containing the results of the function
+        :rtype: XAList
 
-        :Example 2: Get the list of favorite photos/videos from Photos.app
+        :Example:
 
         >>> import PyXA
-        >>> app = PyXA.Application("Photos")
-        >>> favorites = app.media_items().filter("favorite", "==", True)
-        >>> print(favorites)
-        <<class 'PyXA.apps.PhotosApp.XAPhotosMediaItemList'>['CB24FE9F-E9DC-4A5C-A0B0-CC779B1CEDCE/L0/001', 'EFEB7F37-8373-4972-8E43-21612F597185/L0/001', ...]>
+        >>> app = PyXA.Application("Notes")
+        >>> notes = app.notes()
+        >>> indexed_notes = notes.map(lambda element, index: {"element": element, "id": index})
+        >>> print(indexed_notes[0])
+        {'element': <<class 'PyXA.apps.Notes.XANote'>Example Note, x-coredata://314D805E-C349-42A0-96EC-380EE21392E2/ICNote/p9527>, 'id': 0}
 
-        .. note::
+        .. versionadded:: 0.3.0
+        """
+        new_arr = AppKit.NSMutableArray.alloc().initWithArray_(self.xa_elem)
 
-           For properties that appear to be boolean but fail to return expected filter results, try using the corresponding 0 or 1 value instead.
+        def apply_to_index(index):
+            new_arr.replaceObjectAtIndex_withObject_(
+                index, function(self._new_element(new_arr[index], self.xa_ocls), index)
+            )
 
-        :Example 3: Provide a custom format string
+        import libdispatch
 
-        >>> import PyXA
-        >>> app = PyXA.Application("Photos")
-        >>> photo = app.media_items().filter("id == 'CB24FE9F-E9DC-4A5C-A0B0-CC779B1CEDCE/L0/001'")[0]
-        >>> print(photo)
-        <<class 'PyXA.apps.PhotosApp.XAPhotosMediaItem'>id=CB24FE9F-E9DC-4A5C-A0B0-CC779B1CEDCE/L0/001>
+        queue = libdispatch.dispatch_get_global_queue(
+            libdispatch.DISPATCH_QUEUE_PRIORITY_HIGH, 0
+        )
+        libdispatch.dispatch_apply(
+            self.xa_elem.count(), queue, lambda i: apply_to_index(i)
+        )
 
-        :Example 4: Get All Top-Level Playlists in Music.app
+        return self._new_element(new_arr, XAList)
 
-        >>> import PyXA
-        >>> app = PyXA.Music()
-        >>> top_level_playlists = app.playlists().filter("parent", "!exists")
-        >>> print(top_level_playlists)
+    def _xa_selector(self, key: str) -> str:
+        """Gets the Objective-C selector (key) corresponding to the given property name, caching the result per list class.
 
-        .. versionadded:: 0.0.8
+        :param key: The snake_case or camelCase name of a property
+        :type key: str
+        :return: The corresponding selector name
+        :rtype: str
+
+        .. versionadded:: 0.3.1
         """
-        filter, value1, value2 = self._format_for_filter(filter, value1, value2)
-        if comparison_operation.lower() == "exists":
-            return self.exists(filter)
-        elif comparison_operation.lower() in ["not exists", "!exists", "nonexistent"]:
-            return self.not_exists(filter)
-        if comparison_operation is not None and value1 is not None:
-            predicate = XAPredicate()
-            if comparison_operation in ["=", "==", "eq", "EQ", "equals", "EQUALS"]:
-                predicate.add_eq_condition(filter, value1)
-            elif comparison_operation in [
-                "!=",
-                "!==",
-                "neq",
-                "NEQ",
-                "not equal to",
-                "NOT EQUAL TO",
-            ]:
-                predicate.add_neq_condition(filter, value1)
-            elif comparison_operation in [
-                ">",
-                "gt",
-                "GT",
-                "greater than",
-                "GREATER THAN",
-            ]:
-                predicate.add_gt_condition(filter, value1)
-            elif comparison_operation in ["<", "lt", "LT", "less than", "LESS THAN"]:
-                predicate.add_lt_condition(filter, value1)
-            elif comparison_operation in [
-                ">=",
-                "geq",
-                "GEQ",
-                "greater than or equal to",
-                "GREATER THAN OR EQUAL TO",
-            ]:
-                predicate.add_geq_condition(filter, value1)
-            elif comparison_operation in [
-                "<=",
-                "leq",
-                "LEQ",
-                "less than or equal to",
-                "LESS THAN OR EQUAL TO",
-            ]:
-                predicate.add_leq_condition(filter, value1)
-            elif comparison_operation in [
-                "begins with",
-                "beginswith",
-                "BEGINS WITH",
-                "BEGINSWITH",
-            ]:
-                predicate.add_begins_with_condition(filter, value1)
-            elif comparison_operation in ["contains", "CONTAINS"]:
-                predicate.add_contains_condition(filter, value1)
-            elif comparison_operation in [
-                "ends with",
-                "endswith",
-                "ENDS WITH",
-                "ENDSWITH",
-            ]:
-                predicate.add_ends_with_condition(filter, value1)
-            elif comparison_operation in ["between", "BETWEEN"]:
-                predicate.add_between_condition(filter, value1, value2)
-            elif comparison_operation in ["matches", "MATCHES"]:
-                predicate.add_match_condition(filter, value1)
+        cache_key = (self.__class__, key)
+        selector = XAList._xa_selector_cache.get(cache_key)
+        if selector is None:
+            selector = camelize(key) if "_" in key else key
+            XAList._xa_selector_cache[cache_key] = selector
+        return selector
 
-            filtered_list = predicate.evaluate(self.xa_elem)
-            return super()._new_element(filtered_list, self.__class__)
-        else:
-            filtered_list = XAPredicate.evaluate_with_format(self.xa_elem, filter)
-            return super()._new_element(filtered_list, self.__class__)
+    def _xa_resolve_record_key(self, key: str, record: dict) -> Union[str, None]:
+        # Selectors such as persistentID or EQ cannot be derived by camelizing alone, so match them case-insensitively against the record once
+        selector = self._xa_selector(key)
+        if selector in record:
+            return selector
 
-    def at(self, index: int) -> XAObject:
-        """Retrieves the element at the specified index.
+        selector_l = selector.lower()
+        for record_key in record.keys():
+            if str(record_key).lower() == selector_l:
+                XAList._xa_selector_cache[(self.__class__, key)] = str(record_key)
+                return str(record_key)
+        return None
 
-        :param index: The index of the desired element
-        :type index: int
-        :return: The PyXA-wrapped element object
-        :rtype: XAObject
+    def fetch(self, keys: Union[str, list[str]]) -> dict[str, list[Any]]:
+        """Retrieves the values of several properties of every element in the list in a single batched pass.
 
-        .. versionadded:: 0.0.6
-        """
-        return self._new_element(self.xa_elem[index], self.xa_ocls)
+        A single property is retrieved with one request for its values. When several properties are requested, they are resolved from one bulk request for the property records of the list's elements, rather than one request per property. Properties that are not included in the elements' property records are retrieved individually as a fallback.
 
-    @property
-    def first(self) -> XAObject:
-        """Retrieves the first element of the list as a wrapped PyXA object.
+        :param keys: The names of the properties to retrieve, in snake_case or as selector names
+        :type keys: Union[str, list[str]]
+        :return: A dictionary mapping each requested property name to a list of values, one per element, in list order
+        :rtype: dict[str, list[Any]]
 
-        :return: The wrapped object
-        :rtype: XAObject
+        :Example:
 
-        .. versionadded:: 0.0.3
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> columns = app.tracks().fetch(["name", "artist", "duration"])
+        >>> print(columns["name"][:3], columns["duration"][:3])
+        ['Die Another Day', 'Shake It Off', 'Chandelier'] [278.0, 219.0, 216.0]
+
+        .. versionadded:: 0.3.1
         """
-        return self._new_element(self.xa_elem.firstObject(), self.xa_ocls)
+        if isinstance(keys, str):
+            keys = [keys]
 
-    @property
-    def last(self) -> XAObject:
-        """Retrieves the last element of the list as a wrapped PyXA object.
+        columns = {key: None for key in keys}
 
-        :return: The wrapped object
-        :rtype: XAObject
+        records = []
+        if len(keys) == 1:
+            # One property is cheaper to sweep than the records of every property, which may include large values such as message contents
+            try:
+                columns[keys[0]] = self._xa_element_values(keys[0])
+                return columns
+            except Exception:
+                # The selector could not be derived from the name, e.g. persistentID, so it is resolved from the property records below
+                pass
 
-        .. versionadded:: 0.0.3
-        """
-        return self._new_element(self.xa_elem.lastObject(), self.xa_ocls)
+        try:
+            records = XABackends.element_values(self.xa_elem, "properties") or []
+        except Exception:
+            # Elements do not expose a property record
+            records = []
 
-    def shuffle(self) -> "XAList":
-        """Randomizes the order of objects in the list.
+        if len(records) > 0 and hasattr(records[0], "keys"):
+            for key in keys:
+                record_key = self._xa_resolve_record_key(key, records[0])
+                if record_key is not None:
+                    columns[key] = _xa_record_values(records, record_key)
 
-        :return: A reference to the shuffled XAList
-        :rtype: XAList
+        for key in keys:
+            if columns[key] is None:
+                columns[key] = self._xa_element_values(key)
 
-        .. versionadded:: 0.0.3
-        """
-        try:
-            self.xa_elem = self.xa_elem.shuffledArray()
-        except AttributeError as e:
-            try:
-                random.shuffle(self.xa_elem)
-            except TypeError:
-                self.xa_elem = [x for x in self.xa_elem]
-                random.shuffle(self.xa_elem)
-                self.xa_elem = AppKit.NSArray.alloc().initWithArray_(self.xa_elem)
-        return self
+        return columns
 
-    def extend(self, ls: Union["XAList", list]):
-        """Appends all elements of the supplied list to the end of this list.
+    def _xa_element_values(self, key: str) -> list[Any]:
+        # Gets the values of one property of every element with a single request, with missing values as None
+        values = XABackends.element_values(self.xa_elem, self._xa_selector(key)) or []
+        return [None if isinstance(value, AppKit.NSNull) else value for value in values]
 
-        :param ls: _description_
-        :type ls: Union[XAList, list]
+    def to_columns(
+        self, keys: Union[str, list[str]], dtype_map: Union[dict[str, Any], None] = None
+    ) -> dict[str, "numpy.ndarray"]:
+        """Retrieves the values of one or more properties of every element in the list as typed NumPy arrays.
 
-        .. versionadded:: 0.1.1
-        """
-        arr1 = AppKit.NSMutableArray.alloc().initWithArray_(self.xa_elem)
+        Values are fetched using :func:`fetch`, then converted to NumPy arrays in a single pass without wrapping individual elements. Unless otherwise specified in `dtype_map`, the type of each column is inferred from its values:
 
-        if isinstance(ls, XAList):
-            ls = ls.xa_elem
-        else:
-            ls = AppKit.NSMutableArray.alloc().initWithArray_(ls)
+        - Dates become `datetime64[us]` (UTC), with missing values as `NaT`
+        - Booleans become `bool_`
+        - Integers become `int64`, or `float64` if any values are missing
+        - Floats become `float64`, with missing values as `NaN`
+        - Strings and all other values become `object`
 
-        arr1.addObjectsFromArray_(ls)
-        self.xa_elem = arr1
+        .. note::
 
-    def push(self, *elements: list[XAObject]) -> Union[XAObject, list[XAObject], None]:
-        """Appends the object referenced by the provided PyXA wrapper to the end of the list.
+           This method requires NumPy to be installed.
 
-        .. versionadded:: 0.0.3
-        """
-        objects = []
-        num_added = 0
+        :param keys: The names of the properties to retrieve
+        :type keys: Union[str, list[str]]
+        :param dtype_map: A dictionary mapping property names to NumPy dtypes (e.g. `"U64"` for fixed-width strings) that override the inferred types. Integer and boolean dtypes cannot represent missing values, so they are only accepted for properties without any. Defaults to None
+        :type dtype_map: Union[dict[str, Any], None], optional
+        :raises ValueError: An integer or boolean dtype was given for a property with missing values
+        :return: A dictionary mapping each property name to a NumPy array of values, in list order
+        :rtype: dict[str, numpy.ndarray]
 
-        for element in elements:
-            len_before = len(self.xa_elem)
-            self.xa_elem.addObject_(element.xa_elem)
-            len_after = len(self.xa_elem)
+        :Example:
 
-            if len_after == len_before:
-                # Object wasn't added -- try force-getting the list before adding
-                self.xa_elem.get().addObject_(element.xa_elem)
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> columns = app.tracks().to_columns(["name", "duration", "date_added"])
+        >>> print(columns["duration"].mean())
+        241.1825
 
-            if len_after > len_before:
-                num_added += 1
-                objects.append(self[len_after - 1])
+        .. versionadded:: 0.3.1
+        """
+        dtype_map = dtype_map or {}
+        columns = self.fetch(keys)
+        return {
+            key: _xa_to_ndarray(values, dtype_map.get(key), key)
+            for key, values in columns.items()
+        }
 
-        if num_added == 1:
-            return objects[0]
+    def to_records(
+        self, keys: Union[str, list[str]], dtype_map: Union[dict[str, Any], None] = None
+    ) -> "numpy.ndarray":
+        """Retrieves the values of one or more properties of every element in the list as a NumPy structured array, with one field per property and one record per element.
 
-        if num_added == 0:
-            return None
+        Column types are determined as in :func:`to_columns`.
 
-        return objects
+        .. note::
 
-    def insert(self, element: XAObject, index: int):
-        """Inserts the object referenced by the provided PyXA wrapper at the specified index.
+           This method requires NumPy to be installed.
 
-        .. versionadded:: 0.0.3
-        """
-        self.xa_elem.insertObject_atIndex_(element.xa_elem, index)
+        :param keys: The names of the properties to retrieve
+        :type keys: Union[str, list[str]]
+        :param dtype_map: A dictionary mapping property names to NumPy dtypes that override the inferred types, defaults to None
+        :type dtype_map: Union[dict[str, Any], None], optional
+        :raises ValueError: An integer or boolean dtype was given for a property with missing values
+        :return: The structured array of property values
+        :rtype: numpy.ndarray
 
-    def pop(self, index: int = -1) -> XAObject:
-        """Removes the object at the specified index from the list and returns it.
+        :Example:
 
-        .. versionadded:: 0.0.3
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> records = app.tracks().to_records(["name", "played_count"])
+        >>> print(records[records["played_count"] > 100]["name"])
+        ['Chandelier' 'Shake It Off']
+
+        .. versionadded:: 0.3.1
         """
-        removed = self.xa_elem.lastObject()
-        self.xa_elem.removeLastObject()
-        return self._new_element(removed, self.xa_ocls)
+        import numpy
 
-    def index(self, element: XAObject) -> int:
-        """Returns the index of the first occurrence of the element in the list, or -1 if no such element exists in the list.
+        columns = self.to_columns(keys, dtype_map)
+        records = numpy.empty(
+            len(self.xa_elem),
+            dtype=[(key, column.dtype) for key, column in columns.items()],
+        )
+        for key, column in columns.items():
+            records[key] = column
+        return records
 
-        .. versionadded:: 0.1.2
-        """
-        for index, item in enumerate(self.xa_elem):
-            if item == element.xa_elem:
-                return index
+    def _xa_load_batch(
+        self,
+        start: int,
+        size: int,
+        prefetch: list[str],
+        identifiers: Union[_XAElementIdentifiers, None],
+    ) -> "XAList":
+        if identifiers is not None:
+            elements = _XAElementSlice(
+                self.xa_elem, range(start, start + size), identifiers
+            )
+        else:
+            elements = self.xa_elem.subarrayWithRange_((start, size))
+        chunk = self._new_element(elements, self.__class__)
+
+        if prefetch:
+            # Uses the chunk's bulk accessors, so that values are converted the same way as by the elements' property getters
+            columns = {key: chunk._xa_column_accessor(key)() for key in prefetch}
+            cache = chunk.xa_cache if chunk.xa_cache is not None else XAPropertyCache()
+            for index, element in enumerate(chunk.xa_elem):
+                for key, column in columns.items():
+                    cache.set(element, key, column[index])
+            chunk.enable_cache(cache=cache)
+        return chunk
+
+    def _xa_column_accessor(self, key: str) -> Callable[[], list[Any]]:
+        # Gets the bulk accessor method of a subclass for the property, e.g. XAMusicTrackList.name for XAMusicTrack.name
+        for klass in type(self).__mro__:
+            if klass is XAList:
+                break
+            if callable(klass.__dict__.get(key)):
+                return getattr(self, key)
+        raise ValueError(
+            f"{key!r} cannot be prefetched because {type(self).__name__} has no bulk accessor for it."
+        )
 
-        for index, item in enumerate(self):
-            if item == element:
-                return index
+    def iter_batches(
+        self,
+        size: int = 500,
+        prefetch: Union[list[str], None] = None,
+        background: bool = False,
+    ) -> Iterator["XAList"]:
+        """Iterates over the list in chunks, optionally fetching properties of each chunk's elements ahead of time.
 
-        return -1
+        When properties are prefetched, they are retrieved for each chunk as it is loaded, using the chunk's bulk accessor method of the same name (e.g. :func:`XAMusicTrackList.name`), so accessing those properties on the chunk's elements does not send further requests. Prefetching with `background=True` moves these requests, as well as the loading of the following chunks, off of the thread that processes the chunks.
 
-    def count(self, count_function: Callable[[object], bool]) -> int:
-        """Counts the number of entries in the list for which the provided function is True.
+        Only the values of the current and next chunks are held in memory. Chunks of lists of scripting elements are element arrays themselves, as slices of such lists are, so each prefetched property costs one request per chunk, or one per 200 elements of the chunk for lists obtained from ScriptingBridge, which has no range specifiers and instead targets the chunk's elements by ID after retrieving the IDs of the list's elements once.
 
-        :param count_function: The function to check entries against
-        :type count_function: Callable[[object], bool]
-        :return: The number of entries for which the given function is True.
-        :rtype: int
+        .. note::
 
-        .. versionadded:: 0.1.0
-        """
-        count = 0
-        for index in range(len(self)):
-            in_count = False
-            try:
-                in_count = count_function(self.xa_elem[index])
-            except:
-                # TODO: Add logging message here
-                pass
+           Prefetched values are converted by the list's accessor methods, so they have the same types (e.g. enums or :class:`XAPath` objects) as values returned by the elements' property getters. Properties without a bulk accessor on the list's class cannot be prefetched.
 
-            if not in_count:
-                try:
-                    in_count = count_function(self[index])
-                except:
-                    pass
+        :param size: The maximum number of elements in each chunk, defaults to 500
+        :type size: int, optional
+        :param prefetch: The names of properties to bulk-fetch for each chunk, defaults to None
+        :type prefetch: Union[list[str], None], optional
+        :param background: Whether to load the next chunk on a background thread while the current chunk is processed, defaults to False
+        :type background: bool, optional
+        :raises ValueError: The batch size is less than 1, or a prefetched property has no bulk accessor
+        :yield: Lists of the same type as this list containing consecutive elements
+        :rtype: Iterator[XAList]
 
-            if in_count:
-                count += 1
-        return count
+        :Example:
 
-    def __getitem__(self, key: Union[int, slice]):
-        if isinstance(key, slice):
-            arr = AppKit.NSMutableArray.alloc().initWithArray_(
-                [
-                    self.xa_elem[index]
-                    for index in range(key.start, key.stop, key.step or 1)
-                ]
+        >>> import PyXA
+        >>> app = PyXA.Mail()
+        >>> messages = app.accounts()[0].mailboxes().by_name("INBOX").messages()
+        >>> for chunk in messages.iter_batches(500, prefetch=["subject", "id"], background=True):
+        ...     for message in chunk:
+        ...         print(message.id, message.subject)
+
+        .. versionadded:: 0.3.1
+        """
+        if size < 1:
+            raise ValueError("The batch size must be at least 1.")
+
+        prefetch = list(prefetch or [])
+        for key in prefetch:
+            self._xa_column_accessor(key)
+
+        identifiers = None
+        if isinstance(self.xa_elem, ScriptingBridge.SBElementArray):
+            identifiers = _XAElementIdentifiers(self.xa_elem)
+        total = XABackends.element_count(self.xa_elem)
+        starts = range(0, total, size)
+
+        def load_batch(start: int) -> "XAList":
+            return self._xa_load_batch(
+                start, min(size, total - start), prefetch, identifiers
             )
-            return self._new_element(arr, self.__class__)
-        if key < 0:
-            key = self.xa_elem.count() + key
 
-        return self._new_element(self.xa_elem.objectAtIndex_(key), self.xa_ocls)
+        if not background:
+            for start in starts:
+                yield load_batch(start)
+            return
 
-    def __len__(self):
-        return len(self.xa_elem)
-
-    def __reversed__(self):
-        self.xa_elem = self.xa_elem.reverseObjectEnumerator().allObjects()
-        return self
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            for start in starts:
+                if pending is None:
+                    pending = executor.submit(load_batch, start)
+                chunk = pending.result()
 
-    def __iter__(self):
-        return (
-            self._new_element(object, self.xa_ocls)
-            for object in self.xa_elem.objectEnumerator()
-        )
+                next_start = start + size
+                pending = None
+                if next_start < total:
+                    pending = executor.submit(load_batch, next_start)
+                yield chunk
 
-    def __contains__(self, item):
-        if isinstance(item, XAObject):
-            item = item.xa_elem
-        return item in self.xa_elem
+    def equalling(self, property: str, value: str) -> "XAList":
+        """Retrieves all elements whose property value equals the given value.
 
-    def __repr__(self):
-        return "<" + str(type(self)) + str(self.xa_elem) + ">"
+        :param property: The property to match
+        :type property: str
+        :param value: The value to search for
+        :type value: str
+        :return: The list of matching elements
+        :rtype: XAList
 
+        :Example:
 
-class XAApplicationList(XAList):
-    """A wrapper around a list of applications.
+        >>> import PyXA
+        >>> app = PyXA.Application("TV")
+        >>> print(app.tracks().equalling("playedCount", 0))
+        <<class 'PyXA.apps.TV.XATVTrackList'>['Frozen', 'Sunshine', 'The Hunger Games: Mockingjay - Part 2', ...]>
 
-    .. versionadded:: 0.0.5
-    """
+        .. versionadded:: 0.1.0
+        """
+        property, value, _ = self._format_for_filter(property, value)
+        predicate = XAPredicate()
+        predicate.add_eq_condition(property, value)
+        ls = predicate.evaluate(self.xa_elem)
+        return self._new_element(ls, self.__class__)
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, XAApplication, filter)
+    def not_equalling(self, property: str, value: str) -> "XAList":
+        """Retrieves all elements whose property value does not equal the given value.
 
-        if filter is not None:
-            self.xa_elem = XAPredicate().from_dict(filter).evaluate(self.xa_elem)
+        :param property: The property to match
+        :type property: str
+        :param value: The value to search for
+        :type value: str
+        :return: The list of matching elements
+        :rtype: XAList
 
-    def first(self) -> XAObject:
-        """Retrieves the first element of the list as a wrapped PyXA application object.
+        :Example:
 
-        :return: The wrapped object
-        :rtype: XAObject
+        >>> import PyXA
+        >>> app = PyXA.Application("TV")
+        >>> print(app.tracks().not_equalling("playedCount", 0))
+        <<class 'PyXA.apps.TV.XATVTrackList'>['The Avatar State', 'The Cave of Two Lovers', 'Return to Omashu', ...]>
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.1.0
         """
-        return self.__getitem__(0)
+        property, value, _ = self._format_for_filter(property, value)
+        predicate = XAPredicate()
+        predicate.add_neq_condition(property, value)
+        ls = predicate.evaluate(self.xa_elem)
+        return self._new_element(ls, self.__class__)
 
-    def last(self) -> XAObject:
-        """Retrieves the last element of the list as a wrapped PyXA application object.
+    def containing(self, property: str, value: str) -> "XAList":
+        """Retrieves all elements whose property value contains the given value.
 
-        :return: The wrapped object
-        :rtype: XAObject
+        :param property: The property to match
+        :type property: str
+        :param value: The value to search for
+        :type value: str
+        :return: The list of matching elements
+        :rtype: XAList
 
-        .. versionadded:: 0.0.5
-        """
-        return self.__getitem__(-1)
+        :Example:
 
-    def pop(self, index: int = -1) -> XAObject:
-        """Removes the application at the specified index from the list and returns it.
+        >>> import PyXA
+        >>> app = PyXA.Application("Reminders")
+        >>> print(app.reminders().containing("name", "PyXA"))
+        <<class 'PyXA.apps.Reminders.XARemindersReminderList'>['PyXA v0.1.0 release']>
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.0.6
         """
-        removed = self.xa_elem.lastObject()
-        self.xa_elem.removeLastObject()
-        app_name = removed["kCGWindowOwnerName"]
-        return Application(app_name)
-
-    def __getitem__(self, key: Union[int, slice]):
-        """Retrieves the wrapped application object(s) at the specified key."""
-        if isinstance(key, slice):
-            arr = AppKit.NSArray.alloc().initWithArray_(
-                [
-                    self.xa_elem[index]
-                    for index in range(key.start, key.stop, key.step or 1)
-                ]
-            )
-            return self._new_element(arr, self.__class__)
-        app_name = self.xa_elem[key]["kCGWindowOwnerName"]
-        return Application(app_name)
-
-    def bundle_identifier(self) -> list[str]:
-        return [app.bundle_identifier for app in self]
-
-    def bundle_url(self) -> list["XAURL"]:
-        return [XAURL(app.bundle_url) for app in self]
-
-    def executable_url(self) -> list["XAURL"]:
-        return [XAURL(app.executable_url) for app in self]
+        property, value, _ = self._format_for_filter(property, value)
+        predicate = XAPredicate()
+        predicate.add_contains_condition(property, value)
+        ls = predicate.evaluate(self.xa_elem)
+        return self._new_element(ls, self.__class__)
 
-    def launch_date(self) -> list[datetime]:
-        return [app.launch_date for app in self]
+    def not_containing(self, property: str, value: str) -> "XAList":
+        """Retrieves all elements whose property value does not contain the given value.
 
-    def localized_name(self) -> list[str]:
-        return [x.get("kCGWindowOwnerName") for x in self.xa_elem]
+        :param property: The property to match
+        :type property: str
+        :param value: The value to search for
+        :type value: str
+        :return: The list of matching elements
+        :rtype: XAList
 
-    def process_identifier(self) -> list[str]:
-        return [x.get("kCGWindowOwnerPID") for x in self.xa_elem]
+        :Example:
 
-    def by_bundle_identifier(
-        self, bundle_identifier: str
-    ) -> Union["XAApplication", None]:
-        for app in self:
-            if app.bundle_identifier == bundle_identifier:
-                return app
+        >>> import PyXA
+        >>> app = PyXA.Application("Reminders")
+        >>> print(app.reminders().not_containing("name", " "))
+        <<class 'PyXA.apps.Reminders.XARemindersReminderList'>['Trash', 'Thing', 'Reminder', ...]>
 
-    def by_bundle_url(
-        self, bundle_url: Union["XAURL", str]
-    ) -> Union["XAApplication", None]:
-        if isinstance(bundle_url, str):
-            bundle_url = XAURL(bundle_url)
+        .. versionadded:: 0.1.0
+        """
+        property, value, _ = self._format_for_filter(property, value)
+        ls = XAPredicate.evaluate_with_format(
+            self.xa_elem, f'NOT {property} CONTAINS "{value}"'
+        )
+        return self._new_element(ls, self.__class__)
 
-        for app in self:
-            if app.bundle_url.xa_elem == bundle_url.xa_elem:
-                return app
+    def beginning_with(self, property: str, value: str) -> "XAList":
+        """Retrieves all elements whose property value begins with the given value.
 
-    def by_executable_url(
-        self, executable_url: Union["XAURL", str]
-    ) -> Union["XAApplication", None]:
-        if isinstance(executable_url, str):
-            executable_url = XAURL(executable_url)
+        :param property: The property to match
+        :type property: str
+        :param value: The value to search for
+        :type value: str
+        :return: The list of matching elements
+        :rtype: XAList
 
-        for app in self:
-            if app.executable_url.xa_elem == executable_url.xa_elem:
-                return app
+        :Example:
 
-    def by_launch_date(self, launch_date: datetime) -> Union["XAApplication", None]:
-        for app in self:
-            if app.launch_date == launch_date:
-                return app
+        >>> import PyXA
+        >>> app = PyXA.Application("System Events")
+        >>> print(app.downloads_folder.files().beginning_with("name", "Example"))
+        <<class 'PyXA.apps.SystemEvents.XASystemEventsFileList'>['Example.png', 'ExampleImage.png', ...]>
 
-    def by_localized_name(self, localized_name: str) -> Union["XAApplication", None]:
-        for index, app in enumerate(self.xa_elem):
-            if app.get("kCGWindowOwnerName") == localized_name:
-                return self.__getitem__(index)
+        .. versionadded:: 0.1.0
+        """
+        property, value, _ = self._format_for_filter(property, value)
+        predicate = XAPredicate()
+        predicate.add_begins_with_condition(property, value)
+        ls = predicate.evaluate(self.xa_elem)
+        return self._new_element(ls, self.__class__)
 
-    def by_process_identifier(
-        self, process_identifier: str
-    ) -> Union["XAApplication", None]:
-        for index, app in enumerate(self.xa_elem):
-            if app.get("kCGWindowOwnerPID") == process_identifier:
-                return self.__getitem__(index)
+    def ending_with(self, property: str, value: str) -> "XAList":
+        """Retrieves all elements whose property value ends with the given value.
 
-    def hide(self):
-        """Hides all applications in the list.
+        :param property: The property to match
+        :type property: str
+        :param value: The value to search for
+        :type value: str
+        :return: The list of matching elements
+        :rtype: XAList
 
-        :Example 1: Hide all visible running applications
+        :Example:
 
         >>> import PyXA
-        >>> apps = PyXA.running_applications()
-        >>> apps.hide()
-
-        .. seealso:: :func:`unhide`
+        >>> app = PyXA.Application("System Events")
+        >>> print(app.downloads_folder.files().ending_with("name", ".png"))
+        <<class 'PyXA.apps.SystemEvents.XASystemEventsFileList'>['Example.png', 'Image.png', ...]>
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.1.0
         """
-        for app in self:
-            app.hide()
+        property, value, _ = self._format_for_filter(property, value)
+        predicate = XAPredicate()
+        predicate.add_ends_with_condition(property, value)
+        ls = predicate.evaluate(self.xa_elem)
+        return self._new_element(ls, self.__class__)
 
-    def unhide(self):
-        """Unhides all applications in the list.
+    def greater_than(self, property: str, value: Union[int, float]) -> "XAList":
+        """Retrieves all elements whose property value is greater than the given value.
 
-        :Example 1: Hide then unhide all visible running applications
+        :param property: The property to match
+        :type property: str
+        :param value: The value to compare against
+        :type value: Union[int, float]
+        :return: The list of matching elements
+        :rtype: XAList
 
-        >>> import PyXA
-        >>> apps = PyXA.running_applications()
-        >>> apps.hide()
-        >>> apps.unhide()
+        :Example:
 
-        .. seealso:: :func:`hide`
+        >>> import PyXA
+        >>> app = PyXA.Application("Photos")
+        >>> print(app.media_items().greater_than("altitude", 10000)[0].spotlight())
+        <<class 'PyXA.apps.PhotosApp.XAPhotosMediaItem'>id=53B0F28E-0B39-446B-896C-484CD0DC2D3C/L0/001>
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.1.0
         """
-        for app in self:
-            app.unhide()
-
-    def terminate(self):
-        """Quits (terminates) all applications in the list. Synonymous with :func:`quit`.
-
-        :Example 1: Terminate all visible running applications
-
-        >>> import PyXA
-        >>> apps = PyXA.running_applications()
-        >>> apps.terminate()
+        property, value, _ = self._format_for_filter(property, value)
+        predicate = XAPredicate()
+        predicate.add_gt_condition(property, value)
+        ls = predicate.evaluate(self.xa_elem)
+        return self._new_element(ls, self.__class__)
 
-        .. versionadded:: 0.0.5
-        """
-        for app in self:
-            app.terminate()
+    def less_than(self, property: str, value: Union[int, float]) -> "XAList":
+        """Retrieves all elements whose property value is less than the given value.
 
-    def quit(self):
-        """Quits (terminates) all applications in the list. Synonymous with :func:`terminate`.
+        :param property: The property to match
+        :type property: str
+        :param value: The value to compare against
+        :type value: Union[int, float]
+        :return: The list of matching elements
+        :rtype: XAList
 
-        :Example 1: Quit all visible running applications
+        :Example:
 
-        >>> import PyXA
-        >>> apps = PyXA.running_applications()
-        >>> apps.quit()
+        >>> app = PyXA.Application("Music")
+        >>> tracks = app.tracks()
+        >>> print(tracks.less_than("playedCount", 5).name())
+        ['Outrunning Karma', 'Death of a Hero', '1994', 'Mind Is a Prison']
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.1.0
         """
-        for app in self:
-            app.terminate()
-
-    def windows(self) -> "XAList":
-        """Retrieves a list of every window belonging to each application in the list.
+        property, value, _ = self._format_for_filter(property, value)
+        predicate = XAPredicate()
+        predicate.add_lt_condition(property, value)
+        ls = predicate.evaluate(self.xa_elem)
+        return self._new_element(ls, self.__class__)
 
-        Operations on the list of windows will specialized to scriptable and non-scriptable application window operations as necessary.
+    def between(
+        self, property: str, value1: Union[int, float], value2: Union[int, float]
+    ) -> "XAList":
+        """Retrieves all elements whose property value is between the given values.
 
-        :return: A list containing both scriptable and non-scriptable windows
+        :param property: The property to match
+        :type property: str
+        :param value1: The lower-end of the range to match
+        :type value1: Union[int, float]
+        :param value2: The upper-end of the range to match
+        :type value2: Union[int, float]
+        :return: The list of matching elements
         :rtype: XAList
 
         :Example:
 
         >>> import PyXA
-        >>> windows = PyXA.running_applications().windows()
-        >>> windows.collapse()
-        >>> sleep(1)
-        >>> windows.uncollapse()
-
-        .. versionchanged 0.1.2
-
-            Now returns an instance of :class:`PyXA.apps.SystemEvents.XASystemEventsWindowList`
-
-        .. versionchanged:: 0.1.1
-
-           Now returns an instance of :class:`XAWindowList` instead of :class:`XACombinedWindowList`.
+        >>> from datetime import datetime, timedelta
+        >>>
+        >>> app = PyXA.Application("Calendar")
+        >>> events = app.calendars()[3].events()
+        >>> now = datetime.now()
+        >>> print(events.between("startDate", now, now + timedelta(days=1)))
+        <<class 'PyXA.apps.Calendar.XACalendarEventList'>['Capstone Meeting', 'Lunch with Dan']>
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.1.0
         """
-        return self.xa_sevt.processes().windows()
+        property, value1, value2 = self._format_for_filter(property, value1, value2)
+        predicate = XAPredicate()
+        predicate.add_gt_condition(property, value1)
+        predicate.add_lt_condition(property, value2)
+        ls = predicate.evaluate(self.xa_elem)
+        return self._new_element(ls, self.__class__)
 
-    def __iter__(self):
-        return (
-            Application(object["kCGWindowOwnerName"])
-            for object in self.xa_elem.objectEnumerator()
-        )
+    def exists(self, property: str) -> "XAList":
+        """Retrieves all elements whose specified property value exists.
 
-    def __contains__(self, item):
-        if isinstance(item, XAApplication):
-            return item.process_identifier in self.process_identifier()
+        :param property: The property to check the existence of
+        :type property: str
+        :return: The list of matching elements
+        :rtype: XAList
 
-    def __repr__(self):
-        return "<" + str(type(self)) + str(self.localized_name()) + ">"
+        .. versionadded:: 0.2.2
+        """
+        ls = [x for x in self.xa_elem if getattr(x, property)().exists()]
+        return self._new_element(ls, self.__class__)
 
+    def not_exists(self, property: str) -> "XAList":
+        """Retrieves all elements whose specified property value does not exist.
 
-class Application(XAObject):
-    """A wrapper around a macOS application providing access to its scripting functionality.
+        :param property: The property to check the non-existence of
+        :type property: str
+        :return: The list of matching elements
+        :rtype: XAList
 
-    .. versionchanged:: 0.1.1
+        .. versionadded:: 0.2.2
+        """
+        ls = [x for x in self.xa_elem if not getattr(x, property)().exists()]
+        return self._new_element(ls, self.__class__)
 
-       Moved into the XABase module.
+    def filter(
+        self,
+        filter: str,
+        comparison_operation: Union[str, None] = None,
+        value1: Union[Any, None] = None,
+        value2: Union[Any, None] = None,
+    ) -> "XAList":
+        """Filters the list by the given parameters.
 
-    .. versionadded:: 0.1.0
-    """
+        The filter may be either a format string, used to create an NSPredicate, or up to 4 arguments specifying the filtered property name, the comparison operation, and up to two values to compare against.
 
-    app_paths: list[str] = []  #: A list containing the path to each application
+        :param filter: A format string or a property name
+        :type filter: str
+        :param comparison_operation: The symbol or name of a comparison operation, such as > or <, defaults to None
+        :type comparison_operation: Union[str, None], optional
+        :param value1: The first value to compare each list item's property value against, defaults to None
+        :type value1: Union[Any, None], optional
+        :param value2: The second value to compare each list item's property value against, defaults to None
+        :type value2: Union[Any, None], optional
+        :return: The filtered XAList object
+        :rtype: XAList
 
-    def __init__(self, app_name: str):
-        """Creates a new application object.
+        :Example 1: Get the last file sent by you (via this machine) in Messages.app
 
-        :param app_name: The name of the target application
-        :type app_name: str
+        >>> import PyXA
+        >>> app = PyXA.Application("Messages")
+        >>> last_file_transfer = app.file_transfers().filter("direction", "==", app.MessageDirection.OUTGOING)[-1]
+        >>> print(last_file_transfer)
+        <<class 'PyXA.apps.Messages.XAMessagesFileTransfer'>Test.jpg>
 
-        .. versionadded:: 0.1.0
-        """
-        # Elevate to XAApplication
-        new_self = self.__get_application(app_name)
-        self.__class__ = new_self.__class__
-        self.__dict__.update(new_self.__dict__)
+        :Example 2: Get the list of favorite photos/videos from Photos.app
 
-    def __xa_get_path_to_app(self, app_identifier: str) -> str:
-        self.__xa_load_app_paths()
-        candidate = None
-        for path in self.app_paths:
-            app_path_component = path.split("/")[-1][:-4]
-            if (
-                app_identifier.lower() == path.lower()
-                or app_identifier.lower() == app_path_component.lower()
-            ):
-                return path
+        >>> import PyXA
+        >>> app = PyXA.Application("Photos")
+        >>> favorites = app.media_items().filter("favorite", "==", True)
+        >>> print(favorites)
+        <<class 'PyXA.apps.PhotosApp.XAPhotosMediaItemList'>['CB24FE9F-E9DC-4A5C-A0B0-CC779B1CEDCE/L0/001', 'EFEB7F37-8373-4972-8E43-21612F597185/L0/001', ...]>
 
-            if app_identifier.lower() in path.lower():
-                candidate = path
+        .. note::
 
-        if candidate is not None:
-            return candidate
+           For properties that appear to be boolean but fail to return expected filter results, try using the corresponding 0 or 1 value instead.
 
-        raise ApplicationNotFoundError(app_identifier)
+        :Example 3: Provide a custom format string
 
-    def __xa_load_app_paths(self):
-        if self.app_paths == []:
-            search = XASpotlight()
-            search.predicate = "kMDItemContentType == 'com.apple.application-bundle'"
-            search.run()
-            self.app_paths = [x.path for x in search.results]
+        >>> import PyXA
+        >>> app = PyXA.Application("Photos")
+        >>> photo = app.media_items().filter("id == 'CB24FE9F-E9DC-4A5C-A0B0-CC779B1CEDCE/L0/001'")[0]
+        >>> print(photo)
+        <<class 'PyXA.apps.PhotosApp.XAPhotosMediaItem'>id=CB24FE9F-E9DC-4A5C-A0B0-CC779B1CEDCE/L0/001>
 
-    def __get_application(self, app_identifier: str) -> "XAApplication":
-        """Retrieves a PyXA application object representation of the target application without launching or activating the application.
+        :Example 4: Get All Top-Level Playlists in Music.app
 
-        :param app_identifier: The name of the application to get an object of.
-        :type app_identifier: str
-        :return: A PyXA application object referencing the target application.
-        :rtype: XAApplication
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> top_level_playlists = app.playlists().filter("parent", "!exists")
+        >>> print(top_level_playlists)
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.0.8
         """
-        global workspace
-        if workspace is None:
-            workspace = AppKit.NSWorkspace.sharedWorkspace()
+        filter, value1, value2 = self._format_for_filter(filter, value1, value2)
+        if comparison_operation is not None:
+            if comparison_operation.lower() == "exists":
+                return self.exists(filter)
+            elif comparison_operation.lower() in ["not exists", "!exists", "nonexistent"]:
+                return self.not_exists(filter)
 
-        app_identifier_l = app_identifier.lower()
+        if comparison_operation is not None and value1 is not None:
+            predicate = XAPredicate()
+            predicate.add_condition(filter, comparison_operation, value1, value2)
+            filtered_list = predicate.evaluate(self.xa_elem)
+            return super()._new_element(filtered_list, self.__class__)
+        else:
+            filtered_list = XAPredicate.evaluate_with_format(self.xa_elem, filter)
+            return super()._new_element(filtered_list, self.__class__)
 
-        def _match_open_app(obj, index, stop):
-            res = obj.localizedName().lower() == app_identifier_l
-            return res, res
+    def at(self, index: int) -> XAObject:
+        """Retrieves the element at the specified index.
 
-        idx_set = workspace.runningApplications().indexesOfObjectsPassingTest_(
-            _match_open_app
-        )
-        if idx_set.count() == 1:
-            index = idx_set.firstIndex()
-            app = workspace.runningApplications()[index]
-            properties = {
-                "parent": None,
-                "element": app,
-                "appref": app,
-            }
+        :param index: The index of the desired element
+        :type index: int
+        :return: The PyXA-wrapped element object
+        :rtype: XAObject
 
-            app_obj = application_classes.get(app_identifier_l, XAApplication)
-            if isinstance(app_obj, tuple):
-                module = importlib.import_module("PyXA.apps." + app_obj[0])
-                app_class = getattr(module, app_obj[1], None)
-                if app_class is not None:
-                    application_classes[app_identifier_l] = app_class
-                    app = app_class
-                else:
-                    raise NotImplementedError()
+        .. versionadded:: 0.0.6
+        """
+        return self._new_element(self.xa_elem[index], self.xa_ocls)
 
-            # Check if the app is supported by PyXA
-            app_ref = application_classes.get(app_identifier_l, XAApplication)(
-                properties
-            )
-            return app_ref
+    @property
+    def first(self) -> XAObject:
+        """Retrieves the first element of the list as a wrapped PyXA object.
 
-        app_path = app_identifier
-        if not app_identifier.startswith("/"):
-            app_path = self.__xa_get_path_to_app(app_identifier)
-        bundle = AppKit.NSBundle.alloc().initWithPath_(app_path)
-        url = workspace.URLForApplicationWithBundleIdentifier_(
-            bundle.bundleIdentifier()
-        )
+        :return: The wrapped object
+        :rtype: XAObject
 
-        config = AppKit.NSWorkspaceOpenConfiguration.alloc().init()
-        config.setActivates_(False)
-        config.setHides_(True)
+        .. versionadded:: 0.0.3
+        """
+        return self._new_element(self.xa_elem.firstObject(), self.xa_ocls)
 
-        app_ref = None
+    @property
+    def last(self) -> XAObject:
+        """Retrieves the last element of the list as a wrapped PyXA object.
 
-        def _launch_completion_handler(app, _error):
-            nonlocal app_ref
-            properties = {
-                "parent": None,
-                "element": app,
-                "appref": app,
-            }
+        :return: The wrapped object
+        :rtype: XAObject
 
-            app_obj = application_classes.get(app_identifier_l, None)
-            if isinstance(app_obj, tuple):
-                module = importlib.import_module("PyXA.apps." + app_obj[0])
-                app_class = getattr(module, app_obj[1], None)
-                if app_class is not None:
-                    application_classes[app_identifier_l] = app_class
-                    app = app_class
-                else:
-                    raise NotImplementedError()
+        .. versionadded:: 0.0.3
+        """
+        return self._new_element(self.xa_elem.lastObject(), self.xa_ocls)
 
-            app_ref = application_classes.get(app_identifier_l, XAApplication)(
-                properties
-            )
+    def shuffle(self) -> "XAList":
+        """Randomizes the order of objects in the list.
 
-        workspace.openApplicationAtURL_configuration_completionHandler_(
-            url, config, _launch_completion_handler
-        )
-        while app_ref is None:
-            time.sleep(0.01)
-        return app_ref
+        :return: A reference to the shuffled XAList
+        :rtype: XAList
 
+        .. versionadded:: 0.0.3
+        """
+        try:
+            self.xa_elem = self.xa_elem.shuffledArray()
+        except AttributeError as e:
+            try:
+                random.shuffle(self.xa_elem)
+            except TypeError:
+                self.xa_elem = [x for x in self.xa_elem]
+                random.shuffle(self.xa_elem)
+                self.xa_elem = AppKit.NSArray.alloc().initWithArray_(self.xa_elem)
+        self.drop_indexes()
+        return self
 
-def current_application() -> "XAApplication":
-    """Retrieves a PyXA representation of the frontmost application.
-
-    :return: A PyXA application object referencing the current application.
-    :rtype: XAApplication
+    def extend(self, ls: Union["XAList", list]):
+        """Appends all elements of the supplied list to the end of this list.
 
-    .. versionchanged:: 0.1.1
+        :param ls: _description_
+        :type ls: Union[XAList, list]
 
-       Moved into the XABase module.
+        .. versionadded:: 0.1.1
+        """
+        arr1 = AppKit.NSMutableArray.alloc().initWithArray_(self.xa_elem)
 
-    .. versionadded:: 0.0.1
-    """
-    global workspace
-    if workspace is None:
-        workspace = AppKit.NSWorkspace.sharedWorkspace()
-    return Application(workspace.frontmostApplication().localizedName())
+        if isinstance(ls, XAList):
+            ls = ls.xa_elem
+        else:
+            ls = AppKit.NSMutableArray.alloc().initWithArray_(ls)
 
+        arr1.addObjectsFromArray_(ls)
+        self.xa_elem = arr1
+        self.drop_indexes()
 
-def running_applications(unique=True) -> list["XAApplication"]:
-    """Gets PyXA references to all currently visible (not hidden or minimized) running applications whose app bundles are stored in typical application directories. Applications are ordered by their z-index, with the frontmost application first.
+    @_xa_batched()
+    def push(self, *elements: list[XAObject]) -> Union[XAObject, list[XAObject], None]:
+        """Appends the object referenced by the provided PyXA wrapper to the end of the list.
 
-    :param unique: Whether to return only one instance of each application, defaults to True
-    :type unique: bool, optional
-    :return: A list of PyXA application objects.
-    :rtype: list[XAApplication]
+        .. versionadded:: 0.0.3
+        """
+        objects = []
+        num_added = 0
+        self.drop_indexes()
 
-    :Example 1: Get the name of each running application
+        for element in elements:
+            len_before = len(self.xa_elem)
+            self.xa_elem.addObject_(element.xa_elem)
+            len_after = len(self.xa_elem)
 
-    >>> import PyXA
-    >>> apps = PyXA.running_applications()
-    >>> print(apps.localized_name())
-    ['GitHub Desktop', 'Safari', 'Code', 'Terminal', 'Notes', 'Messages', 'TV']
+            if len_after == len_before:
+                # Object wasn't added -- try force-getting the list before adding
+                self.xa_elem.get().addObject_(element.xa_elem)
 
-    .. versionchanged:: 0.3.0
+            if len_after > len_before:
+                num_added += 1
+                objects.append(self[len_after - 1])
 
-        Added the :attr:`unique` parameter.
+        if num_added == 1:
+            return objects[0]
 
-    .. versionadded:: 0.0.1
-    """
-    windows = Quartz.CGWindowListCopyWindowInfo(
-        Quartz.kCGWindowListOptionOnScreenOnly, Quartz.kCGNullWindowID
-    )
-    ls = XAPredicate.evaluate_with_format(windows, "kCGWindowLayer == 0")
+        if num_added == 0:
+            return None
 
-    # Filter list to unique applications
-    if unique:
-        app_names = []
-        ls = [
-            x
-            for x in ls
-            if x["kCGWindowOwnerName"] not in app_names
-            and (app_names.append(x["kCGWindowOwnerName"]) or True)
-        ]
+        return objects
 
-    properties = {
-        "element": ls,
-    }
-    arr = XAApplicationList(properties)
-    return arr
+    @_xa_batched()
+    def insert(self, element: XAObject, index: int):
+        """Inserts the object referenced by the provided PyXA wrapper at the specified index.
 
+        .. versionadded:: 0.0.3
+        """
+        self.xa_elem.insertObject_atIndex_(element.xa_elem, index)
+        self.drop_indexes()
 
-SUPPORTED_BROWSERS = [
-    "Safari",
-    "Google Chrome",
-    "Google Chrome Canary",
-    "Google Chrome Beta",
-    "Google Chrome Dev",
-    "Chromium",
-    "Brave Browser",
-    "Brave Browser Dev",
-    "Brave Browser Beta",
-    "Brave Browser Nightly",
-    "Microsoft Edge",
-    "Microsoft Edge Beta",
-    "Microsoft Edge Dev",
-    "Microsoft Edge Canary",
-    "Opera",
-    "Opera Beta",
-    "Opera Developer",
-    "Opera GX",
-    "Opera Neon",
-    "Vivaldi",
-    "Blisk",
-    "Iridium",
-    "Yandex",
-    "Maxthon",
-    "Maxthon Beta",
-    "Arc",
-    "OmniWeb",
-]
-"""Browsers supported by PyXA, i.e. having dedicated PyXA Application classes.
-"""
+    @_xa_batched()
+    def pop(self, index: int = -1) -> XAObject:
+        """Removes the object at the specified index from the list and returns it.
 
+        .. versionadded:: 0.0.3
+        """
+        removed = self.xa_elem.lastObject()
+        self.xa_elem.removeLastObject()
+        self.drop_indexes()
+        return self._new_element(removed, self.xa_ocls)
 
-def active_browser() -> "XAApplication":
-    """Retrieves a PyXA representation of the most recently active browser application. The browser must have at least one open window. The browser must be one of the ones listed in :attr:`SUPPORTED_BROWSERS`.
+    def index(self, element: XAObject) -> int:
+        """Returns the index of the first occurrence of the element in the list, or -1 if no such element exists in the list.
 
-    :return: A PyXA application object referencing the current browser application.
-    :rtype: XAApplication
+        .. versionadded:: 0.1.2
+        """
+        for index, item in enumerate(self.xa_elem):
+            if item == element.xa_elem:
+                return index
 
-    .. versionadded:: 0.3.0
-    """
-    running_app_names = running_applications().localized_name()
-    for browser in running_app_names:
-        if browser in SUPPORTED_BROWSERS:
-            return Application(browser)
+        for index, item in enumerate(self):
+            if item == element:
+                return index
 
+        return -1
 
-class XAApplication(XAObject, XAClipboardCodable):
-    """A general application class for both officially scriptable and non-scriptable applications.
+    def count(self, count_function: Callable[[object], bool]) -> int:
+        """Counts the number of entries in the list for which the provided function is True.
 
-    .. versionadded:: 0.0.1
-    """
+        :param count_function: The function to check entries against
+        :type count_function: Callable[[object], bool]
+        :return: The number of entries for which the given function is True.
+        :rtype: int
 
-    def __init__(self, properties):
-        super().__init__(properties)
-        self.__xa_prcs = None
+        .. versionadded:: 0.1.0
+        """
+        count = 0
+        for index in range(len(self)):
+            in_count = False
+            try:
+                in_count = count_function(self.xa_elem[index])
+            except:
+                # TODO: Add logging message here
+                pass
 
-    @property
-    def xa_apsc(self):
-        import appscript
+            if not in_count:
+                try:
+                    in_count = count_function(self[index])
+                except:
+                    pass
 
-        return appscript.app(self.bundle_url.path())
+            if in_count:
+                count += 1
+        return count
 
-    @property
-    def xa_prcs(self):
-        if self.__xa_prcs == None:
-            processes = self.xa_sevt.processes()
-            self.__xa_prcs = processes.by_displayed_name(self.xa_elem.localizedName())
-        return self.__xa_prcs
+    def _xa_slice(self, key: slice) -> Any:
+        """Gets the sub-array of element references selected by a slice, without dereferencing the elements.
 
-    @property
-    def bundle_identifier(self) -> str:
-        """The bundle identifier for the application.
+        Contiguous slices use a single range-based sub-array; stepped slices select elements by index set. Slice bounds follow Python semantics, including negative and omitted bounds and negative steps.
 
-        .. versionadded:: 0.0.1
-        """
-        return self.xa_elem.bundleIdentifier()
+        Slices of element arrays are element arrays themselves, so bulk operations on the slice, e.g. :func:`fetch`, :func:`filter`, or :func:`set_property_all`, still send one request per property for the whole slice. ScriptingBridge does not expose range specifiers, so these requests target the elements of a slice of an SBElementArray by their IDs, with one whose clause per 200 elements, after retrieving the IDs of the parent array's elements once. Elements without a unique ID are accessed one at a time.
 
-    @property
-    def bundle_url(self) -> str:
-        """The file URL of the application bundle.
+        :param key: The slice to apply
+        :type key: slice
+        :return: The selected element references
+        :rtype: Any
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.3.1
         """
-        return self.xa_elem.bundleURL()
-
-    @property
-    def executable_url(self) -> str:
-        """The file URL of the application's executable.
+        start, stop, step = key.indices(XABackends.element_count(self.xa_elem))
+        if isinstance(self.xa_elem, ScriptingBridge.SBElementArray):
+            return _XAElementSlice(self.xa_elem, range(start, stop, step))
 
-        .. versionadded:: 0.0.1
-        """
-        return self.xa_elem.executableURL()
+        if step == 1:
+            return self.xa_elem.subarrayWithRange_((start, max(stop - start, 0)))
 
-    @property
-    def frontmost(self) -> bool:
-        """Whether the application is the active application.
+        indices = range(start, stop, step)
+        if isinstance(self.xa_elem, XABackends.XABackendArray):
+            # Backend arrays accept positions in any order
+            return self.xa_elem.objectsAtIndexes_(list(indices))
 
-        .. versionadded:: 0.0.1
-        """
-        return self.xa_elem.isActive()
+        index_set = AppKit.NSMutableIndexSet.alloc().init()
+        for index in indices:
+            index_set.addIndex_(index)
 
-    @frontmost.setter
-    def frontmost(self, frontmost: bool):
-        if frontmost is True:
-            self.xa_elem.activateWithOptions_(
-                AppKit.NSApplicationActivateIgnoringOtherApps
-            )
+        arr = self.xa_elem.objectsAtIndexes_(index_set)
+        if step < 0:
+            arr = arr.reverseObjectEnumerator().allObjects()
+        return arr
 
-    @property
-    def launch_date(self) -> datetime:
-        """The date and time that the application was launched.
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            return self._new_element(self._xa_slice(key), self.__class__)
+        if key < 0:
+            key = XABackends.element_count(self.xa_elem) + key
 
-        .. versionadded:: 0.0.1
-        """
-        return self.xa_elem.launchDate()
+        return self._new_element(
+            XABackends.element_at(self.xa_elem, key), self.xa_ocls
+        )
 
-    @property
-    def localized_name(self) -> str:
-        """The application's name.
+    def __len__(self):
+        return len(self.xa_elem)
 
-        .. versionadded:: 0.0.1
-        """
-        return self.xa_elem.localizedName()
+    def __reversed__(self):
+        self.xa_elem = self.xa_elem.reverseObjectEnumerator().allObjects()
+        self.drop_indexes()
+        return self
 
-    @property
-    def owns_menu_bar(self) -> bool:
-        """Whether the application owns the top menu bar.
+    def __iter__(self):
+        return (
+            self._new_element(object, self.xa_ocls)
+            for object in self.xa_elem.objectEnumerator()
+        )
 
-        .. versionadded:: 0.0.1
-        """
-        return self.xa_elem.ownsMenuBar()
-
-    @property
-    def process_identifier(self) -> str:
-        """The process identifier for the application instance.
+    def __contains__(self, item):
+        if isinstance(item, XAObject):
+            item = item.xa_elem
+        return item in self.xa_elem
 
-        .. versionadded:: 0.0.1
-        """
-        return self.xa_elem.processIdentifier()
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.xa_elem) + ">"
 
-    @property
-    def icon(self) -> "XAImage":
-        """The application's icon.
 
-        .. versionadded:: 0.1.1
-        """
-        return XAImage(self.xa_elem.icon())
+class XAListQuery:
+    """A lazy query on an :class:`XAList` that accumulates filters into one compound predicate.
 
-    def launch(self) -> "XAApplication":
-        """Launches the application.
+    Queries are created using :func:`XAList.query`. Filter methods return the query itself, so they can be chained. The accumulated predicate is evaluated once, by :func:`evaluate` or when the query is iterated, indexed, or measured, and the result is cached until another filter is added.
 
-        :return: The application object.
-        :rtype: XAApplication
+    .. versionadded:: 0.3.1
+    """
 
-        .. versionadded:: 0.1.1
-        """
-        config = AppKit.NSWorkspaceOpenConfiguration.alloc().init()
-        config.setActivates_(False)
-        config.setHides_(True)
+    def __init__(self, xa_list: XAList):
+        """Creates a new query on the given list.
 
-        finished_launching = False
+        :param xa_list: The list to filter
+        :type xa_list: XAList
 
-        def test(app, error):
-            nonlocal finished_launching
-            finished_launching = True
+        .. versionadded:: 0.3.1
+        """
+        self.xa_list = xa_list  #: The list that the query filters
+        self.__predicate = XAPredicate()
+        self.__formats: list[tuple[str, list[Any]]] = []
+        self.__result = None
 
-        self.xa_wksp.openApplicationAtURL_configuration_completionHandler_(
-            self.bundle_url, config, test
+    def __add_condition(
+        self, property: str, comparison_operation: str, value1: Any, value2: Any = None
+    ) -> "XAListQuery":
+        property, value1, value2 = self.xa_list._format_for_filter(
+            property, value1, value2
         )
-
-        while not finished_launching:
-            time.sleep(0.05)
-
+        self.__predicate.add_condition(property, comparison_operation, value1, value2)
+        self.__result = None
         return self
 
-    def activate(self) -> "XAApplication":
-        """Activates the application, bringing its window(s) to the front and launching the application beforehand if necessary.
-
-        :return: A reference to the PyXA application object.
-        :rtype: XAApplication
+    def __add_format(self, format: str, *args: Any) -> "XAListQuery":
+        self.__formats.append((format, list(args)))
+        self.__result = None
+        return self
 
-        .. seealso:: :func:`terminate`, :func:`unhide`, :func:`focus`
+    def equalling(self, property: str, value: Any) -> "XAListQuery":
+        """Restricts the query to elements whose property value equals the given value.
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.3.1
         """
-        if not self.xa_elem.isFinishedLaunching():
-            self.launch()
+        return self.__add_condition(property, "==", value)
 
-        if self.xa_elem.isHidden():
-            self.unhide()
+    def not_equalling(self, property: str, value: Any) -> "XAListQuery":
+        """Restricts the query to elements whose property value does not equal the given value.
 
-        self.xa_elem.activateWithOptions_(
-            AppKit.NSApplicationActivateAllWindows
-            | AppKit.NSApplicationActivateIgnoringOtherApps
-        )
-        return self
+        .. versionadded:: 0.3.1
+        """
+        return self.__add_condition(property, "!=", value)
 
-    def terminate(self) -> "XAApplication":
-        """Quits the application. Synonymous with quit().
+    def containing(self, property: str, value: Any) -> "XAListQuery":
+        """Restricts the query to elements whose property value contains the given value.
 
-        :return: A reference to the PyXA application object.
-        :rtype: XAApplication
+        .. versionadded:: 0.3.1
+        """
+        return self.__add_condition(property, "contains", value)
 
-        :Example:
+    def not_containing(self, property: str, value: Any) -> "XAListQuery":
+        """Restricts the query to elements whose property value does not contain the given value.
 
-        >>> import PyXA
-        >>> safari = PyXA.Application("Safari")
-        >>> safari.terminate()
+        .. versionadded:: 0.3.1
+        """
+        property, value, _ = self.xa_list._format_for_filter(property, value)
+        return self.__add_format(f"NOT {property} CONTAINS %@", value)
 
-        .. seealso:: :func:`quit`, :func:`activate`
+    def beginning_with(self, property: str, value: Any) -> "XAListQuery":
+        """Restricts the query to elements whose property value begins with the given value.
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.3.1
         """
-        self.xa_elem.terminate()
-        return self
+        return self.__add_condition(property, "begins with", value)
 
-    def quit(self) -> "XAApplication":
-        """Quits the application. Synonymous with terminate().
+    def ending_with(self, property: str, value: Any) -> "XAListQuery":
+        """Restricts the query to elements whose property value ends with the given value.
 
-        :return: A reference to the PyXA application object.
-        :rtype: XAApplication
+        .. versionadded:: 0.3.1
+        """
+        return self.__add_condition(property, "ends with", value)
 
-        :Example:
+    def greater_than(self, property: str, value: Union[int, float]) -> "XAListQuery":
+        """Restricts the query to elements whose property value is greater than the given value.
 
-        >>> import PyXA
-        >>> safari = PyXA.Application("Safari")
-        >>> safari.quit()
+        .. versionadded:: 0.3.1
+        """
+        return self.__add_condition(property, ">", value)
 
-        .. seealso:: :func:`terminate`, :func:`activate`
+    def less_than(self, property: str, value: Union[int, float]) -> "XAListQuery":
+        """Restricts the query to elements whose property value is less than the given value.
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.3.1
         """
-        self.xa_elem.terminate()
-        return self
+        return self.__add_condition(property, "<", value)
 
-    def hide(self) -> "XAApplication":
-        """Hides all windows of the application.
+    def between(
+        self, property: str, value1: Union[int, float], value2: Union[int, float]
+    ) -> "XAListQuery":
+        """Restricts the query to elements whose property value is between the given values.
 
-        :return: A reference to the PyXA application object.
-        :rtype: XAApplication
+        .. versionadded:: 0.3.1
+        """
+        self.__add_condition(property, ">", value1)
+        return self.__add_condition(property, "<", value2)
 
-        :Example:
+    def exists(self, property: str) -> "XAListQuery":
+        """Restricts the query to elements for which the given property has a value.
 
-        >>> import PyXA
-        >>> safari = PyXA.Application("Safari")
-        >>> safari.hide()
+        .. versionadded:: 0.3.1
+        """
+        property, _, _ = self.xa_list._format_for_filter(property, None)
+        return self.__add_format(f"{property} != nil")
 
-        .. seealso:: :func:`unhide`
+    def not_exists(self, property: str) -> "XAListQuery":
+        """Restricts the query to elements for which the given property has no value.
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.3.1
         """
-        self.xa_elem.hide()
-        return self
+        property, _, _ = self.xa_list._format_for_filter(property, None)
+        return self.__add_format(f"{property} == nil")
 
-    def unhide(self) -> "XAApplication":
-        """Unhides (reveals) all windows of the application, but does not does not activate them.
+    def filter(
+        self,
+        filter: str,
+        comparison_operation: Union[str, None] = None,
+        value1: Union[Any, None] = None,
+        value2: Union[Any, None] = None,
+    ) -> "XAListQuery":
+        """Restricts the query using the same parameters as :func:`XAList.filter`, i.e. either a predicate format string or a property name, comparison operation, and up to two values.
 
-        :return: A reference to the PyXA application object.
-        :rtype: XAApplication
+        .. versionadded:: 0.3.1
+        """
+        if comparison_operation is not None:
+            if comparison_operation.lower() == "exists":
+                return self.exists(filter)
+            elif comparison_operation.lower() in ["not exists", "!exists", "nonexistent"]:
+                return self.not_exists(filter)
 
-        :Example:
+        if comparison_operation is not None and value1 is not None:
+            return self.__add_condition(filter, comparison_operation, value1, value2)
+        return self.__add_format(filter)
 
-        >>> import PyXA
-        >>> safari = PyXA.Application("Safari")
-        >>> safari.unhide()
+    def predicate(self) -> "AppKit.NSPredicate":
+        """Constructs the compound predicate representing all filters added to the query.
 
-        .. seealso:: :func:`hide`
+        :return: The compound predicate
+        :rtype: AppKit.NSPredicate
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.3.1
         """
-        self.xa_elem.unhide()
-        return self
+        formats = [
+            " ".join((key, operator, "%@"))
+            for key, operator in zip(self.__predicate.keys, self.__predicate.operators)
+        ]
+        args = list(self.__predicate.values)
 
-    def focus(self) -> "XAApplication":
-        """Hides the windows of all applications except this one.
+        for format, format_args in self.__formats:
+            formats.append(format)
+            args.extend(format_args)
 
-        :return: A reference to the PyXA application object.
-        :rtype: XAApplication
+        if len(formats) == 0:
+            return AppKit.NSPredicate.predicateWithValue_(True)
 
-        :Example:
+        format = "( " + " ) && ( ".join(formats) + " )"
+        return AppKit.NSPredicate.predicateWithFormat_argumentArray_(format, args)
 
-        >>> import PyXA
-        >>> safari = PyXA.Application("Safari")
-        >>> safari.focus()
+    def explain(self) -> str:
+        """Gets the format string of the compound predicate that the query will evaluate.
 
-        .. seealso:: :func:`unfocus`
+        :return: The predicate format string
+        :rtype: str
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.3.1
         """
-        for app in self.xa_wksp.runningApplications():
-            if app.localizedName() != self.xa_elem.localizedName():
-                app.hide()
-            else:
-                app.unhide()
-        return self
+        return str(self.predicate().predicateFormat())
 
-    def unfocus(self) -> "XAApplication":
-        """Unhides (reveals) the windows of all other applications, but does not activate them.
+    def evaluate(self) -> XAList:
+        """Evaluates the query, filtering the list in a single pass.
 
-        :return: A reference to the PyXA application object.
-        :rtype: XAApplication
+        :return: A list of the same type as the queried list containing the matching elements
+        :rtype: XAList
 
-        :Example:
+        .. versionadded:: 0.3.1
+        """
+        if self.__result is None:
+            predicate = self.predicate()
+            target = self.xa_list.xa_elem
 
-        >>> import PyXA
-        >>> safari = PyXA.Application("Safari")
-        >>> safari.unfocus()
+            try:
+                # Mirrors XAPredicate.evaluate -- round-tripping the format is sometimes necessary
+                ls = XABackends.filtered_elements(
+                    target, AppKit.NSPredicate.predicateWithFormat_(str(predicate))
+                )
+            except ValueError:
+                ls = XABackends.filtered_elements(target, predicate)
+            self.__result = self.xa_list._new_element(ls, self.xa_list.__class__)
+        return self.__result
 
-        .. seealso:: :func:`focus`
+    def by_property(self, property: str, value: Any) -> Union[XAObject, None]:
+        """Evaluates the query with an additional equality condition and retrieves the first matching element, if one exists.
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.3.1
         """
-        for app in self.xa_wksp.runningApplications():
-            app.unhide()
-        return self
+        result = self.copy().equalling(property, value).evaluate()
+        if len(result) == 0:
+            return None
+        return result.first
 
-    def _get_processes(self, processes):
-        for process in self.xa_sevt.processes():
-            processes.append(process)
+    def copy(self) -> "XAListQuery":
+        """Creates a copy of the query, such that filters added to the copy do not affect this query.
 
-    def windows(self, filter: dict = None) -> XAList:
-        return self.xa_prcs.windows(filter)
+        :return: The new query
+        :rtype: XAListQuery
 
-    @property
-    def front_window(self) -> XAObject:
-        """The frontmost window of the application."""
-        return self.xa_prcs.front_window
+        .. versionadded:: 0.3.1
+        """
+        query = XAListQuery(self.xa_list)
+        query.__predicate.keys.extend(self.__predicate.keys)
+        query.__predicate.operators.extend(self.__predicate.operators)
+        query.__predicate.values.extend(self.__predicate.values)
+        query.__formats.extend(self.__formats)
+        return query
 
-    def menu_bars(self, filter: dict = None) -> XAList:
-        return self.xa_prcs.menu_bars(filter)
+    def __getitem__(self, key: Union[int, slice]):
+        return self.evaluate()[key]
 
-    def get_clipboard_representation(
-        self,
-    ) -> list[Union[str, "AppKit.NSURL", "AppKit.NSImage"]]:
-        """Gets a clipboard-codable representation of the application.
+    def __len__(self):
+        return len(self.evaluate())
 
-        When the clipboard content is set to an application, three items are placed on the clipboard:
-        1. The application's name
-        2. The URL to the application bundle
-        3. The application icon
+    def __iter__(self):
+        return iter(self.evaluate())
 
-        After copying an application to the clipboard, pasting will have the following effects:
-        - In Finder: Paste a copy of the application bundle in the current directory
-        - In Terminal: Paste the name of the application followed by the path to the application
-        - In iWork: Paste the application name
-        - In Safari: Paste the application name
-        - In Notes: Attach a copy of the application bundle to the active note
-        The pasted content may be different for other applications.
+    def __repr__(self):
+        return "<" + str(type(self)) + self.explain() + ">"
 
-        :return: The clipboard-codable representation
-        :rtype: list[Union[str, AppKit.NSURL, AppKit.NSImage]]
 
-        .. versionadded:: 0.0.8
-        """
-        return [
-            self.xa_elem.localizedName(),
-            self.xa_elem.bundleURL(),
-            self.xa_elem.icon(),
-        ]
+class XAListGroupBy:
+    """A grouping of the elements of an :class:`XAList` by the values of one or more properties.
 
-    def __getattr__(self, attr):
-        attributes = [
-            x
-            for y in [
-                cls.__dict__.keys()
-                for cls in self.__class__.__mro__
-                if cls.__name__ != "object"
-            ]
-            for x in y
-        ]
-        if attr in attributes:
-            # If possible, use PyXA attribute
-            return super().__getattribute__(attr)
-        else:
-            # Otherwise, fall back to appscript
-            return getattr(self.xa_apsc, attr)
+    Groupings are created using :func:`XAList.group_by`.
 
+    .. note::
 
-######################
-### PyXA Utilities ###
-######################
-class AppleScript:
-    """A class for constructing and executing AppleScript scripts.
+       Aggregation requires NumPy to be installed.
 
-    .. versionadded:: 0.0.5
+    .. versionadded:: 0.3.1
     """
 
-    def __init__(self, script: Union[str, list[str], None] = None):
-        """Creates a new AppleScript object.
+    AGGREGATIONS = [
+        "count",
+        "sum",
+        "mean",
+        "min",
+        "max",
+        "first",
+        "last",
+    ]  #: The names of supported aggregation functions
 
-        :param script: A string or list of strings representing lines of AppleScript code, or the path to a script plaintext file, defaults to None
-        :type script: Union[str, list[str], None], optional
+    def __init__(self, xa_list: XAList, keys: tuple[str, ...]):
+        """Creates a new grouping of the given list.
 
-        .. versionadded:: 0.0.5
-        """
-        self.script: list[str]  #: The lines of AppleScript code contained in the script
-        self.last_result: Any  #: The return value of the last execution of the script
-        self.file_path: XAPath  #: The file path of this script, if one exists
+        :param xa_list: The list to group
+        :type xa_list: XAList
+        :param keys: The names of the properties to group by
+        :type keys: tuple[str, ...]
 
-        if isinstance(script, str):
-            if script.startswith("/"):
-                with open(script, "r") as f:
-                    script = f.readlines()
-            else:
-                script_text = re.sub(r"[ \t]+", " ", script)
-                script_text = re.sub(r"[\n\r]+", "\n", script_text)
-                self.script = script_text.split("\n")
-        elif isinstance(script, list):
-            self.script = script
-        elif script == None:
-            self.script = []
+        .. versionadded:: 0.3.1
+        """
+        if len(keys) == 0:
+            raise ValueError("At least one property must be specified.")
 
-    @property
-    def last_result(self) -> Any:
-        return self.__last_result
+        self.xa_list = xa_list  #: The grouped list
+        self.keys = list(keys)  #: The names of the properties that elements are grouped by
 
-    @property
-    def file_path(self) -> "XAPath":
-        return self.__file_path
+    def agg(self, **aggregations: Union[str, list[str]]) -> dict[str, "numpy.ndarray"]:
+        """Aggregates property values within each group.
 
-    def add(self, script: Union[str, list[str], "AppleScript"]):
-        """Adds the supplied string, list of strings, or script as a new line entry in the script.
+        All grouping and aggregated properties are retrieved in a single call to :func:`XAList.fetch`, and values are aggregated per group using vectorized NumPy operations. Missing values are ignored by all aggregations. Groups without any values aggregate to `NaN` for numeric properties, `NaT` for dates, and None for other values.
 
-        :param script: The script to append to the current script string.
-        :type script: Union[str, list[str], AppleScript]
+        :param aggregations: Property names mapped to the name of an aggregation function in :attr:`AGGREGATIONS`, or a list of such names. When a list is given, the resulting columns are named `<property>_<function>`.
+        :type aggregations: Union[str, list[str]]
+        :return: A dictionary with one array per grouping property containing the distinct values of that property, in order of first appearance, and one array per aggregation containing the aggregated value for each group
+        :rtype: dict[str, numpy.ndarray]
 
         :Example:
 
         >>> import PyXA
-        >>> script = PyXA.AppleScript("tell application \"Safari\"")
-        >>> script.add("print the document of window 1")
-        >>> script.add("end tell")
-        >>> script.run()
+        >>> app = PyXA.Music()
+        >>> stats = app.tracks().group_by("artist", "album").agg(duration=["sum", "mean"], played_count="max")
+        >>> print(list(stats.keys()))
+        ['artist', 'album', 'duration_sum', 'duration_mean', 'played_count']
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.3.1
         """
-        if isinstance(script, str):
-            self.script.append(script)
-        elif isinstance(script, list):
-            self.script.extend(script)
-        elif isinstance(script, AppleScript):
-            self.script.extend(script.script)
+        import numpy
 
-    def insert(self, index: int, script: Union[str, list[str], "AppleScript"]):
-        """Inserts the supplied string, list of strings, or script as a line entry in the script starting at the given line index.
+        requested = []
+        for field, functions in aggregations.items():
+            if isinstance(functions, str):
+                requested.append((field, functions, field))
+            else:
+                requested.extend(
+                    (field, function, f"{field}_{function}") for function in functions
+                )
 
-        :param index: The line index to begin insertion at
-        :type index: int
-        :param script: The script to insert into the current script
-        :type script: Union[str, list[str], AppleScript]
+        for _, function, _ in requested:
+            if function not in XAListGroupBy.AGGREGATIONS:
+                raise ValueError(f"Unknown aggregation function: {function}")
 
-        :Example:
+        fields = list(dict.fromkeys(self.keys + [field for field, _, _ in requested]))
+        columns = self.xa_list.fetch(fields)
 
-        >>> import PyXA
-        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
-        >>> script.insert(1, "activate")
-        >>> script.run()
+        # Assign each element a group code in order of first appearance
+        group_codes: dict[Any, int] = {}
+        group_values = []
+        if len(self.keys) == 1:
+            key_rows = ((x,) for x in columns[self.keys[0]])
+        else:
+            key_rows = zip(*[columns[key] for key in self.keys])
+
+        codes = numpy.empty(len(columns[self.keys[0]]), dtype=numpy.int64)
+        for position, row in enumerate(key_rows):
+            hashable_row = _xa_hashable(row)
+            code = group_codes.get(hashable_row)
+            if code is None:
+                code = len(group_values)
+                group_codes[hashable_row] = code
+                group_values.append(row)
+            codes[position] = code
+
+        num_groups = len(group_values)
+        result = {}
+        for index, key in enumerate(self.keys):
+            result[key] = _xa_to_ndarray([row[index] for row in group_values])
+
+        for field, function, name in requested:
+            result[name] = self.__aggregate(
+                numpy, columns[field], codes, num_groups, function
+            )
+        return result
 
-        .. versionadded:: 0.0.9
-        """
-        if isinstance(script, str):
-            self.script.insert(index, script)
-        elif isinstance(script, list):
-            for line in script:
-                self.script.insert(index, line)
-                index += 1
-        elif isinstance(script, AppleScript):
-            for line in script.script:
-                self.script.insert(index, line)
-                index += 1
+    def __aggregate(
+        self,
+        numpy,
+        values: list[Any],
+        codes: "numpy.ndarray",
+        num_groups: int,
+        function: str,
+    ) -> "numpy.ndarray":
+        present = numpy.fromiter(
+            (value is not None for value in values), dtype=bool, count=len(values)
+        )
 
-    def pop(self, index: int = -1) -> str:
-        """Removes the line at the given index from the script.
+        if function == "count":
+            return numpy.bincount(codes[present], minlength=num_groups)
+
+        if function in ("first", "last"):
+            positions = numpy.nonzero(present)[0]
+            if function == "first":
+                # Later positions are overwritten by earlier ones when assigning in reverse
+                positions = positions[::-1]
+            selected = numpy.full(num_groups, -1, dtype=numpy.int64)
+            selected[codes[positions]] = positions
+            missing = selected < 0
+            array = _xa_to_ndarray(values)
+            if missing.any() and array.dtype.kind in ("b", "i", "u"):
+                # Groups without any values are NaN, so the column cannot stay integral
+                array = array.astype(numpy.float64)
+            elif missing.any() and array.dtype.kind in ("U", "S"):
+                array = array.astype(object)
+
+            output = array[numpy.maximum(selected, 0)]
+            if array.dtype.kind == "f":
+                output[missing] = numpy.nan
+            elif array.dtype.kind == "M":
+                output[missing] = numpy.datetime64("NaT")
+            elif array.dtype == object:
+                output[missing] = None
+            return output
+
+        array = _xa_to_ndarray(values)
+        if array.dtype.kind in ("b", "i", "u", "f"):
+            numbers = array.astype(numpy.float64)
+            counts = numpy.bincount(codes[present], minlength=num_groups)
+            if function in ("sum", "mean"):
+                sums = numpy.bincount(
+                    codes[present], weights=numbers[present], minlength=num_groups
+                )
+                if function == "sum":
+                    return sums
+                with numpy.errstate(invalid="ignore", divide="ignore"):
+                    return sums / counts
+
+            ufunc = numpy.minimum if function == "min" else numpy.maximum
+            output = numpy.full(
+                num_groups, numpy.inf if function == "min" else -numpy.inf
+            )
+            ufunc.at(output, codes[present], numbers[present])
+            output[counts == 0] = numpy.nan
+            return output
 
-        :param index: The index of the line to remove
-        :type index: int
-        :return: The text of the removed line
-        :rtype: str
+        if function in ("sum", "mean"):
+            raise TypeError(f"Cannot compute the {function} of non-numeric values.")
 
-        :Example:
+        # Dates, strings, and other comparable values
+        output = [None] * num_groups
+        select = min if function == "min" else max
+        for code, value, is_present in zip(codes, array, present):
+            if is_present:
+                current = output[code]
+                output[code] = value if current is None else select(current, value)
+        return numpy.array(output, dtype=array.dtype)
 
-        >>> import PyXA
-        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
-        >>> print(script.pop(1))
-            get chats
 
-        .. versionadded:: 0.0.9
-        """
-        return self.script.pop(index)
+class XAListSnapshot:
+    """A snapshot of the values of selected properties of every element in an :class:`XAList`, keyed by a unique identifier property.
 
-    def load(path: Union["XAPath", str]) -> "AppleScript":
-        """Loads an AppleScript (.scpt) file as a runnable AppleScript object.
+    Snapshots are created using :func:`XAList.snapshot`. Each record is stored alongside a BLAKE2 digest of the types and representations of its values, and :func:`diff` treats records with equal digests as unchanged without comparing their values, so unchanged records cost one digest comparison each. Only records with different digests are compared field by field. Keys must be unique within the list.
 
-        :param path: The path of the .scpt file to load
-        :type path: Union[XAPath, str]
-        :return: The newly loaded AppleScript object
-        :rtype: AppleScript
+    .. versionadded:: 0.3.1
+    """
 
-        :Example 1: Load and run a script
+    def __init__(self, xa_list: XAList, key: str, fields: list[str]):
+        """Captures a new snapshot of the given list.
+
+        :param xa_list: The list to capture
+        :type xa_list: XAList
+        :param key: The name of the property that uniquely identifies each element
+        :type key: str
+        :param fields: The names of the properties to capture
+        :type fields: list[str]
+        :raises ValueError: Two or more elements share the same key
+
+        .. versionadded:: 0.3.1
+        """
+        self.key = key  #: The name of the property that uniquely identifies each element
+        self.fields = [field for field in fields if field != key]  #: The names of the captured properties
+        self.timestamp = datetime.now()  #: The date and time that the snapshot was captured
+
+        columns = xa_list.fetch([key] + self.fields)
+        rows = zip(*[columns[field] for field in self.fields])
+        if len(self.fields) == 0:
+            rows = ((),) * len(columns[key])
+
+        self.__rows: dict[Any, tuple] = {}
+        self.__digests: dict[Any, bytes] = {}
+        for row_key, row in zip(columns[key], rows):
+            row_key = _xa_hashable(row_key)
+            if row_key in self.__rows:
+                raise ValueError(
+                    f"The {key!r} property does not uniquely identify elements, since {row_key!r} occurs more than once."
+                )
+            self.__rows[row_key] = row
+            self.__digests[row_key] = self.__digest(row)
 
-        >>> import PyXA
-        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
-        >>> print(script.run())
-        {
-            'string': None,
-            'int': 0,
-            'bool': False,
-            'float': 0.0,
-            'date': None,
-            'file_url': None,
-            'type_code': 845507684,
-            'data': {length = 8962, bytes = 0x646c6532 00000000 6c697374 000022f2 ... 6e756c6c 00000000 },
-            'event': <NSAppleEventDescriptor: [ 'obj '{ ... } ]>
-        }
+    @staticmethod
+    def __digest(row: tuple) -> bytes:
+        # Unlike hash(), a 128-bit digest makes collisions negligible, so equal digests can be trusted
+        digest = hashlib.blake2b(digest_size=16)
+        for value in row:
+            digest.update(f"{type(value).__qualname__}:{value!r}\0".encode())
+        return digest.digest()
 
-        :Example 2: Load, modify, and run a script
+    def record(self, key: Any) -> dict[str, Any]:
+        """Gets the captured values of the element with the given key.
 
-        >>> import PyXA
-        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
-        >>> script.pop(1)
-        >>> script.insert(1, "activate")
-        >>> script.run()
+        :param key: The key of the element
+        :type key: Any
+        :return: A dictionary mapping property names to captured values
+        :rtype: dict[str, Any]
 
-        .. versionadded:: 0.0.8
+        .. versionadded:: 0.3.1
         """
-        if isinstance(path, str):
-            path = XAPath(path)
-        script = AppKit.NSAppleScript.alloc().initWithContentsOfURL_error_(
-            path.xa_elem, None
-        )[0]
-        script_text = re.sub(r"[ \t]+", " ", str(script.richTextSource().string()))
-        script_text = re.sub(r"[\n\r]+", "\n", script_text)
-        script = AppleScript(script_text.split("\n"))
-        script.__file_path = path
-        return script
-
-    def save(self, path: Union["XAPath", str, None] = None):
-        """Saves the script to the specified file path, or to the path from which the script was loaded.
-
-        :param path: The path to save the script at, defaults to None
-        :type path: Union[XAPath, str, None], optional
-
-        :Example 1: Save the script to a specified path
-
-        >>> import PyXA
-        >>> script = PyXA.AppleScript(f\"\"\"
-        >>>     tell application "Safari"
-        >>>         activate
-        >>>     end tell
-        >>> \"\"\")
-        >>> script.save("/Users/exampleUser/Downloads/Example.scpt")
+        return dict(zip(self.fields, self.__rows[key]))
 
-        :Example 2: Load a script, modify it, then save it
+    def diff(self, previous: "XAListSnapshot") -> XASnapshotDiff:
+        """Compares this snapshot to an earlier snapshot of the same list.
 
-        >>> import PyXA
-        >>> script = PyXA.AppleScript.load("/Users/steven/Downloads/Example.scpt")
-        >>> script.insert(2, "delay 2")
-        >>> script.insert(3, "set the miniaturized of window 1 to true")
-        >>> script.save()
+        :param previous: The earlier snapshot
+        :type previous: XAListSnapshot
+        :return: The records that were added, removed, or changed since the earlier snapshot
+        :rtype: XASnapshotDiff
 
-        .. versionadded:: 0.0.9
+        .. versionadded:: 0.3.1
         """
-        if path is None and self.file_path is None:
-            print("No path to save script to!")
-            return
+        if previous.key != self.key or previous.fields != self.fields:
+            raise ValueError("Snapshots must capture the same key and fields.")
 
-        if isinstance(path, str):
-            path = XAPath(path)
+        current_digests = self.__digests
+        previous_digests = previous.__digests
 
-        script = ""
-        for line in self.script:
-            script += line + "\n"
-        script = AppKit.NSAppleScript.alloc().initWithSource_(script)
-        script.compileAndReturnError_(None)
-        source = script.richTextSource().string()
+        added = {
+            key: self.record(key)
+            for key in current_digests
+            if key not in previous_digests
+        }
+        removed = {
+            key: previous.record(key)
+            for key in previous_digests
+            if key not in current_digests
+        }
 
-        if path is not None:
-            self.__file_path = path
+        changed = {}
+        for key, digest in current_digests.items():
+            previous_digest = previous_digests.get(key)
+            if previous_digest is None or previous_digest == digest:
+                continue
+
+            # Values whose representations differ between captures, e.g. by memory address, can still be equal
+            fields = {
+                field: (old_value, new_value)
+                for field, old_value, new_value in zip(
+                    self.fields, previous.__rows[key], self.__rows[key]
+                )
+                if _xa_hashable(old_value) != _xa_hashable(new_value)
+            }
+            if fields:
+                changed[key] = fields
 
-        with open(self.file_path.xa_elem.path(), "w") as f:
-            f.write(source)
+        return XASnapshotDiff(added, removed, changed)
 
-    def parse_result_data(result: dict) -> list[tuple[str, str]]:
-        """Extracts string data from an AppleScript execution result dictionary.
+    def keys(self) -> list[Any]:
+        """Gets the keys of all elements in the snapshot.
 
-        :param result: The execution result dictionary to extract data from
-        :type result: dict
-        :return: A list of responses contained in the result structured as tuples
-        :rtype: list[tuple[str, str]]
+        :return: The list of keys
+        :rtype: list[Any]
 
-        :Example:
+        .. versionadded:: 0.3.1
+        """
+        return list(self.__rows.keys())
 
-        >>> import PyXA
-        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
-        >>> print(script.script)
-        >>> result = script.run()
-        >>> print(PyXA.AppleScript.parse_result_data(result))
-        ['tell application "Messages"', '\\tget chats', 'end tell']
-        [('ID', 'iMessage;-;+12345678910'), ('ID', 'iMessage;-;+12345678911'), ('ID', 'iMessage;-;example@icloud.com'), ...]
+    def __getitem__(self, key: Any) -> dict[str, Any]:
+        return self.record(key)
 
-        .. versionadded:: 0.0.9
-        """
-        result = result["event"]
-        response_objects = []
-        num_responses = result.numberOfItems()
-        for response_index in range(1, num_responses + 1):
-            response = result.descriptorAtIndex_(response_index)
+    def __contains__(self, key: Any) -> bool:
+        return key in self.__rows
 
-            data = ()
-            num_params = response.numberOfItems()
-            if num_params == 0:
-                data = response.stringValue().strip()
+    def __len__(self):
+        return len(self.__rows)
 
-            else:
-                for param_index in range(1, num_params + 1):
-                    param = response.descriptorAtIndex_(param_index).stringValue()
-                    if param is not None:
-                        data += (param.strip(),)
-            response_objects.append(data)
+    def __repr__(self):
+        return (
+            "<"
+            + str(type(self))
+            + f"{len(self)} records of {[self.key] + self.fields} at {self.timestamp}>"
+        )
 
-        return response_objects
 
-    def run(self, args: list = None, dry_run=False) -> Any:
-        """Compiles and runs the script, returning the result.
+class XAApplicationList(XAList):
+    """A wrapper around a list of applications.
 
-        :param args: A list of arguments to pass to the script, defaults to None
-        :type args: list, optional
-        :param dry_run: Whether to compile and check the script without running it, defaults to False
-        :type dry_run: bool, optional
-        :return: The return value of the script.
-        :rtype: Any
+    .. versionadded:: 0.0.5
+    """
 
-        :Example 1: Basic Script Execution
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, XAApplication, filter)
 
-        >>> import PyXA
-        >>> script = PyXA.AppleScript(f\"\"\"tell application "System Events"
-        >>>     return 1 + 2
-        >>> end tell
-        >>> \"\"\")
-        >>> print(script.run())
-        {
-            'string': '3',
-            'int': 3,
-            'bool': False,
-            'float': 3.0,
-            'date': None,
-            'file_url': None,
-            'type_code': 3,
-            'data': {length = 4, bytes = 0x03000000},
-            'event': <NSAppleEventDescriptor: 3>
-        }
+        if filter is not None:
+            self.xa_elem = XAPredicate().from_dict(filter).evaluate(self.xa_elem)
 
-        :Example 2: Run Script With Arguments
+    def first(self) -> XAObject:
+        """Retrieves the first element of the list as a wrapped PyXA application object.
 
-        >>> import PyXA
-        >>> script = PyXA.AppleScript(f\"\"\"on run argv
-        >>>     set x to item 1 of argv
-        >>>     set y to item 2 of argv
-        >>>     return x + y
-        >>> end run\"\"\")
-        >>> print(script.run([5, 6]))
-        {'
-            string': '11',
-            'int': 11,
-            'bool': False,
-            'float': 11.0,
-            'date': None,
-            'file_url': None,
-            'type_code': 11,
-            'data': {length = 4, bytes = 0x0b000000},
-            'event': <NSAppleEventDescriptor: 11>
-        }
+        :return: The wrapped object
+        :rtype: XAObject
 
         .. versionadded:: 0.0.5
         """
-        script = ""
-        for line in self.script:
-            if line.startswith("on run "):
-                argv_specifier = line.split("on run ")[1].strip()
-                script += "on run" + "\n"
+        return self.__getitem__(0)
 
-                if args is not None:
-                    if type(args) is not list:
-                        args = [args]
+    def last(self) -> XAObject:
+        """Retrieves the last element of the list as a wrapped PyXA application object.
 
-                    args = [str(x) for x in args]
+        :return: The wrapped object
+        :rtype: XAObject
 
-                    script += (
-                        "set " + argv_specifier + ' to {"' + '", "'.join(args) + '"}\n'
-                    )
-                else:
-                    script += "set " + argv_specifier + " to {}\n"
-            else:
-                script += line + "\n"
+        .. versionadded:: 0.0.5
+        """
+        return self.__getitem__(-1)
 
-        full_script = AppKit.NSAppleScript.alloc().initWithSource_(script)
-        if dry_run:
-            status = full_script.compileAndReturnError_(None)
-            if status[1] is not None:
-                raise AppleScriptError(status[1], script)
-            return status[0]
+    def pop(self, index: int = -1) -> XAObject:
+        """Removes the application at the specified index from the list and returns it.
 
-        result = full_script.executeAndReturnError_(None)
-        if result[1] is not None:
-            raise AppleScriptError(result[1], script)
+        .. versionadded:: 0.0.5
+        """
+        removed = self.xa_elem.lastObject()
+        self.xa_elem.removeLastObject()
+        app_name = removed["kCGWindowOwnerName"]
+        return Application(app_name)
 
-        result = result[0]
-        string_result = result.stringValue()
-        if string_result is not None:
-            string_result = string_result.replace("\r", "\n")
+    def __getitem__(self, key: Union[int, slice]):
+        """Retrieves the wrapped application object(s) at the specified key."""
+        if isinstance(key, slice):
+            return self._new_element(self._xa_slice(key), self.__class__)
+        app_name = self.xa_elem[key]["kCGWindowOwnerName"]
+        return Application(app_name)
 
-        if result is not None:
-            self.__last_result = {
-                "string": string_result,
-                "int": result.int32Value(),
-                "bool": result.booleanValue(),
-                "float": result.doubleValue(),
-                "date": result.dateValue(),
-                "file_url": result.fileURLValue(),
-                "type_code": result.typeCodeValue(),
-                "data": result.data(),
-                "event": result,
-            }
-            return self.last_result
+    def bundle_identifier(self) -> list[str]:
+        return [app.bundle_identifier for app in self]
 
-    def __repr__(self):
-        return "<" + str(type(self)) + str(self.script) + ">"
+    def bundle_url(self) -> list["XAURL"]:
+        return [XAURL(app.bundle_url) for app in self]
 
+    def executable_url(self) -> list["XAURL"]:
+        return [XAURL(app.executable_url) for app in self]
 
-class XAPredicate(XAObject, XAClipboardCodable):
-    """A predicate used to filter arrays.
+    def launch_date(self) -> list[datetime]:
+        return [app.launch_date for app in self]
 
-    .. versionadded:: 0.0.4
-    """
+    def localized_name(self) -> list[str]:
+        return [x.get("kCGWindowOwnerName") for x in self.xa_elem]
 
-    def __init__(self):
-        self.keys: list[str] = []
-        self.operators: list[str] = []
-        self.values: list[str] = []
+    def process_identifier(self) -> list[str]:
+        return [x.get("kCGWindowOwnerPID") for x in self.xa_elem]
 
-    def from_dict(self, ref_dict: dict) -> "XAPredicate":
-        """Populates the XAPredicate object from the supplied dictionary.
+    def by_bundle_identifier(
+        self, bundle_identifier: str
+    ) -> Union["XAApplication", None]:
+        for app in self:
+            if app.bundle_identifier == bundle_identifier:
+                return app
 
-        The predicate will use == for all comparisons.
+    def by_bundle_url(
+        self, bundle_url: Union["XAURL", str]
+    ) -> Union["XAApplication", None]:
+        if isinstance(bundle_url, str):
+            bundle_url = XAURL(bundle_url)
 
-        :param ref_dict: A specification of key, value pairs
-        :type ref_dict: dict
-        :return: The populated predicate object
-        :rtype: XAPredicate
+        for app in self:
+            if app.bundle_url.xa_elem == bundle_url.xa_elem:
+                return app
 
-        .. versionadded:: 0.0.4
-        """
-        for key, value in ref_dict.items():
-            self.keys.append(key)
-            self.operators.append("==")
-            self.values.append(value)
-        return self
+    def by_executable_url(
+        self, executable_url: Union["XAURL", str]
+    ) -> Union["XAApplication", None]:
+        if isinstance(executable_url, str):
+            executable_url = XAURL(executable_url)
 
-    def from_args(self, *args) -> "XAPredicate":
-        """Populates the XAPredicate object from the supplied key, value argument pairs.
+        for app in self:
+            if app.executable_url.xa_elem == executable_url.xa_elem:
+                return app
 
-        The number of keys and values must be equal. The predicate will use == for all comparisons.
+    def by_launch_date(self, launch_date: datetime) -> Union["XAApplication", None]:
+        for app in self:
+            if app.launch_date == launch_date:
+                return app
 
-        :raises InvalidPredicateError: Raised when the number of keys does not match the number of values
-        :return: The populated predicate object
-        :rtype: XAPredicate
+    def by_localized_name(self, localized_name: str) -> Union["XAApplication", None]:
+        for index, app in enumerate(self.xa_elem):
+            if app.get("kCGWindowOwnerName") == localized_name:
+                return self.__getitem__(index)
 
-        .. versionadded:: 0.0.4
-        """
-        arg_num = len(args)
-        if arg_num % 2 != 0:
-            raise InvalidPredicateError(
-                "The number of keys and values must be equal; the number of arguments must be an even number."
-            )
+    def by_process_identifier(
+        self, process_identifier: str
+    ) -> Union["XAApplication", None]:
+        for index, app in enumerate(self.xa_elem):
+            if app.get("kCGWindowOwnerPID") == process_identifier:
+                return self.__getitem__(index)
 
-        for index, value in enumerate(args):
-            if index % 2 == 0:
-                self.keys.append(value)
-                self.operators.append("==")
-                self.values.append(args[index + 1])
-        return self
+    def hide(self):
+        """Hides all applications in the list.
 
-    def evaluate(self, target: Union["AppKit.NSArray", XAList]) -> "AppKit.NSArray":
-        """Evaluates the predicate on the given array.
+        :Example 1: Hide all visible running applications
 
-        :param target: The array to evaluate against the predicate
-        :type target: AppKit.NSArray
-        :return: The filtered array
-        :rtype: AppKit.NSArray
+        >>> import PyXA
+        >>> apps = PyXA.running_applications()
+        >>> apps.hide()
 
-        .. versionadded:: 0.0.4
+        .. seealso:: :func:`unhide`
+
+        .. versionadded:: 0.0.5
         """
-        target_list = target
-        if isinstance(target, XAList):
-            target_list = target.xa_elem
+        for app in self:
+            app.hide()
 
-        placeholders = ["%@"] * len(self.values)
-        expressions = [
-            " ".join(expr) for expr in zip(self.keys, self.operators, placeholders)
-        ]
-        format = "( " + " ) && ( ".join(expressions) + " )"
+    def unhide(self):
+        """Unhides all applications in the list.
 
-        ls = []
-        predicate = AppKit.NSPredicate.predicateWithFormat_(format, *self.values)
+        :Example 1: Hide then unhide all visible running applications
 
-        try:
-            # Not sure why this is necessary sometimes, but it is.
-            ls = target_list.filteredArrayUsingPredicate_(
-                AppKit.NSPredicate.predicateWithFormat_(str(predicate))
-            )
-        except ValueError:
-            ls = target_list.filteredArrayUsingPredicate_(predicate)
+        >>> import PyXA
+        >>> apps = PyXA.running_applications()
+        >>> apps.hide()
+        >>> apps.unhide()
 
-        if isinstance(target, XAList):
-            return target.__class__(
-                {
-                    "parent": target,
-                    "element": ls,
-                    "appref": self.xa_aref,
-                }
-            )
-        return ls
+        .. seealso:: :func:`hide`
 
-    def evaluate_with_format(
-        target: Union["AppKit.NSArray", XAList], fmt: str, *fmt_parameters
-    ) -> "AppKit.NSArray":
-        """Evaluates the specified array against a predicate with the given format.
+        .. versionadded:: 0.0.5
+        """
+        for app in self:
+            app.unhide()
 
-        :param target: The array to filter
-        :type target: AppKit.NSArray
-        :param fmt: The format string for the predicate
-        :type fmt: str
-        :param fmt_parameters: The parameters for the format string
-        :type fmt_parameters: Any
-        :return: The filtered array
-        :rtype: AppKit.NSArray
+    def terminate(self):
+        """Quits (terminates) all applications in the list. Synonymous with :func:`quit`.
 
-        .. versionchanged:: 0.3.0
+        :Example 1: Terminate all visible running applications
 
-            Added the :attr:`fmt_parameters` parameter.
+        >>> import PyXA
+        >>> apps = PyXA.running_applications()
+        >>> apps.terminate()
 
-        .. versionadded:: 0.0.4
+        .. versionadded:: 0.0.5
         """
-        target_list = target
-        if isinstance(target, XAList):
-            target_list = target.xa_elem
-
-        predicate = AppKit.NSPredicate.predicateWithFormat_argumentArray_(
-            fmt, fmt_parameters
-        )
-        ls = target_list.filteredArrayUsingPredicate_(predicate)
-
-        if isinstance(target, XAList):
-            return target.__class__(
-                {
-                    "parent": target,
-                    "element": ls,
-                    "appref": AppKit.NSApplication.sharedApplication(),
-                }
-            )
-        return ls
+        for app in self:
+            app.terminate()
 
-    def evaluate_with_dict(
-        target: Union["AppKit.NSArray", XAList], properties_dict: dict
-    ) -> "AppKit.NSArray":
-        """Evaluates the specified array against a predicate constructed from the supplied dictionary.
+    def quit(self):
+        """Quits (terminates) all applications in the list. Synonymous with :func:`terminate`.
 
-        The predicate will use == for all comparisons.
+        :Example 1: Quit all visible running applications
 
-        :param target: The array to filter
-        :type target: AppKit.NSArray
-        :param properties_dict: The specification of key, value pairs
-        :type properties_dict: dict
-        :return: The filtered array
-        :rtype: AppKit.NSArray
+        >>> import PyXA
+        >>> apps = PyXA.running_applications()
+        >>> apps.quit()
 
-        .. versionadded:: 0.0.4
+        .. versionadded:: 0.0.5
         """
-        target_list = target
-        if isinstance(target, XAList):
-            target_list = target.xa_elem
-
-        fmt = ""
-        for key, value in properties_dict.items():
-            if isinstance(value, str):
-                value = "'" + value + "'"
-            fmt += f"( {key} == {value} ) &&"
+        for app in self:
+            app.terminate()
 
-        predicate = AppKit.NSPredicate.predicateWithFormat_(fmt[:-3])
-        ls = target_list.filteredArrayUsingPredicate_(predicate)
+    def windows(self) -> "XAList":
+        """Retrieves a list of every window belonging to each application in the list.
 
-        if isinstance(target, XAList):
-            return target.__class__(
-                {
-                    "parent": target,
-                    "element": ls,
-                    "appref": AppKit.NSApplication.sharedApplication(),
-                }
-            )
-        return ls
+        Operations on the list of windows will specialized to scriptable and non-scriptable application window operations as necessary.
 
-    # EQUAL
-    def add_eq_condition(self, property: str, value: Any):
-        """Appends an `==` condition to the end of the predicate format.
+        :return: A list containing both scriptable and non-scriptable windows
+        :rtype: XAList
 
-        The added condition will have the form `property == value`.
+        :Example:
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        >>> import PyXA
+        >>> windows = PyXA.running_applications().windows()
+        >>> windows.collapse()
+        >>> sleep(1)
+        >>> windows.uncollapse()
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.append(property)
-        self.operators.append("==")
-        self.values.append(value)
+        .. versionchanged 0.1.2
 
-    def insert_eq_condition(self, index: int, property: str, value: Any):
-        """Inserts an `==` condition to the predicate format at the desired location, specified by index.
+            Now returns an instance of :class:`PyXA.apps.SystemEvents.XASystemEventsWindowList`
 
-        The added condition will have the form `property == value`.
+        .. versionchanged:: 0.1.1
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+           Now returns an instance of :class:`XAWindowList` instead of :class:`XACombinedWindowList`.
 
-        .. versionadded:: 0.0.4
+        .. versionadded:: 0.0.5
         """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "==")
-        self.values.insert(index, value)
-
-    # NOT EQUAL
-    def add_neq_condition(self, property: str, value: Any):
-        """Appends a `!=` condition to the end of the predicate format.
+        return self.xa_sevt.processes().windows()
 
-        The added condition will have the form `property != value`.
+    def __iter__(self):
+        return (
+            Application(object["kCGWindowOwnerName"])
+            for object in self.xa_elem.objectEnumerator()
+        )
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+    def __contains__(self, item):
+        if isinstance(item, XAApplication):
+            return item.process_identifier in self.process_identifier()
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.append(property)
-        self.operators.append("!=")
-        self.values.append(value)
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.localized_name()) + ">"
 
-    def insert_neq_condition(self, index: int, property: str, value: Any):
-        """Inserts a `!=` condition to the predicate format at the desired location, specified by index.
 
-        The added condition will have the form `property != value`.
+class XAApplicationIndex:
+    """A persistent index of the application bundles on the disk, used to resolve application names and bundle identifiers to paths.
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+    The index is stored as JSON in the user's cache directory. When loaded, only the application folders whose modification dates have changed since the last scan are rescanned. Folders are checked again before an unknown application is looked up. Applications outside of the indexed folders are located using Spotlight on demand and then added to the index, and identifiers that Spotlight does not find are not searched for again until the index is rebuilt.
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "!=")
-        self.values.insert(index, value)
+    .. versionadded:: 0.3.1
+    """
 
-    # GREATER THAN OR EQUAL
-    def add_geq_condition(self, property: str, value: Any):
-        """Appends a `>=` condition to the end of the predicate format.
+    folders: list[str] = [
+        "/Applications",
+        "/System/Applications",
+        "/System/Library/CoreServices",
+        "~/Applications",
+    ]  #: The folders to scan for application bundles
 
-        The added condition will have the form `property >= value`.
+    def __init__(self, path: Union[str, None] = None):
+        """Creates a new application index.
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        :param path: The path of the JSON file to store the index in, defaults to ~/Library/Caches/PyXA/app_index.json
+        :type path: Union[str, None], optional
 
-        .. versionadded:: 0.0.4
+        .. versionadded:: 0.3.1
         """
-        self.keys.append(property)
-        self.operators.append(">=")
-        self.values.append(value)
+        self.path = path or os.path.expanduser(
+            "~/Library/Caches/PyXA/app_index.json"
+        )  #: The path of the JSON file that the index is stored in
+        self.__lock = threading.Lock()
+        self.__loaded = False
+        self.__directories: dict[str, Union[float, None]] = {}
+        self.__not_found: set[str] = set()
+        self.__apps: dict[str, dict[str, Any]] = {}
+        self.__by_name: dict[str, str] = {}
+        self.__by_bundle_id: dict[str, str] = {}
 
-    def insert_geq_condition(self, index: int, property: str, value: Any):
-        """Inserts a `>=` condition to the predicate format at the desired location, specified by index.
+    def find(self, app_identifier: str) -> str:
+        """Gets the path to the application with the given name, bundle identifier, or path.
 
-        The added condition will have the form `property >= value`.
+        Exact matches of the application's name or bundle identifier are resolved in constant time. Otherwise, the last indexed path containing the identifier is used.
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        :param app_identifier: The name, bundle identifier, or path of the application
+        :type app_identifier: str
+        :raises ApplicationNotFoundError: The application could not be found
+        :return: The path to the application bundle
+        :rtype: str
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, ">=")
-        self.values.insert(index, value)
+        :Example:
 
-    # LESS THAN OR EQUAL
-    def add_leq_condition(self, property: str, value: Any):
-        """Appends a `<=` condition to the end of the predicate format.
+        >>> import PyXA
+        >>> print(PyXA.Application.app_index.find("numbers"))
+        /Applications/Numbers.app
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            self.__refresh()
+            path = self.__match(app_identifier)
+            if path is not None and not os.path.exists(path):
+                # The app was removed since it was indexed
+                del self.__apps[path]
+                self.__rebuild_lookups()
+                self.__save()
+                path = self.__match(app_identifier)
+
+            if path is None:
+                # The app may have been installed in an indexed folder since it was last checked
+                self.__refresh(check_folders=True)
+                path = self.__match(app_identifier)
+
+            if path is None and app_identifier.lower() not in self.__not_found:
+                # Fall back to Spotlight for apps outside of the indexed folders
+                if self.__search_spotlight():
+                    self.__save()
+                path = self.__match(app_identifier)
+                if path is None:
+                    self.__not_found.add(app_identifier.lower())
+
+        if path is None:
+            raise ApplicationNotFoundError(app_identifier)
+        return path
+
+    def paths(self) -> list[str]:
+        """Gets the path to each indexed application.
+
+        :return: The list of paths
+        :rtype: list[str]
 
-        The added condition will have the form `property <= value`.
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            self.__refresh()
+            return list(self.__apps.keys())
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+    def rebuild(self):
+        """Discards the index and rescans all application folders.
 
-        .. versionadded:: 0.0.4
+        .. versionadded:: 0.3.1
         """
-        self.keys.append(property)
-        self.operators.append("<=")
-        self.values.append(value)
+        with self.__lock:
+            self.__directories = {}
+            self.__not_found = set()
+            self.__apps = {}
+            self.__by_name = {}
+            self.__loaded = True
+            self.__refresh()
 
-    def insert_leq_condition(self, index: int, property: str, value: Any):
-        """Inserts a `<=` condition to the predicate format at the desired location, specified by index.
+    def __match(self, app_identifier: str) -> Union[str, None]:
+        if app_identifier.startswith("/") and app_identifier in self.__apps:
+            return app_identifier
 
-        The added condition will have the form `property <= value`.
+        app_identifier_l = app_identifier.lower()
+        path = self.__by_name.get(app_identifier_l) or self.__by_bundle_id.get(
+            app_identifier_l
+        )
+        if path is not None:
+            return path
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        candidate = None
+        for path in self.__apps:
+            if app_identifier_l in path.lower():
+                candidate = path
+        return candidate
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "<=")
-        self.values.insert(index, value)
+    def __refresh(self, check_folders: bool = False):
+        if not self.__loaded:
+            self.__loaded = True
+            try:
+                with open(self.path, "r") as file:
+                    data = json.load(file)
+                self.__directories = data["directories"]
+                self.__apps = data["apps"]
+            except (OSError, ValueError, KeyError):
+                self.__directories = {}
+                self.__apps = {}
+        elif self.__by_name and not check_folders:
+            # Folders are checked once when the index is loaded, then only when a lookup misses
+            return
 
-    # GREATER THAN
-    def add_gt_condition(self, property: str, value: Any):
-        """Appends a `>` condition to the end of the predicate format.
+        changed = False
+        for folder in self.folders:
+            folder = os.path.expanduser(folder)
+            if folder not in self.__directories:
+                changed |= self.__scan(folder)
 
-        The added condition will have the form `property > value`.
+        for directory, mtime in list(self.__directories.items()):
+            try:
+                current_mtime = os.stat(directory).st_mtime
+            except OSError:
+                current_mtime = None
+            if current_mtime != mtime:
+                changed |= self.__scan(directory)
+
+        if changed or not self.__by_name:
+            self.__rebuild_lookups()
+        if changed:
+            self.__save()
+
+    def __scan(self, directory: str) -> bool:
+        # Rescans the directory, returning whether the index changed
+        removed = [path for path in self.__apps if os.path.dirname(path) == directory]
+        for path in removed:
+            del self.__apps[path]
+
+        top_level = directory in [os.path.expanduser(x) for x in self.folders]
+        try:
+            mtime = os.stat(directory).st_mtime
+            entries = list(os.scandir(directory))
+        except OSError:
+            if not top_level:
+                self.__directories.pop(directory, None)
+                return True
+
+            # Record missing folders so that they are not rescanned until they appear
+            changed = (
+                len(removed) > 0 or self.__directories.get(directory, 0) is not None
+            )
+            self.__directories[directory] = None
+            return changed
+
+        self.__directories[directory] = mtime
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+
+            if entry.name.endswith(".app"):
+                self.__add(entry.path)
+            elif (
+                top_level
+                and not entry.name.startswith(".")
+                and entry.path not in self.__directories
+            ):
+                # Scan one level of nested folders, e.g. /Applications/Utilities
+                self.__scan(entry.path)
+        return True
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+    def __add(self, path: str):
+        bundle_id = None
+        try:
+            with open(os.path.join(path, "Contents", "Info.plist"), "rb") as file:
+                bundle_id = plistlib.load(file).get("CFBundleIdentifier")
+        except Exception:
+            pass
+
+        self.__apps[path] = {
+            "name": os.path.basename(path)[:-4],
+            "bundle_id": bundle_id,
+        }
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.append(property)
-        self.operators.append(">")
-        self.values.append(value)
+    def __search_spotlight(self) -> bool:
+        search = XASpotlight()
+        search.predicate = "kMDItemContentType == 'com.apple.application-bundle'"
+        new_paths = [
+            x.path for x in search.results if x.path not in self.__apps
+        ]
+        for path in new_paths:
+            self.__add(path)
+        self.__rebuild_lookups()
+        return len(new_paths) > 0
+
+    def __rebuild_lookups(self):
+        self.__by_name = {}
+        self.__by_bundle_id = {}
+        for path, info in self.__apps.items():
+            # Keep the first path found for each name, matching the original search order
+            self.__by_name.setdefault(path.lower(), path)
+            self.__by_name.setdefault(info["name"].lower(), path)
+            if info["bundle_id"] is not None:
+                self.__by_bundle_id.setdefault(info["bundle_id"].lower(), path)
+
+    def __save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w") as file:
+                json.dump(
+                    {"directories": self.__directories, "apps": self.__apps}, file
+                )
+            os.replace(temp_path, self.path)
+        except OSError:
+            # The index will be rebuilt on the next run
+            pass
 
-    def insert_gt_condition(self, index: int, property: str, value: Any):
-        """Inserts a `>` condition to the predicate format at the desired location, specified by index.
+    def __repr__(self):
+        return "<" + str(type(self)) + self.path + ">"
 
-        The added condition will have the form `property > value`.
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+class Application(XAObject):
+    """A wrapper around a macOS application providing access to its scripting functionality.
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, ">")
-        self.values.insert(index, value)
+    .. versionchanged:: 0.1.1
 
-    # LESS THAN
-    def add_lt_condition(self, property: str, value: Any):
-        """Appends a `<` condition to the end of the predicate format.
+       Moved into the XABase module.
 
-        The added condition will have the form `property < value`.
+    .. versionadded:: 0.1.0
+    """
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+    app_paths: list[str] = []  #: A list containing the path to each application
+    app_index = XAApplicationIndex()  #: The persistent index used to locate applications on the disk
+    launch_timeout: float = 30  #: The maximum amount of time in seconds to wait for an application to launch
+
+    __registry: dict[str, "XAApplication"] = {}
+    __registry_lock = threading.Lock()
+    __termination_observer = None
+
+    def __new__(cls, app_name: str, fresh: bool = False):
+        # Reuse the live application object, along with its scripting bridge connection, if one exists
+        if not fresh and XABackends.backend_for(app_name) is None:
+            app = Application.__registered(app_name)
+            if app is not None:
+                return app
+        return super().__new__(cls)
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.append(property)
-        self.operators.append("<")
-        self.values.append(value)
+    def __init__(self, app_name: str, fresh: bool = False):
+        """Creates a new application object.
 
-    def insert_lt_condition(self, index: int, property: str, value: Any):
-        """Inserts a `<` condition to the predicate format at the desired location, specified by index.
+        Application objects are reused across calls for as long as the application's process is running.
 
-        The added condition will have the form `property < value`.
+        :param app_name: The name of the target application
+        :type app_name: str
+        :param fresh: Whether to create a new application object instead of reusing an existing one, defaults to False
+        :type fresh: bool, optional
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        .. versionchanged:: 0.3.1
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "<")
-        self.values.insert(index, value)
+           Added the `fresh` parameter. Existing application objects are now reused when possible.
 
-    # BETWEEN
-    def add_between_condition(
-        self, property: str, value1: Union[int, float], value2: Union[int, float]
-    ):
-        """Appends a `BETWEEN` condition to the end of the predicate format.
+        .. versionadded:: 0.1.0
+        """
+        if self.__dict__.get("_xa_initialized", False):
+            # A reused application object returned by __new__
+            return
 
-        The added condition will have the form `property BETWEEN [value1, value2]`.
+        # Elevate to XAApplication
+        new_self = self.__get_application(app_name)
+        self.__class__ = new_self.__class__
+        self.__dict__.update(new_self.__dict__)
+        Application.__register(app_name, self)
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value1: The lower target value of the condition
-        :type value1: Union[int, float]
-        :param value2: The upper target value of the condition
-        :type value2: Union[int, float]
+    @staticmethod
+    def clear_registry():
+        """Discards all reused application objects, so that subsequent calls to :class:`Application` create new objects.
 
-        .. versionadded:: 0.0.4
+        .. versionadded:: 0.3.1
         """
-        self.keys.append(property)
-        self.operators.append("BETWEEN")
-        self.values.append([value1, value2])
+        with Application.__registry_lock:
+            Application.__registry.clear()
 
-    def insert_between_condition(
-        self,
-        index: int,
-        property: str,
-        value1: Union[int, float],
-        value2: Union[int, float],
-    ):
-        """Inserts a `BETWEEN` condition to the predicate format at the desired location, specified by index.
+    @staticmethod
+    def __is_alive(app: "XAApplication") -> bool:
+        running_app = app.xa_elem
+        if not isinstance(running_app, AppKit.NSRunningApplication):
+            return False
 
-        The added condition will have the form `property BETWEEN [value1, value2]`.
+        current_app = (
+            AppKit.NSRunningApplication.runningApplicationWithProcessIdentifier_(
+                running_app.processIdentifier()
+            )
+        )
+        return (
+            current_app is not None
+            and current_app.bundleIdentifier() == running_app.bundleIdentifier()
+        )
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value1: The lower target value of the condition
-        :type value1: Union[int, float]
-        :param value2: The upper target value of the condition
-        :type valu2e: Union[int, float]
+    @staticmethod
+    def __registered(app_name: str) -> Union["XAApplication", None]:
+        with Application.__registry_lock:
+            app = Application.__registry.get(app_name.lower())
+            if app is not None and Application.__is_alive(app):
+                return app
+        return None
+
+    @staticmethod
+    def __register(app_name: str, app: "XAApplication"):
+        app._xa_initialized = True
+        with Application.__registry_lock:
+            if Application.__termination_observer is None:
+                global workspace
+                if workspace is None:
+                    workspace = AppKit.NSWorkspace.sharedWorkspace()
+
+                Application.__termination_observer = workspace.notificationCenter().addObserverForName_object_queue_usingBlock_(
+                    AppKit.NSWorkspaceDidTerminateApplicationNotification,
+                    None,
+                    None,
+                    Application.__application_terminated,
+                )
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "BETWEEN")
-        self.values.insert(index, [value1, value2])
+            Application.__registry[app_name.lower()] = app
+            bundle_identifier = app.xa_elem.bundleIdentifier()
+            if bundle_identifier is not None:
+                Application.__registry[bundle_identifier.lower()] = app
 
-    # BEGINSWITH
-    def add_begins_with_condition(self, property: str, value: Any):
-        """Appends a `BEGINSWITH` condition to the end of the predicate format.
+    @staticmethod
+    def __application_terminated(notification):
+        terminated_app = notification.userInfo()[AppKit.NSWorkspaceApplicationKey]
+        pid = terminated_app.processIdentifier()
+        with Application.__registry_lock:
+            for key, app in list(Application.__registry.items()):
+                if app.xa_elem.processIdentifier() == pid:
+                    del Application.__registry[key]
 
-        The added condition will have the form `property BEGINSWITH value`.
+    def __get_application(self, app_identifier: str) -> "XAApplication":
+        """Retrieves a PyXA application object representation of the target application without launching or activating the application.
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        :param app_identifier: The name of the application to get an object of.
+        :type app_identifier: str
+        :return: A PyXA application object referencing the target application.
+        :rtype: XAApplication
 
-        .. versionadded:: 0.0.4
+        .. versionchanged:: 0.3.1
+
+           Applications with an installed backend are wrapped around the backend's objects.
+
+        .. versionadded:: 0.0.1
         """
-        self.keys.append(property)
-        self.operators.append("BEGINSWITH")
-        self.values.append(value)
+        backend = XABackends.backend_for(app_identifier)
+        if backend is not None:
+            app = Application.__wrap_running_application(
+                app_identifier, backend.running_application(app_identifier)
+            )
+            app.xa_scel = backend.scripting_application(app_identifier)
+            return app
 
-    def insert_begins_with_condition(self, index: int, property: str, value: Any):
-        """Inserts a `BEGINSWITH` condition to the predicate format at the desired location, specified by index.
+        global workspace
+        if workspace is None:
+            workspace = AppKit.NSWorkspace.sharedWorkspace()
 
-        The added condition will have the form `property BEGINSWITH value`.
+        app = Application.__running_application(app_identifier)
+        if app is not None:
+            return Application.__wrap_running_application(app_identifier, app)
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        url = Application.__url_for_application(app_identifier)
+        launched = threading.Event()
+        result = None
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "BEGINSWITH")
-        self.values.insert(index, value)
+        def _launch_completion_handler(app, _error):
+            nonlocal result
+            result = app
+            launched.set()
 
-    # ENDSWITH
-    def add_ends_with_condition(self, property: str, value: Any):
-        """Appends a `ENDSWITH` condition to the end of the predicate format.
+        workspace.openApplicationAtURL_configuration_completionHandler_(
+            url, Application.__launch_configuration(), _launch_completion_handler
+        )
 
-        The added condition will have the form `property ENDSWITH value`.
+        # The completion handler is called on a background queue, so no run loop is needed
+        if not launched.wait(Application.launch_timeout):
+            raise TimeoutError(
+                f"{app_identifier} did not launch within {Application.launch_timeout} seconds"
+            )
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        if result is None:
+            raise ApplicationNotFoundError(app_identifier)
+        return Application.__wrap_running_application(app_identifier, result)
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.append(property)
-        self.operators.append("ENDSWITH")
-        self.values.append(value)
+    @staticmethod
+    async def launch_async(
+        app_name: str, timeout: float = 30, fresh: bool = False
+    ) -> "XAApplication":
+        """Launches an application, if necessary, without blocking the running event loop.
 
-    def insert_ends_with_condition(self, index: int, property: str, value: Any):
-        """Inserts a `ENDSWITH` condition to the predicate format at the desired location, specified by index.
+        Applications that are already running are returned without being launched again, so their visibility is left unchanged.
 
-        The added condition will have the form `property ENDSWITH value`.
+        :param app_name: The name, bundle identifier, or path of the target application
+        :type app_name: str
+        :param timeout: The maximum amount of time in seconds to wait for the application to finish launching, defaults to 30
+        :type timeout: float, optional
+        :param fresh: Whether to create a new application object instead of reusing an existing one, defaults to False
+        :type fresh: bool, optional
+        :raises ApplicationNotFoundError: The application could not be found
+        :raises TimeoutError: The application was not found and launched within the timeout
+        :return: A PyXA application object referencing the target application
+        :rtype: XAApplication
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        :Example: Launch several applications concurrently
 
-        .. versionadded:: 0.0.4
+        >>> import asyncio
+        >>> import PyXA
+        >>>
+        >>> async def main():
+        ...     return await asyncio.gather(
+        ...         PyXA.Application.launch_async("Numbers"),
+        ...         PyXA.Application.launch_async("Pages"),
+        ...     )
+        >>>
+        >>> print(asyncio.run(main()))
+        [<<class 'PyXA.apps.Numbers.XANumbersApplication'>Numbers>, <<class 'PyXA.apps.Pages.XAPagesApplication'>Pages>]
+
+        .. versionadded:: 0.3.1
         """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "ENDSWITH")
-        self.values.insert(index, value)
+        import asyncio
 
-    # CONTAINS
-    def add_contains_condition(self, property: str, value: Any):
-        """Appends a `CONTAINS` condition to the end of the predicate format.
+        if XABackends.backend_for(app_name) is not None:
+            return Application(app_name, fresh)
 
-        The added condition will have the form `property CONTAINS value`.
+        if not fresh:
+            app = Application.__registered(app_name)
+            if app is not None:
+                return app
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        global workspace
+        if workspace is None:
+            workspace = AppKit.NSWorkspace.sharedWorkspace()
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.append(property)
-        self.operators.append("CONTAINS")
-        self.values.append(value)
+        # Launching a running application would apply the launch configuration to it, hiding it
+        running_app = Application.__running_application(app_name)
+        if running_app is not None:
+            app = Application.__wrap_running_application(app_name, running_app)
+            Application.__register(app_name, app)
+            return app
+
+        loop = asyncio.get_running_loop()
+        launched = loop.create_future()
+
+        def _set_result(app, error):
+            if launched.done():
+                return
+            if app is None:
+                launched.set_exception(ApplicationNotFoundError(app_name))
+            else:
+                launched.set_result(app)
 
-    def insert_contains_condition(self, index: int, property: str, value: Any):
-        """Inserts a `CONTAINS` condition to the predicate format at the desired location, specified by index.
+        def _launch_completion_handler(app, error):
+            try:
+                loop.call_soon_threadsafe(_set_result, app, error)
+            except RuntimeError:
+                # The launch finished after the event loop closed, e.g. following a timeout
+                pass
 
-        The added condition will have the form `property CONTAINS value`.
+        def _open_application():
+            # Resolving the application may scan the disk, so it runs off of the event loop
+            workspace.openApplicationAtURL_configuration_completionHandler_(
+                Application.__url_for_application(app_name),
+                Application.__launch_configuration(),
+                _launch_completion_handler,
+            )
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        async def _launch():
+            await loop.run_in_executor(None, _open_application)
+            return await launched
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "CONTAINS")
-        self.values.insert(index, value)
+        try:
+            running_app = await asyncio.wait_for(_launch(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"{app_name} did not launch within {timeout} seconds"
+            ) from None
+
+        app = Application.__wrap_running_application(app_name, running_app)
+        Application.__register(app_name, app)
+        return app
+
+    @staticmethod
+    def __running_application(
+        app_identifier: str,
+    ) -> Union["AppKit.NSRunningApplication", None]:
+        app_identifier_l = app_identifier.lower()
 
-    # MATCHES
-    def add_match_condition(self, property: str, value: Any):
-        """Appends a `MATCHES` condition to the end of the predicate format.
+        def _match_open_app(obj, index, stop):
+            res = obj.localizedName().lower() == app_identifier_l
+            return res, res
 
-        The added condition will have the form `property MATCHES value`.
+        running_apps = workspace.runningApplications()
+        idx_set = running_apps.indexesOfObjectsPassingTest_(_match_open_app)
+        if idx_set.count() == 1:
+            return running_apps[idx_set.firstIndex()]
+        return None
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+    @staticmethod
+    def __url_for_application(app_identifier: str) -> "AppKit.NSURL":
+        app_path = app_identifier
+        if not app_identifier.startswith("/"):
+            app_path = Application.app_index.find(app_identifier)
+            if Application.app_paths == []:
+                Application.app_paths = Application.app_index.paths()
+        bundle = AppKit.NSBundle.alloc().initWithPath_(app_path)
+        if bundle is None:
+            raise ApplicationNotFoundError(app_identifier)
+        return workspace.URLForApplicationWithBundleIdentifier_(
+            bundle.bundleIdentifier()
+        )
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.append(property)
-        self.operators.append("MATCHES")
-        self.values.append(value)
+    @staticmethod
+    def __launch_configuration() -> "AppKit.NSWorkspaceOpenConfiguration":
+        config = AppKit.NSWorkspaceOpenConfiguration.alloc().init()
+        config.setActivates_(False)
+        config.setHides_(True)
+        return config
 
-    def insert_match_condition(self, index: int, property: str, value: Any):
-        """Inserts a `MATCHES` condition to the predicate format at the desired location, specified by index.
+    @staticmethod
+    def __wrap_running_application(
+        app_identifier: str, app: "AppKit.NSRunningApplication"
+    ) -> "XAApplication":
+        app_identifier_l = app_identifier.lower()
+        properties = {
+            "parent": None,
+            "element": app,
+            "appref": app,
+        }
 
-        The added condition will have the form `property MATCHES value`.
+        app_obj = application_classes.get(app_identifier_l, XAApplication)
+        if isinstance(app_obj, tuple):
+            module = importlib.import_module("PyXA.apps." + app_obj[0])
+            app_class = getattr(module, app_obj[1], None)
+            if app_class is not None:
+                application_classes[app_identifier_l] = app_class
+            else:
+                raise NotImplementedError()
 
-        :param property: A property of an object to check the condition against
-        :type property: str
-        :param value: The target value of the condition
-        :type value: Any
+        # Check if the app is supported by PyXA
+        return application_classes.get(app_identifier_l, XAApplication)(properties)
 
-        .. versionadded:: 0.0.4
-        """
-        self.keys.insert(index, property)
-        self.operators.insert(index, "MATCHES")
-        self.values.insert(index, value)
 
-    def get_clipboard_representation(self) -> str:
-        """Gets a clipboard-codable representation of the predicate.
+def current_application() -> "XAApplication":
+    """Retrieves a PyXA representation of the frontmost application.
 
-        When a predicate is copied to the clipboard, the string representation of the predicate is added to the clipboard.
+    :return: A PyXA application object referencing the current application.
+    :rtype: XAApplication
 
-        :return: The string representation of the predicate
-        :rtype: str
+    .. versionchanged:: 0.1.1
 
-        .. versionadded:: 0.0.8
-        """
-        placeholders = ["%@"] * len(self.values)
-        expressions = [
-            " ".join(expr) for expr in zip(self.keys, self.operators, placeholders)
-        ]
-        format = "( " + " ) && ( ".join(expressions) + " )"
-        predicate = AppKit.NSPredicate.predicateWithFormat_(format, *self.values)
-        return predicate.predicateFormat()
+       Moved into the XABase module.
 
+    .. versionadded:: 0.0.1
+    """
+    global workspace
+    if workspace is None:
+        workspace = AppKit.NSWorkspace.sharedWorkspace()
+    return Application(workspace.frontmostApplication().localizedName())
 
-class XAURLList(XAList):
-    """A list of URLs. Supports bulk operations.
 
-    .. versionadded:: 0.1.2
-    """
+def running_applications(unique=True) -> list["XAApplication"]:
+    """Gets PyXA references to all currently visible (not hidden or minimized) running applications whose app bundles are stored in typical application directories. Applications are ordered by their z-index, with the frontmost application first.
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, XAURL, filter)
+    :param unique: Whether to return only one instance of each application, defaults to True
+    :type unique: bool, optional
+    :return: A list of PyXA application objects.
+    :rtype: list[XAApplication]
 
-    def base_url(self) -> list[str]:
-        return [url.base_url for url in self]
+    :Example 1: Get the name of each running application
 
-    def parameters(self) -> list[str]:
-        return [url.parameters for url in self]
+    >>> import PyXA
+    >>> apps = PyXA.running_applications()
+    >>> print(apps.localized_name())
+    ['GitHub Desktop', 'Safari', 'Code', 'Terminal', 'Notes', 'Messages', 'TV']
 
-    def scheme(self) -> list[str]:
-        return [url.scheme for url in self]
+    .. versionchanged:: 0.3.0
 
-    def fragment(self) -> list[str]:
-        return [url.fragment for url in self]
+        Added the :attr:`unique` parameter.
 
-    def port(self) -> list[int]:
-        return [url.port for url in self]
+    .. versionadded:: 0.0.1
+    """
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly, Quartz.kCGNullWindowID
+    )
+    ls = XAPredicate.evaluate_with_format(windows, "kCGWindowLayer == 0")
 
-    def html(self) -> list[element.Tag]:
-        return [url.html for url in self]
+    # Filter list to unique applications
+    if unique:
+        app_names = []
+        ls = [
+            x
+            for x in ls
+            if x["kCGWindowOwnerName"] not in app_names
+            and (app_names.append(x["kCGWindowOwnerName"]) or True)
+        ]
 
-    def title(self) -> list[str]:
-        return [url.title for url in self]
+    properties = {
+        "element": ls,
+    }
+    arr = XAApplicationList(properties)
+    return arr
 
-    def open(self):
-        """Opens each URL in the list.
 
-        .. versionadded:: 0.1.2
-        """
-        for url in self:
-            url.open()
+SUPPORTED_BROWSERS = [
+    "Safari",
+    "Google Chrome",
+    "Google Chrome Canary",
+    "Google Chrome Beta",
+    "Google Chrome Dev",
+    "Chromium",
+    "Brave Browser",
+    "Brave Browser Dev",
+    "Brave Browser Beta",
+    "Brave Browser Nightly",
+    "Microsoft Edge",
+    "Microsoft Edge Beta",
+    "Microsoft Edge Dev",
+    "Microsoft Edge Canary",
+    "Opera",
+    "Opera Beta",
+    "Opera Developer",
+    "Opera GX",
+    "Opera Neon",
+    "Vivaldi",
+    "Blisk",
+    "Iridium",
+    "Yandex",
+    "Maxthon",
+    "Maxthon Beta",
+    "Arc",
+    "OmniWeb",
+]
+"""Browsers supported by PyXA, i.e. having dedicated PyXA Application classes.
+"""
 
-    def extract_text(self) -> list[list[str]]:
-        """Extracts the visible text of each URL in the list.
 
-        .. versionadded:: 0.1.2
-        """
-        ls = [url.extract_text() for url in self]
-        return ls
+def active_browser() -> "XAApplication":
+    """Retrieves a PyXA representation of the most recently active browser application. The browser must have at least one open window. The browser must be one of the ones listed in :attr:`SUPPORTED_BROWSERS`.
 
-    def extract_images(self) -> list[list["XAImage"]]:
-        """Extracts the images of each URL in the list.
+    :return: A PyXA application object referencing the current browser application.
+    :rtype: XAApplication
 
-        .. versionadded:: 0.1.2
-        """
-        ls = [url.extract_images() for url in self]
-        return ls
+    .. versionadded:: 0.3.0
+    """
+    running_app_names = running_applications().localized_name()
+    for browser in running_app_names:
+        if browser in SUPPORTED_BROWSERS:
+            return Application(browser)
 
 
-class XAURL(XAObject, XAClipboardCodable):
-    """A URL using any scheme recognized by the system. This can be a file URL.
+class XAApplication(XAObject, XAClipboardCodable):
+    """A general application class for both officially scriptable and non-scriptable applications.
 
-    .. versionadded:: 0.0.5
+    .. versionadded:: 0.0.1
     """
 
-    def __init__(self, url: Union[str, "AppKit.NSURL", "XAURL", "XAPath"]):
-        super().__init__()
-        self.soup: BeautifulSoup = None  #: The bs4 object for the URL, starts as None until a bs4-related action is made
-        self.url: str  #: The string form of the URL
+    __xa_apsc = None
 
-        if isinstance(url, list):
-            # Elevate to XAURLList
-            new_self = XAURLList(
-                {"element": AppKit.NSArray.alloc().initWithArray_(url)}
-            )
-            self.__dict__ = new_self.__dict__
-            self.__class__ = new_self.__class__
-            self = new_self
-            return
+    def __init__(self, properties):
+        super().__init__(properties)
+        self.__xa_prcs = None
 
-        if isinstance(url, dict):
-            # Initialized via XAURLList
-            url = url["element"]
+    @property
+    def xa_apsc(self):
+        if self.__xa_apsc is None:
+            import appscript
 
-        if isinstance(url, str):
-            # URL-encode spaces
-            url = url.replace(" ", "%20")
+            self.__xa_apsc = appscript.app(self.bundle_url.path())
+        return self.__xa_apsc
 
-            if url.startswith("/"):
-                # Prepend file scheme
-                url = "file://" + url
-            elif url.replace(".", "").isdecimal():
-                # URL is an IP -- must add http:// prefix
-                if ":" not in url:
-                    # No port provided, add port 80 by default
-                    url = "http://" + url + ":80"
-                else:
-                    url = "http://" + url
-            elif "://" not in url:
-                # URL is not currently valid, try prepending http://
-                url = "http://" + url
+    @property
+    def xa_prcs(self):
+        if self.__xa_prcs == None:
+            processes = self.xa_sevt.processes()
+            self.__xa_prcs = processes.by_displayed_name(self.xa_elem.localizedName())
+        return self.__xa_prcs
 
-            self.url = url
-            url = AppKit.NSURL.alloc().initWithString_(url)
-        elif isinstance(url, XAURL) or isinstance(url, XAPath):
-            self.url = url.url
-            url = url.xa_elem
-        else:
-            self.url = str(url)
+    @property
+    def bundle_identifier(self) -> str:
+        """The bundle identifier for the application.
 
-        self.xa_elem = url
+        .. versionadded:: 0.0.1
+        """
+        return self.xa_elem.bundleIdentifier()
 
     @property
-    def base_url(self) -> str:
-        return self.xa_elem.host()
+    def bundle_url(self) -> str:
+        """The file URL of the application bundle.
 
-    @property
-    def parameters(self) -> str:
-        """The query parameters of the URL."""
-        return self.xa_elem.query()
+        .. versionadded:: 0.0.1
+        """
+        return self.xa_elem.bundleURL()
 
     @property
-    def scheme(self) -> str:
-        """The URI scheme of the URL."""
-        return self.xa_elem.scheme()
+    def executable_url(self) -> str:
+        """The file URL of the application's executable.
 
-    @property
-    def fragment(self) -> str:
-        """The fragment identifier following a # symbol in the URL."""
-        return self.xa_elem.fragment()
+        .. versionadded:: 0.0.1
+        """
+        return self.xa_elem.executableURL()
 
     @property
-    def port(self) -> int:
-        """The port that the URL points to."""
-        return self.xa_elem.port()
+    def frontmost(self) -> bool:
+        """Whether the application is the active application.
 
-    @property
-    def html(self) -> element.Tag:
-        """The html of the URL."""
-        if self.soup is None:
-            self.__get_soup()
-        return self.soup.html
+        .. versionadded:: 0.0.1
+        """
+        return self.xa_elem.isActive()
+
+    @frontmost.setter
+    def frontmost(self, frontmost: bool):
+        if frontmost is True:
+            self.xa_elem.activateWithOptions_(
+                AppKit.NSApplicationActivateIgnoringOtherApps
+            )
 
     @property
-    def title(self) -> str:
-        """The title of the URL."""
-        if self.soup is None:
-            self.__get_soup()
-        return self.soup.title.text
+    def launch_date(self) -> datetime:
+        """The date and time that the application was launched.
 
-    def __get_soup(self):
-        req = requests.get(str(self.xa_elem))
-        self.soup = BeautifulSoup(req.text, "html.parser")
+        .. versionadded:: 0.0.1
+        """
+        return self.xa_elem.launchDate()
 
-    def open(self):
-        """Opens the URL in the appropriate default application.
+    @property
+    def localized_name(self) -> str:
+        """The application's name.
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.0.1
         """
-        global workspace
-        if workspace is None:
-            workspace = AppKit.NSWorkspace.sharedWorkspace()
-        workspace.openURL_(self.xa_elem)
-
-    def extract_text(self) -> list[str]:
-        """Extracts the visible text from the webpage that the URL points to.
+        return self.xa_elem.localizedName()
 
-        :return: The list of extracted lines of text
-        :rtype: list[str]
+    @property
+    def owns_menu_bar(self) -> bool:
+        """Whether the application owns the top menu bar.
 
-        .. versionadded:: 0.0.8
+        .. versionadded:: 0.0.1
         """
-        if self.soup is None:
-            self.__get_soup()
-        return self.soup.get_text().splitlines()
-
-    def extract_images(self) -> list["XAImage"]:
-        """Extracts all images from HTML of the webpage that the URL points to.
+        return self.xa_elem.ownsMenuBar()
 
-        :return: The list of extracted images
-        :rtype: list[XAImage]
+    @property
+    def process_identifier(self) -> str:
+        """The process identifier for the application instance.
 
-        .. versionadded:: 0.0.8
+        .. versionadded:: 0.0.1
         """
-        data = AppKit.NSData.alloc().initWithContentsOfURL_(
-            AppKit.NSURL.URLWithString_(str(self.xa_elem))
-        )
-        image = AppKit.NSImage.alloc().initWithData_(data)
-
-        if image is not None:
-            image_object = XAImage(image, name=self.xa_elem.pathComponents()[-1])
-            return [image_object]
-        else:
-            if self.soup is None:
-                self.__get_soup()
+        return self.xa_elem.processIdentifier()
 
-            images = self.soup.findAll("img")
-            image_objects = []
-            for image in images:
-                image_src = image["src"]
-                if image_src.startswith("/"):
-                    image_src = str(self) + str(image["src"])
+    @property
+    def icon(self) -> "XAImage":
+        """The application's icon.
 
-                data = AppKit.NSData.alloc().initWithContentsOfURL_(
-                    AppKit.NSURL.URLWithString_(image_src)
-                )
-                image = AppKit.NSImage.alloc().initWithData_(data)
-                if image is not None:
-                    image_object = XAImage(image)
-                    image_objects.append(image_object)
+        .. versionadded:: 0.1.1
+        """
+        return _xa_graphics().XAImage(self.xa_elem.icon())
 
-            return image_objects
+    def launch(self, timeout: float = 30) -> "XAApplication":
+        """Launches the application.
 
-    def get_clipboard_representation(self) -> list[Union["AppKit.NSURL", str]]:
-        """Gets a clipboard-codable representation of the URL.
+        :param timeout: The maximum amount of time in seconds to wait for the application to finish launching, defaults to 30
+        :type timeout: float, optional
+        :raises TimeoutError: The application did not finish launching within the timeout
+        :return: The application object.
+        :rtype: XAApplication
 
-        When the clipboard content is set to a URL, the raw URL data and the string representation of the URL are added to the clipboard.
+        .. versionchanged:: 0.3.1
 
-        :return: The clipboard-codable form of the URL
-        :rtype: Any
+           Added the `timeout` parameter.
 
-        .. versionadded:: 0.0.8
+        .. versionadded:: 0.1.1
         """
-        return [self.xa_elem, str(self.xa_elem)]
+        config = AppKit.NSWorkspaceOpenConfiguration.alloc().init()
+        config.setActivates_(False)
+        config.setHides_(True)
 
-    def __eq__(self, other: "XAURL"):
-        if not isinstance(other, XAURL):
-            return False
+        finished_launching = threading.Event()
 
-        if self.xa_elem == other.xa_elem:
-            return True
+        def _launch_completion_handler(app, error):
+            finished_launching.set()
 
-        return self.url == other.url
+        self.xa_wksp.openApplicationAtURL_configuration_completionHandler_(
+            self.bundle_url, config, _launch_completion_handler
+        )
 
-    def __str__(self):
-        return str(self.xa_elem)
+        if not finished_launching.wait(timeout):
+            raise TimeoutError(
+                f"{self.localized_name} did not launch within {timeout} seconds"
+            )
 
-    def __repr__(self):
-        return "<" + str(type(self)) + str(self.xa_elem) + ">"
+        return self
 
+    def activate(self) -> "XAApplication":
+        """Activates the application, bringing its window(s) to the front and launching the application beforehand if necessary.
 
-class XAPath(XAObject, XAClipboardCodable):
-    """A path to a file on the disk.
+        :return: A reference to the PyXA application object.
+        :rtype: XAApplication
 
-    .. versionadded:: 0.0.5
-    """
+        .. seealso:: :func:`terminate`, :func:`unhide`, :func:`focus`
 
-    def __init__(self, path: Union[str, "AppKit.NSURL"]):
-        super().__init__()
-        if isinstance(path, str):
-            path = AppKit.NSURL.alloc().initFileURLWithPath_(path)
-        self.xa_elem = path
-        self.path = path.path()  #: The path string without the file:// prefix
-        self.url = str(
-            self.xa_elem
-        )  #: The path string with the file:// prefix included
+        .. versionadded:: 0.0.1
+        """
+        if not self.xa_elem.isFinishedLaunching():
+            self.launch()
 
-    @property
-    def name(self) -> str:
-        """The name of the file or folder at the path."""
-        return self.xa_elem.lastPathComponent()
+        if self.xa_elem.isHidden():
+            self.unhide()
 
-    def open(self):
-        """Opens the file in its default application.
+        self.xa_elem.activateWithOptions_(
+            AppKit.NSApplicationActivateAllWindows
+            | AppKit.NSApplicationActivateIgnoringOtherApps
+        )
+        return self
 
-        .. versionadded: 0.0.5
-        """
-        global workspace
-        if workspace is None:
-            workspace = AppKit.NSWorkspace.sharedWorkspace()
-        workspace.openURL_(self.xa_elem)
+    def terminate(self) -> "XAApplication":
+        """Quits the application. Synonymous with quit().
 
-    def show_in_finder(self):
-        """Opens a Finder window showing the folder containing this path, with the associated file selected. Synonymous with :func:`select`.
+        :return: A reference to the PyXA application object.
+        :rtype: XAApplication
 
-        .. versionadded: 0.0.9
-        """
-        self.select()
+        :Example:
 
-    def select(self):
-        """Opens a Finder window showing the folder containing this path, with the associated file selected. Synonymous with :func:`show_in_finder`.
+        >>> import PyXA
+        >>> safari = PyXA.Application("Safari")
+        >>> safari.terminate()
 
-        .. versionadded: 0.0.5
+        .. seealso:: :func:`quit`, :func:`activate`
+
+        .. versionadded:: 0.0.1
         """
-        global workspace
-        if workspace is None:
-            workspace = AppKit.NSWorkspace.sharedWorkspace()
-        workspace.activateFileViewerSelectingURLs_([self.xa_elem])
+        self.xa_elem.terminate()
+        return self
 
-    def get_clipboard_representation(self) -> list[Union["AppKit.NSURL", str]]:
-        """Gets a clipboard-codable representation of the path.
+    def quit(self) -> "XAApplication":
+        """Quits the application. Synonymous with terminate().
 
-        When the clipboard content is set to a path, the raw file URL data and the string representation of the path are added to the clipboard.
+        :return: A reference to the PyXA application object.
+        :rtype: XAApplication
 
-        :return: The clipboard-codable form of the path
-        :rtype: Any
+        :Example:
 
-        .. versionadded:: 0.0.8
+        >>> import PyXA
+        >>> safari = PyXA.Application("Safari")
+        >>> safari.quit()
+
+        .. seealso:: :func:`terminate`, :func:`activate`
+
+        .. versionadded:: 0.0.1
         """
-        return [self.xa_elem, self.xa_elem.path()]
+        self.xa_elem.terminate()
+        return self
 
-    def __eq__(self, other: "XAPath"):
-        if not isinstance(other, XAPath):
-            return False
+    def hide(self) -> "XAApplication":
+        """Hides all windows of the application.
 
-        if self.xa_elem == other.xa_elem:
-            return True
+        :return: A reference to the PyXA application object.
+        :rtype: XAApplication
 
-        return self.path == other.path
+        :Example:
 
-    def __repr__(self):
-        return "<" + str(type(self)) + str(self.xa_elem) + ">"
+        >>> import PyXA
+        >>> safari = PyXA.Application("Safari")
+        >>> safari.hide()
 
+        .. seealso:: :func:`unhide`
 
-########################
-### System Utilities ###
-########################
-class XAClipboard(XAObject):
-    """A wrapper class for managing and interacting with the system clipboard.
+        .. versionadded:: 0.0.1
+        """
+        self.xa_elem.hide()
+        return self
 
-    .. versionadded:: 0.0.5
-    """
+    def unhide(self) -> "XAApplication":
+        """Unhides (reveals) all windows of the application, but does not does not activate them.
 
-    def __init__(self):
-        self.xa_elem = AppKit.NSPasteboard.generalPasteboard()
+        :return: A reference to the PyXA application object.
+        :rtype: XAApplication
 
-    @property
-    def content(self) -> dict[str, list[Any]]:
-        """The content of the clipboard."""
-        info_by_type = {}
-        for item in self.xa_elem.pasteboardItems():
-            for item_type in item.types():
-                info_by_type[item_type] = {
-                    "data": item.dataForType_(item_type),
-                    "properties": item.propertyListForType_(item_type),
-                    "strings": item.stringForType_(item_type),
-                }
-        return info_by_type
+        :Example:
 
-    @content.setter
-    def content(self, value: list[Any]):
-        if not isinstance(value, list):
-            value = [value]
-        self.xa_elem.clearContents()
-        for index, item in enumerate(value):
-            if item == None:
-                value[index] = ""
-            elif isinstance(item, XAObject):
-                if not isinstance(item, XAClipboardCodable):
-                    print(item, "is not a clipboard-codable object.")
-                    continue
-                if (
-                    isinstance(item.xa_elem, ScriptingBridge.SBElementArray)
-                    and item.xa_elem.get() is None
-                ):
-                    value[index] = ""
-                else:
-                    content = item.get_clipboard_representation()
-                    if isinstance(content, list):
-                        value.pop(index)
-                        value += content
-                    else:
-                        value[index] = content
-            elif isinstance(item, int) or isinstance(item, float):
-                value[index] = str(item)
-        self.xa_elem.writeObjects_(value)
+        >>> import PyXA
+        >>> safari = PyXA.Application("Safari")
+        >>> safari.unhide()
 
-    def clear(self):
-        """Clears the system clipboard.
+        .. seealso:: :func:`hide`
 
-        .. versionadded:: 0.0.5
+        .. versionadded:: 0.0.1
         """
-        self.xa_elem.clearContents()
+        self.xa_elem.unhide()
+        return self
 
-    def get_strings(self) -> list[str]:
-        """Retrieves string type data from the clipboard, if any such data exists.
+    def focus(self) -> "XAApplication":
+        """Hides the windows of all applications except this one.
 
-        :return: The list of strings currently copied to the clipboard
-        :rtype: list[str]
+        :return: A reference to the PyXA application object.
+        :rtype: XAApplication
 
-        .. versionadded:: 0.0.8
-        """
-        items = []
-        for item in self.xa_elem.pasteboardItems():
-            string = item.stringForType_(AppKit.NSPasteboardTypeString)
-            if string is not None:
-                items.append(string)
-        return items
+        :Example:
 
-    def get_urls(self) -> list["XAURL"]:
-        """Retrieves URL type data from the clipboard, as instances of :class:`XAURL` and :class:`XAPath`, if any such data exists.
+        >>> import PyXA
+        >>> safari = PyXA.Application("Safari")
+        >>> safari.focus()
 
-        :return: The list of file URLs and web URLs currently copied to the clipboard
-        :rtype: list[XAURL]
+        .. seealso:: :func:`unfocus`
 
-        .. versionadded:: 0.0.8
+        .. versionadded:: 0.0.1
         """
-        items = []
-        for item in self.xa_elem.pasteboardItems():
-            url = None
-            string = item.stringForType_(AppKit.NSPasteboardTypeURL)
-            if string is None:
-                string = item.stringForType_(AppKit.NSPasteboardTypeFileURL)
-                if string is not None:
-                    url = XAPath(XAURL(string).xa_elem)
+        for app in self.xa_wksp.runningApplications():
+            if app.localizedName() != self.xa_elem.localizedName():
+                app.hide()
             else:
-                url = XAURL(string)
+                app.unhide()
+        return self
 
-            if url is not None:
-                items.append(url)
-        return items
+    def unfocus(self) -> "XAApplication":
+        """Unhides (reveals) the windows of all other applications, but does not activate them.
 
-    def get_images(self) -> list["XAImage"]:
-        """Retrieves image type data from the clipboard, as instances of :class:`XAImage`, if any such data exists.
+        :return: A reference to the PyXA application object.
+        :rtype: XAApplication
 
-        :return: The list of images currently copied to the clipboard
-        :rtype: list[XAImage]
+        :Example:
 
-        .. versionadded:: 0.0.8
-        """
-        image_types = [
-            AppKit.NSPasteboardTypePNG,
-            AppKit.NSPasteboardTypeTIFF,
-            "public.jpeg",
-            "com.apple.icns",
-        ]
-        items = []
-        for item in self.xa_elem.pasteboardItems():
-            for image_type in image_types:
-                if image_type in item.types():
-                    img = XAImage(data=item.dataForType_(image_type))
-                    items.append(img)
-        return items
+        >>> import PyXA
+        >>> safari = PyXA.Application("Safari")
+        >>> safari.unfocus()
 
-    def set_contents(self, content: list[Any]):
-        """Sets the content of the clipboard
+        .. seealso:: :func:`focus`
 
-        :param content: A list of the content to add fill the clipboard with.
-        :type content: list[Any]
+        .. versionadded:: 0.0.1
+        """
+        for app in self.xa_wksp.runningApplications():
+            app.unhide()
+        return self
 
-        .. deprecated:: 0.0.8
-           Set the :attr:`content` property directly instead.
+    @contextmanager
+    def cached(self, ttl: Union[float, None] = None):
+        """Provides a copy of the application whose property values, and those of all objects derived from it, are cached within a `with` block.
 
-        .. versionadded:: 0.0.5
-        """
-        self.xa_elem.clearContents()
-        self.xa_elem.writeObjects_(content)
+        The application object itself is left unchanged, so other code using the same application object is unaffected. Cached values are invalidated when properties are set on the same object, and the cache is discarded when the block exits.
 
+        :param ttl: The number of seconds that cached values remain valid, or None to keep values for the duration of the block, defaults to None
+        :type ttl: Union[float, None], optional
+        :return: The cached copy of the application, whose property cache is available as its :attr:`xa_cache` attribute
+        :rtype: XAApplication
 
-class XASpotlight(XAObject):
-    """A Spotlight query for files on the disk.
+        :Example:
 
-    .. versionadded:: 0.0.9
-    """
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> with app.cached(ttl=2) as cached_app:
+        ...     track = cached_app.current_track
+        ...     for _ in range(10):
+        ...         name, artist = track.name, track.artist
+        ...     print(cached_app.xa_cache.stats())
+        {'hits': 18, 'misses': 3, 'size': 3, 'hit_rate': 0.8571428571428571, 'ttl': 2}
+
+        .. seealso:: :func:`XAObject.enable_cache`
+
+        .. versionadded:: 0.3.1
+        """
+        # Copied directly, since the copy protocol's lookup of __setstate__ would fall back to appscript
+        cached_app = object.__new__(self.__class__)
+        cached_app.__dict__.update(self.__dict__)
+        cache = XAPropertyCache(ttl)
+        cached_app.enable_cache(cache=cache)
+        try:
+            yield cached_app
+        finally:
+            cache.enabled = False
+            cache.invalidate()
 
-    def __init__(self, *query: list[Any]):
-        self.query: list[Any] = query  #: The query terms to search
-        self.timeout: int = (
-            10  #: The amount of time in seconds to timeout the search after
-        )
-        self.predicate: Union[
-            str, XAPredicate
-        ] = None  #: The predicate to filter search results by
-        self.results: list[XAPath]  #: The results of the search
-        self.__results = None
+    def _get_processes(self, processes):
+        for process in self.xa_sevt.processes():
+            processes.append(process)
 
-        self.query_object = AppKit.NSMetadataQuery.alloc().init()
-        nc = AppKit.NSNotificationCenter.defaultCenter()
-        nc.addObserver_selector_name_object_(
-            self, "_queryNotification:", None, self.query_object
-        )
+    def windows(self, filter: dict = None) -> XAList:
+        return self.xa_prcs.windows(filter)
 
     @property
-    def results(self) -> list["XAPath"]:
-        if len(self.query) == 0 and self.predicate is None:
-            return []
-        self.run()
-        total_time = 0
-        while self.__results is None and total_time < self.timeout:
-            AppKit.NSRunLoop.currentRunLoop().runUntilDate_(
-                datetime.now() + timedelta(seconds=0.01)
-            )
-            total_time += 0.01
-        if self.__results is None:
-            return []
-        return self.__results
+    def front_window(self) -> XAObject:
+        """The frontmost window of the application."""
+        return self.xa_prcs.front_window
 
-    def run(self):
-        """Runs the search.
+    def menu_bars(self, filter: dict = None) -> XAList:
+        return self.xa_prcs.menu_bars(filter)
 
-        :Example:
+    def get_clipboard_representation(
+        self,
+    ) -> list[Union[str, "AppKit.NSURL", "AppKit.NSImage"]]:
+        """Gets a clipboard-codable representation of the application.
 
-        >>> import PyXA
-        >>> from datetime import date, datetime, time
-        >>> date1 = datetime.combine(date(2022, 5, 17), time(0, 0, 0))
-        >>> date2 = datetime.combine(date(2022, 5, 18), time(0, 0, 0))
-        >>> search = PyXA.XASpotlight(date1, date2)
-        >>> print(search.results)
-        [<<class 'PyXA.XAPath'>file:///Users/exampleUser/Downloads/>, <<class 'PyXA.XAPath'>file:///Users/exampleUser/Downloads/Example.txt>, ...]
-
-        .. versionadded:: 0.0.9
-        """
-        if self.predicate is not None:
-            # Search with custom predicate
-            if isinstance(self.predicate, XAPredicate):
-                self.predicate = self.predicate.get_clipboard_representation()
-            self.__search_with_predicate(self.predicate)
-        elif len(self.query) == 1 and isinstance(self.query[0], datetime):
-            # Search date + or - 24 hours
-            self.__search_by_date(self.query)
-        elif (
-            len(self.query) == 2
-            and isinstance(self.query[0], datetime)
-            and isinstance(self.query[1], datetime)
-        ):
-            # Search date range
-            self.__search_by_date_range(self.query[0], self.query[1])
-        elif all(
-            isinstance(x, str) or isinstance(x, int) or isinstance(x, float)
-            for x in self.query
-        ):
-            # Search matching multiple strings
-            self.__search_by_strs(self.query)
-        elif isinstance(self.query[0], datetime) and all(
-            isinstance(x, str) or isinstance(x, int) or isinstance(x, float)
-            for x in self.query[1:]
-        ):
-            # Search by date and string
-            self.__search_by_date_strings(self.query[0], self.query[1:])
-        elif (
-            isinstance(self.query[0], datetime)
-            and isinstance(self.query[1], datetime)
-            and all(
-                isinstance(x, str) or isinstance(x, int) or isinstance(x, float)
-                for x in self.query[2:]
-            )
-        ):
-            # Search by date range and string
-            self.__search_by_date_range_strings(
-                self.query[0], self.query[1], self.query[2:]
-            )
+        When the clipboard content is set to an application, three items are placed on the clipboard:
+        1. The application's name
+        2. The URL to the application bundle
+        3. The application icon
 
-        AppKit.NSRunLoop.currentRunLoop().runUntilDate_(
-            datetime.now() + timedelta(seconds=0.01)
-        )
+        After copying an application to the clipboard, pasting will have the following effects:
+        - In Finder: Paste a copy of the application bundle in the current directory
+        - In Terminal: Paste the name of the application followed by the path to the application
+        - In iWork: Paste the application name
+        - In Safari: Paste the application name
+        - In Notes: Attach a copy of the application bundle to the active note
+        The pasted content may be different for other applications.
 
-    def show_in_finder(self):
-        """Shows the search in Finder. This might not reveal the same search results.
+        :return: The clipboard-codable representation
+        :rtype: list[Union[str, AppKit.NSURL, AppKit.NSImage]]
 
-        .. versionadded:: 0.0.9
+        .. versionadded:: 0.0.8
         """
-        global workspace
-        if workspace is None:
-            workspace = AppKit.NSWorkspace.sharedWorkspace()
-        workspace.showSearchResultsForQueryString_(str(self.query))
-
-    def __search_by_strs(self, terms: tuple[str]):
-        expanded_terms = [x for y in terms for x in [y] * 3]
-        format = (
-            "((kMDItemDisplayName CONTAINS %@) OR (kMDItemTextContent CONTAINS %@) OR (kMDItemFSName CONTAINS %@)) AND "
-            * len(terms)
-        )
-        self.__search_with_predicate(format[:-5], *expanded_terms)
-
-    def __search_by_date(self, date: datetime):
-        self.__search_with_predicate(
-            f"((kMDItemContentCreationDate > %@) AND (kMDItemContentCreationDate < %@)) OR ((kMDItemContentModificationDate > %@) AND (kMDItemContentModificationDate < %@)) OR ((kMDItemFSCreationDate > %@) AND (kMDItemFSCreationDate < %@)) OR ((kMDItemFSContentChangeDate > %@) AND (kMDItemFSContentChangeDate < %@)) OR ((kMDItemDateAdded > %@) AND (kMDItemDateAdded < %@))",
-            *[date - timedelta(hours=12), date + timedelta(hours=12)] * 5,
-        )
+        return [
+            self.xa_elem.localizedName(),
+            self.xa_elem.bundleURL(),
+            self.xa_elem.icon(),
+        ]
 
-    def __search_by_date_range(self, date1: datetime, date2: datetime):
-        self.__search_with_predicate(
-            f"((kMDItemContentCreationDate > %@) AND (kMDItemContentCreationDate < %@)) OR ((kMDItemContentModificationDate > %@) AND (kMDItemContentModificationDate < %@)) OR ((kMDItemFSCreationDate > %@) AND (kMDItemFSCreationDate < %@)) OR ((kMDItemFSContentChangeDate > %@) AND (kMDItemFSContentChangeDate < %@)) OR ((kMDItemDateAdded > %@) AND (kMDItemDateAdded < %@))",
-            *[date1, date2] * 5,
-        )
+    def __getattr__(self, attr):
+        fallback_names = _xa_fallback_attributes(self.__class__)
+        if attr not in fallback_names:
+            if attr in _xa_class_attributes(self.__class__):
+                # If possible, use PyXA attribute
+                return super().__getattribute__(attr)
+            fallback_names.add(attr)
 
-    def __search_by_date_strings(self, date: datetime, terms: tuple[str]):
-        expanded_terms = [x for y in terms for x in [y] * 3]
-        format = (
-            "((kMDItemDisplayName CONTAINS %@) OR (kMDItemTextContent CONTAINS %@) OR (kMDItemFSName CONTAINS %@)) AND "
-            * len(terms)
-        )
-        format += "(((kMDItemContentCreationDate > %@) AND (kMDItemContentCreationDate < %@)) OR ((kMDItemContentModificationDate > %@) AND (kMDItemContentModificationDate < %@)) OR ((kMDItemFSCreationDate > %@) AND (kMDItemFSCreationDate < %@)) OR ((kMDItemFSContentChangeDate > %@) AND (kMDItemFSContentChangeDate < %@)) OR ((kMDItemDateAdded > %@) AND (kMDItemDateAdded < %@)))"
-        self.__search_with_predicate(
-            format,
-            *expanded_terms,
-            *[date - timedelta(hours=12), date + timedelta(hours=12)] * 5,
-        )
+        # Otherwise, fall back to appscript
+        return getattr(self.xa_apsc, attr)
 
-    def __search_by_date_range_strings(
-        self, date1: datetime, date2: datetime, terms: tuple[str]
-    ):
-        expanded_terms = [x for y in terms for x in [y] * 3]
-        format = (
-            "((kMDItemDisplayName CONTAINS %@) OR (kMDItemTextContent CONTAINS %@) OR (kMDItemFSName CONTAINS %@)) AND "
-            * len(terms)
-        )
-        format += "(((kMDItemContentCreationDate > %@) AND (kMDItemContentCreationDate < %@)) OR ((kMDItemContentModificationDate > %@) AND (kMDItemContentModificationDate < %@)) OR ((kMDItemFSCreationDate > %@) AND (kMDItemFSCreationDate < %@)) OR ((kMDItemFSContentChangeDate > %@) AND (kMDItemFSContentChangeDate < %@)) OR ((kMDItemDateAdded > %@) AND (kMDItemDateAdded < %@)))"
-        self.__search_with_predicate(format, *expanded_terms, *[date1, date2] * 5)
 
-    def __search_with_predicate(self, predicate_format: str, *args: list[Any]):
-        predicate = AppKit.NSPredicate.predicateWithFormat_(predicate_format, *args)
-        self.query_object.setPredicate_(predicate)
-        self.query_object.startQuery()
+######################
+### PyXA Utilities ###
+######################
+class AppleScript:
+    """A class for constructing and executing AppleScript scripts.
 
-    def _queryNotification_(self, notification):
-        if notification.name() == AppKit.NSMetadataQueryDidFinishGatheringNotification:
-            self.query_object.stopQuery()
-            results = notification.object().results()
-            self.__results = [
-                XAPath(x.valueForAttribute_(AppKit.NSMetadataItemPathKey))
-                for x in results
-            ]
+    Compiled scripts are cached by their source code, so running the same script repeatedly compiles it only once. A cached script is shared by every :class:`AppleScript` object with the same source code, so the values of `property` and `global` variables persist across runs of that source code, even between separate objects, as they do in saved script files. Runs of a shared script are serialized, so concurrent runs from several threads do not interleave. Set :attr:`cache_size` to 0 to compile each run from scratch instead, giving every run its own state.
 
+    .. versionchanged:: 0.3.1
 
-############
-### Text ###
-############
-class XATextDocumentList(XAList, XAClipboardCodable):
-    """A wrapper around lists of text documents that employs fast enumeration techniques.
+       Added the compiled script cache.
 
-    .. versionadded:: 0.1.0
+    .. versionadded:: 0.0.5
     """
 
-    def __init__(
-        self, properties: dict, filter: Union[dict, None] = None, obj_class=None
-    ):
-        if obj_class is None:
-            obj_class = XATextDocument
-        super().__init__(properties, obj_class, filter)
+    cache_size: int = 128  #: The maximum number of compiled scripts to cache, or 0 to disable caching
 
-    def properties(self) -> list[dict]:
-        ls = self.xa_elem.arrayByApplyingSelector_("properties") or []
-        return [dict(x) for x in ls]
+    __compiled_scripts: OrderedDict[
+        str, tuple["AppKit.NSAppleScript", threading.Lock]
+    ] = OrderedDict()
+    __cache_lock = threading.Lock()
+    __cache_hits = 0
+    __cache_misses = 0
 
-    def text(self) -> "XATextList":
-        ls = self.xa_elem.arrayByApplyingSelector_("text") or []
-        return self._new_element(ls, XATextList)
+    def __init__(self, script: Union[str, list[str], None] = None):
+        """Creates a new AppleScript object.
 
-    def by_properties(self, properties: dict) -> Union["XATextDocument", None]:
-        return self.by_property("properties", properties)
+        :param script: A string or list of strings representing lines of AppleScript code, or the path to a script plaintext file, defaults to None
+        :type script: Union[str, list[str], None], optional
 
-    def by_text(self, text: str) -> Union["XATextDocument", None]:
-        return self.by_property("text", text)
+        .. versionadded:: 0.0.5
+        """
+        self.script: list[str]  #: The lines of AppleScript code contained in the script
+        self.last_result: Any  #: The return value of the last execution of the script
+        self.file_path: XAPath  #: The file path of this script, if one exists
 
-    def paragraphs(self) -> "XAParagraphList":
-        ls = self.xa_elem.arrayByApplyingSelector_("paragraphs") or []
-        return self._new_element([plist for plist in ls], XAParagraphList)
+        if isinstance(script, str):
+            if script.startswith("/"):
+                with open(script, "r") as f:
+                    script = f.readlines()
+            else:
+                script_text = re.sub(r"[ \t]+", " ", script)
+                script_text = re.sub(r"[\n\r]+", "\n", script_text)
+                self.script = script_text.split("\n")
+        elif isinstance(script, list):
+            self.script = script
+        elif script == None:
+            self.script = []
 
-    def words(self) -> "XAWordList":
-        ls = self.xa_elem.arrayByApplyingSelector_("words") or []
-        return [self._new_element([plist for plist in ls], XAWordList)]
+    @property
+    def last_result(self) -> Any:
+        return self.__last_result
 
-    def characters(self) -> "XACharacterList":
-        ls = self.xa_elem.arrayByApplyingSelector_("characters") or []
-        return [self._new_element([plist for plist in ls], XACharacterList)]
+    @staticmethod
+    def cache_info() -> XAScriptCacheInfo:
+        """Gets statistics of the compiled script cache.
 
-    def attribute_runs(self) -> "XAAttributeRunList":
-        ls = self.xa_elem.arrayByApplyingSelector_("attributeRuns") or []
-        return [self._new_element([plist for plist in ls], XAAttributeRunList)]
+        :return: The number of cache hits and misses, the number of cached scripts, and the maximum number of cached scripts
+        :rtype: XAScriptCacheInfo
 
-    def attachments(self) -> "XAAttachmentList":
-        ls = self.xa_elem.arrayByApplyingSelector_("attachments") or []
-        return [self._new_element([plist for plist in ls], XAAttachmentList)]
+        :Example:
 
-    def get_clipboard_representation(self) -> list[Union[str, "AppKit.NSURL"]]:
-        """Gets a clipboard-codable representation of each document in the list.
+        >>> import PyXA
+        >>> for x in range(10):
+        ...     PyXA.AppleScript("return 1 + 2").run()
+        >>> print(PyXA.AppleScript.cache_info())
+        XAScriptCacheInfo(hits=9, misses=1, size=1, max_size=128)
+
+        .. versionadded:: 0.3.1
+        """
+        with AppleScript.__cache_lock:
+            return XAScriptCacheInfo(
+                AppleScript.__cache_hits,
+                AppleScript.__cache_misses,
+                len(AppleScript.__compiled_scripts),
+                AppleScript.cache_size,
+            )
 
-        When the clipboard content is set to a list of documents, each documents's file URL and name are added to the clipboard.
+    @staticmethod
+    def clear_cache():
+        """Discards all cached compiled scripts and resets the cache statistics.
+
+        .. versionadded:: 0.3.1
+        """
+        with AppleScript.__cache_lock:
+            AppleScript.__compiled_scripts.clear()
+            AppleScript.__cache_hits = 0
+            AppleScript.__cache_misses = 0
+
+    @staticmethod
+    def __compile(source: str) -> tuple["AppKit.NSAppleScript", threading.Lock]:
+        # Gets the compiled script for the source code along with the lock that serializes its execution, compiling and caching it if necessary
+        with AppleScript.__cache_lock:
+            entry = AppleScript.__compiled_scripts.get(source)
+            if entry is not None:
+                AppleScript.__compiled_scripts.move_to_end(source)
+                AppleScript.__cache_hits += 1
+                return entry
+            AppleScript.__cache_misses += 1
+
+        compiled_script = AppKit.NSAppleScript.alloc().initWithSource_(source)
+        status = compiled_script.compileAndReturnError_(None)
+        if status[1] is not None:
+            raise AppleScriptError(status[1], source)
+
+        with AppleScript.__cache_lock:
+            # Another thread may have compiled the same source in the meantime
+            entry = AppleScript.__compiled_scripts.setdefault(
+                source, (compiled_script, threading.Lock())
+            )
+            while len(AppleScript.__compiled_scripts) > max(AppleScript.cache_size, 0):
+                AppleScript.__compiled_scripts.popitem(last=False)
+        return entry
 
-        :return: A list of each document's file URL and name
-        :rtype: list[Union[str, AppKit.NSURL]]
+    @property
+    def file_path(self) -> "XAPath":
+        return self.__file_path
 
-        .. versionadded:: 0.0.8
-        """
-        return [str(x) for x in self.text()]
+    def add(self, script: Union[str, list[str], "AppleScript"]):
+        """Adds the supplied string, list of strings, or script as a new line entry in the script.
 
-    def __repr__(self):
-        return "<" + str(type(self)) + str(self.text()) + ">"
+        :param script: The script to append to the current script string.
+        :type script: Union[str, list[str], AppleScript]
 
+        :Example:
 
-class XATextDocument(XAObject):
-    """A class for managing and interacting with text documents.
+        >>> import PyXA
+        >>> script = PyXA.AppleScript("tell application \"Safari\"")
+        >>> script.add("print the document of window 1")
+        >>> script.add("end tell")
+        >>> script.run()
 
-    .. versionadded:: 0.0.1
-    """
+        .. versionadded:: 0.0.5
+        """
+        if isinstance(script, str):
+            self.script.append(script)
+        elif isinstance(script, list):
+            self.script.extend(script)
+        elif isinstance(script, AppleScript):
+            self.script.extend(script.script)
 
-    def __init__(self, properties):
-        super().__init__(properties)
+    def insert(self, index: int, script: Union[str, list[str], "AppleScript"]):
+        """Inserts the supplied string, list of strings, or script as a line entry in the script starting at the given line index.
 
-    @property
-    def text(self) -> "XAText":
-        """The text of the document."""
-        return self._new_element(self.xa_elem.text(), XAText)
+        :param index: The line index to begin insertion at
+        :type index: int
+        :param script: The script to insert into the current script
+        :type script: Union[str, list[str], AppleScript]
 
-    @text.setter
-    def text(self, text: Union[str, "XAText"]):
-        if isinstance(text, XAText):
-            text = text.xa_elem
-        self.set_property("text", text)
+        :Example:
 
-    def prepend(self, text: str) -> "XATextDocument":
-        """Inserts the provided text at the beginning of the document.
+        >>> import PyXA
+        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
+        >>> script.insert(1, "activate")
+        >>> script.run()
 
-        :param text: The text to insert.
-        :type text: str
-        :return: A reference to the document object.
-        :rtype: XATextDocument
+        .. versionadded:: 0.0.9
+        """
+        if isinstance(script, str):
+            self.script.insert(index, script)
+        elif isinstance(script, list):
+            for line in script:
+                self.script.insert(index, line)
+                index += 1
+        elif isinstance(script, AppleScript):
+            for line in script.script:
+                self.script.insert(index, line)
+                index += 1
 
-        .. seealso:: :func:`append`, :func:`set_text`
+    def pop(self, index: int = -1) -> str:
+        """Removes the line at the given index from the script.
 
-        .. versionadded:: 0.0.1
+        :param index: The index of the line to remove
+        :type index: int
+        :return: The text of the removed line
+        :rtype: str
+
+        :Example:
+
+        >>> import PyXA
+        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
+        >>> print(script.pop(1))
+            get chats
+
+        .. versionadded:: 0.0.9
         """
-        old_text = str(self.text)
-        self.set_property("text", text + old_text)
-        return self
+        return self.script.pop(index)
 
-    def append(self, text: str) -> "XATextDocument":
-        """Appends the provided text to the end of the document.
+    def load(path: Union["XAPath", str]) -> "AppleScript":
+        """Loads an AppleScript (.scpt) file as a runnable AppleScript object.
 
-        :param text: The text to append.
-        :type text: str
-        :return: A reference to the document object.
-        :rtype: XATextDocument
+        :param path: The path of the .scpt file to load
+        :type path: Union[XAPath, str]
+        :return: The newly loaded AppleScript object
+        :rtype: AppleScript
 
-        .. seealso:: :func:`prepend`, :func:`set_text`
+        :Example 1: Load and run a script
 
-        .. versionadded:: 0.0.1
-        """
-        old_text = str(self.text)
-        self.set_property("text", old_text + text)
-        return self
+        >>> import PyXA
+        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
+        >>> print(script.run())
+        {
+            'string': None,
+            'int': 0,
+            'bool': False,
+            'float': 0.0,
+            'date': None,
+            'file_url': None,
+            'type_code': 845507684,
+            'data': {length = 8962, bytes = 0x646c6532 00000000 6c697374 000022f2 ... 6e756c6c 00000000 },
+            'event': <NSAppleEventDescriptor: [ 'obj '{ ... } ]>
+        }
 
-    def reverse(self) -> "XATextDocument":
-        """Reverses the text of the document.
+        :Example 2: Load, modify, and run a script
 
-        :return: A reference to the document object.
-        :rtype: XATextDocument
+        >>> import PyXA
+        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
+        >>> script.pop(1)
+        >>> script.insert(1, "activate")
+        >>> script.run()
 
-        .. versionadded:: 0.0.4
+        .. versionadded:: 0.0.8
         """
-        self.set_property("text", reversed(str(self.text)))
-        return self
+        if isinstance(path, str):
+            path = XAPath(path)
+        script = AppKit.NSAppleScript.alloc().initWithContentsOfURL_error_(
+            path.xa_elem, None
+        )[0]
+        script_text = re.sub(r"[ \t]+", " ", str(script.richTextSource().string()))
+        script_text = re.sub(r"[\n\r]+", "\n", script_text)
+        script = AppleScript(script_text.split("\n"))
+        script.__file_path = path
+        return script
 
-    def paragraphs(self, filter: dict = None) -> "XAParagraphList":
-        return self.text.paragraphs(filter)
+    def save(self, path: Union["XAPath", str, None] = None):
+        """Saves the script to the specified file path, or to the path from which the script was loaded.
 
-    def sentences(self, filter: dict = None) -> "XASentenceList":
-        return self.text.sentences(filter)
+        :param path: The path to save the script at, defaults to None
+        :type path: Union[XAPath, str, None], optional
 
-    def words(self, filter: dict = None) -> "XAWordList":
-        return self.text.words(filter)
+        :Example 1: Save the script to a specified path
 
-    def characters(self, filter: dict = None) -> "XACharacterList":
-        return self.text.characters(filter)
+        >>> import PyXA
+        >>> script = PyXA.AppleScript(f\"\"\"
+        >>>     tell application "Safari"
+        >>>         activate
+        >>>     end tell
+        >>> \"\"\")
+        >>> script.save("/Users/exampleUser/Downloads/Example.scpt")
 
-    def attribute_runs(self, filter: dict = None) -> "XAAttributeRunList":
-        return self.text.attribute_runs(filter)
+        :Example 2: Load a script, modify it, then save it
 
-    def attachments(self, filter: dict = None) -> "XAAttachmentList":
-        return self.text.attachments(filter)
+        >>> import PyXA
+        >>> script = PyXA.AppleScript.load("/Users/steven/Downloads/Example.scpt")
+        >>> script.insert(2, "delay 2")
+        >>> script.insert(3, "set the miniaturized of window 1 to true")
+        >>> script.save()
 
+        .. versionadded:: 0.0.9
+        """
+        if path is None and self.file_path is None:
+            print("No path to save script to!")
+            return
 
-class XATextList(XAList):
-    """A wrapper around lists of text objects that employs fast enumeration techniques.
+        if isinstance(path, str):
+            path = XAPath(path)
 
-    .. versionadded:: 0.0.4
-    """
+        script = ""
+        for line in self.script:
+            script += line + "\n"
+        script = AppKit.NSAppleScript.alloc().initWithSource_(script)
+        script.compileAndReturnError_(None)
+        source = script.richTextSource().string()
 
-    def __init__(
-        self, properties: dict, filter: Union[dict, None] = None, obj_class=None
-    ):
-        if obj_class is None:
-            obj_class = XAText
-        super().__init__(properties, obj_class, filter)
+        if path is not None:
+            self.__file_path = path
 
-    def paragraphs(self, filter: dict = None) -> "XAParagraphList":
-        ls = []
-        if hasattr(self.xa_elem, "get"):
-            ls = self.xa_elem.arrayByApplyingSelector_("paragraphs") or []
-        else:
-            ls = [x.xa_elem.split("\n") for x in self]
-        ls = [
-            paragraph
-            for paragraphlist in ls
-            for paragraph in paragraphlist
-            if paragraph.strip() != ""
-        ]
-        return self._new_element(ls, XAParagraphList, filter)
+        with open(self.file_path.xa_elem.path(), "w") as f:
+            f.write(source)
 
-    def sentences(self) -> "XASentenceList":
-        ls = [x.sentences() for x in self]
-        ls = [sentence for sentencelist in ls for sentence in sentencelist]
-        return self._new_element(ls, XASentenceList)
+    def parse_result_data(result: dict) -> list[tuple[str, str]]:
+        """Extracts string data from an AppleScript execution result dictionary.
 
-    def words(self, filter: dict = None) -> "XAWordList":
-        ls = []
-        if hasattr(self.xa_elem, "get"):
-            ls = self.xa_elem.arrayByApplyingSelector_("words") or []
-        else:
-            ls = [x.xa_elem.split() for x in self]
-        ls = [word for wordlist in ls for word in wordlist]
-        return self._new_element(ls, XAWordList, filter)
+        :param result: The execution result dictionary to extract data from
+        :type result: dict
+        :return: A list of responses contained in the result structured as tuples
+        :rtype: list[tuple[str, str]]
 
-    def characters(self, filter: dict = None) -> "XACharacterList":
-        ls = []
-        if hasattr(self.xa_elem, "get"):
-            ls = self.xa_elem.arrayByApplyingSelector_("characters") or []
-        else:
-            ls = [list(x.xa_elem) for x in self]
-        ls = [character for characterlist in ls for character in characterlist]
-        return self._new_element(ls, XACharacterList, filter)
+        :Example:
 
-    def attribute_runs(self, filter: dict = None) -> "XAAttributeRunList":
-        ls = []
-        if hasattr(self.xa_elem, "get"):
-            ls = self.xa_elem.arrayByApplyingSelector_("attributeRuns") or []
-        ls = [
-            attribute_run
-            for attribute_run_list in ls
-            for attribute_run in attribute_run_list
-        ]
-        return self._new_element(ls, XAAttributeRunList, filter)
+        >>> import PyXA
+        >>> script = PyXA.AppleScript.load("/Users/exampleUser/Downloads/Test.scpt")
+        >>> print(script.script)
+        >>> result = script.run()
+        >>> print(PyXA.AppleScript.parse_result_data(result))
+        ['tell application "Messages"', '\\tget chats', 'end tell']
+        [('ID', 'iMessage;-;+12345678910'), ('ID', 'iMessage;-;+12345678911'), ('ID', 'iMessage;-;example@icloud.com'), ...]
 
-    def attachments(self, filter: dict = None) -> "XAAttachmentList":
-        ls = []
-        if hasattr(self.xa_elem, "get"):
-            ls = self.xa_elem.arrayByApplyingSelector_("attachments") or []
-        ls = [attachment for attachment_list in ls for attachment in attachment_list]
-        return self._new_element(ls, XAAttachmentList, filter)
+        .. versionadded:: 0.0.9
+        """
+        result = result["event"]
+        response_objects = []
+        num_responses = result.numberOfItems()
+        for response_index in range(1, num_responses + 1):
+            response = result.descriptorAtIndex_(response_index)
 
-    def __repr__(self):
-        try:
-            if isinstance(self.xa_elem[0], ScriptingBridge.SBObject):
-                # List items will not resolved to text upon dereferencing the list; need to resolve items individually
-                count = self.xa_elem.count()
-                if count <= 500:
-                    # Too many unresolved pointers, save time by just reporting the length
-                    return (
-                        "<"
-                        + str(type(self))
-                        + str([x.get() for x in self.xa_elem])
-                        + ">"
-                    )
-                return (
-                    "<" + str(type(self)) + "length: " + str(self.xa_elem.count()) + ">"
-                )
+            data = ()
+            num_params = response.numberOfItems()
+            if num_params == 0:
+                data = response.stringValue().strip()
 
-            # List items will resolve to text upon dereferencing the list
-            return "<" + str(type(self)) + str(self.xa_elem.get()) + ">"
-        except:
-            return "<" + str(type(self)) + str(list(self.xa_elem)) + ">"
+            else:
+                for param_index in range(1, num_params + 1):
+                    param = response.descriptorAtIndex_(param_index).stringValue()
+                    if param is not None:
+                        data += (param.strip(),)
+            response_objects.append(data)
 
+        return response_objects
 
-class XAText(XAObject):
-    """A class for managing and interacting with the text of documents.
+    def run(self, args: list = None, dry_run=False) -> Any:
+        """Compiles and runs the script, returning the result.
 
-    .. versionadded:: 0.0.1
-    """
+        Arguments are passed to the script's run handler as typed AppleScript values using :func:`XAEvents.event_from_value`, e.g. strings, numbers, booleans, dates, lists, and records, so that the same compiled script can be run with different arguments.
 
-    def __init__(self, properties):
-        if isinstance(properties, dict):
-            super().__init__(properties)
-        elif isinstance(properties, str):
-            super().__init__({"element": properties})
+        :param args: A list of arguments to pass to the script, defaults to None
+        :type args: list, optional
+        :param dry_run: Whether to compile and check the script without running it, defaults to False
+        :type dry_run: bool, optional
+        :return: The return value of the script.
+        :rtype: Any
 
-        self.text: str  #: The plaintext contents of the rich text
-        self.color: XAColor  #: The color of the first character
-        self.font: str  #: The name of the font of the first character
-        self.size: int  #: The size in points of the first character
+        :Example 1: Basic Script Execution
 
-    @property
-    def text(self) -> str:
-        if isinstance(self.xa_elem, str):
-            return self.xa_elem
-        else:
-            return self.xa_elem.text()
+        >>> import PyXA
+        >>> script = PyXA.AppleScript(f\"\"\"tell application "System Events"
+        >>>     return 1 + 2
+        >>> end tell
+        >>> \"\"\")
+        >>> print(script.run())
+        {
+            'string': '3',
+            'int': 3,
+            'bool': False,
+            'float': 3.0,
+            'date': None,
+            'file_url': None,
+            'type_code': 3,
+            'data': {length = 4, bytes = 0x03000000},
+            'event': <NSAppleEventDescriptor: 3>
+        }
 
-    @text.setter
-    def text(self, text: str):
-        if isinstance(self.xa_elem, str):
-            self.xa_elem = text
-        else:
-            self.set_property("text", text)
+        :Example 2: Run Script With Arguments
 
-    @property
-    def color(self) -> "XAColor":
-        if isinstance(self.xa_elem, str):
-            return None
-        else:
-            return XAColor(self.xa_elem.color())
+        >>> import PyXA
+        >>> script = PyXA.AppleScript(f\"\"\"on run argv
+        >>>     set x to item 1 of argv
+        >>>     set y to item 2 of argv
+        >>>     return x + y
+        >>> end run\"\"\")
+        >>> print(script.run([5, 6]))
+        {'
+            string': '11',
+            'int': 11,
+            'bool': False,
+            'float': 11.0,
+            'date': None,
+            'file_url': None,
+            'type_code': 11,
+            'data': {length = 4, bytes = 0x0b000000},
+            'event': <NSAppleEventDescriptor: 11>
+        }
 
-    @color.setter
-    def color(self, color: "XAColor"):
-        if isinstance(self.xa_elem, str):
-            self.color = color.xa_elem
-        else:
-            self.set_property("color", color.xa_elem)
+        .. versionchanged:: 0.3.1
 
-    @property
-    def font(self) -> str:
-        if isinstance(self.xa_elem, str):
-            return None
-        else:
-            return self.xa_elem.font()
+           Compiled scripts are reused from the cache described by :func:`cache_info`. Arguments are passed to the run handler as typed values instead of strings.
 
-    @font.setter
-    def font(self, font: str):
-        if isinstance(self.xa_elem, str):
-            self.font = font
-        else:
-            self.set_property("font", font)
+        .. versionadded:: 0.0.5
+        """
+        script = "\n".join(line.rstrip("\n") for line in self.script)
+        full_script, lock = AppleScript.__compile(script)
+        if dry_run:
+            return True
 
-    @property
-    def size(self) -> int:
-        if isinstance(self.xa_elem, str):
-            return 0
+        # Run handlers that take parameters expect a list, even if it is empty
+        takes_args = any(line.lstrip().startswith("on run ") for line in self.script)
+        if args is None and not takes_args:
+            with lock:
+                result = full_script.executeAndReturnError_(None)
         else:
-            return self.xa_elem.size()
+            from PyXA import XAEvents
 
-    @size.setter
-    def size(self, size: int):
-        if isinstance(self.xa_elem, str):
-            self.size = size
-        else:
-            self.set_property("size", size)
+            if not isinstance(args, list):
+                args = [] if args is None else [args]
+            event = XAEvents.run_event(args)
+            with lock:
+                result = full_script.executeAppleEvent_error_(event, None)
 
-    def tag_parts_of_speech(
-        self, unit: Literal["word", "sentence", "paragraph", "document"] = "word"
-    ) -> list[tuple[str, str]]:
-        """Tags each word of the text with its associated part of speech.
+        if result[1] is not None:
+            raise AppleScriptError(result[1], script)
 
-        :param unit: The grammatical unit to divide the text into for tagging, defaults to "word"
-        :type unit: Literal["word", "sentence", "paragraph", "document"]
-        :return: A list of tuples identifying each word of the text and its part of speech
-        :rtype: list[tuple[str, str]]
+        return self.__store_result(result[0])
 
-        :Example 1: Extract nouns from a text
+    def call(self, handler: str, args: Union[list[Any], None] = None) -> Any:
+        """Compiles the script and calls one of its handlers, returning the result.
 
-        >>> import PyXA
-        >>> text = PyXA.XAText("Here’s to the crazy ones. The misfits. The rebels.")
-        >>> nouns = [pos[0] for pos in text.tag_parts_of_speech() if pos[1] == "Noun"]
-        >>> print(nouns)
-        ['ones', 'misfits', 'rebels']
+        Arguments are passed to the handler as typed AppleScript values using :func:`XAEvents.event_from_value`, e.g. strings, numbers, booleans, dates, lists, and object specifiers for PyXA objects.
 
-        .. versionadded:: 0.1.0
-        """
-        import NaturalLanguage
+        :param handler: The name of the handler to call
+        :type handler: str
+        :param args: A list of arguments to pass to the handler, defaults to None
+        :type args: Union[list[Any], None], optional
+        :raises AppleScriptError: The script failed to compile or the handler raised an error
+        :return: The return value of the handler, in the same format as :func:`run`
+        :rtype: Any
 
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeLexicalClass]
-        )
-        tagger.setString_(str(self.xa_elem))
+        :Example:
 
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
+        >>> import PyXA
+        >>> script = PyXA.AppleScript(\"\"\"on add_numbers(x, y)
+        >>>     return x + y
+        >>> end add_numbers\"\"\")
+        >>> print(script.call("add_numbers", [5, 6])["int"])
+        11
 
-        tagged_pos = []
+        .. versionadded:: 0.3.1
+        """
+        from PyXA import XAEvents
 
-        def apply_tags(tag, token_range, error):
-            word_phrase = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            tagged_pos.append((word_phrase, tag))
+        script = "\n".join(line.rstrip("\n") for line in self.script)
+        full_script, lock = AppleScript.__compile(script)
+        event = XAEvents.handler_event(handler, args)
+        with lock:
+            result = full_script.executeAppleEvent_error_(event, None)
+        if result[1] is not None:
+            raise AppleScriptError(result[1], script)
 
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeLexicalClass,
-            NaturalLanguage.NLTaggerOmitPunctuation
-            | NaturalLanguage.NLTaggerOmitWhitespace,
-            apply_tags,
-        )
-        return tagged_pos
+        return self.__store_result(result[0])
 
-    def tag_languages(
-        self, unit: Literal["word", "sentence", "paragraph", "document"] = "paragraph"
-    ) -> list[tuple[str, str]]:
-        """Tags each paragraph of the text with its language.
+    def __store_result(self, result: "AppKit.NSAppleEventDescriptor") -> Any:
+        if result is None:
+            return None
 
-        :param unit: The grammatical unit to divide the text into for tagging, defaults to "paragraph"
-        :type unit: Literal["word", "sentence", "paragraph", "document"]
-        :return: A list of tuples identifying each paragraph of the text and its language
-        :rtype: list[tuple[str, str]]
+        string_result = result.stringValue()
+        if string_result is not None:
+            string_result = string_result.replace("\r", "\n")
 
-        :Example:
+        self.__last_result = {
+            "string": string_result,
+            "int": result.int32Value(),
+            "bool": result.booleanValue(),
+            "float": result.doubleValue(),
+            "date": result.dateValue(),
+            "file_url": result.fileURLValue(),
+            "type_code": result.typeCodeValue(),
+            "data": result.data(),
+            "event": result,
+        }
+        return self.last_result
 
-        >>> import PyXA
-        >>> text = PyXA.XAText("This is English.\\nQuesto è Italiano.\\nDas ist deutsch.\\nこれは日本語です。")
-        >>> print(text.tag_languages())
-        [('This is English.\\n', 'en'), ('Questo è Italiano.\\n', 'it'), ('Das ist deutsch.\\n', 'de'), ('これは日本語です。', 'ja')]
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.script) + ">"
 
-        .. versionadded:: 0.1.0
-        """
-        import NaturalLanguage
 
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeLanguage]
-        )
-        tagger.setString_(str(self.xa_elem))
+class XAPredicate(XAObject, XAClipboardCodable):
+    """A predicate used to filter arrays.
 
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
+    .. versionadded:: 0.0.4
+    """
 
-        tagged_languages = []
+    def __init__(self):
+        self.keys: list[str] = []
+        self.operators: list[str] = []
+        self.values: list[str] = []
 
-        def apply_tags(tag, token_range, error):
-            paragraph = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            if paragraph.strip() != "":
-                tagged_languages.append((paragraph, tag))
+    def from_dict(self, ref_dict: dict) -> "XAPredicate":
+        """Populates the XAPredicate object from the supplied dictionary.
 
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeLanguage,
-            NaturalLanguage.NLTaggerOmitPunctuation
-            | NaturalLanguage.NLTaggerOmitWhitespace,
-            apply_tags,
-        )
-        return tagged_languages
+        The predicate will use == for all comparisons.
 
-    def tag_entities(
-        self, unit: Literal["word", "sentence", "paragraph", "document"] = "word"
-    ) -> list[tuple[str, str]]:
-        """Tags each word of the text with either the category of entity it represents (i.e. person, place, or organization) or its part of speech.
+        :param ref_dict: A specification of key, value pairs
+        :type ref_dict: dict
+        :return: The populated predicate object
+        :rtype: XAPredicate
 
-        :param unit: The grammatical unit to divide the text into for tagging, defaults to "word"
-        :type unit: Literal["word", "sentence", "paragraph", "document"]
-        :return: A list of tuples identifying each word of the text and its entity category or part of speech
-        :rtype: list[tuple[str, str]]
+        .. versionadded:: 0.0.4
+        """
+        for key, value in ref_dict.items():
+            self.keys.append(key)
+            self.operators.append("==")
+            self.values.append(value)
+        return self
 
-        :Example:
+    def from_args(self, *args) -> "XAPredicate":
+        """Populates the XAPredicate object from the supplied key, value argument pairs.
 
-        >>> import PyXA
-        >>> text = PyXA.XAText("Tim Cook is the CEO of Apple.")
-        >>> print(text.tag_entities())
-        [('Tim', 'PersonalName'), ('Cook', 'PersonalName'), ('is', 'Verb'), ('the', 'Determiner'), ('CEO', 'Noun'), ('of', 'Preposition'), ('Apple', 'OrganizationName')]
+        The number of keys and values must be equal. The predicate will use == for all comparisons.
 
-        .. versionadded:: 0.1.0
-        """
-        import NaturalLanguage
+        :raises InvalidPredicateError: Raised when the number of keys does not match the number of values
+        :return: The populated predicate object
+        :rtype: XAPredicate
 
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeNameTypeOrLexicalClass]
-        )
-        tagger.setString_(str(self.xa_elem))
+        .. versionadded:: 0.0.4
+        """
+        arg_num = len(args)
+        if arg_num % 2 != 0:
+            raise InvalidPredicateError(
+                "The number of keys and values must be equal; the number of arguments must be an even number."
+            )
 
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
+        for index, value in enumerate(args):
+            if index % 2 == 0:
+                self.keys.append(value)
+                self.operators.append("==")
+                self.values.append(args[index + 1])
+        return self
 
-        tagged_languages = []
+    def evaluate(self, target: Union["AppKit.NSArray", XAList]) -> "AppKit.NSArray":
+        """Evaluates the predicate on the given array.
 
-        def apply_tags(tag, token_range, error):
-            word_phrase = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            if word_phrase.strip() != "":
-                tagged_languages.append((word_phrase, tag))
+        :param target: The array to evaluate against the predicate
+        :type target: AppKit.NSArray
+        :return: The filtered array
+        :rtype: AppKit.NSArray
 
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeNameTypeOrLexicalClass,
-            NaturalLanguage.NLTaggerOmitPunctuation
-            | NaturalLanguage.NLTaggerOmitWhitespace,
-            apply_tags,
-        )
-        return tagged_languages
+        .. versionadded:: 0.0.4
+        """
+        target_list = target
+        if isinstance(target, XAList):
+            target_list = target.xa_elem
 
-    def tag_lemmas(
-        self, unit: Literal["word", "sentence", "paragraph", "document"] = "word"
-    ) -> list[tuple[str, str]]:
-        """Tags each word of the text with its stem word.
+        placeholders = ["%@"] * len(self.values)
+        expressions = [
+            " ".join(expr) for expr in zip(self.keys, self.operators, placeholders)
+        ]
+        format = "( " + " ) && ( ".join(expressions) + " )"
 
-        :param unit: The grammatical unit to divide the text into for tagging, defaults to "word"
-        :type unit: Literal["word", "sentence", "paragraph", "document"]
-        :return: A list of tuples identifying each word of the text and its stem words
-        :rtype: list[tuple[str, str]]
+        ls = []
+        predicate = AppKit.NSPredicate.predicateWithFormat_(format, *self.values)
 
-        :Example 1: Lemmatize each word in a text
+        try:
+            # Not sure why this is necessary sometimes, but it is.
+            ls = XABackends.filtered_elements(
+                target_list, AppKit.NSPredicate.predicateWithFormat_(str(predicate))
+            )
+        except ValueError:
+            ls = XABackends.filtered_elements(target_list, predicate)
 
-        >>> import PyXA
-        >>> text = PyXA.XAText("Here’s to the crazy ones. The misfits. The rebels.")
-        >>> print(text.tag_lemmas())
-        [('Here’s', 'here'), ('to', 'to'), ('the', 'the'), ('crazy', 'crazy'), ('ones', 'one'), ('The', 'the'), ('misfits', 'misfit'), ('The', 'the'), ('rebels', 'rebel')]
+        if isinstance(target, XAList):
+            return target.__class__(
+                {
+                    "parent": target,
+                    "element": ls,
+                    "appref": self.xa_aref,
+                }
+            )
+        return ls
 
-        :Example 2: Combine parts of speech tagging and lemmatization
+    def evaluate_with_format(
+        target: Union["AppKit.NSArray", XAList], fmt: str, *fmt_parameters
+    ) -> "AppKit.NSArray":
+        """Evaluates the specified array against a predicate with the given format.
 
-        >>> import PyXA
-        >>> text = PyXA.XAText("The quick brown fox tries to jump over the sleeping lazy dog.")
-        >>> verbs = [pos[0] for pos in text.tag_parts_of_speech() if pos[1] == "Verb"]
-        >>> for index, verb in enumerate(verbs):
-        >>>     print(index, PyXA.XAText(verb).tag_lemmas())
-        0 [('tries', 'try')]
-        1 [('jump', 'jump')]
-        2 [('sleeping', 'sleep')]
+        :param target: The array to filter
+        :type target: AppKit.NSArray
+        :param fmt: The format string for the predicate
+        :type fmt: str
+        :param fmt_parameters: The parameters for the format string
+        :type fmt_parameters: Any
+        :return: The filtered array
+        :rtype: AppKit.NSArray
 
-        .. versionadded:: 0.1.0
+        .. versionchanged:: 0.3.0
+
+            Added the :attr:`fmt_parameters` parameter.
+
+        .. versionadded:: 0.0.4
         """
-        import NaturalLanguage
+        target_list = target
+        if isinstance(target, XAList):
+            target_list = target.xa_elem
 
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeLemma]
+        predicate = AppKit.NSPredicate.predicateWithFormat_argumentArray_(
+            fmt, fmt_parameters
         )
-        tagger.setString_(str(self.xa_elem))
+        ls = XABackends.filtered_elements(target_list, predicate)
 
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
+        if isinstance(target, XAList):
+            return target.__class__(
+                {
+                    "parent": target,
+                    "element": ls,
+                    "appref": AppKit.NSApplication.sharedApplication(),
+                }
+            )
+        return ls
 
-        tagged_lemmas = []
+    def evaluate_with_dict(
+        target: Union["AppKit.NSArray", XAList], properties_dict: dict
+    ) -> "AppKit.NSArray":
+        """Evaluates the specified array against a predicate constructed from the supplied dictionary.
 
-        def apply_tags(tag, token_range, error):
-            word_phrase = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            if word_phrase.strip() != "":
-                tagged_lemmas.append((word_phrase, tag))
+        The predicate will use == for all comparisons.
 
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeLemma,
-            NaturalLanguage.NLTaggerOmitPunctuation
-            | NaturalLanguage.NLTaggerOmitWhitespace
-            | NaturalLanguage.NLTaggerJoinContractions,
-            apply_tags,
-        )
-        return tagged_lemmas
+        :param target: The array to filter
+        :type target: AppKit.NSArray
+        :param properties_dict: The specification of key, value pairs
+        :type properties_dict: dict
+        :return: The filtered array
+        :rtype: AppKit.NSArray
 
-    def tag_sentiments(
-        self,
-        sentiment_scale: list[str] = None,
-        unit: Literal["word", "sentence", "paragraph", "document"] = "paragraph",
-    ) -> list[tuple[str, str]]:
-        """Tags each paragraph of the text with a sentiment rating.
+        .. versionadded:: 0.0.4
+        """
+        target_list = target
+        if isinstance(target, XAList):
+            target_list = target.xa_elem
 
-        :param sentiment_scale: A list of terms establishing a range of sentiments from most negative to most postive
-        :type sentiment_scale: list[str]
-        :param unit: The grammatical unit to divide the text into for tagging, defaults to "paragraph"
-        :type unit: Literal["word", "sentence", "paragraph", "document"]
-        :return: A list of tuples identifying each paragraph of the text and its sentiment rating
-        :rtype: list[tuple[str, str]]
+        fmt = ""
+        for key, value in properties_dict.items():
+            if isinstance(value, str):
+                value = "'" + value + "'"
+            fmt += f"( {key} == {value} ) &&"
 
-        :Example 1: Assess the sentiment of a string
+        predicate = AppKit.NSPredicate.predicateWithFormat_(fmt[:-3])
+        ls = XABackends.filtered_elements(target_list, predicate)
 
-        >>> import PyXA
-        >>> text = PyXA.XAText("This sucks.\\nBut this is great!")
-        >>> print(text.tag_sentiments())
-        [('This sucks.\\n', 'Negative'), ('But this is great!', 'Positive')]
+        if isinstance(target, XAList):
+            return target.__class__(
+                {
+                    "parent": target,
+                    "element": ls,
+                    "appref": AppKit.NSApplication.sharedApplication(),
+                }
+            )
+        return ls
 
-        :Example 2: Use a custom sentiment scale
+    def add_condition(
+        self,
+        property: str,
+        comparison_operation: str,
+        value1: Any,
+        value2: Union[Any, None] = None,
+    ):
+        """Appends a condition using the comparison operation with the given symbol or name to the end of the predicate format.
 
-        >>> import PyXA
-        >>> text = PyXA.XAText("This sucks.\\nBut this is good!\\nAnd this is great!")
-        >>> print(text.tag_sentiments(sentiment_scale=["Very Negative", "Negative", "Somewhat Negative", "Neutral", "Somewhat Positive", "Positive", "Very Positive"]))
-        [('This sucks.\\n', 'Very Negative'), ('But this is good!\\n', 'Neutral'), ('And this is great!', 'Very Positive')]
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param comparison_operation: The symbol or name of a comparison operation, such as > or "begins with"
+        :type comparison_operation: str
+        :param value1: The target value of the condition
+        :type value1: Any
+        :param value2: The second target value of the condition, used for `BETWEEN` comparisons, defaults to None
+        :type value2: Union[Any, None], optional
+        :raises InvalidPredicateError: Raised when the comparison operation is not recognized
+
+        .. versionadded:: 0.3.1
+        """
+        if comparison_operation in ["=", "==", "eq", "EQ", "equals", "EQUALS"]:
+            self.add_eq_condition(property, value1)
+        elif comparison_operation in [
+            "!=",
+            "!==",
+            "neq",
+            "NEQ",
+            "not equal to",
+            "NOT EQUAL TO",
+        ]:
+            self.add_neq_condition(property, value1)
+        elif comparison_operation in [
+            ">",
+            "gt",
+            "GT",
+            "greater than",
+            "GREATER THAN",
+        ]:
+            self.add_gt_condition(property, value1)
+        elif comparison_operation in ["<", "lt", "LT", "less than", "LESS THAN"]:
+            self.add_lt_condition(property, value1)
+        elif comparison_operation in [
+            ">=",
+            "geq",
+            "GEQ",
+            "greater than or equal to",
+            "GREATER THAN OR EQUAL TO",
+        ]:
+            self.add_geq_condition(property, value1)
+        elif comparison_operation in [
+            "<=",
+            "leq",
+            "LEQ",
+            "less than or equal to",
+            "LESS THAN OR EQUAL TO",
+        ]:
+            self.add_leq_condition(property, value1)
+        elif comparison_operation in [
+            "begins with",
+            "beginswith",
+            "BEGINS WITH",
+            "BEGINSWITH",
+        ]:
+            self.add_begins_with_condition(property, value1)
+        elif comparison_operation in ["contains", "CONTAINS"]:
+            self.add_contains_condition(property, value1)
+        elif comparison_operation in [
+            "ends with",
+            "endswith",
+            "ENDS WITH",
+            "ENDSWITH",
+        ]:
+            self.add_ends_with_condition(property, value1)
+        elif comparison_operation in ["between", "BETWEEN"]:
+            self.add_between_condition(property, value1, value2)
+        elif comparison_operation in ["matches", "MATCHES"]:
+            self.add_match_condition(property, value1)
+        else:
+            raise InvalidPredicateError(
+                f"Unknown comparison operation: {comparison_operation}"
+            )
 
-        :Example 3: Use other tag units
+    # EQUAL
+    def add_eq_condition(self, property: str, value: Any):
+        """Appends an `==` condition to the end of the predicate format.
 
-        >>> import PyXA
-        >>> text = PyXA.XAText("This sucks.\\nBut this is good!\\nAnd this is great!")
-        >>> print(1, text.tag_sentiments())
-        >>> print(2, text.tag_sentiments(unit="word"))
-        >>> print(3, text.tag_sentiments(unit="document"))
-        1 [('This sucks.\\n', 'Negative'), ('But this is good!\\n', 'Neutral'), ('And this is great!', 'Positive')]
-        2 [('This', 'Negative'), ('sucks', 'Negative'), ('.', 'Negative'), ('But', 'Neutral'), ('this', 'Neutral'), ('is', 'Neutral'), ('good', 'Neutral'), ('!', 'Neutral'), ('And', 'Positive'), ('this', 'Positive'), ('is', 'Positive'), ('great', 'Positive'), ('!', 'Positive')]
-        3 [('This sucks.\\nBut this is good!\\nAnd this is great!', 'Neutral')]
+        The added condition will have the form `property == value`.
 
-        .. versionadded:: 0.1.0
-        """
-        import NaturalLanguage
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        if sentiment_scale is None or len(sentiment_scale) == 0:
-            sentiment_scale = ["Negative", "Neutral", "Positive"]
+        .. versionadded:: 0.0.4
+        """
+        self.keys.append(property)
+        self.operators.append("==")
+        self.values.append(value)
 
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
+    def insert_eq_condition(self, index: int, property: str, value: Any):
+        """Inserts an `==` condition to the predicate format at the desired location, specified by index.
 
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeSentimentScore]
-        )
-        tagger.setString_(str(self.xa_elem))
+        The added condition will have the form `property == value`.
 
-        tagged_sentiments = []
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        def apply_tags(tag, token_range, error):
-            paragraph = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            if paragraph.strip() != "":
-                # Map raw tag value to range length
-                raw_value = float(tag or 0)
-                scaled = (raw_value + 1.0) / 2.0 * (len(sentiment_scale) - 1)
-
-                label = sentiment_scale[int(scaled)]
-                tagged_sentiments.append((paragraph, label))
+        .. versionadded:: 0.0.4
+        """
+        self.keys.insert(index, property)
+        self.operators.insert(index, "==")
+        self.values.insert(index, value)
 
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeSentimentScore,
-            0,
-            apply_tags,
-        )
-        return tagged_sentiments
+    # NOT EQUAL
+    def add_neq_condition(self, property: str, value: Any):
+        """Appends a `!=` condition to the end of the predicate format.
 
-    def extract_urls(self) -> list["XAURL"]:
-        """Gets a list of URLs in the text.
+        The added condition will have the form `property != value`.
 
-        :return: The list of URLs.
-        :rtype: list[XAURL]
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.0.4
         """
-        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
-            AppKit.NSTextCheckingTypeLink, None
-        )
-        if detector[1] is not None:
-            raise Exception("Error creating data detector")
+        self.keys.append(property)
+        self.operators.append("!=")
+        self.values.append(value)
 
-        matches = detector[0].matchesInString_options_range_(
-            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
-        )
-        return [XAURL(match.URL()) for match in matches]
+    def insert_neq_condition(self, index: int, property: str, value: Any):
+        """Inserts a `!=` condition to the predicate format at the desired location, specified by index.
 
-    def extract_dates(self) -> list["XADatetimeBlock"]:
-        """Gets a list of dates and durations in the text.
+        The added condition will have the form `property != value`.
 
-        :return: The list of dates.
-        :rtype: list[XADatetimeBlock]
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.0.4
         """
-        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
-            AppKit.NSTextCheckingTypeDate, None
-        )
-        if detector[1] is not None:
-            raise Exception("Error creating data detector")
+        self.keys.insert(index, property)
+        self.operators.insert(index, "!=")
+        self.values.insert(index, value)
 
-        matches = detector[0].matchesInString_options_range_(
-            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
-        )
-        return [XADatetimeBlock(match.date(), match.duration()) for match in matches]
+    # GREATER THAN OR EQUAL
+    def add_geq_condition(self, property: str, value: Any):
+        """Appends a `>=` condition to the end of the predicate format.
 
-    def extract_addresses(self):
-        """Gets a list of addresses in the text.
+        The added condition will have the form `property >= value`.
 
-        :return: The list of addresses.
-        :rtype: list[XALocation]
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        .. versionadded:: 0.3.0
+        .. versionadded:: 0.0.4
         """
-        import CoreLocation
+        self.keys.append(property)
+        self.operators.append(">=")
+        self.values.append(value)
 
-        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
-            AppKit.NSTextCheckingTypeAddress, None
-        )
-        if detector[1] is not None:
-            raise Exception()
+    def insert_geq_condition(self, index: int, property: str, value: Any):
+        """Inserts a `>=` condition to the predicate format at the desired location, specified by index.
 
-        matches = detector[0].matchesInString_options_range_(
-            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
-        )
-        address_dicts = [match.addressComponents() for match in matches]
+        The added condition will have the form `property >= value`.
 
-        geocoder = CoreLocation.CLGeocoder.alloc().init()
-        addresses = []
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        def add_location(placemarks, error):
-            nonlocal addresses
-            if error is not None:
-                raise Exception("Error creating data detector")
+        .. versionadded:: 0.0.4
+        """
+        self.keys.insert(index, property)
+        self.operators.insert(index, ">=")
+        self.values.insert(index, value)
 
-            if len(placemarks) > 0:
-                addresses.append(
-                    XALocation(
-                        placemarks[0].location(),
-                        placemarks[0].name(),
-                        0,
-                        0,
-                        None,
-                        0,
-                        placemarks[0].postalAddress(),
-                    )
-                )
+    # LESS THAN OR EQUAL
+    def add_leq_condition(self, property: str, value: Any):
+        """Appends a `<=` condition to the end of the predicate format.
 
-            if len(addresses) == len(address_dicts):
-                AppHelper.stopEventLoop()
+        The added condition will have the form `property <= value`.
 
-        for address_dict in address_dicts:
-            address_string = ", ".join(
-                [x for x in address_dict.values() if x is not None]
-            )
-            geocoder.geocodeAddressString_completionHandler_(
-                address_string, add_location
-            )
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        AppHelper.runConsoleEventLoop()
-        return addresses
+        .. versionadded:: 0.0.4
+        """
+        self.keys.append(property)
+        self.operators.append("<=")
+        self.values.append(value)
 
-    def extract_phone_numbers(self):
-        """Gets a list of phone numbers in the text.
+    def insert_leq_condition(self, index: int, property: str, value: Any):
+        """Inserts a `<=` condition to the predicate format at the desired location, specified by index.
 
-        :return: The list of phone numbers.
-        :rtype: list[XAText]
+        The added condition will have the form `property <= value`.
 
-        .. versionadded:: 0.3.0
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
+
+        .. versionadded:: 0.0.4
         """
-        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
-            AppKit.NSTextCheckingTypePhoneNumber, None
-        )
-        if detector[1] is not None:
-            raise Exception("Error creating data detector")
+        self.keys.insert(index, property)
+        self.operators.insert(index, "<=")
+        self.values.insert(index, value)
 
-        matches = detector[0].matchesInString_options_range_(
-            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
-        )
-        return [XAText(match.phoneNumber()) for match in matches]
+    # GREATER THAN
+    def add_gt_condition(self, property: str, value: Any):
+        """Appends a `>` condition to the end of the predicate format.
 
-    def paragraphs(self, filter: dict = None) -> "XAParagraphList":
-        """Gets a list of paragraphs in the text.
+        The added condition will have the form `property > value`.
 
-        :param filter: The properties and associated values to filter paragraphs by, defaults to None
-        :type filter: dict, optional
-        :return: The list of paragraphs
-        :rtype: XAParagraphList
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        :Example 1: Get paragraphs of a text string
+        .. versionadded:: 0.0.4
+        """
+        self.keys.append(property)
+        self.operators.append(">")
+        self.values.append(value)
 
-        >>> import PyXA
-        >>> string = \"\"\"This is the first paragraph.
-        >>>
-        >>> This is the second paragraph.\"\"\"
-        >>> text = PyXA.XAText(string)
-        >>> print(text.paragraphs())
-        <<class 'PyXA.XAWordList'>['This is the first paragraph.', 'This is the second paragraph. Neat! Very cool.']>
+    def insert_gt_condition(self, index: int, property: str, value: Any):
+        """Inserts a `>` condition to the predicate format at the desired location, specified by index.
 
-        :Example 2: Get paragraphs of a Note
+        The added condition will have the form `property > value`.
 
-        >>> import PyXA
-        >>> app = PyXA.Application("Notes")
-        >>> note = app.notes()[0]
-        >>> text = PyXA.XAText(note.plaintext)
-        >>> print(text.paragraphs())
-        <<class 'PyXA.XAWordList'>['This is the first paragraph.', 'This is the second paragraph. Neat! Very cool.']>
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        .. versionadded:: 0.0.1
+        .. versionadded:: 0.0.4
         """
-        if isinstance(self.xa_elem, str):
-            ls = [x for x in self.xa_elem.split("\n") if x.strip() != ""]
-            return self._new_element(ls, XAWordList, filter)
-        else:
-            return self._new_element(self.xa_elem.paragraphs(), XAParagraphList, filter)
-
-    def sentences(self) -> "XASentenceList":
-        """Gets a list of sentences in the text.
+        self.keys.insert(index, property)
+        self.operators.insert(index, ">")
+        self.values.insert(index, value)
 
-        :return: The list of sentencnes
-        :rtype: XASentenceList
+    # LESS THAN
+    def add_lt_condition(self, property: str, value: Any):
+        """Appends a `<` condition to the end of the predicate format.
 
-        :Example:
+        The added condition will have the form `property < value`.
 
-        >>> import PyXA
-        >>> app = PyXA.Application("Notes")
-        >>> note = app.notes()[0]
-        >>> text = PyXA.XAText(note.plaintext)
-        >>> print(text.sentences())
-        <<class 'PyXA.XASentenceList'>['This is the first paragraph.\\n', '\\n', 'This is the second paragraph. ', 'Neat! ', 'Very cool.']>
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.0.4
         """
-        raw_string = self.xa_elem
-        if hasattr(self.xa_elem, "get"):
-            raw_string = self.xa_elem.get()
+        self.keys.append(property)
+        self.operators.append("<")
+        self.values.append(value)
 
-        sentences = []
-        tokenizer = AppKit.NLTokenizer.alloc().initWithUnit_(
-            AppKit.kCFStringTokenizerUnitSentence
-        )
-        tokenizer.setString_(raw_string)
-        for char_range in tokenizer.tokensForRange_((0, len(raw_string))):
-            start = char_range.rangeValue().location
-            end = start + char_range.rangeValue().length
-            sentences.append(raw_string[start:end])
+    def insert_lt_condition(self, index: int, property: str, value: Any):
+        """Inserts a `<` condition to the predicate format at the desired location, specified by index.
 
-        ls = AppKit.NSArray.alloc().initWithArray_(sentences)
-        return self._new_element(sentences, XASentenceList)
+        The added condition will have the form `property < value`.
 
-    def words(self, filter: dict = None) -> "XAWordList":
-        """Gets a list of words in the text.
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-        :return: The list of words
-        :rtype: XAWordList
+        .. versionadded:: 0.0.4
+        """
+        self.keys.insert(index, property)
+        self.operators.insert(index, "<")
+        self.values.insert(index, value)
 
-        :Example:
+    # BETWEEN
+    def add_between_condition(
+        self, property: str, value1: Union[int, float], value2: Union[int, float]
+    ):
+        """Appends a `BETWEEN` condition to the end of the predicate format.
 
-        >>> import PyXA
-        >>> app = PyXA.Application("Notes")
-        >>> note = app.notes()[0]
-        >>> text = PyXA.XAText(note.plaintext)
-        >>> print(text.words())
-        <<class 'PyXA.XAWordList'>['This', 'is', 'the', 'first', 'paragraph.', 'This', 'is', 'the', 'second', 'paragraph.', 'Neat!', 'Very', 'cool.']>
+        The added condition will have the form `property BETWEEN [value1, value2]`.
 
-        .. versionadded:: 0.0.1
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value1: The lower target value of the condition
+        :type value1: Union[int, float]
+        :param value2: The upper target value of the condition
+        :type value2: Union[int, float]
+
+        .. versionadded:: 0.0.4
         """
-        if isinstance(self.xa_elem, str):
-            ls = self.xa_elem.split()
-            return self._new_element(ls, XAWordList, filter)
-        else:
-            return self._new_element(self.xa_elem.words(), XAWordList, filter)
+        self.keys.append(property)
+        self.operators.append("BETWEEN")
+        self.values.append([value1, value2])
 
-    def characters(self, filter: dict = None) -> "XACharacterList":
-        """Gets a list of characters in the text.
+    def insert_between_condition(
+        self,
+        index: int,
+        property: str,
+        value1: Union[int, float],
+        value2: Union[int, float],
+    ):
+        """Inserts a `BETWEEN` condition to the predicate format at the desired location, specified by index.
 
-        :return: The list of characters
-        :rtype: XACharacterList
+        The added condition will have the form `property BETWEEN [value1, value2]`.
 
-        :Example 1: Get all characters in a text
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value1: The lower target value of the condition
+        :type value1: Union[int, float]
+        :param value2: The upper target value of the condition
+        :type valu2e: Union[int, float]
 
-        >>> import PyXA
-        >>> app = PyXA.Application("Notes")
-        >>> note = app.notes()[0]
-        >>> text = PyXA.XAText(note.plaintext)
-        >>> print(text.characters())
-        <<class 'PyXA.XACharacterList'>['T', 'h', 'i', 's', ' ', 'i', 's', ' ', 't', 'h', 'e', ' ', 'f', 'i', 'r', 's', 't', ' ', 'p', 'a', 'r', 'a', 'g', 'r', 'a', 'p', 'h', '.', '\\n', '\\n', 'T', 'h', 'i', 's', ' ', 'i', 's', ' ', 't', 'h', 'e', ' ', 's', 'e', 'c', 'o', 'n', 'd', ' ', 'p', 'a', 'r', 'a', 'g', 'r', 'a', 'p', 'h', '.', ' ', 'N', 'e', 'a', 't', '!', ' ', 'V', 'e', 'r', 'y', ' ', 'c', 'o', 'o', 'l', '.']>
+        .. versionadded:: 0.0.4
+        """
+        self.keys.insert(index, property)
+        self.operators.insert(index, "BETWEEN")
+        self.values.insert(index, [value1, value2])
 
-        :Example 2: Get the characters of the first word in a text
+    # BEGINSWITH
+    def add_begins_with_condition(self, property: str, value: Any):
+        """Appends a `BEGINSWITH` condition to the end of the predicate format.
 
-        >>> import PyXA
-        >>> app = PyXA.Application("Notes")
-        >>> note = app.notes()[0]
-        >>> text = PyXA.XAText(note.plaintext)
-        >>> print(text.words()[0].characters())
-        <<class 'PyXA.XACharacterList'>['T', 'h', 'i', 's']>
+        The added condition will have the form `property BEGINSWITH value`.
 
-        .. versionadded:: 0.0.1
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
+
+        .. versionadded:: 0.0.4
         """
-        if isinstance(self.xa_elem, str):
-            ls = list(self.xa_elem)
-            return self._new_element(ls, XACharacterList, filter)
-        else:
-            return self._new_element(
-                self.xa_elem.characters().get(), XACharacterList, filter
-            )
+        self.keys.append(property)
+        self.operators.append("BEGINSWITH")
+        self.values.append(value)
 
-    def attribute_runs(self, filter: dict = None) -> "XAAttributeRunList":
-        """Gets a list of attribute runs in the text. For formatted text, this returns all sequences of characters sharing the same attributes.
+    def insert_begins_with_condition(self, index: int, property: str, value: Any):
+        """Inserts a `BEGINSWITH` condition to the predicate format at the desired location, specified by index.
 
-        :param filter: The properties and associated values to filter attribute runs by, defaults to None
-        :type filter: dict, optional
-        :return: The list of attribute runs
-        :rtype: XAAttributeRunList
+        The added condition will have the form `property BEGINSWITH value`.
 
-        .. versionadded:: 0.0.1
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
+
+        .. versionadded:: 0.0.4
         """
-        if isinstance(self.xa_elem, str):
-            return []
-        else:
-            return self._new_element(
-                self.xa_elem.attributeRuns(), XAAttributeRunList, filter
-            )
+        self.keys.insert(index, property)
+        self.operators.insert(index, "BEGINSWITH")
+        self.values.insert(index, value)
 
-    def attachments(self, filter: dict = None) -> "XAAttachmentList":
-        """Gets a list of attachments of the text.
+    # ENDSWITH
+    def add_ends_with_condition(self, property: str, value: Any):
+        """Appends a `ENDSWITH` condition to the end of the predicate format.
 
-        :param filter: The properties and associated values to filter attachments by, defaults to None
-        :type filter: dict, optional
-        :return: The list of attachments
-        :rtype: XAAttachmentList
+        The added condition will have the form `property ENDSWITH value`.
 
-        .. versionadded:: 0.0.1
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
+
+        .. versionadded:: 0.0.4
         """
-        if isinstance(self.xa_elem, str):
-            return []
-        else:
-            return self._new_element(
-                self.xa_elem.attachments(), XAAttachmentList, filter
-            )
+        self.keys.append(property)
+        self.operators.append("ENDSWITH")
+        self.values.append(value)
 
-    def __len__(self):
-        return len(self.xa_elem.get())
+    def insert_ends_with_condition(self, index: int, property: str, value: Any):
+        """Inserts a `ENDSWITH` condition to the predicate format at the desired location, specified by index.
 
-    def __str__(self):
-        if isinstance(self.xa_elem, str):
-            return self.xa_elem
-        return str(self.xa_elem.get())
+        The added condition will have the form `property ENDSWITH value`.
 
-    def __repr__(self):
-        if isinstance(self.xa_elem, str):
-            return self.xa_elem
-        return str(self.xa_elem.get())
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
+        .. versionadded:: 0.0.4
+        """
+        self.keys.insert(index, property)
+        self.operators.insert(index, "ENDSWITH")
+        self.values.insert(index, value)
 
-class XAParagraphList(XATextList):
-    """A wrapper around lists of paragraphs that employs fast enumeration techniques.
+    # CONTAINS
+    def add_contains_condition(self, property: str, value: Any):
+        """Appends a `CONTAINS` condition to the end of the predicate format.
 
-    .. versionadded:: 0.0.5
-    """
+        The added condition will have the form `property CONTAINS value`.
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XAParagraph)
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
+        .. versionadded:: 0.0.4
+        """
+        self.keys.append(property)
+        self.operators.append("CONTAINS")
+        self.values.append(value)
 
-class XAParagraph(XAText):
-    """A class for managing and interacting with paragraphs in text documents.
+    def insert_contains_condition(self, index: int, property: str, value: Any):
+        """Inserts a `CONTAINS` condition to the predicate format at the desired location, specified by index.
 
-    .. versionadded:: 0.0.1
-    """
+        The added condition will have the form `property CONTAINS value`.
 
-    def __init__(self, properties):
-        super().__init__(properties)
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
+        .. versionadded:: 0.0.4
+        """
+        self.keys.insert(index, property)
+        self.operators.insert(index, "CONTAINS")
+        self.values.insert(index, value)
 
-class XASentenceList(XATextList):
-    """A wrapper around lists of sentences that employs fast enumeration techniques.
+    # MATCHES
+    def add_match_condition(self, property: str, value: Any):
+        """Appends a `MATCHES` condition to the end of the predicate format.
 
-    .. versionadded:: 0.0.5
-    """
+        The added condition will have the form `property MATCHES value`.
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XASentence)
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
+        .. versionadded:: 0.0.4
+        """
+        self.keys.append(property)
+        self.operators.append("MATCHES")
+        self.values.append(value)
 
-class XASentence(XAText):
-    """A class for managing and interacting with sentences in text documents.
+    def insert_match_condition(self, index: int, property: str, value: Any):
+        """Inserts a `MATCHES` condition to the predicate format at the desired location, specified by index.
 
-    .. versionadded:: 0.0.1
-    """
+        The added condition will have the form `property MATCHES value`.
 
-    def __init__(self, properties):
-        super().__init__(properties)
-
-
-class XAWordList(XATextList):
-    """A wrapper around lists of words that employs fast enumeration techniques.
-
-    .. versionadded:: 0.0.5
-    """
+        :param property: A property of an object to check the condition against
+        :type property: str
+        :param value: The target value of the condition
+        :type value: Any
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XAWord)
+        .. versionadded:: 0.0.4
+        """
+        self.keys.insert(index, property)
+        self.operators.insert(index, "MATCHES")
+        self.values.insert(index, value)
 
+    def get_clipboard_representation(self) -> str:
+        """Gets a clipboard-codable representation of the predicate.
 
-class XAWord(XAText):
-    """A class for managing and interacting with words in text documents.
+        When a predicate is copied to the clipboard, the string representation of the predicate is added to the clipboard.
 
-    .. versionadded:: 0.0.1
-    """
+        :return: The string representation of the predicate
+        :rtype: str
 
-    def __init__(self, properties):
-        super().__init__(properties)
+        .. versionadded:: 0.0.8
+        """
+        placeholders = ["%@"] * len(self.values)
+        expressions = [
+            " ".join(expr) for expr in zip(self.keys, self.operators, placeholders)
+        ]
+        format = "( " + " ) && ( ".join(expressions) + " )"
+        predicate = AppKit.NSPredicate.predicateWithFormat_(format, *self.values)
+        return predicate.predicateFormat()
 
 
-class XACharacterList(XATextList):
-    """A wrapper around lists of characters that employs fast enumeration techniques.
+class XAURLList(XAList):
+    """A list of URLs. Supports bulk operations.
 
-    .. versionadded:: 0.0.5
+    .. versionadded:: 0.1.2
     """
 
     def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XACharacter)
+        super().__init__(properties, XAURL, filter)
 
+    def base_url(self) -> list[str]:
+        return [url.base_url for url in self]
 
-class XACharacter(XAText):
-    """A class for managing and interacting with characters in text documents.
+    def parameters(self) -> list[str]:
+        return [url.parameters for url in self]
 
-    .. versionadded:: 0.0.1
-    """
+    def scheme(self) -> list[str]:
+        return [url.scheme for url in self]
 
-    def __init__(self, properties):
-        super().__init__(properties)
+    def fragment(self) -> list[str]:
+        return [url.fragment for url in self]
 
+    def port(self) -> list[int]:
+        return [url.port for url in self]
 
-class XAAttributeRunList(XATextList):
-    """A wrapper around lists of attribute runs that employs fast enumeration techniques.
+    def html(self) -> list["bs4.element.Tag"]:
+        return [url.html for url in self]
 
-    .. versionadded:: 0.0.5
-    """
+    def title(self) -> list[str]:
+        return [url.title for url in self]
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XAAttributeRun)
+    def open(self):
+        """Opens each URL in the list.
 
+        .. versionadded:: 0.1.2
+        """
+        for url in self:
+            url.open()
 
-class XAAttributeRun(XAText):
-    """A class for managing and interacting with attribute runs in text documents.
+    def extract_text(self) -> list[list[str]]:
+        """Extracts the visible text of each URL in the list.
 
-    .. versionadded:: 0.0.1
-    """
+        .. versionadded:: 0.1.2
+        """
+        ls = [url.extract_text() for url in self]
+        return ls
 
-    def __init__(self, properties):
-        super().__init__(properties)
+    def extract_images(self) -> list[list["XAImage"]]:
+        """Extracts the images of each URL in the list.
+
+        .. versionadded:: 0.1.2
+        """
+        ls = [url.extract_images() for url in self]
+        return ls
 
 
-class XAAttachmentList(XATextList):
-    """A wrapper around lists of text attachments that employs fast enumeration techniques.
+class XAURL(XAObject, XAClipboardCodable):
+    """A URL using any scheme recognized by the system. This can be a file URL.
 
     .. versionadded:: 0.0.5
     """
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XAAttachment)
+    def __init__(self, url: Union[str, "AppKit.NSURL", "XAURL", "XAPath"]):
+        super().__init__()
+        self.soup: "bs4.BeautifulSoup" = None  #: The bs4 object for the URL, starts as None until a bs4-related action is made
+        self.url: str  #: The string form of the URL
 
+        if isinstance(url, list):
+            # Elevate to XAURLList
+            new_self = XAURLList(
+                {"element": AppKit.NSArray.alloc().initWithArray_(url)}
+            )
+            self.__dict__ = new_self.__dict__
+            self.__class__ = new_self.__class__
+            self = new_self
+            return
 
-class XAAttachment(XAObject):
-    """A class for managing and interacting with attachments in text documents.
+        if isinstance(url, dict):
+            # Initialized via XAURLList
+            url = url["element"]
 
-    .. versionadded:: 0.0.1
-    """
+        if isinstance(url, str):
+            # URL-encode spaces
+            url = url.replace(" ", "%20")
 
-    def __init__(self, properties):
-        super().__init__(properties)
+            if url.startswith("/"):
+                # Prepend file scheme
+                url = "file://" + url
+            elif url.replace(".", "").isdecimal():
+                # URL is an IP -- must add http:// prefix
+                if ":" not in url:
+                    # No port provided, add port 80 by default
+                    url = "http://" + url + ":80"
+                else:
+                    url = "http://" + url
+            elif "://" not in url:
+                # URL is not currently valid, try prepending http://
+                url = "http://" + url
 
+            self.url = url
+            url = AppKit.NSURL.alloc().initWithString_(url)
+        elif isinstance(url, XAURL) or isinstance(url, XAPath):
+            self.url = url.url
+            url = url.xa_elem
+        else:
+            self.url = str(url)
 
-class XAColorList(XATextList):
-    """A wrapper around lists of colors that employs fast enumeration techniques.
+        self.xa_elem = url
 
-    .. versionadded:: 0.0.6
-    """
+    @property
+    def base_url(self) -> str:
+        return self.xa_elem.host()
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, XAColor, filter)
+    @property
+    def parameters(self) -> str:
+        """The query parameters of the URL."""
+        return self.xa_elem.query()
 
+    @property
+    def scheme(self) -> str:
+        """The URI scheme of the URL."""
+        return self.xa_elem.scheme()
+
+    @property
+    def fragment(self) -> str:
+        """The fragment identifier following a # symbol in the URL."""
+        return self.xa_elem.fragment()
+
+    @property
+    def port(self) -> int:
+        """The port that the URL points to."""
+        return self.xa_elem.port()
+
+    @property
+    def html(self) -> "bs4.element.Tag":
+        """The html of the URL."""
+        if self.soup is None:
+            self.__get_soup()
+        return self.soup.html
 
-class XAColor(macimg.Color, XAObject, XAClipboardCodable):
-    def __init__(self, *args):
-        super().__init__(*args)
-        self.xa_elem = self._nscolor
+    @property
+    def title(self) -> str:
+        """The title of the URL."""
+        if self.soup is None:
+            self.__get_soup()
+        return self.soup.title.text
 
-    def get_clipboard_representation(self) -> "AppKit.NSColor":
-        """Gets a clipboard-codable representation of the color.
+    def __get_soup(self):
+        import requests
+        from bs4 import BeautifulSoup
 
-        When the clipboard content is set to a color, the raw color data is added to the clipboard.
+        req = requests.get(str(self.xa_elem))
+        self.soup = BeautifulSoup(req.text, "html.parser")
 
-        :return: The raw color data
-        :rtype: AppKit.NSColor
+    def open(self):
+        """Opens the URL in the appropriate default application.
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.0.5
         """
-        return self.xa_elem
+        global workspace
+        if workspace is None:
+            workspace = AppKit.NSWorkspace.sharedWorkspace()
+        workspace.openURL_(self.xa_elem)
 
+    def extract_text(self) -> list[str]:
+        """Extracts the visible text from the webpage that the URL points to.
 
-class XALocation(XAObject):
-    """A location with a latitude and longitude, along with other data.
+        :return: The list of extracted lines of text
+        :rtype: list[str]
 
-    .. versionadded:: 0.0.2
-    """
+        .. versionadded:: 0.0.8
+        """
+        if self.soup is None:
+            self.__get_soup()
+        return self.soup.get_text().splitlines()
 
-    current_location: "XALocation"  #: The current location of the device
+    def extract_images(self) -> list["XAImage"]:
+        """Extracts all images from HTML of the webpage that the URL points to.
 
-    def __init__(
-        self,
-        raw_value=None,
-        title: str = None,
-        latitude: float = 0,
-        longitude: float = 0,
-        altitude: float = None,
-        radius: int = 0,
-        address: str = None,
-    ):
-        self.raw_value = raw_value  #: The raw CLLocation object
-        self.title = title  #: The name of the location
-        self.latitude = latitude  #: The latitude of the location
-        self.longitude = longitude  #: The longitude of the location
-        self.altitude = altitude  #: The altitude of the location
-        self.radius = radius  #: The horizontal accuracy of the location measurement
-        self.address = address  #: The address of the location
+        :return: The list of extracted images
+        :rtype: list[XAImage]
 
-        import CoreLocation
+        .. versionadded:: 0.0.8
+        """
+        data = AppKit.NSData.alloc().initWithContentsOfURL_(
+            AppKit.NSURL.URLWithString_(str(self.xa_elem))
+        )
+        image = AppKit.NSImage.alloc().initWithData_(data)
 
-        if self.raw_value is None:
-            if latitude is not None and longitude is not None:
-                self.raw_value = (
-                    CoreLocation.CLLocation.alloc().initWithLatitude_longitude_(
-                        latitude, longitude
-                    )
-                )
+        if image is not None:
+            image_object = _xa_graphics().XAImage(image, name=self.xa_elem.pathComponents()[-1])
+            return [image_object]
         else:
-            self.latitude = self.raw_value.coordinate()[0]
-            self.longitude = self.raw_value.coordinate()[1]
-            self.altitude = self.raw_value.altitude()
-            self.radius = self.raw_value.horizontalAccuracy()
+            if self.soup is None:
+                self.__get_soup()
 
-    @property
-    def raw_value(self):
-        return self.__raw_value
-
-    @raw_value.setter
-    def raw_value(self, raw_value):
-        self.__raw_value = raw_value
-        if raw_value is not None:
-            self.latitude = raw_value.coordinate()[0]
-            self.longitude = raw_value.coordinate()[1]
-            self.altitude = raw_value.altitude()
-            self.radius = raw_value.horizontalAccuracy()
-
-    @property
-    def current_location(self) -> "XALocation":
-        """The location of the user's computer."""
-        self.raw_value = None
-        self._spawn_thread(self.__get_current_location)
-        while self.raw_value is None:
-            time.sleep(0.01)
-        return self
-
-    def show_in_maps(self):
-        """Shows the location in Maps.app.
+            images = self.soup.findAll("img")
+            image_objects = []
+            for image in images:
+                image_src = image["src"]
+                if image_src.startswith("/"):
+                    image_src = str(self) + str(image["src"])
 
-        .. versionadded:: 0.0.6
-        """
-        XAURL(f"maps://?q={self.title},ll={self.latitude},{self.longitude}").open()
+                data = AppKit.NSData.alloc().initWithContentsOfURL_(
+                    AppKit.NSURL.URLWithString_(image_src)
+                )
+                image = AppKit.NSImage.alloc().initWithData_(data)
+                if image is not None:
+                    image_object = _xa_graphics().XAImage(image)
+                    image_objects.append(image_object)
 
-    def reverse_geocode(self) -> dict[str, str]:
-        """Obtains reverse-geocode information from the location's latitude and longitude.
+            return image_objects
 
-        :return: A dictionary containing the location's name, street address, locality, state, country, timezone, and notable features.
-        :rtype: dict[str, str]
+    def get_clipboard_representation(self) -> list[Union["AppKit.NSURL", str]]:
+        """Gets a clipboard-codable representation of the URL.
 
-        :Example:
+        When the clipboard content is set to a URL, the raw URL data and the string representation of the URL are added to the clipboard.
 
-        >>> import PyXA
-        >>> loc = PyXA.XALocation(latitude=44.460552, longitude=-110.82807)
-        >>> print(loc.reverse_geocode())
-        {'name': 'Old Faithful', 'street_number': None, 'street': 'Upper Geyser Basin Trail', 'sub_locality': None, 'locality': 'Alta', 'county': 'Teton County', 'state': 'WY', 'postal_code': '83414', 'country': 'United States', 'timezone': America/Denver (MST) offset -25200, 'notable_features': (
-            "Old Faithful",
-            "Yellowstone National Park"
-        )}
+        :return: The clipboard-codable form of the URL
+        :rtype: Any
 
-        .. versionadded:: 0.1.1
+        .. versionadded:: 0.0.8
         """
-        self._placemark = None
-
-        def get_place(place, error):
-            if place is not None:
-                self._placemark = place[0]
-            AppHelper.stopEventLoop()
-
-        import CoreLocation
-
-        CoreLocation.CLGeocoder.alloc().init().reverseGeocodeLocation_completionHandler_(
-            self.raw_value, get_place
-        )
-        AppHelper.runConsoleEventLoop()
-
-        return {
-            "name": self._placemark.name(),
-            "street_number": self._placemark.subThoroughfare(),
-            "street": self._placemark.thoroughfare(),
-            "sub_locality": self._placemark.subLocality(),
-            "locality": self._placemark.locality(),
-            "county": self._placemark.subAdministrativeArea(),
-            "state": self._placemark.administrativeArea(),
-            "postal_code": self._placemark.postalCode(),
-            "country": self._placemark.country(),
-            "timezone": self._placemark.timeZone(),
-            "notable_features": self._placemark.areasOfInterest(),
-        }
-
-    def __get_current_location(self):
-        import CoreLocation
-
-        location_manager = CoreLocation.CLLocationManager.alloc().init()
-        old_self = self
+        return [self.xa_elem, str(self.xa_elem)]
 
-        class CLLocationManagerDelegate(AppKit.NSObject):
-            def locationManager_didUpdateLocations_(self, manager, locations):
-                if locations is not None:
-                    old_self.raw_value = locations[0]
-                    AppHelper.stopEventLoop()
+    def __eq__(self, other: "XAURL"):
+        if not isinstance(other, XAURL):
+            return False
 
-            def locationManager_didFailWithError_(self, manager, error):
-                print(manager, error)
+        if self.xa_elem == other.xa_elem:
+            return True
 
-        location_manager.requestWhenInUseAuthorization()
-        location_manager.setDelegate_(CLLocationManagerDelegate.alloc().init().retain())
-        location_manager.requestLocation()
+        return self.url == other.url
 
-        AppHelper.runConsoleEventLoop()
+    def __str__(self):
+        return str(self.xa_elem)
 
     def __repr__(self):
-        return (
-            "<"
-            + str(type(self))
-            + (self.title + " " if self.title is not None else "")
-            + str((self.latitude, self.longitude))
-            + ">"
-        )
-
-
-class XAColorPickerStyle(Enum):
-    """Options for which tab a color picker should display when first opened."""
-
-    GRAYSCALE = AppKit.NSColorPanelModeGray
-    RGB_SLIDERS = AppKit.NSColorPanelModeRGB
-    CMYK_SLIDERS = AppKit.NSColorPanelModeCMYK
-    HSB_SLIDERS = AppKit.NSColorPanelModeHSB
-    COLOR_LIST = AppKit.NSColorPanelModeColorList
-    COLOR_WHEEL = AppKit.NSColorPanelModeWheel
-    CRAYONS = AppKit.NSColorPanelModeCrayon
-    IMAGE_PALETTE = AppKit.NSColorPanelModeCustomPalette
+        return "<" + str(type(self)) + str(self.xa_elem) + ">"
 
 
-class XAColorPicker(XAObject):
-    """A class for creating and interacting with a color picker window.
+class XAPath(XAObject, XAClipboardCodable):
+    """A path to a file on the disk.
 
     .. versionadded:: 0.0.5
     """
 
-    def __init__(self, style: XAColorPickerStyle = XAColorPickerStyle.COLOR_WHEEL):
+    def __init__(self, path: Union[str, "AppKit.NSURL"]):
         super().__init__()
-        self.style = style
+        if isinstance(path, str):
+            path = AppKit.NSURL.alloc().initFileURLWithPath_(path)
+        self.xa_elem = path
+        self.path = path.path()  #: The path string without the file:// prefix
+        self.url = str(
+            self.xa_elem
+        )  #: The path string with the file:// prefix included
 
-    def display(self) -> XAColor:
-        """Displays the color picker.
+    @property
+    def name(self) -> str:
+        """The name of the file or folder at the path."""
+        return self.xa_elem.lastPathComponent()
 
-        :return: The color that the user selected
-        :rtype: XAColor
+    def open(self):
+        """Opens the file in its default application.
 
-        .. versionadded:: 0.0.5
+        .. versionadded: 0.0.5
         """
-        panel = AppKit.NSColorPanel.sharedColorPanel()
-        panel.setMode_(self.style.value)
-        panel.setShowsAlpha_(True)
-
-        def run_modal(panel):
-            initial_color = panel.color()
-            time.sleep(0.5)
-            while panel.isVisible() and panel.color() == initial_color:
-                time.sleep(0.01)
-            AppKit.NSApp.stopModal()
-
-        modal_thread = threading.Thread(
-            target=run_modal, args=(panel,), name="Run Modal", daemon=True
-        )
-        modal_thread.start()
+        global workspace
+        if workspace is None:
+            workspace = AppKit.NSWorkspace.sharedWorkspace()
+        workspace.openURL_(self.xa_elem)
 
-        AppKit.NSApp.runModalForWindow_(panel)
-        return XAColor(panel.color())
+    def show_in_finder(self):
+        """Opens a Finder window showing the folder containing this path, with the associated file selected. Synonymous with :func:`select`.
 
+        .. versionadded: 0.0.9
+        """
+        self.select()
 
-class XADialog(XAObject):
-    """A custom dialog window.
+    def select(self):
+        """Opens a Finder window showing the folder containing this path, with the associated file selected. Synonymous with :func:`show_in_finder`.
 
-    .. versionadded:: 0.0.8
-    """
+        .. versionadded: 0.0.5
+        """
+        global workspace
+        if workspace is None:
+            workspace = AppKit.NSWorkspace.sharedWorkspace()
+        workspace.activateFileViewerSelectingURLs_([self.xa_elem])
 
-    def __init__(
-        self,
-        text: str = "",
-        title: Union[str, None] = None,
-        buttons: Union[None, list[Union[str, int]]] = None,
-        hidden_answer: bool = False,
-        default_button: Union[str, int, None] = None,
-        cancel_button: Union[str, int, None] = None,
-        icon: Union[Literal["stop", "note", "caution"], None] = None,
-        default_answer: Union[str, int, None] = None,
-    ):
-        super().__init__()
-        self.text: str = text
-        self.title: str = title
-        self.buttons: Union[None, list[Union[str, int]]] = buttons or []
-        self.hidden_answer: bool = hidden_answer
-        self.icon: Union[str, None] = icon
-        self.default_button: Union[str, int, None] = default_button
-        self.cancel_button: Union[str, int, None] = cancel_button
-        self.default_answer: Union[str, int, None] = default_answer
+    def get_clipboard_representation(self) -> list[Union["AppKit.NSURL", str]]:
+        """Gets a clipboard-codable representation of the path.
 
-    def display(self) -> Union[str, int, None, list[str]]:
-        """Displays the dialog, waits for the user to select an option or cancel, then returns the selected button or None if cancelled.
+        When the clipboard content is set to a path, the raw file URL data and the string representation of the path are added to the clipboard.
 
-        :return: The selected button or None if no value was selected
-        :rtype: Union[str, int, None, list[str]]
+        :return: The clipboard-codable form of the path
+        :rtype: Any
 
         .. versionadded:: 0.0.8
         """
-        buttons = [x.replace("'", "") for x in self.buttons]
-        buttons = str(buttons).replace("'", '"')
+        return [self.xa_elem, self.xa_elem.path()]
 
-        default_button = str(self.default_button).replace("'", "")
-        default_button_str = (
-            'default button "' + default_button + '"'
-            if self.default_button is not None
-            else ""
-        )
+    def __eq__(self, other: "XAPath"):
+        if not isinstance(other, XAPath):
+            return False
 
-        cancel_button = str(self.cancel_button).replace("'", "")
-        cancel_button_str = (
-            'cancel button "' + cancel_button + '"'
-            if self.cancel_button is not None
-            else ""
-        )
+        if self.xa_elem == other.xa_elem:
+            return True
 
-        icon_str = "with icon " + self.icon + "" if self.icon is not None else ""
+        return self.path == other.path
 
-        default_answer = str(self.default_answer).replace("'", '"')
-        default_answer_str = (
-            'default answer "' + default_answer + '"'
-            if self.default_answer is not None
-            else ""
-        )
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.xa_elem) + ">"
 
-        script = AppleScript(
-            f"""
-        tell application "System Events"
-            display dialog \"{self.text}\" with title \"{self.title}\" buttons {buttons} {default_button_str} {cancel_button_str} {icon_str} {default_answer_str} hidden answer {self.hidden_answer}
-        end tell
+
+########################
+### System Utilities ###
+########################
+class XAClipboard(XAObject):
+    """A wrapper class for managing and interacting with the system clipboard.
+
+    .. versionadded:: 0.0.5
+    """
+
+    def __init__(self):
+        self.xa_elem = AppKit.NSPasteboard.generalPasteboard()
+
+    @property
+    def content(self) -> dict[str, list[Any]]:
+        """The content of the clipboard."""
+        info_by_type = {}
+        for item in self.xa_elem.pasteboardItems():
+            for item_type in item.types():
+                info_by_type[item_type] = {
+                    "data": item.dataForType_(item_type),
+                    "properties": item.propertyListForType_(item_type),
+                    "strings": item.stringForType_(item_type),
+                }
+        return info_by_type
+
+    @content.setter
+    def content(self, value: list[Any]):
+        if not isinstance(value, list):
+            value = [value]
+        self.xa_elem.clearContents()
+        for index, item in enumerate(value):
+            if item == None:
+                value[index] = ""
+            elif isinstance(item, XAObject):
+                if not isinstance(item, XAClipboardCodable):
+                    print(item, "is not a clipboard-codable object.")
+                    continue
+                if (
+                    isinstance(item.xa_elem, ScriptingBridge.SBElementArray)
+                    and item.xa_elem.get() is None
+                ):
+                    value[index] = ""
+                else:
+                    content = item.get_clipboard_representation()
+                    if isinstance(content, list):
+                        value.pop(index)
+                        value += content
+                    else:
+                        value[index] = content
+            elif isinstance(item, int) or isinstance(item, float):
+                value[index] = str(item)
+        self.xa_elem.writeObjects_(value)
+
+    def clear(self):
+        """Clears the system clipboard.
+
+        .. versionadded:: 0.0.5
+        """
+        self.xa_elem.clearContents()
+
+    def get_strings(self) -> list[str]:
+        """Retrieves string type data from the clipboard, if any such data exists.
+
+        :return: The list of strings currently copied to the clipboard
+        :rtype: list[str]
+
+        .. versionadded:: 0.0.8
+        """
+        items = []
+        for item in self.xa_elem.pasteboardItems():
+            string = item.stringForType_(AppKit.NSPasteboardTypeString)
+            if string is not None:
+                items.append(string)
+        return items
+
+    def get_urls(self) -> list["XAURL"]:
+        """Retrieves URL type data from the clipboard, as instances of :class:`XAURL` and :class:`XAPath`, if any such data exists.
+
+        :return: The list of file URLs and web URLs currently copied to the clipboard
+        :rtype: list[XAURL]
+
+        .. versionadded:: 0.0.8
+        """
+        items = []
+        for item in self.xa_elem.pasteboardItems():
+            url = None
+            string = item.stringForType_(AppKit.NSPasteboardTypeURL)
+            if string is None:
+                string = item.stringForType_(AppKit.NSPasteboardTypeFileURL)
+                if string is not None:
+                    url = XAPath(XAURL(string).xa_elem)
+            else:
+                url = XAURL(string)
+
+            if url is not None:
+                items.append(url)
+        return items
+
+    def get_images(self) -> list["XAImage"]:
+        """Retrieves image type data from the clipboard, as instances of :class:`XAImage`, if any such data exists.
+
+        :return: The list of images currently copied to the clipboard
+        :rtype: list[XAImage]
+
+        .. versionadded:: 0.0.8
+        """
+        image_types = [
+            AppKit.NSPasteboardTypePNG,
+            AppKit.NSPasteboardTypeTIFF,
+            "public.jpeg",
+            "com.apple.icns",
+        ]
+        items = []
+        for item in self.xa_elem.pasteboardItems():
+            for image_type in image_types:
+                if image_type in item.types():
+                    img = _xa_graphics().XAImage(data=item.dataForType_(image_type))
+                    items.append(img)
+        return items
+
+    def set_contents(self, content: list[Any]):
+        """Sets the content of the clipboard
+
+        :param content: A list of the content to add fill the clipboard with.
+        :type content: list[Any]
+
+        .. deprecated:: 0.0.8
+           Set the :attr:`content` property directly instead.
+
+        .. versionadded:: 0.0.5
+        """
+        self.xa_elem.clearContents()
+        self.xa_elem.writeObjects_(content)
+
+
+class XASpotlight(XAObject):
+    """A Spotlight query for files on the disk.
+
+    .. versionadded:: 0.0.9
+    """
+
+    def __init__(self, *query: list[Any]):
+        self.query: list[Any] = query  #: The query terms to search
+        self.timeout: int = (
+            10  #: The amount of time in seconds to timeout the search after
+        )
+        self.predicate: Union[
+            str, XAPredicate
+        ] = None  #: The predicate to filter search results by
+        self.results: list[XAPath]  #: The results of the search
+        self.__results = None
+
+        self.query_object = AppKit.NSMetadataQuery.alloc().init()
+        nc = AppKit.NSNotificationCenter.defaultCenter()
+        nc.addObserver_selector_name_object_(
+            self, "_queryNotification:", None, self.query_object
+        )
+
+    @property
+    def results(self) -> list["XAPath"]:
+        if len(self.query) == 0 and self.predicate is None:
+            return []
+        self.run()
+
+        # Process run loop sources until the query posts its finished notification
+        run_loop = AppKit.NSRunLoop.currentRunLoop()
+        deadline = time.monotonic() + self.timeout
+        while self.__results is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if not run_loop.runMode_beforeDate_(
+                AppKit.NSDefaultRunLoopMode,
+                AppKit.NSDate.dateWithTimeIntervalSinceNow_(remaining),
+            ):
+                # No input sources are attached, so the query can't finish
+                break
+        if self.__results is None:
+            return []
+        return self.__results
+
+    def run(self):
+        """Runs the search.
+
+        :Example:
+
+        >>> import PyXA
+        >>> from datetime import date, datetime, time
+        >>> date1 = datetime.combine(date(2022, 5, 17), time(0, 0, 0))
+        >>> date2 = datetime.combine(date(2022, 5, 18), time(0, 0, 0))
+        >>> search = PyXA.XASpotlight(date1, date2)
+        >>> print(search.results)
+        [<<class 'PyXA.XAPath'>file:///Users/exampleUser/Downloads/>, <<class 'PyXA.XAPath'>file:///Users/exampleUser/Downloads/Example.txt>, ...]
+
+        .. versionadded:: 0.0.9
+        """
+        if self.predicate is not None:
+            # Search with custom predicate
+            if isinstance(self.predicate, XAPredicate):
+                self.predicate = self.predicate.get_clipboard_representation()
+            self.__search_with_predicate(self.predicate)
+        elif len(self.query) == 1 and isinstance(self.query[0], datetime):
+            # Search date + or - 24 hours
+            self.__search_by_date(self.query)
+        elif (
+            len(self.query) == 2
+            and isinstance(self.query[0], datetime)
+            and isinstance(self.query[1], datetime)
+        ):
+            # Search date range
+            self.__search_by_date_range(self.query[0], self.query[1])
+        elif all(
+            isinstance(x, str) or isinstance(x, int) or isinstance(x, float)
+            for x in self.query
+        ):
+            # Search matching multiple strings
+            self.__search_by_strs(self.query)
+        elif isinstance(self.query[0], datetime) and all(
+            isinstance(x, str) or isinstance(x, int) or isinstance(x, float)
+            for x in self.query[1:]
+        ):
+            # Search by date and string
+            self.__search_by_date_strings(self.query[0], self.query[1:])
+        elif (
+            isinstance(self.query[0], datetime)
+            and isinstance(self.query[1], datetime)
+            and all(
+                isinstance(x, str) or isinstance(x, int) or isinstance(x, float)
+                for x in self.query[2:]
+            )
+        ):
+            # Search by date range and string
+            self.__search_by_date_range_strings(
+                self.query[0], self.query[1], self.query[2:]
+            )
+
+        AppKit.NSRunLoop.currentRunLoop().runUntilDate_(
+            datetime.now() + timedelta(seconds=0.01)
+        )
+
+    def show_in_finder(self):
+        """Shows the search in Finder. This might not reveal the same search results.
+
+        .. versionadded:: 0.0.9
+        """
+        global workspace
+        if workspace is None:
+            workspace = AppKit.NSWorkspace.sharedWorkspace()
+        workspace.showSearchResultsForQueryString_(str(self.query))
+
+    def __search_by_strs(self, terms: tuple[str]):
+        expanded_terms = [x for y in terms for x in [y] * 3]
+        format = (
+            "((kMDItemDisplayName CONTAINS %@) OR (kMDItemTextContent CONTAINS %@) OR (kMDItemFSName CONTAINS %@)) AND "
+            * len(terms)
+        )
+        self.__search_with_predicate(format[:-5], *expanded_terms)
+
+    def __search_by_date(self, date: datetime):
+        self.__search_with_predicate(
+            f"((kMDItemContentCreationDate > %@) AND (kMDItemContentCreationDate < %@)) OR ((kMDItemContentModificationDate > %@) AND (kMDItemContentModificationDate < %@)) OR ((kMDItemFSCreationDate > %@) AND (kMDItemFSCreationDate < %@)) OR ((kMDItemFSContentChangeDate > %@) AND (kMDItemFSContentChangeDate < %@)) OR ((kMDItemDateAdded > %@) AND (kMDItemDateAdded < %@))",
+            *[date - timedelta(hours=12), date + timedelta(hours=12)] * 5,
+        )
+
+    def __search_by_date_range(self, date1: datetime, date2: datetime):
+        self.__search_with_predicate(
+            f"((kMDItemContentCreationDate > %@) AND (kMDItemContentCreationDate < %@)) OR ((kMDItemContentModificationDate > %@) AND (kMDItemContentModificationDate < %@)) OR ((kMDItemFSCreationDate > %@) AND (kMDItemFSCreationDate < %@)) OR ((kMDItemFSContentChangeDate > %@) AND (kMDItemFSContentChangeDate < %@)) OR ((kMDItemDateAdded > %@) AND (kMDItemDateAdded < %@))",
+            *[date1, date2] * 5,
+        )
+
+    def __search_by_date_strings(self, date: datetime, terms: tuple[str]):
+        expanded_terms = [x for y in terms for x in [y] * 3]
+        format = (
+            "((kMDItemDisplayName CONTAINS %@) OR (kMDItemTextContent CONTAINS %@) OR (kMDItemFSName CONTAINS %@)) AND "
+            * len(terms)
+        )
+        format += "(((kMDItemContentCreationDate > %@) AND (kMDItemContentCreationDate < %@)) OR ((kMDItemContentModificationDate > %@) AND (kMDItemContentModificationDate < %@)) OR ((kMDItemFSCreationDate > %@) AND (kMDItemFSCreationDate < %@)) OR ((kMDItemFSContentChangeDate > %@) AND (kMDItemFSContentChangeDate < %@)) OR ((kMDItemDateAdded > %@) AND (kMDItemDateAdded < %@)))"
+        self.__search_with_predicate(
+            format,
+            *expanded_terms,
+            *[date - timedelta(hours=12), date + timedelta(hours=12)] * 5,
+        )
+
+    def __search_by_date_range_strings(
+        self, date1: datetime, date2: datetime, terms: tuple[str]
+    ):
+        expanded_terms = [x for y in terms for x in [y] * 3]
+        format = (
+            "((kMDItemDisplayName CONTAINS %@) OR (kMDItemTextContent CONTAINS %@) OR (kMDItemFSName CONTAINS %@)) AND "
+            * len(terms)
+        )
+        format += "(((kMDItemContentCreationDate > %@) AND (kMDItemContentCreationDate < %@)) OR ((kMDItemContentModificationDate > %@) AND (kMDItemContentModificationDate < %@)) OR ((kMDItemFSCreationDate > %@) AND (kMDItemFSCreationDate < %@)) OR ((kMDItemFSContentChangeDate > %@) AND (kMDItemFSContentChangeDate < %@)) OR ((kMDItemDateAdded > %@) AND (kMDItemDateAdded < %@)))"
+        self.__search_with_predicate(format, *expanded_terms, *[date1, date2] * 5)
+
+    def __search_with_predicate(self, predicate_format: str, *args: list[Any]):
+        predicate = AppKit.NSPredicate.predicateWithFormat_(predicate_format, *args)
+        self.query_object.setPredicate_(predicate)
+        self.query_object.startQuery()
+
+    def _queryNotification_(self, notification):
+        if notification.name() == AppKit.NSMetadataQueryDidFinishGatheringNotification:
+            self.query_object.stopQuery()
+            results = notification.object().results()
+            self.__results = [
+                XAPath(x.valueForAttribute_(AppKit.NSMetadataItemPathKey))
+                for x in results
+            ]
+
+
+############
+### Text ###
+############
+class XATextDocumentList(XAList, XAClipboardCodable):
+    """A wrapper around lists of text documents that employs fast enumeration techniques.
+
+    .. versionadded:: 0.1.0
+    """
+
+    def __init__(
+        self, properties: dict, filter: Union[dict, None] = None, obj_class=None
+    ):
+        if obj_class is None:
+            obj_class = XATextDocument
+        super().__init__(properties, obj_class, filter)
+
+    def properties(self) -> list[dict]:
+        ls = XABackends.element_values(self.xa_elem, "properties") or []
+        return [dict(x) for x in ls]
+
+    def text(self) -> "XATextList":
+        ls = XABackends.element_values(self.xa_elem, "text") or []
+        return self._new_element(ls, XATextList)
+
+    def by_properties(self, properties: dict) -> Union["XATextDocument", None]:
+        return self.by_property("properties", properties)
+
+    def by_text(self, text: str) -> Union["XATextDocument", None]:
+        return self.by_property("text", text)
+
+    def paragraphs(self) -> "XAParagraphList":
+        ls = XABackends.element_values(self.xa_elem, "paragraphs") or []
+        return self._new_element([plist for plist in ls], XAParagraphList)
+
+    def words(self) -> "XAWordList":
+        ls = XABackends.element_values(self.xa_elem, "words") or []
+        return [self._new_element([plist for plist in ls], XAWordList)]
+
+    def characters(self) -> "XACharacterList":
+        ls = XABackends.element_values(self.xa_elem, "characters") or []
+        return [self._new_element([plist for plist in ls], XACharacterList)]
+
+    def attribute_runs(self) -> "XAAttributeRunList":
+        ls = XABackends.element_values(self.xa_elem, "attributeRuns") or []
+        return [self._new_element([plist for plist in ls], XAAttributeRunList)]
+
+    def attachments(self) -> "XAAttachmentList":
+        ls = XABackends.element_values(self.xa_elem, "attachments") or []
+        return [self._new_element([plist for plist in ls], XAAttachmentList)]
+
+    def get_clipboard_representation(self) -> list[Union[str, "AppKit.NSURL"]]:
+        """Gets a clipboard-codable representation of each document in the list.
+
+        When the clipboard content is set to a list of documents, each documents's file URL and name are added to the clipboard.
+
+        :return: A list of each document's file URL and name
+        :rtype: list[Union[str, AppKit.NSURL]]
+
+        .. versionadded:: 0.0.8
+        """
+        return [str(x) for x in self.text()]
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.text()) + ">"
+
+
+class XATextDocument(XAObject):
+    """A class for managing and interacting with text documents.
+
+    .. versionadded:: 0.0.1
+    """
+
+    def __init__(self, properties):
+        super().__init__(properties)
+
+    @property
+    def text(self) -> "XAText":
+        """The text of the document."""
+        return self._new_element(self.xa_elem.text(), XAText)
+
+    @text.setter
+    def text(self, text: Union[str, "XAText"]):
+        if isinstance(text, XAText):
+            text = text.xa_elem
+        self.set_property("text", text)
+
+    def prepend(self, text: str) -> "XATextDocument":
+        """Inserts the provided text at the beginning of the document.
+
+        :param text: The text to insert.
+        :type text: str
+        :return: A reference to the document object.
+        :rtype: XATextDocument
+
+        .. seealso:: :func:`append`, :func:`set_text`
+
+        .. versionadded:: 0.0.1
+        """
+        old_text = str(self.text)
+        self.set_property("text", text + old_text)
+        return self
+
+    def append(self, text: str) -> "XATextDocument":
+        """Appends the provided text to the end of the document.
+
+        :param text: The text to append.
+        :type text: str
+        :return: A reference to the document object.
+        :rtype: XATextDocument
+
+        .. seealso:: :func:`prepend`, :func:`set_text`
+
+        .. versionadded:: 0.0.1
+        """
+        old_text = str(self.text)
+        self.set_property("text", old_text + text)
+        return self
+
+    def reverse(self) -> "XATextDocument":
+        """Reverses the text of the document.
+
+        :return: A reference to the document object.
+        :rtype: XATextDocument
+
+        .. versionadded:: 0.0.4
+        """
+        self.set_property("text", reversed(str(self.text)))
+        return self
+
+    def paragraphs(self, filter: dict = None) -> "XAParagraphList":
+        return self.text.paragraphs(filter)
+
+    def sentences(self, filter: dict = None) -> "XASentenceList":
+        return self.text.sentences(filter)
+
+    def words(self, filter: dict = None) -> "XAWordList":
+        return self.text.words(filter)
+
+    def characters(self, filter: dict = None) -> "XACharacterList":
+        return self.text.characters(filter)
+
+    def attribute_runs(self, filter: dict = None) -> "XAAttributeRunList":
+        return self.text.attribute_runs(filter)
+
+    def attachments(self, filter: dict = None) -> "XAAttachmentList":
+        return self.text.attachments(filter)
+
+
+class XATextList(XAList):
+    """A wrapper around lists of text objects that employs fast enumeration techniques.
+
+    .. versionadded:: 0.0.4
+    """
+
+    def __init__(
+        self, properties: dict, filter: Union[dict, None] = None, obj_class=None
+    ):
+        if obj_class is None:
+            obj_class = XAText
+        super().__init__(properties, obj_class, filter)
+
+    def paragraphs(self, filter: dict = None) -> "XAParagraphList":
+        ls = []
+        if hasattr(self.xa_elem, "get"):
+            ls = XABackends.element_values(self.xa_elem, "paragraphs") or []
+        else:
+            ls = [x.xa_elem.split("\n") for x in self]
+        ls = [
+            paragraph
+            for paragraphlist in ls
+            for paragraph in paragraphlist
+            if paragraph.strip() != ""
+        ]
+        return self._new_element(ls, XAParagraphList, filter)
+
+    def sentences(self) -> "XASentenceList":
+        ls = [x.sentences() for x in self]
+        ls = [sentence for sentencelist in ls for sentence in sentencelist]
+        return self._new_element(ls, XASentenceList)
+
+    def words(self, filter: dict = None) -> "XAWordList":
+        ls = []
+        if hasattr(self.xa_elem, "get"):
+            ls = XABackends.element_values(self.xa_elem, "words") or []
+        else:
+            ls = [x.xa_elem.split() for x in self]
+        ls = [word for wordlist in ls for word in wordlist]
+        return self._new_element(ls, XAWordList, filter)
+
+    def characters(self, filter: dict = None) -> "XACharacterList":
+        ls = []
+        if hasattr(self.xa_elem, "get"):
+            ls = XABackends.element_values(self.xa_elem, "characters") or []
+        else:
+            ls = [list(x.xa_elem) for x in self]
+        ls = [character for characterlist in ls for character in characterlist]
+        return self._new_element(ls, XACharacterList, filter)
+
+    def attribute_runs(self, filter: dict = None) -> "XAAttributeRunList":
+        ls = []
+        if hasattr(self.xa_elem, "get"):
+            ls = XABackends.element_values(self.xa_elem, "attributeRuns") or []
+        ls = [
+            attribute_run
+            for attribute_run_list in ls
+            for attribute_run in attribute_run_list
+        ]
+        return self._new_element(ls, XAAttributeRunList, filter)
+
+    def attachments(self, filter: dict = None) -> "XAAttachmentList":
+        ls = []
+        if hasattr(self.xa_elem, "get"):
+            ls = XABackends.element_values(self.xa_elem, "attachments") or []
+        ls = [attachment for attachment_list in ls for attachment in attachment_list]
+        return self._new_element(ls, XAAttachmentList, filter)
+
+    def __repr__(self):
+        try:
+            if isinstance(self.xa_elem[0], ScriptingBridge.SBObject):
+                # List items will not resolved to text upon dereferencing the list; need to resolve items individually
+                count = self.xa_elem.count()
+                if count <= 500:
+                    # Too many unresolved pointers, save time by just reporting the length
+                    return (
+                        "<"
+                        + str(type(self))
+                        + str([x.get() for x in self.xa_elem])
+                        + ">"
+                    )
+                return (
+                    "<" + str(type(self)) + "length: " + str(self.xa_elem.count()) + ">"
+                )
+
+            # List items will resolve to text upon dereferencing the list
+            return "<" + str(type(self)) + str(self.xa_elem.get()) + ">"
+        except:
+            return "<" + str(type(self)) + str(list(self.xa_elem)) + ">"
+
+
+class XAText(XAObject):
+    """A class for managing and interacting with the text of documents.
+
+    .. versionadded:: 0.0.1
+    """
+
+    def __init__(self, properties):
+        if isinstance(properties, dict):
+            super().__init__(properties)
+        elif isinstance(properties, str):
+            super().__init__({"element": properties})
+
+        self.text: str  #: The plaintext contents of the rich text
+        self.color: XAColor  #: The color of the first character
+        self.font: str  #: The name of the font of the first character
+        self.size: int  #: The size in points of the first character
+
+    @property
+    def text(self) -> str:
+        if isinstance(self.xa_elem, str):
+            return self.xa_elem
+        else:
+            return self.xa_elem.text()
+
+    @text.setter
+    def text(self, text: str):
+        if isinstance(self.xa_elem, str):
+            self.xa_elem = text
+        else:
+            self.set_property("text", text)
+
+    @property
+    def color(self) -> "XAColor":
+        if isinstance(self.xa_elem, str):
+            return None
+        else:
+            return _xa_graphics().XAColor(self.xa_elem.color())
+
+    @color.setter
+    def color(self, color: "XAColor"):
+        if isinstance(self.xa_elem, str):
+            self.color = color.xa_elem
+        else:
+            self.set_property("color", color.xa_elem)
+
+    @property
+    def font(self) -> str:
+        if isinstance(self.xa_elem, str):
+            return None
+        else:
+            return self.xa_elem.font()
+
+    @font.setter
+    def font(self, font: str):
+        if isinstance(self.xa_elem, str):
+            self.font = font
+        else:
+            self.set_property("font", font)
+
+    @property
+    def size(self) -> int:
+        if isinstance(self.xa_elem, str):
+            return 0
+        else:
+            return self.xa_elem.size()
+
+    @size.setter
+    def size(self, size: int):
+        if isinstance(self.xa_elem, str):
+            self.size = size
+        else:
+            self.set_property("size", size)
+
+    def tag_parts_of_speech(
+        self, unit: Literal["word", "sentence", "paragraph", "document"] = "word"
+    ) -> list[tuple[str, str]]:
+        """Tags each word of the text with its associated part of speech.
+
+        :param unit: The grammatical unit to divide the text into for tagging, defaults to "word"
+        :type unit: Literal["word", "sentence", "paragraph", "document"]
+        :return: A list of tuples identifying each word of the text and its part of speech
+        :rtype: list[tuple[str, str]]
+
+        :Example 1: Extract nouns from a text
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("Here’s to the crazy ones. The misfits. The rebels.")
+        >>> nouns = [pos[0] for pos in text.tag_parts_of_speech() if pos[1] == "Noun"]
+        >>> print(nouns)
+        ['ones', 'misfits', 'rebels']
+
+        .. versionadded:: 0.1.0
+        """
+        import NaturalLanguage
+
+        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
+            [NaturalLanguage.NLTagSchemeLexicalClass]
+        )
+        tagger.setString_(str(self.xa_elem))
+
+        if unit == "word":
+            unit = NaturalLanguage.NLTokenUnitWord
+        elif unit == "sentence":
+            unit = NaturalLanguage.NLTokenUnitSentence
+        elif unit == "paragraph":
+            unit = NaturalLanguage.NLTokenUnitParagraph
+        elif unit == "document":
+            unit = NaturalLanguage.NLTokenUnitDocument
+
+        tagged_pos = []
+
+        def apply_tags(tag, token_range, error):
+            word_phrase = str(self.xa_elem)[
+                token_range.location : token_range.location + token_range.length
+            ]
+            tagged_pos.append((word_phrase, tag))
+
+        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
+            (0, len(str(self.xa_elem))),
+            unit,
+            NaturalLanguage.NLTagSchemeLexicalClass,
+            NaturalLanguage.NLTaggerOmitPunctuation
+            | NaturalLanguage.NLTaggerOmitWhitespace,
+            apply_tags,
+        )
+        return tagged_pos
+
+    def tag_languages(
+        self, unit: Literal["word", "sentence", "paragraph", "document"] = "paragraph"
+    ) -> list[tuple[str, str]]:
+        """Tags each paragraph of the text with its language.
+
+        :param unit: The grammatical unit to divide the text into for tagging, defaults to "paragraph"
+        :type unit: Literal["word", "sentence", "paragraph", "document"]
+        :return: A list of tuples identifying each paragraph of the text and its language
+        :rtype: list[tuple[str, str]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("This is English.\\nQuesto è Italiano.\\nDas ist deutsch.\\nこれは日本語です。")
+        >>> print(text.tag_languages())
+        [('This is English.\\n', 'en'), ('Questo è Italiano.\\n', 'it'), ('Das ist deutsch.\\n', 'de'), ('これは日本語です。', 'ja')]
+
+        .. versionadded:: 0.1.0
+        """
+        import NaturalLanguage
+
+        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
+            [NaturalLanguage.NLTagSchemeLanguage]
+        )
+        tagger.setString_(str(self.xa_elem))
+
+        if unit == "word":
+            unit = NaturalLanguage.NLTokenUnitWord
+        elif unit == "sentence":
+            unit = NaturalLanguage.NLTokenUnitSentence
+        elif unit == "paragraph":
+            unit = NaturalLanguage.NLTokenUnitParagraph
+        elif unit == "document":
+            unit = NaturalLanguage.NLTokenUnitDocument
+
+        tagged_languages = []
+
+        def apply_tags(tag, token_range, error):
+            paragraph = str(self.xa_elem)[
+                token_range.location : token_range.location + token_range.length
+            ]
+            if paragraph.strip() != "":
+                tagged_languages.append((paragraph, tag))
+
+        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
+            (0, len(str(self.xa_elem))),
+            unit,
+            NaturalLanguage.NLTagSchemeLanguage,
+            NaturalLanguage.NLTaggerOmitPunctuation
+            | NaturalLanguage.NLTaggerOmitWhitespace,
+            apply_tags,
+        )
+        return tagged_languages
+
+    def tag_entities(
+        self, unit: Literal["word", "sentence", "paragraph", "document"] = "word"
+    ) -> list[tuple[str, str]]:
+        """Tags each word of the text with either the category of entity it represents (i.e. person, place, or organization) or its part of speech.
+
+        :param unit: The grammatical unit to divide the text into for tagging, defaults to "word"
+        :type unit: Literal["word", "sentence", "paragraph", "document"]
+        :return: A list of tuples identifying each word of the text and its entity category or part of speech
+        :rtype: list[tuple[str, str]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("Tim Cook is the CEO of Apple.")
+        >>> print(text.tag_entities())
+        [('Tim', 'PersonalName'), ('Cook', 'PersonalName'), ('is', 'Verb'), ('the', 'Determiner'), ('CEO', 'Noun'), ('of', 'Preposition'), ('Apple', 'OrganizationName')]
+
+        .. versionadded:: 0.1.0
+        """
+        import NaturalLanguage
+
+        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
+            [NaturalLanguage.NLTagSchemeNameTypeOrLexicalClass]
+        )
+        tagger.setString_(str(self.xa_elem))
+
+        if unit == "word":
+            unit = NaturalLanguage.NLTokenUnitWord
+        elif unit == "sentence":
+            unit = NaturalLanguage.NLTokenUnitSentence
+        elif unit == "paragraph":
+            unit = NaturalLanguage.NLTokenUnitParagraph
+        elif unit == "document":
+            unit = NaturalLanguage.NLTokenUnitDocument
+
+        tagged_languages = []
+
+        def apply_tags(tag, token_range, error):
+            word_phrase = str(self.xa_elem)[
+                token_range.location : token_range.location + token_range.length
+            ]
+            if word_phrase.strip() != "":
+                tagged_languages.append((word_phrase, tag))
+
+        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
+            (0, len(str(self.xa_elem))),
+            unit,
+            NaturalLanguage.NLTagSchemeNameTypeOrLexicalClass,
+            NaturalLanguage.NLTaggerOmitPunctuation
+            | NaturalLanguage.NLTaggerOmitWhitespace,
+            apply_tags,
+        )
+        return tagged_languages
+
+    def tag_lemmas(
+        self, unit: Literal["word", "sentence", "paragraph", "document"] = "word"
+    ) -> list[tuple[str, str]]:
+        """Tags each word of the text with its stem word.
+
+        :param unit: The grammatical unit to divide the text into for tagging, defaults to "word"
+        :type unit: Literal["word", "sentence", "paragraph", "document"]
+        :return: A list of tuples identifying each word of the text and its stem words
+        :rtype: list[tuple[str, str]]
+
+        :Example 1: Lemmatize each word in a text
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("Here’s to the crazy ones. The misfits. The rebels.")
+        >>> print(text.tag_lemmas())
+        [('Here’s', 'here'), ('to', 'to'), ('the', 'the'), ('crazy', 'crazy'), ('ones', 'one'), ('The', 'the'), ('misfits', 'misfit'), ('The', 'the'), ('rebels', 'rebel')]
+
+        :Example 2: Combine parts of speech tagging and lemmatization
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("The quick brown fox tries to jump over the sleeping lazy dog.")
+        >>> verbs = [pos[0] for pos in text.tag_parts_of_speech() if pos[1] == "Verb"]
+        >>> for index, verb in enumerate(verbs):
+        >>>     print(index, PyXA.XAText(verb).tag_lemmas())
+        0 [('tries', 'try')]
+        1 [('jump', 'jump')]
+        2 [('sleeping', 'sleep')]
+
+        .. versionadded:: 0.1.0
         """
+        import NaturalLanguage
+
+        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
+            [NaturalLanguage.NLTagSchemeLemma]
         )
+        tagger.setString_(str(self.xa_elem))
 
-        result = script.run()["event"]
-        if result is not None:
-            if result.numberOfItems() > 1:
-                return [
-                    result.descriptorAtIndex_(1).stringValue(),
-                    result.descriptorAtIndex_(2).stringValue(),
-                ]
-            else:
-                return result.descriptorAtIndex_(1).stringValue()
+        if unit == "word":
+            unit = NaturalLanguage.NLTokenUnitWord
+        elif unit == "sentence":
+            unit = NaturalLanguage.NLTokenUnitSentence
+        elif unit == "paragraph":
+            unit = NaturalLanguage.NLTokenUnitParagraph
+        elif unit == "document":
+            unit = NaturalLanguage.NLTokenUnitDocument
 
+        tagged_lemmas = []
 
-class XAMenu(XAObject):
-    """A custom list item selection menu.
+        def apply_tags(tag, token_range, error):
+            word_phrase = str(self.xa_elem)[
+                token_range.location : token_range.location + token_range.length
+            ]
+            if word_phrase.strip() != "":
+                tagged_lemmas.append((word_phrase, tag))
 
-    .. versionadded:: 0.0.8
-    """
+        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
+            (0, len(str(self.xa_elem))),
+            unit,
+            NaturalLanguage.NLTagSchemeLemma,
+            NaturalLanguage.NLTaggerOmitPunctuation
+            | NaturalLanguage.NLTaggerOmitWhitespace
+            | NaturalLanguage.NLTaggerJoinContractions,
+            apply_tags,
+        )
+        return tagged_lemmas
 
-    def __init__(
+    def tag_sentiments(
         self,
-        menu_items: list[Any],
-        title: str = "Select Item",
-        prompt: str = "Select an item",
-        default_items: Union[list[str], None] = None,
-        ok_button_name: str = "Okay",
-        cancel_button_name: str = "Cancel",
-        multiple_selections_allowed: bool = False,
-        empty_selection_allowed: bool = False,
-    ):
-        super().__init__()
-        self.menu_items: list[
-            Union[str, int]
-        ] = menu_items  #: The items the user can choose from
-        self.title: str = title  #: The title of the dialog window
-        self.prompt: str = prompt  #: The prompt to display in the dialog box
-        self.default_items: list[str] = (
-            default_items or []
-        )  #: The items to initially select
-        self.ok_button_name: str = ok_button_name  #: The name of the OK button
-        self.cancel_button_name: str = (
-            cancel_button_name  #: The name of the Cancel button
+        sentiment_scale: list[str] = None,
+        unit: Literal["word", "sentence", "paragraph", "document"] = "paragraph",
+    ) -> list[tuple[str, str]]:
+        """Tags each paragraph of the text with a sentiment rating.
+
+        :param sentiment_scale: A list of terms establishing a range of sentiments from most negative to most postive
+        :type sentiment_scale: list[str]
+        :param unit: The grammatical unit to divide the text into for tagging, defaults to "paragraph"
+        :type unit: Literal["word", "sentence", "paragraph", "document"]
+        :return: A list of tuples identifying each paragraph of the text and its sentiment rating
+        :rtype: list[tuple[str, str]]
+
+        :Example 1: Assess the sentiment of a string
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("This sucks.\\nBut this is great!")
+        >>> print(text.tag_sentiments())
+        [('This sucks.\\n', 'Negative'), ('But this is great!', 'Positive')]
+
+        :Example 2: Use a custom sentiment scale
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("This sucks.\\nBut this is good!\\nAnd this is great!")
+        >>> print(text.tag_sentiments(sentiment_scale=["Very Negative", "Negative", "Somewhat Negative", "Neutral", "Somewhat Positive", "Positive", "Very Positive"]))
+        [('This sucks.\\n', 'Very Negative'), ('But this is good!\\n', 'Neutral'), ('And this is great!', 'Very Positive')]
+
+        :Example 3: Use other tag units
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("This sucks.\\nBut this is good!\\nAnd this is great!")
+        >>> print(1, text.tag_sentiments())
+        >>> print(2, text.tag_sentiments(unit="word"))
+        >>> print(3, text.tag_sentiments(unit="document"))
+        1 [('This sucks.\\n', 'Negative'), ('But this is good!\\n', 'Neutral'), ('And this is great!', 'Positive')]
+        2 [('This', 'Negative'), ('sucks', 'Negative'), ('.', 'Negative'), ('But', 'Neutral'), ('this', 'Neutral'), ('is', 'Neutral'), ('good', 'Neutral'), ('!', 'Neutral'), ('And', 'Positive'), ('this', 'Positive'), ('is', 'Positive'), ('great', 'Positive'), ('!', 'Positive')]
+        3 [('This sucks.\\nBut this is good!\\nAnd this is great!', 'Neutral')]
+
+        .. versionadded:: 0.1.0
+        """
+        import NaturalLanguage
+
+        if sentiment_scale is None or len(sentiment_scale) == 0:
+            sentiment_scale = ["Negative", "Neutral", "Positive"]
+
+        if unit == "word":
+            unit = NaturalLanguage.NLTokenUnitWord
+        elif unit == "sentence":
+            unit = NaturalLanguage.NLTokenUnitSentence
+        elif unit == "paragraph":
+            unit = NaturalLanguage.NLTokenUnitParagraph
+        elif unit == "document":
+            unit = NaturalLanguage.NLTokenUnitDocument
+
+        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
+            [NaturalLanguage.NLTagSchemeSentimentScore]
         )
-        self.multiple_selections_allowed: bool = (
-            multiple_selections_allowed  #: Whether multiple items can be selected
+        tagger.setString_(str(self.xa_elem))
+
+        tagged_sentiments = []
+
+        def apply_tags(tag, token_range, error):
+            paragraph = str(self.xa_elem)[
+                token_range.location : token_range.location + token_range.length
+            ]
+            if paragraph.strip() != "":
+                # Map raw tag value to range length
+                raw_value = float(tag or 0)
+                scaled = (raw_value + 1.0) / 2.0 * (len(sentiment_scale) - 1)
+
+                label = sentiment_scale[int(scaled)]
+                tagged_sentiments.append((paragraph, label))
+
+        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
+            (0, len(str(self.xa_elem))),
+            unit,
+            NaturalLanguage.NLTagSchemeSentimentScore,
+            0,
+            apply_tags,
         )
-        self.empty_selection_allowed: bool = empty_selection_allowed  #: Whether the user can click OK without selecting anything
+        return tagged_sentiments
 
-    def display(self) -> Union[str, int, bool, list[str], list[int]]:
-        """Displays the menu, waits for the user to select an option or cancel, then returns the selected value or False if cancelled.
+    def extract_urls(self) -> list["XAURL"]:
+        """Gets a list of URLs in the text.
 
-        :return: The selected value or False if no value was selected
-        :rtype: Union[str, int, bool, list[str], list[int]]
+        :return: The list of URLs.
+        :rtype: list[XAURL]
 
-        .. versionadded:: 0.0.8
-        """
-        menu_items = [x.replace("'", "") for x in self.menu_items]
-        menu_items = str(menu_items).replace("'", '"')
-        default_items = str(self.default_items).replace("'", '"')
-        script = AppleScript(
-            f"""
-        tell application "System Events"
-            choose from list {menu_items} with title \"{self.title}\" with prompt \"{self.prompt}\" default items {default_items} OK button name \"{self.ok_button_name}\" cancel button name \"{self.cancel_button_name}\" multiple selections allowed {self.multiple_selections_allowed} empty selection allowed {self.empty_selection_allowed}
-        end tell
+        .. versionadded:: 0.3.0
         """
+        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
+            AppKit.NSTextCheckingTypeLink, None
         )
-        result = script.run()["event"]
-        if result is not None:
-            if self.multiple_selections_allowed:
-                values = []
-                for x in range(1, result.numberOfItems() + 1):
-                    desc = result.descriptorAtIndex_(x)
-                    values.append(desc.stringValue())
-                return values
-            else:
-                if result.stringValue() == "false":
-                    return False
-                return result.stringValue()
+        if detector[1] is not None:
+            raise Exception("Error creating data detector")
 
+        matches = detector[0].matchesInString_options_range_(
+            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
+        )
+        return [XAURL(match.URL()) for match in matches]
 
-class XAFilePicker(XAObject):
-    """A file selection window.
+    def extract_dates(self) -> list["XADatetimeBlock"]:
+        """Gets a list of dates and durations in the text.
 
-    .. versionadded:: 0.0.8
-    """
+        :return: The list of dates.
+        :rtype: list[XADatetimeBlock]
 
-    def __init__(
-        self,
-        prompt: str = "Choose File",
-        types: list[str] = None,
-        default_location: Union[str, None] = None,
-        show_invisibles: bool = False,
-        multiple_selections_allowed: bool = False,
-        show_package_contents: bool = False,
-    ):
-        super().__init__()
-        self.prompt: str = prompt  #: The prompt to display in the dialog box
-        self.types: list[
-            str
-        ] = types  #: The file types/type identifiers to allow for selection
-        self.default_location: Union[
-            str, None
-        ] = default_location  #: The default file location
-        self.show_invisibles: bool = (
-            show_invisibles  #: Whether invisible files and folders are shown
-        )
-        self.multiple_selections_allowed: bool = (
-            multiple_selections_allowed  #: Whether the user can select multiple files
+        .. versionadded:: 0.3.0
+        """
+        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
+            AppKit.NSTextCheckingTypeDate, None
         )
-        self.show_package_contents: bool = (
-            show_package_contents  #: Whether to show the contents of packages
+        if detector[1] is not None:
+            raise Exception("Error creating data detector")
+
+        matches = detector[0].matchesInString_options_range_(
+            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
         )
+        return [XADatetimeBlock(match.date(), match.duration()) for match in matches]
 
-    def display(self) -> Union[XAPath, None]:
-        """Displays the file chooser, waits for the user to select a file or cancel, then returns the selected file URL or None if cancelled.
+    def extract_addresses(self):
+        """Gets a list of addresses in the text.
 
-        :return: The selected file URL or None if no file was selected
-        :rtype: Union[XAPath, None]
+        :return: The list of addresses.
+        :rtype: list[XALocation]
 
-        .. versionadded:: 0.0.8
+        .. versionadded:: 0.3.0
         """
-        types = [x.replace("'", "") for x in self.types]
-        types = str(types).replace("'", '"')
-        types_str = "of type " + types if self.types is not None else ""
+        import CoreLocation
 
-        default_location_str = (
-            'default location "' + self.default_location + '"'
-            if self.default_location is not None
-            else ""
+        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
+            AppKit.NSTextCheckingTypeAddress, None
         )
+        if detector[1] is not None:
+            raise Exception()
 
-        script = AppleScript(
-            f"""
-        tell application "System Events"
-            choose file with prompt \"{self.prompt}\" {types_str}{default_location_str} invisibles {self.show_invisibles} multiple selections allowed {self.multiple_selections_allowed} showing package contents {self.show_package_contents}
-        end tell
-        """
+        matches = detector[0].matchesInString_options_range_(
+            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
         )
-        result = script.run()["event"]
+        address_dicts = [match.addressComponents() for match in matches]
 
-        if result is not None:
-            if self.multiple_selections_allowed:
-                values = []
-                for x in range(1, result.numberOfItems() + 1):
-                    desc = result.descriptorAtIndex_(x)
-                    values.append(XAPath(desc.fileURLValue()))
-                return values
-            else:
-                return XAPath(result.fileURLValue())
+        geocoder = CoreLocation.CLGeocoder.alloc().init()
+        addresses = []
 
+        def add_location(placemarks, error):
+            nonlocal addresses
+            if error is not None:
+                raise Exception("Error creating data detector")
 
-class XAFolderPicker(XAObject):
-    """A folder selection window.
+            if len(placemarks) > 0:
+                addresses.append(
+                    XALocation(
+                        placemarks[0].location(),
+                        placemarks[0].name(),
+                        0,
+                        0,
+                        None,
+                        0,
+                        placemarks[0].postalAddress(),
+                    )
+                )
 
-    .. versionadded:: 0.0.8
-    """
+            if len(addresses) == len(address_dicts):
+                AppHelper.stopEventLoop()
 
-    def __init__(
-        self,
-        prompt: str = "Choose Folder",
-        default_location: Union[str, None] = None,
-        show_invisibles: bool = False,
-        multiple_selections_allowed: bool = False,
-        show_package_contents: bool = False,
-    ):
-        super().__init__()
-        self.prompt: str = prompt  #: The prompt to display in the dialog box
-        self.default_location: Union[
-            str, None
-        ] = default_location  #: The default folder location
-        self.show_invisibles: bool = (
-            show_invisibles  #: Whether invisible files and folders are shown
-        )
-        self.multiple_selections_allowed: bool = (
-            multiple_selections_allowed  #: Whether the user can select multiple folders
-        )
-        self.show_package_contents: bool = (
-            show_package_contents  #: Whether to show the contents of packages
-        )
+        for address_dict in address_dicts:
+            address_string = ", ".join(
+                [x for x in address_dict.values() if x is not None]
+            )
+            geocoder.geocodeAddressString_completionHandler_(
+                address_string, add_location
+            )
 
-    def display(self) -> Union[XAPath, None]:
-        """Displays the folder chooser, waits for the user to select a folder or cancel, then returns the selected folder URL or None if cancelled.
+        AppHelper.runConsoleEventLoop()
+        return addresses
 
-        :return: The selected folder URL or None if no folder was selected
-        :rtype: Union[XAPath, None]
+    def extract_phone_numbers(self):
+        """Gets a list of phone numbers in the text.
 
-        .. versionadded:: 0.0.8
-        """
+        :return: The list of phone numbers.
+        :rtype: list[XAText]
 
-        default_location_str = (
-            'default location "' + self.default_location + '"'
-            if self.default_location is not None
-            else ""
+        .. versionadded:: 0.3.0
+        """
+        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
+            AppKit.NSTextCheckingTypePhoneNumber, None
         )
+        if detector[1] is not None:
+            raise Exception("Error creating data detector")
 
-        script = AppleScript(
-            f"""
-        tell application "System Events"
-            choose folder with prompt \"{self.prompt}\" {default_location_str} invisibles {self.show_invisibles} multiple selections allowed {self.multiple_selections_allowed} showing package contents {self.show_package_contents}
-        end tell
-        """
+        matches = detector[0].matchesInString_options_range_(
+            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
         )
-        result = script.run()["event"]
-        if result is not None:
-            if self.multiple_selections_allowed:
-                values = []
-                for x in range(1, result.numberOfItems() + 1):
-                    desc = result.descriptorAtIndex_(x)
-                    values.append(XAPath(desc.fileURLValue()))
-                return values
-            else:
-                return XAPath(result.fileURLValue())
+        return [XAText(match.phoneNumber()) for match in matches]
 
+    def paragraphs(self, filter: dict = None) -> "XAParagraphList":
+        """Gets a list of paragraphs in the text.
 
-class XAApplicationPicker(XAObject):
-    """An application selection window.
+        :param filter: The properties and associated values to filter paragraphs by, defaults to None
+        :type filter: dict, optional
+        :return: The list of paragraphs
+        :rtype: XAParagraphList
 
-    .. versionadded:: 0.1.0
-    """
+        :Example 1: Get paragraphs of a text string
 
-    def __init__(
-        self,
-        title: Union[str, None] = None,
-        prompt: Union[str, None] = None,
-        multiple_selections_allowed: bool = False,
-    ):
-        super().__init__()
-        self.title: str = title  #: The dialog window title
-        self.prompt: str = prompt  #: The prompt to be displayed in the dialog box
-        self.multiple_selections_allowed: bool = multiple_selections_allowed  #: Whether to allow multiple items to be selected
+        >>> import PyXA
+        >>> string = \"\"\"This is the first paragraph.
+        >>>
+        >>> This is the second paragraph.\"\"\"
+        >>> text = PyXA.XAText(string)
+        >>> print(text.paragraphs())
+        <<class 'PyXA.XAWordList'>['This is the first paragraph.', 'This is the second paragraph. Neat! Very cool.']>
 
-    def display(self) -> str:
-        """Displays the application chooser, waits for the user to select an application or cancel, then returns the selected application's name or None if cancelled.
+        :Example 2: Get paragraphs of a Note
 
-        :return: The name of the selected application
-        :rtype: str
+        >>> import PyXA
+        >>> app = PyXA.Application("Notes")
+        >>> note = app.notes()[0]
+        >>> text = PyXA.XAText(note.plaintext)
+        >>> print(text.paragraphs())
+        <<class 'PyXA.XAWordList'>['This is the first paragraph.', 'This is the second paragraph. Neat! Very cool.']>
 
-        .. versionadded:: 0.0.8
+        .. versionadded:: 0.0.1
         """
+        if isinstance(self.xa_elem, str):
+            ls = [x for x in self.xa_elem.split("\n") if x.strip() != ""]
+            return self._new_element(ls, XAWordList, filter)
+        else:
+            return self._new_element(self.xa_elem.paragraphs(), XAParagraphList, filter)
 
-        script = AppleScript('tell application "System Events"')
-        dialog_str = "choose application "
-        if self.title is not None:
-            dialog_str += f'with title "{self.title}" '
-        if self.prompt is not None:
-            dialog_str += f'with prompt "{self.prompt}"'
-        dialog_str += f"multiple selections allowed {self.multiple_selections_allowed} "
-        script.add(dialog_str)
-        script.add("end tell")
-
-        return script.run()["string"]
-
-
-class XAFileNameDialog(XAObject):
-    """A file name input window.
-
-    .. versionadded:: 0.0.8
-    """
+    def sentences(self) -> "XASentenceList":
+        """Gets a list of sentences in the text.
 
-    def __init__(
-        self,
-        prompt: str = "Specify file name and location",
-        default_name: str = "New File",
-        default_location: Union[str, None] = None,
-    ):
-        super().__init__()
-        self.prompt: str = prompt  #: The prompt to display in the dialog box
-        self.default_name: str = default_name  #: The default name for the new file
-        self.default_location: Union[
-            str, None
-        ] = default_location  #: The default file location
+        :return: The list of sentencnes
+        :rtype: XASentenceList
 
-    def display(self) -> Union[XAPath, None]:
-        """Displays the file name input window, waits for the user to input a name and location or cancel, then returns the specified file URL or None if cancelled.
+        :Example:
 
-        :return: The specified file URL or None if no file name was inputted
-        :rtype: Union[XAPath, None]
+        >>> import PyXA
+        >>> app = PyXA.Application("Notes")
+        >>> note = app.notes()[0]
+        >>> text = PyXA.XAText(note.plaintext)
+        >>> print(text.sentences())
+        <<class 'PyXA.XASentenceList'>['This is the first paragraph.\\n', '\\n', 'This is the second paragraph. ', 'Neat! ', 'Very cool.']>
 
-        .. versionadded:: 0.0.8
+        .. versionadded:: 0.1.0
         """
+        raw_string = self.xa_elem
+        if hasattr(self.xa_elem, "get"):
+            raw_string = self.xa_elem.get()
 
-        default_location_str = (
-            'default location "' + self.default_location + '"'
-            if self.default_location is not None
-            else ""
+        sentences = []
+        tokenizer = AppKit.NLTokenizer.alloc().initWithUnit_(
+            AppKit.kCFStringTokenizerUnitSentence
         )
+        tokenizer.setString_(raw_string)
+        for char_range in tokenizer.tokensForRange_((0, len(raw_string))):
+            start = char_range.rangeValue().location
+            end = start + char_range.rangeValue().length
+            sentences.append(raw_string[start:end])
 
-        script = AppleScript(
-            f"""
-        tell application "System Events"
-            choose file name with prompt \"{self.prompt}\" default name \"{self.default_name}\" {default_location_str}
-        end tell
-        """
-        )
-        result = script.run()["event"]
-        if result is not None:
-            return XAPath(result.fileURLValue())
+        ls = AppKit.NSArray.alloc().initWithArray_(sentences)
+        return self._new_element(sentences, XASentenceList)
+
+    def words(self, filter: dict = None) -> "XAWordList":
+        """Gets a list of words in the text.
 
+        :return: The list of words
+        :rtype: XAWordList
 
-#############################
-### System / Image Events ###
-#############################
-# ? Move into separate XAFileSystemBase.py file?
-class XAEventsApplication(XACanOpenPath):
-    """A base class for the System and Image events applications.
+        :Example:
 
-    .. versionadded:: 0.1.0
-    """
+        >>> import PyXA
+        >>> app = PyXA.Application("Notes")
+        >>> note = app.notes()[0]
+        >>> text = PyXA.XAText(note.plaintext)
+        >>> print(text.words())
+        <<class 'PyXA.XAWordList'>['This', 'is', 'the', 'first', 'paragraph.', 'This', 'is', 'the', 'second', 'paragraph.', 'Neat!', 'Very', 'cool.']>
 
-    class Format(Enum):
-        """Disk format options."""
+        .. versionadded:: 0.0.1
+        """
+        if isinstance(self.xa_elem, str):
+            ls = self.xa_elem.split()
+            return self._new_element(ls, XAWordList, filter)
+        else:
+            return self._new_element(self.xa_elem.words(), XAWordList, filter)
 
-        APPLE_PHOTO = OSType("dfph")
-        APPLESHARE = OSType("dfas")
-        AUDIO = OSType("dfau")
-        HIGH_SIERRA = OSType("dfhs")
-        ISO_9660 = OSType("fd96")
-        MACOS_EXTENDED = OSType("dfh+")
-        MACOS = OSType("dfhf")
-        MSDOS = OSType("dfms")
-        NFS = OSType("dfnf")
-        PRODOS = OSType("dfpr")
-        QUICKTAKE = OSType("dfqt")
-        UDF = OSType("dfud")
-        UFS = OSType("dfuf")
-        UNKNOWN = OSType("df$$")
-        WEBDAV = OSType("dfwd")
+    def characters(self, filter: dict = None) -> "XACharacterList":
+        """Gets a list of characters in the text.
 
+        :return: The list of characters
+        :rtype: XACharacterList
 
-class XADiskItemList(XAList):
-    """A wrapper around lists of disk items that employs fast enumeration techniques.
+        :Example 1: Get all characters in a text
 
-    All properties of disk items can be called as methods on the wrapped list, returning a list containing each item's value for the property.
+        >>> import PyXA
+        >>> app = PyXA.Application("Notes")
+        >>> note = app.notes()[0]
+        >>> text = PyXA.XAText(note.plaintext)
+        >>> print(text.characters())
+        <<class 'PyXA.XACharacterList'>['T', 'h', 'i', 's', ' ', 'i', 's', ' ', 't', 'h', 'e', ' ', 'f', 'i', 'r', 's', 't', ' ', 'p', 'a', 'r', 'a', 'g', 'r', 'a', 'p', 'h', '.', '\\n', '\\n', 'T', 'h', 'i', 's', ' ', 'i', 's', ' ', 't', 'h', 'e', ' ', 's', 'e', 'c', 'o', 'n', 'd', ' ', 'p', 'a', 'r', 'a', 'g', 'r', 'a', 'p', 'h', '.', ' ', 'N', 'e', 'a', 't', '!', ' ', 'V', 'e', 'r', 'y', ' ', 'c', 'o', 'o', 'l', '.']>
 
-    .. versionadded:: 0.1.0
-    """
+        :Example 2: Get the characters of the first word in a text
 
-    def __init__(
-        self, properties: dict, filter: Union[dict, None] = None, object_class=None
-    ):
-        if object_class is None:
-            object_class = XADiskItem
-        super().__init__(properties, object_class, filter)
+        >>> import PyXA
+        >>> app = PyXA.Application("Notes")
+        >>> note = app.notes()[0]
+        >>> text = PyXA.XAText(note.plaintext)
+        >>> print(text.words()[0].characters())
+        <<class 'PyXA.XACharacterList'>['T', 'h', 'i', 's']>
 
-    def busy_status(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("busyStatus") or [])
+        .. versionadded:: 0.0.1
+        """
+        if isinstance(self.xa_elem, str):
+            ls = list(self.xa_elem)
+            return self._new_element(ls, XACharacterList, filter)
+        else:
+            return self._new_element(
+                self.xa_elem.characters().get(), XACharacterList, filter
+            )
 
-    def container(self) -> "XADiskItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
-        return self._new_element(ls, XADiskItemList)
+    def attribute_runs(self, filter: dict = None) -> "XAAttributeRunList":
+        """Gets a list of attribute runs in the text. For formatted text, this returns all sequences of characters sharing the same attributes.
 
-    def creation_date(self) -> list["datetime"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creationDate") or [])
+        :param filter: The properties and associated values to filter attribute runs by, defaults to None
+        :type filter: dict, optional
+        :return: The list of attribute runs
+        :rtype: XAAttributeRunList
 
-    def displayed_name(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayedName") or [])
+        .. versionadded:: 0.0.1
+        """
+        if isinstance(self.xa_elem, str):
+            return []
+        else:
+            return self._new_element(
+                self.xa_elem.attributeRuns(), XAAttributeRunList, filter
+            )
 
-    def id(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+    def attachments(self, filter: dict = None) -> "XAAttachmentList":
+        """Gets a list of attachments of the text.
 
-    def modification_date(self) -> list["datetime"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        :param filter: The properties and associated values to filter attachments by, defaults to None
+        :type filter: dict, optional
+        :return: The list of attachments
+        :rtype: XAAttachmentList
 
-    def name(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        .. versionadded:: 0.0.1
+        """
+        if isinstance(self.xa_elem, str):
+            return []
+        else:
+            return self._new_element(
+                self.xa_elem.attachments(), XAAttachmentList, filter
+            )
 
-    def name_extension(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("nameExtension") or [])
+    def __len__(self):
+        return len(self.xa_elem.get())
 
-    def package_folder(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("packageFolder") or [])
+    def __str__(self):
+        if isinstance(self.xa_elem, str):
+            return self.xa_elem
+        return str(self.xa_elem.get())
 
-    def path(self) -> list["XAPath"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
-        return [XAPath(x) for x in ls]
+    def __repr__(self):
+        if isinstance(self.xa_elem, str):
+            return self.xa_elem
+        return str(self.xa_elem.get())
 
-    def physical_size(self) -> list["int"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("physicalSize") or [])
 
-    def posix_path(self) -> list[XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("POSIXPath") or []
-        return [XAPath(x) for x in ls]
+class XAParagraphList(XATextList):
+    """A wrapper around lists of paragraphs that employs fast enumeration techniques.
 
-    def size(self) -> list["int"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+    .. versionadded:: 0.0.5
+    """
 
-    def url(self) -> list["XAURL"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
-        return [XAURL(x) for x in ls]
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XAParagraph)
 
-    def visible(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
 
-    def volume(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("volume") or [])
+class XAParagraph(XAText):
+    """A class for managing and interacting with paragraphs in text documents.
 
-    def by_busy_status(self, busy_status: bool) -> Union["XADiskItem", None]:
-        return self.by_property("busyStatus", busy_status)
+    .. versionadded:: 0.0.1
+    """
 
-    def by_container(self, container: "XADiskItem") -> Union["XADiskItem", None]:
-        return self.by_property("container", container.xa_elem)
+    def __init__(self, properties):
+        super().__init__(properties)
 
-    def by_creation_date(self, creation_date: datetime) -> Union["XADiskItem", None]:
-        return self.by_property("creationDate", creation_date)
 
-    def by_displayed_name(self, displayed_name: str) -> Union["XADiskItem", None]:
-        return self.by_property("displayedName", displayed_name)
+class XASentenceList(XATextList):
+    """A wrapper around lists of sentences that employs fast enumeration techniques.
 
-    def by_id(self, id: str) -> Union["XADiskItem", None]:
-        return self.by_property("id", id)
+    .. versionadded:: 0.0.5
+    """
 
-    def by_modification_date(
-        self, modification_date: datetime
-    ) -> Union["XADiskItem", None]:
-        return self.by_property("modificationDate", modification_date)
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XASentence)
 
-    def by_name(self, name: str) -> Union["XADiskItem", None]:
-        return self.by_property("name", name)
 
-    def by_name_extension(self, name_extension: str) -> Union["XADiskItem", None]:
-        return self.by_property("nameExtension", name_extension)
+class XASentence(XAText):
+    """A class for managing and interacting with sentences in text documents.
 
-    def by_package_folder(self, package_folder: bool) -> Union["XADiskItem", None]:
-        return self.by_property("packageFolder", package_folder)
+    .. versionadded:: 0.0.1
+    """
 
-    def by_path(self, path: Union[XAPath, str]) -> Union["XADiskItem", None]:
-        if isinstance(path, XAPath):
-            path = path.path
-        return self.by_property("path", path)
+    def __init__(self, properties):
+        super().__init__(properties)
 
-    def by_physical_size(self, physical_size: int) -> Union["XADiskItem", None]:
-        return self.by_property("physicalSize", physical_size)
 
-    def by_posix_path(
-        self, posix_path: Union[XAPath, str]
-    ) -> Union["XADiskItem", None]:
-        if isinstance(posix_path, XAPath):
-            posix_path = posix_path.path
-        return self.by_property("POSIXPath", posix_path)
+class XAWordList(XATextList):
+    """A wrapper around lists of words that employs fast enumeration techniques.
 
-    def by_size(self, size: int) -> Union["XADiskItem", None]:
-        return self.by_property("size", size)
+    .. versionadded:: 0.0.5
+    """
 
-    def by_url(self, url: XAURL) -> Union["XADiskItem", None]:
-        return self.by_property("URL", url.xa_elem)
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XAWord)
 
-    def by_visible(self, visible: bool) -> Union["XADiskItem", None]:
-        return self.by_property("visible", visible)
 
-    def by_volume(self, volume: str) -> Union["XADiskItem", None]:
-        return self.by_property("volume", volume)
+class XAWord(XAText):
+    """A class for managing and interacting with words in text documents.
 
-    def move_to(self, folder: Union[str, XAPath, "XAFolder"]) -> "XADiskItem":
-        """Moves all disk items in the list to the specified location.
+    .. versionadded:: 0.0.1
+    """
 
-        :param folder: The folder location to move the items to
-        :type folder: Union[str, XAPath, XAFolder]
-        :return: The list of disk items
-        :rtype: XADiskItem
+    def __init__(self, properties):
+        super().__init__(properties)
 
-        .. versionadded:: 0.2.1
-        """
-        if isinstance(folder, XAFolder):
-            folder = folder.posix_path
-        elif isinstance(folder, str):
-            folder = XAPath(folder)
 
-        for item in self.xa_elem.get():
-            item.moveTo_(folder.xa_elem)
-        return self
+class XACharacterList(XATextList):
+    """A wrapper around lists of characters that employs fast enumeration techniques.
 
-    def __repr__(self):
-        return "<" + str(type(self)) + str(self.name()) + ">"
+    .. versionadded:: 0.0.5
+    """
 
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XACharacter)
 
-class XADiskItem(XAObject, XAPathLike):
-    """An item stored in the file system.
 
-    .. versionadded:: 0.1.0
+class XACharacter(XAText):
+    """A class for managing and interacting with characters in text documents.
+
+    .. versionadded:: 0.0.1
     """
 
     def __init__(self, properties):
         super().__init__(properties)
 
-    @property
-    def busy_status(self) -> "bool":
-        """Whether the disk item is busy.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.busyStatus()
+class XAAttributeRunList(XATextList):
+    """A wrapper around lists of attribute runs that employs fast enumeration techniques.
+
+    .. versionadded:: 0.0.5
+    """
 
-    @property
-    def container(self) -> "XADiskItem":
-        """The folder or disk which has this disk item as an element.
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XAAttributeRun)
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.container(), XADiskItem)
 
-    @property
-    def creation_date(self) -> "datetime":
-        """The date on which the disk item was created.
+class XAAttributeRun(XAText):
+    """A class for managing and interacting with attribute runs in text documents.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.creationDate()
+    .. versionadded:: 0.0.1
+    """
 
-    @property
-    def displayed_name(self) -> "str":
-        """The name of the disk item as displayed in the User Interface.
+    def __init__(self, properties):
+        super().__init__(properties)
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.displayedName()
 
-    @property
-    def id(self) -> "str":
-        """The unique ID of the disk item.
+class XAAttachmentList(XATextList):
+    """A wrapper around lists of text attachments that employs fast enumeration techniques.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.id()
+    .. versionadded:: 0.0.5
+    """
 
-    @property
-    def modification_date(self) -> "datetime":
-        """The date on which the disk item was last modified.
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XAAttachment)
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.modificationDate()
 
-    @property
-    def name(self) -> "str":
-        """The name of the disk item.
+class XAAttachment(XAObject):
+    """A class for managing and interacting with attachments in text documents.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.name()
+    .. versionadded:: 0.0.1
+    """
 
-    @property
-    def name_extension(self) -> "str":
-        """The extension portion of the name.
+    def __init__(self, properties):
+        super().__init__(properties)
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.nameExtension()
 
-    @property
-    def package_folder(self) -> "bool":
-        """Whether the disk item is a package.
+class XAColorList(XATextList):
+    """A wrapper around lists of colors that employs fast enumeration techniques.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.packageFolder()
+    .. versionadded:: 0.0.6
+    """
 
-    @property
-    def path(self) -> "XAPath":
-        """The file system path of the disk item.
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, _xa_graphics().XAColor, filter)
 
-        .. versionadded:: 0.1.0
-        """
-        return XAPath(self.xa_elem.path())
 
-    @property
-    def physical_size(self) -> "int":
-        """The actual space used by the disk item on disk.
+class XALocation(XAObject):
+    """A location with a latitude and longitude, along with other data.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.physicalSize()
+    .. versionadded:: 0.0.2
+    """
 
-    @property
-    def posix_path(self) -> XAPath:
-        """The POSIX file system path of the disk item.
+    current_location: "XALocation"  #: The current location of the device
 
-        .. versionadded:: 0.1.0
-        """
-        return XAPath(self.xa_elem.POSIXPath())
+    def __init__(
+        self,
+        raw_value=None,
+        title: str = None,
+        latitude: float = 0,
+        longitude: float = 0,
+        altitude: float = None,
+        radius: int = 0,
+        address: str = None,
+    ):
+        self.raw_value = raw_value  #: The raw CLLocation object
+        self.title = title  #: The name of the location
+        self.latitude = latitude  #: The latitude of the location
+        self.longitude = longitude  #: The longitude of the location
+        self.altitude = altitude  #: The altitude of the location
+        self.radius = radius  #: The horizontal accuracy of the location measurement
+        self.address = address  #: The address of the location
 
-    @property
-    def size(self) -> "int":
-        """The logical size of the disk item.
+        import CoreLocation
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.size()
+        if self.raw_value is None:
+            if latitude is not None and longitude is not None:
+                self.raw_value = (
+                    CoreLocation.CLLocation.alloc().initWithLatitude_longitude_(
+                        latitude, longitude
+                    )
+                )
+        else:
+            self.latitude = self.raw_value.coordinate()[0]
+            self.longitude = self.raw_value.coordinate()[1]
+            self.altitude = self.raw_value.altitude()
+            self.radius = self.raw_value.horizontalAccuracy()
 
     @property
-    def url(self) -> "XAURL":
-        """The URL of the disk item.
+    def raw_value(self):
+        return self.__raw_value
 
-        .. versionadded:: 0.1.0
-        """
-        return XAURL(self.xa_elem.URL())
+    @raw_value.setter
+    def raw_value(self, raw_value):
+        self.__raw_value = raw_value
+        if raw_value is not None:
+            self.latitude = raw_value.coordinate()[0]
+            self.longitude = raw_value.coordinate()[1]
+            self.altitude = raw_value.altitude()
+            self.radius = raw_value.horizontalAccuracy()
 
     @property
-    def visible(self) -> "bool":
-        """Whether the disk item is visible.
+    def current_location(self) -> "XALocation":
+        """The location of the user's computer."""
+        self.raw_value = None
+        self._spawn_thread(self.__get_current_location)
+        while self.raw_value is None:
+            time.sleep(0.01)
+        return self
 
-        .. versionadded:: 0.1.0
+    def show_in_maps(self):
+        """Shows the location in Maps.app.
+
+        .. versionadded:: 0.0.6
         """
-        return self.xa_elem.visible()
+        XAURL(f"maps://?q={self.title},ll={self.latitude},{self.longitude}").open()
 
-    @property
-    def volume(self) -> "str":
-        """The volume on which the disk item resides.
+    def reverse_geocode(self) -> dict[str, str]:
+        """Obtains reverse-geocode information from the location's latitude and longitude.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.volume()
+        :return: A dictionary containing the location's name, street address, locality, state, country, timezone, and notable features.
+        :rtype: dict[str, str]
 
-    def open(self) -> "XADiskItem":
-        """Opens the item in its default application.
+        :Example:
 
-        :return: The item object
-        :rtype: XADiskItem
+        >>> import PyXA
+        >>> loc = PyXA.XALocation(latitude=44.460552, longitude=-110.82807)
+        >>> print(loc.reverse_geocode())
+        {'name': 'Old Faithful', 'street_number': None, 'street': 'Upper Geyser Basin Trail', 'sub_locality': None, 'locality': 'Alta', 'county': 'Teton County', 'state': 'WY', 'postal_code': '83414', 'country': 'United States', 'timezone': America/Denver (MST) offset -25200, 'notable_features': (
+            "Old Faithful",
+            "Yellowstone National Park"
+        )}
 
         .. versionadded:: 0.1.1
         """
-        self.xa_elem.open()
-        return self
+        self._placemark = None
 
-    def move_to(self, folder: Union[str, XAPath, "XAFolder"]) -> "XADiskItem":
-        """Moves the disk item to the specified location.
+        def get_place(place, error):
+            if place is not None:
+                self._placemark = place[0]
+            AppHelper.stopEventLoop()
 
-        :param folder: The folder location to move the item to
-        :type folder: Union[str, XAPath, XAFolder]
-        :return: The disk item object
-        :rtype: XADiskItem
+        import CoreLocation
 
-        .. versionadded:: 0.2.1
-        """
-        if isinstance(folder, XAFolder):
-            folder = folder.posix_path
-        elif isinstance(folder, str):
-            folder = XAPath(folder)
+        CoreLocation.CLGeocoder.alloc().init().reverseGeocodeLocation_completionHandler_(
+            self.raw_value, get_place
+        )
+        AppHelper.runConsoleEventLoop()
 
-        self.xa_elem.moveTo_(folder.xa_elem)
-        return self
+        return {
+            "name": self._placemark.name(),
+            "street_number": self._placemark.subThoroughfare(),
+            "street": self._placemark.thoroughfare(),
+            "sub_locality": self._placemark.subLocality(),
+            "locality": self._placemark.locality(),
+            "county": self._placemark.subAdministrativeArea(),
+            "state": self._placemark.administrativeArea(),
+            "postal_code": self._placemark.postalCode(),
+            "country": self._placemark.country(),
+            "timezone": self._placemark.timeZone(),
+            "notable_features": self._placemark.areasOfInterest(),
+        }
 
-    def get_path_representation(self) -> XAPath:
-        return self.posix_path
+    def __get_current_location(self):
+        import CoreLocation
 
-    def __repr__(self):
-        return "<" + str(type(self)) + str(self.name) + ">"
+        location_manager = CoreLocation.CLLocationManager.alloc().init()
+        old_self = self
 
+        class CLLocationManagerDelegate(AppKit.NSObject):
+            def locationManager_didUpdateLocations_(self, manager, locations):
+                if locations is not None:
+                    old_self.raw_value = locations[0]
+                    AppHelper.stopEventLoop()
 
-class XAAliasList(XADiskItemList):
-    """A wrapper around lists of aliases that employs fast enumeration techniques.
+            def locationManager_didFailWithError_(self, manager, error):
+                print(manager, error)
 
-    All properties of aliases can be called as methods on the wrapped list, returning a list containing each alias' value for the property.
+        location_manager.requestWhenInUseAuthorization()
+        location_manager.setDelegate_(CLLocationManagerDelegate.alloc().init().retain())
+        location_manager.requestLocation()
 
-    .. versionadded:: 0.1.0
-    """
+        AppHelper.runConsoleEventLoop()
+
+    def __repr__(self):
+        return (
+            "<"
+            + str(type(self))
+            + (self.title + " " if self.title is not None else "")
+            + str((self.latitude, self.longitude))
+            + ">"
+        )
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XAAlias)
 
-    def creator_type(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creatorType") or [])
+class XAColorPickerStyle(Enum):
+    """Options for which tab a color picker should display when first opened."""
 
-    def default_application(self) -> "XADiskItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("defaultApplication") or []
-        return self._new_element(ls, XADiskItemList)
+    GRAYSCALE = AppKit.NSColorPanelModeGray
+    RGB_SLIDERS = AppKit.NSColorPanelModeRGB
+    CMYK_SLIDERS = AppKit.NSColorPanelModeCMYK
+    HSB_SLIDERS = AppKit.NSColorPanelModeHSB
+    COLOR_LIST = AppKit.NSColorPanelModeColorList
+    COLOR_WHEEL = AppKit.NSColorPanelModeWheel
+    CRAYONS = AppKit.NSColorPanelModeCrayon
+    IMAGE_PALETTE = AppKit.NSColorPanelModeCustomPalette
 
-    def file_type(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileType") or [])
 
-    def kind(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+class XAColorPicker(XAObject):
+    """A class for creating and interacting with a color picker window.
 
-    def product_version(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("productVersion") or [])
+    .. versionadded:: 0.0.5
+    """
 
-    def short_version(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shortVersion") or [])
+    def __init__(self, style: XAColorPickerStyle = XAColorPickerStyle.COLOR_WHEEL):
+        super().__init__()
+        self.style = style
 
-    def stationery(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("stationery") or [])
+    def display(self) -> "XAColor":
+        """Displays the color picker.
 
-    def type_identifier(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("typeIdentifier") or [])
+        :return: The color that the user selected
+        :rtype: XAColor
 
-    def version(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("version") or [])
+        .. versionadded:: 0.0.5
+        """
+        panel = AppKit.NSColorPanel.sharedColorPanel()
+        panel.setMode_(self.style.value)
+        panel.setShowsAlpha_(True)
 
-    def by_creator_type(self, creator_type: str) -> Union["XAAlias", None]:
-        return self.by_property("creatorType", creator_type)
+        def run_modal(panel):
+            initial_color = panel.color()
+            time.sleep(0.5)
+            while panel.isVisible() and panel.color() == initial_color:
+                time.sleep(0.01)
+            AppKit.NSApp.stopModal()
 
-    def by_default_application(
-        self, default_application: "XADiskItem"
-    ) -> Union["XAAlias", None]:
-        return self.by_property("defaultApplication", default_application.xa_elem)
+        modal_thread = threading.Thread(
+            target=run_modal, args=(panel,), name="Run Modal", daemon=True
+        )
+        modal_thread.start()
 
-    def by_file_type(self, file_type: str) -> Union["XAAlias", None]:
-        return self.by_property("fileType", file_type)
+        AppKit.NSApp.runModalForWindow_(panel)
+        return _xa_graphics().XAColor(panel.color())
 
-    def by_kind(self, kind: str) -> Union["XAAlias", None]:
-        return self.by_property("kind", kind)
 
-    def by_product_version(self, product_version: str) -> Union["XAAlias", None]:
-        return self.by_property("productVersion", product_version)
+class XADialog(XAObject):
+    """A custom dialog window.
 
-    def by_short_version(self, short_version: str) -> Union["XAAlias", None]:
-        return self.by_property("shortVersion", short_version)
+    .. versionadded:: 0.0.8
+    """
 
-    def by_stationery(self, stationery: bool) -> Union["XAAlias", None]:
-        return self.by_property("stationery", stationery)
+    def __init__(
+        self,
+        text: str = "",
+        title: Union[str, None] = None,
+        buttons: Union[None, list[Union[str, int]]] = None,
+        hidden_answer: bool = False,
+        default_button: Union[str, int, None] = None,
+        cancel_button: Union[str, int, None] = None,
+        icon: Union[Literal["stop", "note", "caution"], None] = None,
+        default_answer: Union[str, int, None] = None,
+    ):
+        super().__init__()
+        self.text: str = text
+        self.title: str = title
+        self.buttons: Union[None, list[Union[str, int]]] = buttons or []
+        self.hidden_answer: bool = hidden_answer
+        self.icon: Union[str, None] = icon
+        self.default_button: Union[str, int, None] = default_button
+        self.cancel_button: Union[str, int, None] = cancel_button
+        self.default_answer: Union[str, int, None] = default_answer
 
-    def by_type_identifier(self, type_identifier: str) -> Union["XAAlias", None]:
-        return self.by_property("typeIdentifier", type_identifier)
+    def display(self) -> Union[str, int, None, list[str]]:
+        """Displays the dialog, waits for the user to select an option or cancel, then returns the selected button or None if cancelled.
 
-    def by_version(self, version: str) -> Union["XAAlias", None]:
-        return self.by_property("version", version)
+        :return: The selected button or None if no value was selected
+        :rtype: Union[str, int, None, list[str]]
 
+        .. versionadded:: 0.0.8
+        """
+        buttons = [x.replace("'", "") for x in self.buttons]
+        buttons = str(buttons).replace("'", '"')
 
-class XAAlias(XADiskItem):
-    """An alias in the file system.
+        default_button = str(self.default_button).replace("'", "")
+        default_button_str = (
+            'default button "' + default_button + '"'
+            if self.default_button is not None
+            else ""
+        )
 
-    .. versionadded:: 0.1.0
-    """
+        cancel_button = str(self.cancel_button).replace("'", "")
+        cancel_button_str = (
+            'cancel button "' + cancel_button + '"'
+            if self.cancel_button is not None
+            else ""
+        )
 
-    def __init__(self, properties):
-        super().__init__(properties)
+        icon_str = "with icon " + self.icon + "" if self.icon is not None else ""
 
-    @property
-    def creator_type(self) -> "str":
-        """The OSType identifying the application that created the alias.
+        default_answer = str(self.default_answer).replace("'", '"')
+        default_answer_str = (
+            'default answer "' + default_answer + '"'
+            if self.default_answer is not None
+            else ""
+        )
 
-        .. versionadded:: 0.1.0
+        script = AppleScript(
+            f"""
+        tell application "System Events"
+            display dialog \"{self.text}\" with title \"{self.title}\" buttons {buttons} {default_button_str} {cancel_button_str} {icon_str} {default_answer_str} hidden answer {self.hidden_answer}
+        end tell
         """
-        return self.xa_elem.creatorType()
+        )
 
-    @property
-    def default_application(self) -> "XADiskItem":
-        """The application that will launch if the alias is opened.
+        result = script.run()["event"]
+        if result is not None:
+            if result.numberOfItems() > 1:
+                return [
+                    result.descriptorAtIndex_(1).stringValue(),
+                    result.descriptorAtIndex_(2).stringValue(),
+                ]
+            else:
+                return result.descriptorAtIndex_(1).stringValue()
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.defaultApplication(), XADiskItem)
 
-    @property
-    def file_type(self) -> "str":
-        """The OSType identifying the type of data contained in the alias.
+class XAMenu(XAObject):
+    """A custom list item selection menu.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.fileType()
+    .. versionadded:: 0.0.8
+    """
 
-    @property
-    def kind(self) -> "str":
-        """The kind of alias, as shown in Finder.
+    def __init__(
+        self,
+        menu_items: list[Any],
+        title: str = "Select Item",
+        prompt: str = "Select an item",
+        default_items: Union[list[str], None] = None,
+        ok_button_name: str = "Okay",
+        cancel_button_name: str = "Cancel",
+        multiple_selections_allowed: bool = False,
+        empty_selection_allowed: bool = False,
+    ):
+        super().__init__()
+        self.menu_items: list[
+            Union[str, int]
+        ] = menu_items  #: The items the user can choose from
+        self.title: str = title  #: The title of the dialog window
+        self.prompt: str = prompt  #: The prompt to display in the dialog box
+        self.default_items: list[str] = (
+            default_items or []
+        )  #: The items to initially select
+        self.ok_button_name: str = ok_button_name  #: The name of the OK button
+        self.cancel_button_name: str = (
+            cancel_button_name  #: The name of the Cancel button
+        )
+        self.multiple_selections_allowed: bool = (
+            multiple_selections_allowed  #: Whether multiple items can be selected
+        )
+        self.empty_selection_allowed: bool = empty_selection_allowed  #: Whether the user can click OK without selecting anything
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.kind()
+    def display(self) -> Union[str, int, bool, list[str], list[int]]:
+        """Displays the menu, waits for the user to select an option or cancel, then returns the selected value or False if cancelled.
 
-    @property
-    def product_version(self) -> "str":
-        """The version of the product (visible at the top of the "Get Info" window).
+        :return: The selected value or False if no value was selected
+        :rtype: Union[str, int, bool, list[str], list[int]]
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.0.8
         """
-        return self.xa_elem.productVersion()
+        menu_items = [x.replace("'", "") for x in self.menu_items]
+        menu_items = str(menu_items).replace("'", '"')
+        default_items = str(self.default_items).replace("'", '"')
+        script = AppleScript(
+            f"""
+        tell application "System Events"
+            choose from list {menu_items} with title \"{self.title}\" with prompt \"{self.prompt}\" default items {default_items} OK button name \"{self.ok_button_name}\" cancel button name \"{self.cancel_button_name}\" multiple selections allowed {self.multiple_selections_allowed} empty selection allowed {self.empty_selection_allowed}
+        end tell
+        """
+        )
+        result = script.run()["event"]
+        if result is not None:
+            if self.multiple_selections_allowed:
+                values = []
+                for x in range(1, result.numberOfItems() + 1):
+                    desc = result.descriptorAtIndex_(x)
+                    values.append(desc.stringValue())
+                return values
+            else:
+                if result.stringValue() == "false":
+                    return False
+                return result.stringValue()
 
-    @property
-    def short_version(self) -> "str":
-        """The short version of the application bundle referenced by the alias.
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.shortVersion()
+class XAFilePicker(XAObject):
+    """A file selection window.
 
-    @property
-    def stationery(self) -> "bool":
-        """Whether the alias is a stationery pad.
+    .. versionadded:: 0.0.8
+    """
+
+    def __init__(
+        self,
+        prompt: str = "Choose File",
+        types: list[str] = None,
+        default_location: Union[str, None] = None,
+        show_invisibles: bool = False,
+        multiple_selections_allowed: bool = False,
+        show_package_contents: bool = False,
+    ):
+        super().__init__()
+        self.prompt: str = prompt  #: The prompt to display in the dialog box
+        self.types: list[
+            str
+        ] = types  #: The file types/type identifiers to allow for selection
+        self.default_location: Union[
+            str, None
+        ] = default_location  #: The default file location
+        self.show_invisibles: bool = (
+            show_invisibles  #: Whether invisible files and folders are shown
+        )
+        self.multiple_selections_allowed: bool = (
+            multiple_selections_allowed  #: Whether the user can select multiple files
+        )
+        self.show_package_contents: bool = (
+            show_package_contents  #: Whether to show the contents of packages
+        )
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.stationery()
+    def display(self) -> Union[XAPath, None]:
+        """Displays the file chooser, waits for the user to select a file or cancel, then returns the selected file URL or None if cancelled.
 
-    @property
-    def type_identifier(self) -> "str":
-        """The type identifier of the alias.
+        :return: The selected file URL or None if no file was selected
+        :rtype: Union[XAPath, None]
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.0.8
         """
-        return self.xa_elem.typeIdentifier()
+        types = [x.replace("'", "") for x in self.types]
+        types = str(types).replace("'", '"')
+        types_str = "of type " + types if self.types is not None else ""
 
-    @property
-    def version(self) -> "str":
-        """The version of the application bundle referenced by the alias (visible at the bottom of the "Get Info" window).
+        default_location_str = (
+            'default location "' + self.default_location + '"'
+            if self.default_location is not None
+            else ""
+        )
 
-        .. versionadded:: 0.1.0
+        script = AppleScript(
+            f"""
+        tell application "System Events"
+            choose file with prompt \"{self.prompt}\" {types_str}{default_location_str} invisibles {self.show_invisibles} multiple selections allowed {self.multiple_selections_allowed} showing package contents {self.show_package_contents}
+        end tell
         """
-        return self.xa_elem.version()
+        )
+        result = script.run()["event"]
 
-    def aliases(self, filter: Union[dict, None] = None) -> "XAAliasList":
-        """Returns a list of aliases, as PyXA objects, matching the given filter.
+        if result is not None:
+            if self.multiple_selections_allowed:
+                values = []
+                for x in range(1, result.numberOfItems() + 1):
+                    desc = result.descriptorAtIndex_(x)
+                    values.append(XAPath(desc.fileURLValue()))
+                return values
+            else:
+                return XAPath(result.fileURLValue())
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.aliases(), XAAliasList, filter)
 
-    def disk_items(self, filter: Union[dict, None] = None) -> "XADiskItemList":
-        """Returns a list of disk items, as PyXA objects, matching the given filter.
+class XAFolderPicker(XAObject):
+    """A folder selection window.
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.diskItems(), XADiskItemList, filter)
+    .. versionadded:: 0.0.8
+    """
 
-    def files(self, filter: Union[dict, None] = None) -> "XAFileList":
-        """Returns a list of files, as PyXA objects, matching the given filter.
+    def __init__(
+        self,
+        prompt: str = "Choose Folder",
+        default_location: Union[str, None] = None,
+        show_invisibles: bool = False,
+        multiple_selections_allowed: bool = False,
+        show_package_contents: bool = False,
+    ):
+        super().__init__()
+        self.prompt: str = prompt  #: The prompt to display in the dialog box
+        self.default_location: Union[
+            str, None
+        ] = default_location  #: The default folder location
+        self.show_invisibles: bool = (
+            show_invisibles  #: Whether invisible files and folders are shown
+        )
+        self.multiple_selections_allowed: bool = (
+            multiple_selections_allowed  #: Whether the user can select multiple folders
+        )
+        self.show_package_contents: bool = (
+            show_package_contents  #: Whether to show the contents of packages
+        )
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.files(), XAFileList, filter)
+    def display(self) -> Union[XAPath, None]:
+        """Displays the folder chooser, waits for the user to select a folder or cancel, then returns the selected folder URL or None if cancelled.
 
-    def file_packages(self, filter: Union[dict, None] = None) -> "XAFilePackageList":
-        """Returns a list of file packages, as PyXA objects, matching the given filter.
+        :return: The selected folder URL or None if no folder was selected
+        :rtype: Union[XAPath, None]
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.0.8
         """
-        return self._new_element(self.xa_elem.filePackages(), XAFilePackageList, filter)
 
-    def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
-        """Returns a list of folders, as PyXA objects, matching the given filter.
+        default_location_str = (
+            'default location "' + self.default_location + '"'
+            if self.default_location is not None
+            else ""
+        )
 
-        .. versionadded:: 0.1.0
+        script = AppleScript(
+            f"""
+        tell application "System Events"
+            choose folder with prompt \"{self.prompt}\" {default_location_str} invisibles {self.show_invisibles} multiple selections allowed {self.multiple_selections_allowed} showing package contents {self.show_package_contents}
+        end tell
         """
-        return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
-
+        )
+        result = script.run()["event"]
+        if result is not None:
+            if self.multiple_selections_allowed:
+                values = []
+                for x in range(1, result.numberOfItems() + 1):
+                    desc = result.descriptorAtIndex_(x)
+                    values.append(XAPath(desc.fileURLValue()))
+                return values
+            else:
+                return XAPath(result.fileURLValue())
 
-class XADiskList(XADiskItemList):
-    """A wrapper around lists of disks that employs fast enumeration techniques.
 
-    All properties of disks can be called as methods on the wrapped list, returning a list containing each disk's value for the property.
+class XAApplicationPicker(XAObject):
+    """An application selection window.
 
     .. versionadded:: 0.1.0
     """
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XADisk)
+    def __init__(
+        self,
+        title: Union[str, None] = None,
+        prompt: Union[str, None] = None,
+        multiple_selections_allowed: bool = False,
+    ):
+        super().__init__()
+        self.title: str = title  #: The dialog window title
+        self.prompt: str = prompt  #: The prompt to be displayed in the dialog box
+        self.multiple_selections_allowed: bool = multiple_selections_allowed  #: Whether to allow multiple items to be selected
 
-    def capacity(self) -> list["float"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("capacity") or [])
+    def display(self) -> str:
+        """Displays the application chooser, waits for the user to select an application or cancel, then returns the selected application's name or None if cancelled.
 
-    def ejectable(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ejectable") or [])
+        :return: The name of the selected application
+        :rtype: str
 
-    def format(self) -> list["XAEventsApplication.Format"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("format") or []
-        return [XAEventsApplication.Format(OSType(x.stringValue())) for x in ls]
+        .. versionadded:: 0.0.8
+        """
 
-    def free_space(self) -> list["float"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("freeSpace") or [])
+        script = AppleScript('tell application "System Events"')
+        dialog_str = "choose application "
+        if self.title is not None:
+            dialog_str += f'with title "{self.title}" '
+        if self.prompt is not None:
+            dialog_str += f'with prompt "{self.prompt}"'
+        dialog_str += f"multiple selections allowed {self.multiple_selections_allowed} "
+        script.add(dialog_str)
+        script.add("end tell")
 
-    def ignore_privileges(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ignorePrivileges") or [])
+        return script.run()["string"]
 
-    def local_volume(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("localVolume") or [])
 
-    def server(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("server") or [])
+class XAFileNameDialog(XAObject):
+    """A file name input window.
 
-    def startup(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("startup") or [])
+    .. versionadded:: 0.0.8
+    """
 
-    def zone(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zone") or [])
+    def __init__(
+        self,
+        prompt: str = "Specify file name and location",
+        default_name: str = "New File",
+        default_location: Union[str, None] = None,
+    ):
+        super().__init__()
+        self.prompt: str = prompt  #: The prompt to display in the dialog box
+        self.default_name: str = default_name  #: The default name for the new file
+        self.default_location: Union[
+            str, None
+        ] = default_location  #: The default file location
 
-    def by_capacity(self, capacity: float) -> Union["XADisk", None]:
-        return self.by_property("capacity", capacity)
+    def display(self) -> Union[XAPath, None]:
+        """Displays the file name input window, waits for the user to input a name and location or cancel, then returns the specified file URL or None if cancelled.
 
-    def by_ejectable(self, ejectable: bool) -> Union["XADisk", None]:
-        return self.by_property("ejectable", ejectable)
+        :return: The specified file URL or None if no file name was inputted
+        :rtype: Union[XAPath, None]
 
-    def by_format(self, format: "XAEventsApplication.Format") -> Union["XADisk", None]:
-        return self.by_property("format", format.value)
+        .. versionadded:: 0.0.8
+        """
 
-    def by_free_space(self, free_space: float) -> Union["XADisk", None]:
-        return self.by_property("freeSpace", free_space)
+        default_location_str = (
+            'default location "' + self.default_location + '"'
+            if self.default_location is not None
+            else ""
+        )
 
-    def by_ignore_privileges(self, ignore_privileges: bool) -> Union["XADisk", None]:
-        return self.by_property("ignorePrivileges", ignore_privileges)
+        script = AppleScript(
+            f"""
+        tell application "System Events"
+            choose file name with prompt \"{self.prompt}\" default name \"{self.default_name}\" {default_location_str}
+        end tell
+        """
+        )
+        result = script.run()["event"]
+        if result is not None:
+            return XAPath(result.fileURLValue())
 
-    def by_local_volume(self, local_volume: bool) -> Union["XADisk", None]:
-        return self.by_property("localVolume", local_volume)
 
-    def by_server(self, server: str) -> Union["XADisk", None]:
-        return self.by_property("server", server)
+#############################
+### System / Image Events ###
+#############################
+# ? Move into separate XAFileSystemBase.py file?
+class XAEventsApplication(XACanOpenPath):
+    """A base class for the System and Image events applications.
 
-    def by_startup(self, startup: bool) -> Union["XADisk", None]:
-        return self.by_property("startup", startup)
+    .. versionadded:: 0.1.0
+    """
 
-    def by_zone(self, zone: str) -> Union["XADisk", None]:
-        return self.by_property("zone", zone)
+    class Format(Enum):
+        """Disk format options."""
+
+        APPLE_PHOTO = OSType("dfph")
+        APPLESHARE = OSType("dfas")
+        AUDIO = OSType("dfau")
+        HIGH_SIERRA = OSType("dfhs")
+        ISO_9660 = OSType("fd96")
+        MACOS_EXTENDED = OSType("dfh+")
+        MACOS = OSType("dfhf")
+        MSDOS = OSType("dfms")
+        NFS = OSType("dfnf")
+        PRODOS = OSType("dfpr")
+        QUICKTAKE = OSType("dfqt")
+        UDF = OSType("dfud")
+        UFS = OSType("dfuf")
+        UNKNOWN = OSType("df$$")
+        WEBDAV = OSType("dfwd")
 
 
-class XADisk(XADiskItem):
-    """A disk in the file system.
+class XADiskItemList(XAList):
+    """A wrapper around lists of disk items that employs fast enumeration techniques.
+
+    All properties of disk items can be called as methods on the wrapped list, returning a list containing each item's value for the property.
 
     .. versionadded:: 0.1.0
     """
 
-    def __init__(self, properties):
-        super().__init__(properties)
-
-    @property
-    def capacity(self) -> "float":
-        """The total number of bytes (free or used) on the disk.
+    def __init__(
+        self, properties: dict, filter: Union[dict, None] = None, object_class=None
+    ):
+        if object_class is None:
+            object_class = XADiskItem
+        super().__init__(properties, object_class, filter)
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.capacity()
+    def busy_status(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "busyStatus") or [])
 
-    @property
-    def ejectable(self) -> "bool":
-        """Whether the media can be ejected (floppies, CD's, and so on).
+    def container(self) -> "XADiskItemList":
+        ls = XABackends.element_values(self.xa_elem, "container") or []
+        return self._new_element(ls, XADiskItemList)
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.ejectable()
+    def creation_date(self) -> list["datetime"]:
+        return list(XABackends.element_values(self.xa_elem, "creationDate") or [])
 
-    @property
-    def format(self) -> "XAEventsApplication.Format":
-        """The file system format of the disk.
+    def displayed_name(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "displayedName") or [])
 
-        .. versionadded:: 0.1.0
-        """
-        return XAEventsApplication.Format(self.xa_elem.format())
+    def id(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
-    @property
-    def free_space(self) -> "float":
-        """The number of free bytes left on the disk.
+    def modification_date(self) -> list["datetime"]:
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.freeSpace()
+    def name(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
-    @property
-    def ignore_privileges(self) -> "bool":
-        """Whether to ignore permissions on this disk.
+    def name_extension(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "nameExtension") or [])
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.ignorePrivileges()
+    def package_folder(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "packageFolder") or [])
 
-    @property
-    def local_volume(self) -> "bool":
-        """Whether the media is a local volume (as opposed to a file server).
+    def path(self) -> list["XAPath"]:
+        ls = XABackends.element_values(self.xa_elem, "path") or []
+        return [XAPath(x) for x in ls]
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.localVolume()
+    def physical_size(self) -> list["int"]:
+        return list(XABackends.element_values(self.xa_elem, "physicalSize") or [])
 
-    @property
-    def server(self) -> "str":
-        """The server on which the disk resides, AFP volumes only.
+    def posix_path(self) -> list[XAPath]:
+        ls = XABackends.element_values(self.xa_elem, "POSIXPath") or []
+        return [XAPath(x) for x in ls]
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.server()
+    def size(self) -> list["int"]:
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
-    @property
-    def startup(self) -> "bool":
-        """Whether this disk is the boot disk.
+    def url(self) -> list["XAURL"]:
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
+        return [XAURL(x) for x in ls]
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.startup()
+    def visible(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
-    @property
-    def zone(self) -> "str":
-        """The zone in which the disk's server resides, AFP volumes only.
+    def volume(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "volume") or [])
 
-        .. versionadded:: 0.1.0
-        """
-        return self.xa_elem.zone()
+    def by_busy_status(self, busy_status: bool) -> Union["XADiskItem", None]:
+        return self.by_property("busyStatus", busy_status)
 
-    def aliases(self, filter: Union[dict, None] = None) -> "XAAliasList":
-        """Returns a list of aliases, as PyXA objects, matching the given filter.
+    def by_container(self, container: "XADiskItem") -> Union["XADiskItem", None]:
+        return self.by_property("container", container.xa_elem)
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.aliases(), XAAliasList, filter)
+    def by_creation_date(self, creation_date: datetime) -> Union["XADiskItem", None]:
+        return self.by_property("creationDate", creation_date)
 
-    def disk_items(self, filter: Union[dict, None] = None) -> "XADiskItemList":
-        """Returns a list of disk items, as PyXA objects, matching the given filter.
+    def by_displayed_name(self, displayed_name: str) -> Union["XADiskItem", None]:
+        return self.by_property("displayedName", displayed_name)
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.diskItems(), XADiskItemList, filter)
+    def by_id(self, id: str) -> Union["XADiskItem", None]:
+        return self.by_property("id", id)
 
-    def files(self, filter: Union[dict, None] = None) -> "XAFileList":
-        """Returns a list of files, as PyXA objects, matching the given filter.
+    def by_modification_date(
+        self, modification_date: datetime
+    ) -> Union["XADiskItem", None]:
+        return self.by_property("modificationDate", modification_date)
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.files(), XAFileList, filter)
+    def by_name(self, name: str) -> Union["XADiskItem", None]:
+        return self.by_property("name", name)
 
-    def file_packages(self, filter: Union[dict, None] = None) -> "XAFilePackageList":
-        """Returns a list of file packages, as PyXA objects, matching the given filter.
+    def by_name_extension(self, name_extension: str) -> Union["XADiskItem", None]:
+        return self.by_property("nameExtension", name_extension)
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.fileOackages(), XAFilePackageList, filter)
+    def by_package_folder(self, package_folder: bool) -> Union["XADiskItem", None]:
+        return self.by_property("packageFolder", package_folder)
 
-    def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
-        """Returns a list of folders, as PyXA objects, matching the given filter.
+    def by_path(self, path: Union[XAPath, str]) -> Union["XADiskItem", None]:
+        if isinstance(path, XAPath):
+            path = path.path
+        return self.by_property("path", path)
 
-        .. versionadded:: 0.1.0
-        """
-        return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
+    def by_physical_size(self, physical_size: int) -> Union["XADiskItem", None]:
+        return self.by_property("physicalSize", physical_size)
 
+    def by_posix_path(
+        self, posix_path: Union[XAPath, str]
+    ) -> Union["XADiskItem", None]:
+        if isinstance(posix_path, XAPath):
+            posix_path = posix_path.path
+        return self.by_property("POSIXPath", posix_path)
 
-class XADomainList(XAList):
-    """A wrapper around lists of domains that employs fast enumeration techniques.
+    def by_size(self, size: int) -> Union["XADiskItem", None]:
+        return self.by_property("size", size)
 
-    All properties of domains can be called as methods on the wrapped list, returning a list containing each domain's value for the property.
+    def by_url(self, url: XAURL) -> Union["XADiskItem", None]:
+        return self.by_property("URL", url.xa_elem)
 
-    .. versionadded:: 0.1.0
-    """
+    def by_visible(self, visible: bool) -> Union["XADiskItem", None]:
+        return self.by_property("visible", visible)
 
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, XADomain, filter)
+    def by_volume(self, volume: str) -> Union["XADiskItem", None]:
+        return self.by_property("volume", volume)
 
-    def id(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+    @_xa_batched("move")
+    def move_to(self, folder: Union[str, XAPath, "XAFolder"]) -> "XADiskItem":
+        """Moves all disk items in the list to the specified location.
 
-    def name(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        :param folder: The folder location to move the items to
+        :type folder: Union[str, XAPath, XAFolder]
+        :return: The list of disk items
+        :rtype: XADiskItem
 
-    def by_id(self, id: str) -> Union["XADomain", None]:
-        return self.by_property("id", id)
+        .. versionadded:: 0.2.1
+        """
+        if isinstance(folder, XAFolder):
+            folder = folder.posix_path
+        elif isinstance(folder, str):
+            folder = XAPath(folder)
 
-    def by_name(self, name: str) -> Union["XADomain", None]:
-        return self.by_property("name", name)
+        for item in self.xa_elem.get():
+            item.moveTo_(folder.xa_elem)
+        return self
 
     def __repr__(self):
         return "<" + str(type(self)) + str(self.name()) + ">"
 
 
-class XADomain(XAObject):
-    """A domain in the file system.
+class XADiskItem(XAObject, XAPathLike):
+    """An item stored in the file system.
 
     .. versionadded:: 0.1.0
     """
@@ -5700,138 +7873,241 @@ class XADomain(XAObject):
         super().__init__(properties)
 
     @property
-    def application_support_folder(self) -> "XAFolder":
-        """The Application Support folder.
+    def busy_status(self) -> "bool":
+        """Whether the disk item is busy.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.applicationSupportFolder(), XAFolder)
+        return self.xa_elem.busyStatus()
 
     @property
-    def applications_folder(self) -> "XAFolder":
-        """The Applications folder.
+    def container(self) -> "XADiskItem":
+        """The folder or disk which has this disk item as an element.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.applicationsFolder(), XAFolder)
+        return self._new_element(self.xa_elem.container(), XADiskItem)
 
     @property
-    def desktop_pictures_folder(self) -> "XAFolder":
-        """The Desktop Pictures folder.
+    def creation_date(self) -> "datetime":
+        """The date on which the disk item was created.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.desktopPicturesFolder(), XAFolder)
+        return self.xa_elem.creationDate()
 
     @property
-    def folder_action_scripts_folder(self) -> "XAFolder":
-        """The Folder Action Scripts folder.
+    def displayed_name(self) -> "str":
+        """The name of the disk item as displayed in the User Interface.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.folderActionScriptsFolder(), XAFolder)
+        return self.xa_elem.displayedName()
 
     @property
-    def fonts_folder(self) -> "XAFolder":
-        """The Fonts folder.
+    def id(self) -> "str":
+        """The unique ID of the disk item.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.fontsFolder(), XAFolder)
+        return self.xa_elem.id()
 
     @property
-    def id(self) -> "str":
-        """The unique identifier of the domain.
+    def modification_date(self) -> "datetime":
+        """The date on which the disk item was last modified.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.id()
+        return self.xa_elem.modificationDate()
 
     @property
-    def library_folder(self) -> "XAFolder":
-        """The Library folder.
+    def name(self) -> "str":
+        """The name of the disk item.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.libraryFolder(), XAFolder)
+        return self.xa_elem.name()
 
     @property
-    def name(self) -> "str":
-        """The name of the domain.
+    def name_extension(self) -> "str":
+        """The extension portion of the name.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.name()
+        return self.xa_elem.nameExtension()
 
     @property
-    def preferences_folder(self) -> "XAFolder":
-        """The Preferences folder.
+    def package_folder(self) -> "bool":
+        """Whether the disk item is a package.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.preferencesFolder(), XAFolder)
+        return self.xa_elem.packageFolder()
 
     @property
-    def scripting_additions_folder(self) -> "XAFolder":
-        """The Scripting Additions folder.
+    def path(self) -> "XAPath":
+        """The file system path of the disk item.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.scriptingAdditionsFolder(), XAFolder)
+        return XAPath(self.xa_elem.path())
 
     @property
-    def scripts_folder(self) -> "XAFolder":
-        """The Scripts folder.
+    def physical_size(self) -> "int":
+        """The actual space used by the disk item on disk.
+
+        .. versionadded:: 0.1.0
+        """
+        return self.xa_elem.physicalSize()
+
+    @property
+    def posix_path(self) -> XAPath:
+        """The POSIX file system path of the disk item.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.scriptsFolder(), XAFolder)
+        return XAPath(self.xa_elem.POSIXPath())
 
     @property
-    def shared_documents_folder(self) -> "XAFolder":
-        """The Shared Documents folder.
+    def size(self) -> "int":
+        """The logical size of the disk item.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.sharedDocumentsFolder(), XAFolder)
+        return self.xa_elem.size()
 
     @property
-    def speakable_items_folder(self) -> "XAFolder":
-        """The Speakable Items folder.
+    def url(self) -> "XAURL":
+        """The URL of the disk item.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.speakableItemsFolder(), XAFolder)
+        return XAURL(self.xa_elem.URL())
 
     @property
-    def utilities_folder(self) -> "XAFolder":
-        """The Utilities folder.
+    def visible(self) -> "bool":
+        """Whether the disk item is visible.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.utilitiesFolder(), XAFolder)
+        return self.xa_elem.visible()
 
     @property
-    def workflows_folder(self) -> "XAFolder":
-        """The Automator Workflows folder.
+    def volume(self) -> "str":
+        """The volume on which the disk item resides.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.workflowsFolder(), XAFolder)
+        return self.xa_elem.volume()
 
-    def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
-        """Returns a list of folders, as PyXA objects, matching the given filter.
+    def open(self) -> "XADiskItem":
+        """Opens the item in its default application.
 
-        .. versionadded:: 0.1.0
+        :return: The item object
+        :rtype: XADiskItem
+
+        .. versionadded:: 0.1.1
         """
-        return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
+        self.xa_elem.open()
+        return self
+
+    @_xa_batched("move")
+    def move_to(self, folder: Union[str, XAPath, "XAFolder"]) -> "XADiskItem":
+        """Moves the disk item to the specified location.
+
+        :param folder: The folder location to move the item to
+        :type folder: Union[str, XAPath, XAFolder]
+        :return: The disk item object
+        :rtype: XADiskItem
+
+        .. versionadded:: 0.2.1
+        """
+        if isinstance(folder, XAFolder):
+            folder = folder.posix_path
+        elif isinstance(folder, str):
+            folder = XAPath(folder)
+
+        self.xa_elem.moveTo_(folder.xa_elem)
+        return self
+
+    def get_path_representation(self) -> XAPath:
+        return self.posix_path
 
     def __repr__(self):
         return "<" + str(type(self)) + str(self.name) + ">"
 
 
-class XAClassicDomainObject(XADomain):
-    """The Classic domain in the file system.
+class XAAliasList(XADiskItemList):
+    """A wrapper around lists of aliases that employs fast enumeration techniques.
+
+    All properties of aliases can be called as methods on the wrapped list, returning a list containing each alias' value for the property.
+
+    .. versionadded:: 0.1.0
+    """
+
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XAAlias)
+
+    def creator_type(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "creatorType") or [])
+
+    def default_application(self) -> "XADiskItemList":
+        ls = XABackends.element_values(self.xa_elem, "defaultApplication") or []
+        return self._new_element(ls, XADiskItemList)
+
+    def file_type(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "fileType") or [])
+
+    def kind(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
+
+    def product_version(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "productVersion") or [])
+
+    def short_version(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "shortVersion") or [])
+
+    def stationery(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "stationery") or [])
+
+    def type_identifier(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "typeIdentifier") or [])
+
+    def version(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "version") or [])
+
+    def by_creator_type(self, creator_type: str) -> Union["XAAlias", None]:
+        return self.by_property("creatorType", creator_type)
+
+    def by_default_application(
+        self, default_application: "XADiskItem"
+    ) -> Union["XAAlias", None]:
+        return self.by_property("defaultApplication", default_application.xa_elem)
+
+    def by_file_type(self, file_type: str) -> Union["XAAlias", None]:
+        return self.by_property("fileType", file_type)
+
+    def by_kind(self, kind: str) -> Union["XAAlias", None]:
+        return self.by_property("kind", kind)
+
+    def by_product_version(self, product_version: str) -> Union["XAAlias", None]:
+        return self.by_property("productVersion", product_version)
+
+    def by_short_version(self, short_version: str) -> Union["XAAlias", None]:
+        return self.by_property("shortVersion", short_version)
+
+    def by_stationery(self, stationery: bool) -> Union["XAAlias", None]:
+        return self.by_property("stationery", stationery)
+
+    def by_type_identifier(self, type_identifier: str) -> Union["XAAlias", None]:
+        return self.by_property("typeIdentifier", type_identifier)
+
+    def by_version(self, version: str) -> Union["XAAlias", None]:
+        return self.by_property("version", version)
+
+
+class XAAlias(XADiskItem):
+    """An alias in the file system.
 
     .. versionadded:: 0.1.0
     """
@@ -5840,92 +8116,104 @@ class XAClassicDomainObject(XADomain):
         super().__init__(properties)
 
     @property
-    def apple_menu_folder(self) -> "XAFolder":
-        """The Apple Menu Items folder.
+    def creator_type(self) -> "str":
+        """The OSType identifying the application that created the alias.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.appleMenuFolder(), XAFolder)
+        return self.xa_elem.creatorType()
 
     @property
-    def control_panels_folder(self) -> "XAFolder":
-        """The Control Panels folder.
+    def default_application(self) -> "XADiskItem":
+        """The application that will launch if the alias is opened.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.controlPanelsFolder(), XAFolder)
+        return self._new_element(self.xa_elem.defaultApplication(), XADiskItem)
 
     @property
-    def control_strip_modules_folder(self) -> "XAFolder":
-        """The Control Strip Modules folder.
+    def file_type(self) -> "str":
+        """The OSType identifying the type of data contained in the alias.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.controlStripModulesFolder(), XAFolder)
+        return self.xa_elem.fileType()
 
     @property
-    def desktop_folder(self) -> "XAFolder":
-        """The Classic Desktop folder.
+    def kind(self) -> "str":
+        """The kind of alias, as shown in Finder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.desktopFolder(), XAFolder)
+        return self.xa_elem.kind()
 
     @property
-    def extensions_folder(self) -> "XAFolder":
-        """The Extensions folder.
+    def product_version(self) -> "str":
+        """The version of the product (visible at the top of the "Get Info" window).
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.extensionsFolder(), XAFolder)
+        return self.xa_elem.productVersion()
 
     @property
-    def fonts_folder(self) -> "XAFolder":
-        """The Fonts folder.
+    def short_version(self) -> "str":
+        """The short version of the application bundle referenced by the alias.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.fontsFolder(), XAFolder)
+        return self.xa_elem.shortVersion()
 
     @property
-    def launcher_items_folder(self) -> "XAFolder":
-        """The Launcher Items folder.
+    def stationery(self) -> "bool":
+        """Whether the alias is a stationery pad.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.launcherItemsFolder(), XAFolder)
+        return self.xa_elem.stationery()
 
     @property
-    def preferences_folder(self) -> "XAFolder":
-        """The Classic Preferences folder.
+    def type_identifier(self) -> "str":
+        """The type identifier of the alias.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.preferencesFolder(), XAFolder)
+        return self.xa_elem.typeIdentifier()
 
     @property
-    def shutdown_folder(self) -> "XAFolder":
-        """The Shutdown Items folder.
+    def version(self) -> "str":
+        """The version of the application bundle referenced by the alias (visible at the bottom of the "Get Info" window).
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.shutdownFolder(), XAFolder)
+        return self.xa_elem.version()
 
-    @property
-    def startup_items_folder(self) -> "XAFolder":
-        """The StartupItems folder.
+    def aliases(self, filter: Union[dict, None] = None) -> "XAAliasList":
+        """Returns a list of aliases, as PyXA objects, matching the given filter.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.startupItemsFolder(), XAFolder)
+        return self._new_element(self.xa_elem.aliases(), XAAliasList, filter)
 
-    @property
-    def system_folder(self) -> "XAFolder":
-        """The System folder.
+    def disk_items(self, filter: Union[dict, None] = None) -> "XADiskItemList":
+        """Returns a list of disk items, as PyXA objects, matching the given filter.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.systemFolder(), XAFolder)
+        return self._new_element(self.xa_elem.diskItems(), XADiskItemList, filter)
+
+    def files(self, filter: Union[dict, None] = None) -> "XAFileList":
+        """Returns a list of files, as PyXA objects, matching the given filter.
+
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.files(), XAFileList, filter)
+
+    def file_packages(self, filter: Union[dict, None] = None) -> "XAFilePackageList":
+        """Returns a list of file packages, as PyXA objects, matching the given filter.
+
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.filePackages(), XAFilePackageList, filter)
 
     def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
         """Returns a list of folders, as PyXA objects, matching the given filter.
@@ -5935,81 +8223,75 @@ class XAClassicDomainObject(XADomain):
         return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
 
 
-class XAFileList(XADiskItemList):
-    """A wrapper around lists of files that employs fast enumeration techniques.
+class XADiskList(XADiskItemList):
+    """A wrapper around lists of disks that employs fast enumeration techniques.
 
-    All properties of files can be called as methods on the wrapped list, returning a list containing each file's value for the property.
+    All properties of disks can be called as methods on the wrapped list, returning a list containing each disk's value for the property.
 
     .. versionadded:: 0.1.0
     """
 
-    def __init__(
-        self, properties: dict, filter: Union[dict, None] = None, object_class=None
-    ):
-        if object_class is None:
-            object_class = XAFile
-        super().__init__(properties, filter, object_class)
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XADisk)
 
-    def creator_type(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creatorType") or [])
+    def capacity(self) -> list["float"]:
+        return list(XABackends.element_values(self.xa_elem, "capacity") or [])
 
-    def default_application(self) -> "XADiskItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("defaultApplication") or []
-        return self._new_element(ls, XADiskItemList)
+    def ejectable(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "ejectable") or [])
 
-    def file_type(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileType") or [])
+    def format(self) -> list["XAEventsApplication.Format"]:
+        ls = XABackends.element_values(self.xa_elem, "format") or []
+        return [XAEventsApplication.Format(OSType(x.stringValue())) for x in ls]
 
-    def kind(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+    def free_space(self) -> list["float"]:
+        return list(XABackends.element_values(self.xa_elem, "freeSpace") or [])
 
-    def product_version(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("productVersion") or [])
+    def ignore_privileges(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "ignorePrivileges") or [])
 
-    def short_version(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shortVersion") or [])
+    def local_volume(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "localVolume") or [])
 
-    def stationery(self) -> list["bool"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("stationery") or [])
+    def server(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "server") or [])
 
-    def type_identifier(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("typeIdentifier") or [])
+    def startup(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "startup") or [])
 
-    def version(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("version") or [])
+    def zone(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "zone") or [])
 
-    def by_creator_type(self, creator_type: str) -> Union["XAFile", None]:
-        return self.by_property("creatorType", creator_type)
+    def by_capacity(self, capacity: float) -> Union["XADisk", None]:
+        return self.by_property("capacity", capacity)
 
-    def by_default_application(
-        self, default_application: "XADiskItem"
-    ) -> Union["XAFile", None]:
-        return self.by_property("defaultApplication", default_application.xa_elem)
+    def by_ejectable(self, ejectable: bool) -> Union["XADisk", None]:
+        return self.by_property("ejectable", ejectable)
 
-    def by_file_type(self, file_type: str) -> Union["XAFile", None]:
-        return self.by_property("fileType", file_type)
+    def by_format(self, format: "XAEventsApplication.Format") -> Union["XADisk", None]:
+        return self.by_property("format", format.value)
 
-    def by_kind(self, kind: str) -> Union["XAFile", None]:
-        return self.by_property("kind", kind)
+    def by_free_space(self, free_space: float) -> Union["XADisk", None]:
+        return self.by_property("freeSpace", free_space)
 
-    def by_product_version(self, product_version: str) -> Union["XAFile", None]:
-        return self.by_property("productVersion", product_version)
+    def by_ignore_privileges(self, ignore_privileges: bool) -> Union["XADisk", None]:
+        return self.by_property("ignorePrivileges", ignore_privileges)
 
-    def by_short_version(self, short_version: str) -> Union["XAFile", None]:
-        return self.by_property("shortVersion", short_version)
+    def by_local_volume(self, local_volume: bool) -> Union["XADisk", None]:
+        return self.by_property("localVolume", local_volume)
 
-    def by_stationery(self, stationery: bool) -> Union["XAFile", None]:
-        return self.by_property("stationery", stationery)
+    def by_server(self, server: str) -> Union["XADisk", None]:
+        return self.by_property("server", server)
 
-    def by_type_identifier(self, type_identifier: str) -> Union["XAFile", None]:
-        return self.by_property("typeIdentifier", type_identifier)
+    def by_startup(self, startup: bool) -> Union["XADisk", None]:
+        return self.by_property("startup", startup)
 
-    def by_version(self, version: str) -> Union["XAFile", None]:
-        return self.by_property("version", version)
+    def by_zone(self, zone: str) -> Union["XADisk", None]:
+        return self.by_property("zone", zone)
 
 
-class XAFile(XADiskItem):
-    """A file in the file system.
+class XADisk(XADiskItem):
+    """A disk in the file system.
 
     .. versionadded:: 0.1.0
     """
@@ -6018,102 +8300,76 @@ class XAFile(XADiskItem):
         super().__init__(properties)
 
     @property
-    def creator_type(self) -> "str":
-        """The OSType identifying the application that created the file.
+    def capacity(self) -> "float":
+        """The total number of bytes (free or used) on the disk.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.creatorType()
+        return self.xa_elem.capacity()
 
     @property
-    def default_application(self) -> "XADiskItem":
-        """The application that will launch if the file is opened.
+    def ejectable(self) -> "bool":
+        """Whether the media can be ejected (floppies, CD's, and so on).
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.defaultApplication(), XADiskItem)
-
-    @default_application.setter
-    def default_application(self, default_application: XADiskItem):
-        self.set_property("defaultApplication", default_application.xa_elem)
+        return self.xa_elem.ejectable()
 
     @property
-    def file_type(self) -> "str":
-        """The OSType identifying the type of data contained in the file.
+    def format(self) -> "XAEventsApplication.Format":
+        """The file system format of the disk.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.fileType()
+        return XAEventsApplication.Format(self.xa_elem.format())
 
     @property
-    def kind(self) -> "str":
-        """The kind of file, as shown in Finder.
+    def free_space(self) -> "float":
+        """The number of free bytes left on the disk.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.kind()
+        return self.xa_elem.freeSpace()
 
     @property
-    def product_version(self) -> "str":
-        """The version of the product (visible at the top of the "Get Info" window).
+    def ignore_privileges(self) -> "bool":
+        """Whether to ignore permissions on this disk.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.productVersion()
+        return self.xa_elem.ignorePrivileges()
 
     @property
-    def short_version(self) -> "str":
-        """The short version of the file.
+    def local_volume(self) -> "bool":
+        """Whether the media is a local volume (as opposed to a file server).
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.shortVersion()
+        return self.xa_elem.localVolume()
 
     @property
-    def stationery(self) -> "bool":
-        """Whether the file is a stationery pad.
+    def server(self) -> "str":
+        """The server on which the disk resides, AFP volumes only.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.stationery()
+        return self.xa_elem.server()
 
     @property
-    def type_identifier(self) -> "str":
-        """The type identifier of the file.
+    def startup(self) -> "bool":
+        """Whether this disk is the boot disk.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.typeIdentifier()
+        return self.xa_elem.startup()
 
     @property
-    def version(self) -> "str":
-        """The version of the file (visible at the bottom of the "Get Info" window).
+    def zone(self) -> "str":
+        """The zone in which the disk's server resides, AFP volumes only.
 
         .. versionadded:: 0.1.0
         """
-        return self.xa_elem.version()
-
-
-class XAFilePackageList(XAFileList):
-    """A wrapper around lists of file packages that employs fast enumeration techniques.
-
-    All properties of file packages can be called as methods on the wrapped list, returning a list containing each package's value for the property.
-
-    .. versionadded:: 0.1.0
-    """
-
-    def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XAFilePackage)
-
-
-class XAFilePackage(XAFile):
-    """A file package in the file system.
-
-    .. versionadded:: 0.1.0
-    """
-
-    def __init__(self, properties):
-        super().__init__(properties)
+        return self.xa_elem.zone()
 
     def aliases(self, filter: Union[dict, None] = None) -> "XAAliasList":
         """Returns a list of aliases, as PyXA objects, matching the given filter.
@@ -6141,7 +8397,7 @@ class XAFilePackage(XAFile):
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.filePackages(), XAFilePackageList, filter)
+        return self._new_element(self.xa_elem.fileOackages(), XAFilePackageList, filter)
 
     def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
         """Returns a list of folders, as PyXA objects, matching the given filter.
@@ -6151,20 +8407,35 @@ class XAFilePackage(XAFile):
         return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
 
 
-class XAFolderList(XADiskItemList):
-    """A wrapper around lists of folders that employs fast enumeration techniques.
+class XADomainList(XAList):
+    """A wrapper around lists of domains that employs fast enumeration techniques.
 
-    All properties of folders can be called as methods on the wrapped list, returning a list containing each folder's value for the property.
+    All properties of domains can be called as methods on the wrapped list, returning a list containing each domain's value for the property.
 
     .. versionadded:: 0.1.0
     """
 
     def __init__(self, properties: dict, filter: Union[dict, None] = None):
-        super().__init__(properties, filter, XAFolder)
+        super().__init__(properties, XADomain, filter)
+
+    def id(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
+    def name(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
-class XAFolder(XADiskItem):
-    """A folder in the file system.
+    def by_id(self, id: str) -> Union["XADomain", None]:
+        return self.by_property("id", id)
+
+    def by_name(self, name: str) -> Union["XADomain", None]:
+        return self.by_property("name", name)
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.name()) + ">"
+
+
+class XADomain(XAObject):
+    """A domain in the file system.
 
     .. versionadded:: 0.1.0
     """
@@ -6172,79 +8443,139 @@ class XAFolder(XADiskItem):
     def __init__(self, properties):
         super().__init__(properties)
 
-    def aliases(self, filter: Union[dict, None] = None) -> "XAAliasList":
-        """Returns a list of aliases, as PyXA objects, matching the given filter.
+    @property
+    def application_support_folder(self) -> "XAFolder":
+        """The Application Support folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.aliases(), XAAliasList, filter)
+        return self._new_element(self.xa_elem.applicationSupportFolder(), XAFolder)
 
-    def disk_items(self, filter: Union[dict, None] = None) -> "XADiskItemList":
-        """Returns a list of disk items, as PyXA objects, matching the given filter.
+    @property
+    def applications_folder(self) -> "XAFolder":
+        """The Applications folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.diskItems(), XADiskItemList, filter)
+        return self._new_element(self.xa_elem.applicationsFolder(), XAFolder)
 
-    def files(self, filter: Union[dict, None] = None) -> "XAFileList":
-        """Returns a list of files, as PyXA objects, matching the given filter.
+    @property
+    def desktop_pictures_folder(self) -> "XAFolder":
+        """The Desktop Pictures folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.files(), XAFileList, filter)
+        return self._new_element(self.xa_elem.desktopPicturesFolder(), XAFolder)
 
-    def file_packages(self, filter: Union[dict, None] = None) -> "XAFilePackageList":
-        """Returns a list of file packages, as PyXA objects, matching the given filter.
+    @property
+    def folder_action_scripts_folder(self) -> "XAFolder":
+        """The Folder Action Scripts folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.filePackages(), XAFilePackageList, filter)
+        return self._new_element(self.xa_elem.folderActionScriptsFolder(), XAFolder)
 
-    def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
-        """Returns a list of folders, as PyXA objects, matching the given filter.
+    @property
+    def fonts_folder(self) -> "XAFolder":
+        """The Fonts folder.
 
-        :param filter: A dictionary specifying property-value pairs that all returned folders will have, or None
-        :type filter: Union[dict, None]
-        :return: The list of folders
-        :rtype: XAFolderList
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.fontsFolder(), XAFolder)
+
+    @property
+    def id(self) -> "str":
+        """The unique identifier of the domain.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
+        return self.xa_elem.id()
 
+    @property
+    def library_folder(self) -> "XAFolder":
+        """The Library folder.
 
-class XALocalDomainObject(XADomain):
-    """The local domain in the file system.
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.libraryFolder(), XAFolder)
 
-    .. versionadded:: 0.1.0
-    """
+    @property
+    def name(self) -> "str":
+        """The name of the domain.
 
-    def __init__(self, properties):
-        super().__init__(properties)
+        .. versionadded:: 0.1.0
+        """
+        return self.xa_elem.name()
 
+    @property
+    def preferences_folder(self) -> "XAFolder":
+        """The Preferences folder.
 
-class XANetworkDomainObject(XADomain):
-    """The network domain in the file system.
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.preferencesFolder(), XAFolder)
 
-    .. versionadded:: 0.1.0
-    """
+    @property
+    def scripting_additions_folder(self) -> "XAFolder":
+        """The Scripting Additions folder.
 
-    def __init__(self, properties):
-        super().__init__(properties)
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.scriptingAdditionsFolder(), XAFolder)
+
+    @property
+    def scripts_folder(self) -> "XAFolder":
+        """The Scripts folder.
 
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.scriptsFolder(), XAFolder)
 
-class XASystemDomainObject(XADomain):
-    """The system domain in the file system.
+    @property
+    def shared_documents_folder(self) -> "XAFolder":
+        """The Shared Documents folder.
+
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.sharedDocumentsFolder(), XAFolder)
+
+    @property
+    def speakable_items_folder(self) -> "XAFolder":
+        """The Speakable Items folder.
+
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.speakableItemsFolder(), XAFolder)
+
+    @property
+    def utilities_folder(self) -> "XAFolder":
+        """The Utilities folder.
+
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.utilitiesFolder(), XAFolder)
+
+    @property
+    def workflows_folder(self) -> "XAFolder":
+        """The Automator Workflows folder.
+
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.workflowsFolder(), XAFolder)
+
+    def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
+        """Returns a list of folders, as PyXA objects, matching the given filter.
 
-    .. versionadded:: 0.1.0
-    """
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
 
-    def __init__(self, properties):
-        super().__init__(properties)
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.name) + ">"
 
 
-class XAUserDomainObject(XADomain):
-    """The user domain in the file system.
+class XAClassicDomainObject(XADomain):
+    """The Classic domain in the file system.
 
     .. versionadded:: 0.1.0
     """
@@ -6253,661 +8584,557 @@ class XAUserDomainObject(XADomain):
         super().__init__(properties)
 
     @property
-    def desktop_folder(self) -> "XAFolder":
-        """The user's Desktop folder
+    def apple_menu_folder(self) -> "XAFolder":
+        """The Apple Menu Items folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.desktopFolder(), XAFolder)
+        return self._new_element(self.xa_elem.appleMenuFolder(), XAFolder)
 
     @property
-    def documents_folder(self) -> "XAFolder":
-        """The user's Documents folder
+    def control_panels_folder(self) -> "XAFolder":
+        """The Control Panels folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.documentsFolder(), XAFolder)
+        return self._new_element(self.xa_elem.controlPanelsFolder(), XAFolder)
 
     @property
-    def downloads_folder(self) -> "XAFolder":
-        """The user's Downloads folder
+    def control_strip_modules_folder(self) -> "XAFolder":
+        """The Control Strip Modules folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.downloadsFolder(), XAFolder)
+        return self._new_element(self.xa_elem.controlStripModulesFolder(), XAFolder)
 
     @property
-    def favorites_folder(self) -> "XAFolder":
-        """The user's Favorites folder
+    def desktop_folder(self) -> "XAFolder":
+        """The Classic Desktop folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.favoritesFolder(), XAFolder)
+        return self._new_element(self.xa_elem.desktopFolder(), XAFolder)
 
     @property
-    def home_folder(self) -> "XAFolder":
-        """The user's Home folder
+    def extensions_folder(self) -> "XAFolder":
+        """The Extensions folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.homeFolder(), XAFolder)
+        return self._new_element(self.xa_elem.extensionsFolder(), XAFolder)
 
     @property
-    def movies_folder(self) -> "XAFolder":
-        """The user's Movies folder
+    def fonts_folder(self) -> "XAFolder":
+        """The Fonts folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.moviesFolder(), XAFolder)
+        return self._new_element(self.xa_elem.fontsFolder(), XAFolder)
 
     @property
-    def music_folder(self) -> "XAFolder":
-        """The user's Music folder
+    def launcher_items_folder(self) -> "XAFolder":
+        """The Launcher Items folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.musicFolder(), XAFolder)
+        return self._new_element(self.xa_elem.launcherItemsFolder(), XAFolder)
 
     @property
-    def pictures_folder(self) -> "XAFolder":
-        """The user's Pictures folder
+    def preferences_folder(self) -> "XAFolder":
+        """The Classic Preferences folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.picturesFolder(), XAFolder)
+        return self._new_element(self.xa_elem.preferencesFolder(), XAFolder)
 
     @property
-    def public_folder(self) -> "XAFolder":
-        """The user's Public folder
+    def shutdown_folder(self) -> "XAFolder":
+        """The Shutdown Items folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.publicFolder(), XAFolder)
+        return self._new_element(self.xa_elem.shutdownFolder(), XAFolder)
 
     @property
-    def sites_folder(self) -> "XAFolder":
-        """The user's Sites folder
+    def startup_items_folder(self) -> "XAFolder":
+        """The StartupItems folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.sitesFolder(), XAFolder)
+        return self._new_element(self.xa_elem.startupItemsFolder(), XAFolder)
 
     @property
-    def temporary_items_folder(self) -> "XAFolder":
-        """The Temporary Items folder
+    def system_folder(self) -> "XAFolder":
+        """The System folder.
 
         .. versionadded:: 0.1.0
         """
-        return self._new_element(self.xa_elem.temporaryItemsFolder(), XAFolder)
+        return self._new_element(self.xa_elem.systemFolder(), XAFolder)
 
+    def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
+        """Returns a list of folders, as PyXA objects, matching the given filter.
 
-#############
-### Media ###
-#############
-class XAImageList(XAList, XAClipboardCodable):
-    """A wrapper around lists of images that employs fast enumeration techniques.
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
 
-    .. deprecated:: 0.2.0
 
-       Use :class:`XAImage` and its methods instead.
+class XAFileList(XADiskItemList):
+    """A wrapper around lists of files that employs fast enumeration techniques.
 
-    .. versionadded:: 0.0.3
+    All properties of files can be called as methods on the wrapped list, returning a list containing each file's value for the property.
+
+    .. versionadded:: 0.1.0
     """
 
     def __init__(
-        self, properties: dict, filter: Union[dict, None] = None, obj_class=None
+        self, properties: dict, filter: Union[dict, None] = None, object_class=None
     ):
-        if obj_class is None:
-            obj_class = XAImage
-        super().__init__(properties, obj_class, filter)
+        if object_class is None:
+            object_class = XAFile
+        super().__init__(properties, filter, object_class)
 
-        self.modified = False  #: Whether the list of images has been modified since it was initialized
+    def creator_type(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "creatorType") or [])
 
-    def __partial_init(self):
-        images = [None] * self.xa_elem.count()
+    def default_application(self) -> "XADiskItemList":
+        ls = XABackends.element_values(self.xa_elem, "defaultApplication") or []
+        return self._new_element(ls, XADiskItemList)
 
-        def init_images(ref, index, stop):
-            if isinstance(ref, str):
-                ref = AppKit.NSImage.alloc().initWithContentsOfURL_(XAPath(ref).xa_elem)
-            elif isinstance(ref, ScriptingBridge.SBObject):
-                ref = AppKit.NSImage.alloc().initWithContentsOfURL_(
-                    XAPath(ref.imageFile().POSIXPath()).xa_elem
-                )
-            elif isinstance(ref, XAObject):
-                ref = AppKit.NSImage.alloc().initWithContentsOfURL_(
-                    ref.image_file.posix_path.xa_elem
-                )
-            images[index] = ref
+    def file_type(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "fileType") or [])
 
-        self.xa_elem.enumerateObjectsUsingBlock_(init_images)
-        return AppKit.NSMutableArray.alloc().initWithArray_(images)
+    def kind(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
-    def __apply_filter(self, filter_block, *args):
-        images = self.__partial_init()
+    def product_version(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "productVersion") or [])
 
-        filtered_images = [None] * images.count()
+    def short_version(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "shortVersion") or [])
 
-        def filter_image(image, index, *args):
-            img = Quartz.CIImage.imageWithCGImage_(image.CGImage())
-            filter = filter_block(image, *args)
-            filter.setValue_forKey_(img, "inputImage")
-            uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
+    def stationery(self) -> list["bool"]:
+        return list(XABackends.element_values(self.xa_elem, "stationery") or [])
 
-            # Crop the result to the original image size
-            cropped = uncropped.imageByCroppingToRect_(
-                Quartz.CGRectMake(0, 0, image.size().width * 2, image.size().height * 2)
-            )
+    def type_identifier(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "typeIdentifier") or [])
 
-            # Convert back to NSImage
-            rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
-            result = AppKit.NSImage.alloc().initWithSize_(rep.size())
-            result.addRepresentation_(rep)
-            filtered_images[index] = result
+    def version(self) -> list["str"]:
+        return list(XABackends.element_values(self.xa_elem, "version") or [])
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(filter_image, [image, index, *args])
+    def by_creator_type(self, creator_type: str) -> Union["XAFile", None]:
+        return self.by_property("creatorType", creator_type)
 
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+    def by_default_application(
+        self, default_application: "XADiskItem"
+    ) -> Union["XAFile", None]:
+        return self.by_property("defaultApplication", default_application.xa_elem)
 
-        self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(filtered_images)
-        return self
+    def by_file_type(self, file_type: str) -> Union["XAFile", None]:
+        return self.by_property("fileType", file_type)
 
-    def file(self) -> list[XAPath]:
-        return [x.file for x in self]
+    def by_kind(self, kind: str) -> Union["XAFile", None]:
+        return self.by_property("kind", kind)
 
-    def horizontal_stitch(self) -> "XAImage":
-        """Horizontally stacks each image in the list.
+    def by_product_version(self, product_version: str) -> Union["XAFile", None]:
+        return self.by_property("productVersion", product_version)
 
-        The first image in the list is placed at the left side of the resulting image.
+    def by_short_version(self, short_version: str) -> Union["XAFile", None]:
+        return self.by_property("shortVersion", short_version)
 
-        :return: The resulting image after stitching
-        :rtype: XAImage
+    def by_stationery(self, stationery: bool) -> Union["XAFile", None]:
+        return self.by_property("stationery", stationery)
 
-        .. versionadded:: 0.1.0
-        """
-        return XAImage.horizontal_stitch(self)
+    def by_type_identifier(self, type_identifier: str) -> Union["XAFile", None]:
+        return self.by_property("typeIdentifier", type_identifier)
 
-    def vertical_stitch(self) -> "XAImage":
-        """Vertically stacks each image in the list.
+    def by_version(self, version: str) -> Union["XAFile", None]:
+        return self.by_property("version", version)
 
-        The first image in the list is placed at the bottom side of the resulting image.
 
-        :return: The resulting image after stitching
-        :rtype: XAImage
+class XAFile(XADiskItem):
+    """A file in the file system.
+
+    .. versionadded:: 0.1.0
+    """
+
+    def __init__(self, properties):
+        super().__init__(properties)
+
+    @property
+    def creator_type(self) -> "str":
+        """The OSType identifying the application that created the file.
 
         .. versionadded:: 0.1.0
         """
-        return XAImage.vertical_stitch(self)
+        return self.xa_elem.creatorType()
 
-    def additive_composition(self) -> "XAImage":
-        """Creates a composition image by adding the color values of each image in the list.
+    @property
+    def default_application(self) -> "XADiskItem":
+        """The application that will launch if the file is opened.
 
-        :param images: The images to add together
-        :type images: list[XAImage]
-        :return: The resulting image composition
-        :rtype: XAImage
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.defaultApplication(), XADiskItem)
+
+    @default_application.setter
+    def default_application(self, default_application: XADiskItem):
+        self.set_property("defaultApplication", default_application.xa_elem)
+
+    @property
+    def file_type(self) -> "str":
+        """The OSType identifying the type of data contained in the file.
 
         .. versionadded:: 0.1.0
         """
-        image_data = [None] * self.xa_elem.count()
-        for index, image in enumerate(self.xa_elem):
-            if isinstance(image, str):
-                image = AppKit.NSImage.alloc().initWithContentsOfURL_(
-                    XAPath(image).xa_elem
-                )
-            image_data[index] = Quartz.CIImage.imageWithData_(
-                image.TIFFRepresentation()
-            )
+        return self.xa_elem.fileType()
 
-        current_composition = None
-        while len(image_data) > 1:
-            img1 = image_data.pop(0)
-            img2 = image_data.pop(0)
-            composition_filter = Quartz.CIFilter.filterWithName_(
-                "CIAdditionCompositing"
-            )
-            composition_filter.setDefaults()
-            composition_filter.setValue_forKey_(img1, "inputImage")
-            composition_filter.setValue_forKey_(img2, "inputBackgroundImage")
-            current_composition = composition_filter.outputImage()
-            image_data.insert(0, current_composition)
+    @property
+    def kind(self) -> "str":
+        """The kind of file, as shown in Finder.
 
-        composition_rep = AppKit.NSCIImageRep.imageRepWithCIImage_(current_composition)
-        composition = AppKit.NSImage.alloc().initWithSize_(composition_rep.size())
-        composition.addRepresentation_(composition_rep)
-        return XAImage(composition)
+        .. versionadded:: 0.1.0
+        """
+        return self.xa_elem.kind()
+
+    @property
+    def product_version(self) -> "str":
+        """The version of the product (visible at the top of the "Get Info" window).
 
-    def subtractive_composition(self) -> "XAImage":
-        """Creates a composition image by subtracting the color values of each image in the list successively.
+        .. versionadded:: 0.1.0
+        """
+        return self.xa_elem.productVersion()
 
-        :param images: The images to create the composition from
-        :type images: list[XAImage]
-        :return: The resulting image composition
-        :rtype: XAImage
+    @property
+    def short_version(self) -> "str":
+        """The short version of the file.
 
         .. versionadded:: 0.1.0
         """
-        image_data = [None] * self.xa_elem.count()
-        for index, image in enumerate(self.xa_elem):
-            if isinstance(image, str):
-                image = AppKit.NSImage.alloc().initWithContentsOfURL_(
-                    XAPath(image).xa_elem
-                )
-            image_data[index] = Quartz.CIImage.imageWithData_(
-                image.TIFFRepresentation()
-            )
+        return self.xa_elem.shortVersion()
 
-        current_composition = None
-        while len(image_data) > 1:
-            img1 = image_data.pop(0)
-            img2 = image_data.pop(0)
-            composition_filter = Quartz.CIFilter.filterWithName_("CISubtractBlendMode")
-            composition_filter.setDefaults()
-            composition_filter.setValue_forKey_(img1, "inputImage")
-            composition_filter.setValue_forKey_(img2, "inputBackgroundImage")
-            current_composition = composition_filter.outputImage()
-            image_data.insert(0, current_composition)
+    @property
+    def stationery(self) -> "bool":
+        """Whether the file is a stationery pad.
 
-        composition_rep = AppKit.NSCIImageRep.imageRepWithCIImage_(current_composition)
-        composition = AppKit.NSImage.alloc().initWithSize_(composition_rep.size())
-        composition.addRepresentation_(composition_rep)
-        return XAImage(composition)
+        .. versionadded:: 0.1.0
+        """
+        return self.xa_elem.stationery()
 
-    def edges(self, intensity: float = 1.0) -> "XAImageList":
-        """Detects the edges in each image of the list and highlights them colorfully, blackening other areas of the images.
+    @property
+    def type_identifier(self) -> "str":
+        """The type identifier of the file.
 
-        :param intensity: The degree to which edges are highlighted. Higher is brighter. Defaults to 1.0
-        :type intensity: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+        .. versionadded:: 0.1.0
+        """
+        return self.xa_elem.typeIdentifier()
+
+    @property
+    def version(self) -> "str":
+        """The version of the file (visible at the bottom of the "Get Info" window).
 
         .. versionadded:: 0.1.0
         """
+        return self.xa_elem.version()
 
-        def filter_block(image, intensity):
-            filter = Quartz.CIFilter.filterWithName_("CIEdges")
-            filter.setDefaults()
-            filter.setValue_forKey_(intensity, "inputIntensity")
-            return filter
 
-        return self.__apply_filter(filter_block, intensity)
+class XAFilePackageList(XAFileList):
+    """A wrapper around lists of file packages that employs fast enumeration techniques.
 
-    def gaussian_blur(self, intensity: float = 10) -> "XAImageList":
-        """Blurs each image in the list using a Gaussian filter.
+    All properties of file packages can be called as methods on the wrapped list, returning a list containing each package's value for the property.
 
-        :param intensity: The strength of the blur effect, defaults to 10
-        :type intensity: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    .. versionadded:: 0.1.0
+    """
 
-        .. versionadded:: 0.1.0
-        """
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XAFilePackage)
 
-        def filter_block(image, intensity):
-            filter = Quartz.CIFilter.filterWithName_("CIGaussianBlur")
-            filter.setDefaults()
-            filter.setValue_forKey_(intensity, "inputRadius")
-            return filter
 
-        return self.__apply_filter(filter_block, intensity)
+class XAFilePackage(XAFile):
+    """A file package in the file system.
 
-    def reduce_noise(
-        self, noise_level: float = 0.02, sharpness: float = 0.4
-    ) -> "XAImageList":
-        """Reduces noise in each image of the list by sharpening areas with a luminance delta below the specified noise level threshold.
+    .. versionadded:: 0.1.0
+    """
 
-        :param noise_level: The threshold for luminance changes in an area below which will be considered noise, defaults to 0.02
-        :type noise_level: float
-        :param sharpness: The sharpness of the resulting images, defaults to 0.4
-        :type sharpness: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    def __init__(self, properties):
+        super().__init__(properties)
+
+    def aliases(self, filter: Union[dict, None] = None) -> "XAAliasList":
+        """Returns a list of aliases, as PyXA objects, matching the given filter.
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.aliases(), XAAliasList, filter)
 
-        def filter_block(image, noise_level, sharpness):
-            filter = Quartz.CIFilter.filterWithName_("CINoiseReduction")
-            filter.setDefaults()
-            filter.setValue_forKey_(noise_level, "inputNoiseLevel")
-            filter.setValue_forKey_(sharpness, "inputSharpness")
-            return filter
-
-        return self.__apply_filter(filter_block, noise_level, sharpness)
+    def disk_items(self, filter: Union[dict, None] = None) -> "XADiskItemList":
+        """Returns a list of disk items, as PyXA objects, matching the given filter.
 
-    def pixellate(self, pixel_size: float = 8.0) -> "XAImageList":
-        """Pixellates each image in the list.
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.diskItems(), XADiskItemList, filter)
 
-        :param pixel_size: The size of the pixels, defaults to 8.0
-        :type pixel_size: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    def files(self, filter: Union[dict, None] = None) -> "XAFileList":
+        """Returns a list of files, as PyXA objects, matching the given filter.
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.files(), XAFileList, filter)
 
-        def filter_block(image, pixel_size):
-            filter = Quartz.CIFilter.filterWithName_("CIPixellate")
-            filter.setDefaults()
-            filter.setValue_forKey_(pixel_size, "inputScale")
-            return filter
-
-        return self.__apply_filter(filter_block, pixel_size)
+    def file_packages(self, filter: Union[dict, None] = None) -> "XAFilePackageList":
+        """Returns a list of file packages, as PyXA objects, matching the given filter.
 
-    def outline(self, threshold: float = 0.1) -> "XAImageList":
-        """Outlines detected edges within each image of the list in black, leaving the rest transparent.
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.filePackages(), XAFilePackageList, filter)
 
-        :param threshold: The threshold to use when separating edge and non-edge pixels. Larger values produce thinner edge lines. Defaults to 0.1
-        :type threshold: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
+        """Returns a list of folders, as PyXA objects, matching the given filter.
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
 
-        def filter_block(image, threshold):
-            filter = Quartz.CIFilter.filterWithName_("CILineOverlay")
-            filter.setDefaults()
-            filter.setValue_forKey_(threshold, "inputThreshold")
-            return filter
 
-        return self.__apply_filter(filter_block, threshold)
+class XAFolderList(XADiskItemList):
+    """A wrapper around lists of folders that employs fast enumeration techniques.
 
-    def invert(self) -> "XAImageList":
-        """Inverts the colors of each image in the list.
+    All properties of folders can be called as methods on the wrapped list, returning a list containing each folder's value for the property.
 
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    .. versionadded:: 0.1.0
+    """
+
+    def __init__(self, properties: dict, filter: Union[dict, None] = None):
+        super().__init__(properties, filter, XAFolder)
+
+
+class XAFolder(XADiskItem):
+    """A folder in the file system.
+
+    .. versionadded:: 0.1.0
+    """
+
+    def __init__(self, properties):
+        super().__init__(properties)
+
+    def aliases(self, filter: Union[dict, None] = None) -> "XAAliasList":
+        """Returns a list of aliases, as PyXA objects, matching the given filter.
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.aliases(), XAAliasList, filter)
 
-        def filter_block(image):
-            filter = Quartz.CIFilter.filterWithName_("CIColorInvert")
-            filter.setDefaults()
-            return filter
-
-        return self.__apply_filter(filter_block)
+    def disk_items(self, filter: Union[dict, None] = None) -> "XADiskItemList":
+        """Returns a list of disk items, as PyXA objects, matching the given filter.
 
-    def sepia(self, intensity: float = 1.0) -> "XAImageList":
-        """Applies a sepia filter to each image in the list; maps all colors of the images to shades of brown.
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.diskItems(), XADiskItemList, filter)
 
-        :param intensity: The opacity of the sepia effect. A value of 0 will have no impact on the image. Defaults to 1.0
-        :type intensity: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    def files(self, filter: Union[dict, None] = None) -> "XAFileList":
+        """Returns a list of files, as PyXA objects, matching the given filter.
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.files(), XAFileList, filter)
 
-        def filter_block(image, intensity):
-            filter = Quartz.CIFilter.filterWithName_("CISepiaTone")
-            filter.setDefaults()
-            filter.setValue_forKey_(intensity, "inputIntensity")
-            return filter
+    def file_packages(self, filter: Union[dict, None] = None) -> "XAFilePackageList":
+        """Returns a list of file packages, as PyXA objects, matching the given filter.
 
-        return self.__apply_filter(filter_block, intensity)
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.filePackages(), XAFilePackageList, filter)
 
-    def vignette(self, intensity: float = 1.0) -> "XAImageList":
-        """Applies vignette shading to the corners of each image in the list.
+    def folders(self, filter: Union[dict, None] = None) -> "XAFolderList":
+        """Returns a list of folders, as PyXA objects, matching the given filter.
 
-        :param intensity: The intensity of the vignette effect, defaults to 1.0
-        :type intensity: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+        :param filter: A dictionary specifying property-value pairs that all returned folders will have, or None
+        :type filter: Union[dict, None]
+        :return: The list of folders
+        :rtype: XAFolderList
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.folders(), XAFolderList, filter)
 
-        def filter_block(image, intensity):
-            filter = Quartz.CIFilter.filterWithName_("CIVignette")
-            filter.setDefaults()
-            filter.setValue_forKey_(intensity, "inputIntensity")
-            return filter
 
-        return self.__apply_filter(filter_block, intensity)
+class XALocalDomainObject(XADomain):
+    """The local domain in the file system.
 
-    def depth_of_field(
-        self,
-        focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None] = None,
-        intensity: float = 10.0,
-        focal_region_saturation: float = 1.5,
-    ) -> "XAImageList":
-        """Applies a depth of field filter to each image in the list, simulating a tilt & shift effect.
+    .. versionadded:: 0.1.0
+    """
 
-        :param focal_region: Two points defining a line within each image to focus the effect around (pixels around the line will be in focus), or None to use the center third of the image, defaults to None
-        :type focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None]
-        :param intensity: Controls the amount of distance around the focal region to keep in focus. Higher values decrease the distance before the out-of-focus effect starts. Defaults to 10.0
-        :type intensity: float
-        :param focal_region_saturation: Adjusts the saturation of the focial region. Higher values increase saturation. Defaults to 1.5 (1.5x default saturation)
-        :type focal_region_saturation: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    def __init__(self, properties):
+        super().__init__(properties)
+
+
+class XANetworkDomainObject(XADomain):
+    """The network domain in the file system.
 
-        .. versionadded:: 0.1.0
-        """
+    .. versionadded:: 0.1.0
+    """
 
-        def filter_block(image, focal_region, intensity, focal_region_saturation):
-            if focal_region is None:
-                center_top = Quartz.CIVector.vectorWithX_Y_(
-                    image.size().width / 2, image.size().height / 3
-                )
-                center_bottom = Quartz.CIVector.vectorWithX_Y_(
-                    image.size().width / 2, image.size().height / 3 * 2
-                )
-                focal_region = (center_top, center_bottom)
-            else:
-                point1 = Quartz.CIVector.vectorWithX_Y_(focal_region[0])
-                point2 = Quartz.CIVector.vectorWithX_Y_(focal_region[1])
-                focal_region = (point1, point2)
+    def __init__(self, properties):
+        super().__init__(properties)
 
-            filter = Quartz.CIFilter.filterWithName_("CIDepthOfField")
-            filter.setDefaults()
-            filter.setValue_forKey_(focal_region[0], "inputPoint0")
-            filter.setValue_forKey_(focal_region[1], "inputPoint1")
-            filter.setValue_forKey_(intensity, "inputRadius")
-            filter.setValue_forKey_(focal_region_saturation, "inputSaturation")
-            return filter
 
-        return self.__apply_filter(
-            filter_block, focal_region, intensity, focal_region_saturation
-        )
+class XASystemDomainObject(XADomain):
+    """The system domain in the file system.
 
-    def crystallize(self, crystal_size: float = 20.0) -> "XAImageList":
-        """Applies a crystallization filter to each image in the list. Creates polygon-shaped color blocks by aggregating pixel values.
+    .. versionadded:: 0.1.0
+    """
 
-        :param crystal_size: The radius of the crystals, defaults to 20.0
-        :type crystal_size: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    def __init__(self, properties):
+        super().__init__(properties)
 
-        .. versionadded:: 0.1.0
-        """
 
-        def filter_block(image, crystal_size):
-            filter = Quartz.CIFilter.filterWithName_("CICrystallize")
-            filter.setDefaults()
-            filter.setValue_forKey_(crystal_size, "inputRadius")
-            return filter
+class XAUserDomainObject(XADomain):
+    """The user domain in the file system.
 
-        return self.__apply_filter(filter_block, crystal_size)
+    .. versionadded:: 0.1.0
+    """
 
-    def comic(self) -> "XAImageList":
-        """Applies a comic filter to each image in the list. Outlines edges and applies a color halftone effect.
+    def __init__(self, properties):
+        super().__init__(properties)
 
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    @property
+    def desktop_folder(self) -> "XAFolder":
+        """The user's Desktop folder
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.desktopFolder(), XAFolder)
 
-        def filter_block(image):
-            filter = Quartz.CIFilter.filterWithName_("CIComicEffect")
-            filter.setDefaults()
-            return filter
-
-        return self.__apply_filter(filter_block)
+    @property
+    def documents_folder(self) -> "XAFolder":
+        """The user's Documents folder
 
-    def pointillize(self, point_size: float = 20.0) -> "XAImageList":
-        """Applies a pointillization filter to each image in the list.
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.documentsFolder(), XAFolder)
 
-        :param crystal_size: The radius of the points, defaults to 20.0
-        :type crystal_size: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    @property
+    def downloads_folder(self) -> "XAFolder":
+        """The user's Downloads folder
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.downloadsFolder(), XAFolder)
 
-        def filter_block(image, point_size):
-            filter = Quartz.CIFilter.filterWithName_("CIPointillize")
-            filter.setDefaults()
-            filter.setValue_forKey_(point_size, "inputRadius")
-            return filter
-
-        return self.__apply_filter(filter_block, point_size)
+    @property
+    def favorites_folder(self) -> "XAFolder":
+        """The user's Favorites folder
 
-    def bloom(self, intensity: float = 0.5) -> "XAImageList":
-        """Applies a bloom effect to each image in the list. Softens edges and adds a glow.
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.favoritesFolder(), XAFolder)
 
-        :param intensity: The strength of the softening and glow effects, defaults to 0.5
-        :type intensity: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+    @property
+    def home_folder(self) -> "XAFolder":
+        """The user's Home folder
 
         .. versionadded:: 0.1.0
         """
+        return self._new_element(self.xa_elem.homeFolder(), XAFolder)
 
-        def filter_block(image, intensity):
-            filter = Quartz.CIFilter.filterWithName_("CIBloom")
-            filter.setDefaults()
-            filter.setValue_forKey_(intensity, "inputIntensity")
-            return filter
+    @property
+    def movies_folder(self) -> "XAFolder":
+        """The user's Movies folder
 
-        return self.__apply_filter(filter_block, intensity)
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.moviesFolder(), XAFolder)
 
-    def monochrome(self, color: XAColor, intensity: float = 1.0) -> "XAImageList":
-        """Remaps the colors of each image in the list to shades of the specified color.
+    @property
+    def music_folder(self) -> "XAFolder":
+        """The user's Music folder
 
-        :param color: The color of map each images colors to
-        :type color: XAColor
-        :param intensity: The strength of recoloring effect. Higher values map colors to darker shades of the provided color. Defaults to 1.0
-        :type intensity: float
-        :return: The resulting images after applying the filter
-        :rtype: XAImageList
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.musicFolder(), XAFolder)
+
+    @property
+    def pictures_folder(self) -> "XAFolder":
+        """The user's Pictures folder
 
         .. versionadded:: 0.1.0
         """
-        ci_color = Quartz.CIColor.alloc().initWithColor_(color.xa_elem)
+        return self._new_element(self.xa_elem.picturesFolder(), XAFolder)
 
-        def filter_block(image, intensity):
-            filter = Quartz.CIFilter.filterWithName_("CIColorMonochrome")
-            filter.setDefaults()
-            filter.setValue_forKey_(ci_color, "inputColor")
-            filter.setValue_forKey_(intensity, "inputIntensity")
-            return filter
+    @property
+    def public_folder(self) -> "XAFolder":
+        """The user's Public folder
 
-        return self.__apply_filter(filter_block, intensity)
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.publicFolder(), XAFolder)
 
-    def bump(
-        self,
-        center: Union[tuple[int, int], None] = None,
-        radius: float = 300.0,
-        curvature: float = 0.5,
-    ) -> "XAImageList":
-        """Adds a concave (inward) or convex (outward) bump to each image in the list at the specified location within each image.
+    @property
+    def sites_folder(self) -> "XAFolder":
+        """The user's Sites folder
 
-        :param center: The center point of the effect, or None to use the center of the image, defaults to None
-        :type center: Union[tuple[int, int], None]
-        :param radius: The radius of the bump in pixels, defaults to 300.0
-        :type radius: float
-        :param curvature: Controls the direction and intensity of the bump's curvature. Positive values create convex bumps while negative values create concave bumps. Defaults to 0.5
-        :type curvature: float
-        :return: The resulting images after applying the distortion
-        :rtype: XAImageList
+        .. versionadded:: 0.1.0
+        """
+        return self._new_element(self.xa_elem.sitesFolder(), XAFolder)
+
+    @property
+    def temporary_items_folder(self) -> "XAFolder":
+        """The Temporary Items folder
 
         .. versionadded:: 0.1.0
         """
-        images = self.__partial_init()
+        return self._new_element(self.xa_elem.temporaryItemsFolder(), XAFolder)
 
-        bumped_images = [None] * images.count()
 
-        def bump_image(image, index, center, radius, curvature):
-            if center is None:
-                center = Quartz.CIVector.vectorWithX_Y_(
-                    image.size().width / 2, image.size().height / 2
-                )
-            else:
-                center = Quartz.CIVector.vectorWithX_Y_(center[0], center[1])
+#############
+### Media ###
+#############
+class XAImageList(XAList, XAClipboardCodable):
+    """A wrapper around lists of images that employs fast enumeration techniques.
 
-            img = Quartz.CIImage.imageWithCGImage_(image.CGImage())
-            filter = Quartz.CIFilter.filterWithName_("CIBumpDistortion")
-            filter.setDefaults()
-            filter.setValue_forKey_(img, "inputImage")
-            filter.setValue_forKey_(center, "inputCenter")
-            filter.setValue_forKey_(radius, "inputRadius")
-            filter.setValue_forKey_(curvature, "inputScale")
-            uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
+    .. deprecated:: 0.2.0
 
-            # Crop the result to the original image size
-            cropped = uncropped.imageByCroppingToRect_(
-                Quartz.CGRectMake(0, 0, image.size().width * 2, image.size().height * 2)
-            )
+       Use :class:`XAImage` and its methods instead.
 
-            # Convert back to NSImage
-            rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
-            result = AppKit.NSImage.alloc().initWithSize_(rep.size())
-            result.addRepresentation_(rep)
-            bumped_images[index] = result
+    .. versionadded:: 0.0.3
+    """
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(
-                bump_image, [image, index, center, radius, curvature]
-            )
+    def __init__(
+        self, properties: dict, filter: Union[dict, None] = None, obj_class=None
+    ):
+        if obj_class is None:
+            obj_class = _xa_graphics().XAImage
+        super().__init__(properties, obj_class, filter)
 
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.modified = False  #: Whether the list of images has been modified since it was initialized
 
-        self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(bumped_images)
-        return self
+    def __partial_init(self):
+        images = [None] * self.xa_elem.count()
 
-    def pinch(
-        self, center: Union[tuple[int, int], None] = None, intensity: float = 0.5
-    ) -> "XAImageList":
-        """Adds an inward pinch distortion to each image in the list at the specified location within each image.
+        def init_images(ref, index, stop):
+            if isinstance(ref, str):
+                ref = AppKit.NSImage.alloc().initWithContentsOfURL_(XAPath(ref).xa_elem)
+            elif isinstance(ref, ScriptingBridge.SBObject):
+                ref = AppKit.NSImage.alloc().initWithContentsOfURL_(
+                    XAPath(ref.imageFile().POSIXPath()).xa_elem
+                )
+            elif isinstance(ref, XAObject):
+                ref = AppKit.NSImage.alloc().initWithContentsOfURL_(
+                    ref.image_file.posix_path.xa_elem
+                )
+            images[index] = ref
 
-        :param center: The center point of the effect, or None to use the center of the image, defaults to None
-        :type center: Union[tuple[int, int], None]
-        :param intensity: Controls the scale of the pinch effect. Higher values stretch pixels away from the specified center to a greater degree. Defaults to 0.5
-        :type intensity: float
-        :return: The resulting images after applying the distortion
-        :rtype: XAImageList
+        self.xa_elem.enumerateObjectsUsingBlock_(init_images)
+        return AppKit.NSMutableArray.alloc().initWithArray_(images)
 
-        .. versionadded:: 0.1.0
-        """
+    def __apply_filter(self, filter_block, *args):
         images = self.__partial_init()
 
-        pinched_images = [None] * images.count()
-
-        def pinch_image(image, index, center, intensity):
-            if center is None:
-                center = Quartz.CIVector.vectorWithX_Y_(
-                    image.size().width / 2, image.size().height / 2
-                )
-            else:
-                center = Quartz.CIVector.vectorWithX_Y_(center[0], center[1])
+        filtered_images = [None] * images.count()
 
+        def filter_image(image, index, *args):
             img = Quartz.CIImage.imageWithCGImage_(image.CGImage())
-            filter = Quartz.CIFilter.filterWithName_("CIPinchDistortion")
-            filter.setDefaults()
+            filter = filter_block(image, *args)
             filter.setValue_forKey_(img, "inputImage")
-            filter.setValue_forKey_(center, "inputCenter")
-            filter.setValue_forKey_(intensity, "inputScale")
             uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
 
             # Crop the result to the original image size
@@ -6919,1164 +9146,1219 @@ class XAImageList(XAList, XAClipboardCodable):
             rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
             result = AppKit.NSImage.alloc().initWithSize_(rep.size())
             result.addRepresentation_(rep)
-            pinched_images[index] = result
+            filtered_images[index] = result
 
         threads = [None] * images.count()
         for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(
-                pinch_image, [image, index, center, intensity]
-            )
+            threads[index] = self._spawn_thread(filter_image, [image, index, *args])
 
         while any([t.is_alive() for t in threads]):
             time.sleep(0.01)
 
         self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(pinched_images)
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(filtered_images)
         return self
 
-    def twirl(
-        self,
-        center: Union[tuple[int, int], None] = None,
-        radius: float = 300.0,
-        angle: float = 3.14,
-    ) -> "XAImageList":
-        """Adds a twirl distortion to each image in the list by rotating pixels around the specified location within each image.
+    def file(self) -> list[XAPath]:
+        return [x.file for x in self]
 
-        :param center: The center point of the effect, or None to use the center of the image, defaults to None
-        :type center: Union[tuple[int, int], None]
-        :param radius: The pixel radius around the centerpoint that defines the area to apply the effect to, defaults to 300.0
-        :type radius: float
-        :param angle: The angle of the twirl in radians, defaults to 3.14
-        :type angle: float
-        :return: The resulting images after applying the distortion
-        :rtype: XAImageList
+    def horizontal_stitch(self) -> "XAImage":
+        """Horizontally stacks each image in the list.
+
+        The first image in the list is placed at the left side of the resulting image.
+
+        :return: The resulting image after stitching
+        :rtype: XAImage
 
         .. versionadded:: 0.1.0
         """
-        images = self.__partial_init()
+        return _xa_graphics().XAImage.horizontal_stitch(self)
 
-        twirled_images = [None] * images.count()
+    def vertical_stitch(self) -> "XAImage":
+        """Vertically stacks each image in the list.
 
-        def twirl_image(image, index, center, radius, angle):
-            if center is None:
-                center = Quartz.CIVector.vectorWithX_Y_(
-                    image.size().width / 2, image.size().height / 2
-                )
-            else:
-                center = Quartz.CIVector.vectorWithX_Y_(center[0], center[1])
+        The first image in the list is placed at the bottom side of the resulting image.
 
-            img = Quartz.CIImage.imageWithCGImage_(image.CGImage())
-            filter = Quartz.CIFilter.filterWithName_("CITwirlDistortion")
-            filter.setDefaults()
-            filter.setValue_forKey_(img, "inputImage")
-            filter.setValue_forKey_(center, "inputCenter")
-            filter.setValue_forKey_(radius, "inputRadius")
-            filter.setValue_forKey_(angle, "inputAngle")
-            uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
+        :return: The resulting image after stitching
+        :rtype: XAImage
 
-            # Crop the result to the original image size
-            cropped = uncropped.imageByCroppingToRect_(
-                Quartz.CGRectMake(0, 0, image.size().width * 2, image.size().height * 2)
+        .. versionadded:: 0.1.0
+        """
+        return _xa_graphics().XAImage.vertical_stitch(self)
+
+    def additive_composition(self) -> "XAImage":
+        """Creates a composition image by adding the color values of each image in the list.
+
+        :param images: The images to add together
+        :type images: list[XAImage]
+        :return: The resulting image composition
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        image_data = [None] * self.xa_elem.count()
+        for index, image in enumerate(self.xa_elem):
+            if isinstance(image, str):
+                image = AppKit.NSImage.alloc().initWithContentsOfURL_(
+                    XAPath(image).xa_elem
+                )
+            image_data[index] = Quartz.CIImage.imageWithData_(
+                image.TIFFRepresentation()
             )
 
-            # Convert back to NSImage
-            rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
-            result = AppKit.NSImage.alloc().initWithSize_(rep.size())
-            result.addRepresentation_(rep)
-            twirled_images[index] = result
+        current_composition = None
+        while len(image_data) > 1:
+            img1 = image_data.pop(0)
+            img2 = image_data.pop(0)
+            composition_filter = Quartz.CIFilter.filterWithName_(
+                "CIAdditionCompositing"
+            )
+            composition_filter.setDefaults()
+            composition_filter.setValue_forKey_(img1, "inputImage")
+            composition_filter.setValue_forKey_(img2, "inputBackgroundImage")
+            current_composition = composition_filter.outputImage()
+            image_data.insert(0, current_composition)
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(
-                twirl_image, [image, index, center, radius, angle]
+        composition_rep = AppKit.NSCIImageRep.imageRepWithCIImage_(current_composition)
+        composition = AppKit.NSImage.alloc().initWithSize_(composition_rep.size())
+        composition.addRepresentation_(composition_rep)
+        return _xa_graphics().XAImage(composition)
+
+    def subtractive_composition(self) -> "XAImage":
+        """Creates a composition image by subtracting the color values of each image in the list successively.
+
+        :param images: The images to create the composition from
+        :type images: list[XAImage]
+        :return: The resulting image composition
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        image_data = [None] * self.xa_elem.count()
+        for index, image in enumerate(self.xa_elem):
+            if isinstance(image, str):
+                image = AppKit.NSImage.alloc().initWithContentsOfURL_(
+                    XAPath(image).xa_elem
+                )
+            image_data[index] = Quartz.CIImage.imageWithData_(
+                image.TIFFRepresentation()
             )
 
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        current_composition = None
+        while len(image_data) > 1:
+            img1 = image_data.pop(0)
+            img2 = image_data.pop(0)
+            composition_filter = Quartz.CIFilter.filterWithName_("CISubtractBlendMode")
+            composition_filter.setDefaults()
+            composition_filter.setValue_forKey_(img1, "inputImage")
+            composition_filter.setValue_forKey_(img2, "inputBackgroundImage")
+            current_composition = composition_filter.outputImage()
+            image_data.insert(0, current_composition)
 
-        self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(twirled_images)
-        return self
+        composition_rep = AppKit.NSCIImageRep.imageRepWithCIImage_(current_composition)
+        composition = AppKit.NSImage.alloc().initWithSize_(composition_rep.size())
+        composition.addRepresentation_(composition_rep)
+        return _xa_graphics().XAImage(composition)
 
-    def auto_enhance(
-        self,
-        correct_red_eye: bool = False,
-        crop_to_features: bool = False,
-        correct_rotation: bool = False,
+    def edges(self, intensity: float = 1.0) -> "XAImageList":
+        """Detects the edges in each image of the list and highlights them colorfully, blackening other areas of the images.
+
+        :param intensity: The degree to which edges are highlighted. Higher is brighter. Defaults to 1.0
+        :type intensity: float
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
+
+        .. versionadded:: 0.1.0
+        """
+
+        def filter_block(image, intensity):
+            filter = Quartz.CIFilter.filterWithName_("CIEdges")
+            filter.setDefaults()
+            filter.setValue_forKey_(intensity, "inputIntensity")
+            return filter
+
+        return self.__apply_filter(filter_block, intensity)
+
+    def gaussian_blur(self, intensity: float = 10) -> "XAImageList":
+        """Blurs each image in the list using a Gaussian filter.
+
+        :param intensity: The strength of the blur effect, defaults to 10
+        :type intensity: float
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
+
+        .. versionadded:: 0.1.0
+        """
+
+        def filter_block(image, intensity):
+            filter = Quartz.CIFilter.filterWithName_("CIGaussianBlur")
+            filter.setDefaults()
+            filter.setValue_forKey_(intensity, "inputRadius")
+            return filter
+
+        return self.__apply_filter(filter_block, intensity)
+
+    def reduce_noise(
+        self, noise_level: float = 0.02, sharpness: float = 0.4
     ) -> "XAImageList":
-        """Attempts to enhance each image in the list by applying suggested filters.
+        """Reduces noise in each image of the list by sharpening areas with a luminance delta below the specified noise level threshold.
 
-        :param correct_red_eye: Whether to attempt red eye removal, defaults to False
-        :type correct_red_eye: bool, optional
-        :param crop_to_features: Whether to crop the images to focus on their main features, defaults to False
-        :type crop_to_features: bool, optional
-        :param correct_rotation: Whether attempt perspective correction by rotating the images, defaults to False
-        :type correct_rotation: bool, optional
-        :return: The list of enhanced images
+        :param noise_level: The threshold for luminance changes in an area below which will be considered noise, defaults to 0.02
+        :type noise_level: float
+        :param sharpness: The sharpness of the resulting images, defaults to 0.4
+        :type sharpness: float
+        :return: The resulting images after applying the filter
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        images = self.__partial_init()
 
-        enhanced_images = [None] * images.count()
+        def filter_block(image, noise_level, sharpness):
+            filter = Quartz.CIFilter.filterWithName_("CINoiseReduction")
+            filter.setDefaults()
+            filter.setValue_forKey_(noise_level, "inputNoiseLevel")
+            filter.setValue_forKey_(sharpness, "inputSharpness")
+            return filter
 
-        def enhance_image(image, index):
-            ci_image = Quartz.CIImage.imageWithCGImage_(image.CGImage())
+        return self.__apply_filter(filter_block, noise_level, sharpness)
 
-            options = {
-                Quartz.kCIImageAutoAdjustRedEye: correct_red_eye,
-                Quartz.kCIImageAutoAdjustCrop: crop_to_features,
-                Quartz.kCIImageAutoAdjustLevel: correct_rotation,
-            }
+    def pixellate(self, pixel_size: float = 8.0) -> "XAImageList":
+        """Pixellates each image in the list.
 
-            enhancements = ci_image.autoAdjustmentFiltersWithOptions_(options)
-            for filter in enhancements:
-                filter.setValue_forKey_(ci_image, "inputImage")
-                ci_image = filter.outputImage()
+        :param pixel_size: The size of the pixels, defaults to 8.0
+        :type pixel_size: float
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
 
-            # Crop the result to the original image size
-            cropped = ci_image.imageByCroppingToRect_(
-                Quartz.CGRectMake(0, 0, image.size().width * 2, image.size().height * 2)
-            )
+        .. versionadded:: 0.1.0
+        """
+
+        def filter_block(image, pixel_size):
+            filter = Quartz.CIFilter.filterWithName_("CIPixellate")
+            filter.setDefaults()
+            filter.setValue_forKey_(pixel_size, "inputScale")
+            return filter
 
-            # Convert back to NSImage
-            rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
-            result = AppKit.NSImage.alloc().initWithSize_(rep.size())
-            result.addRepresentation_(rep)
-            enhanced_images[index] = result
+        return self.__apply_filter(filter_block, pixel_size)
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(enhance_image, [image, index])
+    def outline(self, threshold: float = 0.1) -> "XAImageList":
+        """Outlines detected edges within each image of the list in black, leaving the rest transparent.
 
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        :param threshold: The threshold to use when separating edge and non-edge pixels. Larger values produce thinner edge lines. Defaults to 0.1
+        :type threshold: float
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
 
-        self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(enhanced_images)
-        return self
+        .. versionadded:: 0.1.0
+        """
 
-    def flip_horizontally(self) -> "XAImageList":
-        """Flips each image in the list horizontally.
+        def filter_block(image, threshold):
+            filter = Quartz.CIFilter.filterWithName_("CILineOverlay")
+            filter.setDefaults()
+            filter.setValue_forKey_(threshold, "inputThreshold")
+            return filter
 
-        :return: The list of flipped images
+        return self.__apply_filter(filter_block, threshold)
+
+    def invert(self) -> "XAImageList":
+        """Inverts the colors of each image in the list.
+
+        :return: The resulting images after applying the filter
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        images = self.__partial_init()
 
-        flipped_images = [None] * images.count()
+        def filter_block(image):
+            filter = Quartz.CIFilter.filterWithName_("CIColorInvert")
+            filter.setDefaults()
+            return filter
 
-        def flip_image(image, index):
-            flipped_image = AppKit.NSImage.alloc().initWithSize_(image.size())
-            imageBounds = AppKit.NSMakeRect(
-                0, 0, image.size().width, image.size().height
-            )
+        return self.__apply_filter(filter_block)
 
-            transform = AppKit.NSAffineTransform.alloc().init()
-            transform.translateXBy_yBy_(image.size().width, 0)
-            transform.scaleXBy_yBy_(-1, 1)
+    def sepia(self, intensity: float = 1.0) -> "XAImageList":
+        """Applies a sepia filter to each image in the list; maps all colors of the images to shades of brown.
 
-            flipped_image.lockFocus()
-            transform.concat()
-            image.drawInRect_fromRect_operation_fraction_(
-                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
-            )
-            flipped_image.unlockFocus()
-            flipped_images[index] = flipped_image
+        :param intensity: The opacity of the sepia effect. A value of 0 will have no impact on the image. Defaults to 1.0
+        :type intensity: float
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(flip_image, [image, index])
+        .. versionadded:: 0.1.0
+        """
 
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        def filter_block(image, intensity):
+            filter = Quartz.CIFilter.filterWithName_("CISepiaTone")
+            filter.setDefaults()
+            filter.setValue_forKey_(intensity, "inputIntensity")
+            return filter
 
-        self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(flipped_images)
-        return self
+        return self.__apply_filter(filter_block, intensity)
 
-    def flip_vertically(self) -> "XAImageList":
-        """Flips each image in the list vertically.
+    def vignette(self, intensity: float = 1.0) -> "XAImageList":
+        """Applies vignette shading to the corners of each image in the list.
 
-        :return: The list of flipped images
+        :param intensity: The intensity of the vignette effect, defaults to 1.0
+        :type intensity: float
+        :return: The resulting images after applying the filter
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        images = self.__partial_init()
 
-        flipped_images = [None] * images.count()
+        def filter_block(image, intensity):
+            filter = Quartz.CIFilter.filterWithName_("CIVignette")
+            filter.setDefaults()
+            filter.setValue_forKey_(intensity, "inputIntensity")
+            return filter
 
-        def flip_image(image, index):
-            flipped_image = AppKit.NSImage.alloc().initWithSize_(image.size())
-            imageBounds = AppKit.NSMakeRect(
-                0, 0, image.size().width, image.size().height
-            )
+        return self.__apply_filter(filter_block, intensity)
 
-            transform = AppKit.NSAffineTransform.alloc().init()
-            transform.translateXBy_yBy_(0, image.size().height)
-            transform.scaleXBy_yBy_(1, -1)
+    def depth_of_field(
+        self,
+        focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None] = None,
+        intensity: float = 10.0,
+        focal_region_saturation: float = 1.5,
+    ) -> "XAImageList":
+        """Applies a depth of field filter to each image in the list, simulating a tilt & shift effect.
 
-            flipped_image.lockFocus()
-            transform.concat()
-            image.drawInRect_fromRect_operation_fraction_(
-                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
-            )
-            flipped_image.unlockFocus()
-            flipped_images[index] = flipped_image
+        :param focal_region: Two points defining a line within each image to focus the effect around (pixels around the line will be in focus), or None to use the center third of the image, defaults to None
+        :type focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None]
+        :param intensity: Controls the amount of distance around the focal region to keep in focus. Higher values decrease the distance before the out-of-focus effect starts. Defaults to 10.0
+        :type intensity: float
+        :param focal_region_saturation: Adjusts the saturation of the focial region. Higher values increase saturation. Defaults to 1.5 (1.5x default saturation)
+        :type focal_region_saturation: float
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(flip_image, [image, index])
+        .. versionadded:: 0.1.0
+        """
 
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        def filter_block(image, focal_region, intensity, focal_region_saturation):
+            if focal_region is None:
+                center_top = Quartz.CIVector.vectorWithX_Y_(
+                    image.size().width / 2, image.size().height / 3
+                )
+                center_bottom = Quartz.CIVector.vectorWithX_Y_(
+                    image.size().width / 2, image.size().height / 3 * 2
+                )
+                focal_region = (center_top, center_bottom)
+            else:
+                point1 = Quartz.CIVector.vectorWithX_Y_(focal_region[0])
+                point2 = Quartz.CIVector.vectorWithX_Y_(focal_region[1])
+                focal_region = (point1, point2)
 
-        self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(flipped_images)
-        return self
+            filter = Quartz.CIFilter.filterWithName_("CIDepthOfField")
+            filter.setDefaults()
+            filter.setValue_forKey_(focal_region[0], "inputPoint0")
+            filter.setValue_forKey_(focal_region[1], "inputPoint1")
+            filter.setValue_forKey_(intensity, "inputRadius")
+            filter.setValue_forKey_(focal_region_saturation, "inputSaturation")
+            return filter
 
-    def rotate(self, degrees: float) -> "XAImageList":
-        """Rotates each image in the list by the specified amount of degrees.
+        return self.__apply_filter(
+            filter_block, focal_region, intensity, focal_region_saturation
+        )
 
-        :param degrees: The number of degrees to rotate the images by
-        :type degrees: float
-        :return: The list of rotated images
+    def crystallize(self, crystal_size: float = 20.0) -> "XAImageList":
+        """Applies a crystallization filter to each image in the list. Creates polygon-shaped color blocks by aggregating pixel values.
+
+        :param crystal_size: The radius of the crystals, defaults to 20.0
+        :type crystal_size: float
+        :return: The resulting images after applying the filter
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        sinDegrees = abs(math.sin(degrees * math.pi / 180.0))
-        cosDegrees = abs(math.cos(degrees * math.pi / 180.0))
 
-        images = self.__partial_init()
+        def filter_block(image, crystal_size):
+            filter = Quartz.CIFilter.filterWithName_("CICrystallize")
+            filter.setDefaults()
+            filter.setValue_forKey_(crystal_size, "inputRadius")
+            return filter
 
-        rotated_images = [None] * images.count()
+        return self.__apply_filter(filter_block, crystal_size)
 
-        def rotate_image(image, index):
-            new_size = Quartz.CGSizeMake(
-                image.size().height * sinDegrees + image.size().width * cosDegrees,
-                image.size().width * sinDegrees + image.size().height * cosDegrees,
-            )
-            rotated_image = AppKit.NSImage.alloc().initWithSize_(new_size)
+    def comic(self) -> "XAImageList":
+        """Applies a comic filter to each image in the list. Outlines edges and applies a color halftone effect.
 
-            imageBounds = Quartz.CGRectMake(
-                (new_size.width - image.size().width) / 2,
-                (new_size.height - image.size().height) / 2,
-                image.size().width,
-                image.size().height,
-            )
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
 
-            transform = AppKit.NSAffineTransform.alloc().init()
-            transform.translateXBy_yBy_(new_size.width / 2, new_size.height / 2)
-            transform.rotateByDegrees_(degrees)
-            transform.translateXBy_yBy_(-new_size.width / 2, -new_size.height / 2)
+        .. versionadded:: 0.1.0
+        """
 
-            rotated_image.lockFocus()
-            transform.concat()
-            image.drawInRect_fromRect_operation_fraction_(
-                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
-            )
-            rotated_image.unlockFocus()
+        def filter_block(image):
+            filter = Quartz.CIFilter.filterWithName_("CIComicEffect")
+            filter.setDefaults()
+            return filter
 
-            rotated_images[index] = rotated_image
+        return self.__apply_filter(filter_block)
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(rotate_image, [image, index])
+    def pointillize(self, point_size: float = 20.0) -> "XAImageList":
+        """Applies a pointillization filter to each image in the list.
 
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        :param crystal_size: The radius of the points, defaults to 20.0
+        :type crystal_size: float
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
 
-        self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(rotated_images)
-        return self
+        .. versionadded:: 0.1.0
+        """
 
-    def crop(
-        self, size: tuple[int, int], corner: Union[tuple[int, int], None] = None
-    ) -> "XAImageList":
-        """Crops each image in the list to the specified dimensions.
+        def filter_block(image, point_size):
+            filter = Quartz.CIFilter.filterWithName_("CIPointillize")
+            filter.setDefaults()
+            filter.setValue_forKey_(point_size, "inputRadius")
+            return filter
 
-        :param size: The dimensions to crop each image to
-        :type size: tuple[int, int]
-        :param corner: The bottom-left location to crom each image from, or None to use (0, 0), defaults to None
-        :type corner: Union[tuple[int, int], None]
-        :return: The list of cropped images
+        return self.__apply_filter(filter_block, point_size)
+
+    def bloom(self, intensity: float = 0.5) -> "XAImageList":
+        """Applies a bloom effect to each image in the list. Softens edges and adds a glow.
+
+        :param intensity: The strength of the softening and glow effects, defaults to 0.5
+        :type intensity: float
+        :return: The resulting images after applying the filter
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
-        """
-        if corner is None:
-            # No corner provided -- use (0,0) by default
-            corner = (0, 0)
+        """
 
-        images = self.__partial_init()
+        def filter_block(image, intensity):
+            filter = Quartz.CIFilter.filterWithName_("CIBloom")
+            filter.setDefaults()
+            filter.setValue_forKey_(intensity, "inputIntensity")
+            return filter
 
-        cropped_images = [None] * images.count()
+        return self.__apply_filter(filter_block, intensity)
 
-        def crop_image(image, index):
-            cropped_image = AppKit.NSImage.alloc().initWithSize_(
-                AppKit.NSMakeSize(size[0], size[1])
-            )
-            imageBounds = AppKit.NSMakeRect(
-                corner[0], corner[1], image.size().width, image.size().height
-            )
+    def monochrome(self, color: "XAColor", intensity: float = 1.0) -> "XAImageList":
+        """Remaps the colors of each image in the list to shades of the specified color.
 
-            cropped_image.lockFocus()
-            image.drawInRect_(imageBounds)
-            cropped_image.unlockFocus()
-            cropped_images[index] = cropped_image
+        :param color: The color of map each images colors to
+        :type color: XAColor
+        :param intensity: The strength of recoloring effect. Higher values map colors to darker shades of the provided color. Defaults to 1.0
+        :type intensity: float
+        :return: The resulting images after applying the filter
+        :rtype: XAImageList
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(crop_image, [image, index])
+        .. versionadded:: 0.1.0
+        """
+        ci_color = Quartz.CIColor.alloc().initWithColor_(color.xa_elem)
 
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        def filter_block(image, intensity):
+            filter = Quartz.CIFilter.filterWithName_("CIColorMonochrome")
+            filter.setDefaults()
+            filter.setValue_forKey_(ci_color, "inputColor")
+            filter.setValue_forKey_(intensity, "inputIntensity")
+            return filter
 
-        self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(cropped_images)
-        return self
+        return self.__apply_filter(filter_block, intensity)
 
-    def scale(
-        self, scale_factor_x: float, scale_factor_y: Union[float, None] = None
+    def bump(
+        self,
+        center: Union[tuple[int, int], None] = None,
+        radius: float = 300.0,
+        curvature: float = 0.5,
     ) -> "XAImageList":
-        """Scales each image in the list by the specified horizontal and vertical factors.
+        """Adds a concave (inward) or convex (outward) bump to each image in the list at the specified location within each image.
 
-        :param scale_factor_x: The factor by which to scale each image in the X dimension
-        :type scale_factor_x: float
-        :param scale_factor_y: The factor by which to scale each image in the Y dimension, or None to match the horizontal factor, defaults to None
-        :type scale_factor_y: Union[float, None]
-        :return: The list of scaled images
+        :param center: The center point of the effect, or None to use the center of the image, defaults to None
+        :type center: Union[tuple[int, int], None]
+        :param radius: The radius of the bump in pixels, defaults to 300.0
+        :type radius: float
+        :param curvature: Controls the direction and intensity of the bump's curvature. Positive values create convex bumps while negative values create concave bumps. Defaults to 0.5
+        :type curvature: float
+        :return: The resulting images after applying the distortion
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        if scale_factor_y is None:
-            scale_factor_y = scale_factor_x
-
         images = self.__partial_init()
 
-        scaled_images = [None] * self.xa_elem.count()
+        bumped_images = [None] * images.count()
 
-        def scale_image(image, index):
-            scaled_image = AppKit.NSImage.alloc().initWithSize_(
-                AppKit.NSMakeSize(
-                    image.size().width * scale_factor_x,
-                    image.size().height * scale_factor_y,
+        def bump_image(image, index, center, radius, curvature):
+            if center is None:
+                center = Quartz.CIVector.vectorWithX_Y_(
+                    image.size().width / 2, image.size().height / 2
                 )
-            )
-            imageBounds = AppKit.NSMakeRect(
-                0, 0, image.size().width, image.size().height
-            )
+            else:
+                center = Quartz.CIVector.vectorWithX_Y_(center[0], center[1])
 
-            transform = AppKit.NSAffineTransform.alloc().init()
-            transform.scaleXBy_yBy_(scale_factor_x, scale_factor_y)
+            img = Quartz.CIImage.imageWithCGImage_(image.CGImage())
+            filter = Quartz.CIFilter.filterWithName_("CIBumpDistortion")
+            filter.setDefaults()
+            filter.setValue_forKey_(img, "inputImage")
+            filter.setValue_forKey_(center, "inputCenter")
+            filter.setValue_forKey_(radius, "inputRadius")
+            filter.setValue_forKey_(curvature, "inputScale")
+            uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
 
-            scaled_image.lockFocus()
-            transform.concat()
-            image.drawInRect_fromRect_operation_fraction_(
-                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
+            # Crop the result to the original image size
+            cropped = uncropped.imageByCroppingToRect_(
+                Quartz.CGRectMake(0, 0, image.size().width * 2, image.size().height * 2)
             )
-            scaled_image.unlockFocus()
-            scaled_images[index] = scaled_image
 
-        threads = [None] * self.xa_elem.count()
+            # Convert back to NSImage
+            rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
+            result = AppKit.NSImage.alloc().initWithSize_(rep.size())
+            result.addRepresentation_(rep)
+            bumped_images[index] = result
+
+        threads = [None] * images.count()
         for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(scale_image, [image, index])
+            threads[index] = self._spawn_thread(
+                bump_image, [image, index, center, radius, curvature]
+            )
 
         while any([t.is_alive() for t in threads]):
             time.sleep(0.01)
 
         self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(scaled_images)
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(bumped_images)
         return self
 
-    def resize(self, width: int, height: Union[int, None] = None) -> "XAImageList":
-        """Resizes each image in the list to the specified width and height.
+    def pinch(
+        self, center: Union[tuple[int, int], None] = None, intensity: float = 0.5
+    ) -> "XAImageList":
+        """Adds an inward pinch distortion to each image in the list at the specified location within each image.
 
-        :param width: The width of the resulting images
-        :type width: int
-        :param height: The height of the resulting images, or None to maintain width:height proportions, defaults to None
-        :type height: Union[int, None]
-        :return: The list of scaled images
+        :param center: The center point of the effect, or None to use the center of the image, defaults to None
+        :type center: Union[tuple[int, int], None]
+        :param intensity: Controls the scale of the pinch effect. Higher values stretch pixels away from the specified center to a greater degree. Defaults to 0.5
+        :type intensity: float
+        :return: The resulting images after applying the distortion
         :rtype: XAImageList
 
-        .. versionadded:: 0.1.1
+        .. versionadded:: 0.1.0
         """
         images = self.__partial_init()
 
-        scaled_images = [None] * self.xa_elem.count()
-
-        def scale_image(image, index):
-            nonlocal height
-            img_width = image.size().width
-            img_height = image.size().height
-
-            if height is None:
-                height = img_height
+        pinched_images = [None] * images.count()
 
-            scaled_image = AppKit.NSImage.alloc().initWithSize_(
-                AppKit.NSMakeSize(
-                    img_width * width / img_width, img_height * height / img_height
+        def pinch_image(image, index, center, intensity):
+            if center is None:
+                center = Quartz.CIVector.vectorWithX_Y_(
+                    image.size().width / 2, image.size().height / 2
                 )
-            )
-            imageBounds = AppKit.NSMakeRect(
-                0, 0, image.size().width, image.size().height
-            )
+            else:
+                center = Quartz.CIVector.vectorWithX_Y_(center[0], center[1])
 
-            transform = AppKit.NSAffineTransform.alloc().init()
-            transform.scaleXBy_yBy_(width / img_width, height / img_height)
+            img = Quartz.CIImage.imageWithCGImage_(image.CGImage())
+            filter = Quartz.CIFilter.filterWithName_("CIPinchDistortion")
+            filter.setDefaults()
+            filter.setValue_forKey_(img, "inputImage")
+            filter.setValue_forKey_(center, "inputCenter")
+            filter.setValue_forKey_(intensity, "inputScale")
+            uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
 
-            scaled_image.lockFocus()
-            transform.concat()
-            image.drawInRect_fromRect_operation_fraction_(
-                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
+            # Crop the result to the original image size
+            cropped = uncropped.imageByCroppingToRect_(
+                Quartz.CGRectMake(0, 0, image.size().width * 2, image.size().height * 2)
             )
-            scaled_image.unlockFocus()
-            scaled_images[index] = scaled_image
 
-        threads = [None] * self.xa_elem.count()
+            # Convert back to NSImage
+            rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
+            result = AppKit.NSImage.alloc().initWithSize_(rep.size())
+            result.addRepresentation_(rep)
+            pinched_images[index] = result
+
+        threads = [None] * images.count()
         for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(scale_image, [image, index])
+            threads[index] = self._spawn_thread(
+                pinch_image, [image, index, center, intensity]
+            )
 
         while any([t.is_alive() for t in threads]):
             time.sleep(0.01)
 
         self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(scaled_images)
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(pinched_images)
         return self
 
-    def pad(
+    def twirl(
         self,
-        horizontal_border_width: int = 50,
-        vertical_border_width: int = 50,
-        pad_color: Union[XAColor, None] = None,
+        center: Union[tuple[int, int], None] = None,
+        radius: float = 300.0,
+        angle: float = 3.14,
     ) -> "XAImageList":
-        """Pads each image in the list with the specified color; add a border around each image in the list with the specified vertical and horizontal width.
+        """Adds a twirl distortion to each image in the list by rotating pixels around the specified location within each image.
 
-        :param horizontal_border_width: The border width, in pixels, in the x-dimension, defaults to 50
-        :type horizontal_border_width: int
-        :param vertical_border_width: The border width, in pixels, in the y-dimension, defaults to 50
-        :type vertical_border_width: int
-        :param pad_color: The color of the border, or None for a white border, defaults to None
-        :type pad_color: Union[XAColor, None]
-        :return: The list of padded images
+        :param center: The center point of the effect, or None to use the center of the image, defaults to None
+        :type center: Union[tuple[int, int], None]
+        :param radius: The pixel radius around the centerpoint that defines the area to apply the effect to, defaults to 300.0
+        :type radius: float
+        :param angle: The angle of the twirl in radians, defaults to 3.14
+        :type angle: float
+        :return: The resulting images after applying the distortion
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        if pad_color is None:
-            # No color provided -- use white by default
-            pad_color = XAColor.white()
-
         images = self.__partial_init()
 
-        padded_images = [None] * images.count()
+        twirled_images = [None] * images.count()
 
-        def pad_image(image, index):
-            new_width = image.size().width + horizontal_border_width * 2
-            new_height = image.size().height + vertical_border_width * 2
-            color_swatch = pad_color.make_swatch(new_width, new_height)
+        def twirl_image(image, index, center, radius, angle):
+            if center is None:
+                center = Quartz.CIVector.vectorWithX_Y_(
+                    image.size().width / 2, image.size().height / 2
+                )
+            else:
+                center = Quartz.CIVector.vectorWithX_Y_(center[0], center[1])
 
-            color_swatch.xa_elem.lockFocus()
-            bounds = AppKit.NSMakeRect(
-                horizontal_border_width,
-                vertical_border_width,
-                image.size().width,
-                image.size().height,
+            img = Quartz.CIImage.imageWithCGImage_(image.CGImage())
+            filter = Quartz.CIFilter.filterWithName_("CITwirlDistortion")
+            filter.setDefaults()
+            filter.setValue_forKey_(img, "inputImage")
+            filter.setValue_forKey_(center, "inputCenter")
+            filter.setValue_forKey_(radius, "inputRadius")
+            filter.setValue_forKey_(angle, "inputAngle")
+            uncropped = filter.valueForKey_(Quartz.kCIOutputImageKey)
+
+            # Crop the result to the original image size
+            cropped = uncropped.imageByCroppingToRect_(
+                Quartz.CGRectMake(0, 0, image.size().width * 2, image.size().height * 2)
             )
-            image.drawInRect_(bounds)
-            color_swatch.xa_elem.unlockFocus()
-            padded_images[index] = color_swatch.xa_elem
+
+            # Convert back to NSImage
+            rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
+            result = AppKit.NSImage.alloc().initWithSize_(rep.size())
+            result.addRepresentation_(rep)
+            twirled_images[index] = result
 
         threads = [None] * images.count()
         for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(pad_image, [image, index])
+            threads[index] = self._spawn_thread(
+                twirl_image, [image, index, center, radius, angle]
+            )
 
         while any([t.is_alive() for t in threads]):
             time.sleep(0.01)
 
         self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(padded_images)
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(twirled_images)
         return self
 
-    def overlay_image(
+    def auto_enhance(
         self,
-        image: "XAImage",
-        location: Union[tuple[int, int], None] = None,
-        size: Union[tuple[int, int], None] = None,
+        correct_red_eye: bool = False,
+        crop_to_features: bool = False,
+        correct_rotation: bool = False,
     ) -> "XAImageList":
-        """Overlays an image on top of each image in the list, at the specified location, with the specified size.
+        """Attempts to enhance each image in the list by applying suggested filters.
 
-        :param image: The image to overlay on top of each image in the list
-        :type image: XAImage
-        :param location: The bottom-left point of the overlaid image in the results, or None to use the bottom-left point of each background image, defaults to None
-        :type location: Union[tuple[int, int], None]
-        :param size: The width and height of the overlaid image, or None to use the overlaid's images existing width and height, or (-1, -1) to use the dimensions of each background images, defaults to None
-        :type size: Union[tuple[int, int], None]
-        :return: The list of images with the specified image overlaid on top of them
+        :param correct_red_eye: Whether to attempt red eye removal, defaults to False
+        :type correct_red_eye: bool, optional
+        :param crop_to_features: Whether to crop the images to focus on their main features, defaults to False
+        :type crop_to_features: bool, optional
+        :param correct_rotation: Whether attempt perspective correction by rotating the images, defaults to False
+        :type correct_rotation: bool, optional
+        :return: The list of enhanced images
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        if location is None:
-            # No location provided -- use the bottom-left point of the background image by default
-            location = (0, 0)
-
         images = self.__partial_init()
-        overlayed_images = [None] * images.count()
 
-        def overlay_image(img, index, image, size, location):
-            if size is None:
-                # No dimensions provided -- use size of overlay image by default
-                size = image.size
-            elif size == (-1, -1):
-                # Use remaining width/height of background image
-                size = (img.size().width - location[0], img.size().height - location[1])
-            elif size[0] == -1:
-                # Use remaining width of background image + provided height
-                size = (img.size().width - location[0], size[1])
-            elif size[1] == -1:
-                # Use remaining height of background image + provided width
-                size = (size[1], img.size().width - location[1])
+        enhanced_images = [None] * images.count()
 
-            img.lockFocus()
-            bounds = AppKit.NSMakeRect(location[0], location[1], size[0], size[1])
-            image.xa_elem.drawInRect_(bounds)
-            img.unlockFocus()
-            overlayed_images[index] = img
+        def enhance_image(image, index):
+            ci_image = Quartz.CIImage.imageWithCGImage_(image.CGImage())
 
-        threads = [None] * images.count()
-        for index, img in enumerate(images):
-            threads[index] = self._spawn_thread(
-                overlay_image, [img, index, image, size, location]
+            options = {
+                Quartz.kCIImageAutoAdjustRedEye: correct_red_eye,
+                Quartz.kCIImageAutoAdjustCrop: crop_to_features,
+                Quartz.kCIImageAutoAdjustLevel: correct_rotation,
+            }
+
+            enhancements = ci_image.autoAdjustmentFiltersWithOptions_(options)
+            for filter in enhancements:
+                filter.setValue_forKey_(ci_image, "inputImage")
+                ci_image = filter.outputImage()
+
+            # Crop the result to the original image size
+            cropped = ci_image.imageByCroppingToRect_(
+                Quartz.CGRectMake(0, 0, image.size().width * 2, image.size().height * 2)
             )
 
+            # Convert back to NSImage
+            rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
+            result = AppKit.NSImage.alloc().initWithSize_(rep.size())
+            result.addRepresentation_(rep)
+            enhanced_images[index] = result
+
+        threads = [None] * images.count()
+        for index, image in enumerate(images):
+            threads[index] = self._spawn_thread(enhance_image, [image, index])
+
         while any([t.is_alive() for t in threads]):
             time.sleep(0.01)
 
         self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(overlayed_images)
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(enhanced_images)
         return self
 
-    def overlay_text(
-        self,
-        text: str,
-        location: Union[tuple[int, int], None] = None,
-        font_size: float = 12,
-        font_color: Union[XAColor, None] = None,
-    ) -> "XAImageList":
-        """Overlays text of the specified size and color at the provided location within each image of the list.
+    def flip_horizontally(self) -> "XAImageList":
+        """Flips each image in the list horizontally.
 
-        :param text: The text to overlay onto each image of the list
-        :type text: str
-        :param location: The bottom-left point of the start of the text, or None to use (5, 5), defaults to None
-        :type location: Union[tuple[int, int], None]
-        :param font_size: The font size, in pixels, of the text, defaults to 12
-        :type font_size: float
-        :param font_color: The color of the text, or None to use black, defaults to None
-        :type font_color: XAColor
-        :return: The list of images with the specified text overlaid on top of them
+        :return: The list of flipped images
         :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        if location is None:
-            # No location provided -- use (5, 5) by default
-            location = (5, 5)
-
-        if font_color is None:
-            # No color provided -- use black by default
-            font_color = XAColor.black()
-
-        font = AppKit.NSFont.userFontOfSize_(font_size)
         images = self.__partial_init()
-        overlayed_images = [None] * self.xa_elem.count()
 
-        def overlay_text(image, index):
-            textRect = Quartz.CGRectMake(
-                location[0], 0, image.size().width - location[0], location[1]
+        flipped_images = [None] * images.count()
+
+        def flip_image(image, index):
+            flipped_image = AppKit.NSImage.alloc().initWithSize_(image.size())
+            imageBounds = AppKit.NSMakeRect(
+                0, 0, image.size().width, image.size().height
             )
-            attributes = {
-                AppKit.NSFontAttributeName: font,
-                AppKit.NSForegroundColorAttributeName: font_color.xa_elem,
-            }
 
-            image.lockFocus()
-            AppKit.NSString.alloc().initWithString_(text).drawInRect_withAttributes_(
-                textRect, attributes
+            transform = AppKit.NSAffineTransform.alloc().init()
+            transform.translateXBy_yBy_(image.size().width, 0)
+            transform.scaleXBy_yBy_(-1, 1)
+
+            flipped_image.lockFocus()
+            transform.concat()
+            image.drawInRect_fromRect_operation_fraction_(
+                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
             )
-            image.unlockFocus()
-            overlayed_images[index] = image
+            flipped_image.unlockFocus()
+            flipped_images[index] = flipped_image
 
-        threads = [None] * self.xa_elem.count()
+        threads = [None] * images.count()
         for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(overlay_text, [image, index])
+            threads[index] = self._spawn_thread(flip_image, [image, index])
 
         while any([t.is_alive() for t in threads]):
             time.sleep(0.01)
 
         self.modified = True
-        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(overlayed_images)
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(flipped_images)
         return self
 
-    def extract_text(self) -> list[str]:
-        """Extracts and returns a list of all visible text in each image of the list.
-
-        :return: The array of extracted text strings
-        :rtype: list[str]
-
-        :Example:
+    def flip_vertically(self) -> "XAImageList":
+        """Flips each image in the list vertically.
 
-        >>> import PyXA
-        >>> test = PyXA.XAImage("/Users/ExampleUser/Downloads/Example.jpg")
-        >>> print(test.extract_text())
-        ["HERE'S TO THE", 'CRAZY ONES', 'the MISFITS the REBELS', 'THE TROUBLEMAKERS', ...]
+        :return: The list of flipped images
+        :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
         images = self.__partial_init()
-        import Vision
-
-        extracted_strings = [None] * self.xa_elem.count()
 
-        def get_text(image, index):
-            # Prepare CGImage
-            ci_image = Quartz.CIImage.imageWithCGImage_(image.CGImage())
-            context = Quartz.CIContext.alloc().initWithOptions_(None)
-            img = context.createCGImage_fromRect_(ci_image, ci_image.extent())
+        flipped_images = [None] * images.count()
 
-            # Handle request completion
-            image_strings = []
+        def flip_image(image, index):
+            flipped_image = AppKit.NSImage.alloc().initWithSize_(image.size())
+            imageBounds = AppKit.NSMakeRect(
+                0, 0, image.size().width, image.size().height
+            )
 
-            def recognize_text_handler(request, error):
-                observations = request.results()
-                for observation in observations:
-                    recognized_strings = observation.topCandidates_(1)[0].string()
-                    image_strings.append(recognized_strings)
+            transform = AppKit.NSAffineTransform.alloc().init()
+            transform.translateXBy_yBy_(0, image.size().height)
+            transform.scaleXBy_yBy_(1, -1)
 
-            # Perform request and return extracted text
-            request = Vision.VNRecognizeTextRequest.alloc().initWithCompletionHandler_(
-                recognize_text_handler
-            )
-            request_handler = (
-                Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(img, None)
+            flipped_image.lockFocus()
+            transform.concat()
+            image.drawInRect_fromRect_operation_fraction_(
+                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
             )
-            request_handler.performRequests_error_([request], None)
-            extracted_strings[index] = image_strings
+            flipped_image.unlockFocus()
+            flipped_images[index] = flipped_image
 
-        threads = [None] * self.xa_elem.count()
+        threads = [None] * images.count()
         for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(get_text, [image, index])
+            threads[index] = self._spawn_thread(flip_image, [image, index])
 
         while any([t.is_alive() for t in threads]):
             time.sleep(0.01)
 
-        return extracted_strings
-
-    def show_in_preview(self):
-        """Opens each image in the list in Preview.
-
-        .. versionadded:: 0.1.0
-        """
-        for image in self:
-            image.show_in_preview()
+        self.modified = True
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(flipped_images)
+        return self
 
-    def save(self, file_paths: list[Union[XAPath, str]]):
-        """Saves each image to a file on the disk.
+    def rotate(self, degrees: float) -> "XAImageList":
+        """Rotates each image in the list by the specified amount of degrees.
 
-        :param file_path: The path at which to save the image file. Any existing file at that location will be overwritten, defaults to None
-        :type file_path: Union[XAPath, str, None]
+        :param degrees: The number of degrees to rotate the images by
+        :type degrees: float
+        :return: The list of rotated images
+        :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        for index, image in enumerate(self):
-            path = None
-            if len(file_paths) > index:
-                path = file_paths[index]
-            image.save(path)
-
-    def get_clipboard_representation(self) -> list["AppKit.NSImage"]:
-        """Gets a clipboard-codable representation of each image in the list.
-
-        When the clipboard content is set to a list of image, the raw data of each image is added to the clipboard. You can then
-
-        :return: A list of media item file URLs
-        :rtype: list[NSURL]
-
-        .. versionadded:: 0.0.8
-        """
-        data = []
-        for image in self.__partial_init():
-            if image.TIFFRepresentation():
-                data.append(image)
-        return data
-
+        sinDegrees = abs(math.sin(degrees * math.pi / 180.0))
+        cosDegrees = abs(math.cos(degrees * math.pi / 180.0))
 
-class XAImage(macimg.Image, XAObject, XAClipboardCodable):
-    """A wrapper around NSImage with specialized automation methods.
+        images = self.__partial_init()
 
-    .. versionadded:: 0.0.2
-    """
+        rotated_images = [None] * images.count()
 
-    def __init__(
-        self,
-        image_reference: Union[
-            str, XAPath, "AppKit.NSURL", "AppKit.NSImage", None
-        ] = None,
-    ):
-        match image_reference:
-            case {"element": str(ref)}:
-                image_reference = ref
+        def rotate_image(image, index):
+            new_size = Quartz.CGSizeMake(
+                image.size().height * sinDegrees + image.size().width * cosDegrees,
+                image.size().width * sinDegrees + image.size().height * cosDegrees,
+            )
+            rotated_image = AppKit.NSImage.alloc().initWithSize_(new_size)
 
-            case {"element": XAImage() as image}:
-                image_reference = image._nsimage
+            imageBounds = Quartz.CGRectMake(
+                (new_size.width - image.size().width) / 2,
+                (new_size.height - image.size().height) / 2,
+                image.size().width,
+                image.size().height,
+            )
 
-            case {"element": AppKit.NSImage() as image}:
-                image_reference = image
+            transform = AppKit.NSAffineTransform.alloc().init()
+            transform.translateXBy_yBy_(new_size.width / 2, new_size.height / 2)
+            transform.rotateByDegrees_(degrees)
+            transform.translateXBy_yBy_(-new_size.width / 2, -new_size.height / 2)
 
-            case XAPath() as path:
-                image_reference = path.path
+            rotated_image.lockFocus()
+            transform.concat()
+            image.drawInRect_fromRect_operation_fraction_(
+                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
+            )
+            rotated_image.unlockFocus()
 
-            case XAURL() as url:
-                image_reference = url.url
+            rotated_images[index] = rotated_image
 
-            case XAObject():
-                try:
-                    image_reference = image_reference.get_image_representation()
-                except AttributeError:
-                    raise TypeError(
-                        f"{str(type(image_reference))} does not implement the XAImageLike protocol."
-                    )
+        threads = [None] * images.count()
+        for index, image in enumerate(images):
+            threads[index] = self._spawn_thread(rotate_image, [image, index])
 
-        super().__init__(image_reference)
+        while any([t.is_alive() for t in threads]):
+            time.sleep(0.01)
 
-    @property
-    def xa_elem(self):
-        return self._nsimage
+        self.modified = True
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(rotated_images)
+        return self
 
-    def open(
-        *images: Union[str, XAPath, list[Union[str, XAPath]]]
-    ) -> Union["XAImage", XAImageList]:
-        """Initializes one or more images from files.
+    def crop(
+        self, size: tuple[int, int], corner: Union[tuple[int, int], None] = None
+    ) -> "XAImageList":
+        """Crops each image in the list to the specified dimensions.
 
-        :param images: The image(s) to open
-        :type images: Union[str, XAPath, list[Union[str, XAPath]]]
-        :return: The newly created image object, or a list of image objects
-        :rtype: Union[XAImage, XAImageList]
+        :param size: The dimensions to crop each image to
+        :type size: tuple[int, int]
+        :param corner: The bottom-left location to crom each image from, or None to use (0, 0), defaults to None
+        :type corner: Union[tuple[int, int], None]
+        :return: The list of cropped images
+        :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        if len(images) == 1:
-            images = images[0]
-
-        if isinstance(images, list) or isinstance(images, tuple):
-            return XAImageList({"element": images})
-        else:
-            return XAImage(images)
-
-    def horizontal_stitch(images: Union[list["XAImage"], XAImageList]) -> "XAImage":
-        """Horizontally stacks two or more images.
+        if corner is None:
+            # No corner provided -- use (0,0) by default
+            corner = (0, 0)
 
-        The first image in the list is placed at the left side of the resulting image.
+        images = self.__partial_init()
 
-        :param images: The list of images to stitch together
-        :type images: Union[list[XAImage], XAImageList]
-        :return: The resulting image after stitching
-        :rtype: XAImage
+        cropped_images = [None] * images.count()
 
-        .. versionadded:: 0.1.1
-        """
-        return macimg.compositions.HorizontalStitch().compose(*images)
+        def crop_image(image, index):
+            cropped_image = AppKit.NSImage.alloc().initWithSize_(
+                AppKit.NSMakeSize(size[0], size[1])
+            )
+            imageBounds = AppKit.NSMakeRect(
+                corner[0], corner[1], image.size().width, image.size().height
+            )
 
-    def vertical_stitch(images: Union[list["XAImage"], XAImageList]) -> "XAImage":
-        """Vertically stacks two or more images.
+            cropped_image.lockFocus()
+            image.drawInRect_(imageBounds)
+            cropped_image.unlockFocus()
+            cropped_images[index] = cropped_image
 
-        The first image in the list is placed at the bottom of the resulting image.
+        threads = [None] * images.count()
+        for index, image in enumerate(images):
+            threads[index] = self._spawn_thread(crop_image, [image, index])
 
-        :param images: The list of images to stitch together
-        :type images: Union[list[XAImage], XAImageList]
-        :return: The resulting image after stitching
-        :rtype: XAImage
+        while any([t.is_alive() for t in threads]):
+            time.sleep(0.01)
 
-        .. versionadded:: 0.1.1
-        """
-        return macimg.compositions.VerticalStitch().compose(*images)
+        self.modified = True
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(cropped_images)
+        return self
 
-    def edges(self, intensity: float = 1.0) -> "XAImage":
-        """Detects the edges in the image and highlights them colorfully, blackening other areas of the image.
+    def scale(
+        self, scale_factor_x: float, scale_factor_y: Union[float, None] = None
+    ) -> "XAImageList":
+        """Scales each image in the list by the specified horizontal and vertical factors.
 
-        :param intensity: The degree to which edges are highlighted. Higher is brighter. Defaults to 1.0
-        :type intensity: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        :param scale_factor_x: The factor by which to scale each image in the X dimension
+        :type scale_factor_x: float
+        :param scale_factor_y: The factor by which to scale each image in the Y dimension, or None to match the horizontal factor, defaults to None
+        :type scale_factor_y: Union[float, None]
+        :return: The list of scaled images
+        :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        return macimg.filters.Edges(intensity).apply_to(self)
-
-    def gaussian_blur(self, intensity: float = 10) -> "XAImage":
-        """Blurs the image using a Gaussian filter.
+        if scale_factor_y is None:
+            scale_factor_y = scale_factor_x
 
-        :param intensity: The strength of the blur effect, defaults to 10
-        :type intensity: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        images = self.__partial_init()
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.GaussianBlur(intensity).apply_to(self)
+        scaled_images = [None] * self.xa_elem.count()
 
-    def reduce_noise(
-        self, noise_level: float = 0.02, sharpness: float = 0.4
-    ) -> "XAImage":
-        """Reduces noise in the image by sharpening areas with a luminance delta below the specified noise level threshold.
+        def scale_image(image, index):
+            scaled_image = AppKit.NSImage.alloc().initWithSize_(
+                AppKit.NSMakeSize(
+                    image.size().width * scale_factor_x,
+                    image.size().height * scale_factor_y,
+                )
+            )
+            imageBounds = AppKit.NSMakeRect(
+                0, 0, image.size().width, image.size().height
+            )
 
-        :param noise_level: The threshold for luminance changes in an area below which will be considered noise, defaults to 0.02
-        :type noise_level: float
-        :param sharpness: The sharpness of the resulting image, defaults to 0.4
-        :type sharpness: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+            transform = AppKit.NSAffineTransform.alloc().init()
+            transform.scaleXBy_yBy_(scale_factor_x, scale_factor_y)
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.NoiseReduction(noise_level, sharpness).apply_to(self)
+            scaled_image.lockFocus()
+            transform.concat()
+            image.drawInRect_fromRect_operation_fraction_(
+                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
+            )
+            scaled_image.unlockFocus()
+            scaled_images[index] = scaled_image
 
-    def pixellate(self, pixel_size: float = 8.0) -> "XAImage":
-        """Pixellates the image.
+        threads = [None] * self.xa_elem.count()
+        for index, image in enumerate(images):
+            threads[index] = self._spawn_thread(scale_image, [image, index])
 
-        :param pixel_size: The size of the pixels, defaults to 8.0
-        :type pixel_size: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        while any([t.is_alive() for t in threads]):
+            time.sleep(0.01)
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.Pixellate(pixel_size).apply_to(self)
+        self.modified = True
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(scaled_images)
+        return self
 
-    def outline(self, threshold: float = 0.1) -> "XAImage":
-        """Outlines detected edges within the image in black, leaving the rest transparent.
+    def resize(self, width: int, height: Union[int, None] = None) -> "XAImageList":
+        """Resizes each image in the list to the specified width and height.
 
-        :param threshold: The threshold to use when separating edge and non-edge pixels. Larger values produce thinner edge lines. Defaults to 0.1
-        :type threshold: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        :param width: The width of the resulting images
+        :type width: int
+        :param height: The height of the resulting images, or None to maintain width:height proportions, defaults to None
+        :type height: Union[int, None]
+        :return: The list of scaled images
+        :rtype: XAImageList
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.1.1
         """
-        return macimg.filters.Outline(threshold).apply_to(self)
+        images = self.__partial_init()
 
-    def invert(self) -> "XAImage":
-        """Inverts the color of the image.
+        scaled_images = [None] * self.xa_elem.count()
 
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        def scale_image(image, index):
+            nonlocal height
+            img_width = image.size().width
+            img_height = image.size().height
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.Invert().apply_to(self)
+            if height is None:
+                height = img_height
 
-    def sepia(self, intensity: float = 1.0) -> "XAImage":
-        """Applies a sepia filter to the image; maps all colors of the image to shades of brown.
+            scaled_image = AppKit.NSImage.alloc().initWithSize_(
+                AppKit.NSMakeSize(
+                    img_width * width / img_width, img_height * height / img_height
+                )
+            )
+            imageBounds = AppKit.NSMakeRect(
+                0, 0, image.size().width, image.size().height
+            )
 
-        :param intensity: The opacity of the sepia effect. A value of 0 will have no impact on the image. Defaults to 1.0
-        :type intensity: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+            transform = AppKit.NSAffineTransform.alloc().init()
+            transform.scaleXBy_yBy_(width / img_width, height / img_height)
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.Sepia(intensity).apply_to(self)
+            scaled_image.lockFocus()
+            transform.concat()
+            image.drawInRect_fromRect_operation_fraction_(
+                imageBounds, Quartz.CGRectZero, AppKit.NSCompositingOperationCopy, 1.0
+            )
+            scaled_image.unlockFocus()
+            scaled_images[index] = scaled_image
 
-    def vignette(self, intensity: float = 1.0) -> "XAImage":
-        """Applies vignette shading to the corners of the image.
+        threads = [None] * self.xa_elem.count()
+        for index, image in enumerate(images):
+            threads[index] = self._spawn_thread(scale_image, [image, index])
 
-        :param intensity: The intensity of the vignette effect, defaults to 1.0
-        :type intensity: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        while any([t.is_alive() for t in threads]):
+            time.sleep(0.01)
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.Vignette(intensity).apply_to(self)
+        self.modified = True
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(scaled_images)
+        return self
 
-    def depth_of_field(
+    def pad(
         self,
-        focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None] = None,
-        intensity: float = 10.0,
-        focal_region_saturation: float = 1.5,
-    ) -> "XAImage":
-        """Applies a depth of field filter to the image, simulating a tilt & shift effect.
+        horizontal_border_width: int = 50,
+        vertical_border_width: int = 50,
+        pad_color: Union["XAColor", None] = None,
+    ) -> "XAImageList":
+        """Pads each image in the list with the specified color; add a border around each image in the list with the specified vertical and horizontal width.
 
-        :param focal_region: Two points defining a line within the image to focus the effect around (pixels around the line will be in focus), or None to use the center third of the image, defaults to None
-        :type focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None]
-        :param intensity: Controls the amount of distance around the focal region to keep in focus. Higher values decrease the distance before the out-of-focus effect starts. Defaults to 10.0
-        :type intensity: float
-        :param focal_region_saturation: Adjusts the saturation of the focial region. Higher values increase saturation. Defaults to 1.5 (1.5x default saturation)
-        :type focal_region_saturation: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        :param horizontal_border_width: The border width, in pixels, in the x-dimension, defaults to 50
+        :type horizontal_border_width: int
+        :param vertical_border_width: The border width, in pixels, in the y-dimension, defaults to 50
+        :type vertical_border_width: int
+        :param pad_color: The color of the border, or None for a white border, defaults to None
+        :type pad_color: Union[XAColor, None]
+        :return: The list of padded images
+        :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        return macimg.filters.DepthOfField(
-            focal_region, intensity, focal_region_saturation
-        ).apply_to(self)
+        if pad_color is None:
+            # No color provided -- use white by default
+            pad_color = _xa_graphics().XAColor.white()
 
-    def crystallize(self, crystal_size: float = 20.0) -> "XAImage":
-        """Applies a crystallization filter to the image. Creates polygon-shaped color blocks by aggregating pixel values.
+        images = self.__partial_init()
 
-        :param crystal_size: The radius of the crystals, defaults to 20.0
-        :type crystal_size: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        padded_images = [None] * images.count()
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.Crystallize(crystal_size).apply_to(self)
+        def pad_image(image, index):
+            new_width = image.size().width + horizontal_border_width * 2
+            new_height = image.size().height + vertical_border_width * 2
+            color_swatch = pad_color.make_swatch(new_width, new_height)
+
+            color_swatch.xa_elem.lockFocus()
+            bounds = AppKit.NSMakeRect(
+                horizontal_border_width,
+                vertical_border_width,
+                image.size().width,
+                image.size().height,
+            )
+            image.drawInRect_(bounds)
+            color_swatch.xa_elem.unlockFocus()
+            padded_images[index] = color_swatch.xa_elem
 
-    def comic(self) -> "XAImage":
-        """Applies a comic filter to the image. Outlines edges and applies a color halftone effect.
+        threads = [None] * images.count()
+        for index, image in enumerate(images):
+            threads[index] = self._spawn_thread(pad_image, [image, index])
 
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        while any([t.is_alive() for t in threads]):
+            time.sleep(0.01)
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.Comic().apply_to(self)
+        self.modified = True
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(padded_images)
+        return self
 
-    def pointillize(self, point_size: float = 20.0) -> "XAImage":
-        """Applies a pointillization filter to the image.
+    def overlay_image(
+        self,
+        image: "XAImage",
+        location: Union[tuple[int, int], None] = None,
+        size: Union[tuple[int, int], None] = None,
+    ) -> "XAImageList":
+        """Overlays an image on top of each image in the list, at the specified location, with the specified size.
 
-        :param crystal_size: The radius of the points, defaults to 20.0
-        :type crystal_size: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        :param image: The image to overlay on top of each image in the list
+        :type image: XAImage
+        :param location: The bottom-left point of the overlaid image in the results, or None to use the bottom-left point of each background image, defaults to None
+        :type location: Union[tuple[int, int], None]
+        :param size: The width and height of the overlaid image, or None to use the overlaid's images existing width and height, or (-1, -1) to use the dimensions of each background images, defaults to None
+        :type size: Union[tuple[int, int], None]
+        :return: The list of images with the specified image overlaid on top of them
+        :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        return macimg.filters.Pointillize(point_size).apply_to(self)
+        if location is None:
+            # No location provided -- use the bottom-left point of the background image by default
+            location = (0, 0)
 
-    def bloom(self, intensity: float = 0.5) -> "XAImage":
-        """Applies a bloom effect to the image. Softens edges and adds a glow.
+        images = self.__partial_init()
+        overlayed_images = [None] * images.count()
 
-        :param intensity: The strength of the softening and glow effects, defaults to 0.5
-        :type intensity: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        def overlay_image(img, index, image, size, location):
+            if size is None:
+                # No dimensions provided -- use size of overlay image by default
+                size = image.size
+            elif size == (-1, -1):
+                # Use remaining width/height of background image
+                size = (img.size().width - location[0], img.size().height - location[1])
+            elif size[0] == -1:
+                # Use remaining width of background image + provided height
+                size = (img.size().width - location[0], size[1])
+            elif size[1] == -1:
+                # Use remaining height of background image + provided width
+                size = (size[1], img.size().width - location[1])
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.Bloom(intensity).apply_to(self)
+            img.lockFocus()
+            bounds = AppKit.NSMakeRect(location[0], location[1], size[0], size[1])
+            image.xa_elem.drawInRect_(bounds)
+            img.unlockFocus()
+            overlayed_images[index] = img
 
-    def monochrome(self, color: XAColor, intensity: float = 1.0) -> "XAImage":
-        """Remaps the colors of the image to shades of the specified color.
+        threads = [None] * images.count()
+        for index, img in enumerate(images):
+            threads[index] = self._spawn_thread(
+                overlay_image, [img, index, image, size, location]
+            )
 
-        :param color: The color of map the image's colors to
-        :type color: XAColor
-        :param intensity: The strength of recoloring effect. Higher values map colors to darker shades of the provided color. Defaults to 1.0
-        :type intensity: float
-        :return: The resulting image after applying the filter
-        :rtype: XAImage
+        while any([t.is_alive() for t in threads]):
+            time.sleep(0.01)
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.Monochrome(color, intensity).apply_to(self)
+        self.modified = True
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(overlayed_images)
+        return self
 
-    def bump(
+    def overlay_text(
         self,
-        center: Union[tuple[int, int], None] = None,
-        radius: float = 300.0,
-        curvature: float = 0.5,
-    ) -> "XAImage":
-        """Creates a concave (inward) or convex (outward) bump at the specified location within the image.
+        text: str,
+        location: Union[tuple[int, int], None] = None,
+        font_size: float = 12,
+        font_color: Union["XAColor", None] = None,
+    ) -> "XAImageList":
+        """Overlays text of the specified size and color at the provided location within each image of the list.
 
-        :param center: The center point of the effect, or None to use the center of the image, defaults to None
-        :type center: Union[tuple[int, int], None]
-        :param radius: The radius of the bump in pixels, defaults to 300.0
-        :type radius: float
-        :param curvature: Controls the direction and intensity of the bump's curvature. Positive values create convex bumps while negative values create concave bumps. Defaults to 0.5
-        :type curvature: float
-        :return: The resulting image after applying the distortion
-        :rtype: XAImage
+        :param text: The text to overlay onto each image of the list
+        :type text: str
+        :param location: The bottom-left point of the start of the text, or None to use (5, 5), defaults to None
+        :type location: Union[tuple[int, int], None]
+        :param font_size: The font size, in pixels, of the text, defaults to 12
+        :type font_size: float
+        :param font_color: The color of the text, or None to use black, defaults to None
+        :type font_color: XAColor
+        :return: The list of images with the specified text overlaid on top of them
+        :rtype: XAImageList
 
         .. versionadded:: 0.1.0
         """
-        return macimg.distortions.Bump(center, radius, curvature).apply_to(self)
+        if location is None:
+            # No location provided -- use (5, 5) by default
+            location = (5, 5)
 
-    def pinch(
-        self, center: Union[tuple[int, int], None] = None, intensity: float = 0.5
-    ) -> "XAImage":
-        """Creates an inward pinch distortion at the specified location within the image.
+        if font_color is None:
+            # No color provided -- use black by default
+            font_color = _xa_graphics().XAColor.black()
 
-        :param center: The center point of the effect, or None to use the center of the image, defaults to None
-        :type center: Union[tuple[int, int], None]
-        :param intensity: Controls the scale of the pinch effect. Higher values stretch pixels away from the specified center to a greater degree. Defaults to 0.5
-        :type intensity: float
-        :return: The resulting image after applying the distortion
-        :rtype: XAImage
+        font = AppKit.NSFont.userFontOfSize_(font_size)
+        images = self.__partial_init()
+        overlayed_images = [None] * self.xa_elem.count()
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.distortions.Pinch(center, intensity).apply_to(self)
+        def overlay_text(image, index):
+            textRect = Quartz.CGRectMake(
+                location[0], 0, image.size().width - location[0], location[1]
+            )
+            attributes = {
+                AppKit.NSFontAttributeName: font,
+                AppKit.NSForegroundColorAttributeName: font_color.xa_elem,
+            }
 
-    def twirl(
-        self,
-        center: Union[tuple[int, int], None] = None,
-        radius: float = 300.0,
-        angle: float = 3.14,
-    ) -> "XAImage":
-        """Creates a twirl distortion by rotating pixels around the specified location within the image.
+            image.lockFocus()
+            AppKit.NSString.alloc().initWithString_(text).drawInRect_withAttributes_(
+                textRect, attributes
+            )
+            image.unlockFocus()
+            overlayed_images[index] = image
 
-        :param center: The center point of the effect, or None to use the center of the image, defaults to None
-        :type center: Union[tuple[int, int], None]
-        :param radius: The pixel radius around the centerpoint that defines the area to apply the effect to, defaults to 300.0
-        :type radius: float
-        :param angle: The angle of the twirl in radians, defaults to 3.14
-        :type angle: float
-        :return: The resulting image after applying the distortion
-        :rtype: XAImage
+        threads = [None] * self.xa_elem.count()
+        for index, image in enumerate(images):
+            threads[index] = self._spawn_thread(overlay_text, [image, index])
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.distortions.Twirl(center, radius, angle).apply_to(self)
+        while any([t.is_alive() for t in threads]):
+            time.sleep(0.01)
 
-    def auto_enhance(
-        self,
-        correct_red_eye: bool = False,
-        crop_to_features: bool = False,
-        correct_rotation: bool = False,
-    ) -> "XAImage":
-        """Attempts to enhance the image by applying suggested filters.
+        self.modified = True
+        self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(overlayed_images)
+        return self
 
-        :param correct_red_eye: Whether to attempt red eye removal, defaults to False
-        :type correct_red_eye: bool, optional
-        :param crop_to_features: Whether to crop the image to focus on the main features with it, defaults to False
-        :type crop_to_features: bool, optional
-        :param correct_rotation: Whether attempt perspective correction by rotating the image, defaults to False
-        :type correct_rotation: bool, optional
-        :return: The resulting image after applying the enchantments
-        :rtype: XAImage
+    def extract_text(self) -> list[str]:
+        """Extracts and returns a list of all visible text in each image of the list.
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.filters.AutoEnhance(
-            correct_red_eye, crop_to_features, correct_rotation
-        ).apply_to(self)
+        :return: The array of extracted text strings
+        :rtype: list[str]
 
-    def flip_horizontally(self) -> "XAImage":
-        """Flips the image horizontally.
+        :Example:
 
-        :return: The image object, modifications included
-        :rtype: XAImage
+        >>> import PyXA
+        >>> test = PyXA.XAImage("/Users/ExampleUser/Downloads/Example.jpg")
+        >>> print(test.extract_text())
+        ["HERE'S TO THE", 'CRAZY ONES', 'the MISFITS the REBELS', 'THE TROUBLEMAKERS', ...]
 
         .. versionadded:: 0.1.0
         """
-        return macimg.transforms.Flip("horizontal").apply_to(self)
-
-    def flip_vertically(self) -> "XAImage":
-        """Flips the image vertically.
-
-        :return: The image object, modifications included
-        :rtype: XAImage
+        images = self.__partial_init()
+        import Vision
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.transforms.Flip("vertical").apply_to(self)
+        extracted_strings = [None] * self.xa_elem.count()
 
-    def rotate(self, degrees: float) -> "XAImage":
-        """Rotates the image clockwise by the specified number of degrees.
+        def get_text(image, index):
+            # Prepare CGImage
+            ci_image = Quartz.CIImage.imageWithCGImage_(image.CGImage())
+            context = Quartz.CIContext.alloc().initWithOptions_(None)
+            img = context.createCGImage_fromRect_(ci_image, ci_image.extent())
 
-        :param degrees: The number of degrees to rotate the image by
-        :type degrees: float
-        :return: The image object, modifications included
-        :rtype: XAImage
+            # Handle request completion
+            image_strings = []
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.transforms.Rotate(degrees).apply_to(self)
+            def recognize_text_handler(request, error):
+                observations = request.results()
+                for observation in observations:
+                    recognized_strings = observation.topCandidates_(1)[0].string()
+                    image_strings.append(recognized_strings)
 
-    def crop(
-        self, size: tuple[int, int], corner: tuple[int, int] = (0, 0)
-    ) -> "XAImage":
-        """Crops the image to the specified dimensions.
+            # Perform request and return extracted text
+            request = Vision.VNRecognizeTextRequest.alloc().initWithCompletionHandler_(
+                recognize_text_handler
+            )
+            request_handler = (
+                Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(img, None)
+            )
+            request_handler.performRequests_error_([request], None)
+            extracted_strings[index] = image_strings
 
-        :param size: The width and height of the resulting image
-        :type size: tuple[int, int]
-        :param corner: The bottom-left corner location from which to crop the image, defaults to (0, 0)
-        :type corner: tuple[int, int], optional
-        :return: The image object, modifications included
-        :rtype: XAImage
+        threads = [None] * self.xa_elem.count()
+        for index, image in enumerate(images):
+            threads[index] = self._spawn_thread(get_text, [image, index])
 
-        .. versionadded:: 0.1.0
-        """
-        return macimg.transforms.Crop(size, corner).apply_to(self)
+        while any([t.is_alive() for t in threads]):
+            time.sleep(0.01)
 
-    def scale(
-        self, scale_factor_x: float, scale_factor_y: Union[float, None] = None
-    ) -> "XAImage":
-        """Scales the image by the specified horizontal and vertical factors.
+        return extracted_strings
 
-        :param scale_factor_x: The factor by which to scale the image in the X dimension
-        :type scale_factor_x: float
-        :param scale_factor_y: The factor by which to scale the image in the Y dimension, or None to match the horizontal factor, defaults to None
-        :type scale_factor_y: Union[float, None]
-        :return: The image object, modifications included
-        :rtype: XAImage
+    def show_in_preview(self):
+        """Opens each image in the list in Preview.
 
         .. versionadded:: 0.1.0
         """
-        return macimg.transforms.Scale(scale_factor_x, scale_factor_y).apply_to(self)
-
-    def resize(self, width: int, height: Union[int, None] = None) -> "XAImage":
-        """Resizes the image to the specified width and height.
-
-        :param width: The width of the resulting image, in pixels
-        :type width: int
-        :param height: The height of the resulting image, in pixels, or None to maintain width:height proportions, defaults to None
-        :type height: Union[int, None]
-        :return: The image object, modifications included
-        :rtype: XAImage
-
-        .. versionadded:: 0.1.1
-        """
-        return macimg.transforms.Resize(width, height).apply_to(self)
+        for image in self:
+            image.show_in_preview()
 
-    def save(self, file_path: Union[XAPath, str, None] = None):
-        """Saves the image to a file on the disk. Saves to the original file (if there was one) by default.
+    def save(self, file_paths: list[Union[XAPath, str]]):
+        """Saves each image to a file on the disk.
 
         :param file_path: The path at which to save the image file. Any existing file at that location will be overwritten, defaults to None
         :type file_path: Union[XAPath, str, None]
 
         .. versionadded:: 0.1.0
         """
-        if isinstance(file_path, XAPath):
-            file_path = file_path.path
-        super().save(file_path)
+        for index, image in enumerate(self):
+            path = None
+            if len(file_paths) > index:
+                path = file_paths[index]
+            image.save(path)
 
-    def get_clipboard_representation(self) -> "AppKit.NSImage":
-        """Gets a clipboard-codable representation of the iimage.
+    def get_clipboard_representation(self) -> list["AppKit.NSImage"]:
+        """Gets a clipboard-codable representation of each image in the list.
 
-        When the clipboard content is set to an image, the image itself, including any modifications, is added to the clipboard. Pasting will then insert the image into the active document.
+        When the clipboard content is set to a list of image, the raw data of each image is added to the clipboard. You can then
 
-        :return: The raw NSImage object for this XAIMage
-        :rtype: AppKit.NSImage
+        :return: A list of media item file URLs
+        :rtype: list[NSURL]
 
-        .. versionadded:: 0.1.0
+        .. versionadded:: 0.0.8
         """
-        return self._nsimage
-
-    def __eq__(self, other):
-        return (
-            isinstance(other, XAImage)
-            and self._nsimage.TIFFRepresentation()
-            == other._nsimage.TIFFRepresentation()
-        )
+        data = []
+        for image in self.__partial_init():
+            if image.TIFFRepresentation():
+                data.append(image)
+        return data
 
 
 class XASoundList(XAList, XAClipboardCodable):
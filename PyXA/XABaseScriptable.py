@@ -1,15 +1,43 @@
+import re
+from contextlib import contextmanager
 from enum import Enum
-from typing import Union
+from typing import Any, Iterator, Union
 import threading
 import AppKit
 import ScriptingBridge
 
 from PyXA import XABase
+from PyXA import XABackends
 
 import time
 
 from .XAProtocols import XACloseable
-from .XATypes import XARectangle
+from .XATypes import XABatchResult, XARectangle
+
+
+# Properties whose ScriptingBridge selectors are renamed to avoid clashing with NSObject methods
+_XA_RENAMED_TERMS = {
+    "objectDescription": "description",
+    "objectClass": "class",
+}
+
+
+def _xa_applescript_term(name: str) -> str:
+    """Gets the AppleScript term of a property or class from its ScriptingBridge selector, e.g. "played count" for playedCount, or from its snake_case name.
+
+    Acronyms remain single words, e.g. "persistent ID" for persistentID and "URL" for URL. Names that are already terms, i.e. that contain spaces or raw codes, are returned unchanged.
+
+    .. versionadded:: 0.3.1
+    """
+    if " " in name or "«" in name:
+        return name
+
+    selector = XABase.camelize(name) if "_" in name else name
+    if selector in _XA_RENAMED_TERMS:
+        return _XA_RENAMED_TERMS[selector]
+
+    words = re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z0-9]+", selector)
+    return " ".join(word if word.isupper() else word.lower() for word in words)
 
 
 class XASBPrintable(XABase.XAObject):
@@ -128,12 +156,347 @@ class XASBApplication(XABase.XAApplication):
             return self._new_element([], XASBWindowList)
 
     def set_property(self, property_name, value):
+        batch = XABase._xa_recording_batch(self)
+        if batch is not None:
+            batch.set_property(self, property_name, value)
+            return self
+
         if "_" in property_name:
             parts = property_name.split("_")
             titled_parts = [part.title() for part in parts[1:]]
             property_name = parts[0] + "".join(titled_parts)
         self.xa_scel.setValue_forKey_(value, property_name)
 
+        if self.xa_cache is not None:
+            self.xa_cache.invalidate(self.xa_elem)
+
+    @contextmanager
+    def batch(self) -> Iterator["XASBBatch"]:
+        """Records changes made to this application's scripting objects within a `with` block, then sends them all at once as a single compiled AppleScript when the block exits.
+
+        Calls to :func:`XABase.XAObject.set_property`, :func:`XABase.XAObject.set_properties`, and the `delete()` methods of the application's objects are recorded automatically, as are calls to their `move_to()` methods with PyXA objects as destinations. Other methods that change the application's objects, such as `duplicate()`, `add()`, and :func:`XABase.XAList.push`, raise a RuntimeError within the block rather than running ahead of the recorded operations; these operations, as well as making new objects, can be recorded using the methods of the yielded :class:`XASBBatch`. If the block raises an exception, the recorded operations are discarded.
+
+        :yield: The batch recording the changes
+        :rtype: Iterator[XASBBatch]
+
+        :Example: Complete several reminders and delete another
+
+        >>> import PyXA
+        >>> app = PyXA.Reminders()
+        >>> reminders = app.reminders()
+        >>> with app.batch() as batch:
+        ...     for reminder in reminders[:10]:
+        ...         reminder.completed = True
+        ...     batch.delete(reminders[10])
+        >>> print(batch.results[0])
+        XABatchResult(operation='set completed of XARemindersReminder', result=None, error=None)
+
+        .. versionadded:: 0.3.1
+        """
+        batch = XASBBatch(self)
+        previous_batch = getattr(XABase._xa_batches, "current", None)
+        XABase._xa_batches.current = batch
+        try:
+            yield batch
+        finally:
+            XABase._xa_batches.current = previous_batch
+        batch.flush()
+
+
+class XASBBatch:
+    """A queue of changes to an application's scripting objects that are sent together as a single compiled AppleScript.
+
+    Objects and values are passed to the script as typed arguments rather than being written into its source. Each operation runs in its own `try` block, so a failing operation does not prevent later operations from running.
+
+    .. seealso:: :func:`XASBApplication.batch`
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, application: XASBApplication):
+        """Creates a new batch for the given application.
+
+        :param application: The application whose objects the batch changes
+        :type application: XASBApplication
+
+        .. versionadded:: 0.3.1
+        """
+        self.application = application  #: The application whose objects the batch changes
+        self.results: list[XABatchResult] = []  #: The outcome of each operation in the most recently sent batch
+        self.__operations: list[tuple[str, str, list[Any], bool]] = []
+        self.__targets: list[XABase.XAObject] = []
+
+    def records(self, xa_object: XABase.XAObject) -> bool:
+        """Whether changes to the given object are recorded in this batch, i.e. whether the object is a scripting object belonging to the batch's application.
+
+        :param xa_object: The object to check
+        :type xa_object: XABase.XAObject
+        :return: True if changes to the object are recorded
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """
+        if xa_object is self.application:
+            return True
+
+        app_ref = getattr(xa_object, "xa_aref", None)
+        return (
+            app_ref is not None
+            and hasattr(xa_object.xa_elem, "qualifiedSpecifier")
+            and app_ref.processIdentifier()
+            == self.application.xa_elem.processIdentifier()
+        )
+
+    def set_property(
+        self, target: XABase.XAObject, property_name: str, value: Any
+    ) -> "XASBBatch":
+        """Records a change to the value of a property of an object.
+
+        :param target: The object to change
+        :type target: XABase.XAObject
+        :param property_name: The name of the property, e.g. "played_count", or its AppleScript term, e.g. "played count"
+        :type property_name: str
+        :param value: The new value of the property
+        :type value: Any
+        :return: The batch object
+        :rtype: XASBBatch
+
+        .. versionadded:: 0.3.1
+        """
+        term = self.__term(property_name)
+        return self.__add(
+            f"set {term} of {self.__describe(target)}",
+            "set " + term + " of {0} to {1}",
+            [target, value],
+            target=target,
+        )
+
+    def set_properties(
+        self, target: XABase.XAObject, properties: dict[str, Any]
+    ) -> "XASBBatch":
+        """Records a change to the values of several properties of an object.
+
+        :param target: The object to change
+        :type target: XABase.XAObject
+        :param properties: A dictionary of property names and new values
+        :type properties: dict[str, Any]
+        :return: The batch object
+        :rtype: XASBBatch
+
+        .. versionadded:: 0.3.1
+        """
+        terms = [self.__term(name) for name in properties]
+        statements = [
+            "set " + term + " of {0} to {" + str(index + 1) + "}"
+            for index, term in enumerate(terms)
+        ]
+        return self.__add(
+            f"set {', '.join(terms)} of {self.__describe(target)}",
+            "\n".join(statements),
+            [target, *properties.values()],
+            target=target,
+        )
+
+    def delete(self, target: XABase.XAObject) -> "XASBBatch":
+        """Records the deletion of an object.
+
+        :param target: The object to delete
+        :type target: XABase.XAObject
+        :return: The batch object
+        :rtype: XASBBatch
+
+        .. versionadded:: 0.3.1
+        """
+        return self.__add(
+            f"delete {self.__describe(target)}", "delete {0}", [target], target=target
+        )
+
+    def move(self, target: XABase.XAObject, destination: Any) -> "XASBBatch":
+        """Records moving an object to a new location.
+
+        :param target: The object to move
+        :type target: XABase.XAObject
+        :param destination: The location to move the object to, e.g. a container object
+        :type destination: Any
+        :return: The batch object
+        :rtype: XASBBatch
+
+        .. versionadded:: 0.3.1
+        """
+        return self.__add(
+            f"move {self.__describe(target)} to {self.__describe(destination)}",
+            "move {0} to {1}",
+            [target, destination],
+            target=target,
+        )
+
+    def make(
+        self,
+        class_name: str,
+        location: Any = None,
+        properties: Union[dict[str, Any], None] = None,
+    ) -> "XASBBatch":
+        """Records the creation of a new object. The result of the operation is the object specifier of the new object.
+
+        :param class_name: The name of the class of object to make, e.g. "reminder", or its AppleScript term
+        :type class_name: str
+        :param location: The location at which to make the object, defaults to None
+        :type location: Any, optional
+        :param properties: A dictionary of property names and values to make the object with, defaults to None
+        :type properties: Union[dict[str, Any], None], optional
+        :return: The batch object
+        :rtype: XASBBatch
+
+        .. versionadded:: 0.3.1
+        """
+        args = []
+        statement = "make new " + self.__term(class_name)
+        if location is not None:
+            statement += " at {0}"
+            args.append(location)
+
+        if properties:
+            values = []
+            for name, value in properties.items():
+                values.append(self.__term(name) + ":{" + str(len(args)) + "}")
+                args.append(value)
+            statement += " with properties {{" + ", ".join(values) + "}}"
+
+        return self.__add(f"make new {class_name}", statement, args, returns=True)
+
+    def add(self, statement: str, *args: Any, returns: bool = False) -> "XASBBatch":
+        """Records an arbitrary AppleScript statement, run within a `tell` block targeting the application.
+
+        Arguments are referenced in the statement using numbered placeholders, e.g. `{0}`, and are passed to the script as typed values. Literal braces must be doubled.
+
+        :param statement: The AppleScript statement
+        :type statement: str
+        :param returns: Whether the statement is an expression whose value should be used as the result of the operation, defaults to False
+        :type returns: bool, optional
+        :return: The batch object
+        :rtype: XASBBatch
+
+        :Example:
+
+        >>> import PyXA
+        >>> app = PyXA.Notes()
+        >>> with app.batch() as batch:
+        ...     batch.add("count notes of {0}", app.folders()[0], returns=True)
+        >>> print(batch.results[0].result)
+        12
+
+        .. versionadded:: 0.3.1
+        """
+        return self.__add(statement, statement, list(args), returns=returns)
+
+    def flush(self) -> list[XABatchResult]:
+        """Sends all recorded operations to the application as a single compiled AppleScript, then clears the batch.
+
+        :raises AppleScriptError: The script failed to compile, e.g. because a term is not defined by the application
+        :return: The outcome of each operation, in the order they were recorded
+        :rtype: list[XABatchResult]
+
+        .. versionadded:: 0.3.1
+        """
+        operations = self.__operations
+        targets = self.__targets
+        self.__operations = []
+        self.__targets = []
+        if len(operations) == 0:
+            self.results = []
+            return self.results
+
+        args = []
+        blocks = []
+        for _, statement, operation_args, returns in operations:
+            placeholders = []
+            for arg in operation_args:
+                if arg is self.application:
+                    # The application is the target of the tell block
+                    placeholders.append("it")
+                else:
+                    args.append(arg)
+                    placeholders.append(f"(item {len(args)} of pyxa_args)")
+
+            statement = statement.format(*placeholders)
+            if returns:
+                statement = f"set pyxa_result to ({statement})"
+
+            blocks.append(
+                "\n".join(
+                    [
+                        "try",
+                        "set pyxa_result to missing value",
+                        statement,
+                        "set end of pyxa_results to {true, pyxa_result}",
+                        "on error pyxa_message number pyxa_number",
+                        "set end of pyxa_results to {false, pyxa_number, pyxa_message}",
+                        "end try",
+                    ]
+                )
+            )
+
+        script = XABase.AppleScript(
+            [
+                "on pyxa_batch(pyxa_args)",
+                "set pyxa_results to {}",
+                f'tell application id "{self.application.xa_elem.bundleIdentifier()}"',
+                *blocks,
+                "end tell",
+                "return pyxa_results",
+                "end pyxa_batch",
+            ]
+        )
+
+        try:
+            result = script.call("pyxa_batch", [args])
+        finally:
+            for target in targets:
+                if target.xa_cache is not None:
+                    target.xa_cache.invalidate(target.xa_elem)
+
+        from PyXA import XAEvents
+
+        self.results = []
+        for (description, _, _, _), outcome in zip(
+            operations, XAEvents.value_from_event(result["event"])
+        ):
+            if outcome[0]:
+                self.results.append(XABatchResult(description, outcome[1], None))
+            else:
+                self.results.append(
+                    XABatchResult(description, None, f"{outcome[2]} ({outcome[1]})")
+                )
+        return self.results
+
+    def __add(
+        self,
+        description: str,
+        statement: str,
+        args: list[Any],
+        returns: bool = False,
+        target: Union[XABase.XAObject, None] = None,
+    ) -> "XASBBatch":
+        self.__operations.append((description, statement, args, returns))
+        if target is not None:
+            self.__targets.append(target)
+        return self
+
+    def __describe(self, value: Any) -> str:
+        # Avoid repr(), which would send a request for the object's name
+        if isinstance(value, XABase.XAObject):
+            return type(value).__name__
+        return repr(value)
+
+    def __term(self, name: str) -> str:
+        return _xa_applescript_term(name)
+
+    def __len__(self):
+        return len(self.__operations)
+
+    def __repr__(self):
+        return "<" + str(type(self)) + f"{len(self)} operations>"
+
 
 class XASBWindowList(XABase.XAList):
     """A wrapper around a list of windows.
@@ -149,16 +512,16 @@ class XASBWindowList(XABase.XAList):
             self.xa_ocls = self.xa_prnt.xa_wcls
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def bounds(self) -> list[XARectangle]:
-        ls = self.xa_elem.arrayByApplyingSelector_("bounds") or []
+        ls = XABackends.element_values(self.xa_elem, "bounds") or []
         return [
             XARectangle(
                 value.rectValue().origin.x,
@@ -170,25 +533,25 @@ class XASBWindowList(XABase.XAList):
         ]
 
     def closeable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("closeable") or [])
+        return list(XABackends.element_values(self.xa_elem, "closeable") or [])
 
     def resizable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("resizable") or [])
+        return list(XABackends.element_values(self.xa_elem, "resizable") or [])
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def zoomable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomable") or [])
+        return list(XABackends.element_values(self.xa_elem, "zoomable") or [])
 
     def zoomed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomed") or [])
+        return list(XABackends.element_values(self.xa_elem, "zoomed") or [])
 
     def miniaturizable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("miniaturizable") or [])
+        return list(XABackends.element_values(self.xa_elem, "miniaturizable") or [])
 
     def miniaturized(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("miniaturized") or [])
+        return list(XABackends.element_values(self.xa_elem, "miniaturized") or [])
 
     def by_name(self, name: str) -> Union["XASBWindow", None]:
         return self.by_property("name", name)
@@ -284,23 +647,14 @@ class XASBWindow(XABase.XAObject, XACloseable):
                 parent = parent.xa_prnt
 
     def __getattr__(self, attr):
-        attributes = [
-            x
-            for y in [
-                cls.__dict__.keys()
-                for cls in self.__class__.__mro__
-                if cls.__name__ != "object"
-            ]
-            for x in y
-        ]
-        if attr in attributes:
-            # If possible, use PyXA attribute
-            return super().__getattribute__(attr)
-        else:
-            try:
-                return self.xa_elem.__getattribute__(attr)
-            except Exception as e:
-                raise e
+        fallback_names = XABase._xa_fallback_attributes(self.__class__)
+        if attr not in fallback_names:
+            if attr in XABase._xa_class_attributes(self.__class__):
+                # If possible, use PyXA attribute
+                return super().__getattribute__(attr)
+            fallback_names.add(attr)
+
+        return self.xa_elem.__getattribute__(attr)
 
     @property
     def name(self) -> str:
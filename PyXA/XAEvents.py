@@ -1,3 +1,7 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Union
+
 import ApplicationServices
 
 import objc
@@ -1043,3 +1047,205 @@ def event_from_bool(b: bool) -> ApplicationServices.NSAppleEventDescriptor:
     .. versionadded:: 0.0.4
     """
     return ApplicationServices.NSAppleEventDescriptor.descriptorWithBoolean_(b)
+
+
+kASAppleScriptSuite = OSType("ascr")
+kASSubroutineEvent = OSType("psbr")
+keyASSubroutineName = OSType("snam")
+keyASUserRecordFields = OSType("usrf")
+
+typeSInt32 = OSType("long")
+typeIEEE64BitFloatingPoint = OSType("doub")
+typeBoolean = OSType("bool")
+typeType = OSType("type")
+typeEnumerated = OSType("enum")
+cMissingValue = OSType("msng")
+
+
+def event_from_value(value: Any) -> ApplicationServices.NSAppleEventDescriptor:
+    """Creates an Apple Event descriptor representing the provided Python value.
+
+    Strings, booleans, numbers, dates, file URLs, lists, dictionaries (records), and None (missing value) are converted to their AppleScript equivalents. Enum members are converted according to their values, with integer values treated as enumerated four-character codes. PyXA objects and scripting bridge objects are converted to object specifiers.
+
+    :param value: The value to convert
+    :type value: Any
+    :return: The Apple Event descriptor
+    :rtype: ApplicationServices.NSAppleEventDescriptor
+
+    .. versionadded:: 0.3.1
+    """
+    descriptor_class = ApplicationServices.NSAppleEventDescriptor
+    if isinstance(value, descriptor_class):
+        return value
+
+    if value is None:
+        return descriptor_class.descriptorWithTypeCode_(cMissingValue)
+
+    if isinstance(value, Enum):
+        if isinstance(value.value, int):
+            return descriptor_class.descriptorWithEnumCode_(value.value)
+        return event_from_value(value.value)
+
+    if isinstance(value, bool):
+        return descriptor_class.descriptorWithBoolean_(value)
+
+    if isinstance(value, int):
+        if -(2**31) <= value < 2**31:
+            return descriptor_class.descriptorWithInt32_(value)
+        return descriptor_class.descriptorWithDouble_(float(value))
+
+    if isinstance(value, float):
+        return descriptor_class.descriptorWithDouble_(value)
+
+    if isinstance(value, str):
+        return descriptor_class.descriptorWithString_(value)
+
+    if isinstance(value, (datetime, ApplicationServices.NSDate)):
+        return descriptor_class.descriptorWithDate_(value)
+
+    if isinstance(value, (list, tuple)):
+        descriptor = descriptor_class.listDescriptor()
+        for index, item in enumerate(value):
+            descriptor.insertDescriptor_atIndex_(event_from_value(item), index + 1)
+        return descriptor
+
+    if isinstance(value, dict):
+        # Records with arbitrary labels store their fields as a list of alternating labels and values
+        fields = []
+        for key, item in value.items():
+            fields.extend([str(key), item])
+        descriptor = descriptor_class.recordDescriptor()
+        descriptor.setDescriptor_forKeyword_(
+            event_from_value(fields), keyASUserRecordFields
+        )
+        return descriptor
+
+    if hasattr(value, "xa_elem"):
+        # PyXA objects
+        return event_from_value(value.xa_elem)
+
+    if hasattr(value, "qualifiedSpecifier"):
+        # Scripting bridge objects
+        return value.qualifiedSpecifier()
+
+    if isinstance(value, ApplicationServices.NSURL) and value.isFileURL():
+        return descriptor_class.descriptorWithFileURL_(value)
+
+    return descriptor_class.descriptorWithString_(str(value))
+
+
+def value_from_event(descriptor: ApplicationServices.NSAppleEventDescriptor) -> Any:
+    """Converts an Apple Event descriptor to the equivalent Python value, where one exists.
+
+    Text, booleans, numbers, dates, file URLs, lists, records, and missing values are converted. Record fields with AppleScript-defined labels, such as `name`, are keyed by their four-character codes. Other descriptors, such as object specifiers, are returned as-is.
+
+    :param descriptor: The descriptor to convert
+    :type descriptor: ApplicationServices.NSAppleEventDescriptor
+    :return: The converted value
+    :rtype: Any
+
+    .. versionadded:: 0.3.1
+    """
+    if descriptor is None:
+        return None
+
+    descriptor_type = descriptor.descriptorType()
+    if descriptor_type == typeAEList:
+        return [
+            value_from_event(descriptor.descriptorAtIndex_(index))
+            for index in range(1, descriptor.numberOfItems() + 1)
+        ]
+
+    if descriptor_type == typeAERecord:
+        record = {}
+        for index in range(1, descriptor.numberOfItems() + 1):
+            keyword = descriptor.keywordForDescriptorAtIndex_(index)
+            item = value_from_event(descriptor.descriptorForKeyword_(keyword))
+            if keyword == keyASUserRecordFields:
+                record.update(zip(item[::2], item[1::2]))
+            else:
+                record[keyword.to_bytes(4, "big").decode("mac_roman")] = item
+        return record
+
+    if descriptor_type in (typeBoolean, typeTrue, typeFalse):
+        return bool(descriptor.booleanValue())
+
+    if descriptor_type == typeSInt32:
+        return descriptor.int32Value()
+
+    if descriptor_type == typeIEEE64BitFloatingPoint:
+        return descriptor.doubleValue()
+
+    if descriptor_type == typeLongDateTime:
+        return descriptor.dateValue()
+
+    if descriptor_type == typeFileURL:
+        return descriptor.fileURLValue()
+
+    if descriptor_type == typeType and descriptor.typeCodeValue() == cMissingValue:
+        return None
+
+    if descriptor_type == typeUnicodeText:
+        return descriptor.stringValue()
+
+    return descriptor
+
+
+def run_event(
+    args: Union[list[Any], None] = None
+) -> ApplicationServices.NSAppleEventDescriptor:
+    """Creates an Apple Event that calls the run handler of a compiled AppleScript with the provided arguments, as `osascript` does.
+
+    :param args: The arguments to pass to the run handler, defaults to None
+    :type args: Union[list[Any], None], optional
+    :return: The Apple Event
+    :rtype: ApplicationServices.NSAppleEventDescriptor
+
+    .. versionadded:: 0.3.1
+    """
+    descriptor_class = ApplicationServices.NSAppleEventDescriptor
+    event = descriptor_class.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
+        kCoreEventClass,
+        kAEOpenApplication,
+        descriptor_class.currentProcessDescriptor(),
+        kAutoGenerateReturnID,
+        kAnyTransactionID,
+    )
+    event.setParamDescriptor_forKeyword_(
+        event_from_value(list(args or [])), keyDirectObject
+    )
+    return event
+
+
+def handler_event(
+    handler_name: str, args: Union[list[Any], None] = None
+) -> ApplicationServices.NSAppleEventDescriptor:
+    """Creates an Apple Event that calls a handler of a compiled AppleScript with the provided arguments.
+
+    :param handler_name: The name of the handler to call
+    :type handler_name: str
+    :param args: The arguments to pass to the handler, defaults to None
+    :type args: Union[list[Any], None], optional
+    :return: The Apple Event
+    :rtype: ApplicationServices.NSAppleEventDescriptor
+
+    .. versionadded:: 0.3.1
+    """
+    descriptor_class = ApplicationServices.NSAppleEventDescriptor
+    event = descriptor_class.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
+        kASAppleScriptSuite,
+        kASSubroutineEvent,
+        descriptor_class.currentProcessDescriptor(),
+        kAutoGenerateReturnID,
+        kAnyTransactionID,
+    )
+
+    # Handler names are case-insensitive and are matched in lowercase
+    event.setParamDescriptor_forKeyword_(
+        descriptor_class.descriptorWithString_(handler_name.lower()),
+        keyASSubroutineName,
+    )
+    event.setParamDescriptor_forKeyword_(
+        event_from_value(list(args or [])), keyDirectObject
+    )
+    return event
@@ -0,0 +1,493 @@
+""".. versionadded:: 0.3.1
+
+Color and image classes built on macimg, which :mod:`PyXA.XABase` imports on first use since macimg is slow to import. The classes are available from :mod:`PyXA.XABase` as well.
+"""
+
+from typing import Union
+
+import macimg
+
+import AppKit
+
+from PyXA.XABase import XAImageList, XAObject, XAPath, XAURL, _macimg
+from PyXA.XAProtocols import XAClipboardCodable
+
+
+class XAColor(macimg.Color, XAObject, XAClipboardCodable):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.xa_elem = self._nscolor
+
+    def get_clipboard_representation(self) -> "AppKit.NSColor":
+        """Gets a clipboard-codable representation of the color.
+
+        When the clipboard content is set to a color, the raw color data is added to the clipboard.
+
+        :return: The raw color data
+        :rtype: AppKit.NSColor
+
+        .. versionadded:: 0.1.0
+        """
+        return self.xa_elem
+
+
+class XAImage(macimg.Image, XAObject, XAClipboardCodable):
+    """A wrapper around NSImage with specialized automation methods.
+
+    .. versionadded:: 0.0.2
+    """
+
+    def __init__(
+        self,
+        image_reference: Union[
+            str, XAPath, "AppKit.NSURL", "AppKit.NSImage", None
+        ] = None,
+    ):
+        match image_reference:
+            case {"element": str(ref)}:
+                image_reference = ref
+
+            case {"element": XAImage() as image}:
+                image_reference = image._nsimage
+
+            case {"element": AppKit.NSImage() as image}:
+                image_reference = image
+
+            case XAPath() as path:
+                image_reference = path.path
+
+            case XAURL() as url:
+                image_reference = url.url
+
+            case XAObject():
+                try:
+                    image_reference = image_reference.get_image_representation()
+                except AttributeError:
+                    raise TypeError(
+                        f"{str(type(image_reference))} does not implement the XAImageLike protocol."
+                    )
+
+        super().__init__(image_reference)
+
+    @property
+    def xa_elem(self):
+        return self._nsimage
+
+    def open(
+        *images: Union[str, XAPath, list[Union[str, XAPath]]]
+    ) -> Union["XAImage", XAImageList]:
+        """Initializes one or more images from files.
+
+        :param images: The image(s) to open
+        :type images: Union[str, XAPath, list[Union[str, XAPath]]]
+        :return: The newly created image object, or a list of image objects
+        :rtype: Union[XAImage, XAImageList]
+
+        .. versionadded:: 0.1.0
+        """
+        if len(images) == 1:
+            images = images[0]
+
+        if isinstance(images, list) or isinstance(images, tuple):
+            return XAImageList({"element": images})
+        else:
+            return XAImage(images)
+
+    def horizontal_stitch(images: Union[list["XAImage"], XAImageList]) -> "XAImage":
+        """Horizontally stacks two or more images.
+
+        The first image in the list is placed at the left side of the resulting image.
+
+        :param images: The list of images to stitch together
+        :type images: Union[list[XAImage], XAImageList]
+        :return: The resulting image after stitching
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.1
+        """
+        return _macimg("compositions").HorizontalStitch().compose(*images)
+
+    def vertical_stitch(images: Union[list["XAImage"], XAImageList]) -> "XAImage":
+        """Vertically stacks two or more images.
+
+        The first image in the list is placed at the bottom of the resulting image.
+
+        :param images: The list of images to stitch together
+        :type images: Union[list[XAImage], XAImageList]
+        :return: The resulting image after stitching
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.1
+        """
+        return _macimg("compositions").VerticalStitch().compose(*images)
+
+    def edges(self, intensity: float = 1.0) -> "XAImage":
+        """Detects the edges in the image and highlights them colorfully, blackening other areas of the image.
+
+        :param intensity: The degree to which edges are highlighted. Higher is brighter. Defaults to 1.0
+        :type intensity: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Edges(intensity).apply_to(self)
+
+    def gaussian_blur(self, intensity: float = 10) -> "XAImage":
+        """Blurs the image using a Gaussian filter.
+
+        :param intensity: The strength of the blur effect, defaults to 10
+        :type intensity: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").GaussianBlur(intensity).apply_to(self)
+
+    def reduce_noise(
+        self, noise_level: float = 0.02, sharpness: float = 0.4
+    ) -> "XAImage":
+        """Reduces noise in the image by sharpening areas with a luminance delta below the specified noise level threshold.
+
+        :param noise_level: The threshold for luminance changes in an area below which will be considered noise, defaults to 0.02
+        :type noise_level: float
+        :param sharpness: The sharpness of the resulting image, defaults to 0.4
+        :type sharpness: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").NoiseReduction(noise_level, sharpness).apply_to(self)
+
+    def pixellate(self, pixel_size: float = 8.0) -> "XAImage":
+        """Pixellates the image.
+
+        :param pixel_size: The size of the pixels, defaults to 8.0
+        :type pixel_size: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Pixellate(pixel_size).apply_to(self)
+
+    def outline(self, threshold: float = 0.1) -> "XAImage":
+        """Outlines detected edges within the image in black, leaving the rest transparent.
+
+        :param threshold: The threshold to use when separating edge and non-edge pixels. Larger values produce thinner edge lines. Defaults to 0.1
+        :type threshold: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Outline(threshold).apply_to(self)
+
+    def invert(self) -> "XAImage":
+        """Inverts the color of the image.
+
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Invert().apply_to(self)
+
+    def sepia(self, intensity: float = 1.0) -> "XAImage":
+        """Applies a sepia filter to the image; maps all colors of the image to shades of brown.
+
+        :param intensity: The opacity of the sepia effect. A value of 0 will have no impact on the image. Defaults to 1.0
+        :type intensity: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Sepia(intensity).apply_to(self)
+
+    def vignette(self, intensity: float = 1.0) -> "XAImage":
+        """Applies vignette shading to the corners of the image.
+
+        :param intensity: The intensity of the vignette effect, defaults to 1.0
+        :type intensity: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Vignette(intensity).apply_to(self)
+
+    def depth_of_field(
+        self,
+        focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None] = None,
+        intensity: float = 10.0,
+        focal_region_saturation: float = 1.5,
+    ) -> "XAImage":
+        """Applies a depth of field filter to the image, simulating a tilt & shift effect.
+
+        :param focal_region: Two points defining a line within the image to focus the effect around (pixels around the line will be in focus), or None to use the center third of the image, defaults to None
+        :type focal_region: Union[tuple[tuple[int, int], tuple[int, int]], None]
+        :param intensity: Controls the amount of distance around the focal region to keep in focus. Higher values decrease the distance before the out-of-focus effect starts. Defaults to 10.0
+        :type intensity: float
+        :param focal_region_saturation: Adjusts the saturation of the focial region. Higher values increase saturation. Defaults to 1.5 (1.5x default saturation)
+        :type focal_region_saturation: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").DepthOfField(
+            focal_region, intensity, focal_region_saturation
+        ).apply_to(self)
+
+    def crystallize(self, crystal_size: float = 20.0) -> "XAImage":
+        """Applies a crystallization filter to the image. Creates polygon-shaped color blocks by aggregating pixel values.
+
+        :param crystal_size: The radius of the crystals, defaults to 20.0
+        :type crystal_size: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Crystallize(crystal_size).apply_to(self)
+
+    def comic(self) -> "XAImage":
+        """Applies a comic filter to the image. Outlines edges and applies a color halftone effect.
+
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Comic().apply_to(self)
+
+    def pointillize(self, point_size: float = 20.0) -> "XAImage":
+        """Applies a pointillization filter to the image.
+
+        :param crystal_size: The radius of the points, defaults to 20.0
+        :type crystal_size: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Pointillize(point_size).apply_to(self)
+
+    def bloom(self, intensity: float = 0.5) -> "XAImage":
+        """Applies a bloom effect to the image. Softens edges and adds a glow.
+
+        :param intensity: The strength of the softening and glow effects, defaults to 0.5
+        :type intensity: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Bloom(intensity).apply_to(self)
+
+    def monochrome(self, color: XAColor, intensity: float = 1.0) -> "XAImage":
+        """Remaps the colors of the image to shades of the specified color.
+
+        :param color: The color of map the image's colors to
+        :type color: XAColor
+        :param intensity: The strength of recoloring effect. Higher values map colors to darker shades of the provided color. Defaults to 1.0
+        :type intensity: float
+        :return: The resulting image after applying the filter
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").Monochrome(color, intensity).apply_to(self)
+
+    def bump(
+        self,
+        center: Union[tuple[int, int], None] = None,
+        radius: float = 300.0,
+        curvature: float = 0.5,
+    ) -> "XAImage":
+        """Creates a concave (inward) or convex (outward) bump at the specified location within the image.
+
+        :param center: The center point of the effect, or None to use the center of the image, defaults to None
+        :type center: Union[tuple[int, int], None]
+        :param radius: The radius of the bump in pixels, defaults to 300.0
+        :type radius: float
+        :param curvature: Controls the direction and intensity of the bump's curvature. Positive values create convex bumps while negative values create concave bumps. Defaults to 0.5
+        :type curvature: float
+        :return: The resulting image after applying the distortion
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("distortions").Bump(center, radius, curvature).apply_to(self)
+
+    def pinch(
+        self, center: Union[tuple[int, int], None] = None, intensity: float = 0.5
+    ) -> "XAImage":
+        """Creates an inward pinch distortion at the specified location within the image.
+
+        :param center: The center point of the effect, or None to use the center of the image, defaults to None
+        :type center: Union[tuple[int, int], None]
+        :param intensity: Controls the scale of the pinch effect. Higher values stretch pixels away from the specified center to a greater degree. Defaults to 0.5
+        :type intensity: float
+        :return: The resulting image after applying the distortion
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("distortions").Pinch(center, intensity).apply_to(self)
+
+    def twirl(
+        self,
+        center: Union[tuple[int, int], None] = None,
+        radius: float = 300.0,
+        angle: float = 3.14,
+    ) -> "XAImage":
+        """Creates a twirl distortion by rotating pixels around the specified location within the image.
+
+        :param center: The center point of the effect, or None to use the center of the image, defaults to None
+        :type center: Union[tuple[int, int], None]
+        :param radius: The pixel radius around the centerpoint that defines the area to apply the effect to, defaults to 300.0
+        :type radius: float
+        :param angle: The angle of the twirl in radians, defaults to 3.14
+        :type angle: float
+        :return: The resulting image after applying the distortion
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("distortions").Twirl(center, radius, angle).apply_to(self)
+
+    def auto_enhance(
+        self,
+        correct_red_eye: bool = False,
+        crop_to_features: bool = False,
+        correct_rotation: bool = False,
+    ) -> "XAImage":
+        """Attempts to enhance the image by applying suggested filters.
+
+        :param correct_red_eye: Whether to attempt red eye removal, defaults to False
+        :type correct_red_eye: bool, optional
+        :param crop_to_features: Whether to crop the image to focus on the main features with it, defaults to False
+        :type crop_to_features: bool, optional
+        :param correct_rotation: Whether attempt perspective correction by rotating the image, defaults to False
+        :type correct_rotation: bool, optional
+        :return: The resulting image after applying the enchantments
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("filters").AutoEnhance(
+            correct_red_eye, crop_to_features, correct_rotation
+        ).apply_to(self)
+
+    def flip_horizontally(self) -> "XAImage":
+        """Flips the image horizontally.
+
+        :return: The image object, modifications included
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("transforms").Flip("horizontal").apply_to(self)
+
+    def flip_vertically(self) -> "XAImage":
+        """Flips the image vertically.
+
+        :return: The image object, modifications included
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("transforms").Flip("vertical").apply_to(self)
+
+    def rotate(self, degrees: float) -> "XAImage":
+        """Rotates the image clockwise by the specified number of degrees.
+
+        :param degrees: The number of degrees to rotate the image by
+        :type degrees: float
+        :return: The image object, modifications included
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("transforms").Rotate(degrees).apply_to(self)
+
+    def crop(
+        self, size: tuple[int, int], corner: tuple[int, int] = (0, 0)
+    ) -> "XAImage":
+        """Crops the image to the specified dimensions.
+
+        :param size: The width and height of the resulting image
+        :type size: tuple[int, int]
+        :param corner: The bottom-left corner location from which to crop the image, defaults to (0, 0)
+        :type corner: tuple[int, int], optional
+        :return: The image object, modifications included
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("transforms").Crop(size, corner).apply_to(self)
+
+    def scale(
+        self, scale_factor_x: float, scale_factor_y: Union[float, None] = None
+    ) -> "XAImage":
+        """Scales the image by the specified horizontal and vertical factors.
+
+        :param scale_factor_x: The factor by which to scale the image in the X dimension
+        :type scale_factor_x: float
+        :param scale_factor_y: The factor by which to scale the image in the Y dimension, or None to match the horizontal factor, defaults to None
+        :type scale_factor_y: Union[float, None]
+        :return: The image object, modifications included
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.0
+        """
+        return _macimg("transforms").Scale(scale_factor_x, scale_factor_y).apply_to(self)
+
+    def resize(self, width: int, height: Union[int, None] = None) -> "XAImage":
+        """Resizes the image to the specified width and height.
+
+        :param width: The width of the resulting image, in pixels
+        :type width: int
+        :param height: The height of the resulting image, in pixels, or None to maintain width:height proportions, defaults to None
+        :type height: Union[int, None]
+        :return: The image object, modifications included
+        :rtype: XAImage
+
+        .. versionadded:: 0.1.1
+        """
+        return _macimg("transforms").Resize(width, height).apply_to(self)
+
+    def save(self, file_path: Union[XAPath, str, None] = None):
+        """Saves the image to a file on the disk. Saves to the original file (if there was one) by default.
+
+        :param file_path: The path at which to save the image file. Any existing file at that location will be overwritten, defaults to None
+        :type file_path: Union[XAPath, str, None]
+
+        .. versionadded:: 0.1.0
+        """
+        if isinstance(file_path, XAPath):
+            file_path = file_path.path
+        super().save(file_path)
+
+    def get_clipboard_representation(self) -> "AppKit.NSImage":
+        """Gets a clipboard-codable representation of the iimage.
+
+        When the clipboard content is set to an image, the image itself, including any modifications, is added to the clipboard. Pasting will then insert the image into the active document.
+
+        :return: The raw NSImage object for this XAIMage
+        :rtype: AppKit.NSImage
+
+        .. versionadded:: 0.1.0
+        """
+        return self._nsimage
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, XAImage)
+            and self._nsimage.TIFFRepresentation()
+            == other._nsimage.TIFFRepresentation()
+        )
@@ -0,0 +1,717 @@
+""".. versionadded:: 0.3.1
+
+Opt-in instrumentation of PyXA scripting calls, for finding where an automation spends its time.
+
+While instrumentation is active, property accesses of PyXA objects, methods of PyXA lists, :func:`XABase.XAObject.set_property`, :func:`XABase.AppleScript.run`, and :func:`XABase.XASpotlight.run` are timed. Call counts, latencies, and element counts are aggregated per application, class, and property or method. When no instrumentation session is active, PyXA's classes are left unmodified and incur no overhead.
+
+Instrumentation can be enabled for a block of code using :func:`PyXA.instrument`, or for an entire run by setting the `PYXA_INSTRUMENT` environment variable, in which case a table of statistics is printed to stderr on exit.
+
+Nested timing spans of the same calls, along with requests sent to element arrays (e.g. `bridge get name`), conversions of their results (e.g. `convert to ndarray`), and the construction of PyXA wrapper objects, can be recorded using :func:`PyXA.trace` or by setting the `PYXA_TRACE` environment variable to an output path. Traces are saved in the Chrome Trace Event format, loadable in chrome://tracing or Perfetto, when the path ends in `.json`, and as collapsed stacks for flame graph tools otherwise.
+
+:Example: Find the slowest calls in a block of code
+
+>>> import PyXA
+>>> with PyXA.instrument() as session:
+...     music = PyXA.Music()
+...     names = music.tracks().name()
+...     durations = music.tracks().duration()
+>>> session.print_table()
+app    class                 member    kind      calls  total ms  mean ms  p50 ms  p95 ms  max ms  elements
+Music  XAMusicTrackList      name      list          1     41.62    41.62   41.62   41.62   41.62      2104
+Music  XAMusicTrackList      duration  list          1     38.20    38.20   38.20   38.20   38.20      2104
+Music  XAMusicApplication    tracks    list          2      0.41     0.20    0.20    0.21    0.21
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Union
+
+import AppKit
+
+from PyXA import XABackends, XABase
+
+
+class XACallStats:
+    """Aggregated statistics of calls to one property or method.
+
+    .. versionadded:: 0.3.1
+    """
+
+    max_samples: int = 10000  #: The maximum number of latency samples kept for computing percentiles
+
+    def __init__(self):
+        self.calls: int = 0  #: The number of calls
+        self.total: float = 0  #: The total duration of all calls, in seconds
+        self.max: float = 0  #: The duration of the slowest call, in seconds
+        self.elements: int = 0  #: The total number of list elements returned by the calls
+        self.__samples: list[float] = []
+
+    def add(self, duration: float, elements: Union[int, None] = None):
+        """Adds a call to the statistics.
+
+        :param duration: The duration of the call, in seconds
+        :type duration: float
+        :param elements: The number of list elements returned by the call, if applicable, defaults to None
+        :type elements: Union[int, None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        if elements is not None:
+            self.elements += elements
+
+        # Reservoir sampling keeps memory bounded for long runs
+        if len(self.__samples) < self.max_samples:
+            self.__samples.append(duration)
+        else:
+            index = random.randrange(self.calls)
+            if index < self.max_samples:
+                self.__samples[index] = duration
+
+    def percentile(self, percent: float) -> float:
+        """Gets the call duration at the given percentile, in seconds.
+
+        :param percent: The percentile, from 0 to 100
+        :type percent: float
+        :return: The duration at the percentile
+        :rtype: float
+
+        .. versionadded:: 0.3.1
+        """
+        if len(self.__samples) == 0:
+            return 0
+        samples = sorted(self.__samples)
+        return samples[round(percent / 100 * (len(samples) - 1))]
+
+    def to_dict(self) -> dict[str, Union[int, float]]:
+        """Gets the statistics as a dictionary, with durations in milliseconds.
+
+        :return: The dictionary of statistics
+        :rtype: dict[str, Union[int, float]]
+
+        .. versionadded:: 0.3.1
+        """
+        return {
+            "calls": self.calls,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.calls * 1000 if self.calls else 0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+            "elements": self.elements,
+        }
+
+
+class XAInstrumentationSession:
+    """A collection of call statistics recorded while instrumentation is active.
+
+    .. seealso:: :func:`instrument`
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self):
+        self.__stats: dict[tuple[str, str, str, str], XACallStats] = {}
+        self.__lock = threading.Lock()
+
+    def record(
+        self,
+        key: tuple[str, str, str, str],
+        duration: float,
+        elements: Union[int, None] = None,
+    ):
+        """Records a call.
+
+        :param key: The application, class, member, and kind of the call
+        :type key: tuple[str, str, str, str]
+        :param duration: The duration of the call, in seconds
+        :type duration: float
+        :param elements: The number of list elements returned by the call, if applicable, defaults to None
+        :type elements: Union[int, None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            stats = self.__stats.get(key)
+            if stats is None:
+                stats = self.__stats[key] = XACallStats()
+            stats.add(duration, elements)
+
+    def stats(self) -> dict[tuple[str, str, str, str], dict[str, Union[int, float]]]:
+        """Gets the recorded statistics.
+
+        :return: A dictionary mapping (application, class, member, kind) tuples to dictionaries of statistics, ordered by total duration
+        :rtype: dict[tuple[str, str, str, str], dict[str, Union[int, float]]]
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            items = [(key, stats.to_dict()) for key, stats in self.__stats.items()]
+        items.sort(key=lambda item: item[1]["total_ms"], reverse=True)
+        return dict(items)
+
+    def table(self, limit: Union[int, None] = None) -> str:
+        """Formats the recorded statistics as a table, ordered by total duration.
+
+        :param limit: The maximum number of rows to include, defaults to None
+        :type limit: Union[int, None], optional
+        :return: The table
+        :rtype: str
+
+        .. versionadded:: 0.3.1
+        """
+        header = [
+            "app",
+            "class",
+            "member",
+            "kind",
+            "calls",
+            "total ms",
+            "mean ms",
+            "p50 ms",
+            "p95 ms",
+            "max ms",
+            "elements",
+        ]
+        rows = []
+        for (app, cls, member, kind), stats in list(self.stats().items())[:limit]:
+            rows.append(
+                [
+                    app,
+                    cls,
+                    member,
+                    kind,
+                    str(stats["calls"]),
+                    f"{stats['total_ms']:.2f}",
+                    f"{stats['mean_ms']:.2f}",
+                    f"{stats['p50_ms']:.2f}",
+                    f"{stats['p95_ms']:.2f}",
+                    f"{stats['max_ms']:.2f}",
+                    str(stats["elements"]) if stats["elements"] else "",
+                ]
+            )
+
+        widths = [
+            max(len(row[index]) for row in [header] + rows)
+            for index in range(len(header))
+        ]
+        lines = []
+        for row in [header] + rows:
+            cells = [
+                cell.ljust(width) if index < 4 else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(row, widths))
+            ]
+            lines.append("  ".join(cells).rstrip())
+        return "\n".join(lines)
+
+    def print_table(self, limit: Union[int, None] = None, file=None):
+        """Prints the recorded statistics as a table, ordered by total duration.
+
+        :param limit: The maximum number of rows to print, defaults to None
+        :type limit: Union[int, None], optional
+        :param file: The file to print to, defaults to stdout
+        :type file: Any, optional
+
+        .. versionadded:: 0.3.1
+        """
+        print(self.table(limit), file=file)
+
+    def reset(self):
+        """Discards all recorded statistics.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            self.__stats.clear()
+
+    def __repr__(self):
+        return "<" + str(type(self)) + f"{len(self.__stats)} entries>"
+
+
+class XATrace:
+    """A recording of nested timing spans of PyXA calls.
+
+    Each span covers one call to a property, list method, or other instrumented function, a request sent to an element array through :mod:`PyXA.XABackends` (named e.g. `bridge get name`), a conversion of bridged values (e.g. `convert to ndarray`), or the construction of a PyXA wrapper object. Requests that property getters of individual objects send directly to their scripting elements are not separate spans, so their time counts toward the self time of the enclosing call.
+
+    .. seealso:: :func:`trace`
+
+    .. versionadded:: 0.3.1
+    """
+
+    max_spans: int = 1000000  #: The maximum number of spans to record, after which further spans are dropped
+
+    def __init__(self):
+        self.start_time = time.perf_counter()  #: The time that the trace started, from :func:`time.perf_counter`
+        self.dropped: int = 0  #: The number of spans dropped after reaching :attr:`max_spans`
+        self.__spans: list[tuple[tuple[str, ...], str, str, int, float, float, float]] = []
+        self.__lock = threading.Lock()
+
+    def add_span(
+        self,
+        stack: tuple[str, ...],
+        kind: str,
+        app: str,
+        thread_id: int,
+        start: float,
+        duration: float,
+        self_time: float,
+    ):
+        """Adds a completed span to the trace.
+
+        :param stack: The names of the span and its enclosing spans, outermost first
+        :type stack: tuple[str, ...]
+        :param kind: The kind of call, e.g. "property" or "list"
+        :type kind: str
+        :param app: The name of the application that the call targeted
+        :type app: str
+        :param thread_id: The identifier of the thread that made the call
+        :type thread_id: int
+        :param start: The start time of the span, from :func:`time.perf_counter`
+        :type start: float
+        :param duration: The duration of the span, in seconds
+        :type duration: float
+        :param self_time: The duration of the span excluding nested spans, in seconds
+        :type self_time: float
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            if len(self.__spans) >= self.max_spans:
+                self.dropped += 1
+                return
+            self.__spans.append(
+                (stack, kind, app, thread_id, start, duration, self_time)
+            )
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Gets the trace in the Chrome Trace Event format.
+
+        :return: The trace as a JSON-serializable dictionary
+        :rtype: dict[str, Any]
+
+        .. versionadded:: 0.3.1
+        """
+        pid = os.getpid()
+        with self.__lock:
+            spans = list(self.__spans)
+
+        events = [
+            {
+                "name": stack[-1],
+                "cat": kind,
+                "ph": "X",
+                "ts": (start - self.start_time) * 1e6,
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"app": app},
+            }
+            for stack, kind, app, thread_id, start, duration, _ in spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_collapsed_stacks(self) -> str:
+        """Gets the trace in the collapsed stack format used by flame graph tools, with self times in microseconds.
+
+        :return: One line per distinct stack, e.g. `XAMusicTrackList.name;new XAMusicTrack 1520`
+        :rtype: str
+
+        .. versionadded:: 0.3.1
+        """
+        totals: dict[tuple[str, ...], float] = {}
+        with self.__lock:
+            for stack, _, _, _, _, _, self_time in self.__spans:
+                totals[stack] = totals.get(stack, 0) + self_time
+
+        return "\n".join(
+            ";".join(stack) + f" {round(total * 1e6)}" for stack, total in totals.items()
+        )
+
+    def save(self, path: str):
+        """Saves the trace to a file, in the Chrome Trace Event format if the path ends in `.json` and in the collapsed stack format otherwise.
+
+        :param path: The path of the file to save the trace to
+        :type path: str
+
+        .. versionadded:: 0.3.1
+        """
+        with open(path, "w") as file:
+            if path.endswith(".json"):
+                json.dump(self.to_chrome_trace(), file)
+            else:
+                file.write(self.to_collapsed_stacks() + "\n")
+
+    def __len__(self):
+        return len(self.__spans)
+
+    def __repr__(self):
+        return "<" + str(type(self)) + f"{len(self)} spans>"
+
+
+_sessions: list[XAInstrumentationSession] = []
+_traces: list[XATrace] = []
+_originals: dict[tuple[type, str], Any] = {}
+_lock = threading.RLock()
+_span_stacks = threading.local()
+
+
+def _app_name(xa_object: Any) -> str:
+    # Read from the instance dictionary to avoid triggering __getattr__ fallbacks
+    app_ref = getattr(xa_object, "__dict__", {}).get("xa_aref")
+    if isinstance(app_ref, AppKit.NSRunningApplication):
+        return str(app_ref.localizedName())
+    return "-"
+
+
+def _element_count(result: Any) -> Union[int, None]:
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    if isinstance(result, dict) and len(result) > 0:
+        first_value = next(iter(result.values()))
+        if isinstance(first_value, list):
+            return len(first_value)
+    return None
+
+
+def _record(key: tuple[str, str, str, str], duration: float, result: Any):
+    elements = _element_count(result)
+    for session in list(_sessions):
+        session.record(key, duration, elements)
+
+
+def _begin_span(name: str) -> Union[list, None]:
+    if len(_traces) == 0:
+        return None
+
+    stack = getattr(_span_stacks, "frames", None)
+    if stack is None:
+        stack = _span_stacks.frames = []
+
+    # [name, time spent in nested spans]
+    frame = [name, 0.0]
+    stack.append(frame)
+    return frame
+
+
+def _end_span(frame: list, kind: str, app: str, start: float, duration: float):
+    stack = _span_stacks.frames
+    names = tuple(stack_frame[0] for stack_frame in stack)
+    stack.pop()
+    if len(stack) > 0:
+        stack[-1][1] += duration
+
+    for trace in list(_traces):
+        trace.add_span(
+            names,
+            kind,
+            app,
+            threading.get_ident(),
+            start,
+            duration,
+            max(duration - frame[1], 0),
+        )
+
+
+def _wrap(function: Callable[..., Any], name: str, kind: str) -> Callable[..., Any]:
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        frame = _begin_span(type(self).__name__ + "." + name)
+        start = time.perf_counter()
+        result = None
+        try:
+            result = function(self, *args, **kwargs)
+            return result
+        finally:
+            duration = time.perf_counter() - start
+            app = _app_name(self)
+            if len(_sessions) > 0:
+                _record((app, type(self).__name__, name, kind), duration, result)
+            if frame is not None:
+                _end_span(frame, kind, app, start, duration)
+
+    wrapper.__xa_instrumented__ = True
+    return wrapper
+
+
+def _wrap_new_element(function: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(function)
+    def wrapper(self, obj, obj_class="XAObject", *args, **kwargs):
+        class_name = getattr(obj_class, "__name__", str(obj_class))
+        frame = _begin_span("new " + class_name)
+        start = time.perf_counter()
+        try:
+            return function(self, obj, obj_class, *args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            app = _app_name(self)
+            if len(_sessions) > 0:
+                _record((app, class_name, "_new_element", "wrap"), duration, None)
+            if frame is not None:
+                _end_span(frame, "wrap", app, start, duration)
+
+    wrapper.__xa_instrumented__ = True
+    return wrapper
+
+
+def _bridge_span(name: str, function: Callable[[], Any]) -> Any:
+    # Times a request sent to an element array, e.g. a selector fan-out or predicate filter
+    frame = _begin_span(name)
+    if frame is None:
+        return function()
+
+    start = time.perf_counter()
+    try:
+        return function()
+    finally:
+        _end_span(frame, "bridge", "-", start, time.perf_counter() - start)
+
+
+def _wrap_conversion(function: Callable[..., Any], name: str) -> Callable[..., Any]:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        frame = _begin_span(name)
+        if frame is None:
+            return function(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _end_span(frame, "convert", "-", start, time.perf_counter() - start)
+
+    wrapper.__xa_instrumented__ = True
+    return wrapper
+
+
+def _patch(cls: type, name: str, replacement: Any):
+    if (cls, name) not in _originals:
+        _originals[(cls, name)] = cls.__dict__[name]
+    setattr(cls, name, replacement)
+
+
+def _instrument_class(cls: type):
+    is_list = issubclass(cls, XABase.XAList)
+    for name, attribute in list(cls.__dict__.items()):
+        if name.startswith("_") or name.startswith("xa_"):
+            continue
+
+        if isinstance(attribute, property) and attribute.fget is not None:
+            if getattr(attribute.fget, "__xa_instrumented__", False):
+                continue
+            _patch(
+                cls,
+                name,
+                property(
+                    _wrap(attribute.fget, name, "property"),
+                    attribute.fset,
+                    attribute.fdel,
+                    attribute.__doc__,
+                ),
+            )
+        elif inspect.isfunction(attribute) and not getattr(
+            attribute, "__xa_instrumented__", False
+        ):
+            if name in ("set_property", "set_properties"):
+                _patch(cls, name, _wrap(attribute, name, "set"))
+            elif is_list:
+                _patch(cls, name, _wrap(attribute, name, "list"))
+
+
+def _all_subclasses(cls: type) -> Iterator[type]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _all_subclasses(subclass)
+
+
+def _init_subclass(cls, **kwargs):
+    # Instruments classes defined while instrumentation is active, e.g. in app modules imported later
+    super(XABase.XAObject, cls).__init_subclass__(**kwargs)
+    with _lock:
+        if len(_sessions) > 0 or len(_traces) > 0:
+            _instrument_class(cls)
+
+
+def _enable():
+    _instrument_class(XABase.XAObject)
+    for cls in set(_all_subclasses(XABase.XAObject)):
+        _instrument_class(cls)
+
+    _patch(XABase.AppleScript, "run", _wrap(XABase.AppleScript.run, "run", "call"))
+    _patch(XABase.AppleScript, "call", _wrap(XABase.AppleScript.call, "call", "call"))
+    _patch(XABase.XASpotlight, "run", _wrap(XABase.XASpotlight.run, "run", "call"))
+    _patch(
+        XABase.XAObject,
+        "_new_element",
+        _wrap_new_element(XABase.XAObject._new_element),
+    )
+    _patch(
+        XABase,
+        "_xa_record_values",
+        _wrap_conversion(XABase._xa_record_values, "convert property records"),
+    )
+    _patch(
+        XABase,
+        "_xa_to_ndarray",
+        _wrap_conversion(XABase._xa_to_ndarray, "convert to ndarray"),
+    )
+    XABackends._request_hook = _bridge_span
+
+    _originals[(XABase.XAObject, "__init_subclass__")] = XABase.XAObject.__dict__.get(
+        "__init_subclass__"
+    )
+    XABase.XAObject.__init_subclass__ = classmethod(_init_subclass)
+
+
+def _disable():
+    XABackends._request_hook = None
+    for (cls, name), original in _originals.items():
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+    _originals.clear()
+
+
+def start() -> XAInstrumentationSession:
+    """Starts a new instrumentation session, instrumenting PyXA's classes if they are not already instrumented.
+
+    :return: The new session
+    :rtype: XAInstrumentationSession
+
+    .. seealso:: :func:`instrument`
+
+    .. versionadded:: 0.3.1
+    """
+    with _lock:
+        if len(_sessions) == 0 and len(_traces) == 0:
+            _enable()
+        session = XAInstrumentationSession()
+        _sessions.append(session)
+        return session
+
+
+def stop(session: XAInstrumentationSession):
+    """Stops an instrumentation session. PyXA's classes are restored once no sessions remain.
+
+    :param session: The session to stop
+    :type session: XAInstrumentationSession
+
+    .. versionadded:: 0.3.1
+    """
+    with _lock:
+        if session in _sessions:
+            _sessions.remove(session)
+        if len(_sessions) == 0 and len(_traces) == 0:
+            _disable()
+
+
+@contextmanager
+def instrument() -> Iterator[XAInstrumentationSession]:
+    """Records statistics of PyXA scripting calls made within a `with` block.
+
+    :yield: The session recording the statistics
+    :rtype: Iterator[XAInstrumentationSession]
+
+    :Example:
+
+    >>> import PyXA
+    >>> with PyXA.instrument() as session:
+    ...     PyXA.Notes().notes().name()
+    >>> print(session.stats())
+    {('Notes', 'XANoteList', 'name', 'list'): {'calls': 1, 'total_ms': 12.5, 'mean_ms': 12.5, 'p50_ms': 12.5, 'p95_ms': 12.5, 'p99_ms': 12.5, 'max_ms': 12.5, 'elements': 38}, ...}
+
+    .. versionadded:: 0.3.1
+    """
+    session = start()
+    try:
+        yield session
+    finally:
+        stop(session)
+
+
+def start_trace() -> XATrace:
+    """Starts recording a new trace, instrumenting PyXA's classes if they are not already instrumented.
+
+    :return: The new trace
+    :rtype: XATrace
+
+    .. seealso:: :func:`trace`
+
+    .. versionadded:: 0.3.1
+    """
+    with _lock:
+        if len(_sessions) == 0 and len(_traces) == 0:
+            _enable()
+        xa_trace = XATrace()
+        _traces.append(xa_trace)
+        return xa_trace
+
+
+def stop_trace(xa_trace: XATrace):
+    """Stops recording a trace. PyXA's classes are restored once no sessions or traces remain.
+
+    :param xa_trace: The trace to stop recording
+    :type xa_trace: XATrace
+
+    .. versionadded:: 0.3.1
+    """
+    with _lock:
+        if xa_trace in _traces:
+            _traces.remove(xa_trace)
+        if len(_sessions) == 0 and len(_traces) == 0:
+            _disable()
+
+
+@contextmanager
+def trace(path: Union[str, None] = None) -> Iterator[XATrace]:
+    """Records nested timing spans of PyXA scripting calls made within a `with` block.
+
+    :param path: The path to save the trace to when the block exits, defaults to None
+    :type path: Union[str, None], optional
+    :yield: The trace recording the spans
+    :rtype: Iterator[XATrace]
+
+    :Example: Save a trace of a slow automation for viewing in Perfetto
+
+    >>> import PyXA
+    >>> with PyXA.trace("/Users/exampleUser/Desktop/trace.json"):
+    ...     tracks = PyXA.Music().tracks()
+    ...     names = [track.name for track in tracks[:100]]
+
+    .. versionadded:: 0.3.1
+    """
+    xa_trace = start_trace()
+    try:
+        yield xa_trace
+    finally:
+        stop_trace(xa_trace)
+        if path is not None:
+            xa_trace.save(path)
+
+
+def start_from_environment():
+    """Starts instrumenting the remainder of the process according to environment variables.
+
+    If `PYXA_INSTRUMENT` is set, a table of call statistics is printed to stderr on exit. If `PYXA_TRACE` is set to a path, a trace is saved to that path on exit.
+
+    .. versionadded:: 0.3.1
+    """
+    if os.environ.get("PYXA_INSTRUMENT", "") not in ("", "0"):
+        session = start()
+        atexit.register(session.print_table, file=sys.stderr)
+
+    trace_path = os.environ.get("PYXA_TRACE", "")
+    if trace_path != "":
+        xa_trace = start_trace()
+        atexit.register(xa_trace.save, trace_path)
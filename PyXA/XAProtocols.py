@@ -73,8 +73,19 @@ class XADeletable(XAProtocol):
         :return: A reference to the PyXA object that called this method.
         :rtype: XAObject
 
+        .. versionchanged:: 0.3.1
+
+           Records the deletion in the batch being recorded for the object's application, if any.
+
         .. versionadded:: 0.0.1
         """
+        from PyXA import XABase
+
+        batch = XABase._xa_recording_batch(self)
+        if batch is not None:
+            batch.delete(self)
+            return
+
         self.xa_elem.delete()
 
 
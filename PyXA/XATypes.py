@@ -15,3 +15,21 @@ XARectangle = namedtuple("XARectangle", ["x", "y", "width", "height"])
 
 XADatetimeBlock = namedtuple("XADatetimeBlock", ["date", "duration"])
 """A named tuple representing a date and an associated duration."""
+
+XASnapshotDiff = namedtuple("XASnapshotDiff", ["added", "removed", "changed"])
+"""A named tuple representing the differences between two snapshots of a list. `added` and `removed` map keys to records, while `changed` maps keys to dictionaries of each changed field's old and new values.
+"""
+
+XAUpdateReport = namedtuple("XAUpdateReport", ["updated", "events"])
+"""A named tuple representing the result of a bulk update, i.e. the number of objects updated and the number of scripting requests sent.
+"""
+
+XABatchResult = namedtuple("XABatchResult", ["operation", "result", "error"])
+"""A named tuple representing the outcome of one operation in a batch, i.e. a description of the operation, its return value, and the error message if the operation failed.
+"""
+
+XAScriptCacheInfo = namedtuple(
+    "XAScriptCacheInfo", ["hits", "misses", "size", "max_size"]
+)
+"""A named tuple representing the statistics of the compiled script cache, i.e. the number of cache hits and misses, the number of cached scripts, and the maximum number of cached scripts.
+"""
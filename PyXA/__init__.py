@@ -1,44 +1,45 @@
 import importlib
+import os
 import sys
 from types import ModuleType
 
-from PyXA import XABase, XABaseScriptable, XAEvents, Additions
+from .apps import application_classes
 
-from .XABase import (
+# Names re-exported from XABase, which is imported on first access since it loads PyObjC and macimg
+xabase_exports = [
     # Base Types
-    XAText,
-    XAURL,
-    XAPath,
-    XAColor,
-    XASound,
-    XAImage,
-    XAVideo,
-    XALocation,
-    Application,
+    "XAText",
+    "XAURL",
+    "XAPath",
+    "XAColor",
+    "XASound",
+    "XAImage",
+    "XAVideo",
+    "XALocation",
+    "Application",
     # Utilities
-    AppleScript,
-    XAPredicate,
+    "AppleScript",
+    "XAPredicate",
     # System Features
-    XAClipboard,
-    XASpotlight,
+    "XAClipboard",
+    "XASpotlight",
     # Alerts, Dialogs, Menus, and Notifications
-    XAFilePicker,
-    XAFolderPicker,
-    XAApplicationPicker,
-    XADialog,
-    XAFileNameDialog,
-    XAColorPicker,
-    XAColorPickerStyle,
-    XAMenu,
+    "XAFilePicker",
+    "XAFolderPicker",
+    "XAApplicationPicker",
+    "XADialog",
+    "XAFileNameDialog",
+    "XAColorPicker",
+    "XAColorPickerStyle",
+    "XAMenu",
     # Constants
-    VERSION,
-    application_classes,
-    # XAFinderExtension,
+    "VERSION",
+    # "XAFinderExtension",
     # Methods
-    current_application,
-    running_applications,
-    active_browser,
-)
+    "current_application",
+    "running_applications",
+    "active_browser",
+]
 
 old_module = sys.modules["PyXA"]
 
@@ -48,7 +49,9 @@ for index, app_name in enumerate(application_classes):
     setattr(
         old_module,
         wrapper_name,
-        lambda local_app_name=app_name: Application(local_app_name),
+        lambda local_app_name=app_name: importlib.import_module(
+            ".XABase", "PyXA"
+        ).Application(local_app_name),
     )
 
 # JIT imports
@@ -68,17 +71,42 @@ module_map = {
     "XANotification": ".Additions.UI",
     "XAHUD": ".Additions.UI",
     "RSSFeed": ".Additions.Web",
+    "instrument": ".XAInstrumentation",
+    "trace": ".XAInstrumentation",
 }
 
+# Submodules imported on first access, e.g. PyXA.XABaseScriptable
+lazy_submodules = [
+    "XABase",
+    "XABackends",
+    "XABaseScriptable",
+    "XAEvents",
+    "XAInstrumentation",
+    "Additions",
+    "aio",
+]
+
+# Instruments the entire run, printing statistics or saving a trace on exit
+if os.environ.get("PYXA_INSTRUMENT", "") not in ("", "0") or os.environ.get(
+    "PYXA_TRACE"
+):
+    importlib.import_module(".XAInstrumentation", "PyXA").start_from_environment()
+
 
 class module(ModuleType):
     def __getattr__(self, attr):
         if attr in old_module.__dict__:
             return getattr(old_module, attr)
 
+        if attr in xabase_exports:
+            return getattr(importlib.import_module(".XABase", "PyXA"), attr)
+
         if attr in module_map:
             module = importlib.import_module(module_map[attr], "PyXA")
             return getattr(module, attr)
 
+        if attr in lazy_submodules:
+            return importlib.import_module("." + attr, "PyXA")
+
 
 sys.modules["PyXA"] = module("PyXA")
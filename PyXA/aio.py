@@ -0,0 +1,273 @@
+""".. versionadded:: 0.3.1
+
+Awaitable versions of PyXA scripting calls for use in asyncio-based programs.
+
+Scripting calls are run on dedicated worker threads instead of the event loop's thread. Each target application has its own serial queue, so calls to the same application run in the order they were made, while calls to different applications run in parallel. Idle queues of applications that have terminated are discarded when a new queue is created. The number of in-flight calls per application is capped by :attr:`max_in_flight`.
+
+:Example: Fetch track names while querying Reminders
+
+>>> import asyncio
+>>> import PyXA
+>>> from PyXA import aio
+>>>
+>>> async def main():
+...     music = await aio.application("Music")
+...     reminders = await aio.application("Reminders")
+...     return await asyncio.gather(
+...         aio.fetch(music.tracks(), ["name", "artist"]),
+...         aio.get(reminders.reminders(), "name"),
+...     )
+>>>
+>>> columns, names = asyncio.run(main())
+"""
+
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Union
+
+import AppKit
+
+from PyXA import XABase
+
+max_in_flight: int = 8  #: The maximum number of calls awaiting each application at once
+
+_executors: dict[Any, ThreadPoolExecutor] = {}
+_pending: dict[Any, int] = {}  # Queue key -> number of calls submitted but not yet finished
+_semaphores = weakref.WeakKeyDictionary()  # Event loop -> {queue key: semaphore}
+_lock = threading.Lock()
+
+
+def _queue_key(target: Any) -> Any:
+    """Gets the key of the serial queue that calls involving the target should run on."""
+    if isinstance(target, str):
+        return target
+
+    app_ref = getattr(target, "xa_aref", None)
+    if app_ref is None and isinstance(target, XABase.XAApplication):
+        app_ref = target.xa_elem
+
+    if app_ref is not None and hasattr(app_ref, "processIdentifier"):
+        return app_ref.processIdentifier()
+    return "default"
+
+
+def _is_running(pid: int) -> bool:
+    return (
+        AppKit.NSRunningApplication.runningApplicationWithProcessIdentifier_(pid)
+        is not None
+    )
+
+
+def _submit(key: Any, function: Callable[[], Any]) -> Future:
+    stale = []
+    with _lock:
+        executor = _executors.get(key)
+        if executor is None:
+            # Applications get a new process identifier when relaunched, so discard the idle queues of terminated processes
+            for pid in [pid for pid in _executors if isinstance(pid, int)]:
+                if _pending.get(pid, 0) == 0 and not _is_running(pid):
+                    stale.append(_executors.pop(pid))
+                    for semaphores in list(_semaphores.values()):
+                        semaphores.pop(pid, None)
+
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"PyXA-aio-{key}"
+            )
+            _executors[key] = executor
+        _pending[key] = _pending.get(key, 0) + 1
+
+    for stale_executor in stale:
+        stale_executor.shutdown(wait=False)
+
+    def _call():
+        try:
+            return function()
+        finally:
+            with _lock:
+                _pending[key] -= 1
+                if _pending[key] == 0:
+                    del _pending[key]
+
+    return executor.submit(_call)
+
+
+def _semaphore(key: Any) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphores = _semaphores.setdefault(loop, {})
+    semaphore = semaphores.get(key)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_in_flight)
+        semaphores[key] = semaphore
+    return semaphore
+
+
+async def run(target: Any, function: Callable[..., Any], *args, **kwargs) -> Any:
+    """Runs a function on the serial queue of the given target's application.
+
+    :param target: A PyXA object belonging to the application, or the name of a queue
+    :type target: Any
+    :param function: The function to run
+    :type function: Callable[..., Any]
+    :return: The return value of the function
+    :rtype: Any
+
+    :Example:
+
+    >>> import PyXA
+    >>> from PyXA import aio
+    >>> notes = PyXA.Notes()
+    >>> await aio.run(notes, notes.notes().name)
+    ['PyXA Notes', 'Example', ...]
+
+    .. versionadded:: 0.3.1
+    """
+    key = _queue_key(target)
+    async with _semaphore(key):
+        return await asyncio.wrap_future(
+            _submit(key, functools.partial(function, *args, **kwargs))
+        )
+
+
+async def fetch(xa_list: XABase.XAList, keys: list[str]) -> dict[str, list[Any]]:
+    """Retrieves the values of several properties of every element in a list. Awaitable version of :func:`XABase.XAList.fetch`.
+
+    :param xa_list: The list to retrieve property values of
+    :type xa_list: XABase.XAList
+    :param keys: The names of the properties to retrieve
+    :type keys: list[str]
+    :return: A dictionary mapping each property name to the list of values
+    :rtype: dict[str, list[Any]]
+
+    .. versionadded:: 0.3.1
+    """
+    return await run(xa_list, xa_list.fetch, keys)
+
+
+async def get(target: XABase.XAObject, name: str) -> Any:
+    """Retrieves the value of a property of an object, or the values of a property of every element in a list.
+
+    :param target: The object or list to retrieve the property of
+    :type target: XABase.XAObject
+    :param name: The name of the property
+    :type name: str
+    :return: The value of the property, or the list of values
+    :rtype: Any
+
+    :Example:
+
+    >>> import PyXA
+    >>> from PyXA import aio
+    >>> music = PyXA.Music()
+    >>> await aio.get(music, "current_track")
+    <<class 'PyXA.apps.Music.XAMusicTrack'>Example Track, ...>
+    >>> await aio.get(music.tracks(), "name")
+    ['Track 1', 'Track 2', ...]
+
+    .. versionadded:: 0.3.1
+    """
+
+    def _get():
+        value = getattr(target, name)
+        if isinstance(target, XABase.XAList) and callable(value):
+            return value()
+        return value
+
+    return await run(target, _get)
+
+
+async def run_applescript(
+    script: Union[str, list[str], XABase.AppleScript], args: Union[list, None] = None
+) -> Any:
+    """Compiles and runs an AppleScript script. Awaitable version of :func:`XABase.AppleScript.run`.
+
+    Scripts run serially on a queue shared by all scripts.
+
+    :param script: The script or its source code
+    :type script: Union[str, list[str], XABase.AppleScript]
+    :param args: A list of arguments to pass to the script, defaults to None
+    :type args: Union[list, None], optional
+    :return: The return value of the script
+    :rtype: Any
+
+    .. versionadded:: 0.3.1
+    """
+    if not isinstance(script, XABase.AppleScript):
+        script = XABase.AppleScript(script)
+    return await run("AppleScript", script.run, args)
+
+
+async def spotlight(
+    *query: list[Any],
+    predicate: Union[str, XABase.XAPredicate, None] = None,
+    timeout: int = 10,
+) -> list[XABase.XAPath]:
+    """Runs a Spotlight search. Awaitable version of :attr:`XABase.XASpotlight.results`.
+
+    :param query: The query terms to search
+    :type query: list[Any]
+    :param predicate: The predicate to filter search results by, defaults to None
+    :type predicate: Union[str, XABase.XAPredicate, None], optional
+    :param timeout: The amount of time in seconds to timeout the search after, defaults to 10
+    :type timeout: int, optional
+    :return: The paths of the matching files
+    :rtype: list[XABase.XAPath]
+
+    .. versionadded:: 0.3.1
+    """
+
+    def _search():
+        # The query must be created on the thread whose run loop gathers its results
+        search = XABase.XASpotlight(*query)
+        search.predicate = predicate
+        search.timeout = timeout
+        return search.results
+
+    return await run("Spotlight", _search)
+
+
+async def application(app_name: str) -> XABase.XAApplication:
+    """Gets a PyXA application object without blocking the event loop. Awaitable version of :class:`XABase.Application`.
+
+    :param app_name: The name of the target application
+    :type app_name: str
+    :return: A PyXA application object referencing the target application
+    :rtype: XABase.XAApplication
+
+    .. versionadded:: 0.3.1
+    """
+    return await run("Application", XABase.Application, app_name)
+
+
+async def launch(app_name: str, timeout: float = 30) -> XABase.XAApplication:
+    """Launches an application. Equivalent to :func:`XABase.Application.launch_async`.
+
+    :param app_name: The name of the target application
+    :type app_name: str
+    :param timeout: The maximum amount of time in seconds to wait for the application to finish launching, defaults to 30
+    :type timeout: float, optional
+    :raises TimeoutError: The application did not finish launching within the timeout
+    :return: A PyXA application object referencing the target application
+    :rtype: XABase.XAApplication
+
+    .. versionadded:: 0.3.1
+    """
+    return await XABase.Application.launch_async(app_name, timeout)
+
+
+def shutdown(wait: bool = True):
+    """Shuts down all worker threads. Subsequent calls start new workers as needed.
+
+    :param wait: Whether to wait for pending calls to finish, defaults to True
+    :type wait: bool, optional
+
+    .. versionadded:: 0.3.1
+    """
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+
+    for executor in executors:
+        executor.shutdown(wait=wait)
@@ -10,6 +10,7 @@ from typing import Union, Literal
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
@@ -371,11 +372,11 @@ class XAAcrobatReaderDocumentList(XABase.XAList):
         super().__init__(properties, XAAcrobatReaderDocument, filter)
 
     def best_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bestType") or [])
+        return list(XABackends.element_values(self.xa_elem, "bestType") or [])
 
     def bounds(self) -> list[tuple[int, int, int, int]]:
         bounds = []
-        ls = self.xa_elem.arrayByApplyingSelector_("bounds") or []
+        ls = XABackends.element_values(self.xa_elem, "bounds") or []
         for bound in ls:
             origin = bound.origin
             size = bound.size
@@ -383,20 +384,20 @@ class XAAcrobatReaderDocumentList(XABase.XAList):
         return bounds
 
     def default_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("defaultType") or [])
+        return list(XABackends.element_values(self.xa_elem, "defaultType") or [])
 
     def file_alias(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("fileAlias") or []
+        ls = XABackends.element_values(self.xa_elem, "fileAlias") or []
         return [XABase.XAPath(x) for x in ls]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def view_mode(self) -> list[XAAcrobatReaderApplication.ViewMode]:
-        ls = self.xa_elem.arrayByApplyingSelector_("viewMode") or []
+        ls = XABackends.element_values(self.xa_elem, "viewMode") or []
         return [XAAcrobatReaderApplication.ViewMode(x) for x in ls]
 
     def by_best_type(self, best_type: str) -> Union["XAAcrobatReaderDocument", None]:
@@ -577,34 +578,34 @@ class XAAcrobatReaderPDFPageList(XABase.XAList):
         super().__init__(properties, XAAcrobatReaderPDFPage, filter)
 
     def best_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bestType") or [])
+        return list(XABackends.element_values(self.xa_elem, "bestType") or [])
 
     def art_box(self) -> list[list[float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("artBox") or [])
+        return list(XABackends.element_values(self.xa_elem, "artBox") or [])
 
     def bleed_box(self) -> list[list[float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bleedBox") or [])
+        return list(XABackends.element_values(self.xa_elem, "bleedBox") or [])
 
     def crop_box(self) -> list[list[float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("cropBox") or [])
+        return list(XABackends.element_values(self.xa_elem, "cropBox") or [])
 
     def default_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("defaultType") or [])
+        return list(XABackends.element_values(self.xa_elem, "defaultType") or [])
 
     def label_text(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("labelText") or [])
+        return list(XABackends.element_values(self.xa_elem, "labelText") or [])
 
     def media_box(self) -> list[list[float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("mediaBox") or [])
+        return list(XABackends.element_values(self.xa_elem, "mediaBox") or [])
 
     def page_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("pageNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "pageNumber") or [])
 
     def rotation(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rotation") or [])
+        return list(XABackends.element_values(self.xa_elem, "rotation") or [])
 
     def trim_box(self) -> list[list[float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("trimBox") or [])
+        return list(XABackends.element_values(self.xa_elem, "trimBox") or [])
 
     def by_best_type(self, best_type: str) -> Union["XAAcrobatReaderPDFPage", None]:
         return self.by_property("bestType", best_type)
@@ -743,31 +744,33 @@ class XAAcrobatReaderBookmarkList(XABase.XAList):
         super().__init__(properties, XAAcrobatReaderBookmark, filter)
 
     def best_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bestType") or [])
+        return list(XABackends.element_values(self.xa_elem, "bestType") or [])
 
     def default_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("defaultType") or [])
+        return list(XABackends.element_values(self.xa_elem, "defaultType") or [])
 
     def destination_page_number(self) -> list[int]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("destinationPageNumber") or []
+            XABackends.element_values(self.xa_elem, "destinationPageNumber") or []
         )
 
     def destination_rectangle(self) -> list[list[float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("destinationRectangle") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "destinationRectangle") or []
+        )
 
     def fit_type(self) -> list[XAAcrobatReaderApplication.FitType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("fitType") or []
+        ls = XABackends.element_values(self.xa_elem, "fitType") or []
         return [XAAcrobatReaderApplication.FitType(x) for x in ls]
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def zoom_factor(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomFactor") or [])
+        return list(XABackends.element_values(self.xa_elem, "zoomFactor") or [])
 
     def by_best_type(self, best_type: str) -> Union["XAAcrobatReaderBookmark", None]:
         return self.by_property("bestType", best_type)
@@ -886,51 +889,53 @@ class XAAcrobatReaderAnnotationList(XABase.XAList):
         super().__init__(properties, XAAcrobatReaderAnnotation, filter)
 
     def best_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bestType") or [])
+        return list(XABackends.element_values(self.xa_elem, "bestType") or [])
 
     def bounds(self) -> list[list[float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bounds") or [])
+        return list(XABackends.element_values(self.xa_elem, "bounds") or [])
 
     def color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("color") or []
+        ls = XABackends.element_values(self.xa_elem, "color") or []
         return [XABase.XAColor(x) for x in ls]
 
     def contents(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("contents") or [])
+        return list(XABackends.element_values(self.xa_elem, "contents") or [])
 
     def default_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("defaultType") or [])
+        return list(XABackends.element_values(self.xa_elem, "defaultType") or [])
 
     def destination_page_number(self) -> list[int]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("destinationPageNumber") or []
+            XABackends.element_values(self.xa_elem, "destinationPageNumber") or []
         )
 
     def destination_rectangle(self) -> list[list[float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("destinationRectangle") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "destinationRectangle") or []
+        )
 
     def fit_type(self) -> list[XAAcrobatReaderApplication.FitType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("fitType") or []
+        ls = XABackends.element_values(self.xa_elem, "fitType") or []
         # TODO
         return [XAAcrobatReaderApplication.FitType(x) for x in ls]
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def open_state(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("openState") or [])
+        return list(XABackends.element_values(self.xa_elem, "openState") or [])
 
     def subtype(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("subtype") or [])
+        return list(XABackends.element_values(self.xa_elem, "subtype") or [])
 
     def zoom_factor(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomFactor") or [])
+        return list(XABackends.element_values(self.xa_elem, "zoomFactor") or [])
 
     def by_best_type(self, best_type: str) -> Union["XAAcrobatReaderAnnotation", None]:
         return self.by_property("bestType", best_type)
@@ -1128,16 +1133,16 @@ class XAAcrobatReaderMenuList(XABase.XAList):
         super().__init__(properties, XAAcrobatReaderMenu, filter)
 
     def best_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bestType") or [])
+        return list(XABackends.element_values(self.xa_elem, "bestType") or [])
 
     def default_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("defaultType") or [])
+        return list(XABackends.element_values(self.xa_elem, "defaultType") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def by_best_type(self, best_type: str) -> Union["XAAcrobatReaderMenu", None]:
         return self.by_property("bestType", best_type)
@@ -1194,25 +1199,25 @@ class XAAcrobatReaderMenuItemList(XABase.XAList):
         super().__init__(properties, XAAcrobatReaderMenuItem, filter)
 
     def best_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bestType") or [])
+        return list(XABackends.element_values(self.xa_elem, "bestType") or [])
 
     def default_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("defaultType") or [])
+        return list(XABackends.element_values(self.xa_elem, "defaultType") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def marked(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("marked") or [])
+        return list(XABackends.element_values(self.xa_elem, "marked") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def has_submenu(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hasSubmenu") or [])
+        return list(XABackends.element_values(self.xa_elem, "hasSubmenu") or [])
 
     def by_best_type(self, best_type: str) -> Union["XAAcrobatReaderMenuItem", None]:
         return self.by_property("bestType", best_type)
@@ -2,6 +2,7 @@ from typing import Any, Callable, Union
 from enum import Enum
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType
 from PyXA import XABaseScriptable
 
@@ -150,70 +151,70 @@ class XAArcWindowList(XABaseScriptable.XASBWindowList):
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("id"))
+        return list(XABackends.element_values(self.xa_elem, "id"))
 
     def name(self) -> list["str"]:
         """The full title of the window.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("name"))
+        return list(XABackends.element_values(self.xa_elem, "name"))
 
     def index(self) -> list["int"]:
         """The index of the window, ordered front to back.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("index"))
+        return list(XABackends.element_values(self.xa_elem, "index"))
 
     def closeable(self) -> list["bool"]:
         """Whether the window has a close box.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("closeable"))
+        return list(XABackends.element_values(self.xa_elem, "closeable"))
 
     def minimizable(self) -> list["bool"]:
         """Whether the window can be minimized.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("minimizable"))
+        return list(XABackends.element_values(self.xa_elem, "minimizable"))
 
     def minimized(self) -> list["bool"]:
         """Whether the window is currently minimized.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("minimized"))
+        return list(XABackends.element_values(self.xa_elem, "minimized"))
 
     def resizable(self) -> list["bool"]:
         """Whether the window can be resized.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("resizable"))
+        return list(XABackends.element_values(self.xa_elem, "resizable"))
 
     def visible(self) -> list["bool"]:
         """Whether the window is currently visible.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("visible"))
+        return list(XABackends.element_values(self.xa_elem, "visible"))
 
     def zoomable(self) -> list["bool"]:
         """Whether the window can be zoomed.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomable"))
+        return list(XABackends.element_values(self.xa_elem, "zoomable"))
 
     def zoomed(self) -> list[bool]:
         """Whether the window is currently zoomed.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomed"))
+        return list(XABackends.element_values(self.xa_elem, "zoomed"))
 
     def active_tab(self) -> list["XAArcTab"]:
         """Returns the currently selected tab
@@ -236,14 +237,14 @@ class XAArcWindowList(XABaseScriptable.XASBWindowList):
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("incognito"))
+        return list(XABackends.element_values(self.xa_elem, "incognito"))
 
     def mode(self) -> list["XAArcApplication.WindowMode"]:
         """Represents the mode of the window which can be 'normal' or 'incognito', can be set only once during creation of the window.
 
         .. versionadded:: 0.3.0
         """
-        ls = list(self.xa_elem.arrayByApplyingSelector_("mode"))
+        ls = list(XABackends.element_values(self.xa_elem, "mode"))
         return [XAArcApplication.WindowMode(mode) for mode in ls]
 
     def by_id(self, id: str) -> "XAArcWindow":
@@ -506,21 +507,21 @@ class XAArcTabList(XABase.XAList):
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("id"))
+        return list(XABackends.element_values(self.xa_elem, "id"))
 
     def title(self) -> list["str"]:
         """The full title of the tab.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def url(self) -> list["XABase.XAURLList"]:
         """The url of the tab.
 
         .. versionadded:: 0.3.0
         """
-        ls = list(self.xa_elem.arrayByApplyingSelector_("URL"))
+        ls = list(XABackends.element_values(self.xa_elem, "URL"))
         return self._new_element(ls, XABase.XAURLList)
 
     def loading(self) -> list["bool"]:
@@ -528,14 +529,14 @@ class XAArcTabList(XABase.XAList):
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("loading"))
+        return list(XABackends.element_values(self.xa_elem, "loading"))
 
     def location(self) -> list["XAArcApplication.TabLocation"]:
         """Represents the location of the tab in the sidebar. Can be 'topApp', 'pinned', or 'unpinned'.
 
         .. versionadded:: 0.3.0
         """
-        ls = list(self.xa_elem.arrayByApplyingSelector_("location"))
+        ls = list(XABackends.element_values(self.xa_elem, "location"))
         return [XAArcApplication.TabLocation(location) for location in ls]
 
     def by_id(self, id: str) -> "XAArcTab":
@@ -698,14 +699,14 @@ class XAArcSpaceList(XABase.XAList):
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("id"))
+        return list(XABackends.element_values(self.xa_elem, "id"))
 
     def title(self) -> list["str"]:
         """The full title of the space.
 
         .. versionadded:: 0.3.0
         """
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def by_id(self, id: str) -> "XAArcSpace":
         """Retrieves the A spacewhose id matches the given id.
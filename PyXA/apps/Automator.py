@@ -9,6 +9,7 @@ from typing import Any, Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath
 
@@ -80,6 +81,7 @@ class XAAutomatorApplication(XABaseScriptable.XASBApplication, XACanOpenPath):
         )
         return self.workflows()[0]
 
+    @XABase._xa_batched()
     def add(
         self,
         action: "XAAutomatorAction",
@@ -277,13 +279,13 @@ class XAAutomatorDocumentList(XABase.XAList):
         super().__init__(properties, XAAutomatorDocument, filter)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def by_id(self, id: int) -> Union["XAAutomatorDocument", None]:
         return self.by_property("id", id)
@@ -350,74 +352,76 @@ class XAAutomatorActionList(XABase.XAList):
         super().__init__(properties, XAAutomatorAction, filter)
 
     def bundle_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bundleId") or [])
+        return list(XABackends.element_values(self.xa_elem, "bundleId") or [])
 
     def category(self) -> list[list[str]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("category") or [])
+        return list(XABackends.element_values(self.xa_elem, "category") or [])
 
     def comment(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("comment") or [])
+        return list(XABackends.element_values(self.xa_elem, "comment") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def execution_error_message(self) -> list[str]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("executionErrorMessage") or []
+            XABackends.element_values(self.xa_elem, "executionErrorMessage") or []
         )
 
     def execution_error_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("executionErrorNumber") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "executionErrorNumber") or []
+        )
 
     def execution_result(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("executionResult") or [])
+        return list(XABackends.element_values(self.xa_elem, "executionResult") or [])
 
     def icon_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("iconName") or [])
+        return list(XABackends.element_values(self.xa_elem, "iconName") or [])
 
     def ignores_input(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ignoresInput") or [])
+        return list(XABackends.element_values(self.xa_elem, "ignoresInput") or [])
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def input_types(self) -> list[list[str]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("inputTypes") or [])
+        return list(XABackends.element_values(self.xa_elem, "inputTypes") or [])
 
     def keywords(self) -> list[list[str]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("keywords") or [])
+        return list(XABackends.element_values(self.xa_elem, "keywords") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def output_types(self) -> list[list[str]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("outputTypes") or [])
+        return list(XABackends.element_values(self.xa_elem, "outputTypes") or [])
 
     def parent_workflow(self) -> "XAAutomatorWorkflowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("parentWorkflow") or []
+        ls = XABackends.element_values(self.xa_elem, "parentWorkflow") or []
         return self._new_element(ls, XAAutomatorWorkflowList)
 
     def path(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("path") or [])
+        return list(XABackends.element_values(self.xa_elem, "path") or [])
 
     def show_action_when_run(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("showActionWhenRun") or [])
+        return list(XABackends.element_values(self.xa_elem, "showActionWhenRun") or [])
 
     def target_application(self) -> list[list[str]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("targetApplication") or [])
+        return list(XABackends.element_values(self.xa_elem, "targetApplication") or [])
 
     def version(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("version") or [])
+        return list(XABackends.element_values(self.xa_elem, "version") or [])
 
     def warning_action(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("warningAction") or [])
+        return list(XABackends.element_values(self.xa_elem, "warningAction") or [])
 
     def warning_level(self) -> list[XAAutomatorApplication.WarningLevel]:
-        ls = self.xa_elem.arrayByApplyingSelector_("warningLevel") or []
+        ls = XABackends.element_values(self.xa_elem, "warningLevel") or []
         return [XAAutomatorApplication.WarningLevel(x) for x in ls]
 
     def warning_message(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("warningMessage") or [])
+        return list(XABackends.element_values(self.xa_elem, "warningMessage") or [])
 
     def by_bundle_id(self, bundle_id: str) -> Union["XAAutomatorAction", None]:
         return self.by_property("bundleId", bundle_id)
@@ -703,16 +707,16 @@ class XAAutomatorRequiredResourceList(XABase.XAList):
         super().__init__(properties, XAAutomatorRequiredResource, filter)
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def resource(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("resource") or [])
+        return list(XABackends.element_values(self.xa_elem, "resource") or [])
 
     def version(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("version") or [])
+        return list(XABackends.element_values(self.xa_elem, "version") or [])
 
     def by_kind(self, kind: str) -> Union["XAAutomatorRequiredResource", None]:
         return self.by_property("kind", kind)
@@ -777,13 +781,13 @@ class XAAutomatorSettingList(XABase.XAList):
         super().__init__(properties, XAAutomatorSetting, filter)
 
     def default_value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("defaultValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "defaultValue") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def by_default_value(self, default_value: Any) -> Union["XAAutomatorSetting", None]:
         if isinstance(default_value, XABase.XAObject):
@@ -848,13 +852,13 @@ class XAAutomatorVariableList(XABase.XAList):
         super().__init__(properties, XAAutomatorVariable, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def settable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("settable") or [])
+        return list(XABackends.element_values(self.xa_elem, "settable") or [])
 
     def value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def by_name(self, name: str) -> Union["XAAutomatorVariable", None]:
         return self.by_property("name", name)
@@ -921,25 +925,27 @@ class XAAutomatorWorkflowList(XABase.XAList):
         super().__init__(properties, XAAutomatorWorkflow, filter)
 
     def current_action(self) -> XAAutomatorActionList:
-        ls = self.xa_elem.arrayByApplyingSelector_("currentAction") or []
+        ls = XABackends.element_values(self.xa_elem, "currentAction") or []
         return self._new_element(ls, XAAutomatorActionList)
 
     def execution_error_message(self) -> list[str]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("executionErrorMessage") or []
+            XABackends.element_values(self.xa_elem, "executionErrorMessage") or []
         )
 
     def execution_error_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("executionErrorNumber") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "executionErrorNumber") or []
+        )
 
     def execution_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("executionId") or [])
+        return list(XABackends.element_values(self.xa_elem, "executionId") or [])
 
     def execution_result(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("executionResult") or [])
+        return list(XABackends.element_values(self.xa_elem, "executionResult") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_current_action(
         self, current_action: XAAutomatorAction
@@ -1050,6 +1056,7 @@ class XAAutomatorWorkflow(XAAutomatorDocument):
             self.xa_elem.variables(), XAAutomatorVariableList, filter
         )
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Closes the workflow.
 
@@ -9,6 +9,7 @@ from typing import Union, Any
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
     XACanOpenPath,
@@ -226,52 +227,52 @@ class XABikeDocumentList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
         super().__init__(properties, XABikeDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("url") or []
+        ls = XABackends.element_values(self.xa_elem, "url") or []
         return [XABase.XAURL(x) for x in ls]
 
     def root_row(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("rootRow") or []
+        ls = XABackends.element_values(self.xa_elem, "rootRow") or []
         return self._new_element(ls, XABikeRowList)
 
     def entireContents(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("entireContents") or []
+        ls = XABackends.element_values(self.xa_elem, "entireContents") or []
         ls = [row for contents in ls for row in contents]
         return self._new_element(ls, XABikeRowList)
 
     def focused_row(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("focusedRow") or []
+        ls = XABackends.element_values(self.xa_elem, "focusedRow") or []
         return self._new_element(ls, XABikeRowList)
 
     def hoisted_row(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("hoistedRow") or []
+        ls = XABackends.element_values(self.xa_elem, "hoistedRow") or []
         return self._new_element(ls, XABikeRowList)
 
     def edit_mode(self) -> list[XABikeApplication.EditMode]:
-        ls = self.xa_elem.arrayByApplyingSelector_("editMode") or []
+        ls = XABackends.element_values(self.xa_elem, "editMode") or []
         return [XABikeApplication.EditMode(XABase.OSType(x.stringValue())) for x in ls]
 
     def selected_text(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("selectedText") or [])
+        return list(XABackends.element_values(self.xa_elem, "selectedText") or [])
 
     def selection_row(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("selectionRow") or []
+        ls = XABackends.element_values(self.xa_elem, "selectionRow") or []
         return self._new_element(ls, XABikeRowList)
 
     def selection_rows(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("selectionRows") or []
+        ls = XABackends.element_values(self.xa_elem, "selectionRows") or []
         ls = [row for contents in ls for row in contents]
         return self._new_element(ls, XABikeRowList)
 
@@ -585,60 +586,60 @@ class XABikeRowList(XABase.XAList):
         super().__init__(properties, XABikeRow, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def type(self) -> list[XABikeApplication.RowType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("type") or []
+        ls = XABackends.element_values(self.xa_elem, "type") or []
         return [XABikeApplication.RowType(XABase.OSType(x.stringValue())) for x in ls]
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("url") or []
+        ls = XABackends.element_values(self.xa_elem, "url") or []
         return [XABase.XAURL(x) for x in ls]
 
     def level(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("level") or [])
+        return list(XABackends.element_values(self.xa_elem, "level") or [])
 
     def contains_rows(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("containsRows") or [])
+        return list(XABackends.element_values(self.xa_elem, "containsRows") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def container(self) -> list[Union[XABikeDocument, "XABikeRow"]]:
         return [x.container for x in self]
 
     def container_document(self) -> XABikeDocument:
-        ls = self.xa_elem.arrayByApplyingSelector_("containerDocument") or []
+        ls = XABackends.element_values(self.xa_elem, "containerDocument") or []
         return self._new_element(ls, XABikeDocumentList)
 
     def container_row(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("containerRow") or []
+        ls = XABackends.element_values(self.xa_elem, "containerRow") or []
         return self._new_element(ls, XABikeRowList)
 
     def prev_sibling_row(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("prevSiblingRow") or []
+        ls = XABackends.element_values(self.xa_elem, "prevSiblingRow") or []
         return self._new_element(ls, XABikeRowList)
 
     def next_sibling_row(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("nextSiblingRow") or []
+        ls = XABackends.element_values(self.xa_elem, "nextSiblingRow") or []
         return self._new_element(ls, XABikeRowList)
 
     def entire_contents(self) -> "XABikeRowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("entireContents") or []
+        ls = XABackends.element_values(self.xa_elem, "entireContents") or []
         ls = [item for contents in ls for item in contents]
         return self._new_element(ls, XABikeRowList)
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def selected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("selected") or [])
+        return list(XABackends.element_values(self.xa_elem, "selected") or [])
 
     def expanded(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("expanded") or [])
+        return list(XABackends.element_values(self.xa_elem, "expanded") or [])
 
     def collapsed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("collapsed") or [])
+        return list(XABackends.element_values(self.xa_elem, "collapsed") or [])
 
     def by_id(self, id: str) -> Union["XABikeRow", None]:
         return self.by_property("id", id)
@@ -712,7 +713,7 @@ class XABikeRowList(XABase.XAList):
 
         .. versionadded:: 0.3.0
         """
-        ls = self.xa_elem.arrayByApplyingSelector_("rows") or []
+        ls = XABackends.element_values(self.xa_elem, "rows") or []
         ls = [row for row in ls]
         return self._new_element(ls, XABikeRowList)
 
@@ -724,10 +725,11 @@ class XABikeRowList(XABase.XAList):
 
         .. versionadded:: 0.3.0
         """
-        ls = self.xa_elem.arrayByApplyingSelector_("attributes") or []
+        ls = XABackends.element_values(self.xa_elem, "attributes") or []
         ls = [attribute for attribute in ls]
         return self._new_element(ls, XABikeAttributeList)
 
+    @XABase._xa_batched("delete")
     def delete(self) -> None:
         """Deletes all rows in the list.
 
@@ -877,6 +879,7 @@ class XABikeRow(XABase.XAObject, XADeletable):
         """True if this row is collapsed in the window."""
         return self.xa_elem.collapsed()
 
+    @XABase._xa_batched("delete")
     def delete(self) -> None:
         """Deletes the row.
 
@@ -904,6 +907,7 @@ class XABikeRow(XABase.XAObject, XADeletable):
         """
         self.xa_elem.expandAll_(all)
 
+    @XABase._xa_batched("move")
     def move_to(self, location: "XABikeRow"):
         """Makes the row a child of the specified row.
 
@@ -923,6 +927,7 @@ class XABikeRow(XABase.XAObject, XADeletable):
         """
         self.xa_elem.moveTo_(location.xa_elem)
 
+    @XABase._xa_batched()
     def duplicate(
         self,
         location: Union[XABikeDocument, "XABikeRow", None] = None,
@@ -996,13 +1001,13 @@ class XABikeAttributeList(XABase.XAList):
         super().__init__(properties, XABikeAttribute, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def value(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def container_row(self) -> XABikeRowList:
-        ls = self.xa_elem.arrayByApplyingSelector_("containerRow") or []
+        ls = XABackends.element_values(self.xa_elem, "containerRow") or []
         return self._new_element(ls, XABikeRowList)
 
     def by_name(self, name: str) -> Union["XABikeAttribute", None]:
@@ -6,6 +6,7 @@ import EventKit
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath
 
@@ -414,17 +415,17 @@ class XACalendarDocumentList(XABase.XAList):
         super().__init__(properties, XACalendarDocument, filter)
 
     def properties(self) -> list[dict]:
-        ls = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        ls = XABackends.element_values(self.xa_elem, "properties") or []
         return [dict(x) for x in ls]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def by_properties(self, properties: dict) -> Union["XACalendarDocument", None]:
@@ -498,10 +499,10 @@ class XACalendarCalendarList(XABase.XAList):
         return properties_list
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("color") or []
+        ls = XABackends.element_values(self.xa_elem, "color") or []
         return [XABase.XAColor(x) for x in ls]
 
     # ! BROKEN -- This seems to be a problem with Calendar.app
@@ -509,13 +510,13 @@ class XACalendarCalendarList(XABase.XAList):
     # return [calendar.get().calendarIdentifier() for calendar in self.xa_elem]
 
     def writable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("writable") or [])
+        return list(XABackends.element_values(self.xa_elem, "writable") or [])
 
     def description(self) -> list[str]:
         return [x.description() for x in self.xa_elem]
 
     def events(self) -> "XACalendarEventList":
-        ls = self.xa_elem.arrayByApplyingSelector_("events") or []
+        ls = XABackends.element_values(self.xa_elem, "events") or []
         return self._new_element(ls, XACalendarEventList)
 
     def by_properties(self, properties: dict) -> Union["XACalendarCalendar", None]:
@@ -625,6 +626,7 @@ class XACalendarCalendar(XABase.XAObject):
     def description(self, description: str):
         self.set_property("description", description)
 
+    @XABase._xa_batched("delete")
     def delete(self) -> "XACalendarEvent":
         """Deletes the calendar.
 
@@ -829,16 +831,16 @@ class XACalendarAttendeeList(XABase.XAList):
         super().__init__(properties, XACalendarEvent, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def display_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayName") or [])
 
     def email(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("email") or [])
+        return list(XABackends.element_values(self.xa_elem, "email") or [])
 
     def participation_status(self) -> list[XACalendarApplication.ParticipationStatus]:
-        ls = self.xa_elem.arrayByApplyingSelector_("participationStatus") or []
+        ls = XABackends.element_values(self.xa_elem, "participationStatus") or []
         return [
             XACalendarApplication.ParticipationStatus(XABase.OSType(x.stringValue()))
             for x in ls
@@ -935,44 +937,44 @@ class XACalendarEventList(XABase.XAList):
         return [event.description() for event in self.xa_elem]
 
     def start_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("startDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "startDate") or [])
 
     def end_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("endDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "endDate") or [])
 
     def allday_event(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("alldayEvent") or [])
+        return list(XABackends.element_values(self.xa_elem, "alldayEvent") or [])
 
     def recurrence(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("recurrence") or [])
+        return list(XABackends.element_values(self.xa_elem, "recurrence") or [])
 
     def sequence(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sequence") or [])
+        return list(XABackends.element_values(self.xa_elem, "sequence") or [])
 
     def stamp_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("stampDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "stampDate") or [])
 
     def excluded_dates(self) -> list[list[datetime]]:
         return [list(event.excludedDates() or []) for event in self.xa_elem]
 
     def status(self) -> list[XACalendarApplication.EventStatus]:
-        ls = self.xa_elem.arrayByApplyingSelector_("status") or []
+        ls = XABackends.element_values(self.xa_elem, "status") or []
         return [
             XACalendarApplication.EventStatus(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def summary(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("summary") or [])
+        return list(XABackends.element_values(self.xa_elem, "summary") or [])
 
     def location(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("location") or [])
+        return list(XABackends.element_values(self.xa_elem, "location") or [])
 
     def uid(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("uid") or [])
+        return list(XABackends.element_values(self.xa_elem, "uid") or [])
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("url") or []
+        ls = XABackends.element_values(self.xa_elem, "url") or []
         return [XABase.XAURL(url) for url in ls if url is not None]
 
     def by_properties(self, properties: dict) -> Union["XACalendarEvent", None]:
@@ -1226,6 +1228,7 @@ class XACalendarEvent(XABase.XAObject):
         self.xa_elem.show()
         return self
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes the event.
 
@@ -1235,6 +1238,7 @@ class XACalendarEvent(XABase.XAObject):
             self.xa_event_obj, EventKit.EKSpanThisEvent, None
         )
 
+    @XABase._xa_batched()
     def duplicate(self) -> "XACalendarEvent":
         """Duplicates the event, placing the copy on the same calendar.
 
@@ -1254,6 +1258,7 @@ class XACalendarEvent(XABase.XAObject):
 
         return parent.events().by_uid(new_event.calendarItemIdentifier())
 
+    @XABase._xa_batched()
     def duplicate_to(self, calendar: XACalendarCalendar) -> "XACalendarEvent":
         """Duplicates the event, placing the copy on the same calendar.
 
@@ -1283,6 +1288,7 @@ class XACalendarEvent(XABase.XAObject):
         )
         return calendar.events().by_uid(new_event.calendarItemIdentifier())
 
+    @XABase._xa_batched("move")
     def move_to(self, calendar: XACalendarCalendar) -> "XACalendarEvent":
         """Moves this event to the specified calendar.
 
@@ -1377,21 +1383,21 @@ class XACalendarAttachmentList(XABase.XAList):
         super().__init__(properties, XACalendarAttachment, filter)
 
     def type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("contentType") or [])
+        return list(XABackends.element_values(self.xa_elem, "contentType") or [])
 
     def file_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileName") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("urlOnDisk") or []
+        ls = XABackends.element_values(self.xa_elem, "urlOnDisk") or []
         return [XABase.XAPath(x) for x in ls]
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAURL(x) for x in ls]
 
     def uuid(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("UUID") or [])
+        return list(XABackends.element_values(self.xa_elem, "UUID") or [])
 
     def by_type(self, type: str) -> Union["XACalendarAttachment", None]:
         return self.by_property("contentType", type)
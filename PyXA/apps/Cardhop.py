@@ -10,6 +10,7 @@ import AppKit
 from ScriptingBridge import SBElementArray
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
     XACanOpenPath,
@@ -109,13 +110,13 @@ class XACardhopDocumentList(XABase.XAList, XAPrintable, XAClipboardCodable):
         super().__init__(properties, XACardhopDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def by_name(self, name: str) -> Union["XACardhopDocument", None]:
@@ -9,6 +9,7 @@ from enum import Enum
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath, XAClipboardCodable
 
@@ -316,17 +317,17 @@ class XAChromiumTabList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAChromiumTab, filter)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAURL(x) for x in ls]
 
     def loading(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("loading") or [])
+        return list(XABackends.element_values(self.xa_elem, "loading") or [])
 
     def by_id(self, id: int) -> Union['XAChromiumTab', None]:
         return self.by_property("id", id)
@@ -519,6 +520,7 @@ class XAChromiumTab(XABase.XAObject, XAClipboardCodable):
         """
         return self.xa_elem.executeJavascript_(script)
 
+    @XABase._xa_batched("move")
     def move_to(self, window: 'XAChromiumWindow') -> 'XAChromiumWindow':
         """Moves the tab to the specified window. After, the tab will exist in only one location.
 
@@ -549,6 +551,7 @@ class XAChromiumTab(XABase.XAObject, XAClipboardCodable):
         current.close()
         return self
 
+    @XABase._xa_batched()
     def duplicate_to(self, window: 'XAChromiumWindow') -> 'XAChromiumWindow':
         """Duplicates the tab in the specified window. The tab will then exist in two locations.
 
@@ -609,13 +612,13 @@ class XAChromiumBookmarkFolderList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAChromiumBookmarkFolder, filter)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def by_id(self, id: int) -> Union['XAChromiumBookmarkFolder', None]:
         return self.by_property("id", id)
@@ -697,6 +700,7 @@ class XAChromiumBookmarkFolder(XABase.XAObject, XAClipboardCodable):
         """
         return self._new_element(self.xa_elem.bookmarkItems(), XAChromiumBookmarkItemList, filter)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the bookmark folder.
 
@@ -733,17 +737,17 @@ class XAChromiumBookmarkItemList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAChromiumBookmarkItem, filter)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAURL(x) for x in ls]
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def by_id(self, id: int) -> Union['XAChromiumBookmarkItem', None]:
         return self.by_property("id", id)
@@ -820,6 +824,7 @@ class XAChromiumBookmarkItem(XABase.XAObject, XAClipboardCodable):
         """
         return self.xa_elem.index()
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the bookmark.
 
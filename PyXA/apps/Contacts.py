@@ -9,6 +9,7 @@ from typing import Any, Union
 import AppKit
 
 from PyXA import XABase, XAEvents
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath
 
@@ -267,13 +268,13 @@ class XAContactsDocumentList(XABase.XAList):
         super().__init__(properties, XAContactsDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAURL(x) for x in ls]
 
     def by_name(self, name: str) -> Union["XAContactsDocument", None]:
@@ -326,31 +327,31 @@ class XAContactsAddressList(XABase.XAList):
         super().__init__(properties, XAContactsAddress, filter)
 
     def city(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("city") or [])
+        return list(XABackends.element_values(self.xa_elem, "city") or [])
 
     def formatted_address(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("formattedAddress") or [])
+        return list(XABackends.element_values(self.xa_elem, "formattedAddress") or [])
 
     def street(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("street") or [])
+        return list(XABackends.element_values(self.xa_elem, "street") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def zip(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zip") or [])
+        return list(XABackends.element_values(self.xa_elem, "zip") or [])
 
     def country(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("country") or [])
+        return list(XABackends.element_values(self.xa_elem, "country") or [])
 
     def label(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("label") or [])
+        return list(XABackends.element_values(self.xa_elem, "label") or [])
 
     def country_code(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("countryCode") or [])
+        return list(XABackends.element_values(self.xa_elem, "countryCode") or [])
 
     def state(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("state") or [])
+        return list(XABackends.element_values(self.xa_elem, "state") or [])
 
     def by_city(self, city: str) -> Union["XAContactsAddress", None]:
         return self.by_property("city", city)
@@ -484,13 +485,13 @@ class XAContactsContactInfoList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def label(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("label") or [])
+        return list(XABackends.element_values(self.xa_elem, "label") or [])
 
     def value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def by_label(self, label: str) -> Union["XAContactsContactInfo", None]:
         return self.by_property("label", label)
@@ -600,16 +601,16 @@ class XAContactsEntryList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def creation_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "creationDate") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def selected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("selected") or [])
+        return list(XABackends.element_values(self.xa_elem, "selected") or [])
 
     def by_modification_date(
         self, modification_date: datetime
@@ -664,6 +665,7 @@ class XAContactsEntry(XABase.XAObject):
     def selected(self, selected: bool):
         self.set_property("selected", selected)
 
+    @XABase._xa_batched()
     def add_to(self, parent: XABase.XAObject) -> "XAContactsPerson":
         """Adds a child object to an entry.
 
@@ -703,6 +705,7 @@ class XAContactsEntry(XABase.XAObject):
         person = self.xa_elem.removeFrom_(elem.xa_elem)
         return self._new_element(person, XAContactsPerson)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes the entry. Only entries creates in the current session can be deleted.
 
@@ -726,7 +729,7 @@ class XAContactsGroupList(XAContactsEntryList):
         super().__init__(properties, filter, XAContactsGroup)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_name(self, name: str) -> Union["XAContactsGroup", None]:
         return self.by_property("name", name)
@@ -793,17 +796,17 @@ class XAContactsInstantMessageList(XAContactsContactInfoList):
         super().__init__(properties, filter, XAContactsInstantMessage)
 
     def service_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("serviceName") or [])
+        return list(XABackends.element_values(self.xa_elem, "serviceName") or [])
 
     def service_type(self) -> list[XAContactsApplication.ServiceType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("serviceType") or []
+        ls = XABackends.element_values(self.xa_elem, "serviceType") or []
         return [
             XAContactsApplication.ServiceType(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def user_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("userName") or [])
+        return list(XABackends.element_values(self.xa_elem, "userName") or [])
 
     def by_service_name(
         self, service_name: str
@@ -871,65 +874,65 @@ class XAContactsPersonList(XAContactsEntryList):
         super().__init__(properties, filter, XAContactsPerson)
 
     def nickname(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("nickname") or [])
+        return list(XABackends.element_values(self.xa_elem, "nickname") or [])
 
     def organization(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("organization") or [])
+        return list(XABackends.element_values(self.xa_elem, "organization") or [])
 
     def maiden_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("maidenName") or [])
+        return list(XABackends.element_values(self.xa_elem, "maidenName") or [])
 
     def suffix(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("suffix") or [])
+        return list(XABackends.element_values(self.xa_elem, "suffix") or [])
 
     def vcard(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("vcard") or [])
+        return list(XABackends.element_values(self.xa_elem, "vcard") or [])
 
     def home_page(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("homePage") or [])
+        return list(XABackends.element_values(self.xa_elem, "homePage") or [])
 
     def birth_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("birthdate") or [])
+        return list(XABackends.element_values(self.xa_elem, "birthdate") or [])
 
     def phonetic_last_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("phoneticLastName") or [])
+        return list(XABackends.element_values(self.xa_elem, "phoneticLastName") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def phonetic_middle_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("phoneticMiddleName") or [])
+        return list(XABackends.element_values(self.xa_elem, "phoneticMiddleName") or [])
 
     def department(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("department") or [])
+        return list(XABackends.element_values(self.xa_elem, "department") or [])
 
     def image(self) -> list[XABase.XAImage]:
-        ls = self.xa_elem.arrayByApplyingSelector_("image") or []
+        ls = XABackends.element_values(self.xa_elem, "image") or []
         return [XABase.XAImage(x) for x in ls]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def note(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("note") or [])
+        return list(XABackends.element_values(self.xa_elem, "note") or [])
 
     def company(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("company") or [])
+        return list(XABackends.element_values(self.xa_elem, "company") or [])
 
     def middle_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("middleName") or [])
+        return list(XABackends.element_values(self.xa_elem, "middleName") or [])
 
     def phonetic_first_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("phoneticFirstName") or [])
+        return list(XABackends.element_values(self.xa_elem, "phoneticFirstName") or [])
 
     def job_title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("jobTitle") or [])
+        return list(XABackends.element_values(self.xa_elem, "jobTitle") or [])
 
     def last_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("lastName") or [])
+        return list(XABackends.element_values(self.xa_elem, "lastName") or [])
 
     def first_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("firstName") or [])
+        return list(XABackends.element_values(self.xa_elem, "firstName") or [])
 
     def by_nickname(self, nickname: str) -> Union["XAContactsPerson", None]:
         return self.by_property("nickname", nickname)
@@ -1388,19 +1391,19 @@ class XAContactsSocialProfileList(XABase.XAList):
         super().__init__(properties, XAContactsSocialProfile, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def service_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("serviceName") or [])
+        return list(XABackends.element_values(self.xa_elem, "serviceName") or [])
 
     def user_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("userName") or [])
+        return list(XABackends.element_values(self.xa_elem, "userName") or [])
 
     def user_identifier(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("userIdentifier") or [])
+        return list(XABackends.element_values(self.xa_elem, "userIdentifier") or [])
 
     def url(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("URL") or [])
+        return list(XABackends.element_values(self.xa_elem, "URL") or [])
 
     def by_id(self, id: str) -> Union["XAContactsSocialProfile", None]:
         return self.by_property("id", id)
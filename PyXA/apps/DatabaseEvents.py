@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Any, Union
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath
 
@@ -191,14 +192,14 @@ class XADatabaseEventsDatabaseList(XABase.XAList):
         super().__init__(properties, XADatabaseEventsDatabase, filter)
 
     def location(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("location") or []
+        ls = XABackends.element_values(self.xa_elem, "location") or []
         return [XABase.XAPath(x) for x in ls]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def store_type(self) -> list[XADatabaseEventsApplication.StoreType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("storeType") or []
+        ls = XABackends.element_values(self.xa_elem, "storeType") or []
         return [
             XADatabaseEventsApplication.StoreType(XABase.OSType(x.stringValue()))
             for x in ls
@@ -247,6 +248,7 @@ class XADatabaseEventsDatabase(XABase.XAObject):
         """The type of storage used by the database; may be specified upon creation, but not thereafter; defaults to SQLite."""
         return XADatabaseEventsApplication.StoreType(self.xa_elem.storeType())
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes the database.
 
@@ -308,13 +310,13 @@ class XADatabaseEventsFieldList(XABase.XAList):
         super().__init__(properties, XADatabaseEventsField, filter)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def by_id(self, id: int) -> Union["XADatabaseEventsField", None]:
         return self.by_property("id", id)
@@ -357,6 +359,7 @@ class XADatabaseEventsField(XABase.XAObject):
     def value(self, value: Any):
         self.set_property("value", value)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes the field.
 
@@ -380,10 +383,10 @@ class XADatabaseEventsRecordList(XABase.XAList):
         super().__init__(properties, XADatabaseEventsRecord, filter)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_id(self, id: int) -> Union["XADatabaseEventsRecord", None]:
         return self.by_property("id", id)
@@ -414,6 +417,7 @@ class XADatabaseEventsRecord(XABase.XAObject):
         """The name of the record, equivalent to the value of the "name" field."""
         return self.xa_elem.name()
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes the record.
 
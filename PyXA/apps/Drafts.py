@@ -8,6 +8,7 @@ from typing import Union, Any
 from enum import Enum
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath
 
@@ -125,31 +126,31 @@ class XADraftsDraftList(XABase.XAList):
         super().__init__(properties, XADraftsDraft, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def content(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("content") or [])
+        return list(XABackends.element_values(self.xa_elem, "content") or [])
 
     def flagged(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("flagged") or [])
+        return list(XABackends.element_values(self.xa_elem, "flagged") or [])
 
     def tags(self) -> list[list[str]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("tags") or [])
+        return list(XABackends.element_values(self.xa_elem, "tags") or [])
 
     def created_at(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("createdAt") or [])
+        return list(XABackends.element_values(self.xa_elem, "createdAt") or [])
 
     def modified_at(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modifiedAt") or [])
+        return list(XABackends.element_values(self.xa_elem, "modifiedAt") or [])
 
     def accessed_at(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("accessedAt") or [])
+        return list(XABackends.element_values(self.xa_elem, "accessedAt") or [])
 
     def permalink(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("permalink") or [])
+        return list(XABackends.element_values(self.xa_elem, "permalink") or [])
 
     def by_id(self, id: str) -> Union["XADraftsDraft", None]:
         return self.by_property("id", id)
@@ -9,6 +9,7 @@ from typing import Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XAClipboardCodable, XACloseable, XADeletable, XAPrintable
 
@@ -182,13 +183,13 @@ class XAFantasticalDocumentList(XABase.XAList):
         super().__init__(properties, XAFantasticalDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def by_name(self, name: str) -> "XAFantasticalDocument":
@@ -307,10 +308,10 @@ class XAFantasticalCalendarList(XABase.XAList):
         super().__init__(properties, XAFantasticalCalendar, filter)
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def by_title(self, title: str) -> "XAFantasticalCalendar":
         return self.by_property("title", title)
@@ -365,32 +366,32 @@ class XAFantasticalCalendarItemList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def start_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("startDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "startDate") or [])
 
     def end_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("endDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "endDate") or [])
 
     def notes(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("notes") or [])
+        return list(XABackends.element_values(self.xa_elem, "notes") or [])
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAURL(x) for x in ls]
 
     def show_url(self) -> list[XABase.XAURL]:
-        return list(self.xa_elem.arrayByApplyingSelector_("showURL") or [])
+        return list(XABackends.element_values(self.xa_elem, "showURL") or [])
 
     def is_recurring(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("isRecurring") or [])
+        return list(XABackends.element_values(self.xa_elem, "isRecurring") or [])
 
     def is_all_day(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("isAllDay") or [])
+        return list(XABackends.element_values(self.xa_elem, "isAllDay") or [])
 
     def by_id(self, id: str) -> "XAFantasticalCalendarItem":
         return self.by_property("id", id)
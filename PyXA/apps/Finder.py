@@ -12,6 +12,7 @@ import AppKit
 from ScriptingBridge import SBObject
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType, XAImage, XAList
 from PyXA import XABaseScriptable
 from PyXA.XAProtocols import (
@@ -705,89 +706,89 @@ class XAFinderItemList(XABase.XAList):
         super().__init__(properties, object_class, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def displayed_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayedName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayedName") or [])
 
     def name_extension(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("nameExtension") or [])
+        return list(XABackends.element_values(self.xa_elem, "nameExtension") or [])
 
     def extension_hidden(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("extensionHidden") or [])
+        return list(XABackends.element_values(self.xa_elem, "extensionHidden") or [])
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def position(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("position") or [])
+        return list(XABackends.element_values(self.xa_elem, "position") or [])
 
     def desktop_position(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("desktopPosition") or [])
+        return list(XABackends.element_values(self.xa_elem, "desktopPosition") or [])
 
     def bounds(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bounds") or [])
+        return list(XABackends.element_values(self.xa_elem, "bounds") or [])
 
     def label_index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("labelIndex") or [])
+        return list(XABackends.element_values(self.xa_elem, "labelIndex") or [])
 
     def locked(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("locked") or [])
+        return list(XABackends.element_values(self.xa_elem, "locked") or [])
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("description") or [])
+        return list(XABackends.element_values(self.xa_elem, "description") or [])
 
     def comment(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("comment") or [])
+        return list(XABackends.element_values(self.xa_elem, "comment") or [])
 
     def size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
     def physical_size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("physicalSize") or [])
+        return list(XABackends.element_values(self.xa_elem, "physicalSize") or [])
 
     def creation_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "creationDate") or [])
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def url(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAPath(x[7:]) for x in ls]
 
     def owner(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("owner") or [])
+        return list(XABackends.element_values(self.xa_elem, "owner") or [])
 
     def group(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("group") or [])
+        return list(XABackends.element_values(self.xa_elem, "group") or [])
 
     def owner_privileges(self) -> list[XAFinderApplication.PrivacySetting]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ownerPrivileges") or [])
+        return list(XABackends.element_values(self.xa_elem, "ownerPrivileges") or [])
 
     def group_privileges(self) -> list[XAFinderApplication.PrivacySetting]:
-        return list(self.xa_elem.arrayByApplyingSelector_("groupPrivileges") or [])
+        return list(XABackends.element_values(self.xa_elem, "groupPrivileges") or [])
 
     def everyone_privileges(self) -> list[XAFinderApplication.PrivacySetting]:
-        return list(self.xa_elem.arrayByApplyingSelector_("everyonePrivileges") or [])
+        return list(XABackends.element_values(self.xa_elem, "everyonePrivileges") or [])
 
     def container(self) -> "XAFinderContainerList":
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XAFinderContainerList)
 
     def disk(self) -> "XAFinderDiskList":
-        ls = self.xa_elem.arrayByApplyingSelector_("disk") or []
+        ls = XABackends.element_values(self.xa_elem, "disk") or []
         return self._new_element(ls, XAFinderDiskList)
 
     def icon(self) -> XABase.XAImageList:
-        ls = self.xa_elem.arrayByApplyingSelector_("icon") or []
+        ls = XABackends.element_values(self.xa_elem, "icon") or []
         return self._new_element(ls, XABase.XAImageList)
 
     def information_window(self) -> "XAFinderInformationWindowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("informationWindow") or []
+        ls = XABackends.element_values(self.xa_elem, "informationWindow") or []
         return self._new_element(ls, XAFinderInformationWindowList)
 
     def by_name(self, name: str) -> Union["XAFinderItem", None]:
@@ -1175,6 +1176,7 @@ class XAFinderItem(XABase.XAObject, XASelectable, XADeletable, XAClipboardCodabl
         self.set_clipboard(url)
         return self
 
+    @XABase._xa_batched("move")
     def move_to(
         self, new_path: Union[str, AppKit.NSURL], overwrite: bool = False
     ) -> "XAFinderItem":
@@ -1244,11 +1246,11 @@ class XAFinderContainerList(XAFinderItemList):
         super().__init__(properties, filter, object_class)
 
     def entire_contents(self) -> "XAFinderItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("entireContents") or []
+        ls = XABackends.element_values(self.xa_elem, "entireContents") or []
         return self._new_element(ls, XAFinderItemList)
 
     def container_window(self) -> "XAFinderFinderWindowList":
-        ls = self.xa_elem.arrayByApplyingSelector_("containerWindow") or []
+        ls = XABackends.element_values(self.xa_elem, "containerWindow") or []
 
         parent = self.xa_prnt
         while not hasattr(parent, "xa_wcls"):
@@ -1259,58 +1261,58 @@ class XAFinderContainerList(XAFinderItemList):
 
     def items(self) -> XAFinderItemList:
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("items") or [], XAFinderItemList
+            XABackends.element_values(self.xa_elem, "items") or [], XAFinderItemList
         )
 
     def containers(self) -> "XAFinderContainerList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("containers") or [],
+            XABackends.element_values(self.xa_elem, "containers") or [],
             XAFinderContainerList,
         )
 
     def folders(self) -> "XAFinderFolderList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("folders") or [], XAFinderFolderList
+            XABackends.element_values(self.xa_elem, "folders") or [], XAFinderFolderList
         )
 
     def files(self) -> "XAFinderFileList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("files") or [], XAFinderFileList
+            XABackends.element_values(self.xa_elem, "files") or [], XAFinderFileList
         )
 
     def alias_files(self) -> "XAFinderAliasFileList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("aliasFiles") or [],
+            XABackends.element_values(self.xa_elem, "aliasFiles") or [],
             XAFinderAliasFileList,
         )
 
     def application_files(self) -> "XAFinderApplicationFileList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("applicationFiles") or [],
+            XABackends.element_values(self.xa_elem, "applicationFiles") or [],
             XAFinderApplicationFileList,
         )
 
     def document_files(self) -> "XAFinderDocumentFileList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("documentFiles") or [],
+            XABackends.element_values(self.xa_elem, "documentFiles") or [],
             XAFinderDocumentFileList,
         )
 
     def internet_location_files(self) -> "XAFinderInternetLocationFileList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("internetLocationFiles") or [],
+            XABackends.element_values(self.xa_elem, "internetLocationFiles") or [],
             XAFinderInternetLocationFileList,
         )
 
     def clippings(self) -> "XAFinderClippingList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("clippings") or [],
+            XABackends.element_values(self.xa_elem, "clippings") or [],
             XAFinderClippingList,
         )
 
     def packages(self) -> "XAFinderPackageList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("packages") or [], XAFinderPackageList
+            XABackends.element_values(self.xa_elem, "packages") or [], XAFinderPackageList
         )
 
     def by_entire_contents(
@@ -1444,31 +1446,31 @@ class XAFinderDiskList(XAFinderContainerList):
         super().__init__(properties, filter, XAFinderDisk)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def capacity(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("capacity") or [])
+        return list(XABackends.element_values(self.xa_elem, "capacity") or [])
 
     def free_space(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("freeSpace") or [])
+        return list(XABackends.element_values(self.xa_elem, "freeSpace") or [])
 
     def ejectable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ejectable") or [])
+        return list(XABackends.element_values(self.xa_elem, "ejectable") or [])
 
     def local_volume(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("localVolume") or [])
+        return list(XABackends.element_values(self.xa_elem, "localVolume") or [])
 
     def startup(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("startup") or [])
+        return list(XABackends.element_values(self.xa_elem, "startup") or [])
 
     def format(self) -> list[XAFinderApplication.ItemFormat]:
-        return list(self.xa_elem.arrayByApplyingSelector_("format") or [])
+        return list(XABackends.element_values(self.xa_elem, "format") or [])
 
     def journaling_enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("journalingEnabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "journalingEnabled") or [])
 
     def ignore_privileges(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ignorePrivileges") or [])
+        return list(XABackends.element_values(self.xa_elem, "ignorePrivileges") or [])
 
     def by_id(self, id: int) -> Union["XAFinderDisk", None]:
         return self.by_property("id", id)
@@ -1628,19 +1630,19 @@ class XAFinderFileList(XAFinderItemList):
         super().__init__(properties, filter, obj_class)
 
     def file_type(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileType") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileType") or [])
 
     def creator_type(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creatorType") or [])
+        return list(XABackends.element_values(self.xa_elem, "creatorType") or [])
 
     def stationery(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("stationery") or [])
+        return list(XABackends.element_values(self.xa_elem, "stationery") or [])
 
     def product_version(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("productVersion") or [])
+        return list(XABackends.element_values(self.xa_elem, "productVersion") or [])
 
     def version(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("version") or [])
+        return list(XABackends.element_values(self.xa_elem, "version") or [])
 
     def by_file_type(self, file_type: int) -> Union["XAFinderFile", None]:
         return self.by_property("fileType", file_type)
@@ -1717,7 +1719,7 @@ class XAFinderAliasFileList(XAFinderFileList):
         super().__init__(properties, filter, XAFinderAliasFile)
 
     def original_item(self) -> list[XAFinderItem]:
-        return list(self.xa_elem.arrayByApplyingSelector_("originalItem") or [])
+        return list(XABackends.element_values(self.xa_elem, "originalItem") or [])
 
     def by_original_item(
         self, original_item: XAFinderItem
@@ -1757,11 +1759,11 @@ class XAFinderApplicationFileList(XAFinderFileList):
         super().__init__(properties, filter, XAFinderApplicationFile)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def has_scripting_terminology(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("hasScriptingTerminology") or []
+            XABackends.element_values(self.xa_elem, "hasScriptingTerminology") or []
         )
 
     def by_id(self, id: str) -> Union["XAFinderApplicationFile", None]:
@@ -1827,7 +1829,7 @@ class XAFinderInternetLocationFileList(XAFinderFileList):
         super().__init__(properties, filter, XAFinderInternetLocationFile)
 
     def location(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("location") or [])
+        return list(XABackends.element_values(self.xa_elem, "location") or [])
 
     def by_location(self, location: str) -> Union["XAFinderInternetLocationFile", None]:
         return self.by_property("location", location)
@@ -1908,23 +1910,23 @@ class XAFinderWindowList(XABaseScriptable.XASBWindowList):
         super().__init__(properties, filter, obj_class)
 
     def position(self) -> list[XAPoint]:
-        ls = self.xa_elem.arrayByApplyingSelector_("position") or []
+        ls = XABackends.element_values(self.xa_elem, "position") or []
         return [XAPoint(value) for value in ls]
 
     def titled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("titled") or [])
+        return list(XABackends.element_values(self.xa_elem, "titled") or [])
 
     def floating(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("floating") or [])
+        return list(XABackends.element_values(self.xa_elem, "floating") or [])
 
     def modal(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modal") or [])
+        return list(XABackends.element_values(self.xa_elem, "modal") or [])
 
     def collapsed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("collapsed") or [])
+        return list(XABackends.element_values(self.xa_elem, "collapsed") or [])
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def by_position(self, position: tuple[int, int]) -> Union["XAFinderWindow", None]:
         return self.by_property("position", position)
@@ -2031,32 +2033,32 @@ class XAFinderFinderWindowList(XAFinderWindowList):
         self.xa_wcls = parent.xa_wcls
 
     def current_view(self) -> list[XAFinderApplication.ViewSetting]:
-        return list(self.xa_elem.arrayByApplyingSelector_("currentView") or [])
+        return list(XABackends.element_values(self.xa_elem, "currentView") or [])
 
     def toolbar_visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("toolbarVisible") or [])
+        return list(XABackends.element_values(self.xa_elem, "toolbarVisible") or [])
 
     def statusbar_visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("statusbarVisible") or [])
+        return list(XABackends.element_values(self.xa_elem, "statusbarVisible") or [])
 
     def pathbar_visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("pathbarVisible") or [])
+        return list(XABackends.element_values(self.xa_elem, "pathbarVisible") or [])
 
     def sidebar_width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sidebarWidth") or [])
+        return list(XABackends.element_values(self.xa_elem, "sidebarWidth") or [])
 
     def target(self) -> XAFinderContainerList:
-        ls = self.xa_elem.arrayByApplyingSelector_("target") or []
+        ls = XABackends.element_values(self.xa_elem, "target") or []
         return self._new_element(ls, XAFinderContainerList)
 
     def icon_view_options(self) -> list["XAFinderIconViewOptions"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("iconViewOptions") or [])
+        return list(XABackends.element_values(self.xa_elem, "iconViewOptions") or [])
 
     def list_view_options(self) -> list["XAFinderListViewOptions"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("listViewOptions") or [])
+        return list(XABackends.element_values(self.xa_elem, "listViewOptions") or [])
 
     def column_view_options(self) -> list["XAFinderColumnViewOptions"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("columnViewOptions") or [])
+        return list(XABackends.element_values(self.xa_elem, "columnViewOptions") or [])
 
     def by_current_view(
         self, current_view: XAFinderApplication.ViewSetting
@@ -2355,11 +2357,11 @@ class XAFinderInformationWindowList(XAFinderWindowList):
         super().__init__(properties, filter, XAFinderInformationWindow)
 
     def item(self) -> XAFinderItemList:
-        ls = self.xa_elem.arrayByApplyingSelector_("item") or []
+        ls = XABackends.element_values(self.xa_elem, "item") or []
         return self._new_element(ls, XAFinderItemList)
 
     def current_panel(self) -> list[XAFinderApplication.Panel]:
-        return list(self.xa_elem.arrayByApplyingSelector_("currentPanel") or [])
+        return list(XABackends.element_values(self.xa_elem, "currentPanel") or [])
 
     def by_item(self, item: XAFinderItem) -> Union["XAFinderInformationWindow", None]:
         return self.by_property("item", item)
@@ -2618,25 +2620,25 @@ class XAFinderColumnList(XABase.XAList):
         super().__init__(properties, XAFinderColumn, filter)
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def sort_direction(self) -> list[XAFinderApplication.SortDirection]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortDirection") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortDirection") or [])
 
     def width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("width") or [])
+        return list(XABackends.element_values(self.xa_elem, "width") or [])
 
     def minimum_width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("minimum_width") or [])
+        return list(XABackends.element_values(self.xa_elem, "minimum_width") or [])
 
     def maximum_width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("maximum_width") or [])
+        return list(XABackends.element_values(self.xa_elem, "maximum_width") or [])
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def by_index(self, index: int) -> Union["XAFinderColumn", None]:
         return self.by_property("index", index)
@@ -8,6 +8,7 @@ from typing import Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XAClipboardCodable
 
@@ -218,13 +219,13 @@ class XAFontBookDocumentList(XABase.XAList):
         super().__init__(properties, XAFontBookDocument, filter)
 
     def path(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("path") or [])
+        return list(XABackends.element_values(self.xa_elem, "path") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_path(self, path: str) -> "XAFontBookDocument":
         return self.by_property("path", path)
@@ -283,25 +284,25 @@ class XAFontBookFontFamilyList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAFontBookFontFamily, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def display_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayName") or [])
 
     def displayed_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayedName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayedName") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def duplicated(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("duplicated") or [])
+        return list(XABackends.element_values(self.xa_elem, "duplicated") or [])
 
     def files(self) -> list[list[XABase.XAPath]]:
-        ls = self.xa_elem.arrayByApplyingSelector_("files") or []
+        ls = XABackends.element_values(self.xa_elem, "files") or []
         return [XABase.XAURL(x) for x in [y for y in ls]]
 
     def by_properties(self, properties: dict) -> "XAFontBookFontFamily":
@@ -392,6 +393,7 @@ class XAFontBookFontFamily(XABase.XAObject, XAClipboardCodable):
         ls = self.xa_elem.files()
         return [XABase.XAPath(x) for x in ls]
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the typeface.
 
@@ -436,51 +438,51 @@ class XAFontBookTypefaceList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAFontBookTypeface, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def display_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayName") or [])
 
     def displayed_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayedName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayedName") or [])
 
     def font_family(self) -> XAFontBookFontFamilyList:
-        ls = self.xa_elem.arrayByApplyingSelector_("fontFamily") or []
+        ls = XABackends.element_values(self.xa_elem, "fontFamily") or []
         return self._new_element(ls, XAFontBookFontFamilyList)
 
     def family_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("familyName") or [])
+        return list(XABackends.element_values(self.xa_elem, "familyName") or [])
 
     def style_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("styleName") or [])
+        return list(XABackends.element_values(self.xa_elem, "styleName") or [])
 
     def post_script_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("postScriptName") or [])
+        return list(XABackends.element_values(self.xa_elem, "postScriptName") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def duplicated(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("duplicated") or [])
+        return list(XABackends.element_values(self.xa_elem, "duplicated") or [])
 
     def font_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fontType") or [])
+        return list(XABackends.element_values(self.xa_elem, "fontType") or [])
 
     def copyright(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("copyright") or [])
+        return list(XABackends.element_values(self.xa_elem, "copyright") or [])
 
     def font_container(self) -> "XAFontBookFontContainerList":
-        ls = self.xa_elem.arrayByApplyingSelector_("fontContainer") or []
+        ls = XABackends.element_values(self.xa_elem, "fontContainer") or []
         return self._new_element(ls, XAFontBookFontContainerList)
 
     def files(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("files") or []
+        ls = XABackends.element_values(self.xa_elem, "files") or []
         return [XABase.XAPath(x) for y in ls for x in y]
 
     def by_properties(self, properties: dict) -> "XAFontBookTypeface":
@@ -667,24 +669,24 @@ class XAFontBookFontContainerList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAFontBookFontContainer, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def path(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("path") or [])
+        return list(XABackends.element_values(self.xa_elem, "path") or [])
 
     def files(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("files") or []
+        ls = XABackends.element_values(self.xa_elem, "files") or []
         return [XABase.XAPath(x) for y in ls for x in y]
 
     def domain(self) -> "XAFontBookFontDomainList":
-        ls = self.xa_elem.arrayByApplyingSelector_("domain") or []
+        ls = XABackends.element_values(self.xa_elem, "domain") or []
         return self._new_element(ls, XAFontBookFontDomainList)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def by_properties(self, properties: dict) -> "XAFontBookFontContainer":
         return self.by_property("properties", properties)
@@ -821,19 +823,19 @@ class XAFontBookFontCollectionList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, obj_class, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def display_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayName") or [])
 
     def displayed_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayedName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayedName") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def by_properties(self, properties: dict) -> "XAFontBookFontCollection":
         return self.by_property("properties", properties)
@@ -10,6 +10,7 @@ from typing import Any, Literal, Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from PyXA.XAProtocols import XACanOpenPath, XACloseable
 from PyXA.XAEvents import event_from_str
@@ -138,83 +139,83 @@ class XAIINAPlayerList(XABase.XAList):
         super().__init__(properties, XAIINAPlayer, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def state(self) -> list[XAIINAApplication.PlayerState]:
-        ls = self.xa_elem.arrayByApplyingSelector_("state") or []
+        ls = XABackends.element_values(self.xa_elem, "state") or []
         return [
             XAIINAApplication.PlayerState(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def playback_speed(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("playbackSpeed") or [])
+        return list(XABackends.element_values(self.xa_elem, "playbackSpeed") or [])
 
     def file_loop(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileLoop") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileLoop") or [])
 
     def audio_volume(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("audioVolume") or [])
+        return list(XABackends.element_values(self.xa_elem, "audioVolume") or [])
 
     def muted(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("muted") or [])
+        return list(XABackends.element_values(self.xa_elem, "muted") or [])
 
     def position(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("position") or [])
+        return list(XABackends.element_values(self.xa_elem, "position") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("sampleRate") or []
+        ls = XABackends.element_values(self.xa_elem, "sampleRate") or []
         return [XABase.XAURL(x) for x in ls]
 
     def music_mode(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("musicMode") or [])
+        return list(XABackends.element_values(self.xa_elem, "musicMode") or [])
 
     def fullscreen(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fullscreen") or [])
+        return list(XABackends.element_values(self.xa_elem, "fullscreen") or [])
 
     def window(self) -> XABaseScriptable.XASBWindowList:
-        ls = self.xa_elem.arrayByApplyingSelector_("window") or []
+        ls = XABackends.element_values(self.xa_elem, "window") or []
         return self._new_element(ls, XABaseScriptable.XASBWindowList)
 
     def current_video_track(self) -> "XAIINAVideoTrackList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentVideoTrack") or []
+        ls = XABackends.element_values(self.xa_elem, "currentVideoTrack") or []
         return self._new_element(ls, XAIINAVideoTrackList)
 
     def current_audio_track(self) -> "XAIINAAudioTrackList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentAudioTrack") or []
+        ls = XABackends.element_values(self.xa_elem, "currentAudioTrack") or []
         return self._new_element(ls, XAIINAAudioTrackList)
 
     def current_subtitle_track(self) -> "XAIINASubtitleTrackList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentSubtitleTrack") or []
+        ls = XABackends.element_values(self.xa_elem, "currentSubtitleTrack") or []
         return self._new_element(ls, XAIINASubtitleTrackList)
 
     def second_subtitle_track(self) -> "XAIINASubtitleTrackList":
-        ls = self.xa_elem.arrayByApplyingSelector_("secondSubtitleTrack") or []
+        ls = XABackends.element_values(self.xa_elem, "secondSubtitleTrack") or []
         return self._new_element(ls, XAIINASubtitleTrackList)
 
     def aspect_ratio(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("aspectRatio") or [])
+        return list(XABackends.element_values(self.xa_elem, "aspectRatio") or [])
 
     def rotation(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rotation") or [])
+        return list(XABackends.element_values(self.xa_elem, "rotation") or [])
 
     def mirrored(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("mirrored") or [])
+        return list(XABackends.element_values(self.xa_elem, "mirrored") or [])
 
     def flipped(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("flipped") or [])
+        return list(XABackends.element_values(self.xa_elem, "flipped") or [])
 
     def pip(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("pip") or [])
+        return list(XABackends.element_values(self.xa_elem, "pip") or [])
 
     def current_playlist_item(self) -> "XAIINAPlaylistItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentPlaylistItem") or []
+        ls = XABackends.element_values(self.xa_elem, "currentPlaylistItem") or []
         return self._new_element(ls, XAIINAPlaylistItemList)
 
     def by_id(self, id: str) -> Union["XAIINAPlayer", None]:
@@ -635,23 +636,23 @@ class XAIINATrackList(XABase.XAList):
         super().__init__(properties, XAIINATrack, filter)
 
     def type(self) -> list[XAIINAApplication.TrackType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("type") or []
+        ls = XABackends.element_values(self.xa_elem, "type") or []
         return [XAIINAApplication.TrackType(XABase.OSType(x.stringValue())) for x in ls]
 
     def codec(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("codec") or [])
+        return list(XABackends.element_values(self.xa_elem, "codec") or [])
 
     def language(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("language") or [])
+        return list(XABackends.element_values(self.xa_elem, "language") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def info_string(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("infoString") or [])
+        return list(XABackends.element_values(self.xa_elem, "infoString") or [])
 
     def default(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("default") or [])
+        return list(XABackends.element_values(self.xa_elem, "default") or [])
 
     def by_type(self, type: XAIINAApplication.TrackType) -> Union["XAIINATrack", None]:
         return self.by_property("type", event_from_str(XABase.unOSType(type.value)))
@@ -724,13 +725,13 @@ class XAIINAVideoTrackList(XABase.XAList):
         super().__init__(properties, XAIINAVideoTrack, filter)
 
     def fps(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fps") or [])
+        return list(XABackends.element_values(self.xa_elem, "fps") or [])
 
     def width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("width") or [])
+        return list(XABackends.element_values(self.xa_elem, "width") or [])
 
     def height(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("height") or [])
+        return list(XABackends.element_values(self.xa_elem, "height") or [])
 
     def by_fps(self, fps: float) -> Union["XAIINAVideoTrack", None]:
         return self.by_property("fps", fps)
@@ -779,10 +780,10 @@ class XAIINAAudioTrackList(XABase.XAList):
         super().__init__(properties, XAIINAAudioTrack, filter)
 
     def sample_rate(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sampleRate") or [])
+        return list(XABackends.element_values(self.xa_elem, "sampleRate") or [])
 
     def channel_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("channelCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "channelCount") or [])
 
     def by_sample_rate(self, sample_rate: int) -> Union["XAIINAAudioTrack", None]:
         return self.by_property("sampleRate", sample_rate)
@@ -845,24 +846,24 @@ class XAIINAPlaylistItemList(XABase.XAList):
         super().__init__(properties, XAIINAPlaylistItem, filter)
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAURL(x) for x in ls]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def current(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("current") or [])
+        return list(XABackends.element_values(self.xa_elem, "current") or [])
 
     def currently_playing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("currentlyPlaying") or [])
+        return list(XABackends.element_values(self.xa_elem, "currentlyPlaying") or [])
 
     def network(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("network") or [])
+        return list(XABackends.element_values(self.xa_elem, "network") or [])
 
     def by_file(
         self, file: Union[XABase.XAPath, str]
@@ -7,6 +7,7 @@ import AppKit
 import ScriptingBridge
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType
 from PyXA import XABaseScriptable
 from ..XAEvents import event_from_int, event_from_str
@@ -673,14 +674,14 @@ class XAImageEventsDisplayList(XABase.XAList):
         super().__init__(properties, XAImageEventsDisplay, filter)
 
     def display_number(self) -> list["int"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayNumber") or [])
 
     def display_profile(self) -> "XAImageEventsProfileList":
-        ls = self.xa_elem.arrayByApplyingSelector_("displayProfile") or []
+        ls = XABackends.element_values(self.xa_elem, "displayProfile") or []
         return self._new_element(ls, XAImageEventsProfileList)
 
     def name(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_display_number(self, display_number: int) -> "XAImageEventsDisplay":
         return self.by_property("displayNumber", display_number)
@@ -747,7 +748,7 @@ class XAImageEventsImageList(XABase.XAImageList):
 
     def properties(self) -> list[Dict]:
         pyxa_dicts = []
-        ls = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        ls = XABackends.element_values(self.xa_elem, "properties") or []
         for raw_dict in ls:
             pyxa_dict = {
                 "color_space": XAImageEventsApplication.ColorSpace(
@@ -816,33 +817,33 @@ class XAImageEventsImageList(XABase.XAImageList):
         return [x.color_space for x in self]
 
     def dimensions(self) -> list[list[int]]:
-        ls = self.xa_elem.arrayByApplyingSelector_("dimensions") or []
+        ls = XABackends.element_values(self.xa_elem, "dimensions") or []
         return [tuple(x) for x in ls]
 
     def embedded_profile(self) -> "XAImageEventsProfileList":
-        ls = self.xa_elem.arrayByApplyingSelector_("embeddedProfile") or []
+        ls = XABackends.element_values(self.xa_elem, "embeddedProfile") or []
         return self._new_element(ls, XAImageEventsProfileList)
 
     def file_type(self) -> list["XAImageEventsApplication.FileType"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("fileType") or []
+        ls = XABackends.element_values(self.xa_elem, "fileType") or []
         return [
             XAImageEventsApplication.FileType(XABase.OSType(x.get().stringValue()))
             for x in ls
         ]
 
     def image_file(self) -> "XABase.XAFileList":
-        ls = self.xa_elem.arrayByApplyingSelector_("imageFile") or []
+        ls = XABackends.element_values(self.xa_elem, "imageFile") or []
         return self._new_element(ls, XABase.XAFileList)
 
     def location(self) -> list["XABase.XADiskItem"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("location") or []
+        ls = XABackends.element_values(self.xa_elem, "location") or []
         return self._new_element(ls, XABase.XADiskItemList)
 
     def name(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def resolution(self) -> list["float"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("resolution") or []
+        ls = XABackends.element_values(self.xa_elem, "resolution") or []
         return [tuple(x) for x in ls]
 
     def by_bit_depth(self, bit_depth) -> "XAImageEventsApplication.BitDepth":
@@ -1202,13 +1203,13 @@ class XAImageEventsMetadataTagList(XABase.XAList):
         super().__init__(properties, XAImageEventsMetadataTag, filter)
 
     def description(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("description") or [])
+        return list(XABackends.element_values(self.xa_elem, "description") or [])
 
     def name(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def value(self) -> list[Union[bool, int, float, str, "XAImageEventsProfile", any]]:
-        ls = self.xa_elem.arrayByApplyingSelector_("value") or []
+        ls = XABackends.element_values(self.xa_elem, "value") or []
         for index, value in enumerate(ls):
             if isinstance(value, ScriptingBridge.SBObject):
                 ls[index] = self._new_element(value, XAImageEventsProfile)
@@ -1283,70 +1284,70 @@ class XAImageEventsProfileList(XABase.XAList):
         super().__init__(properties, XAImageEventsProfile, filter)
 
     def color_space(self) -> list["XAImageEventsApplication.ColorSpace"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("colorSpace") or []
+        ls = XABackends.element_values(self.xa_elem, "colorSpace") or []
         return [
             XAImageEventsApplication.ColorSpace(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def connection_space(self) -> list["XAImageEventsApplication.ConnectionSpace"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("connectionSpace") or []
+        ls = XABackends.element_values(self.xa_elem, "connectionSpace") or []
         return [
             XAImageEventsApplication.ConnectionSpace(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def creation_date(self) -> list["datetime"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "creationDate") or [])
 
     def creator(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creator") or [])
+        return list(XABackends.element_values(self.xa_elem, "creator") or [])
 
     def device_class(self) -> list["XAImageEventsApplication.DeviceClass"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("deviceClass") or []
+        ls = XABackends.element_values(self.xa_elem, "deviceClass") or []
         return [
             XAImageEventsApplication.DeviceClass(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def device_manufacturer(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("deviceManufacturer") or [])
+        return list(XABackends.element_values(self.xa_elem, "deviceManufacturer") or [])
 
     def device_model(self) -> list["int"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("deviceModel") or [])
+        return list(XABackends.element_values(self.xa_elem, "deviceModel") or [])
 
     def location(self) -> "XABase.XAAliasList":
-        ls = self.xa_elem.arrayByApplyingSelector_("location") or []
+        ls = XABackends.element_values(self.xa_elem, "location") or []
         return self._new_element(ls, XABase.XAAliasList)
 
     def name(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def platform(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("platform") or [])
+        return list(XABackends.element_values(self.xa_elem, "platform") or [])
 
     def preferred_cmm(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("preferredCMM") or [])
+        return list(XABackends.element_values(self.xa_elem, "preferredCMM") or [])
 
     def quality(self) -> list["XAImageEventsApplication.ProfileQuality"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("quality") or []
+        ls = XABackends.element_values(self.xa_elem, "quality") or []
         return [
             XAImageEventsApplication.ProfileQuality(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def rendering_intent(self) -> list["XAImageEventsApplication.RenderingIntent"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("renderingIntent") or []
+        ls = XABackends.element_values(self.xa_elem, "renderingIntent") or []
         return [
             XAImageEventsApplication.RenderingIntent(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def size(self) -> list["int"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
     def version(self) -> list["str"]:
-        return list(self.xa_elem.arrayByApplyingSelector_("version") or [])
+        return list(XABackends.element_values(self.xa_elem, "version") or [])
 
     def by_color_space(
         self, color_space: XAImageEventsApplication.ColorSpace
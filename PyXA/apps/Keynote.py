@@ -8,6 +8,7 @@ from typing import Any, Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XAEvents
 from PyXA.XABase import OSType
 
@@ -369,33 +370,37 @@ class XAKeynoteDocumentList(iWorkApplicationBase.XAiWorkDocumentList):
         return pyxa_dicts
 
     def slide_numbers_showing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("slideNumbersShowing") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "slideNumbersShowing") or []
+        )
 
     def document_theme(self) -> 'XAKeynoteThemeList':
-        ls = self.xa_elem.arrayByApplyingSelector_("documentTheme") or []
+        ls = XABackends.element_values(self.xa_elem, "documentTheme") or []
         return self._new_element(ls, XAKeynoteThemeList)
 
     def auto_loop(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("autoLoop") or [])
+        return list(XABackends.element_values(self.xa_elem, "autoLoop") or [])
 
     def auto_play(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("autoPlay") or [])
+        return list(XABackends.element_values(self.xa_elem, "autoPlay") or [])
 
     def auto_restart(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("autoRestart") or [])
+        return list(XABackends.element_values(self.xa_elem, "autoRestart") or [])
 
     def maximum_idle_duration(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("maximumIdleDuration") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "maximumIdleDuration") or []
+        )
 
     def current_slide(self) -> 'XAKeynoteSlideList':
-        ls = self.xa_elem.arrayByApplyingSelector_("currentSlide") or []
+        ls = XABackends.element_values(self.xa_elem, "currentSlide") or []
         return self._new_element(ls, XAKeynoteSlideList)
 
     def height(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("height") or [])
+        return list(XABackends.element_values(self.xa_elem, "height") or [])
 
     def width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("width") or [])
+        return list(XABackends.element_values(self.xa_elem, "width") or [])
 
     def by_properties(self, properties: dict) -> Union['XAKeynoteDocument', None]:
         raw_dict = {}
@@ -826,10 +831,10 @@ class XAKeynoteThemeList(XABase.XAList):
         return pyxa_dicts
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_properties(self, properties: dict) -> Union['XAKeynoteTheme', None]:
         for theme in self.xa_elem:
@@ -918,7 +923,7 @@ class XAKeynoteSlideList(XAKeynoteContainerList):
         super().__init__(properties, filter, obj_class)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = [None] * len(self.xa_elem)
         for index, raw_dict in enumerate(raw_dicts):
             pyxa_dicts[index] = {
@@ -940,19 +945,19 @@ class XAKeynoteSlideList(XAKeynoteContainerList):
         return pyxa_dicts
 
     def body_showing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bodyShowing") or [])
+        return list(XABackends.element_values(self.xa_elem, "bodyShowing") or [])
 
     def skipped(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("skipped") or [])
+        return list(XABackends.element_values(self.xa_elem, "skipped") or [])
 
     def slide_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("slideNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "slideNumber") or [])
 
     def title_showing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("titleShowing") or [])
+        return list(XABackends.element_values(self.xa_elem, "titleShowing") or [])
 
     def transition_properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("transitionProperties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "transitionProperties") or []
         pyxa_dicts = [None] * len(self.xa_elem)
         for index, raw_dict in enumerate(raw_dicts):
             pyxa_dicts[index] = XAKeynoteTransitionSettings({
@@ -964,19 +969,19 @@ class XAKeynoteSlideList(XAKeynoteContainerList):
         return pyxa_dicts
 
     def base_layout(self) -> 'XAKeynoteSlideLayoutList':
-        ls = self.xa_elem.arrayByApplyingSelector_("baseLayout") or []
+        ls = XABackends.element_values(self.xa_elem, "baseLayout") or []
         return self._new_element(ls, XAKeynoteSlideLayoutList)
 
     def default_body_item(self) -> 'iWorkApplicationBase.XAiWorkShapeList':
-        ls = self.xa_elem.arrayByApplyingSelector_("defaultBodyItem") or []
+        ls = XABackends.element_values(self.xa_elem, "defaultBodyItem") or []
         return self._new_element(ls, iWorkApplicationBase.XAiWorkShapeList)
 
     def default_title_item(self) -> 'iWorkApplicationBase.XAiWorkShapeList':
-        ls = self.xa_elem.arrayByApplyingSelector_("defaultTitleItem") or []
+        ls = XABackends.element_values(self.xa_elem, "defaultTitleItem") or []
         return self._new_element(ls, iWorkApplicationBase.XAiWorkShapeList)
 
     def presenter_notes(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("presenterNotes") or []
+        ls = XABackends.element_values(self.xa_elem, "presenterNotes") or []
         return self._new_element(ls, XABase.XATextList)
 
     def by_properties(self, properties: dict) -> 'XAKeynoteSlide':
@@ -1253,6 +1258,7 @@ class XAKeynoteSlide(XAKeynoteContainer):
                 self.xa_elem.moveTo_(location.slides().xa_elem[position].positionBefore())
                 return location.slides()[position]
 
+    @XABase._xa_batched()
     def duplicate(self, location: Union[XAKeynoteDocument, XAKeynoteSlideList, None] = None, position: int = -1) -> 'XAKeynoteSlide':
         """Duplicates the slide, mimicking the action of copying and pasting the slide manually.
         
@@ -1286,6 +1292,7 @@ class XAKeynoteSlide(XAKeynoteContainer):
             self.xa_elem.duplicateTo_withProperties_(source.slides().xa_elem.lastObject().positionAfter(), None)
             return source.slides()[-1].move(location, position)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes the slide.
 
@@ -1371,7 +1378,7 @@ class XAKeynoteSlideLayoutList(XAKeynoteSlideList):
         super().__init__(properties, XAKeynoteSlideLayout, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_name(self, name: str) -> 'XAKeynoteSlideLayout':
         return self.by_property("name", name)
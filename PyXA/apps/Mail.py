@@ -10,6 +10,7 @@ from typing import Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType, unOSType
 from PyXA import XABaseScriptable
 from PyXA.XAEvents import event_from_str
@@ -620,62 +621,64 @@ class XAMailMessageViewerList(XABase.XAList):
         super().__init__(properties, XAMailMessageViewer, filter)
 
     def drafts_mailbox(self) -> "XAMailboxList":
-        ls = self.xa_elem.arrayByApplyingSelector_("draftsMailbox") or []
+        ls = XABackends.element_values(self.xa_elem, "draftsMailbox") or []
         return self._new_element(ls, XAMailboxList)
 
     def inbox(self) -> "XAMailboxList":
-        ls = self.xa_elem.arrayByApplyingSelector_("inbox") or []
+        ls = XABackends.element_values(self.xa_elem, "inbox") or []
         return self._new_element(ls, XAMailboxList)
 
     def junk_mailbox(self) -> "XAMailboxList":
-        ls = self.xa_elem.arrayByApplyingSelector_("junkMailbox") or []
+        ls = XABackends.element_values(self.xa_elem, "junkMailbox") or []
         return self._new_element(ls, XAMailboxList)
 
     def outbox(self) -> "XAMailboxList":
-        ls = self.xa_elem.arrayByApplyingSelector_("outbox") or []
+        ls = XABackends.element_values(self.xa_elem, "outbox") or []
         return self._new_element(ls, XAMailboxList)
 
     def sent_mailbox(self) -> "XAMailboxList":
-        ls = self.xa_elem.arrayByApplyingSelector_("sentMailbox") or []
+        ls = XABackends.element_values(self.xa_elem, "sentMailbox") or []
         return self._new_element(ls, XAMailboxList)
 
     def trash_mailbox(self) -> "XAMailboxList":
-        ls = self.xa_elem.arrayByApplyingSelector_("trashMailbox") or []
+        ls = XABackends.element_values(self.xa_elem, "trashMailbox") or []
         return self._new_element(ls, XAMailboxList)
 
     def sort_column(self) -> list[XAMailApplication.ViewerColumn]:
-        ls = self.xa_elem.arrayByApplyingSelector_("sortColumns") or []
+        ls = XABackends.element_values(self.xa_elem, "sortColumns") or []
         return [XAMailApplication.ViewerColumn(OSType(x.stringValue())) for x in ls]
 
     def sorted_ascending(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortedAscending") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortedAscending") or [])
 
     def mailbox_list_visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("mailboxListVisible") or [])
+        return list(XABackends.element_values(self.xa_elem, "mailboxListVisible") or [])
 
     def preview_pane_is_visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("previewPaneIsVisible") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "previewPaneIsVisible") or []
+        )
 
     def visible_columns(self) -> list[list[str]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visibleColumns") or [])
+        return list(XABackends.element_values(self.xa_elem, "visibleColumns") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def visible_messages(self) -> list["XAMailMessageList"]:
-        message_lists = self.xa_elem.arrayByApplyingSelector_("visibleMessages") or []
+        message_lists = XABackends.element_values(self.xa_elem, "visibleMessages") or []
         return [self._new_element(ls, XAMailMessageList) for ls in message_lists]
 
     def selected_messages(self) -> list["XAMailMessageList"]:
-        message_lists = self.xa_elem.arrayByApplyingSelector_("selectedMessages") or []
+        message_lists = XABackends.element_values(self.xa_elem, "selectedMessages") or []
         return [self._new_element(ls, XAMailMessageList) for ls in message_lists]
 
     def selected_mailboxes(self) -> list["XAMailboxList"]:
-        mailbox_lists = self.xa_elem.arrayByApplyingSelector_("selectedMailboxes") or []
+        mailbox_lists = XABackends.element_values(self.xa_elem, "selectedMailboxes") or []
         return [self._new_element(ls, XAMailboxList) for ls in mailbox_lists]
 
     def window(self) -> XABaseScriptable.XASBWindowList:
-        windows = self.xa_elem.arrayByApplyingSelector_("window") or []
+        windows = XABackends.element_values(self.xa_elem, "window") or []
         return self._new_element(windows, XABaseScriptable.XASBWindowList)
 
     def by_drafts_mailbox(
@@ -925,10 +928,10 @@ class XAMailSignatureList(XABase.XAList):
         super().__init__(properties, XAMailDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def content(self) -> list[XABase.XAText]:
-        ls = self.xa_elem.arrayByApplyingSelector_("content") or []
+        ls = XABackends.element_values(self.xa_elem, "content") or []
         return self._new_element(ls, XABase.XATextList)
 
     def by_name(self, name: str) -> Union["XAMailSignature", None]:
@@ -968,6 +971,7 @@ class XAMailSignature(XABase.XAObject):
     def name(self, name: str):
         self.set_property("name", name)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the signature.
 
@@ -995,69 +999,71 @@ class XAMailAccountList(XABase.XAList):
         super().__init__(properties, object_class, filter)
 
     def delivery_account(self) -> "XAMailSMTPServerList":
-        ls = self.xa_elem.arrayByApplyingSelector_("deliveryAccount") or []
+        ls = XABackends.element_values(self.xa_elem, "deliveryAccount") or []
         return self._new_element(ls, XAMailSMTPServerList)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def authentication(self) -> list[XAMailApplication.AuthenticationMethod]:
-        ls = self.xa_elem.arrayByApplyingSelector_("authentication") or []
+        ls = XABackends.element_values(self.xa_elem, "authentication") or []
         return [
             XAMailApplication.AuthenticationMethod(OSType(x.stringValue())) for x in ls
         ]
 
     def account_type(self) -> list[XAMailApplication.AccountType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("accountType") or []
+        ls = XABackends.element_values(self.xa_elem, "accountType") or []
         return [XAMailApplication.AccountType(OSType(x.stringValue())) for x in ls]
 
     def email_addresses(self) -> list[list[str]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("emailAddresses") or [])
+        return list(XABackends.element_values(self.xa_elem, "emailAddresses") or [])
 
     def full_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fullName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fullName") or [])
 
     def empty_junk_messages_frequency(self) -> list[int]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("emptyJunkMessagesFrequency") or []
+            XABackends.element_values(self.xa_elem, "emptyJunkMessagesFrequency") or []
         )
 
     def empty_trash_frequency(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("emptyTrashFrequency") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "emptyTrashFrequency") or []
+        )
 
     def empty_junk_messages_on_quit(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("emptyJunkMessagesOnQuit") or []
+            XABackends.element_values(self.xa_elem, "emptyJunkMessagesOnQuit") or []
         )
 
     def empty_trash_on_quit(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("emptyTrashOnQuit") or [])
+        return list(XABackends.element_values(self.xa_elem, "emptyTrashOnQuit") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def user_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("userName") or [])
+        return list(XABackends.element_values(self.xa_elem, "userName") or [])
 
     def account_directory(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("accountDirectory") or [])
+        return list(XABackends.element_values(self.xa_elem, "accountDirectory") or [])
 
     def port(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("port") or [])
+        return list(XABackends.element_values(self.xa_elem, "port") or [])
 
     def server_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("serverName") or [])
+        return list(XABackends.element_values(self.xa_elem, "serverName") or [])
 
     def move_deleted_messages_to_trash(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("moveDeletedMessagesToTrash") or []
+            XABackends.element_values(self.xa_elem, "moveDeletedMessagesToTrash") or []
         )
 
     def uses_ssl(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("usesSsl") or [])
+        return list(XABackends.element_values(self.xa_elem, "usesSsl") or [])
 
     def by_delivery_account(
         self, delivery_account: "XAMailSMTPServer"
@@ -1142,7 +1148,7 @@ class XAMailAccountList(XABase.XAList):
         return self.by_property("usesSsl", uses_ssl)
 
     def mailboxes(self):
-        ls = self.xa_elem.arrayByApplyingSelector_("mailboxes") or []
+        ls = XABackends.element_values(self.xa_elem, "mailboxes") or []
         return self._new_element(ls, XAMailboxList)
 
     def __repr__(self):
@@ -1345,29 +1351,31 @@ class XAMailIMAPAccountList(XAMailAccountList):
 
     def compact_mailboxes_when_closing(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("compactMailboxesWhenClosing") or []
+            XABackends.element_values(self.xa_elem, "compactMailboxesWhenClosing") or []
         )
 
     def message_caching(self) -> list[XAMailApplication.CachingPolicy]:
-        ls = self.xa_elem.arrayByApplyingSelector_("messageCaching") or []
+        ls = XABackends.element_values(self.xa_elem, "messageCaching") or []
         return [XAMailApplication.CachingPolicy(OSType(x.stringValue())) for x in ls]
 
     def store_drafts_on_server(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("storeDraftsOnServer") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "storeDraftsOnServer") or []
+        )
 
     def store_junk_mail_on_server(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("storeJunkMailOnServer") or []
+            XABackends.element_values(self.xa_elem, "storeJunkMailOnServer") or []
         )
 
     def store_sent_messages_on_server(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("storeSentMessagesOnServer") or []
+            XABackends.element_values(self.xa_elem, "storeSentMessagesOnServer") or []
         )
 
     def store_deleted_messages_on_server(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("storeDeletedMessagesOnServer") or []
+            XABackends.element_values(self.xa_elem, "storeDeletedMessagesOnServer") or []
         )
 
     def by_compact_mailboxes_when_closing(
@@ -1512,21 +1520,21 @@ class XAMailPOPAccountList(XAMailAccountList):
 
     def big_message_warning_size(self) -> list[int]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("bigMessageWarningSize") or []
+            XABackends.element_values(self.xa_elem, "bigMessageWarningSize") or []
         )
 
     def delayed_message_deletion_interval(self) -> list[int]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("delayedMessageDeletionInterval")
+            XABackends.element_values(self.xa_elem, "delayedMessageDeletionInterval")
             or []
         )
 
     def delete_mail_on_server(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("deleteMailOnServer") or [])
+        return list(XABackends.element_values(self.xa_elem, "deleteMailOnServer") or [])
 
     def delete_messages_when_moved_from_inbox(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("deleteMessagesWhenMovedFromInbox")
+            XABackends.element_values(self.xa_elem, "deleteMessagesWhenMovedFromInbox")
             or []
         )
 
@@ -1619,32 +1627,32 @@ class XAMailSMTPServerList(XABase.XAList):
         super().__init__(properties, XAMailSMTPServer, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def authentication(self) -> list[XAMailApplication.AuthenticationMethod]:
-        ls = self.xa_elem.arrayByApplyingSelector_("authentication") or []
+        ls = XABackends.element_values(self.xa_elem, "authentication") or []
         return [
             XAMailApplication.AuthenticationMethod(OSType(x.stringValue())) for x in ls
         ]
 
     def account_type(self) -> list[XAMailApplication.AccountType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("accountType") or []
+        ls = XABackends.element_values(self.xa_elem, "accountType") or []
         return [XAMailApplication.AccountType(OSType(x.stringValue())) for x in ls]
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def user_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("userName") or [])
+        return list(XABackends.element_values(self.xa_elem, "userName") or [])
 
     def port(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("port") or [])
+        return list(XABackends.element_values(self.xa_elem, "port") or [])
 
     def server_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("serverName") or [])
+        return list(XABackends.element_values(self.xa_elem, "serverName") or [])
 
     def uses_ssl(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("usesSsl") or [])
+        return list(XABackends.element_values(self.xa_elem, "usesSsl") or [])
 
     def by_name(self, name: str) -> "XAMailAccount":
         return self.by_property("name", name)
@@ -1784,13 +1792,13 @@ class XAMailDocumentList(XABase.XAList):
         super().__init__(properties, XAMailDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("file") or [])
+        return list(XABackends.element_values(self.xa_elem, "file") or [])
 
     def by_name(self, name: str) -> "XAMailDocument":
         return self.by_property("name", name)
@@ -1829,6 +1837,7 @@ class XAMailDocument(XABase.XAObject):
         """The location of the document on the disk, if one exists."""
         return self.xa_elem.file()
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the document.
 
@@ -1856,17 +1865,17 @@ class XAMailboxList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def unread_count(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("unread_count") or [])
+        return list(XABackends.element_values(self.xa_elem, "unread_count") or [])
 
     def account(self) -> XAMailAccountList:
-        ls = self.xa_elem.arrayByApplyingSelector_("account") or []
+        ls = XABackends.element_values(self.xa_elem, "account") or []
         return self._new_element(ls, XAMailAccountList)
 
     def container(self) -> "XAMailContainerList":
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XAMailContainerList)
 
     def by_name(self, name: str) -> "XAMailbox":
@@ -1882,7 +1891,7 @@ class XAMailboxList(XABase.XAList):
         return self.by_property("container", container.xa_elem)
 
     def messages(self):
-        ls = self.xa_elem.arrayByApplyingSelector_("messages") or []
+        ls = XABackends.element_values(self.xa_elem, "messages") or []
         return self._new_element(ls, XAMailMessageList)
 
     def __repr__(self):
@@ -1922,6 +1931,7 @@ class XAMailbox(XABase.XAObject):
         """The parent mailbox of the mailbox."""
         return self._new_element(self.xa_elem.container(), XAMailbox)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the mailboxs.
 
@@ -1985,25 +1995,25 @@ class XAMailMessageList(XABase.XAList):
         return [x.id() for x in self.xa_elem]
 
     def all_headers(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("allHeaders") or [])
+        return list(XABackends.element_values(self.xa_elem, "allHeaders") or [])
 
     def background_color(self) -> list[XAMailApplication.HighlightColor]:
         ls = [x.backgroundColor() for x in self.xa_elem]
         return [XAMailApplication.HighlightColor(OSType(x.stringValue())) for x in ls]
 
     def mailbox(self) -> XAMailboxList:
-        ls = self.xa_elem.arrayByApplyingSelector_("mailbox") or []
+        ls = XABackends.element_values(self.xa_elem, "mailbox") or []
         return self._new_element(ls, XAMailboxList)
 
     def content(self) -> list[str]:
-        ls = self.xa_elem.arrayByApplyingSelector_("content") or []
-        return list(ls.arrayByApplyingSelector_("get"))
+        ls = XABackends.element_values(self.xa_elem, "content") or []
+        return list(XABackends.element_values(ls, "get"))
 
     def date_received(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("dateReceived") or [])
+        return list(XABackends.element_values(self.xa_elem, "dateReceived") or [])
 
     def date_sent(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("dateSent") or [])
+        return list(XABackends.element_values(self.xa_elem, "dateSent") or [])
 
     def deleted_status(self) -> list[bool]:
         return [x.deletedStatus() for x in self.xa_elem]
@@ -2021,22 +2031,22 @@ class XAMailMessageList(XABase.XAList):
         return [x.readStatus() for x in self.xa_elem]
 
     def message_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("messageId") or [])
+        return list(XABackends.element_values(self.xa_elem, "messageId") or [])
 
     def source(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("source") or [])
+        return list(XABackends.element_values(self.xa_elem, "source") or [])
 
     def reply_to(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("replyTo") or [])
+        return list(XABackends.element_values(self.xa_elem, "replyTo") or [])
 
     def message_size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("messageSize") or [])
+        return list(XABackends.element_values(self.xa_elem, "messageSize") or [])
 
     def sender(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sender") or [])
+        return list(XABackends.element_values(self.xa_elem, "sender") or [])
 
     def subject(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("subject") or [])
+        return list(XABackends.element_values(self.xa_elem, "subject") or [])
 
     def was_forwarded(self) -> list[bool]:
         return [x.wasForwarded() for x in self.xa_elem]
@@ -2294,6 +2304,7 @@ class XAMailMessage(XABase.XAObject):
         msg = self.xa_elem.replyOpeningWindow_replyToAll_(open_window, reply_all)
         return self._new_element(msg, XAMailOutgoingMessage)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the message.
 
@@ -2367,24 +2378,24 @@ class XAMailOutgoingMessageList(XABase.XAList):
         super().__init__(properties, XAMailHeader, filter)
 
     def sender(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sender") or [])
+        return list(XABackends.element_values(self.xa_elem, "sender") or [])
 
     def subject(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("subject") or [])
+        return list(XABackends.element_values(self.xa_elem, "subject") or [])
 
     def content(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("content") or []
+        ls = XABackends.element_values(self.xa_elem, "content") or []
         return self._new_element(ls, XABase.XATextList)
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def message_signature(self) -> XAMailSignatureList:
-        ls = self.xa_elem.arrayByApplyingSelector_("messageSignature") or []
+        ls = XABackends.element_values(self.xa_elem, "messageSignature") or []
         return self._new_element(ls, XAMailSignatureList)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def by_sender(self, sender: str) -> "XAMailOutgoingMessage":
         return self.by_property("sender", sender)
@@ -2484,6 +2495,7 @@ class XAMailOutgoingMessage(XABase.XAObject):
     ):
         self.xa_elem.closeSaving_savingIn_(save.value, None)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the outgoing message.
 
@@ -2511,10 +2523,10 @@ class XAMailRecipientList(XABase.XAList):
         super().__init__(properties, object_class, filter)
 
     def address(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("address") or [])
+        return list(XABackends.element_values(self.xa_elem, "address") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_address(self, address: str) -> "XAMailRecipient":
         return self.by_property("address", address)
@@ -2635,10 +2647,10 @@ class XAMailHeaderList(XABase.XAList):
         super().__init__(properties, XAMailHeader, filter)
 
     def content(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("content") or [])
+        return list(XABackends.element_values(self.xa_elem, "content") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_content(self, content: str) -> "XAMailHeader":
         return self.by_property("content", content)
@@ -2693,19 +2705,19 @@ class XAMailAttachmentList(XABase.XAList):
         super().__init__(properties, XAMailAttachment, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def mime_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("mimeType") or [])
+        return list(XABackends.element_values(self.xa_elem, "mimeType") or [])
 
     def file_size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileSize") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileSize") or [])
 
     def downloaded(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("downloaded") or [])
+        return list(XABackends.element_values(self.xa_elem, "downloaded") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def by_name(self, name: str) -> "XAMailAttachment":
         return self.by_property("name", name)
@@ -2760,6 +2772,7 @@ class XAMailAttachment(XABase.XAObject):
         """The unique identifier for the attachment."""
         return self.xa_elem.id()
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the attachment.
 
@@ -2783,71 +2796,73 @@ class XAMailRuleList(XABase.XAList):
         super().__init__(properties, XAMailMessage, filter)
 
     def color_message(self) -> list[XAMailApplication.HighlightColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("colorMessage") or []
+        ls = XABackends.element_values(self.xa_elem, "colorMessage") or []
         return [XAMailApplication.HighlightColor(OSType(x.stringValue())) for x in ls]
 
     def delete_message(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("deleteMessage") or [])
+        return list(XABackends.element_values(self.xa_elem, "deleteMessage") or [])
 
     def forward_text(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("forwardText") or [])
+        return list(XABackends.element_values(self.xa_elem, "forwardText") or [])
 
     def forward_message(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("forwardMessage") or [])
+        return list(XABackends.element_values(self.xa_elem, "forwardMessage") or [])
 
     def mark_flagged(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("markFlagged") or [])
+        return list(XABackends.element_values(self.xa_elem, "markFlagged") or [])
 
     def mark_flag_index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("markFlagIndex") or [])
+        return list(XABackends.element_values(self.xa_elem, "markFlagIndex") or [])
 
     def mark_read(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("markRead") or [])
+        return list(XABackends.element_values(self.xa_elem, "markRead") or [])
 
     def play_sound(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("playSound") or [])
+        return list(XABackends.element_values(self.xa_elem, "playSound") or [])
 
     def redirect_message(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("redirectMessage") or [])
+        return list(XABackends.element_values(self.xa_elem, "redirectMessage") or [])
 
     def reply_text(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("replyText") or [])
+        return list(XABackends.element_values(self.xa_elem, "replyText") or [])
 
     def run_script(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("runScript") or [])
+        return list(XABackends.element_values(self.xa_elem, "runScript") or [])
 
     def all_conditions_must_be_met(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("allConditionsMustBeMet") or []
+            XABackends.element_values(self.xa_elem, "allConditionsMustBeMet") or []
         )
 
     def copy_message(self) -> XAMailboxList:
-        ls = self.xa_elem.arrayByApplyingSelector_("copyMessage") or []
+        ls = XABackends.element_values(self.xa_elem, "copyMessage") or []
         return self._new_element(ls, XAMailboxList)
 
     def move_message(self) -> XAMailboxList:
-        ls = self.xa_elem.arrayByApplyingSelector_("moveMessage") or []
+        ls = XABackends.element_values(self.xa_elem, "moveMessage") or []
         return self._new_element(ls, XAMailboxList)
 
     def highlight_text_using_color(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("highlightTextUsingColor") or []
+            XABackends.element_values(self.xa_elem, "highlightTextUsingColor") or []
         )
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def should_copy_message(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shouldCopyMessage") or [])
+        return list(XABackends.element_values(self.xa_elem, "shouldCopyMessage") or [])
 
     def should_move_message(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shouldMoveMessage") or [])
+        return list(XABackends.element_values(self.xa_elem, "shouldMoveMessage") or [])
 
     def stop_evaluating_rules(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("stopEvaluatingRules") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "stopEvaluatingRules") or []
+        )
 
     def by_color_message(
         self, color_message: XAMailApplication.HighlightColor
@@ -3111,6 +3126,7 @@ class XAMailRule(XABase.XAObject):
     def stop_evaluating_rule(self, stop_evaluating_rules: bool):
         self.set_property("stopEvaluatingRules", stop_evaluating_rules)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the rule.
 
@@ -3143,17 +3159,17 @@ class XAMailRuleConditionList(XABase.XAList):
         super().__init__(properties, XAMailMessage, filter)
 
     def expression(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("expression") or [])
+        return list(XABackends.element_values(self.xa_elem, "expression") or [])
 
     def header(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("header") or [])
+        return list(XABackends.element_values(self.xa_elem, "header") or [])
 
     def qualifier(self) -> list[XAMailApplication.RuleQualifier]:
-        ls = self.xa_elem.arrayByApplyingSelector_("qualifier") or []
+        ls = XABackends.element_values(self.xa_elem, "qualifier") or []
         return [XAMailApplication.RuleQualifier(OSType(x.stringValue())) for x in ls]
 
     def rule_type(self) -> list[XAMailApplication.RuleType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("ruleType") or []
+        ls = XABackends.element_values(self.xa_elem, "ruleType") or []
         return [XAMailApplication.RuleType(OSType(x.stringValue())) for x in ls]
 
     def by_expression(self, expression: str) -> Union["XAMailRuleCondition", None]:
@@ -3220,6 +3236,7 @@ class XAMailRuleCondition(XABase.XAObject):
     def rule_type(self, rule_type: XAMailApplication.RuleType):
         self.set_property("ruleType", rule_type.value)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the rule condition.
 
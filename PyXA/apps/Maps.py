@@ -7,6 +7,7 @@ from typing import Literal, Union
 from AppKit import NSPredicate
 
 from PyXA import XABase
+from PyXA import XABackends
 from .SystemEvents import XASystemEventsUIElement, XASystemEventsUIElementList
 
 
@@ -325,7 +326,7 @@ class XAMapsTabList(XASystemEventsUIElementList):
         super().__init__(properties, filter, XAMapsTab)
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title"))
+        return list(XABackends.element_values(self.xa_elem, "title"))
 
     def __repr__(self):
         return "<" + str(type(self)) + str(self.title()) + ">"
@@ -362,7 +363,7 @@ class XAMapsSidebarLocationList(XABase.XAList):
         super().__init__(properties, XAMapsSidebarLocation, filter)
 
     def name(self) -> list[str]:
-        ls = self.xa_elem.arrayByApplyingSelector_("objectDescription") or []
+        ls = XABackends.element_values(self.xa_elem, "objectDescription") or []
         return [x.split(",")[0] for x in ls]
 
     def __repr__(self):
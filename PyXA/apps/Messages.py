@@ -10,6 +10,7 @@ from typing import Any, Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XAEvents
 from PyXA import XABaseScriptable
 from ..XAProtocols import XAClipboardCodable
@@ -383,13 +384,13 @@ class XAMessagesDocumentList(XABase.XAList):
         super().__init__(properties, XAMessagesDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("file") or [])
+        return list(XABackends.element_values(self.xa_elem, "file") or [])
 
     def by_name(self, name: str) -> Union["XAMessagesDocument", None]:
         return self.by_property("name", name)
@@ -447,13 +448,13 @@ class XAMessagesChatList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAMessagesChat, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def account(self) -> "XAMessagesAccountList":
-        ls = self.xa_elem.arrayByApplyingSelector_("account") or []
+        ls = XABackends.element_values(self.xa_elem, "account") or []
         return self._new_element(ls, XAMessagesAccountList)
 
     def participants(self) -> list["XAMessagesParticipantList"]:
@@ -595,13 +596,13 @@ class XAMessagesFileTransferList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAMessagesFileTransfer, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def file_path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("filePath") or []
+        ls = XABackends.element_values(self.xa_elem, "filePath") or []
         return [XABase.XAPath(x) for x in ls]
 
     def direction(self) -> list[XAMessagesApplication.MessageDirection]:
@@ -633,7 +634,7 @@ class XAMessagesFileTransferList(XABase.XAList, XAClipboardCodable):
             ]
 
     def started(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("started") or [])
+        return list(XABackends.element_values(self.xa_elem, "started") or [])
 
     def by_id(self, id: str) -> "XAMessagesFileTransfer":
         return self.by_property("id", id)
@@ -803,26 +804,26 @@ class XAMessagesParticipantList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAMessagesParticipant, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def account(self) -> "XAMessagesAccountList":
-        ls = self.xa_elem.arrayByApplyingSelector_("account") or []
+        ls = XABackends.element_values(self.xa_elem, "account") or []
         return self._new_element(ls, XAMessagesAccountList)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def handle(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("handle") or [])
+        return list(XABackends.element_values(self.xa_elem, "handle") or [])
 
     def first_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("firstName") or [])
+        return list(XABackends.element_values(self.xa_elem, "firstName") or [])
 
     def last_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("lastName") or [])
+        return list(XABackends.element_values(self.xa_elem, "lastName") or [])
 
     def full_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fullName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fullName") or [])
 
     def by_id(self, id: str) -> Union["XAMessagesParticipant", None]:
         return self.by_property("id", id)
@@ -959,18 +960,18 @@ class XAMessagesAccountList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAMessagesAccount, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def object_description(self) -> list[str]:
         return list(
-            self.xa_elem.get().arrayByApplyingSelector_("objectDescription") or []
+            XABackends.element_values(self.xa_elem.get(), "objectDescription") or []
         )
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def connection_status(self) -> list[XAMessagesApplication.ConnectionStatus]:
-        ls = self.xa_elem.arrayByApplyingSelector_("connectionStatus") or []
+        ls = XABackends.element_values(self.xa_elem, "connectionStatus") or []
         return [
             XAMessagesApplication.ConnectionStatus(XABase.OSType(x.stringValue()))
             for x in ls
@@ -11,6 +11,7 @@ import AppKit
 import ScriptingBridge
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from PyXA.XAProtocols import XACanOpenPath
 from PyXA.XAEvents import event_from_str, event_from_type_code
@@ -1011,23 +1012,23 @@ class XAMusicItemList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def container(self) -> list[XABase.XAObject]:
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XABase.XAList)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def persistent_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("persistentID") or [])
+        return list(XABackends.element_values(self.xa_elem, "persistentID") or [])
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def by_container(self, container: XABase.XAObject) -> Union["XAMusicItem", None]:
         return self.by_property("container", container.xa_elem)
@@ -1166,23 +1167,23 @@ class XAMusicArtworkList(XAMusicItemList):
         super().__init__(properties, filter, XAMusicArtwork)
 
     def data(self) -> list[XABase.XAImage]:
-        ls = self.xa_elem.arrayByApplyingSelector_("data") or []
+        ls = XABackends.element_values(self.xa_elem, "data") or []
         return [XABase.XAImage(x) for x in ls]
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def downloaded(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("downloaded") or [])
+        return list(XABackends.element_values(self.xa_elem, "downloaded") or [])
 
     def format(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("format") or [])
+        return list(XABackends.element_values(self.xa_elem, "format") or [])
 
     def kind(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def raw_data(self) -> list[bytes]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rawData") or [])
+        return list(XABackends.element_values(self.xa_elem, "rawData") or [])
 
     def by_data(self, data: XABase.XAImage) -> Union["XAMusicArtwork", None]:
         return self.by_property("data", data.xa_elem)
@@ -1275,34 +1276,34 @@ class XAMusicAirPlayDeviceList(XAMusicItemList):
         super().__init__(properties, filter, XAMusicAirPlayDevice)
 
     def active(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("active") or [])
+        return list(XABackends.element_values(self.xa_elem, "active") or [])
 
     def available(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("available") or [])
+        return list(XABackends.element_values(self.xa_elem, "available") or [])
 
     def kind(self) -> list[XAMusicApplication.DeviceKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("kind") or []
+        ls = XABackends.element_values(self.xa_elem, "kind") or []
         return [
             XAMusicApplication.DeviceKind(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def network_address(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("networkAddress") or [])
+        return list(XABackends.element_values(self.xa_elem, "networkAddress") or [])
 
     def protected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("protected") or [])
+        return list(XABackends.element_values(self.xa_elem, "protected") or [])
 
     def selected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("selected") or [])
+        return list(XABackends.element_values(self.xa_elem, "selected") or [])
 
     def supports_audio(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("supportsAudio") or [])
+        return list(XABackends.element_values(self.xa_elem, "supportsAudio") or [])
 
     def supports_video(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("supportsVideo") or [])
+        return list(XABackends.element_values(self.xa_elem, "supportsVideo") or [])
 
     def sound_volume(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("soundVolume") or [])
+        return list(XABackends.element_values(self.xa_elem, "soundVolume") or [])
 
     def by_active(self, active: bool) -> Union["XAMusicAirPlayDevice", None]:
         return self.by_property("active", active)
@@ -1425,7 +1426,7 @@ class XAMusicEncoderList(XAMusicItemList):
         super().__init__(properties, filter, XAMusicEncoder)
 
     def format(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("format") or [])
+        return list(XABackends.element_values(self.xa_elem, "format") or [])
 
     def by_format(self, format: str) -> Union["XAMusicEncoder", None]:
         return self.by_property("format", format)
@@ -1462,43 +1463,43 @@ class XAMusicEQPresetList(XAMusicItemList):
         super().__init__(properties, filter, XAMusicEQPreset)
 
     def band1(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band1") or [])
+        return list(XABackends.element_values(self.xa_elem, "band1") or [])
 
     def band2(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band2") or [])
+        return list(XABackends.element_values(self.xa_elem, "band2") or [])
 
     def band3(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band3") or [])
+        return list(XABackends.element_values(self.xa_elem, "band3") or [])
 
     def band4(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band4") or [])
+        return list(XABackends.element_values(self.xa_elem, "band4") or [])
 
     def band5(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band5") or [])
+        return list(XABackends.element_values(self.xa_elem, "band5") or [])
 
     def band6(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band6") or [])
+        return list(XABackends.element_values(self.xa_elem, "band6") or [])
 
     def band7(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band7") or [])
+        return list(XABackends.element_values(self.xa_elem, "band7") or [])
 
     def band8(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band8") or [])
+        return list(XABackends.element_values(self.xa_elem, "band8") or [])
 
     def band9(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band9") or [])
+        return list(XABackends.element_values(self.xa_elem, "band9") or [])
 
     def band10(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("band10") or [])
+        return list(XABackends.element_values(self.xa_elem, "band10") or [])
 
     def modifiable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modifiable") or [])
+        return list(XABackends.element_values(self.xa_elem, "modifiable") or [])
 
     def preamp(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("preamp") or [])
+        return list(XABackends.element_values(self.xa_elem, "preamp") or [])
 
     def update_tracks(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("updateTracks") or [])
+        return list(XABackends.element_values(self.xa_elem, "updateTracks") or [])
 
     def by_band1(self, band1: float) -> Union["XAMusicEQPreset", None]:
         return self.by_property("band1", band1)
@@ -1683,10 +1684,10 @@ class XAMusicPlaylistList(XAMusicItemList):
         super().__init__(properties, filter, obj_class)
 
     def disliked(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("disliked") or [])
+        return list(XABackends.element_values(self.xa_elem, "disliked") or [])
 
     def loved(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("loved") or [])
+        return list(XABackends.element_values(self.xa_elem, "loved") or [])
 
     def by_disliked(self, disliked: bool) -> Union["XAMusicPlaylist", None]:
         return self.by_property("disliked", disliked)
@@ -1695,32 +1696,32 @@ class XAMusicPlaylistList(XAMusicItemList):
         return self.by_property("loved", loved)
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def duration(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("duration") or [])
+        return list(XABackends.element_values(self.xa_elem, "duration") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def parent(self) -> "XAMusicPlaylistList":
-        ls = self.xa_elem.arrayByApplyingSelector_("parent") or []
+        ls = XABackends.element_values(self.xa_elem, "parent") or []
         return self._new_element(ls, XAMusicPlaylistList)
 
     def size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
     def special_kind(self) -> list[XAMusicApplication.PlaylistKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("specialKind") or []
+        ls = XABackends.element_values(self.xa_elem, "specialKind") or []
         return [
             XAMusicApplication.PlaylistKind(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def time(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("time") or [])
+        return list(XABackends.element_values(self.xa_elem, "time") or [])
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def by_object_description(
         self, object_description: str
@@ -1752,6 +1753,7 @@ class XAMusicPlaylistList(XAMusicItemList):
     def by_visible(self, visible: bool) -> Union["XAMusicPlaylist", None]:
         return self.by_property("visible", visible)
 
+    @XABase._xa_batched()
     def push(
         self, *elements: list["XAMusicPlaylist"]
     ) -> Union["XAMusicPlaylist", list["XAMusicPlaylist"], None]:
@@ -1911,6 +1913,7 @@ class XAMusicPlaylist(XAMusicItem):
         """
         self.xa_elem.moveTo_(location.xa_elem)
 
+    @XABase._xa_batched()
     def duplicate(
         self, location: Union["XAMusicSource", "XAMusicFolderPlaylist", None] = None
     ):
@@ -2053,25 +2056,25 @@ class XAMusicAudioCDPlaylistList(XAMusicPlaylistList):
         super().__init__(properties, filter, XAMusicAudioCDPlaylist)
 
     def artist(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("artist") or [])
+        return list(XABackends.element_values(self.xa_elem, "artist") or [])
 
     def compilation(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("compilation") or [])
+        return list(XABackends.element_values(self.xa_elem, "compilation") or [])
 
     def composer(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("composer") or [])
+        return list(XABackends.element_values(self.xa_elem, "composer") or [])
 
     def disc_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("discCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "discCount") or [])
 
     def disc_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("discNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "discNumber") or [])
 
     def genre(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("genre") or [])
+        return list(XABackends.element_values(self.xa_elem, "genre") or [])
 
     def year(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("year") or [])
+        return list(XABackends.element_values(self.xa_elem, "year") or [])
 
     def by_artist(self, artist: str) -> Union["XAMusicAudioCDPlaylist", None]:
         return self.by_property("artist", artist)
@@ -2240,13 +2243,13 @@ class XAMusicSourceList(XAMusicItemList):
         super().__init__(properties, filter, XAMusicSource)
 
     def capacity(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("capacity") or [])
+        return list(XABackends.element_values(self.xa_elem, "capacity") or [])
 
     def free_space(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("freeSpace") or [])
+        return list(XABackends.element_values(self.xa_elem, "freeSpace") or [])
 
     def kind(self) -> list[XAMusicApplication.SourceKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("kind") or []
+        ls = XABackends.element_values(self.xa_elem, "kind") or []
         return [
             XAMusicApplication.SourceKind(XABase.OSType(x.stringValue())) for x in ls
         ]
@@ -2460,226 +2463,226 @@ class XAMusicTrackList(XAMusicItemList):
         super().__init__(properties, filter, obj_class)
 
     def album_artist(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("albumArtist") or [])
+        return list(XABackends.element_values(self.xa_elem, "albumArtist") or [])
 
     def album_disliked(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("albumDisliked") or [])
+        return list(XABackends.element_values(self.xa_elem, "albumDisliked") or [])
 
     def album_loved(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("albumLoved") or [])
+        return list(XABackends.element_values(self.xa_elem, "albumLoved") or [])
 
     def artist(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("artist") or [])
+        return list(XABackends.element_values(self.xa_elem, "artist") or [])
 
     def bpm(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bpm") or [])
+        return list(XABackends.element_values(self.xa_elem, "bpm") or [])
 
     def cloud_status(self) -> list[XAMusicApplication.iCloudStatus]:
-        ls = self.xa_elem.arrayByApplyingSelector_("cloudStatus") or []
+        ls = XABackends.element_values(self.xa_elem, "cloudStatus") or []
         return [
             XAMusicApplication.iCloudStatus(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def compilation(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("compilation") or [])
+        return list(XABackends.element_values(self.xa_elem, "compilation") or [])
 
     def composer(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("composer") or [])
+        return list(XABackends.element_values(self.xa_elem, "composer") or [])
 
     def disliked(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("disliked") or [])
+        return list(XABackends.element_values(self.xa_elem, "disliked") or [])
 
     def eq(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("EQ") or [])
+        return list(XABackends.element_values(self.xa_elem, "EQ") or [])
 
     def gapless(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("gapless") or [])
+        return list(XABackends.element_values(self.xa_elem, "gapless") or [])
 
     def loved(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("loved") or [])
+        return list(XABackends.element_values(self.xa_elem, "loved") or [])
 
     def lyrics(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("lyrics") or [])
+        return list(XABackends.element_values(self.xa_elem, "lyrics") or [])
 
     def movement(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("movement") or [])
+        return list(XABackends.element_values(self.xa_elem, "movement") or [])
 
     def movement_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("movementCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "movementCount") or [])
 
     def movement_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("movementNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "movementNumber") or [])
 
     def shufflable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shufflable") or [])
+        return list(XABackends.element_values(self.xa_elem, "shufflable") or [])
 
     def sort_artist(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortArtist") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortArtist") or [])
 
     def sort_album_artist(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortAlbumArtist") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortAlbumArtist") or [])
 
     def sort_composer(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortComposer") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortComposer") or [])
 
     def work(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("work") or [])
+        return list(XABackends.element_values(self.xa_elem, "work") or [])
 
     def album(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("album") or [])
+        return list(XABackends.element_values(self.xa_elem, "album") or [])
 
     def album_rating(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("albumRating") or [])
+        return list(XABackends.element_values(self.xa_elem, "albumRating") or [])
 
     def album_rating_kind(self) -> list[XAMusicApplication.RatingKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("albumRatingKind") or []
+        ls = XABackends.element_values(self.xa_elem, "albumRatingKind") or []
         return [
             XAMusicApplication.RatingKind(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def bit_rate(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bitRate") or [])
+        return list(XABackends.element_values(self.xa_elem, "bitRate") or [])
 
     def bookmark(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bookmark") or [])
+        return list(XABackends.element_values(self.xa_elem, "bookmark") or [])
 
     def bookmarkable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bookmarkable") or [])
+        return list(XABackends.element_values(self.xa_elem, "bookmarkable") or [])
 
     def category(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("category") or [])
+        return list(XABackends.element_values(self.xa_elem, "category") or [])
 
     def comment(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("comment") or [])
+        return list(XABackends.element_values(self.xa_elem, "comment") or [])
 
     def database_id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("databaseID") or [])
+        return list(XABackends.element_values(self.xa_elem, "databaseID") or [])
 
     def date_added(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("dateAdded") or [])
+        return list(XABackends.element_values(self.xa_elem, "dateAdded") or [])
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def disc_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("discCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "discCount") or [])
 
     def disc_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("discNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "discNumber") or [])
 
     def downloader_apple_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("downloaderAppleID") or [])
+        return list(XABackends.element_values(self.xa_elem, "downloaderAppleID") or [])
 
     def downloader_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("downloaderName") or [])
+        return list(XABackends.element_values(self.xa_elem, "downloaderName") or [])
 
     def duration(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("duration") or [])
+        return list(XABackends.element_values(self.xa_elem, "duration") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def episode_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("episodeID") or [])
+        return list(XABackends.element_values(self.xa_elem, "episodeID") or [])
 
     def episode_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("episodeNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "episodeNumber") or [])
 
     def finish(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("finish") or [])
+        return list(XABackends.element_values(self.xa_elem, "finish") or [])
 
     def genre(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("genre") or [])
+        return list(XABackends.element_values(self.xa_elem, "genre") or [])
 
     def grouping(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("grouping") or [])
+        return list(XABackends.element_values(self.xa_elem, "grouping") or [])
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def long_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("longDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "longDescription") or [])
 
     def media_kind(self) -> list[XAMusicApplication.MediaKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("mediaKind") or []
+        ls = XABackends.element_values(self.xa_elem, "mediaKind") or []
         return [
             XAMusicApplication.MediaKind(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def played_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("playedCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "playedCount") or [])
 
     def played_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("playedDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "playedDate") or [])
 
     def purchaser_apple_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("purchaserAppleID") or [])
+        return list(XABackends.element_values(self.xa_elem, "purchaserAppleID") or [])
 
     def purchaser_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("purchaserName") or [])
+        return list(XABackends.element_values(self.xa_elem, "purchaserName") or [])
 
     def rating(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rating") or [])
+        return list(XABackends.element_values(self.xa_elem, "rating") or [])
 
     def rating_kind(self) -> list[XAMusicApplication.RatingKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("ratingKind") or []
+        ls = XABackends.element_values(self.xa_elem, "ratingKind") or []
         return [
             XAMusicApplication.RatingKind(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def release_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("releaseDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "releaseDate") or [])
 
     def sample_rate(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sampleRate") or [])
+        return list(XABackends.element_values(self.xa_elem, "sampleRate") or [])
 
     def season_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("seasonNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "seasonNumber") or [])
 
     def skipped_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("skippedCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "skippedCount") or [])
 
     def skipped_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("skippedDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "skippedDate") or [])
 
     def show(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("show") or [])
+        return list(XABackends.element_values(self.xa_elem, "show") or [])
 
     def sort_album(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortAlbum") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortAlbum") or [])
 
     def sort_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortName") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortName") or [])
 
     def sort_show(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortShow") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortShow") or [])
 
     def size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
     def start(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("start") or [])
+        return list(XABackends.element_values(self.xa_elem, "start") or [])
 
     def time(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("time") or [])
+        return list(XABackends.element_values(self.xa_elem, "time") or [])
 
     def track_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("trackCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "trackCount") or [])
 
     def track_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("trackNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "trackNumber") or [])
 
     def unplayed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("unplayed") or [])
+        return list(XABackends.element_values(self.xa_elem, "unplayed") or [])
 
     def volume_adjustment(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("volumeAdjustment") or [])
+        return list(XABackends.element_values(self.xa_elem, "volumeAdjustment") or [])
 
     def year(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("year") or [])
+        return list(XABackends.element_values(self.xa_elem, "year") or [])
 
     def by_album(self, album: str) -> Union["XAMusicTrack", None]:
         return self.by_property("album", album)
@@ -3537,6 +3540,7 @@ class XAMusicTrack(XAMusicItem):
         """
         self.xa_elem.moveTo_(location.xa_elem)
 
+    @XABase._xa_batched()
     def duplicate(self, location: Union[XAMusicPlaylist, XAMusicSource]):
         """Duplicates the track at the specified location.
 
@@ -3596,7 +3600,7 @@ class XAMusicFileTrackList(XAMusicTrackList):
         super().__init__(properties, filter, XAMusicFileTrack)
 
     def location(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("location") or []
+        ls = XABackends.element_values(self.xa_elem, "location") or []
         return [XABase.XAURL(x) for x in ls]
 
     def by_location(self, location: XABase.XAURL) -> Union["XAMusicFileTrack", None]:
@@ -3660,7 +3664,7 @@ class XAMusicAudioCDTrackList(XAMusicTrackList):
         super().__init__(properties, filter, XAMusicAudioCDTrack)
 
     def location(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("location") or []
+        ls = XABackends.element_values(self.xa_elem, "location") or []
         return [XABase.XAURL(x) for x in ls]
 
     def by_location(self, location: XABase.XAURL) -> Union["XAMusicAudioCDTrack", None]:
@@ -3700,7 +3704,7 @@ class XAMusicURLTrackList(XAMusicTrackList):
         super().__init__(properties, filter, XAMusicURLTrack)
 
     def address(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("address") or [])
+        return list(XABackends.element_values(self.xa_elem, "address") or [])
 
     def by_address(self, address: str) -> Union["XAMusicURLTrack", None]:
         return self.by_property("address", address)
@@ -3741,13 +3745,13 @@ class XAMusicUserPlaylistList(XAMusicPlaylistList):
         super().__init__(properties, filter, XAMusicUserPlaylist)
 
     def genius(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("genius") or [])
+        return list(XABackends.element_values(self.xa_elem, "genius") or [])
 
     def shared(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shared") or [])
+        return list(XABackends.element_values(self.xa_elem, "shared") or [])
 
     def smart(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("smart") or [])
+        return list(XABackends.element_values(self.xa_elem, "smart") or [])
 
     def by_shared(self, shared: bool) -> Union["XAMusicUserPlaylist", None]:
         return self.by_property("shared", shared)
@@ -3898,34 +3902,34 @@ class XAMusicWindowList(XAMusicItemList):
         super().__init__(properties, filter, obj_class)
 
     def bounds(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bounds") or [])
+        return list(XABackends.element_values(self.xa_elem, "bounds") or [])
 
     def closeable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("closeable") or [])
+        return list(XABackends.element_values(self.xa_elem, "closeable") or [])
 
     def collapseable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("collapseable") or [])
+        return list(XABackends.element_values(self.xa_elem, "collapseable") or [])
 
     def collapsed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("collapsed") or [])
+        return list(XABackends.element_values(self.xa_elem, "collapsed") or [])
 
     def full_screen(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fullScreen") or [])
+        return list(XABackends.element_values(self.xa_elem, "fullScreen") or [])
 
     def position(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("position") or [])
+        return list(XABackends.element_values(self.xa_elem, "position") or [])
 
     def resizable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("resizable") or [])
+        return list(XABackends.element_values(self.xa_elem, "resizable") or [])
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def zoomable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomable") or [])
+        return list(XABackends.element_values(self.xa_elem, "zoomable") or [])
 
     def zoomed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomed") or [])
+        return list(XABackends.element_values(self.xa_elem, "zoomed") or [])
 
     def by_bounds(
         self, bounds: tuple[tuple[int, int], tuple[int, int]]
@@ -4024,11 +4028,11 @@ class XAMusicBrowserWindowList(XAMusicWindowList):
         super().__init__(properties, filter, XAMusicBrowserWindow)
 
     def selection(self) -> XAMusicTrackList:
-        ls = self.xa_elem.arrayByApplyingSelector_("selection") or []
+        ls = XABackends.element_values(self.xa_elem, "selection") or []
         return self._new_element(ls, XAMusicTrackList)
 
     def view(self) -> XAMusicPlaylistList:
-        ls = self.xa_elem.arrayByApplyingSelector_("view") or []
+        ls = XABackends.element_values(self.xa_elem, "view") or []
         return self._new_element(ls, XAMusicPlaylistList)
 
     def by_selection(
@@ -4072,11 +4076,11 @@ class XAMusicPlaylistWindowList(XAMusicWindowList):
         super().__init__(properties, filter, XAMusicPlaylistWindow)
 
     def selection(self) -> XAMusicTrackList:
-        ls = self.xa_elem.arrayByApplyingSelector_("selection") or []
+        ls = XABackends.element_values(self.xa_elem, "selection") or []
         return self._new_element(ls, XAMusicTrackList)
 
     def view(self) -> XAMusicPlaylistList:
-        ls = self.xa_elem.arrayByApplyingSelector_("view") or []
+        ls = XABackends.element_values(self.xa_elem, "view") or []
         return self._new_element(ls, XAMusicPlaylistList)
 
     def by_selection(
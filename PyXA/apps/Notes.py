@@ -11,6 +11,7 @@ import AppKit
 from ScriptingBridge import SBElementArray
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
@@ -334,35 +335,35 @@ class XANoteList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XANote, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def body(self) -> list[str]:
         return [note.body for note in self]
 
     def plaintext(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("plaintext") or [])
+        return list(XABackends.element_values(self.xa_elem, "plaintext") or [])
 
     def creation_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "creationDate") or [])
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def password_protected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("passwordProtected") or [])
+        return list(XABackends.element_values(self.xa_elem, "passwordProtected") or [])
 
     def shared(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shared") or [])
+        return list(XABackends.element_values(self.xa_elem, "shared") or [])
 
     def container(self) -> "XANotesFolderList":
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XANotesFolderList)
 
     def attachments(self) -> "XANotesAttachmentList":
-        ls = self.xa_elem.arrayByApplyingSelector_("attachments") or []
+        ls = XABackends.element_values(self.xa_elem, "attachments") or []
         return self._new_element(ls, XANotesAttachmentList)
 
     def by_name(self, name: str) -> "XANote":
@@ -439,13 +440,13 @@ class XANotesDocumentList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XANotesDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("file") or [])
+        return list(XABackends.element_values(self.xa_elem, "file") or [])
 
     def by_name(self, name: str) -> "XANotesDocument":
         return self.by_property("name", name)
@@ -482,24 +483,24 @@ class XANotesAccountList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XANotesAccount, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def upgraded(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("upgraded") or [])
+        return list(XABackends.element_values(self.xa_elem, "upgraded") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def default_folder(self) -> "XANotesFolderList":
-        ls = self.xa_elem.arrayByApplyingSelector_("defaultFolder") or []
+        ls = XABackends.element_values(self.xa_elem, "defaultFolder") or []
         return self._new_element(ls, XANotesFolderList)
 
     def notes(self) -> "XANoteList":
-        ls = self.xa_elem.arrayByApplyingSelector_("notes") or []
+        ls = XABackends.element_values(self.xa_elem, "notes") or []
         return self._new_element(ls, XANoteList)
 
     def folders(self) -> "XANotesFolderList":
-        ls = self.xa_elem.arrayByApplyingSelector_("folders") or []
+        ls = XABackends.element_values(self.xa_elem, "folders") or []
         return self._new_element(ls, XANotesFolderList)
 
     def by_name(self, name: str) -> "XANotesAccount":
@@ -540,24 +541,24 @@ class XANotesFolderList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XANotesFolder, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def shared(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shared") or [])
+        return list(XABackends.element_values(self.xa_elem, "shared") or [])
 
     def container(self) -> XANotesAccountList:
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XANotesAccountList)
 
     def folders(self) -> "XANotesFolderList":
-        ls = self.xa_elem.arrayByApplyingSelector_("folders") or []
+        ls = XABackends.element_values(self.xa_elem, "folders") or []
         return self._new_element(ls, XANotesFolderList)
 
     def notes(self) -> XANoteList:
-        ls = self.xa_elem.arrayByApplyingSelector_("notes") or []
+        ls = XABackends.element_values(self.xa_elem, "notes") or []
         return self._new_element(ls, XANoteList)
 
     def by_name(self, name: str) -> "XANotesFolder":
@@ -598,29 +599,29 @@ class XANotesAttachmentList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XANoteAttachment, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def content_identifier(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("contentIdentifier") or [])
+        return list(XABackends.element_values(self.xa_elem, "contentIdentifier") or [])
 
     def creation_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "creationDate") or [])
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAURL(x) for x in ls]
 
     def shared(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shared") or [])
+        return list(XABackends.element_values(self.xa_elem, "shared") or [])
 
     def container(self) -> XANoteList:
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XANoteList)
 
     def by_name(self, name: str) -> Union["XANoteAttachment", None]:
@@ -762,6 +763,7 @@ class XANotesFolder(XABase.XAObject, XAClipboardCodable):
         self.xa_elem.showSeparately_(False)
         return self
 
+    @XABase._xa_batched("move")
     def move_to(
         self, destination: Union["XANotesFolder", "XANotesAccount"]
     ) -> "XANotesFolder":
@@ -774,6 +776,7 @@ class XANotesFolder(XABase.XAObject, XAClipboardCodable):
         """
         self.xa_elem.moveTo_(destination.xa_elem)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the folder.
 
@@ -992,6 +995,7 @@ class XANote(XABase.XAObject, XAClipboardCodable, XAShowable, XADeletable):
             self.xa_elem.attachments(), XANotesAttachmentList, filter
         )
 
+    @XABase._xa_batched("move")
     def move_to(self, folder: "XANotesFolder") -> "XANote":
         """Moves the note to the specified folder.
 
@@ -1112,6 +1116,7 @@ class XANoteAttachment(XABase.XAObject, XAClipboardCodable):
         self.xa_elem.saveIn_as_(url, XANotesApplication.FileFormat.NATIVE.value)
         return self
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Permanently deletes the attachment.
 
@@ -8,6 +8,7 @@ from typing import Any, Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType
 
 from . import iWorkApplicationBase
@@ -258,11 +259,11 @@ class XANumbersDocumentList(iWorkApplicationBase.XAiWorkDocumentList):
         return pyxa_dicts
 
     def document_template(self) -> "XANumbersTemplateList":
-        ls = self.xa_elem.arrayByApplyingSelector_("documentTemplate") or []
+        ls = XABackends.element_values(self.xa_elem, "documentTemplate") or []
         return self._new_element(ls, XANumbersTemplateList)
 
     def active_sheet(self) -> "XANumbersSheetList":
-        ls = self.xa_elem.arrayByApplyingSelector_("activeSheet") or []
+        ls = XABackends.element_values(self.xa_elem, "activeSheet") or []
         return self._new_element(ls, XANumbersSheetList)
 
     def by_properties(self, properties: dict) -> Union["XANumbersDocument", None]:
@@ -418,7 +419,7 @@ class XANumbersTemplateList(XABase.XAList):
         super().__init__(properties, XANumbersTemplate, filter)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = [None] * len(self.xa_elem)
         for index, raw_dict in enumerate(raw_dicts):
             pyxa_dicts[index] = {
@@ -428,10 +429,10 @@ class XANumbersTemplateList(XABase.XAList):
         return pyxa_dicts
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_properties(self, properties: dict) -> Union["XANumbersTemplate", None]:
         raw_dict = {}
@@ -519,14 +520,14 @@ class XANumbersSheetList(XANumbersContainerList):
         super().__init__(properties, filter, XANumbersSheet)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = [None] * len(self.xa_elem)
         for index, raw_dict in enumerate(raw_dicts):
             pyxa_dicts[index] = {"name": raw_dict["name"]}
         return pyxa_dicts
 
     def body_text(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("bodyText") or []
+        ls = XABackends.element_values(self.xa_elem, "bodyText") or []
         return self._new_element(ls, XABase.XATextList)
 
     def by_properties(self, properties: dict) -> Union["XANumbersSheet", None]:
@@ -8,6 +8,7 @@ from typing import Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
     XACanOpenPath,
@@ -408,116 +409,120 @@ class XAOmniOutlinerDocumentList(XABase.XAList):
         super().__init__(properties, XAOmniOutlinerDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def alternate_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("alternateColor") or []
+        ls = XABackends.element_values(self.xa_elem, "alternateColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def background_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("backgroundColor") or []
+        ls = XABackends.element_values(self.xa_elem, "backgroundColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def canredo(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("canredo") or [])
+        return list(XABackends.element_values(self.xa_elem, "canredo") or [])
 
     def canundo(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("canundo") or [])
+        return list(XABackends.element_values(self.xa_elem, "canundo") or [])
 
     def children_are_sections(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("childrenAreSections") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "childrenAreSections") or []
+        )
 
     def column_title_style(self) -> "XAOmniOutlinerStyleList":
-        ls = self.xa_elem.arrayByApplyingSelector_("columnTitleStyle") or []
+        ls = XABackends.element_values(self.xa_elem, "columnTitleStyle") or []
         return self._new_element(ls, XAOmniOutlinerStyleList)
 
     def editable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("editable") or [])
+        return list(XABackends.element_values(self.xa_elem, "editable") or [])
 
     def folded_editing_enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("foldedEditingEnabled") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "foldedEditingEnabled") or []
+        )
 
     def has_subtopics(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hasSubtopics") or [])
+        return list(XABackends.element_values(self.xa_elem, "hasSubtopics") or [])
 
     def horizontal_grid_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("horizontalGridColor") or []
+        ls = XABackends.element_values(self.xa_elem, "horizontalGridColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def note_column(self) -> "XAOmniOutlinerColumnList":
-        ls = self.xa_elem.arrayByApplyingSelector_("noteColumn") or []
+        ls = XABackends.element_values(self.xa_elem, "noteColumn") or []
         return self._new_element(ls, XAOmniOutlinerColumnList)
 
     def note_display(self) -> list[XAOmniOutlinerApplication.DisplayType]:
-        ls = self.xa_elem.arrayByApplyingSelector_("noteDisplay") or []
+        ls = XABackends.element_values(self.xa_elem, "noteDisplay") or []
         return [
             XAOmniOutlinerApplication.DisplayType(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def save_identifier(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("saveIdentifier") or [])
+        return list(XABackends.element_values(self.xa_elem, "saveIdentifier") or [])
 
     def save_identifier_enabled(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("saveIdentifierEnabled") or []
+            XABackends.element_values(self.xa_elem, "saveIdentifierEnabled") or []
         )
 
     def sorting_postponed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortingPostponed") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortingPostponed") or [])
 
     def status_sort_order(self) -> list[XAOmniOutlinerApplication.SortOrder]:
-        ls = self.xa_elem.arrayByApplyingSelector_("statusSortOrder") or []
+        ls = XABackends.element_values(self.xa_elem, "statusSortOrder") or []
         return [
             XAOmniOutlinerApplication.SortOrder(XABase.OSType(x.stringValue()))
             for x in ls
         ]
 
     def status_visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("statusVisible") or [])
+        return list(XABackends.element_values(self.xa_elem, "statusVisible") or [])
 
     def store_compressed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("storeCompressed") or [])
+        return list(XABackends.element_values(self.xa_elem, "storeCompressed") or [])
 
     def style(self) -> "XAOmniOutlinerStyleList":
-        ls = self.xa_elem.arrayByApplyingSelector_("style") or []
+        ls = XABackends.element_values(self.xa_elem, "style") or []
         return self._new_element(ls, XAOmniOutlinerStyleList)
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def topic_column(self) -> "XAOmniOutlinerColumnList":
-        ls = self.xa_elem.arrayByApplyingSelector_("topicColumn") or []
+        ls = XABackends.element_values(self.xa_elem, "topicColumn") or []
         return self._new_element(ls, XAOmniOutlinerColumnList)
 
     def undo_enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("undoEnabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "undoEnabled") or [])
 
     def verticalGridColor(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("verticalGridColor") or []
+        ls = XABackends.element_values(self.xa_elem, "verticalGridColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def writes_wrapper(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("writesWrapper") or [])
+        return list(XABackends.element_values(self.xa_elem, "writesWrapper") or [])
 
     def topiccolumnid(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("topiccolumnid") or [])
+        return list(XABackends.element_values(self.xa_elem, "topiccolumnid") or [])
 
     def notecolumnid(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("notecolumnid") or [])
+        return list(XABackends.element_values(self.xa_elem, "notecolumnid") or [])
 
     def __repr__(self):
         return "<" + str(type(self)) + str(self.name()) + ">"
@@ -798,6 +803,7 @@ class XAOmniOutlinerDocument(XABase.XAObject, XACloseable, XAPrintable):
             items = [x.xa_elem for x in items]
             self.xa_elem.select_extending_(items, extend)
 
+    @XABase._xa_batched()
     def add(self, items: Union[XABase.XAObject, list[XABase.XAObject]]):
         """Adds objects to the document.
 
@@ -810,6 +816,7 @@ class XAOmniOutlinerDocument(XABase.XAObject, XACloseable, XAPrintable):
             items = [x.xa_elem for x in items]
         self.xa_elem.add_to_(items, self.xa_elem)
 
+    @XABase._xa_batched()
     def add_to(self, destination: XABase.XAObject):
         """Adds the document to a location.
 
@@ -1269,6 +1276,7 @@ class XAOmniOutlinerEnumeration(XABase.XAObject):
     def name(self, name: str):
         self.set_property("name", name)
 
+    @XABase._xa_batched("move")
     def move_to(self, destination: "XAOmniOutlinerColumn"):
         """Moves the enumeration to a new column.
 
@@ -1436,6 +1444,7 @@ class XAOmniOutlinerColumn(XABase.XAObject):
     def visible(self, visible: bool):
         self.set_property("visible", visible)
 
+    @XABase._xa_batched("move")
     def move_to(self, destination: XAOmniOutlinerDocument):
         """Moves the column to the specified document.
 
@@ -1769,6 +1778,7 @@ class XAOmniOutlinerRow(XABase.XAObject):
         """
         self.xa_elem.outdent()
 
+    @XABase._xa_batched()
     def add(self, items: Union[XABase.XAObject, list[XABase.XAObject]]):
         """Adds objects to the row.
 
@@ -1781,6 +1791,7 @@ class XAOmniOutlinerRow(XABase.XAObject):
             items = [x.xa_elem for x in items]
         self.xa_elem.add_to_(items, self.xa_elem)
 
+    @XABase._xa_batched()
     def add_to(self, destination: XABase.XAObject):
         """Adds the row to a location.
 
@@ -11,6 +11,7 @@ import threading
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
     XACanOpenPath,
@@ -346,14 +347,14 @@ class XAOmniWebDocumentList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
         super().__init__(properties, XAOmniWebDocument, filter)
 
     def name(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("name") or []
+        ls = XABackends.element_values(self.xa_elem, "name") or []
         return self._new_element(ls, XABase.XATextList)
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
+        ls = XABackends.element_values(self.xa_elem, "path") or []
         return [XABase.XAPath(x) for x in ls]
 
     def by_name(self, name: Union[str, XABase.XAText]) -> Union["XAOmniWebDocument", None]:
@@ -421,10 +422,10 @@ class XAOmniWebWorkspaceList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
         super().__init__(properties, XAOmniWebWorkspace, filter)
 
     def autosaves(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("autosaves") or [])
+        return list(XABackends.element_values(self.xa_elem, "autosaves") or [])
 
     def name(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("name") or []
+        ls = XABackends.element_values(self.xa_elem, "name") or []
         return self._new_element(ls, XABase.XATextList)
 
     def by_autosaves(self, autosaves: bool) -> Union["XAOmniWebWorkspace", None]:
@@ -443,7 +444,7 @@ class XAOmniWebWorkspaceList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
 
         .. versionadded:: 0.3.0
         """
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("browsers")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "browsers")]
         return self._new_element(ls, XAOmniWebBrowserList)
 
     def __repr__(self):
@@ -514,27 +515,27 @@ class XAOmniWebBrowserList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
 
     def active_tab(self) -> "XAOmniWebTabList":
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("activeTab") or [], XAOmniWebTabList
+            XABackends.element_values(self.xa_elem, "activeTab") or [], XAOmniWebTabList
         )
 
     def address(self) -> XABase.XAURLList:
-        ls = self.xa_elem.arrayByApplyingSelector_("address") or []
+        ls = XABackends.element_values(self.xa_elem, "address") or []
         return self._new_element(ls, XABase.XAURLList)
 
     def has_favorites(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hasFavorites") or [])
+        return list(XABackends.element_values(self.xa_elem, "hasFavorites") or [])
 
     def has_tabs(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hasTabs") or [])
+        return list(XABackends.element_values(self.xa_elem, "hasTabs") or [])
 
     def has_toolbar(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hasToolbar") or [])
+        return list(XABackends.element_values(self.xa_elem, "hasToolbar") or [])
 
     def is_busy(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("isBusy") or [])
+        return list(XABackends.element_values(self.xa_elem, "isBusy") or [])
 
     def shows_address(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("showsAddress") or [])
+        return list(XABackends.element_values(self.xa_elem, "showsAddress") or [])
 
     def by_active_tab(
         self, active_tab: "XAOmniWebTab"
@@ -571,7 +572,7 @@ class XAOmniWebBrowserList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
 
         .. versionadded:: 0.3.0
         """
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("tabs")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "tabs")]
         return self._new_element(ls, XAOmniWebTabList)
 
     def __repr__(self):
@@ -683,18 +684,18 @@ class XAOmniWebTabList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
         super().__init__(properties, XAOmniWebTab, filter)
 
     def address(self) -> XABase.XAURLList:
-        ls = self.xa_elem.arrayByApplyingSelector_("address") or []
+        ls = XABackends.element_values(self.xa_elem, "address") or []
         return self._new_element(ls, XABase.XAURLList)
 
     def is_busy(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("isBusy") or [])
+        return list(XABackends.element_values(self.xa_elem, "isBusy") or [])
 
     def source(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("source") or []
+        ls = XABackends.element_values(self.xa_elem, "source") or []
         return self._new_element(ls, XABase.XATextList)
 
     def title(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("title") or []
+        ls = XABackends.element_values(self.xa_elem, "title") or []
         return self._new_element(ls, XABase.XATextList)
 
     def by_address(
@@ -717,6 +718,7 @@ class XAOmniWebTabList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
             title = title.text
         return self.by_property("title", title)
 
+    @XABase._xa_batched("delete")
     def delete(self) -> None:
         """Closes all tabs in the list.
 
@@ -763,6 +765,7 @@ class XAOmniWebTab(XABase.XAObject, XACloseable, XAPrintable, XADeletable):
         """The title of the page currently being displayed in the tab."""
         return self._new_element(self.xa_elem.title(), XABase.XAText)
 
+    @XABase._xa_batched("delete")
     def delete(self) -> None:
         """Closes the tab.
 
@@ -787,11 +790,11 @@ class XAOmniWebBookmarksDocumentList(XABase.XAList, XACanOpenPath, XAClipboardCo
         super().__init__(properties, XAOmniWebBookmarksDocument, filter)
 
     def address(self) -> XABase.XAURLList:
-        ls = self.xa_elem.arrayByApplyingSelector_("address") or []
+        ls = XABackends.element_values(self.xa_elem, "address") or []
         return self._new_element(ls, XABase.XAURLList)
 
     def is_read_only(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("isReadOnly") or [])
+        return list(XABackends.element_values(self.xa_elem, "isReadOnly") or [])
 
     def by_address(self, address: Union[str, XABase.XAURL]) -> Union["XAOmniWebBookmarksDocument", None]:
         if isinstance(address, XABase.XAURL):
@@ -809,7 +812,7 @@ class XAOmniWebBookmarksDocumentList(XABase.XAList, XACanOpenPath, XAClipboardCo
 
         .. versionadded:: 0.3.0
         """
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("bookmarks")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "bookmarks")]
         return self._new_element(ls, XAOmniWebBookmarkList)
 
     def __repr__(self):
@@ -870,27 +873,27 @@ class XAOmniWebBookmarkList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
         super().__init__(properties, XAOmniWebBookmark, filter)
 
     def address(self) -> XABase.XAURLList:
-        ls = self.xa_elem.arrayByApplyingSelector_("address") or []
+        ls = XABackends.element_values(self.xa_elem, "address") or []
         return self._new_element(ls, XABase.XAURLList)
 
     def check_interval(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("checkInterval") or [])
+        return list(XABackends.element_values(self.xa_elem, "checkInterval") or [])
 
     def is_new(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("isNew") or [])
+        return list(XABackends.element_values(self.xa_elem, "isNew") or [])
 
     def is_reachable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("isReachable") or [])
+        return list(XABackends.element_values(self.xa_elem, "isReachable") or [])
 
     def last_checked_date(self) -> list[datetime]:
-        return self.xa_elem.arrayByApplyingSelector_("lastCheckedDate") or []
+        return XABackends.element_values(self.xa_elem, "lastCheckedDate") or []
 
     def name(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("name") or []
+        ls = XABackends.element_values(self.xa_elem, "name") or []
         return self._new_element(ls, XABase.XATextList)
 
     def note(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("note") or []
+        ls = XABackends.element_values(self.xa_elem, "note") or []
         return self._new_element(ls, XABase.XATextList)
     
     def by_address(self, address: Union[str, XABase.XAURL]) -> Union["XAOmniWebBookmark", None]:
@@ -928,7 +931,7 @@ class XAOmniWebBookmarkList(XABase.XAList, XACanOpenPath, XAClipboardCodable):
 
         .. versionadded:: 0.3.0
         """
-        ls = self.xa_elem.arrayByApplyingSelector_("bookmarks") or []
+        ls = XABackends.element_values(self.xa_elem, "bookmarks") or []
         return self._new_element(ls, XAOmniWebBookmarkList)
 
     def __repr__(self):
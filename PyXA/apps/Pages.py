@@ -8,6 +8,7 @@ from typing import Any, Union
 import AppKit, ScriptingBridge
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType
 from . import iWorkApplicationBase
 
@@ -220,7 +221,7 @@ class XAPagesDocumentList(iWorkApplicationBase.XAiWorkDocumentList):
         super().__init__(properties, filter, XAPagesDocument)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = [None] * len(self.xa_elem)
         for index, doc in enumerate(self.xa_elem):
             pyxa_dicts[index] = {
@@ -246,34 +247,34 @@ class XAPagesDocumentList(iWorkApplicationBase.XAiWorkDocumentList):
         return pyxa_dicts
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def document_template(self) -> "XAPagesTemplateList":
-        ls = self.xa_elem.arrayByApplyingSelector_("documentTemplate") or []
+        ls = XABackends.element_values(self.xa_elem, "documentTemplate") or []
         return self._new_element(ls, XAPagesTemplateList)
 
     def body_text(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("bodyText") or []
+        ls = XABackends.element_values(self.xa_elem, "bodyText") or []
         return self._new_element(ls, XABase.XATextList)
 
     def document_body(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("documentBody") or [])
+        return list(XABackends.element_values(self.xa_elem, "documentBody") or [])
 
     def facing_pages(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("facingPages") or [])
+        return list(XABackends.element_values(self.xa_elem, "facingPages") or [])
 
     def current_page(self) -> "XAPagesPageList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentPage") or []
+        ls = XABackends.element_values(self.xa_elem, "currentPage") or []
         return self._new_element(ls, XAPagesPageList)
 
     def by_properties(self, properties: dict) -> Union["XAPagesDocument", None]:
@@ -365,75 +366,75 @@ class XAPagesDocumentList(iWorkApplicationBase.XAiWorkDocumentList):
     def audio_clips(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkAudioClipList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("audioClips")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "audioClips")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkAudioClipList, filter)
 
     def charts(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkChartList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("charts")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "charts")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkChartList, filter)
 
     def groups(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkGroupList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("groups")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "groups")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkGroupList, filter)
 
     def images(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkImageList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("images")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "images")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkImageList, filter)
 
     def iwork_items(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkiWorkItemList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("iWorkItems")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "iWorkItems")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkiWorkItemList, filter)
 
     def lines(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkLineList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("lines")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "lines")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkLineList, filter)
 
     def movies(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkMovieList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("movies")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "movies")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkMovieList, filter)
 
     def pages(self, filter: Union[dict, None] = None) -> "XAPagesPageList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("pages")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "pages")]
         return self._new_element(ls, XAPagesPageList, filter)
 
     def sections(self, filter: Union[dict, None] = None) -> "XAPagesSectionList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("sections")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "sections")]
         return self._new_element(ls, XAPagesSectionList, filter)
 
     def shapes(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkShapeList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("shapes")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "shapes")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkShapeList, filter)
 
     def tables(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkTableList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("tables")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "tables")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkTableList, filter)
 
     def text_items(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkTextItemList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("textItems")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "textItems")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkTableList, filter)
 
     def placeholder_texts(
         self, filter: Union[dict, None] = None
     ) -> "XAPagesPlaceholderTextList":
-        ls = [x for x in self.xa_elem.arrayByApplyingSelector_("placeholderTexts")]
+        ls = [x for x in XABackends.element_values(self.xa_elem, "placeholderTexts")]
         return self._new_element(ls, iWorkApplicationBase.XAiWorkTableList, filter)
 
     def __repr__(self):
@@ -769,10 +770,10 @@ class XAPagesTemplateList(XABase.XAList):
         super().__init__(properties, XAPagesTemplate, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_id(self, id: str) -> Union["XAPagesTemplate", None]:
         return self.by_property("id", id)
@@ -823,7 +824,7 @@ class XAPagesSectionList(XABase.XAList):
         super().__init__(properties, XAPagesSection, filter)
 
     def body_text(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("bodyText") or []
+        ls = XABackends.element_values(self.xa_elem, "bodyText") or []
         return self._new_element(ls, XABase.XATextList)
 
     def by_body_text(
@@ -837,7 +838,7 @@ class XAPagesSectionList(XABase.XAList):
     def audio_clips(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkAudioClipList":
-        ls = self.xa_elem.arrayByApplyingSelector_("audioClips") or []
+        ls = XABackends.element_values(self.xa_elem, "audioClips") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -847,7 +848,7 @@ class XAPagesSectionList(XABase.XAList):
     def charts(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkChartList":
-        ls = self.xa_elem.arrayByApplyingSelector_("charts") or []
+        ls = XABackends.element_values(self.xa_elem, "charts") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -857,7 +858,7 @@ class XAPagesSectionList(XABase.XAList):
     def groups(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkGroupList":
-        ls = self.xa_elem.arrayByApplyingSelector_("groups") or []
+        ls = XABackends.element_values(self.xa_elem, "groups") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -867,7 +868,7 @@ class XAPagesSectionList(XABase.XAList):
     def images(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkImageList":
-        ls = self.xa_elem.arrayByApplyingSelector_("images") or []
+        ls = XABackends.element_values(self.xa_elem, "images") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -877,7 +878,7 @@ class XAPagesSectionList(XABase.XAList):
     def iwork_items(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkiWorkItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("iWorkItems") or []
+        ls = XABackends.element_values(self.xa_elem, "iWorkItems") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -887,7 +888,7 @@ class XAPagesSectionList(XABase.XAList):
     def lines(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkLineList":
-        ls = self.xa_elem.arrayByApplyingSelector_("lines") or []
+        ls = XABackends.element_values(self.xa_elem, "lines") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -897,7 +898,7 @@ class XAPagesSectionList(XABase.XAList):
     def movies(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkMovieList":
-        ls = self.xa_elem.arrayByApplyingSelector_("movies") or []
+        ls = XABackends.element_values(self.xa_elem, "movies") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -907,7 +908,7 @@ class XAPagesSectionList(XABase.XAList):
     def shapes(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkShapeList":
-        ls = self.xa_elem.arrayByApplyingSelector_("shapes") or []
+        ls = XABackends.element_values(self.xa_elem, "shapes") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -917,7 +918,7 @@ class XAPagesSectionList(XABase.XAList):
     def tables(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkTableList":
-        ls = self.xa_elem.arrayByApplyingSelector_("tables") or []
+        ls = XABackends.element_values(self.xa_elem, "tables") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -925,7 +926,7 @@ class XAPagesSectionList(XABase.XAList):
         return self._new_element(ls, iWorkApplicationBase.XAiWorkTableList, filter)
 
     def pages(self, filter: Union[dict, None] = None) -> "XAPagesPageList":
-        ls = self.xa_elem.arrayByApplyingSelector_("pages") or []
+        ls = XABackends.element_values(self.xa_elem, "pages") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -935,7 +936,7 @@ class XAPagesSectionList(XABase.XAList):
     def text_items(
         self, filter: Union[dict, None] = None
     ) -> "iWorkApplicationBase.XAiWorkTextItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("textItems") or []
+        ls = XABackends.element_values(self.xa_elem, "textItems") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -1180,7 +1181,7 @@ class XAPagesPageList(XAPagesContainerList):
         super().__init__(properties, filter, XAPagesPage)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = [None] * len(self.xa_elem)
         for index, raw_dict in enumerate(raw_dicts):
             pyxa_dicts[index] = {
@@ -1189,7 +1190,7 @@ class XAPagesPageList(XAPagesContainerList):
         return pyxa_dicts
 
     def body_text(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("bodyText") or []
+        ls = XABackends.element_values(self.xa_elem, "bodyText") or []
         return self._new_element(ls, XABase.XATextList)
 
     def by_properties(self, properties: dict) -> Union["XAPagesPage", None]:
@@ -1287,7 +1288,7 @@ class XAPagesPlaceholderTextList(XABase.XATextList):
         super().__init__(properties, filter, XAPagesPlaceholderText)
 
     def tag(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("tag") or [])
+        return list(XABackends.element_values(self.xa_elem, "tag") or [])
 
     def by_tag(self, tag: str) -> Union["XAPagesPlaceholderText", None]:
         return self.by_property("tag", tag)
@@ -11,6 +11,7 @@ import threading
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
     XACanOpenPath,
@@ -151,13 +152,13 @@ class XAPathFinderFinderWindowList(XABaseScriptable.XASBWindowList):
     def target(self) -> "XAPathFinderContainerList":
         """The active target."""
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("target") or [],
+            XABackends.element_values(self.xa_elem, "target") or [],
             XAPathFinderContainerList,
         )
 
     def current_view(self) -> list[str]:
         """The current view."""
-        return list(self.xa_elem.arrayByApplyingSelector_("currentView") or [])
+        return list(XABackends.element_values(self.xa_elem, "currentView") or [])
 
     def by_target(
         self, target: "XAPathFinderContainer"
@@ -212,7 +213,7 @@ class XAPathFinderInfoWindowList(XABaseScriptable.XASBWindowList):
     def item(self) -> "XAPathFinderItemList":
         """The active item."""
         return self._new_element(
-            self.xa_elem.arrayByApplyingSelector_("item") or [], XAPathFinderItemList
+            XABackends.element_values(self.xa_elem, "item") or [], XAPathFinderItemList
         )
 
     def by_item(
@@ -248,15 +249,15 @@ class XAPathFinderDocumentList(XABase.XAList):
         super().__init__(properties, XAPathFinderDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list["XABase.XAPath"]:
         return [
             XABase.XAPath(x)
-            for x in self.xa_elem.arrayByApplyingSelector_("file") or []
+            for x in XABackends.element_values(self.xa_elem, "file") or []
         ]
 
     def by_name(self, name: str) -> Union["XAPathFinderDocument", None]:
@@ -314,7 +315,7 @@ class XAPathFinderItemList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_name(self, name: str) -> Union["XAPathFinderItem", None]:
         return self.by_property("name", name)
@@ -462,6 +463,7 @@ class XAPathFinderItem(XABase.XAObject):
         """Returns whether the item exists."""
         return self.xa_elem.exists()
 
+    @XABase._xa_batched("delete")
     def delete(self) -> None:
         """Deletes the item."""
         self.xa_elem.delete()
@@ -554,19 +556,19 @@ class XAPathFinderDiskList(XAPathFinderContainerList):
         super().__init__(properties, filter, XAPathFinderDisk)
 
     def local_volume(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("localVolume") or [])
+        return list(XABackends.element_values(self.xa_elem, "localVolume") or [])
 
     def startup(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("startup") or [])
+        return list(XABackends.element_values(self.xa_elem, "startup") or [])
 
     def ejectable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ejectable") or [])
+        return list(XABackends.element_values(self.xa_elem, "ejectable") or [])
 
     def capacity(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("capacity") or [])
+        return list(XABackends.element_values(self.xa_elem, "capacity") or [])
 
     def free_space(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("freeSpace") or [])
+        return list(XABackends.element_values(self.xa_elem, "freeSpace") or [])
 
     def by_local_volume(self, local_volume: bool) -> Union["XAPathFinderDisk", None]:
         return self.by_property("localVolume", local_volume)
@@ -626,10 +628,10 @@ class XAPathFinderFileList(XAPathFinderItemList):
         super().__init__(properties, filter, XAPathFinderFile)
 
     def file_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileType") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileType") or [])
 
     def creator_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creatorType") or [])
+        return list(XABackends.element_values(self.xa_elem, "creatorType") or [])
 
     def by_file_type(self, file_type: str) -> Union["XAPathFinderFile", None]:
         return self.by_property("fileType", file_type)
@@ -23,6 +23,7 @@ import Quartz
 from PyObjCTools import AppHelper
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath, XAClipboardCodable, XAImageLike
 from ..XAErrors import AuthenticationError
@@ -217,6 +218,7 @@ class XAPhotosApplication(XABaseScriptable.XASBApplication, XACanOpenPath):
         ls = self.xa_scel.searchFor_(query)
         return self._new_element(ls, XAPhotosMediaItemList)
 
+    @XABase._xa_batched()
     def add(
         self,
         media_items: Union["XAPhotosMediaItemList", list["XAPhotosMediaItem"]],
@@ -483,33 +485,33 @@ class XAPhotosMediaItemList(XABase.XAList, XAClipboardCodable):
         return element
 
     def properties(self) -> list[dict]:
-        return list(self.xa_scel.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_scel, "properties") or [])
 
     def keywords(self) -> list[list[str]]:
-        ls = self.xa_scel.arrayByApplyingSelector_("keywords") or []
+        ls = XABackends.element_values(self.xa_scel, "keywords") or []
         return [keyword for keywordlist in ls for keyword in keywordlist]
 
     def duration(self) -> list[float]:
         return [x.duration() for x in self.xa_elem]
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def file_path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("mainFileURL") or []
+        ls = XABackends.element_values(self.xa_elem, "mainFileURL") or []
         return [XABase.XAPath(x) for x in ls]
 
     def object_description(self) -> list[str]:
-        return list(self.xa_scel.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_scel, "objectDescription") or [])
 
     def favorite(self) -> list[bool]:
         return [x.isFavorite() for x in self.xa_elem]
 
     def creation_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "creationDate") or [])
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def is_burst(self) -> list[bool]:
         return [x.representsBurst() for x in self.xa_elem]
@@ -524,7 +526,7 @@ class XAPhotosMediaItemList(XABase.XAList, XAClipboardCodable):
         return [x.isPhoto() for x in self.xa_elem]
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("localIdentifier") or [])
+        return list(XABackends.element_values(self.xa_elem, "localIdentifier") or [])
 
     def height(self) -> list[int]:
         return [x.pixelHeight() for x in self.xa_elem]
@@ -533,10 +535,10 @@ class XAPhotosMediaItemList(XABase.XAList, XAClipboardCodable):
         return [x.pixelWidth() for x in self.xa_elem]
 
     def filename(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("filename") or [])
+        return list(XABackends.element_values(self.xa_elem, "filename") or [])
 
     def altitude(self) -> list[float]:
-        locations = self.xa_elem.arrayByApplyingSelector_("location") or []
+        locations = XABackends.element_values(self.xa_elem, "location") or []
         return [x.altitude() for x in locations]
 
     def size(self) -> list[tuple[float, float]]:
@@ -552,7 +554,7 @@ class XAPhotosMediaItemList(XABase.XAList, XAClipboardCodable):
         ]
 
     def location(self) -> list[list[Union[float, None]]]:
-        ls = self.xa_elem.arrayByApplyingSelector_("location") or []
+        ls = XABackends.element_values(self.xa_elem, "location") or []
         return [
             XABase.XALocation(
                 latitude=x.coordinate()[0],
@@ -812,6 +814,7 @@ class XAPhotosMediaItem(XABase.XAObject, XAClipboardCodable, XAImageLike):
         self.xa_scel.spotlight()
         return self
 
+    @XABase._xa_batched()
     def duplicate(self) -> "XAPhotosMediaItem":
         """Duplicates the media item.
 
@@ -878,16 +881,16 @@ class XAPhotosContainerList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, obj_class, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def parent(self) -> "XAPhotosFolderList":
-        ls = self.xa_elem.arrayByApplyingSelector_("parent") or []
+        ls = XABackends.element_values(self.xa_elem, "parent") or []
         return self._new_element(ls, XAPhotosFolderList)
 
     def by_properties(self, properties: dict) -> Union["XAPhotosContainer", None]:
@@ -986,6 +989,7 @@ class XAPhotosAlbumList(XAPhotosContainerList):
     def __init__(self, properties: dict, filter: Union[dict, None] = None):
         super().__init__(properties, filter, XAPhotosAlbum)
 
+    @XABase._xa_batched()
     def push(self, container: "XAPhotosContainer"):
         name = "New Album"
         desc = container.xa_elem.description()
@@ -1030,6 +1034,7 @@ class XAPhotosFolderList(XAPhotosContainerList):
     def __init__(self, properties: dict, filter: Union[dict, None] = None):
         super().__init__(properties, filter, XAPhotosFolder)
 
+    @XABase._xa_batched()
     def push(self, container: "XAPhotosContainer"):
         name = "New Folder"
         desc = container.xa_elem.description()
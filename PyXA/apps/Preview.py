@@ -8,6 +8,7 @@ from typing import Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
     XACanOpenPath,
@@ -139,17 +140,17 @@ class XAPreviewDocumentList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAPreviewDocument, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
+        ls = XABackends.element_values(self.xa_elem, "path") or []
         return [XABase.XAPath(x) for x in ls]
 
     def modified(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def by_properties(self, properties: dict) -> Union["XAPreviewDocument", None]:
         return self.by_property("properties", properties)
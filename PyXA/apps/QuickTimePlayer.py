@@ -7,6 +7,7 @@ from typing import Any, Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath
 
@@ -255,59 +256,59 @@ class XAQuickTimeDocumentList(XABase.XAList):
         super().__init__(properties, XAQuickTimeDocument, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def audio_volume(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("audioVolume") or [])
+        return list(XABackends.element_values(self.xa_elem, "audioVolume") or [])
 
     def current_time(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("currentTime") or [])
+        return list(XABackends.element_values(self.xa_elem, "currentTime") or [])
 
     def data_rate(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("dataRate") or [])
+        return list(XABackends.element_values(self.xa_elem, "dataRate") or [])
 
     def data_size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("dataSize") or [])
+        return list(XABackends.element_values(self.xa_elem, "dataSize") or [])
 
     def duration(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("duration") or [])
+        return list(XABackends.element_values(self.xa_elem, "duration") or [])
 
     def looping(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("looping") or [])
+        return list(XABackends.element_values(self.xa_elem, "looping") or [])
 
     def muted(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("muted") or [])
+        return list(XABackends.element_values(self.xa_elem, "muted") or [])
 
     def natural_dimensions(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("naturalDimensions") or [])
+        return list(XABackends.element_values(self.xa_elem, "naturalDimensions") or [])
 
     def playing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("playing") or [])
+        return list(XABackends.element_values(self.xa_elem, "playing") or [])
 
     def rate(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rate") or [])
+        return list(XABackends.element_values(self.xa_elem, "rate") or [])
 
     def presenting(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("presenting") or [])
+        return list(XABackends.element_values(self.xa_elem, "presenting") or [])
 
     def current_microphone(self) -> "XAQuickTimeAudioRecordingDeviceList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentMicrophone") or []
+        ls = XABackends.element_values(self.xa_elem, "currentMicrophone") or []
         return self._new_element(ls, XAQuickTimeAudioRecordingDeviceList)
 
     def current_camera(self) -> "XAQuickTimeVideoRecordingDeviceList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentCamera") or []
+        ls = XABackends.element_values(self.xa_elem, "currentCamera") or []
         return self._new_element(ls, XAQuickTimeVideoRecordingDeviceList)
 
     def current_audio_compression(self) -> "XAQuickTimeAudioCompressionPresetList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentAudioCompression") or []
+        ls = XABackends.element_values(self.xa_elem, "currentAudioCompression") or []
         return self._new_element(ls, XAQuickTimeAudioCompressionPresetList)
 
     def current_movie_compression(self) -> "XAQuickTimeMovieCompressionPresetList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentMovieCompression") or []
+        ls = XABackends.element_values(self.xa_elem, "currentMovieCompression") or []
         return self._new_element(ls, XAQuickTimeMovieCompressionPresetList)
 
     def current_screen_compression(self) -> "XAQuickTimeScreenCompressionPresetList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentScreenCompression") or []
+        ls = XABackends.element_values(self.xa_elem, "currentScreenCompression") or []
         return self._new_element(ls, XAQuickTimeScreenCompressionPresetList)
 
     def by_properties(self, properties: dict) -> "XAQuickTimeDocument":
@@ -583,13 +584,13 @@ class XAQuickTimeAudioRecordingDeviceList(XABase.XAList):
         super().__init__(properties, XAQuickTimeAudioRecordingDevice, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ID") or [])
+        return list(XABackends.element_values(self.xa_elem, "ID") or [])
 
 
 class XAQuickTimeAudioRecordingDevice(XABase.XAObject):
@@ -631,13 +632,13 @@ class XAQuickTimeVideoRecordingDeviceList(XABase.XAList):
         super().__init__(properties, XAQuickTimeVideoRecordingDevice, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ID") or [])
+        return list(XABackends.element_values(self.xa_elem, "ID") or [])
 
 
 class XAQuickTimeVideoRecordingDevice(XABase.XAObject):
@@ -679,13 +680,13 @@ class XAQuickTimeAudioCompressionPresetList(XABase.XAList):
         super().__init__(properties, XAQuickTimeAudioCompressionPreset, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ID") or [])
+        return list(XABackends.element_values(self.xa_elem, "ID") or [])
 
 
 class XAQuickTimeAudioCompressionPreset(XABase.XAObject):
@@ -727,13 +728,13 @@ class XAQuickTimeMovieCompressionPresetList(XABase.XAList):
         super().__init__(properties, XAQuickTimeMovieCompressionPreset, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ID") or [])
+        return list(XABackends.element_values(self.xa_elem, "ID") or [])
 
 
 class XAQuickTimeMovieCompressionPreset(XABase.XAObject):
@@ -775,13 +776,13 @@ class XAQuickTimeScreenCompressionPresetList(XABase.XAList):
         super().__init__(properties, XAQuickTimeScreenCompressionPreset, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("ID") or [])
+        return list(XABackends.element_values(self.xa_elem, "ID") or [])
 
 
 class XAQuickTimeScreenCompressionPreset(XABase.XAObject):
@@ -11,6 +11,7 @@ import EventKit
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 
 
@@ -327,16 +328,16 @@ class XARemindersDocumentList(XABase.XAList):
         super().__init__(properties, XARemindersDocument, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def name(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def by_properties(self, properties: dict) -> Union["XARemindersDocument", None]:
@@ -399,14 +400,17 @@ class XARemindersDocument(XABase.XAObject):
         """Prints a document."""
         return self.xa_elem.printWithProperties_printDialog_(properties, show_dialog)
 
+    @XABase._xa_batched("delete")
     def delete(self) -> None:
         """Deletes the document."""
         return self.xa_elem.delete()
 
+    @XABase._xa_batched()
     def duplicate(self) -> None:
         """Copies an object."""
         return self.xa_elem.duplicateTo_withProperties_(...)
 
+    @XABase._xa_batched("move")
     def move_to(self, window: XARemindersWindow) -> None:
         """Move an object to a new location."""
         return self.xa_elem.moveTo_(window.xa_elem)
@@ -424,14 +428,14 @@ class XARemindersAccountList(XABase.XAList):
         super().__init__(properties, XARemindersAccount, filter)
 
     def properties(self) -> list[dict]:
-        ls = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        ls = XABackends.element_values(self.xa_elem, "properties") or []
         return [dict(x) for x in ls]
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_properties(self, properties: dict) -> Union["XARemindersAccount", None]:
         for account in self.xa_elem:
@@ -492,27 +496,27 @@ class XARemindersListList(XABase.XAList):
         super().__init__(properties, XARemindersList, filter)
 
     def properties(self) -> list[dict]:
-        ls = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        ls = XABackends.element_values(self.xa_elem, "properties") or []
         return [dict(x) for x in ls]
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def container(self) -> XARemindersAccountList:
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XARemindersAccountList)
 
     def color(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("color") or [])
+        return list(XABackends.element_values(self.xa_elem, "color") or [])
 
     def emblem(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("emblem") or [])
+        return list(XABackends.element_values(self.xa_elem, "emblem") or [])
 
     def reminders(self) -> "XARemindersReminderList":
-        ls = self.xa_elem.arrayByApplyingSelector_("reminders") or []
+        ls = XABackends.element_values(self.xa_elem, "reminders") or []
         return self._new_element(ls, XARemindersReminderList)
 
     def by_properties(self, properties: dict) -> Union["XARemindersList", None]:
@@ -539,6 +543,7 @@ class XARemindersListList(XABase.XAList):
     def by_emblem(self, emblem: str) -> Union["XARemindersList", None]:
         return self.by_property("emblem", emblem)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes all reminder lists in the list.
 
@@ -619,6 +624,7 @@ class XARemindersList(XABase.XAObject):
     def emblem(self, emblem: str):
         self.set_property("emblem", emblem)
 
+    @XABase._xa_batched("delete")
     def delete(self) -> None:
         """Deletes the list.
 
@@ -664,48 +670,48 @@ class XARemindersReminderList(XABase.XAList):
         super().__init__(properties, XARemindersReminder, filter)
 
     def properties(self) -> list[dict]:
-        ls = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        ls = XABackends.element_values(self.xa_elem, "properties") or []
         return [dict(x) for x in ls]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def container(self) -> XARemindersListList:
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XARemindersListList)
 
     def creation_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "creationDate") or [])
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def body(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("body") or [])
+        return list(XABackends.element_values(self.xa_elem, "body") or [])
 
     def completed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("completed") or [])
+        return list(XABackends.element_values(self.xa_elem, "completed") or [])
 
     def completion_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("completionDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "completionDate") or [])
 
     def due_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("dueDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "dueDate") or [])
 
     def allday_due_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("alldayDueDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "alldayDueDate") or [])
 
     def remind_me_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("remindMeDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "remindMeDate") or [])
 
     def priority(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("priority") or [])
+        return list(XABackends.element_values(self.xa_elem, "priority") or [])
 
     def flagged(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("flagged") or [])
+        return list(XABackends.element_values(self.xa_elem, "flagged") or [])
 
     def alarms(self) -> list["XARemindersAlarmList"]:
         return [x.alarms() for x in self]
@@ -780,6 +786,7 @@ class XARemindersReminderList(XABase.XAList):
     def by_flagged(self, flagged: bool) -> Union["XARemindersReminder", None]:
         return self.by_property("flagged", flagged)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes all reminders in the list.
 
@@ -787,6 +794,7 @@ class XARemindersReminderList(XABase.XAList):
         """
         [x.delete() for x in self.xa_elem]
 
+    @XABase._xa_batched("move")
     def move_to(self, list: XARemindersList):
         """Moves all reminders in the list to the specified reminder list.
 
@@ -1044,6 +1052,7 @@ class XARemindersReminder(XABase.XAObject):
             if len(reminders) > 0:
                 return reminders[0]
 
+    @XABase._xa_batched("delete")
     def delete(self) -> None:
         """Deletes the reminder.
 
@@ -1051,6 +1060,7 @@ class XARemindersReminder(XABase.XAObject):
         """
         return self.xa_elem.delete()
 
+    @XABase._xa_batched("move")
     def move_to(self, list: XARemindersList) -> "XARemindersReminder":
         """Moves the reminder to the specified list.
 
@@ -1181,16 +1191,16 @@ class XARemindersAlarmList(XABase.XAList):
         super().__init__(properties, XARemindersAlarm, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sharedUID") or [])
+        return list(XABackends.element_values(self.xa_elem, "sharedUID") or [])
 
     def snoozed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("isSnoozed") or [])
+        return list(XABackends.element_values(self.xa_elem, "isSnoozed") or [])
 
     def date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("absoluteDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "absoluteDate") or [])
 
     def proximity_direction(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("proximityString") or [])
+        return list(XABackends.element_values(self.xa_elem, "proximityString") or [])
 
     def location(self) -> list[XABase.XALocation]:
         return [x.location for x in self]
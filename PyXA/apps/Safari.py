@@ -10,6 +10,7 @@ from enum import Enum
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath, XAClipboardCodable, XACloseable
 
@@ -445,19 +446,19 @@ class XASafariDocumentList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XASafariDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("file") or [])
+        return list(XABackends.element_values(self.xa_elem, "file") or [])
 
     def source(self) -> list[str]:
         return [x.source() for x in self.xa_elem]
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAURL(x) for x in ls]
 
     def text(self) -> list[XABase.XAText]:
@@ -692,11 +693,11 @@ class XASafariTabList(XABase.XAList, XAClipboardCodable):
         return sources
 
     def url(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("URL") or []
+        ls = XABackends.element_values(self.xa_elem, "URL") or []
         return [XABase.XAURL(x) for x in ls]
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def text(self) -> list[XABase.XAText]:
         """Gets the visible text of each tab in the list.
@@ -718,10 +719,10 @@ class XASafariTabList(XABase.XAList, XAClipboardCodable):
         return texts
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_source(self, source: str) -> Union["XASafariTab", None]:
         for tab in self.xa_elem:
@@ -805,6 +806,7 @@ class XASafariTabList(XABase.XAList, XAClipboardCodable):
             tab.search(term)
         return self
 
+    @XABase._xa_batched("move")
     def move_to(self, window: XASafariWindow) -> "XASafariTabList":
         """Moves all tabs in the list to the specified window.
 
@@ -822,6 +824,7 @@ class XASafariTabList(XABase.XAList, XAClipboardCodable):
             tab.close()
         return self
 
+    @XABase._xa_batched()
     def duplicate_to(self, window: XASafariWindow) -> "XASafariTabList":
         """Duplicate all tabs in the list in the specified window.
 
@@ -911,6 +914,7 @@ class XASafariTab(XASafariGeneric, XAClipboardCodable):
         """The title of the tab."""
         return self.xa_elem.name()
 
+    @XABase._xa_batched("move")
     def move_to(self, window: "XASafariWindow") -> "XASafariTab":
         """Moves the tab to the specified window. After, the tab will exist in only one location.
 
@@ -935,6 +939,7 @@ class XASafariTab(XASafariGeneric, XAClipboardCodable):
         self.close()
         return self
 
+    @XABase._xa_batched()
     def duplicate_to(self, window: "XASafariWindow") -> "XASafariTab":
         """Duplicates the tab in the specified window. The tab will then exist in two locations.
 
@@ -9,6 +9,7 @@ from enum import Enum
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XAClipboardCodable, XACloseable, XADeletable, XAPrintable
 
@@ -29,7 +30,7 @@ class XAScriptEditorItemList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def by_properties(self, properties: dict) -> "XAScriptEditorItem":
         return self.by_property("properties", properties)
@@ -192,35 +193,35 @@ class XAScriptEditorDocumentList(XAScriptEditorItemList):
         super().__init__(properties, filter, XAScriptEditorDocument)
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
+        ls = XABackends.element_values(self.xa_elem, "path") or []
         return [XABase.XAPath(x) for x in ls]
 
     def contents(self) -> "XAScriptEditorTextList":
-        ls = self.xa_elem.arrayByApplyingSelector_("contents") or []
+        ls = XABackends.element_values(self.xa_elem, "contents") or []
         return self._new_element(ls, XAScriptEditorTextList)
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def event_log(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("eventLog") or [])
+        return list(XABackends.element_values(self.xa_elem, "eventLog") or [])
 
     def language(self) -> "XAScriptEditorLanguageList":
-        ls = self.xa_elem.arrayByApplyingSelector_("language") or []
+        ls = XABackends.element_values(self.xa_elem, "language") or []
         return self._new_element(ls, XAScriptEditorLanguageList)
 
     def selection(self) -> "XAScriptEditorSelectionObjectList":
-        ls = self.xa_elem.arrayByApplyingSelector_("selection") or []
+        ls = XABackends.element_values(self.xa_elem, "selection") or []
         return self._new_element(ls, XAScriptEditorSelectionObjectList)
 
     def text(self) -> "XAScriptEditorTextList":
-        ls = self.xa_elem.arrayByApplyingSelector_("text") or []
+        ls = XABackends.element_values(self.xa_elem, "text") or []
         return self._new_element(ls, XAScriptEditorTextList)
 
     def by_modified(self, modified: bool) -> "XAScriptEditorDocument":
@@ -496,7 +497,7 @@ class XAScriptEditorInsertionPointList(XAScriptEditorItemList):
         super().__init__(properties, filter, XAScriptEditorInsertionPoint)
 
     def contents(self) -> XAScriptEditorItemList:
-        ls = self.xa_elem.arrayByApplyingSelector_("contents") or []
+        ls = XABackends.element_values(self.xa_elem, "contents") or []
         return self._new_element(ls, XAScriptEditorItemList)
 
     def by_contents(
@@ -542,14 +543,14 @@ class XAScriptEditorTextList(XABase.XATextList):
         super().__init__(properties, filter, XAScriptEditorText)
 
     def color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("color") or []
+        ls = XABackends.element_values(self.xa_elem, "color") or []
         return [XABase.XAColor(x) for x in ls]
 
     def font(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("font") or [])
+        return list(XABackends.element_values(self.xa_elem, "font") or [])
 
     def size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
     def by_color(self, color: XABase.XAColor) -> "XAScriptEditorText":
         return self.by_property("color", color.xa_elem)
@@ -616,19 +617,19 @@ class XAScriptEditorLanguageList(XAScriptEditorItemList):
         super().__init__(properties, filter, XAScriptEditorLanguage)
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def supports_compiling(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("supportsCompiling") or [])
+        return list(XABackends.element_values(self.xa_elem, "supportsCompiling") or [])
 
     def supports_recording(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("supportsRecording") or [])
+        return list(XABackends.element_values(self.xa_elem, "supportsRecording") or [])
 
     def by_object_description(
         self, object_description: str
@@ -705,10 +706,10 @@ class XAScriptEditorSelectionObjectList(XAScriptEditorItemList):
         super().__init__(properties, filter, XAScriptEditorSelectionObject)
 
     def character_range(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("characterRange") or [])
+        return list(XABackends.element_values(self.xa_elem, "characterRange") or [])
 
     def contents(self) -> XAScriptEditorItemList:
-        ls = self.xa_elem.arrayByApplyingSelector_("contents") or []
+        ls = XABackends.element_values(self.xa_elem, "contents") or []
         return self._new_element(ls, XAScriptEditorItemList)
 
     def by_character_range(
@@ -8,6 +8,7 @@ from enum import Enum
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath, XAClipboardCodable
 
@@ -171,10 +172,10 @@ class XAShortcutFolderList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAShortcutFolder, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_id(self, id: str) -> Union["XAShortcutFolder", None]:
         return self.by_property("id", id)
@@ -183,7 +184,7 @@ class XAShortcutFolderList(XABase.XAList, XAClipboardCodable):
         return self.by_property("name", name)
 
     def shortcuts(self, filter: dict = None) -> list["XAShortcutList"]:
-        ls = self.xa_elem.arrayByApplyingSelector_("shortcuts") or []
+        ls = XABackends.element_values(self.xa_elem, "shortcuts") or []
         return [self._new_element(x, XAShortcutList, filter) for x in ls.get()]
 
     def get_clipboard_representation(self) -> list[str]:
@@ -284,31 +285,31 @@ class XAShortcutList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAShortcut, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def subtitle(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("subtitle") or [])
+        return list(XABackends.element_values(self.xa_elem, "subtitle") or [])
 
     def folder(self) -> XAShortcutFolderList:
-        ls = self.xa_elem.arrayByApplyingSelector_("id") or []
+        ls = XABackends.element_values(self.xa_elem, "id") or []
         return self._new_element(ls, XAShortcutFolderList)
 
     def color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("color") or []
+        ls = XABackends.element_values(self.xa_elem, "color") or []
         return [XABase.XAColor(x) for x in ls]
 
     def icon(self) -> XABase.XAImageList:
-        ls = self.xa_elem.arrayByApplyingSelector_("icon") or []
+        ls = XABackends.element_values(self.xa_elem, "icon") or []
         return [XABase.XAImage(x) for x in ls]
 
     def accepts_input(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("acceptsInput") or [])
+        return list(XABackends.element_values(self.xa_elem, "acceptsInput") or [])
 
     def action_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("actionCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "actionCount") or [])
 
     def by_id(self, id: str) -> Union["XAShortcut", None]:
         return self.by_property("id", id)
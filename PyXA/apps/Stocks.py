@@ -7,6 +7,7 @@ from typing import Union
 from AppKit import NSPredicate, NSMutableArray, NSURL
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XAClipboardCodable
 
@@ -174,7 +175,7 @@ class XAStocksSavedStockList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XAStocksSavedStock, filter)
 
     def properties(self) -> list[str]:
-        return self.xa_elem.arrayByApplyingSelector_("properties")
+        return XABackends.element_values(self.xa_elem, "properties")
 
     def name(self) -> list[str]:
         return [x.name for x in self]
@@ -189,7 +190,7 @@ class XAStocksSavedStockList(XABase.XAList, XAClipboardCodable):
         return [x.change for x in self]
 
     def selected(self) -> list[str]:
-        ls = self.xa_elem.arrayByApplyingSelector_("selected")
+        ls = XABackends.element_values(self.xa_elem, "selected")
         return [x.get() for x in ls]
 
     def get_clipboard_representation(self) -> list[Union[str, NSURL]]:
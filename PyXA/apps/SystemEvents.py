@@ -11,6 +11,7 @@ from typing import Any, Union
 import Quartz
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA.XABase import OSType
 from PyXA import XABaseScriptable
 from PyXA.XAEvents import KEYCODES
@@ -1005,13 +1006,13 @@ class XASystemEventsDocumentList(XABase.XAList):
         super().__init__(properties, XASystemEventsDocument, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> "XABase.XAFileList":
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return self._new_element(ls, XABase.XAFileList)
 
     def by_name(self, name: str) -> Union["XASystemEventsDocument", None]:
@@ -1081,7 +1082,7 @@ class XASystemEventsWindowList(XABaseScriptable.XASBWindowList):
             self.xa_ocls = self.xa_prnt.xa_wcls
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def collapse(self) -> "XASystemEventsWindowList":
         """Collapses all windows in the list.
@@ -1875,17 +1876,17 @@ class XASystemEventsUserList(XABase.XAList):
         super().__init__(properties, XASystemEventsUser, filter)
 
     def full_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fullName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fullName") or [])
 
     def home_directory(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("homeDirectory") or []
+        ls = XABackends.element_values(self.xa_elem, "homeDirectory") or []
         return [XABase.XAPath(x) for x in ls]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def picture_path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("picturePath") or []
+        ls = XABackends.element_values(self.xa_elem, "picturePath") or []
         return [XABase.XAPath(x) for x in ls]
 
     def by_full_name(self, full_name: str) -> Union["XASystemEventsUser", None]:
@@ -2171,37 +2172,37 @@ class XASystemEventsDesktopList(XABase.XAList):
         super().__init__(properties, XASystemEventsUser, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def change_interval(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("changeInterval") or [])
+        return list(XABackends.element_values(self.xa_elem, "changeInterval") or [])
 
     def display_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayName") or [])
 
     def picture(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("picture") or []
+        ls = XABackends.element_values(self.xa_elem, "picture") or []
         return [XABase.XAPath(x) for x in ls]
 
     def picture_rotation(self) -> list[XASystemEventsApplication.PictureRotation]:
-        ls = self.xa_elem.arrayByApplyingSelector_("pictureRotation") or []
+        ls = XABackends.element_values(self.xa_elem, "pictureRotation") or []
         return [XASystemEventsApplication.PictureRotation(x) for x in ls]
 
     def pictures_folder(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("picturesFolder") or []
+        ls = XABackends.element_values(self.xa_elem, "picturesFolder") or []
         return [XABase.XAPath(x) for x in ls]
 
     def random_folder(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("randomOrder") or [])
+        return list(XABackends.element_values(self.xa_elem, "randomOrder") or [])
 
     def translucent_menu_bar(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("translucentMenuBar") or [])
+        return list(XABackends.element_values(self.xa_elem, "translucentMenuBar") or [])
 
     def dynamic_style(self) -> list[XASystemEventsApplication.DynamicStyle]:
-        ls = self.xa_elem.arrayByApplyingSelector_("dynamicStyle") or []
+        ls = XABackends.element_values(self.xa_elem, "dynamicStyle") or []
         return [XASystemEventsApplication.DynamicStyle(x) for x in ls]
 
     def by_name(self, name: str) -> Union["XASystemEventsDesktop", None]:
@@ -2488,16 +2489,16 @@ class XASystemEventsLoginItemList(XABase.XAList):
         super().__init__(properties, XASystemEventsLoginItem, filter)
 
     def hidden(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("contents") or [])
+        return list(XABackends.element_values(self.xa_elem, "contents") or [])
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
+        ls = XABackends.element_values(self.xa_elem, "path") or []
         return [XABase.XAPath(x) for x in ls]
 
     def by_hidden(self, hidden: bool) -> Union["XASystemEventsLoginItem", None]:
@@ -2553,6 +2554,7 @@ class XASystemEventsLoginItem(XABase.XAObject):
         """The file system path to the Login Item."""
         return self.xa_elem.path()
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes the login item.
 
@@ -2573,16 +2575,16 @@ class XASystemEventsConfigurationList(XABase.XAList):
         super().__init__(properties, XASystemEventsConfiguration, filter)
 
     def account_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("accountName") or [])
+        return list(XABackends.element_values(self.xa_elem, "accountName") or [])
 
     def connected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("connected") or [])
+        return list(XABackends.element_values(self.xa_elem, "connected") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_account_name(
         self, account_name: str
@@ -2670,28 +2672,28 @@ class XASystemEventsInterfaceList(XABase.XAList):
         super().__init__(properties, XASystemEventsInterface, filter)
 
     def automatic(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("automatic") or [])
+        return list(XABackends.element_values(self.xa_elem, "automatic") or [])
 
     def duplex(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("duplex") or [])
+        return list(XABackends.element_values(self.xa_elem, "duplex") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def mac_address(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("macAddress") or [])
+        return list(XABackends.element_values(self.xa_elem, "macAddress") or [])
 
     def mtu(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("mtu") or [])
+        return list(XABackends.element_values(self.xa_elem, "mtu") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def speed(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("speed") or [])
+        return list(XABackends.element_values(self.xa_elem, "speed") or [])
 
     def by_automatic(self, automatic: bool) -> Union["XASystemEventsInterface", None]:
         return self.by_property("automatic", automatic)
@@ -2801,10 +2803,10 @@ class XASystemEventsLocationList(XABase.XAList):
         super().__init__(properties, XASystemEventsLocation, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_id(self, id: str) -> Union["XASystemEventsLocation", None]:
         return self.by_property("id", id)
@@ -2917,24 +2919,24 @@ class XASystemEventsServiceList(XABase.XAList):
         super().__init__(properties, XASystemEventsService, filter)
 
     def active(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("active") or [])
+        return list(XABackends.element_values(self.xa_elem, "active") or [])
 
     def current_configuration(self) -> XASystemEventsConfigurationList:
-        ls = self.xa_elem.arrayByApplyingSelector_("currentConfiguration") or []
+        ls = XABackends.element_values(self.xa_elem, "currentConfiguration") or []
         return self._new_element(ls, XASystemEventsConfigurationList)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def interface(self) -> XASystemEventsInterfaceList:
-        ls = self.xa_elem.arrayByApplyingSelector_("interface") or []
+        ls = XABackends.element_values(self.xa_elem, "interface") or []
         return self._new_element(ls, XASystemEventsInterfaceList)
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_active(self, active: bool) -> Union["XASystemEventsService", None]:
         return self.by_property("active", active)
@@ -3048,17 +3050,19 @@ class XASystemEventsScreenSaverList(XABase.XAList):
         super().__init__(properties, XASystemEventsScreenSaver, filter)
 
     def displayed_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayedName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayedName") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
+        ls = XABackends.element_values(self.xa_elem, "path") or []
         return [XABase.XAPath(x) for x in ls]
 
     def picture_display_style(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("pictureDisplayStyle") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "pictureDisplayStyle") or []
+        )
 
     def by_displayed_name(
         self, displayed_name: str
@@ -3264,17 +3268,17 @@ class XASystemEventsFolderActionList(XABase.XAList):
         super().__init__(properties, XABase.XAFolderAction, filter)
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
+        ls = XABackends.element_values(self.xa_elem, "path") or []
         return [XABase.XAPath(x) for x in ls]
 
     def volume(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("volume") or [])
+        return list(XABackends.element_values(self.xa_elem, "volume") or [])
 
     def by_enabled(self, enabled: bool) -> Union["XABase.XAFolderAction", None]:
         return self.by_property("enabled", enabled)
@@ -3365,17 +3369,17 @@ class XASystemEventsScriptList(XABase.XAList):
         super().__init__(properties, XASystemEventsScript, filter)
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
+        ls = XABackends.element_values(self.xa_elem, "path") or []
         return [XABase.XAPath(x) for x in ls]
 
     def posix_path(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("posixPath") or [])
+        return list(XABackends.element_values(self.xa_elem, "posixPath") or [])
 
     def by_enabled(self, enabled: bool) -> Union["XASystemEventsScript", None]:
         return self.by_property("enabled", enabled)
@@ -3443,10 +3447,10 @@ class XASystemEventsActionList(XABase.XAList):
         super().__init__(properties, XASystemEventsAction, filter)
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_object_description(
         self, object_description: str
@@ -3499,13 +3503,13 @@ class XASystemEventsAttributeList(XABase.XAList):
         super().__init__(properties, XASystemEventsAttribute, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def settable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("settable") or [])
+        return list(XABackends.element_values(self.xa_elem, "settable") or [])
 
     def value(self) -> Any:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def by_name(self, name: str) -> Union["XASystemEventsAttribute", None]:
         return self.by_property("name", name)
@@ -3566,60 +3570,60 @@ class XASystemEventsUIElementList(XABase.XAList):
 
     def accessibility_description(self) -> list[str]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("accessibilityDescription") or []
+            XABackends.element_values(self.xa_elem, "accessibilityDescription") or []
         )
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def entire_contents(self) -> "XASystemEventsUIElementList":
-        ls = self.xa_elem.arrayByApplyingSelector_("entireContents") or []
+        ls = XABackends.element_values(self.xa_elem, "entireContents") or []
         return self._new_element(ls, XASystemEventsUIElementList)
 
     def focused(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("focused") or [])
+        return list(XABackends.element_values(self.xa_elem, "focused") or [])
 
     def help(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("help") or [])
+        return list(XABackends.element_values(self.xa_elem, "help") or [])
 
     def maximum_value(self) -> list[Union[int, float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("maximumValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "maximumValue") or [])
 
     def minimum_value(self) -> list[Union[int, float]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("minimumValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "minimumValue") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def orientation(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("orientation") or [])
+        return list(XABackends.element_values(self.xa_elem, "orientation") or [])
 
     def position(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("position") or [])
+        return list(XABackends.element_values(self.xa_elem, "position") or [])
 
     def role(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("role") or [])
+        return list(XABackends.element_values(self.xa_elem, "role") or [])
 
     def role_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("roleDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "roleDescription") or [])
 
     def selected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("selected") or [])
+        return list(XABackends.element_values(self.xa_elem, "selected") or [])
 
     def size(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
     def subrole(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("subrole") or [])
+        return list(XABackends.element_values(self.xa_elem, "subrole") or [])
 
     def title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("title") or [])
+        return list(XABackends.element_values(self.xa_elem, "title") or [])
 
     def value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def by_accessibility_description(
         self, accessibility_description: str
@@ -3693,12 +3697,12 @@ class XASystemEventsUIElementList(XABase.XAList):
 
     def actions(self, filter: dict = None) -> "XASystemEventsActionList":
         ls = [
-            x for y in self.xa_elem.arrayByApplyingSelector_("actions") or [] for x in y
+            x for y in XABackends.element_values(self.xa_elem, "actions") or [] for x in y
         ]
         return self._new_element(ls, XASystemEventsActionList)
 
     def windows(self, filter: dict = None) -> "XASystemEventsWindowList":
-        ls = list(self.xa_elem.arrayByApplyingSelector_("windows") or [])
+        ls = list(XABackends.element_values(self.xa_elem, "windows") or [])
         self.xa_wcls = XASystemEventsWindow
         return self._new_element(ls, XASystemEventsWindowList)
 
@@ -4503,62 +4507,64 @@ class XASystemEventsProcessList(XASystemEventsUIElementList):
 
     def accepts_high_level_events(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("acceptsHighLevelEvents") or []
+            XABackends.element_values(self.xa_elem, "acceptsHighLevelEvents") or []
         )
 
     def accepts_remote_events(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("acceptsRemoteEvents") or [])
+        return list(
+            XABackends.element_values(self.xa_elem, "acceptsRemoteEvents") or []
+        )
 
     def architecture(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("architecture") or [])
+        return list(XABackends.element_values(self.xa_elem, "architecture") or [])
 
     def background_only(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("backgroundOnly") or [])
+        return list(XABackends.element_values(self.xa_elem, "backgroundOnly") or [])
 
     def bundle_identifier(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bundleIdentifier") or [])
+        return list(XABackends.element_values(self.xa_elem, "bundleIdentifier") or [])
 
     def classic(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("class") or [])
+        return list(XABackends.element_values(self.xa_elem, "class") or [])
 
     def creator_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("creatorType") or [])
+        return list(XABackends.element_values(self.xa_elem, "creatorType") or [])
 
     def displayed_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("displayedName") or [])
+        return list(XABackends.element_values(self.xa_elem, "displayedName") or [])
 
     def file(self) -> XABase.XAFileList:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return self._new_element(ls, XABase.XAFileList)
 
     def file_type(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileType") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileType") or [])
 
     def has_scripting_terminology(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("hasScriptingTerminology") or []
+            XABackends.element_values(self.xa_elem, "hasScriptingTerminology") or []
         )
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def partition_space_used(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("partitionSpaceUsed") or [])
+        return list(XABackends.element_values(self.xa_elem, "partitionSpaceUsed") or [])
 
     def short_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shortName") or [])
+        return list(XABackends.element_values(self.xa_elem, "shortName") or [])
 
     def total_partition_size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("totalPartitionSize") or [])
+        return list(XABackends.element_values(self.xa_elem, "totalPartitionSize") or [])
 
     def unix_id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("unixId") or [])
+        return list(XABackends.element_values(self.xa_elem, "unixId") or [])
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def by_accepts_high_level_events(
         self, accepts_high_level_events: bool
@@ -4771,7 +4777,7 @@ class XASystemEventsApplicationProcessList(XASystemEventsProcessList):
         super().__init__(properties, filter, XASystemEventsApplicationProcess)
 
     def application_file(self) -> XABase.XAFileList:
-        ls = self.xa_elem.arrayByApplyingSelector_("applicationFile") or []
+        ls = XABackends.element_values(self.xa_elem, "applicationFile") or []
         return self._new_element(ls, XABase.XAFileList)
 
     def by_application_file(
@@ -4807,7 +4813,7 @@ class XASystemEventsDeskAccessoryProcessList(XASystemEventsProcessList):
         super().__init__(properties, filter, XASystemEventsDeskAccessoryProcess)
 
     def desk_accessory_file(self) -> XABase.XAFileList:
-        ls = self.xa_elem.arrayByApplyingSelector_("deskAccessoryFile") or []
+        ls = XABackends.element_values(self.xa_elem, "deskAccessoryFile") or []
         return self._new_element(ls, XABase.XAFileList)
 
     def by_desk_accessory_file(
@@ -4843,7 +4849,7 @@ class XASystemEventsPropertyListFileList(XABase.XAList):
         super().__init__(properties, XASystemEventsPropertyListFile, filter)
 
     def contents(self) -> "XASystemEventsPropertyListItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("contents") or []
+        ls = XABackends.element_values(self.xa_elem, "contents") or []
         return self._new_element(ls, XASystemEventsPropertyListItemList)
 
     def by_content(
@@ -4889,17 +4895,17 @@ class XASystemEventsPropertyListItemList(XABase.XAList):
 
     def kind(self) -> list[str]:
         # TODO
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def text(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("text") or [])
+        return list(XABackends.element_values(self.xa_elem, "text") or [])
 
     def value(self) -> list[Union[int, bool, datetime, dict, str, bytes]]:
         # TODO: SPECIALIZE TYPE
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def by_kind(self, kind: str) -> Union["XASystemEventsPropertyListItem", None]:
         # TODO
@@ -4986,10 +4992,10 @@ class XASystemEventsXMLAttributeList(XABase.XAList):
         super().__init__(properties, XASystemEventsXMLAttribute, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def by_name(self, name: str) -> Union["XASystemEventsXMLAttribute", None]:
         return self.by_property("name", name)
@@ -5037,13 +5043,13 @@ class XASystemEventsXMLDataList(XABase.XAList):
         super().__init__(properties, XASystemEventsXMLData, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def text(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("text") or [])
+        return list(XABackends.element_values(self.xa_elem, "text") or [])
 
     def by_id(self, id: str) -> Union["XASystemEventsXMLData", None]:
         return self.by_property("id", id)
@@ -5119,13 +5125,13 @@ class XASystemEventsXMLElementList(XABase.XAList):
         super().__init__(properties, XASystemEventsXMLElement, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def by_id(self, id: str) -> Union["XASystemEventsXMLElement", None]:
         return self.by_property("id", id)
@@ -5213,7 +5219,7 @@ class XASystemEventsXMLFileList(XABase.XAFileList):
         super().__init__(properties, filter, XASystemEventsXMLFile)
 
     def contents(self) -> XASystemEventsXMLDataList:
-        ls = self.xa_elem.arrayByApplyingSelector_("contents") or []
+        ls = XABackends.element_values(self.xa_elem, "contents") or []
         return self._new_element(ls, XASystemEventsXMLDataList)
 
     def by_contents(
@@ -5357,25 +5363,25 @@ class XASystemEventsScriptingClassList(XABase.XAList):
         super().__init__(properties, XASystemEventsScriptingClass, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def hidden(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hidden") or [])
+        return list(XABackends.element_values(self.xa_elem, "hidden") or [])
 
     def plural_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("pluralName") or [])
+        return list(XABackends.element_values(self.xa_elem, "pluralName") or [])
 
     def suite_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("suiteName") or [])
+        return list(XABackends.element_values(self.xa_elem, "suiteName") or [])
 
     def superclass(self) -> "XASystemEventsScriptingClassList":
-        ls = self.xa_elem.arrayByApplyingSelector_("superclass") or []
+        ls = XABackends.element_values(self.xa_elem, "superclass") or []
         return self._new_element(ls, XASystemEventsScriptingClassList)
 
     def by_name(self, name: str) -> Union["XASystemEventsScriptingClass", None]:
@@ -5502,27 +5508,27 @@ class XASystemEventsScriptingCommandList(XABase.XAList):
         super().__init__(properties, XASystemEventsScriptingCommand, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def direct_parameter(self) -> "XASystemEventsScriptingParameterList":
-        ls = self.xa_elem.arrayByApplyingSelector_("directParameter") or []
+        ls = XABackends.element_values(self.xa_elem, "directParameter") or []
         return self._new_element(ls, XASystemEventsScriptingParameterList)
 
     def hidden(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hidden") or [])
+        return list(XABackends.element_values(self.xa_elem, "hidden") or [])
 
     def scripting_result(self) -> "XASystemEventsScriptingResultObjectList":
-        ls = self.xa_elem.arrayByApplyingSelector_("scriptingResult") or []
+        ls = XABackends.element_values(self.xa_elem, "scriptingResult") or []
         return self._new_element(ls, XASystemEventsScriptingResultObjectList)
 
     def suite_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("suiteName") or [])
+        return list(XABackends.element_values(self.xa_elem, "suiteName") or [])
 
     def by_name(self, name: str) -> Union["XASystemEventsScriptingCommand", None]:
         return self.by_property("name", name)
@@ -5682,13 +5688,13 @@ class XASystemEventsScriptingEnumerationList(XABase.XAList):
         super().__init__(properties, XASystemEventsScriptingEnumeration, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def hidden(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hidden") or [])
+        return list(XABackends.element_values(self.xa_elem, "hidden") or [])
 
     def by_name(self, name: str) -> Union["XASystemEventsScriptingEnumeration", None]:
         return self.by_property("name", name)
@@ -5758,16 +5764,16 @@ class XASystemEventsScriptingEnumeratorList(XABase.XAList):
         super().__init__(properties, XASystemEventsScriptingEnumerator, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def hidden(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hidden") or [])
+        return list(XABackends.element_values(self.xa_elem, "hidden") or [])
 
     def by_name(self, name: str) -> Union["XASystemEventsScriptingEnumerator", None]:
         return self.by_property("name", name)
@@ -5831,22 +5837,22 @@ class XASystemEventsScriptingParameterList(XABase.XAList):
         super().__init__(properties, XASystemEventsScriptingParameter, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def hidden(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hidden") or [])
+        return list(XABackends.element_values(self.xa_elem, "hidden") or [])
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def optional(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("optional") or [])
+        return list(XABackends.element_values(self.xa_elem, "optional") or [])
 
     def by_name(self, name: str) -> Union["XASystemEventsScriptingParameter", None]:
         return self.by_property("name", name)
@@ -5928,29 +5934,29 @@ class XASystemEventsScriptingPropertyList(XABase.XAList):
         super().__init__(properties, XASystemEventsScriptingProperty, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def access(self) -> list[XASystemEventsApplication.AccessRight]:
-        ls = self.xa_elem.arrayByApplyingSelector_("access") or []
+        ls = XABackends.element_values(self.xa_elem, "access") or []
         return [XASystemEventsApplication.AccessRight(x) for x in ls]
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def enumerated(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enumerated") or [])
+        return list(XABackends.element_values(self.xa_elem, "enumerated") or [])
 
     def hidden(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hidden") or [])
+        return list(XABackends.element_values(self.xa_elem, "hidden") or [])
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def listed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("listed") or [])
+        return list(XABackends.element_values(self.xa_elem, "listed") or [])
 
     def by_name(self, name: str) -> Union["XASystemEventsScriptingProperty", None]:
         return self.by_property("name", name)
@@ -6048,16 +6054,16 @@ class XASystemEventsScriptingResultObjectList(XABase.XAList):
         super().__init__(properties, XASystemEventsScriptingResultObject, filter)
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def enumerated(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enumerated") or [])
+        return list(XABackends.element_values(self.xa_elem, "enumerated") or [])
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def listed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("listed") or [])
+        return list(XABackends.element_values(self.xa_elem, "listed") or [])
 
     def by_object_description(
         self, object_description: str
@@ -6123,16 +6129,16 @@ class XASystemEventsScriptingSuiteList(XABase.XAList):
         super().__init__(properties, XASystemEventsScriptingSuite, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def hidden(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("hidden") or [])
+        return list(XABackends.element_values(self.xa_elem, "hidden") or [])
 
     def by_name(self, name: str) -> Union["XASystemEventsScriptingSuite", None]:
         return self.by_property("name", name)
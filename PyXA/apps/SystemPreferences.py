@@ -6,6 +6,7 @@ Control the macOS System Preferences application using JXA-like syntax.
 from typing import Union
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 
 
@@ -123,13 +124,13 @@ class XAPreferencePaneList(XABase.XAList):
         super().__init__(properties, XAPreferencePane, filter)
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def localized_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("localizedName") or [])
+        return list(XABackends.element_values(self.xa_elem, "localizedName") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_id(self, id: str) -> "XAPreferencePane":
         return self.by_property("id", id)
@@ -250,7 +251,7 @@ class XAPreferenceAnchorList(XABase.XAList):
         super().__init__(properties, XAPreferenceAnchor, filter)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def by_name(self, name: str) -> "XAPreferenceAnchor":
         return self.by_property("name", name)
@@ -10,6 +10,7 @@ from typing import Any, Literal, Union
 import ScriptingBridge
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from PyXA.XAProtocols import XACanOpenPath
 from PyXA.XAEvents import event_from_str
@@ -623,23 +624,23 @@ class XATVItemList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def container(self) -> list[XABase.XAObject]:
-        ls = self.xa_elem.arrayByApplyingSelector_("container") or []
+        ls = XABackends.element_values(self.xa_elem, "container") or []
         return self._new_element(ls, XABase.XAList)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def index(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("index") or [])
+        return list(XABackends.element_values(self.xa_elem, "index") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def persistent_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("persistentID") or [])
+        return list(XABackends.element_values(self.xa_elem, "persistentID") or [])
 
     def properties(self) -> list[dict]:
-        return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        return list(XABackends.element_values(self.xa_elem, "properties") or [])
 
     def by_container(self, container: XABase.XAObject) -> Union["XATVItem", None]:
         return self.by_property("container", container.xa_elem)
@@ -775,23 +776,23 @@ class XATVArtworkList(XATVItemList):
         super().__init__(properties, filter, XATVArtwork)
 
     def data(self) -> list[XABase.XAImage]:
-        ls = self.xa_elem.arrayByApplyingSelector_("data") or []
+        ls = XABackends.element_values(self.xa_elem, "data") or []
         return [XABase.XAImage(x) for x in ls]
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def downloaded(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("downloaded") or [])
+        return list(XABackends.element_values(self.xa_elem, "downloaded") or [])
 
     def format(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("format") or [])
+        return list(XABackends.element_values(self.xa_elem, "format") or [])
 
     def kind(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def raw_data(self) -> list[bytes]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rawData") or [])
+        return list(XABackends.element_values(self.xa_elem, "rawData") or [])
 
     def by_data(self, data: XABase.XAImage) -> Union["XATVArtwork", None]:
         return self.by_property("data", data.xa_elem)
@@ -886,32 +887,32 @@ class XATVPlaylistList(XATVItemList):
         super().__init__(properties, filter, obj_class)
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def duration(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("duration") or [])
+        return list(XABackends.element_values(self.xa_elem, "duration") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def parent(self) -> "XATVPlaylistList":
-        ls = self.xa_elem.arrayByApplyingSelector_("parent") or []
+        ls = XABackends.element_values(self.xa_elem, "parent") or []
         return self._new_element(ls, XATVPlaylistList)
 
     def size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
     def special_kind(self) -> list[XATVApplication.PlaylistKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("specialKind") or []
+        ls = XABackends.element_values(self.xa_elem, "specialKind") or []
         return [
             XATVApplication.PlaylistKind(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def time(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("time") or [])
+        return list(XABackends.element_values(self.xa_elem, "time") or [])
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def by_object_description(
         self, object_description: str
@@ -943,6 +944,7 @@ class XATVPlaylistList(XATVItemList):
     def by_visible(self, visible: bool) -> Union["XATVPlaylist", None]:
         return self.by_property("visible", visible)
 
+    @XABase._xa_batched()
     def push(
         self, *elements: list["XATVPlaylist"]
     ) -> Union["XATVPlaylist", list["XATVPlaylist"], None]:
@@ -1041,6 +1043,7 @@ class XATVPlaylist(XATVItem):
         """Whether the playlist is visible in the source list."""
         return self.xa_elem.visible()
 
+    @XABase._xa_batched("move")
     def move_to(self, parent_playlist):
         self.xa_elem.moveTo_(parent_playlist.xa_elem)
 
@@ -1104,6 +1107,7 @@ class XATVPlaylist(XATVItem):
         """
         self.xa_elem.moveTo_(location.xa_elem)
 
+    @XABase._xa_batched()
     def duplicate(
         self, location: Union["XATVSource", "XATVFolderPlaylist", None] = None
     ):
@@ -1219,13 +1223,13 @@ class XATVSourceList(XATVItemList):
         super().__init__(properties, filter, obj_class)
 
     def capacity(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("capacity") or [])
+        return list(XABackends.element_values(self.xa_elem, "capacity") or [])
 
     def free_space(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("freeSpace") or [])
+        return list(XABackends.element_values(self.xa_elem, "freeSpace") or [])
 
     def kind(self) -> list[XATVApplication.SourceKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("kind") or []
+        ls = XABackends.element_values(self.xa_elem, "kind") or []
         return [XATVApplication.SourceKind(XABase.OSType(x.stringValue())) for x in ls]
 
     def by_capacity(self, capacity: int) -> Union["XATVSource", None]:
@@ -1329,157 +1333,157 @@ class XATVTrackList(XATVItemList):
         super().__init__(properties, filter, obj_class)
 
     def album(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("album") or [])
+        return list(XABackends.element_values(self.xa_elem, "album") or [])
 
     def album_rating(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("albumRating") or [])
+        return list(XABackends.element_values(self.xa_elem, "albumRating") or [])
 
     def album_rating_kind(self) -> list[XATVApplication.RatingKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("albumRatingKind") or []
+        ls = XABackends.element_values(self.xa_elem, "albumRatingKind") or []
         return [XATVApplication.RatingKind(XABase.OSType(x.stringValue())) for x in ls]
 
     def bit_rate(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bitRate") or [])
+        return list(XABackends.element_values(self.xa_elem, "bitRate") or [])
 
     def bookmark(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bookmark") or [])
+        return list(XABackends.element_values(self.xa_elem, "bookmark") or [])
 
     def bookmarkable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bookmarkable") or [])
+        return list(XABackends.element_values(self.xa_elem, "bookmarkable") or [])
 
     def category(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("category") or [])
+        return list(XABackends.element_values(self.xa_elem, "category") or [])
 
     def comment(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("comment") or [])
+        return list(XABackends.element_values(self.xa_elem, "comment") or [])
 
     def database_id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("databaseID") or [])
+        return list(XABackends.element_values(self.xa_elem, "databaseID") or [])
 
     def date_added(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("dateAdded") or [])
+        return list(XABackends.element_values(self.xa_elem, "dateAdded") or [])
 
     def object_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def disc_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("discCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "discCount") or [])
 
     def disc_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("discNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "discNumber") or [])
 
     def downloader_apple_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("downloaderAppleID") or [])
+        return list(XABackends.element_values(self.xa_elem, "downloaderAppleID") or [])
 
     def downloader_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("downloaderName") or [])
+        return list(XABackends.element_values(self.xa_elem, "downloaderName") or [])
 
     def duration(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("duration") or [])
+        return list(XABackends.element_values(self.xa_elem, "duration") or [])
 
     def enabled(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("enabled") or [])
+        return list(XABackends.element_values(self.xa_elem, "enabled") or [])
 
     def episode_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("episodeID") or [])
+        return list(XABackends.element_values(self.xa_elem, "episodeID") or [])
 
     def episode_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("episodeNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "episodeNumber") or [])
 
     def finish(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("finish") or [])
+        return list(XABackends.element_values(self.xa_elem, "finish") or [])
 
     def genre(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("genre") or [])
+        return list(XABackends.element_values(self.xa_elem, "genre") or [])
 
     def grouping(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("grouping") or [])
+        return list(XABackends.element_values(self.xa_elem, "grouping") or [])
 
     def kind(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("kind") or [])
+        return list(XABackends.element_values(self.xa_elem, "kind") or [])
 
     def long_description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("longDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "longDescription") or [])
 
     def media_kind(self) -> list[XATVApplication.MediaKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("mediaKind") or []
+        ls = XABackends.element_values(self.xa_elem, "mediaKind") or []
         return [XATVApplication.MediaKind(XABase.OSType(x.stringValue())) for x in ls]
 
     def modification_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modificationDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "modificationDate") or [])
 
     def played_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("playedCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "playedCount") or [])
 
     def played_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("playedDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "playedDate") or [])
 
     def purchaser_apple_id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("purchaserAppleID") or [])
+        return list(XABackends.element_values(self.xa_elem, "purchaserAppleID") or [])
 
     def purchaser_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("purchaserName") or [])
+        return list(XABackends.element_values(self.xa_elem, "purchaserName") or [])
 
     def rating(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rating") or [])
+        return list(XABackends.element_values(self.xa_elem, "rating") or [])
 
     def rating_kind(self) -> list[XATVApplication.RatingKind]:
-        ls = self.xa_elem.arrayByApplyingSelector_("ratingKind") or []
+        ls = XABackends.element_values(self.xa_elem, "ratingKind") or []
         return [XATVApplication.RatingKind(XABase.OSType(x.stringValue())) for x in ls]
 
     def release_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("releaseDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "releaseDate") or [])
 
     def sample_rate(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sampleRate") or [])
+        return list(XABackends.element_values(self.xa_elem, "sampleRate") or [])
 
     def season_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("seasonNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "seasonNumber") or [])
 
     def skipped_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("skippedCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "skippedCount") or [])
 
     def skipped_date(self) -> list[datetime]:
-        return list(self.xa_elem.arrayByApplyingSelector_("skippedDate") or [])
+        return list(XABackends.element_values(self.xa_elem, "skippedDate") or [])
 
     def show(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("show") or [])
+        return list(XABackends.element_values(self.xa_elem, "show") or [])
 
     def sort_album(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortAlbum") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortAlbum") or [])
 
     def sort_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortName") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortName") or [])
 
     def sort_show(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortShow") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortShow") or [])
 
     def size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("size") or [])
+        return list(XABackends.element_values(self.xa_elem, "size") or [])
 
     def start(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("start") or [])
+        return list(XABackends.element_values(self.xa_elem, "start") or [])
 
     def time(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("time") or [])
+        return list(XABackends.element_values(self.xa_elem, "time") or [])
 
     def track_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("trackCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "trackCount") or [])
 
     def track_number(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("trackNumber") or [])
+        return list(XABackends.element_values(self.xa_elem, "trackNumber") or [])
 
     def unplayed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("unplayed") or [])
+        return list(XABackends.element_values(self.xa_elem, "unplayed") or [])
 
     def volume_adjustment(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("volumeAdjustment") or [])
+        return list(XABackends.element_values(self.xa_elem, "volumeAdjustment") or [])
 
     def year(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("year") or [])
+        return list(XABackends.element_values(self.xa_elem, "year") or [])
 
     def sort_director(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("sortDirector") or [])
+        return list(XABackends.element_values(self.xa_elem, "sortDirector") or [])
 
     def by_sort_director(self, sort_director: str) -> Union["XATVTrack", None]:
         return self.by_property("sortDirector", sort_director)
@@ -2110,6 +2114,7 @@ class XATVTrack(XATVItem):
         """
         self.xa_elem.moveTo_(location.xa_elem)
 
+    @XABase._xa_batched()
     def duplicate(self, location: Union[XATVPlaylist, XATVSource]):
         """Duplicates the track at the specified location.
 
@@ -2145,7 +2150,7 @@ class XATVFileTrackList(XATVTrackList):
         super().__init__(properties, filter, XATVFileTrack)
 
     def location(self) -> list[XABase.XAURL]:
-        ls = self.xa_elem.arrayByApplyingSelector_("location") or []
+        ls = XABackends.element_values(self.xa_elem, "location") or []
         return [XABase.XAURL(x) for x in ls]
 
     def by_location(self, location: XABase.XAURL) -> Union["XATVFileTrack", None]:
@@ -2207,7 +2212,7 @@ class XATVURLTrackList(XATVTrackList):
         super().__init__(properties, filter, XATVURLTrack)
 
     def address(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("address") or [])
+        return list(XABackends.element_values(self.xa_elem, "address") or [])
 
     def by_address(self, address: str) -> Union["XATVURLTrack", None]:
         return self.by_property("address", address)
@@ -2246,10 +2251,10 @@ class XATVUserPlaylistList(XATVPlaylistList):
         super().__init__(properties, filter, XATVUserPlaylist)
 
     def shared(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("shared") or [])
+        return list(XABackends.element_values(self.xa_elem, "shared") or [])
 
     def smart(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("smart") or [])
+        return list(XABackends.element_values(self.xa_elem, "smart") or [])
 
     def by_shared(self, shared: bool) -> Union["XATVUserPlaylist", None]:
         return self.by_property("shared", shared)
@@ -2358,34 +2363,34 @@ class XATVWindowList(XATVItemList):
         super().__init__(properties, filter, obj_class)
 
     def bounds(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("bounds") or [])
+        return list(XABackends.element_values(self.xa_elem, "bounds") or [])
 
     def closeable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("closeable") or [])
+        return list(XABackends.element_values(self.xa_elem, "closeable") or [])
 
     def collapseable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("collapseable") or [])
+        return list(XABackends.element_values(self.xa_elem, "collapseable") or [])
 
     def collapsed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("collapsed") or [])
+        return list(XABackends.element_values(self.xa_elem, "collapsed") or [])
 
     def full_screen(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fullScreen") or [])
+        return list(XABackends.element_values(self.xa_elem, "fullScreen") or [])
 
     def position(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("position") or [])
+        return list(XABackends.element_values(self.xa_elem, "position") or [])
 
     def resizable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("resizable") or [])
+        return list(XABackends.element_values(self.xa_elem, "resizable") or [])
 
     def visible(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("visible") or [])
+        return list(XABackends.element_values(self.xa_elem, "visible") or [])
 
     def zoomable(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomable") or [])
+        return list(XABackends.element_values(self.xa_elem, "zoomable") or [])
 
     def zoomed(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("zoomed") or [])
+        return list(XABackends.element_values(self.xa_elem, "zoomed") or [])
 
     def by_bounds(
         self, bounds: tuple[tuple[int, int], tuple[int, int]]
@@ -2475,11 +2480,11 @@ class XATVBrowserWindowList(XATVWindowList):
         super().__init__(properties, filter, XATVBrowserWindow)
 
     def selection(self) -> XATVTrackList:
-        ls = self.xa_elem.arrayByApplyingSelector_("selection") or []
+        ls = XABackends.element_values(self.xa_elem, "selection") or []
         return self._new_element(ls, XATVTrackList)
 
     def view(self) -> XATVPlaylistList:
-        ls = self.xa_elem.arrayByApplyingSelector_("view") or []
+        ls = XABackends.element_values(self.xa_elem, "view") or []
         return self._new_element(ls, XATVPlaylistList)
 
     def by_selection(
@@ -2523,11 +2528,11 @@ class XATVPlaylistWindowList(XATVWindowList):
         super().__init__(properties, filter, XATVPlaylistWindow)
 
     def selection(self) -> XATVTrackList:
-        ls = self.xa_elem.arrayByApplyingSelector_("selection") or []
+        ls = XABackends.element_values(self.xa_elem, "selection") or []
         return self._new_element(ls, XATVTrackList)
 
     def view(self) -> XATVPlaylistList:
-        ls = self.xa_elem.arrayByApplyingSelector_("view") or []
+        ls = XABackends.element_values(self.xa_elem, "view") or []
         return self._new_element(ls, XATVPlaylistList)
 
     def by_selection(
@@ -9,6 +9,7 @@ from typing import Dict, Union
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import XACanOpenPath, XAClipboardCodable
 
@@ -187,41 +188,41 @@ class XATerminalTabList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XATerminalTab, filter)
 
     def number_of_rows(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("numberOfRows") or [])
+        return list(XABackends.element_values(self.xa_elem, "numberOfRows") or [])
 
     def number_of_columns(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("numberOfColumns") or [])
+        return list(XABackends.element_values(self.xa_elem, "numberOfColumns") or [])
 
     def contents(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("contents") or [])
+        return list(XABackends.element_values(self.xa_elem, "contents") or [])
 
     def history(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("history") or [])
+        return list(XABackends.element_values(self.xa_elem, "history") or [])
 
     def busy(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("busy") or [])
+        return list(XABackends.element_values(self.xa_elem, "busy") or [])
 
     def processes(self) -> list[list[str]]:
         return [
-            list(x) for x in self.xa_elem.arrayByApplyingSelector_("processes") or []
+            list(x) for x in XABackends.element_values(self.xa_elem, "processes") or []
         ]
 
     def selected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("selected") or [])
+        return list(XABackends.element_values(self.xa_elem, "selected") or [])
 
     def title_displays_custom_title(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("titleDisplaysCustomTitle") or []
+            XABackends.element_values(self.xa_elem, "titleDisplaysCustomTitle") or []
         )
 
     def custom_title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("customTitle") or [])
+        return list(XABackends.element_values(self.xa_elem, "customTitle") or [])
 
     def tty(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("tty") or [])
+        return list(XABackends.element_values(self.xa_elem, "tty") or [])
 
     def current_settings(self) -> "XATerminalSettingsSetList":
-        ls = self.xa_elem.arrayByApplyingSelector_("currentSettings") or []
+        ls = XABackends.element_values(self.xa_elem, "currentSettings") or []
         return self._new_element(ls, XATerminalSettingsSetList)
 
     def by_number_of_rows(self, number_of_rows: int) -> Union["XATerminalTab", None]:
@@ -401,75 +402,75 @@ class XATerminalSettingsSetList(XABase.XAList, XAClipboardCodable):
         super().__init__(properties, XATerminalSettingsSet, filter)
 
     def id(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def number_of_rows(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("numberOfRows") or [])
+        return list(XABackends.element_values(self.xa_elem, "numberOfRows") or [])
 
     def number_of_columns(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("numberOfColumns") or [])
+        return list(XABackends.element_values(self.xa_elem, "numberOfColumns") or [])
 
     def cursor_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("cursorColor") or []
+        ls = XABackends.element_values(self.xa_elem, "cursorColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def background_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("backgroundColor") or []
+        ls = XABackends.element_values(self.xa_elem, "backgroundColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def normal_text_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("normalTextColor") or []
+        ls = XABackends.element_values(self.xa_elem, "normalTextColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def bold_text_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("boldTextColor") or []
+        ls = XABackends.element_values(self.xa_elem, "boldTextColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def font_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fontName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fontName") or [])
 
     def font_size(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fontSize") or [])
+        return list(XABackends.element_values(self.xa_elem, "fontSize") or [])
 
     def font_antialiasing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fontAntialiasing") or [])
+        return list(XABackends.element_values(self.xa_elem, "fontAntialiasing") or [])
 
     def clean_commands(self) -> list[list[str]]:
         return [
             list(x)
-            for x in self.xa_elem.arrayByApplyingSelector_("cleanCommands") or []
+            for x in XABackends.element_values(self.xa_elem, "cleanCommands") or []
         ]
 
     def title_displays_device_name(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("titleDisplaysDeviceName") or []
+            XABackends.element_values(self.xa_elem, "titleDisplaysDeviceName") or []
         )
 
     def title_displays_shell_path(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("titleDisplaysShellPath") or []
+            XABackends.element_values(self.xa_elem, "titleDisplaysShellPath") or []
         )
 
     def title_displays_window_size(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("titleDisplaysWindowSize") or []
+            XABackends.element_values(self.xa_elem, "titleDisplaysWindowSize") or []
         )
 
     def title_displays_settings_name(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("titleDisplaysSettingsName") or []
+            XABackends.element_values(self.xa_elem, "titleDisplaysSettingsName") or []
         )
 
     def title_displays_custom_title(self) -> list[bool]:
         return list(
-            self.xa_elem.arrayByApplyingSelector_("titleDisplaysCustomTitle") or []
+            XABackends.element_values(self.xa_elem, "titleDisplaysCustomTitle") or []
         )
 
     def custom_title(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("customTitle") or [])
+        return list(XABackends.element_values(self.xa_elem, "customTitle") or [])
 
     def by_id(self, id: int) -> Union["XATerminalSettingsSet", None]:
         return self.by_property("id", id)
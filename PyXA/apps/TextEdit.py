@@ -10,6 +10,7 @@ from enum import Enum
 import AppKit
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XABaseScriptable
 from ..XAProtocols import (
     XACanOpenPath,
@@ -321,7 +322,7 @@ class XATextEditDocumentList(XABase.XATextDocumentList, XAClipboardCodable):
         super().__init__(properties, filter, XATextEditDocument)
 
     def properties(self) -> list[dict]:
-        raw_dicts = list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        raw_dicts = list(XABackends.element_values(self.xa_elem, "properties") or [])
         return [
             {
                 "modified": raw_dict["modified"],
@@ -336,14 +337,14 @@ class XATextEditDocumentList(XABase.XATextDocumentList, XAClipboardCodable):
         ]
 
     def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
+        ls = XABackends.element_values(self.xa_elem, "path") or []
         return [XABase.XAPath(x) for x in ls]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def by_properties(self, properties: dict) -> Union["XABase.XATextDocument", None]:
         for document in self.xa_elem:
@@ -460,6 +461,7 @@ class XATextEditDocumentList(XABase.XATextDocumentList, XAClipboardCodable):
             items.append(paths[index].xa_elem)
         return items
 
+    @XABase._xa_batched()
     def push(
         self, *documents: list["XATextEditDocument"]
     ) -> Union["XATextEditDocument", list["XATextEditDocument"], None]:
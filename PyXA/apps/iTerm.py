@@ -279,6 +279,7 @@ class XAiTermTab(XABase.XAObject, XACloseable, XASelectable):
         """
         self.xa_elem.close()
 
+    @XABase._xa_batched("move")
     def move_to(self, window: XAiTermWindow):
         self.xa_elem.moveTo_(window.xa_elem)
 
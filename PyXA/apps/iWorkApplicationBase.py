@@ -11,6 +11,7 @@ from typing import Any, Union
 import AppKit, ScriptingBridge
 
 from PyXA import XABase
+from PyXA import XABackends
 from PyXA import XAEvents
 from PyXA.XABase import OSType
 from PyXA import XABaseScriptable
@@ -288,25 +289,25 @@ class XAiWorkDocumentList(XABase.XAList):
         return pyxa_dicts
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def modified(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
+        return list(XABackends.element_values(self.xa_elem, "modified") or [])
 
     def file(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("file") or []
+        ls = XABackends.element_values(self.xa_elem, "file") or []
         return [XABase.XAPath(x) for x in ls]
 
     def id(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("id") or [])
+        return list(XABackends.element_values(self.xa_elem, "id") or [])
 
     def selection(self) -> "XAiWorkiWorkItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("selection") or []
+        ls = XABackends.element_values(self.xa_elem, "selection") or []
         ls = [x for t in ls for x in t]
         return self._new_element(ls, XAiWorkiWorkItemList)
 
     def password_protected(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("passwordProtected") or [])
+        return list(XABackends.element_values(self.xa_elem, "passwordProtected") or [])
 
     def by_properties(self, properties: dict) -> Union["XAiWorkDocument", None]:
         raw_dict = {}
@@ -475,7 +476,7 @@ class XAiWorkContainerList(XABase.XAList):
                 self.__dict__.update(new_self.__dict__)
 
     def charts(self, filter: Union[dict, None] = None) -> "XAiWorkChartList":
-        ls = self.xa_elem.arrayByApplyingSelector_("charts") or []
+        ls = XABackends.element_values(self.xa_elem, "charts") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -483,7 +484,7 @@ class XAiWorkContainerList(XABase.XAList):
         return self._new_element(ls, XAiWorkChartList, filter)
 
     def groups(self, filter: Union[dict, None] = None) -> "XAiWorkGroupList":
-        ls = self.xa_elem.arrayByApplyingSelector_("groups") or []
+        ls = XABackends.element_values(self.xa_elem, "groups") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -491,7 +492,7 @@ class XAiWorkContainerList(XABase.XAList):
         return self._new_element(ls, XAiWorkGroupList, filter)
 
     def images(self, filter: Union[dict, None] = None) -> "XAiWorkImageList":
-        ls = self.xa_elem.arrayByApplyingSelector_("images") or []
+        ls = XABackends.element_values(self.xa_elem, "images") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -499,7 +500,7 @@ class XAiWorkContainerList(XABase.XAList):
         return self._new_element(ls, XAiWorkImageList, filter)
 
     def iwork_items(self, filter: Union[dict, None] = None) -> "XAiWorkiWorkItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("iWorkItems") or []
+        ls = XABackends.element_values(self.xa_elem, "iWorkItems") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -507,7 +508,7 @@ class XAiWorkContainerList(XABase.XAList):
         return self._new_element(ls, XAiWorkiWorkItemList, filter)
 
     def lines(self, filter: Union[dict, None] = None) -> "XAiWorkLineList":
-        ls = self.xa_elem.arrayByApplyingSelector_("lines") or []
+        ls = XABackends.element_values(self.xa_elem, "lines") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -515,7 +516,7 @@ class XAiWorkContainerList(XABase.XAList):
         return self._new_element(ls, XAiWorkLineList, filter)
 
     def movies(self, filter: Union[dict, None] = None) -> "XAiWorkMovieList":
-        ls = self.xa_elem.arrayByApplyingSelector_("movies") or []
+        ls = XABackends.element_values(self.xa_elem, "movies") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -523,7 +524,7 @@ class XAiWorkContainerList(XABase.XAList):
         return self._new_element(ls, XAiWorkMovieList, filter)
 
     def shapes(self, filter: Union[dict, None] = None) -> "XAiWorkShapeList":
-        ls = self.xa_elem.arrayByApplyingSelector_("shapes") or []
+        ls = XABackends.element_values(self.xa_elem, "shapes") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -531,7 +532,7 @@ class XAiWorkContainerList(XABase.XAList):
         return self._new_element(ls, XAiWorkShapeList, filter)
 
     def tables(self, filter: Union[dict, None] = None) -> "XAiWorkTableList":
-        ls = self.xa_elem.arrayByApplyingSelector_("tables") or []
+        ls = XABackends.element_values(self.xa_elem, "tables") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -539,7 +540,7 @@ class XAiWorkContainerList(XABase.XAList):
         return self._new_element(ls, XAiWorkTableList, filter)
 
     def text_items(self, filter: Union[dict, None] = None) -> "XAiWorkTextItemList":
-        ls = self.xa_elem.arrayByApplyingSelector_("textItems") or []
+        ls = XABackends.element_values(self.xa_elem, "textItems") or []
         if isinstance(ls[0], ScriptingBridge.SBElementArray):
             ls = [x for sublist in ls for x in sublist]
         else:
@@ -725,20 +726,20 @@ class XAiWorkiWorkItemList(XABase.XAList):
         return pyxa_dicts
 
     def height(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("height") or [])
+        return list(XABackends.element_values(self.xa_elem, "height") or [])
 
     def locked(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("locked") or [])
+        return list(XABackends.element_values(self.xa_elem, "locked") or [])
 
     def width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("width") or [])
+        return list(XABackends.element_values(self.xa_elem, "width") or [])
 
     def parent(self) -> XAiWorkContainerList:
-        ls = self.xa_elem.arrayByApplyingSelector_("parent") or []
+        ls = XABackends.element_values(self.xa_elem, "parent") or []
         return self._new_element(ls, XAiWorkContainerList)
 
     def position(self) -> list[tuple[int, int]]:
-        ls = self.xa_elem.arrayByApplyingSelector_("position") or []
+        ls = XABackends.element_values(self.xa_elem, "position") or []
         return [tuple(x.pointValue()) for x in ls]
 
     def by_properties(self, properties: dict) -> Union["XAiWorkiWorkItem", None]:
@@ -870,6 +871,7 @@ class XAiWorkiWorkItem(XABase.XAObject):
     def position(self, position: tuple[int, int]):
         self.set_property("position", position)
 
+    @XABase._xa_batched("delete")
     def delete(self):
         """Deletes the item.
 
@@ -877,6 +879,7 @@ class XAiWorkiWorkItem(XABase.XAObject):
         """
         self.xa_elem.delete()
 
+    @XABase._xa_batched()
     def duplicate(self) -> "XAiWorkiWorkItem":
         """Duplicates the item.
 
@@ -955,20 +958,20 @@ class XAiWorkGroupList(XAiWorkContainerList):
         super().__init__(properties, filter, XAiWorkGroup)
 
     def height(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("height") or [])
+        return list(XABackends.element_values(self.xa_elem, "height") or [])
 
     def position(self) -> list[tuple[int, int]]:
-        ls = self.xa_elem.arrayByApplyingSelector_("position") or []
+        ls = XABackends.element_values(self.xa_elem, "position") or []
         return [tuple(point.pointValue()) for point in ls]
 
     def width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("width") or [])
+        return list(XABackends.element_values(self.xa_elem, "width") or [])
 
     def rotation(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rotation") or [])
+        return list(XABackends.element_values(self.xa_elem, "rotation") or [])
 
     def parent(self) -> XAiWorkContainerList:
-        ls = self.xa_elem.arrayByApplyingSelector_("parent") or []
+        ls = XABackends.element_values(self.xa_elem, "parent") or []
         return self._new_element(ls, XAiWorkContainerList)
 
     def by_height(self, height: int) -> "XAiWorkGroup":
@@ -1050,25 +1053,25 @@ class XAiWorkImageList(XAiWorkiWorkItemList):
         super().__init__(properties, filter, XAiWorkImage)
 
     def description(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("objectDescription") or [])
+        return list(XABackends.element_values(self.xa_elem, "objectDescription") or [])
 
     def file(self) -> list[str]:
         return [x.file() for x in self.xa_elem]
 
     def file_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileName") or [])
 
     def opacity(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("opacity") or [])
+        return list(XABackends.element_values(self.xa_elem, "opacity") or [])
 
     def reflection_showing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionShowing") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionShowing") or [])
 
     def reflection_value(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionValue") or [])
 
     def rotation(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rotation") or [])
+        return list(XABackends.element_values(self.xa_elem, "rotation") or [])
 
     def by_description(self, description: str) -> "XAiWorkImage":
         return self.by_property("objectDescription", description)
@@ -1204,13 +1207,13 @@ class XAiWorkAudioClipList(XAiWorkiWorkItemList):
         super().__init__(properties, filter, XAiWorkAudioClip)
 
     def file_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileName") or [])
 
     def clip_volume(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("clipVolume") or [])
+        return list(XABackends.element_values(self.xa_elem, "clipVolume") or [])
 
     def repetition_method(self) -> list[XAiWorkApplication.RepetitionMethod]:
-        ls = self.xa_elem.arrayByApplyingSelector_("repetitionMethod") or []
+        ls = XABackends.element_values(self.xa_elem, "repetitionMethod") or []
         return [
             XAiWorkApplication.RepetitionMethod(XABase.OSType(x.stringValue()))
             for x in ls
@@ -1305,26 +1308,26 @@ class XAiWorkShapeList(XAiWorkiWorkItemList):
         ]
 
     def background_fill_type(self) -> list[XAiWorkApplication.FillOption]:
-        ls = self.xa_elem.arrayByApplyingSelector_("backgroundFillType") or []
+        ls = XABackends.element_values(self.xa_elem, "backgroundFillType") or []
         return [
             XAiWorkApplication.FillOption(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def object_text(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("objectText") or []
+        ls = XABackends.element_values(self.xa_elem, "objectText") or []
         return self._new_element(ls, XABase.XATextList)
 
     def opacity(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("opacity") or [])
+        return list(XABackends.element_values(self.xa_elem, "opacity") or [])
 
     def reflection_showing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionShowing") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionShowing") or [])
 
     def reflection_value(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionValue") or [])
 
     def rotation(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rotation") or [])
+        return list(XABackends.element_values(self.xa_elem, "rotation") or [])
 
     def by_properties(self, properties: dict) -> Union["XAiWorkShape", None]:
         raw_dict = {}
@@ -1507,19 +1510,19 @@ class XAiWorkLineList(XAiWorkiWorkItemList):
         super().__init__(properties, filter, XAiWorkLine)
 
     def end_point(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("end_point") or [])
+        return list(XABackends.element_values(self.xa_elem, "end_point") or [])
 
     def reflection_showing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionShowing") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionShowing") or [])
 
     def reflection_value(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionValue") or [])
 
     def rotation(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rotation") or [])
+        return list(XABackends.element_values(self.xa_elem, "rotation") or [])
 
     def start_point(self) -> list[tuple[int, int]]:
-        return list(self.xa_elem.arrayByApplyingSelector_("start_point") or [])
+        return list(XABackends.element_values(self.xa_elem, "start_point") or [])
 
     def by_end_point(self, end_point: tuple[int, int]) -> "XAiWorkLine":
         return self.by_property("endPoint", end_point)
@@ -1604,26 +1607,26 @@ class XAiWorkMovieList(XAiWorkiWorkItemList):
         super().__init__(properties, filter, XAiWorkMovie)
 
     def file_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fileName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fileName") or [])
 
     def movie_volume(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("movieVolume") or [])
+        return list(XABackends.element_values(self.xa_elem, "movieVolume") or [])
 
     def opacity(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("opacity") or [])
+        return list(XABackends.element_values(self.xa_elem, "opacity") or [])
 
     def reflection_showing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionShowing") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionShowing") or [])
 
     def reflection_value(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionValue") or [])
 
     def reflection_value(self) -> list[XAiWorkApplication.RepetitionMethod]:
-        ls = self.xa_elem.arrayByApplyingSelector_("repetitionMethod") or []
+        ls = XABackends.element_values(self.xa_elem, "repetitionMethod") or []
         return [XAiWorkApplication.RepetitionMethod(x) for x in ls]
 
     def rotation(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rotation") or [])
+        return list(XABackends.element_values(self.xa_elem, "rotation") or [])
 
     def by_file_name(self, file_name: str) -> "XAiWorkMovie":
         return self.by_property("fileName", file_name)
@@ -1734,24 +1737,24 @@ class XAiWorkTextItemList(XAiWorkiWorkItemList):
         super().__init__(properties, filter, XAiWorkTextItem)
 
     def background_fill_type(self) -> list[XAiWorkApplication.FillOption]:
-        ls = self.xa_elem.arrayByApplyingSelector_("fileName") or []
+        ls = XABackends.element_values(self.xa_elem, "fileName") or []
         return [XAiWorkApplication.FillOption(x) for x in ls]
 
     def text(self) -> XABase.XATextList:
-        ls = self.xa_elem.arrayByApplyingSelector_("text") or []
+        ls = XABackends.element_values(self.xa_elem, "text") or []
         return self._new_element(ls, XABase.XATextList)
 
     def opacity(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("opacity") or [])
+        return list(XABackends.element_values(self.xa_elem, "opacity") or [])
 
     def reflection_showing(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionShowing") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionShowing") or [])
 
     def reflection_value(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("reflectionValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "reflectionValue") or [])
 
     def rotation(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rotation") or [])
+        return list(XABackends.element_values(self.xa_elem, "rotation") or [])
 
     def by_background_fill_type(
         self, background_fill_type: XAiWorkApplication.FillOption
@@ -1852,29 +1855,29 @@ class XAiWorkTableList(XAiWorkiWorkItemList):
         super().__init__(properties, filter, XAiWorkTable)
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def row_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("rowCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "rowCount") or [])
 
     def column_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("columnCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "columnCount") or [])
 
     def header_row_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("headerRowCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "headerRowCount") or [])
 
     def header_column_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("headerColumnCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "headerColumnCount") or [])
 
     def footer_row_count(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("footerRowCount") or [])
+        return list(XABackends.element_values(self.xa_elem, "footerRowCount") or [])
 
     def cell_range(self) -> "XAiWorkRangeList":
-        ls = self.xa_elem.arrayByApplyingSelector_("cellRange") or []
+        ls = XABackends.element_values(self.xa_elem, "cellRange") or []
         return self._new_element(ls, XAiWorkRangeList)
 
     def selection_range(self) -> "XAiWorkRangeList":
-        ls = self.xa_elem.arrayByApplyingSelector_("selectionRange") or []
+        ls = XABackends.element_values(self.xa_elem, "selectionRange") or []
         return self._new_element(ls, XAiWorkRangeList)
 
     def by_name(self, name: str) -> Union["XAiWorkTable", None]:
@@ -2087,7 +2090,7 @@ class XAiWorkRangeList(XABase.XAList):
         super().__init__(properties, obj_class, filter)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = [None] * len(self.xa_elem)
         for index, raw_dict in enumerate(raw_dicts):
             pyxa_dicts[index] = {
@@ -2112,37 +2115,37 @@ class XAiWorkRangeList(XABase.XAList):
         return pyxa_dicts
 
     def font_name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fontName") or [])
+        return list(XABackends.element_values(self.xa_elem, "fontName") or [])
 
     def font_size(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("fontSize") or [])
+        return list(XABackends.element_values(self.xa_elem, "fontSize") or [])
 
     def format(self) -> list[XAiWorkApplication.CellFormat]:
-        ls = self.xa_elem.arrayByApplyingSelector_("format") or []
+        ls = XABackends.element_values(self.xa_elem, "format") or []
         return [XAiWorkApplication.CellFormat(x) for x in ls]
 
     def alignment(self) -> list[XAiWorkApplication.Alignment]:
-        ls = self.xa_elem.arrayByApplyingSelector_("alignment") or []
+        ls = XABackends.element_values(self.xa_elem, "alignment") or []
         return [
             XAiWorkApplication.Alignment(XABase.OSType(x.stringValue())) for x in ls
         ]
 
     def name(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
+        return list(XABackends.element_values(self.xa_elem, "name") or [])
 
     def text_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("textColor") or []
+        ls = XABackends.element_values(self.xa_elem, "textColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def text_wrap(self) -> list[bool]:
-        return list(self.xa_elem.arrayByApplyingSelector_("textWrap") or [])
+        return list(XABackends.element_values(self.xa_elem, "textWrap") or [])
 
     def background_color(self) -> list[XABase.XAColor]:
-        ls = self.xa_elem.arrayByApplyingSelector_("backgroundColor") or []
+        ls = XABackends.element_values(self.xa_elem, "backgroundColor") or []
         return [XABase.XAColor(x) for x in ls]
 
     def vertical_alignment(self) -> list[XAiWorkApplication.Alignment]:
-        ls = self.xa_elem.arrayByApplyingSelector_("verticalAlignment") or []
+        ls = XABackends.element_values(self.xa_elem, "verticalAlignment") or []
         return [
             XAiWorkApplication.Alignment(XABase.OSType(x.stringValue())) for x in ls
         ]
@@ -2468,7 +2471,7 @@ class XAiWorkRowList(XAiWorkRangeList):
         super().__init__(properties, filter, XAiWorkRow)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = super().properties()
         for index, raw_dict in enumerate(raw_dicts):
             properties = pyxa_dicts[index]
@@ -2477,10 +2480,10 @@ class XAiWorkRowList(XAiWorkRangeList):
         return pyxa_dicts
 
     def address(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("address") or [])
+        return list(XABackends.element_values(self.xa_elem, "address") or [])
 
     def height(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("height") or [])
+        return list(XABackends.element_values(self.xa_elem, "height") or [])
 
     def by_properties(self, properties: dict) -> Union["XAiWorkRow", None]:
         raw_dict = {}
@@ -2578,7 +2581,7 @@ class XAiWorkColumnList(XAiWorkRangeList):
         super().__init__(properties, filter, XAiWorkColumn)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = super().properties()
         for index, raw_dict in enumerate(raw_dicts):
             properties = pyxa_dicts[index]
@@ -2587,10 +2590,10 @@ class XAiWorkColumnList(XAiWorkRangeList):
         return pyxa_dicts
 
     def address(self) -> list[float]:
-        return list(self.xa_elem.arrayByApplyingSelector_("address") or [])
+        return list(XABackends.element_values(self.xa_elem, "address") or [])
 
     def width(self) -> list[int]:
-        return list(self.xa_elem.arrayByApplyingSelector_("width") or [])
+        return list(XABackends.element_values(self.xa_elem, "width") or [])
 
     def by_properties(self, properties: dict) -> Union["XAiWorkColumn", None]:
         raw_dict = {}
@@ -2688,7 +2691,7 @@ class XAiWorkCellList(XAiWorkRangeList):
         super().__init__(properties, filter, XAiWorkCell)
 
     def properties(self) -> list[dict]:
-        raw_dicts = self.xa_elem.arrayByApplyingSelector_("properties") or []
+        raw_dicts = XABackends.element_values(self.xa_elem, "properties") or []
         pyxa_dicts = super().properties()
         for index, raw_dict in enumerate(raw_dicts):
             properties = pyxa_dicts[index]
@@ -2700,20 +2703,20 @@ class XAiWorkCellList(XAiWorkRangeList):
         return pyxa_dicts
 
     def formatted_value(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("formattedValue") or [])
+        return list(XABackends.element_values(self.xa_elem, "formattedValue") or [])
 
     def formula(self) -> list[str]:
-        return list(self.xa_elem.arrayByApplyingSelector_("formula") or [])
+        return list(XABackends.element_values(self.xa_elem, "formula") or [])
 
     def value(self) -> list[Any]:
-        return list(self.xa_elem.arrayByApplyingSelector_("value") or [])
+        return list(XABackends.element_values(self.xa_elem, "value") or [])
 
     def column(self) -> XAiWorkColumnList:
-        ls = self.xa_elem.arrayByApplyingSelector_("column") or []
+        ls = XABackends.element_values(self.xa_elem, "column") or []
         return self._new_element(ls, XAiWorkColumnList)
 
     def row(self) -> XAiWorkRowList:
-        ls = self.xa_elem.arrayByApplyingSelector_("row") or []
+        ls = XABackends.element_values(self.xa_elem, "row") or []
         return self._new_element(ls, XAiWorkRowList)
 
     def by_properties(self, properties: dict) -> Union["XAiWorkCell", None]:
@@ -0,0 +1,72 @@
+"""Micro-benchmark of attribute resolution in XAApplication.__getattr__.
+
+Measures the per-access cost of names that fall back to appscript and of names that resolve to PyXA attributes, compared with the previous implementation, which rebuilt the list of attribute names across the MRO on every lookup.
+
+Usage: python benchmarks/bench_getattr.py [--number N]
+"""
+
+import argparse
+import timeit
+from types import SimpleNamespace
+
+from PyXA import XABase
+from PyXA.apps.Music import XAMusicApplication
+
+
+class BenchmarkApplication(XAMusicApplication):
+    # Stand-in for appscript, so that only attribute resolution is measured
+    xa_apsc = SimpleNamespace(fallback_name=1)
+
+    @property
+    def failing_property(self):
+        raise AttributeError("failing_property")
+
+
+def legacy_getattr(self, attr):
+    attributes = [
+        x
+        for y in [
+            cls.__dict__.keys()
+            for cls in self.__class__.__mro__
+            if cls.__name__ != "object"
+        ]
+        for x in y
+    ]
+    if attr in attributes:
+        return object.__getattribute__(self, attr)
+    else:
+        return getattr(self.xa_apsc, attr)
+
+
+def current_getattr(self, attr):
+    return XABase.XAApplication.__getattr__(self, attr)
+
+
+def time_per_access(function, app, attr, number):
+    def access():
+        try:
+            function(app, attr)
+        except AttributeError:
+            pass
+
+    return min(timeit.repeat(access, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    app = BenchmarkApplication.__new__(BenchmarkApplication)
+    print(f"{'lookup':<24}{'legacy (ns)':>14}{'cached (ns)':>14}{'speedup':>10}")
+    for label, attr in [
+        ("appscript fallback", "fallback_name"),
+        ("PyXA attribute", "failing_property"),
+    ]:
+        legacy = time_per_access(legacy_getattr, app, attr, args.number)
+        current = time_per_access(current_getattr, app, attr, args.number)
+        print(f"{label:<24}{legacy:>14.0f}{current:>14.0f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""Micro- and macro-benchmarks of PyXA's core machinery, run against synthetic in-memory data.
+
+List benchmarks use the fake Music library provided by :class:`PyXA.XABackends.XAFakeBackend`, so no applications are launched. The RSS benchmark serves a synthetic feed from a local HTTP server. Results are saved as JSON so that runs on different commits can be compared.
+
+Usage:
+    python benchmarks/bench_suite.py [--size N] [--repeat N] [--filter TEXT] [--output results.json]
+    python benchmarks/bench_suite.py --compare baseline.json results.json [--threshold 1.1]
+"""
+
+import argparse
+import http.server
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import timeit
+from datetime import datetime
+from typing import Any, Callable
+
+import PyXA
+from PyXA import XABackends, XABase
+from PyXA.apps.Music import XAMusicTrack, XAMusicTrackList
+
+benchmarks: dict[str, Callable[[int], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str):
+    # Registers a function that prepares a benchmark for the given dataset size and returns the callable to time
+    def decorator(setup: Callable[[int], Callable[[], Any]]):
+        benchmarks[name] = setup
+        return setup
+
+    return decorator
+
+
+def music_tracks(size: int) -> XAMusicTrackList:
+    # The fake Music library is installed by run()
+    return PyXA.Application("Music").tracks()
+
+
+@benchmark("xalist.construction")
+def bench_list_construction(size: int):
+    music = PyXA.Application("Music")
+    return music.tracks
+
+
+@benchmark("xalist.iteration")
+def bench_list_iteration(size: int):
+    tracks = music_tracks(size)
+
+    def iterate():
+        for _ in tracks:
+            pass
+
+    return iterate
+
+
+@benchmark("xalist.slicing")
+def bench_list_slicing(size: int):
+    tracks = music_tracks(size)
+
+    def slice_list():
+        tracks[size // 4 : size // 2]
+        tracks[::10]
+
+    return slice_list
+
+
+@benchmark("xalist.filter")
+def bench_list_filter(size: int):
+    tracks = music_tracks(size)
+    return lambda: tracks.filter("genre", "==", "Jazz")
+
+
+@benchmark("xalist.by_property")
+def bench_list_by_property(size: int):
+    tracks = music_tracks(size)
+    return lambda: tracks.by_property("id", size // 2)
+
+
+@benchmark("xalist.by_property_indexed")
+def bench_list_by_property_indexed(size: int):
+    tracks = music_tracks(size).build_index("id")
+    return lambda: tracks.by_property("id", size // 2)
+
+
+@benchmark("xalist.fetch")
+def bench_list_fetch(size: int):
+    tracks = music_tracks(size)
+    return lambda: tracks.fetch(["name", "artist", "played_count"])
+
+
+@benchmark("xalist.map")
+def bench_list_map(size: int):
+    tracks = music_tracks(size)[:1000]
+    return lambda: tracks.map(lambda element, index: index)
+
+
+@benchmark("xaobject.new_element")
+def bench_new_element(size: int):
+    tracks = music_tracks(size)
+    element = tracks.xa_elem.objectAtIndex_(0)
+    return lambda: tracks._new_element(element, XAMusicTrack)
+
+
+@benchmark("xapredicate.evaluate")
+def bench_predicate_evaluate(size: int):
+    elements = music_tracks(size).xa_elem
+    predicate = XABase.XAPredicate()
+    predicate.add_eq_condition("genre", "Jazz")
+    predicate.add_gt_condition("playedCount", 100)
+    return lambda: predicate.evaluate(elements)
+
+
+@benchmark("applescript.compile")
+def bench_applescript_compile(size: int):
+    source = synthetic_applescript()
+
+    def compile_script():
+        # Clear the cache so that every run measures a full compilation
+        XABase.AppleScript.clear_cache()
+        XABase.AppleScript(source).run(dry_run=True)
+
+    return compile_script
+
+
+@benchmark("applescript.cached_run")
+def bench_applescript_cached_run(size: int):
+    source = synthetic_applescript()
+    XABase.AppleScript.clear_cache()
+    XABase.AppleScript(source).run()
+    return lambda: XABase.AppleScript(source).run()
+
+
+@benchmark("sdefparser.parse")
+def bench_sdef_parse(size: int):
+    from PyXA.Additions.Utils import SDEFParser
+
+    path = os.path.join(tempfile.mkdtemp(), "Example.sdef")
+    with open(path, "w") as file:
+        file.write(synthetic_sdef(max(size // 100, 1)))
+    return lambda: SDEFParser(path).parse()
+
+
+@benchmark("rssfeed.parse")
+def bench_rss_parse(size: int):
+    from PyXA.Additions.Web import RSSFeed
+
+    url = serve(synthetic_rss(max(size // 20, 1)).encode())
+    return lambda: RSSFeed(url).items().title()
+
+
+@benchmark("xatext.words")
+def bench_text_words(size: int):
+    text = XABase.XAText(synthetic_text(size))
+    return text.words
+
+
+@benchmark("xatext.sentences")
+def bench_text_sentences(size: int):
+    text = XABase.XAText(synthetic_text(size))
+    return text.sentences
+
+
+def synthetic_text(sentence_count: int) -> str:
+    return "\n".join(
+        f"Sentence number {index} is about track {index % 97}. Is it good? Yes!"
+        for index in range(sentence_count)
+    )
+
+
+def synthetic_applescript() -> str:
+    return "\n".join(f"set x{index} to {index} * 2" for index in range(50))
+
+
+def synthetic_sdef(class_count: int) -> str:
+    properties = "".join(
+        f'<property name="property {index}" code="p{index:03d}" type="text" description="Property {index}"/>'
+        for index in range(20)
+    )
+    classes = "".join(
+        f'<class name="item {index}" code="c{index:03d}" description="Item {index}">'
+        f'<element type="item {index + 1}"/><responds-to command="delete"/>{properties}</class>'
+        for index in range(class_count)
+    )
+    commands = "".join(
+        f'<command name="command {index}" code="exmpcm{index:02d}" description="Command {index}">'
+        f'<direct-parameter type="specifier"/><parameter name="with value" code="wval" type="integer"/>'
+        f'<result type="text"/></command>'
+        for index in range(class_count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><dictionary title="Example Terminology">'
+        f'<suite name="Example Suite" code="exmp">{classes}{commands}</suite></dictionary>'
+    )
+
+
+def synthetic_rss(item_count: int) -> str:
+    items = "".join(
+        f"<item><title>Item {index}</title><link>https://example.com/{index}</link>"
+        f"<description>Description of item {index}</description>"
+        f"<pubDate>Mon, 02 Jan 2023 10:{index % 60:02d}:00 GMT</pubDate></item>"
+        for index in range(item_count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Example Feed</title>{items}</channel></rss>"
+    )
+
+
+def serve(content: bytes) -> str:
+    # Serves the content from a local HTTP server running for the rest of the process
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/feed.xml"
+
+
+def time_benchmark(function: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "mean_s": statistics.mean(times),
+        "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def metadata(size: int) -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "date": datetime.now().isoformat(),
+        "pyxa_version": XABase.VERSION,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "size": size,
+    }
+
+
+def run(size: int, repeat: int, filter: str) -> dict[str, Any]:
+    results = {}
+    for name, setup in benchmarks.items():
+        if filter not in name:
+            continue
+
+        backend = XABackends.XAFakeBackend()
+        backend.add_music_library(track_count=size)
+        with XABackends.installed("Music", backend):
+            try:
+                results[name] = time_benchmark(setup(size), repeat)
+            except Exception as e:
+                results[name] = {"error": f"{type(e).__name__}: {e}"}
+
+        result = results[name]
+        if "error" in result:
+            print(f"{name:<32}{result['error']}")
+        else:
+            print(f"{name:<32}{result['min_s'] * 1e6:>14.1f} us")
+    return {"metadata": metadata(size), "results": results}
+
+
+def compare(baseline_path: str, results_path: str, threshold: float) -> bool:
+    with open(baseline_path) as file:
+        baseline = json.load(file)["results"]
+    with open(results_path) as file:
+        results = json.load(file)["results"]
+
+    regressed = False
+    print(f"{'benchmark':<32}{'baseline (us)':>15}{'current (us)':>15}{'ratio':>9}")
+    for name, result in results.items():
+        if "min_s" not in result or "min_s" not in baseline.get(name, {}):
+            continue
+
+        ratio = result["min_s"] / baseline[name]["min_s"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  slower"
+            regressed = True
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(
+            f"{name:<32}{baseline[name]['min_s'] * 1e6:>15.1f}{result['min_s'] * 1e6:>15.1f}{ratio:>8.2f}x{flag}"
+        )
+    return not regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size", type=int, default=10000, help="the number of synthetic tracks"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks whose names contain this"
+    )
+    parser.add_argument("--output", help="the path to save results to as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "RESULTS"))
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.1,
+        help="the slowdown ratio reported as a regression",
+    )
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        sys.exit(0 if compare(*args.compare, args.threshold) else 1)
+
+    report = run(args.size, args.repeat, args.filter)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
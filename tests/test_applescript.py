@@ -0,0 +1,80 @@
+import unittest
+
+import PyXA
+
+class TestAppleScript(unittest.TestCase):
+    def setUp(self):
+        PyXA.AppleScript.clear_cache()
+
+    def test_applescript_compiled_script_cache(self):
+        for _ in range(10):
+            result = PyXA.AppleScript("return 1 + 2").run()
+            self.assertEqual(result["int"], 3)
+
+        info = PyXA.AppleScript.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 9)
+        self.assertEqual(info.size, 1)
+
+    def test_applescript_cache_eviction(self):
+        cache_size = PyXA.AppleScript.cache_size
+        PyXA.AppleScript.cache_size = 2
+        try:
+            for x in range(3):
+                PyXA.AppleScript(f"return {x}").run()
+            PyXA.AppleScript("return 0").run()
+        finally:
+            PyXA.AppleScript.cache_size = cache_size
+
+        info = PyXA.AppleScript.cache_info()
+        self.assertEqual(info.size, 2)
+        self.assertEqual(info.misses, 4)
+
+    def test_applescript_compile_error_not_cached(self):
+        with self.assertRaises(PyXA.XAErrors.AppleScriptError):
+            PyXA.AppleScript("return (").run()
+        self.assertEqual(PyXA.AppleScript.cache_info().size, 0)
+
+    def test_applescript_typed_run_arguments(self):
+        script = PyXA.AppleScript("""on run argv
+            return {(item 1 of argv) + 1, (item 2 of argv) * 2, item 3 of argv}
+        end run""")
+
+        for x in range(5):
+            result = script.run([x, 1.5, {"name": "Example", "count": x}])
+            values = PyXA.XAEvents.value_from_event(result["event"])
+            self.assertEqual(values[0], x + 1)
+            self.assertEqual(values[1], 3.0)
+            self.assertEqual(values[2], {"name": "Example", "count": x})
+
+        self.assertEqual(PyXA.AppleScript.cache_info().misses, 1)
+
+    def test_applescript_run_handler_without_arguments(self):
+        script = PyXA.AppleScript("""on run argv
+            return count of argv
+        end run""")
+        self.assertEqual(script.run()["int"], 0)
+
+    def test_applescript_shared_state_serialized(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        source = """property counter : 0
+        set counter to counter + 1
+        return counter"""
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: PyXA.AppleScript(source).run()["int"], range(40)))
+        self.assertEqual(sorted(results), list(range(1, 41)))
+
+    def test_applescript_cache_disabled_resets_state(self):
+        source = """property counter : 0
+        set counter to counter + 1
+        return counter"""
+
+        cache_size = PyXA.AppleScript.cache_size
+        PyXA.AppleScript.cache_size = 0
+        try:
+            for _ in range(3):
+                self.assertEqual(PyXA.AppleScript(source).run()["int"], 1)
+        finally:
+            PyXA.AppleScript.cache_size = cache_size
@@ -0,0 +1,194 @@
+import json
+import os
+import plistlib
+import tempfile
+import unittest
+
+import AppKit
+
+import PyXA
+from PyXA.XABase import XAApplicationIndex
+
+class TestApplicationIndex(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.cache_dir.name, "app_index.json")
+        self.apps_dir = tempfile.TemporaryDirectory()
+        self.missing_dir = os.path.join(self.apps_dir.name, "Missing")
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+        self.apps_dir.cleanup()
+
+    def add_app(self, name: str, bundle_id: str):
+        contents = os.path.join(self.apps_dir.name, name + ".app", "Contents")
+        os.makedirs(contents)
+        with open(os.path.join(contents, "Info.plist"), "wb") as file:
+            plistlib.dump({"CFBundleIdentifier": bundle_id}, file)
+        return os.path.join(self.apps_dir.name, name + ".app")
+
+    def make_index(self):
+        index = XAApplicationIndex(self.index_path)
+        index.folders = [self.apps_dir.name, self.missing_dir]
+        return index
+
+    def test_application_index_lookup(self):
+        path = self.add_app("Example", "com.example.Example")
+        index = self.make_index()
+        self.assertEqual(index.find("Example"), path)
+        self.assertEqual(index.find("example"), path)
+        self.assertEqual(index.find("com.example.Example"), path)
+        self.assertEqual(index.paths(), [path])
+        self.assertTrue(os.path.exists(self.index_path))
+
+        with self.assertRaises(PyXA.XAErrors.ApplicationNotFoundError):
+            index.find("Not A Real Application Name")
+
+    def test_application_index_detects_new_apps(self):
+        self.add_app("Example", "com.example.Example")
+        index = self.make_index()
+        index.find("Example")
+
+        path = self.add_app("Other", "com.example.Other")
+        self.assertEqual(index.find("com.example.Other"), path)
+
+    def test_application_index_persistence(self):
+        path = self.add_app("Example", "com.example.Example")
+        self.make_index().find("Example")
+
+        with open(self.index_path) as file:
+            data = json.load(file)
+        self.assertIsNone(data["directories"][self.missing_dir])
+
+        # Loading an unchanged index must not rewrite it
+        os.utime(self.index_path, (0, 0))
+        self.assertEqual(self.make_index().find("Example"), path)
+        self.assertEqual(os.stat(self.index_path).st_mtime, 0)
+
+
+class TestApplicationRegistry(unittest.TestCase):
+    def test_application_reuse(self):
+        app = PyXA.Application("Music")
+        self.assertIs(PyXA.Application("Music"), app)
+        self.assertIs(PyXA.Application("music"), app)
+        self.assertIs(PyXA.Music(), app)
+        self.assertIs(PyXA.Application("Music").xa_scel, app.xa_scel)
+
+    def test_application_fresh(self):
+        app = PyXA.Application("Music")
+        fresh_app = PyXA.Application("Music", fresh=True)
+        self.assertIsNot(fresh_app, app)
+        self.assertEqual(fresh_app, app)
+        self.assertIs(PyXA.Application("Music"), fresh_app)
+
+        PyXA.Application.clear_registry()
+        self.assertIsNot(PyXA.Application("Music"), fresh_app)
+
+
+class TestApplicationLaunch(unittest.TestCase):
+    def test_application_launch_async(self):
+        import asyncio
+
+        async def launch_all():
+            return await asyncio.gather(
+                PyXA.Application.launch_async("TextEdit"),
+                PyXA.Application.launch_async("Notes"),
+            )
+
+        textedit, notes = asyncio.run(launch_all())
+        self.assertIsInstance(textedit, PyXA.apps.TextEdit.XATextEditApplication)
+        self.assertIsInstance(notes, PyXA.apps.Notes.XANotesApplication)
+        self.assertIs(PyXA.Application("TextEdit"), textedit)
+
+    def test_application_launch_async_timeout(self):
+        import asyncio
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(PyXA.Application.launch_async("/Nonexistent/Example.app", timeout=0, fresh=True))
+
+    def test_application_launch_async_late_completion(self):
+        import asyncio
+        from unittest import mock
+
+        handlers = []
+
+        class Workspace:
+            def runningApplications(self):
+                return AppKit.NSArray.array()
+
+            def openApplicationAtURL_configuration_completionHandler_(self, url, configuration, handler):
+                handlers.append(handler)
+
+        with mock.patch.object(PyXA.XABase, "workspace", Workspace()), mock.patch.object(
+            PyXA.XABase.Application,
+            "_Application__url_for_application",
+            staticmethod(lambda app_identifier: None),
+        ):
+            with self.assertRaises(TimeoutError):
+                asyncio.run(PyXA.Application.launch_async("Example", timeout=0.5, fresh=True))
+
+        # The completion handler fires after the event loop has closed
+        self.assertEqual(len(handlers), 1)
+        handlers[0](None, None)
+
+    def test_application_launch_async_running(self):
+        import asyncio
+        from unittest import mock
+
+        finder = AppKit.NSRunningApplication.runningApplicationsWithBundleIdentifier_("com.apple.finder")[0]
+        opened = []
+
+        class Workspace:
+            def runningApplications(self):
+                return AppKit.NSArray.arrayWithObject_(finder)
+
+            def notificationCenter(self):
+                return AppKit.NSWorkspace.sharedWorkspace().notificationCenter()
+
+            def openApplicationAtURL_configuration_completionHandler_(self, url, configuration, handler):
+                opened.append(url)
+
+        # Running applications are returned as-is rather than relaunched with a hiding configuration
+        with mock.patch.object(PyXA.XABase, "workspace", Workspace()):
+            app = asyncio.run(PyXA.Application.launch_async("Finder", fresh=True))
+
+        self.assertEqual(opened, [])
+        self.assertEqual(app.xa_elem.processIdentifier(), finder.processIdentifier())
+
+    def test_application_launch_async_not_found(self):
+        import asyncio
+
+        with self.assertRaises(PyXA.XAErrors.ApplicationNotFoundError):
+            asyncio.run(PyXA.Application.launch_async("/Nonexistent/Example.app", fresh=True))
+
+
+class TestAsyncio(unittest.TestCase):
+    def test_aio_fetch(self):
+        import asyncio
+        from PyXA import aio
+
+        async def fetch_all():
+            music = await aio.application("Music")
+            tracks = music.tracks()
+            return tracks, await asyncio.gather(
+                aio.fetch(tracks, ["name", "artist"]),
+                aio.get(tracks, "name"),
+                aio.run_applescript("return 1 + 2"),
+            )
+
+        tracks, (columns, names, result) = asyncio.run(fetch_all())
+        self.assertEqual(columns["name"], tracks.name())
+        self.assertEqual(names, tracks.name())
+        self.assertEqual(result["int"], 3)
+
+    def test_aio_discards_terminated_queues(self):
+        import asyncio
+        from PyXA import aio
+
+        # No process has this identifier, as if its application had terminated
+        pid = 2**30
+        aio._submit(pid, lambda: None).result()
+        self.assertIn(pid, aio._executors)
+
+        asyncio.run(aio.run("PyXA-test-queue", lambda: None))
+        self.assertNotIn(pid, aio._executors)
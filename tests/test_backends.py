@@ -0,0 +1,370 @@
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import PyXA
+from PyXA import XABackends
+
+class TestBackendArrays(unittest.TestCase):
+    # Runs without PyObjC, e.g. on Linux
+    def setUp(self):
+        self.backend = XABackends.XAFakeBackend()
+        self.backend.add_music_library(track_count=100)
+        self.tracks = self.backend.scripting_application("Music").tracks()
+
+    def test_backends_import_without_xabase(self):
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys; from PyXA import XABackends; print('PyXA.XABase' in sys.modules)"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+        self.assertEqual(XABackends.element_count(self.tracks), 100)
+
+    def test_backend_array_requests(self):
+        chunk = self.tracks.subarrayWithRange_((10, 5))
+        self.assertIsInstance(chunk, XABackends.XABackendArray)
+        self.assertEqual(XABackends.element_values(chunk, "name")[0], "Track 11")
+
+        jazz = XABackends.filtered_elements(
+            self.tracks, lambda properties: properties["genre"] == "Jazz"
+        )
+        XABackends.set_element_values(jazz, 80, "rating")
+        self.assertTrue(all(rating == 80 for rating in XABackends.element_values(jazz, "rating")))
+
+    def test_backend_array_sort_missing_last(self):
+        class Descriptor:
+            def __init__(self, key, ascending):
+                self.key = lambda: key
+                self.ascending = lambda: ascending
+
+        tracks = XABackends.XAElementArray(
+            XABackends.XAFakeObject({"playedCount": count}) for count in [2, None, 1, 3]
+        )
+        for ascending, expected in [(True, [1, 2, 3, None]), (False, [3, 2, 1, None])]:
+            ordered = tracks.sortedArrayUsingDescriptors_([Descriptor("playedCount", ascending)])
+            self.assertEqual(XABackends.element_values(ordered, "playedCount"), expected)
+
+    def test_replay_backend_unknown_selectors(self):
+        with tempfile.TemporaryDirectory() as trace_dir:
+            trace_path = os.path.join(trace_dir, "music.json")
+            with open(trace_path, "w") as file:
+                json.dump(
+                    {
+                        "version": 1,
+                        "apps": {"music": ["Music", "com.apple.Music"]},
+                        "calls": [
+                            ["music.tracks", {"$array": "music.tracks"}, 0.001],
+                            ["music.tracks.count", 3, 0.001],
+                        ],
+                    },
+                    file,
+                )
+            app = XABackends.XAReplayBackend(trace_path).scripting_application("Music")
+
+        self.assertTrue(hasattr(app, "tracks"))
+        self.assertFalse(hasattr(app, "trakcs"))
+        self.assertEqual(XABackends.element_count(app.tracks()), 3)
+
+
+@unittest.skipUnless(sys.platform == "darwin", "PyXA's wrapper classes require macOS")
+class TestFakeBackend(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.backend = XABackends.XAFakeBackend()
+        cls.backend.add_music_library(track_count=1000)
+        cls.backend.add_messages_history(transfer_count=500, chat_count=10)
+
+    def setUp(self):
+        XABackends.install("Music", self.backend)
+        XABackends.install("Messages", self.backend)
+
+    def tearDown(self):
+        XABackends.uninstall("Music")
+        XABackends.uninstall("Messages")
+
+    def test_fake_backend_application(self):
+        app = PyXA.Application("Music")
+        self.assertIsInstance(app, PyXA.apps.Music.XAMusicApplication)
+        self.assertEqual(app.bundle_identifier, "com.apple.Music")
+        self.assertIs(app.xa_scel, self.backend.scripting_application("Music"))
+
+    def test_fake_backend_list_methods(self):
+        tracks = PyXA.Application("Music").tracks()
+        self.assertEqual(len(tracks), 1000)
+        self.assertEqual(tracks.name()[:2], ["Track 1", "Track 2"])
+        self.assertEqual(tracks[1].name, "Track 2")
+        self.assertEqual(tracks.by_property("id", 10).name, "Track 10")
+
+        columns = tracks.fetch(["name", "played_count"])
+        self.assertEqual(len(columns["played_count"]), 1000)
+
+        jazz = tracks.filter("genre", "==", "Jazz")
+        self.assertTrue(all(genre == "Jazz" for genre in jazz.genre()))
+
+        ordered = tracks.sort_by("played_count").played_count()
+        self.assertEqual(ordered, sorted(ordered))
+
+        counts = sorted(tracks.played_count(), reverse=True)
+        self.assertEqual(tracks.top_k("played_count", 5).played_count(), counts[:5])
+
+    def test_fake_backend_array_interface(self):
+        tracks = self.backend.scripting_application("Music").tracks()
+        self.assertIsInstance(tracks, XABackends.XABackendArray)
+        self.assertEqual(XABackends.element_count(tracks), 1000)
+        self.assertEqual(XABackends.element_at(tracks, 1).name(), "Track 2")
+        self.assertEqual(XABackends.element_values(tracks, "name")[:2], ["Track 1", "Track 2"])
+
+        jazz = XABackends.filtered_elements(tracks, lambda properties: properties["genre"] == "Jazz")
+        self.assertIsInstance(jazz, XABackends.XABackendArray)
+        self.assertTrue(all(genre == "Jazz" for genre in XABackends.element_values(jazz, "genre")))
+
+        with self.assertRaises(NotImplementedError):
+            XABackends.element_count(XABackends.XABackendArray())
+
+    def test_fake_backend_set_properties(self):
+        tracks = PyXA.Application("Music").tracks()[:10]
+        report = tracks.set_property_all("rating", 60)
+        self.assertEqual(report.events, 1)
+        self.assertEqual(tracks.rating(), [60] * 10)
+
+    def test_fake_backend_iter_batches(self):
+        tracks = PyXA.Application("Music").tracks()
+        requests = []
+        XABackends._request_hook = lambda description, send: requests.append(description) or send()
+        try:
+            batches = list(tracks.iter_batches(300, prefetch=["name"], background=True))
+        finally:
+            XABackends._request_hook = None
+
+        # Names are fetched per chunk rather than for the whole list up front
+        self.assertEqual(requests.count("bridge get name"), 4)
+        self.assertEqual([len(batch) for batch in batches], [300, 300, 300, 100])
+        self.assertEqual(batches[-1][0].name, "Track 901")
+        self.assertEqual(batches[-1].xa_cache.stats()["misses"], 0)
+
+    def test_fake_backend_element_slices(self):
+        from PyXA import XABase
+        import AppKit
+
+        tracks = PyXA.Application("Music").tracks()
+        expected = tracks.name()[998:49:-3]
+
+        # Stands in for a slice of an SBElementArray, which ScriptingBridge cannot represent as another element array
+        sliced = XABase._XAElementSlice(tracks.xa_elem, range(998, 49, -3))
+        requests = []
+        XABackends._request_hook = lambda description, send: requests.append(description) or send()
+        try:
+            self.assertEqual(XABackends.element_values(sliced, "name"), expected)
+            jazz = XABackends.filtered_elements(
+                sliced, AppKit.NSPredicate.predicateWithFormat_("genre == %@", "Jazz")
+            )
+            XABackends.set_element_values(jazz, 100, "rating")
+        finally:
+            XABackends._request_hook = None
+
+        # The IDs of the parent's elements are retrieved once, then each operation sends its requests per 200 elements
+        self.assertEqual(requests[:3], ["bridge get name", "bridge get id", "bridge filter"])
+        self.assertEqual(requests.count("bridge get name"), 1 + 2)
+        self.assertEqual(requests.count("bridge get id"), 1 + 2)
+        self.assertEqual(len(requests), 14)
+
+        genres = XABackends.element_values(sliced, "genre")
+        self.assertEqual(len(jazz), genres.count("Jazz"))
+        self.assertEqual(XABackends.element_values(jazz, "rating"), [100] * len(jazz))
+        self.assertEqual(
+            [track.name for track in PyXA.Application("Music").tracks()[::-1][:3]],
+            ["Track 1000", "Track 999", "Track 998"],
+        )
+
+    def test_fake_backend_property_cache_invalidation(self):
+        cache = PyXA.XABase.XAPropertyCache(max_size=4)
+        tracks = PyXA.Application("Music").tracks().xa_elem
+        for track in tracks[:3]:
+            cache.set(track, "name", track.name())
+            cache.set(track, "genre", track.genre())
+
+        # The least recently used track is evicted as a whole
+        self.assertEqual(cache.stats()["size"], 4)
+        self.assertIsNone(cache.get(tracks[0], "name", lambda: None))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+        cache.invalidate(tracks[2])
+        self.assertEqual(cache.stats()["size"], 1)
+        cache.invalidate(name="name")
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_fake_backend_predicate_formats(self):
+        tracks = PyXA.Application("Music").tracks()
+        requests = []
+        XABackends._request_hook = lambda description, send: requests.append(description) or send()
+        try:
+            jazz = PyXA.XAPredicate.evaluate_with_format(tracks, "genre == %@", "Jazz")
+            rock = PyXA.XAPredicate.evaluate_with_dict(tracks, {"genre": "Rock"})
+        finally:
+            XABackends._request_hook = None
+
+        # Both filter through the backend hooks, as XAPredicate.evaluate does
+        self.assertEqual(requests, ["bridge filter", "bridge filter"])
+        self.assertEqual(set(jazz.genre()), {"Jazz"})
+        self.assertEqual(set(rock.genre()), {"Rock"})
+
+    def test_fake_backend_messages(self):
+        app = PyXA.Application("Messages")
+        self.assertEqual(len(app.file_transfers()), 500)
+        self.assertEqual(len(app.chats()), 10)
+
+    def test_fake_backend_set_properties_each(self):
+        tracks = PyXA.Application("Music").tracks()[:10]
+        genres = tracks.genre()
+
+        # Reassign the existing values so the library is left unchanged
+        report = tracks.set_properties_each([{"genre": genre} for genre in genres])
+        self.assertEqual(report.updated, 10)
+        self.assertLessEqual(report.events, len(set(genres)) + 1)
+        self.assertEqual(tracks.genre(), genres)
+
+    def test_fake_backend_set_properties_each_sliced(self):
+        from PyXA import XABase
+
+        tracks = PyXA.Application("Music").tracks()
+        numbers = tracks.track_number()[:3]
+        properties = [{"track_number": number} for number in [21, 22, 23]]
+        self.assertEqual(tracks[:3].set_properties_each(properties, "persistent_id").events, 4)
+
+        # Slices of SBElementArrays target their elements within the parent array
+        sliced = tracks._new_element(XABase._XAElementSlice(tracks.xa_elem, range(3)), type(tracks))
+        requests = []
+        XABackends._request_hook = lambda description, send: requests.append(description) or send()
+        try:
+            report = sliced.set_properties_each(properties, "persistent_id")
+        finally:
+            XABackends._request_hook = None
+
+        self.assertEqual(report.events, 4)
+        self.assertEqual(requests.count("bridge get persistentID"), 1)
+        self.assertEqual(requests.count("bridge set trackNumber"), 3)
+        self.assertNotIn("bridge get id", requests)
+        self.assertEqual(tracks.track_number()[:3], [21, 22, 23])
+
+        tracks[:3].set_properties_each([{"track_number": number} for number in numbers])
+
+    def test_fake_backend_set_properties_each_shared_identifiers(self):
+        backend = XABackends.XAFakeBackend()
+        tracks = [
+            XABackends.XAFakeObject({"name": "A", "rating": 0}),
+            XABackends.XAFakeObject({"name": "A", "rating": 0}),
+            XABackends.XAFakeObject({"name": None, "rating": 0}),
+            XABackends.XAFakeObject({"name": "B", "rating": 0}),
+        ]
+        backend.add_application("Music", "com.apple.Music", elements={"tracks": tracks})
+
+        with XABackends.installed("Music", backend):
+            tracks = PyXA.Application("Music").tracks()
+            report = tracks.set_properties_each(
+                [{"rating": 20}, {"rating": 40}, {"rating": 60}, {"rating": 60}], key="name"
+            )
+            self.assertEqual(report.updated, 4)
+            self.assertEqual(tracks.rating(), [20, 40, 60, 60])
+
+    def test_fake_backend_snapshot_duplicate_keys(self):
+        tracks = PyXA.Application("Music").tracks()
+        snapshot = tracks.snapshot("id", ["name"])
+        self.assertEqual(len(snapshot.diff(tracks.snapshot("id", ["name"])).changed), 0)
+
+        with self.assertRaises(ValueError):
+            tracks.snapshot("genre", ["name"])
+
+    def test_fake_backend_snapshot_diff(self):
+        tracks = PyXA.Application("Music").tracks()[:10]
+        previous = tracks.snapshot("id", ["name", "rating"])
+        ratings = tracks.rating()
+
+        tracks[1].xa_elem.setValue_forKey_(ratings[1] + 1, "rating")
+        try:
+            diff = tracks.snapshot("id", ["name", "rating"]).diff(previous)
+        finally:
+            tracks.set_properties_each([{"rating": rating} for rating in ratings])
+
+        self.assertEqual(diff.changed, {2: {"rating": (ratings[1], ratings[1] + 1)}})
+        self.assertEqual((diff.added, diff.removed), ({}, {}))
+
+    def test_fake_backend_group_by_missing_values(self):
+        backend = XABackends.XAFakeBackend()
+        tracks = [
+            XABackends.XAFakeObject({"artist": "A", "playedCount": 3, "loved": True}),
+            XABackends.XAFakeObject({"artist": "B", "playedCount": None, "loved": None}),
+            XABackends.XAFakeObject({"artist": "A", "playedCount": 5, "loved": False}),
+        ]
+        backend.add_application("Music", "com.apple.Music", elements={"tracks": tracks})
+
+        with XABackends.installed("Music", backend):
+            grouped = PyXA.Application("Music").tracks().group_by("artist")
+            stats = grouped.agg(played_count=["first", "last"], loved="first")
+
+        self.assertEqual(list(stats["artist"]), ["A", "B"])
+        self.assertEqual(stats["played_count_first"][0], 3)
+        self.assertEqual(stats["played_count_last"][0], 5)
+        self.assertTrue(math.isnan(stats["played_count_first"][1]))
+        self.assertTrue(math.isnan(stats["played_count_last"][1]))
+        self.assertEqual(list(stats["loved"]), [True, None])
+
+    def test_fake_backend_columns_missing_values(self):
+        backend = XABackends.XAFakeBackend()
+        tracks = [
+            XABackends.XAFakeObject({"name": "A", "playedCount": 3}),
+            XABackends.XAFakeObject({"name": "B", "playedCount": None}),
+        ]
+        backend.add_application("Music", "com.apple.Music", elements={"tracks": tracks})
+
+        with XABackends.installed("Music", backend):
+            tracks = PyXA.Application("Music").tracks()
+            columns = tracks.to_columns(["played_count"])
+            self.assertTrue(math.isnan(columns["played_count"][1]))
+
+            with self.assertRaisesRegex(ValueError, "played_count"):
+                tracks.to_columns(["played_count"], dtype_map={"played_count": "int64"})
+
+    def test_fake_backend_uninstall(self):
+        with XABackends.installed("Notes", XABackends.XAFakeBackend()) as backend:
+            self.assertIs(XABackends.backend_for("notes"), backend)
+        self.assertIsNone(XABackends.backend_for("Notes"))
+
+
+@unittest.skipUnless(sys.platform == "darwin", "PyXA's wrapper classes require macOS")
+class TestRecordReplayBackend(unittest.TestCase):
+    def setUp(self):
+        self.trace_dir = tempfile.TemporaryDirectory()
+        self.trace_path = os.path.join(self.trace_dir.name, "music.json.gz")
+        PyXA.Application("Music")
+
+    def tearDown(self):
+        XABackends.uninstall("Music")
+        self.trace_dir.cleanup()
+
+    def run_session(self):
+        tracks = PyXA.Application("Music").tracks()
+        columns = tracks.fetch(["name", "artist"])
+        return len(tracks), columns, tracks[:5].name()
+
+    def test_record_replay_backend(self):
+        recorder = XABackends.XARecordingBackend()
+        with XABackends.installed("Music", recorder):
+            recorded = self.run_session()
+        recorder.save(self.trace_path)
+        self.assertGreater(len(recorder.xa_calls), 0)
+
+        replayer = XABackends.XAReplayBackend(self.trace_path)
+        with XABackends.installed("Music", replayer):
+            replayed = self.run_session()
+        self.assertEqual(recorded, replayed)
+        self.assertAlmostEqual(replayer.total_latency, recorder.total_latency, places=3)
+
+        with XABackends.installed("Music", replayer):
+            with self.assertRaises(KeyError):
+                PyXA.Application("Music").playlists().name()
@@ -108,5 +108,38 @@ class TestMessages(unittest.TestCase):
         win.zoomed = False
         self.assertEqual(win.zoomed, False)
 
+    def test_scriptable_application_batch(self):
+        window = self.app.windows()[0]
+        name = self.app.name
+
+        with self.app.batch() as batch:
+            window.set_property("index", window.index)
+            batch.add("get name of {0}", window, returns=True)
+            batch.add('error "Expected failure"')
+            self.assertEqual(len(batch), 3)
+
+        self.assertEqual(len(batch.results), 3)
+        self.assertIsNone(batch.results[0].error)
+        self.assertEqual(batch.results[1].result, window.name)
+        self.assertIsNotNone(batch.results[2].error)
+        self.assertEqual(self.app.name, name)
+
+    def test_scriptable_application_batch_rejects_unrecorded_changes(self):
+        windows = self.app.windows()
+        with self.app.batch() as batch:
+            with self.assertRaises(RuntimeError):
+                windows.push(windows[0])
+            self.assertEqual(len(batch), 0)
+
+    def test_scriptable_batch_terms(self):
+        term = PyXA.XABaseScriptable._xa_applescript_term
+        self.assertEqual(term("URL"), "URL")
+        self.assertEqual(term("objectDescription"), "description")
+        self.assertEqual(term("object_description"), "description")
+        self.assertEqual(term("ANSIBlackColor"), "ANSI black color")
+        self.assertEqual(term("persistentID"), "persistent ID")
+        self.assertEqual(term("played_count"), "played count")
+        self.assertEqual(term("played count"), "played count")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
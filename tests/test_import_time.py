@@ -0,0 +1,71 @@
+import subprocess
+import sys
+import unittest
+
+# Maximum time that `import PyXA` may take, relative to importing PyXA.XABase, which loads PyObjC
+IMPORT_TIME_RATIO = 0.25
+
+class TestImportTime(unittest.TestCase):
+    def run_python(self, code, *options):
+        return subprocess.run(
+            [sys.executable, *options, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def import_time(self, module):
+        # Take the best of several runs to reduce noise from disk caches
+        times = []
+        for _ in range(3):
+            result = self.run_python("import " + module, "-X", "importtime")
+            for line in result.stderr.splitlines():
+                # import time: self [us] | cumulative | imported package
+                fields = line.split("|")
+                if len(fields) == 3 and fields[2].strip() == module:
+                    times.append(int(fields[1]) / 1000)
+
+        self.assertEqual(len(times), 3)
+        return min(times)
+
+    @unittest.skipUnless(sys.platform == "darwin", "PyXA.XABase requires macOS")
+    def test_import_time_budget(self):
+        baseline = self.import_time("PyXA.XABase")
+        self.assertLess(self.import_time("PyXA"), baseline * IMPORT_TIME_RATIO)
+
+    def loaded_modules(self, module):
+        result = self.run_python(f"import sys, {module}; print('\\n'.join(sys.modules))")
+        return set(result.stdout.splitlines())
+
+    def test_import_defers_heavy_modules(self):
+        loaded_modules = self.loaded_modules("PyXA")
+
+        for module in [
+            "requests",
+            "bs4",
+            "DataDetection",
+            "libdispatch",
+            "macimg",
+            "AppKit",
+            "Quartz",
+            "ScriptingBridge",
+            "PyXA.XABase",
+            "PyXA.XABaseScriptable",
+            "PyXA.XAEvents",
+            "PyXA.Additions",
+        ]:
+            self.assertNotIn(module, loaded_modules)
+
+    @unittest.skipUnless(sys.platform == "darwin", "PyXA.XABase requires macOS")
+    def test_xabase_defers_image_modules(self):
+        loaded_modules = self.loaded_modules("PyXA.XABase")
+
+        for module in ["macimg", "Quartz", "PyXA.XAGraphics"]:
+            self.assertNotIn(module, loaded_modules)
+
+    @unittest.skipUnless(sys.platform == "darwin", "PyXA.XABase requires macOS")
+    def test_deferred_modules_load_on_access(self):
+        result = self.run_python(
+            "import PyXA; print(PyXA.XABaseScriptable.XASBApplication.__name__, PyXA.XAImage.__name__)"
+        )
+        self.assertEqual(result.stdout.strip(), "XASBApplication XAImage")
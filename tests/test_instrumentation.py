@@ -0,0 +1,80 @@
+import unittest
+
+import PyXA
+from PyXA import XABackends, XABase
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.app = PyXA.Application("Music")
+
+    def test_instrumentation_records_calls(self):
+        with PyXA.instrument() as session:
+            tracks = self.app.tracks()
+            names = tracks.name()
+            PyXA.AppleScript("return 1").run()
+
+        stats = session.stats()
+        key = ("Music", "XAMusicTrackList", "name", "list")
+        self.assertIn(key, stats)
+        self.assertEqual(stats[key]["calls"], 1)
+        self.assertEqual(stats[key]["elements"], len(names))
+        self.assertGreater(stats[key]["total_ms"], 0)
+        self.assertIn(("-", "AppleScript", "run", "call"), stats)
+        self.assertIn("XAMusicTrackList", session.table())
+
+    def test_instrumentation_restores_classes(self):
+        original = PyXA.apps.Music.XAMusicTrackList.name
+        with PyXA.instrument():
+            self.assertIsNot(PyXA.apps.Music.XAMusicTrackList.name, original)
+        self.assertIs(PyXA.apps.Music.XAMusicTrackList.name, original)
+        self.assertNotIn("__init_subclass__", XABase.XAObject.__dict__)
+
+    def test_trace_records_nested_spans(self):
+        with PyXA.trace() as trace:
+            self.app.tracks().at(0).name
+
+        stacks = trace.to_collapsed_stacks().splitlines()
+        self.assertTrue(
+            any(line.startswith("XAMusicTrackList.at;new XAMusicTrack ") for line in stacks)
+        )
+
+        events = trace.to_chrome_trace()["traceEvents"]
+        self.assertIn("XAMusicTrack.name", [event["name"] for event in events])
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+
+    def test_trace_records_bridge_spans(self):
+        backend = XABackends.XAFakeBackend()
+        backend.add_music_library(track_count=100)
+        with XABackends.installed("Music", backend):
+            tracks = PyXA.Application("Music").tracks()
+            with PyXA.trace() as trace:
+                tracks.to_columns(["name", "played_count"])
+
+        stacks = [line.rsplit(" ", 1)[0] for line in trace.to_collapsed_stacks().splitlines()]
+        self.assertIn("XAMusicTrackList.to_columns;XAMusicTrackList.fetch;bridge get properties", stacks)
+        self.assertIn("XAMusicTrackList.to_columns;XAMusicTrackList.fetch;convert property records", stacks)
+        self.assertIn("XAMusicTrackList.to_columns;convert to ndarray", stacks)
+        self.assertIsNone(XABackends._request_hook)
+
+    def test_trace_records_list_accessor_bridge_spans(self):
+        backend = XABackends.XAFakeBackend()
+        backend.add_music_library(track_count=100)
+        with XABackends.installed("Music", backend):
+            tracks = PyXA.Application("Music").tracks()
+            with PyXA.trace() as trace:
+                tracks.name()
+
+        stacks = [line.rsplit(" ", 1)[0] for line in trace.to_collapsed_stacks().splitlines()]
+        self.assertIn("XAMusicTrackList.name;bridge get name", stacks)
+
+    def test_trace_single_key_fetch_skips_property_records(self):
+        backend = XABackends.XAFakeBackend()
+        backend.add_music_library(track_count=100)
+        with XABackends.installed("Music", backend):
+            tracks = PyXA.Application("Music").tracks()
+            with PyXA.trace() as trace:
+                tracks.fetch("played_count")
+
+        stacks = [line.rsplit(" ", 1)[0] for line in trace.to_collapsed_stacks().splitlines()]
+        self.assertIn("XAMusicTrackList.fetch;bridge get playedCount", stacks)
+        self.assertNotIn("XAMusicTrackList.fetch;bridge get properties", stacks)
@@ -217,4 +217,193 @@ class TestMusic(unittest.TestCase):
         self.assertIsInstance(eq_preset.band10, float)
         self.assertIsInstance(eq_preset.modifiable, bool)
         self.assertIsInstance(eq_preset.preamp, float)
-        self.assertIsInstance(eq_preset.update_tracks, bool)
\ No newline at end of file
+        self.assertIsInstance(eq_preset.update_tracks, bool)
+
+    def test_music_track_list_fetch(self):
+        tracks = self.app.tracks()
+        columns = tracks.fetch(["name", "artist", "persistent_id", "duration"])
+
+        self.assertEqual(list(columns.keys()), ["name", "artist", "persistent_id", "duration"])
+        self.assertEqual(columns["name"], tracks.name())
+        self.assertEqual(columns["artist"], tracks.artist())
+        self.assertEqual(columns["persistent_id"], tracks.persistent_id())
+        self.assertEqual(columns["duration"], tracks.duration())
+
+    def test_music_track_list_to_columns(self):
+        import numpy
+
+        tracks = self.app.tracks()
+        columns = tracks.to_columns(["name", "duration", "date_added", "compilation"])
+        self.assertEqual(columns["name"].dtype, numpy.dtype(object))
+        self.assertEqual(columns["duration"].dtype, numpy.float64)
+        self.assertEqual(columns["date_added"].dtype, numpy.dtype("datetime64[us]"))
+        self.assertEqual(columns["compilation"].dtype, numpy.bool_)
+        self.assertEqual(len(columns["name"]), len(tracks))
+
+        records = tracks.to_records(["name", "duration"], dtype_map={"name": "U256"})
+        self.assertEqual(records.dtype.names, ("name", "duration"))
+        self.assertEqual(list(records["name"]), tracks.name())
+
+    def test_music_property_cache(self):
+        track = self.app.tracks()[0].enable_cache(ttl=60)
+        name = track.name
+        self.assertEqual(track.name, name)
+        self.assertEqual(track.xa_cache.stats()["hits"], 1)
+        self.assertEqual(track.xa_cache.stats()["misses"], 1)
+
+        # Reassign the existing comment so the library is left unchanged
+        comment = track.comment
+        self.assertEqual(track.xa_cache.stats()["size"], 2)
+        track.set_property("comment", comment)
+        self.assertEqual(track.xa_cache.stats()["size"], 0)
+
+        track.disable_cache()
+        self.assertIs(type(track), XAMusicTrack)
+
+        app_class = type(self.app)
+        with self.app.cached() as cached_app:
+            self.assertIsNot(cached_app, self.app)
+            self.assertIsNone(self.app.xa_cache)
+            track = cached_app.tracks()[0]
+            self.assertIs(track.xa_cache, cached_app.xa_cache)
+            track.name
+            track.name
+            self.assertEqual(cached_app.xa_cache.stats()["hits"], 1)
+        self.assertIsNone(self.app.xa_cache)
+        self.assertIs(type(self.app), app_class)
+
+    def test_music_property_cache_eviction(self):
+        cache = PyXA.XABase.XAPropertyCache(ttl=0.05, max_size=2)
+        tracks = self.app.tracks()[:3]
+        for track in tracks:
+            cache.get(track.xa_elem, "name", lambda: track.name)
+        self.assertEqual(cache.stats()["size"], 2)
+
+        time.sleep(0.1)
+        cache.get(tracks[2].xa_elem, "name", lambda: tracks[2].name)
+        self.assertEqual(cache.stats()["misses"], 4)
+        self.assertEqual(cache.stats()["size"], 2)
+
+    def test_music_track_list_slicing(self):
+        tracks = self.app.tracks()
+        names = tracks.name()
+
+        self.assertIsInstance(tracks[:3], XAMusicTrackList)
+        self.assertEqual(tracks[:3].name(), names[:3])
+        self.assertEqual(tracks[-2:].name(), names[-2:])
+        self.assertEqual(tracks[1:7:2].name(), names[1:7:2])
+        self.assertEqual(tracks[::-3].name(), names[::-3])
+        self.assertEqual(tracks[len(names):].name(), [])
+        self.assertIn(names[0], tracks[:5].equalling("name", names[0]).name())
+
+        # Slices keep bulk requests instead of becoming arrays of individual element references
+        self.assertTrue(PyXA.XABase._xa_is_element_array(tracks[1:7:2].xa_elem))
+        self.assertEqual(tracks[1:7:2].equalling("name", names[3]).name(), [names[3]])
+
+    def test_music_track_list_iter_batches(self):
+        tracks = self.app.tracks()[:25]
+        names = tracks.name()
+
+        batches = list(tracks.iter_batches(10, prefetch=["name"], background=True))
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertTrue(all(isinstance(batch, XAMusicTrackList) for batch in batches))
+
+        self.assertEqual([track.name for batch in batches for track in batch], names)
+        self.assertEqual(batches[0].xa_cache.stats()["misses"], 0)
+
+    def test_music_track_list_iter_batches_converted_property(self):
+        tracks = self.app.tracks()[:25]
+        media_kinds = [track.media_kind for track in tracks]
+
+        batches = list(tracks.iter_batches(10, prefetch=["media_kind"]))
+        prefetched = [track.media_kind for batch in batches for track in batch]
+        self.assertTrue(all(isinstance(kind, XAMusicApplication.MediaKind) for kind in prefetched))
+        self.assertEqual(prefetched, media_kinds)
+        self.assertEqual(batches[0].xa_cache.stats()["misses"], 0)
+
+        with self.assertRaises(ValueError):
+            next(tracks.iter_batches(10, prefetch=["not_a_property"]))
+
+    def test_music_track_list_index(self):
+        tracks = self.app.tracks().build_index("id")
+        ids = tracks.id()
+        self.assertEqual(tracks.by_id(ids[0]), tracks[0])
+        self.assertEqual(tracks.by_id(ids[-1]).id, ids[-1])
+        self.assertIsNone(tracks.by_id(-1))
+
+        tracks.build_index("name", "artist")
+        first = tracks[0]
+        self.assertEqual(tracks.lookup(name=first.name, artist=first.artist).id, first.id)
+
+    def test_music_track_list_query(self):
+        tracks = self.app.tracks()
+        artist = tracks[0].artist
+
+        query = tracks.query().equalling("artist", artist).greater_than("duration", 0)
+        self.assertIn("artist", query.explain())
+        self.assertIn("duration", query.explain())
+
+        result = query.evaluate()
+        self.assertIsInstance(result, XAMusicTrackList)
+        self.assertEqual(result.name(), tracks.equalling("artist", artist).greater_than("duration", 0).name())
+        self.assertEqual(query.by_property("name", result[0].name).name, result[0].name)
+        self.assertEqual(len(query), len(result))
+
+    def test_music_track_list_sorting(self):
+        tracks = self.app.tracks()
+        durations = tracks.duration()
+
+        sorted_tracks = tracks.sort_by("duration")
+        self.assertIsInstance(sorted_tracks, XAMusicTrackList)
+        self.assertEqual(sorted_tracks.duration(), sorted(durations))
+        self.assertEqual(tracks.sort_by("duration", descending=True).duration(), sorted(durations, reverse=True))
+
+        self.assertEqual(tracks.top_k("duration", 3).duration(), sorted(durations, reverse=True)[:3])
+        self.assertEqual(tracks.top_k("duration", 3, descending=False).duration(), sorted(durations)[:3])
+
+        artists = tracks.artist()
+        self.assertEqual(tracks.distinct("artist").artist(), list(dict.fromkeys(artists)))
+
+    def test_music_track_list_group_by(self):
+        tracks = self.app.tracks()
+        artists = tracks.artist()
+        durations = tracks.duration()
+
+        totals = tracks.group_by("artist").agg(duration="sum", name="count")
+        self.assertEqual(list(totals["artist"]), list(dict.fromkeys(artists)))
+
+        artist = artists[0]
+        index = list(totals["artist"]).index(artist)
+        expected = sum(d for a, d in zip(artists, durations) if a == artist)
+        self.assertAlmostEqual(totals["duration"][index], expected)
+        self.assertEqual(totals["name"][index], artists.count(artist))
+
+    def test_music_track_list_snapshot(self):
+        tracks = self.app.tracks()
+        previous = tracks.snapshot("persistent_id", ["name", "played_count"])
+        self.assertEqual(len(previous), len(tracks))
+        self.assertEqual(previous[tracks[0].persistent_id]["name"], tracks[0].name)
+
+        current = tracks.snapshot("persistent_id", ["name", "played_count"])
+        changes = current.diff(previous)
+        self.assertEqual(changes.added, {})
+        self.assertEqual(changes.removed, {})
+        self.assertEqual(changes.changed, {})
+
+    def test_music_track_list_bulk_update(self):
+        # A whose-filtered list remains an element array, so updates are grouped into whose clauses
+        tracks = self.app.tracks().equalling("album", self.app.tracks()[0].album)
+        self.assertIsInstance(tracks.xa_elem, ScriptingBridge.SBElementArray)
+        names = tracks.name()
+
+        # Reassign the existing values so the library is left unchanged
+        report = tracks.set_properties_each([{"name": name} for name in names], "persistent_id")
+        self.assertEqual(report.updated, len(names))
+        self.assertLessEqual(report.events, len(set(names)) + 1)
+        self.assertEqual(tracks.name(), names)
+
+        enabled = tracks.enabled()
+        if len(set(enabled)) == 1:
+            report = tracks.set_property_all("enabled", enabled[0])
+            self.assertEqual(report.updated, len(enabled))
+            self.assertEqual(tracks.enabled(), enabled)